@@ -14,6 +14,26 @@ TITULO = "SquareStorm"
 FPS = 60
 MAX_FASES = 26  
 
+# Pasta dos saves do jogador (acessada via src/utils/saves.py)
+PASTA_DADOS = "data"
+
+# Replays das fases (seed + entradas de cada frame, ver src/utils/replay.py)
+GRAVAR_REPLAYS = False
+PASTA_REPLAYS = "replays"
+
+# Profiler de frame por etapa (F3 mostra o overlay, ver src/utils/profiler.py)
+PROFILER_ATIVO = False
+PASTA_PERFIS = "perfis"
+
+# Backend de apresentação (ver src/utils/display_manager.py):
+# "renderer" = textura do SDL2 escalada pelo SDL (pygame._sdl2.video),
+# "surface" = pygame.transform.scale na CPU; "auto" tenta o renderer e
+# volta para surface se ele não estiver disponível
+BACKEND_VIDEO = "auto"
+# Tela cheia só em múltiplos inteiros de 1480x820 (pixels nítidos, scale
+# mais barato, barras pretas maiores)
+ESCALA_INTEIRA = False
+
 # Cores
 PRETO = (0, 0, 0)
 BRANCO = (255, 255, 255)
@@ -19,6 +19,8 @@ from src.entities.quadrado import Quadrado
 from src.entities.tiro import Tiro
 from src.entities.particula import criar_explosao
 from src.utils.sound import gerar_som_explosao, gerar_som_tiro, gerar_som_dano
+from src.utils.sprites import cache_sprites, sombra_retangular, aura_circular, disco, quantizar_cor
+from src.utils.rng import rng_jogo, novo_id_entidade
 
 class BossFusion:
     """
@@ -117,7 +119,7 @@ class BossFusion:
         self.combo_index = 0
         
         # ID único
-        self.id = id(self)
+        self.id = novo_id_entidade()
         
         print(f"🔥 Boss Fusion balanceado criado! Vida: {self.vidas}/{self.vidas_max}")
     
@@ -230,7 +232,7 @@ class BossFusion:
             padroes_agressivos = ["perseguicao", "teleporte", "tremor", "espiral"]
             padroes_disponiveis.extend(padroes_agressivos)
 
-        self.movimento_atual = random.choice(padroes_disponiveis)
+        self.movimento_atual = rng_jogo.choice(padroes_disponiveis)
         print(f"🎯 Boss mudou para movimento: {self.movimento_atual}")
 
         if self.movimento_atual == "teleporte":
@@ -280,7 +282,7 @@ class BossFusion:
                 (LARGURA // 2, 100), (LARGURA // 2, ALTURA_JOGO - 100)
             ]
             
-            nova_pos = random.choice(posicoes_possiveis)
+            nova_pos = rng_jogo.choice(posicoes_possiveis)
             self.x, self.y = nova_pos
             self.teleporte_cooldown = 120
             
@@ -317,8 +319,8 @@ class BossFusion:
     
     def movimento_tremor(self):
         """Movimento errático com tremores."""
-        self.x += random.uniform(-self.velocidade * 4, self.velocidade * 4)
-        self.y += random.uniform(-self.velocidade * 4, self.velocidade * 4)
+        self.x += rng_jogo.uniform(-self.velocidade * 4, self.velocidade * 4)
+        self.y += rng_jogo.uniform(-self.velocidade * 4, self.velocidade * 4)
         
         centro_x = LARGURA // 2
         centro_y = ALTURA_JOGO // 2
@@ -393,7 +395,7 @@ class BossFusion:
             ataques_avancados = ["tornado_tiros", "barreira_espinhos", "pulso_magnetico"]
             padroes_disponiveis.extend(ataques_avancados)
 
-        self.ataque_atual = random.choice(padroes_disponiveis)
+        self.ataque_atual = rng_jogo.choice(padroes_disponiveis)
 
         self.carregando_ataque = True
         self.tempo_carregamento = tempo_atual
@@ -453,21 +455,21 @@ class BossFusion:
 
         for i in range(num_tiros):
             angulo = (2 * math.pi * i) / num_tiros
-            angulo += random.uniform(-0.05, 0.05)  # Menos variação para manter espaços previsíveis
+            angulo += rng_jogo.uniform(-0.05, 0.05)  # Menos variação para manter espaços previsíveis
 
             dx = math.cos(angulo)
             dy = math.sin(angulo)
 
             cor_tiro = self.cor_secundaria
-            velocidade = random.randint(2, 4)  # REDUZIDO: mais lento ainda para dar tempo de reação
+            velocidade = rng_jogo.randint(2, 4)  # REDUZIDO: mais lento ainda para dar tempo de reação
 
             tiro = Tiro(centro_x, centro_y, dx, dy, cor_tiro, velocidade)
             tiros_inimigo.append(tiro)
     
     def ataque_laser_duplo(self, centro_x, centro_y, tiros_inimigo, jogador):
         """Laser duplo com predição."""
-        predicao_x = jogador.x + random.randint(-50, 50)
-        predicao_y = jogador.y + random.randint(-50, 50)
+        predicao_x = jogador.x + rng_jogo.randint(-50, 50)
+        predicao_y = jogador.y + rng_jogo.randint(-50, 50)
 
         dx = predicao_x - centro_x
         dy = predicao_y - centro_y
@@ -498,17 +500,17 @@ class BossFusion:
         num_meteoros = 3 if self.fase_boss < 3 else 5  # MUITO REDUZIDO: era 5 e 8
 
         for _ in range(num_meteoros):
-            x = random.randint(50, LARGURA - 50)
+            x = rng_jogo.randint(50, LARGURA - 50)
             y = -30
 
-            dx = random.uniform(-0.3, 0.3)  # REDUZIDO
-            dy = random.uniform(0.5, 0.8)  # REDUZIDO
+            dx = rng_jogo.uniform(-0.3, 0.3)  # REDUZIDO
+            dy = rng_jogo.uniform(0.5, 0.8)  # REDUZIDO
 
             cor_meteoro = random.choice([(255, 100, 0), (255, 0, 0), (255, 150, 50)])
-            velocidade = random.randint(3, 5)  # MUITO REDUZIDO
+            velocidade = rng_jogo.randint(3, 5)  # MUITO REDUZIDO
 
             meteoro = Tiro(x, y, dx, dy, cor_meteoro, velocidade)
-            meteoro.raio = random.randint(6, 10)  # REDUZIDO
+            meteoro.raio = rng_jogo.randint(6, 10)  # REDUZIDO
             meteoro.rect = pygame.Rect(x - meteoro.raio, y - meteoro.raio,
                                      meteoro.raio * 2, meteoro.raio * 2)
             tiros_inimigo.append(meteoro)
@@ -553,15 +555,15 @@ class BossFusion:
     def ataque_chuva_energia(self, tiros_inimigo, particulas, flashes):
         """Chuva de energia que cobre toda a tela - BALANCEADA."""
         for _ in range(15):  # REDUZIDO: era 25
-            x = random.randint(0, LARGURA)
+            x = rng_jogo.randint(0, LARGURA)
             y = -50
             
-            dx = random.uniform(-0.2, 0.2)  # REDUZIDO
-            dy = random.uniform(2.5, 5)  # REDUZIDO
+            dx = rng_jogo.uniform(-0.2, 0.2)  # REDUZIDO
+            dy = rng_jogo.uniform(2.5, 5)  # REDUZIDO
             
             cor = random.choice([(255, 0, 255), (255, 255, 0), (0, 255, 255)])
-            tiro = Tiro(x, y, dx, dy, cor, random.randint(3, 6))  # REDUZIDO
-            tiro.raio = random.randint(6, 12)  # REDUZIDO
+            tiro = Tiro(x, y, dx, dy, cor, rng_jogo.randint(3, 6))  # REDUZIDO
+            tiro.raio = rng_jogo.randint(6, 12)  # REDUZIDO
             tiros_inimigo.append(tiro)
     
     def ataque_explosao_presas(self, centro_x, centro_y, tiros_inimigo, particulas, flashes):
@@ -716,16 +718,16 @@ class BossFusion:
             ]
             
             posicoes_possiveis = cantos + meio_bordas
-            x, y = random.choice(posicoes_possiveis)
+            x, y = rng_jogo.choice(posicoes_possiveis)
             
             if self.fase_boss == 1:
                 ajudante = InimigoFactory.criar_inimigo_basico(x, y)
             elif self.fase_boss == 2:
                 tipos = [InimigoFactory.criar_inimigo_basico, InimigoFactory.criar_inimigo_rapido]
-                ajudante = random.choice(tipos)(x, y)
+                ajudante = rng_jogo.choice(tipos)(x, y)
             else:
                 tipos = [InimigoFactory.criar_inimigo_basico, InimigoFactory.criar_inimigo_rapido]
-                ajudante = random.choice(tipos)(x, y)
+                ajudante = rng_jogo.choice(tipos)(x, y)
             
             ajudante.invocado_pelo_boss = True
             inimigos.append(ajudante)
@@ -772,6 +774,44 @@ class BossFusion:
             return True
         return False
     
+    def _montar_corpo(self, tamanho_atual, cor_uso, cor_olho):
+        """Borda, corpo com gradiente, núcleo e olhos, com origem na borda (x - 3, y - 3)."""
+        corpo = pygame.Surface((tamanho_atual + 6, tamanho_atual + 6), pygame.SRCALPHA)
+        
+        # Borda externa
+        pygame.draw.rect(corpo, (30, 30, 30), 
+                        (0, 0, tamanho_atual + 6, tamanho_atual + 6), 0, 10)
+        
+        # Corpo principal com gradiente
+        for i in range(3):
+            cor_gradiente = tuple(max(0, c - i * 20) for c in cor_uso)
+            pygame.draw.rect(corpo, cor_gradiente, 
+                            (3 + i, 3 + i, 
+                             tamanho_atual - i * 2, tamanho_atual - i * 2), 0, 8)
+        
+        # Núcleo central
+        core_size = tamanho_atual // 3
+        core_x = 3 + tamanho_atual // 2 - core_size // 2
+        core_y = 3 + tamanho_atual // 2 - core_size // 2
+        
+        for i in range(3):
+            core_cor = tuple(min(255, c + 80 - i * 25) for c in self.cor_brilho)
+            pygame.draw.rect(corpo, core_cor, 
+                            (core_x + i, core_y + i, 
+                             core_size - i * 2, core_size - i * 2), 0, 6)
+        
+        # Olhos
+        olho_size = tamanho_atual // 8
+        olho_y = 3 + tamanho_atual // 3
+        
+        for olho_x in (3 + tamanho_atual // 4, 3 + 3 * tamanho_atual // 4):
+            pygame.draw.circle(corpo, (50, 50, 50), (olho_x, olho_y), olho_size + 2)
+            pygame.draw.circle(corpo, cor_olho, (olho_x, olho_y), olho_size)
+            # Reflexo
+            pygame.draw.circle(corpo, (255, 255, 255), 
+                              (olho_x - 2, olho_y - 2), max(1, olho_size // 3))
+        return corpo
+    
     def desenhar(self, tela, tempo_atual):
         """Sistema de desenho melhorado."""
         # Desenhar rastro
@@ -807,58 +847,20 @@ class BossFusion:
         tamanho_atual = self.tamanho + pulso
         
         # Sombra
-        shadow_surface = pygame.Surface((tamanho_atual + 8, tamanho_atual + 8))
-        shadow_surface.set_alpha(100)
-        shadow_surface.fill((0, 0, 0))
-        tela.blit(shadow_surface, (self.x + 4, self.y + 4))
+        tela.blit(sombra_retangular(tamanho_atual + 8, tamanho_atual + 8, 100),
+                  (self.x + 4, self.y + 4))
         
         # Cor baseada no estado
         cor_uso = self.cor_principal
         if self.invulneravel and tempo_atual % 150 < 75:
             cor_uso = (255, 255, 255)
-        
-        # Borda externa
-        pygame.draw.rect(tela, (30, 30, 30), 
-                        (self.x - 3, self.y - 3, tamanho_atual + 6, tamanho_atual + 6), 0, 10)
-        
-        # Corpo principal com gradiente
-        for i in range(3):
-            cor_gradiente = tuple(max(0, c - i * 20) for c in cor_uso)
-            pygame.draw.rect(tela, cor_gradiente, 
-                            (self.x + i, self.y + i, 
-                             tamanho_atual - i * 2, tamanho_atual - i * 2), 0, 8)
-        
-        # Núcleo central
-        core_size = tamanho_atual // 3
-        core_x = self.x + tamanho_atual // 2 - core_size // 2
-        core_y = self.y + tamanho_atual // 2 - core_size // 2
-        
-        for i in range(3):
-            core_cor = tuple(min(255, c + 80 - i * 25) for c in self.cor_brilho)
-            pygame.draw.rect(tela, core_cor, 
-                            (core_x + i, core_y + i, 
-                             core_size - i * 2, core_size - i * 2), 0, 6)
-        
-        # Olhos
-        olho_size = tamanho_atual // 8
-        olho_y = self.y + tamanho_atual // 3
-        
-        pygame.draw.circle(tela, (50, 50, 50), 
-                          (self.x + tamanho_atual // 4, olho_y), olho_size + 2)
-        pygame.draw.circle(tela, (50, 50, 50), 
-                          (self.x + 3 * tamanho_atual // 4, olho_y), olho_size + 2)
-        
         cor_olho = (255, 0, 0) if self.fase_boss < 3 else (255, 100, 0)
-        pygame.draw.circle(tela, cor_olho, 
-                          (self.x + tamanho_atual // 4, olho_y), olho_size)
-        pygame.draw.circle(tela, cor_olho, 
-                          (self.x + 3 * tamanho_atual // 4, olho_y), olho_size)
         
-        # Reflexo nos olhos
-        pygame.draw.circle(tela, (255, 255, 255), 
-                          (self.x + tamanho_atual // 4 - 2, olho_y - 2), max(1, olho_size // 3))
-        pygame.draw.circle(tela, (255, 255, 255), 
-                          (self.x + 3 * tamanho_atual // 4 - 2, olho_y - 2), max(1, olho_size // 3))
+        # Borda, corpo, núcleo e olhos: um sprite por tamanho/cor/fase
+        corpo = cache_sprites.obter(
+            ('boss_fusion', tamanho_atual, cor_uso, self.cor_brilho, cor_olho),
+            lambda: self._montar_corpo(tamanho_atual, cor_uso, cor_olho))
+        tela.blit(corpo, (int(self.x) - 3, int(self.y) - 3))
         
         # Detalhes por fase
         if self.fase_boss >= 2:
@@ -876,9 +878,7 @@ class BossFusion:
                 raio_aura = tamanho_atual // 2 + 20 + i * 8
                 alpha = 50 - i * 8
                 if alpha > 0:
-                    aura_surface = pygame.Surface((raio_aura * 2, raio_aura * 2))
-                    aura_surface.set_alpha(alpha)
-                    pygame.draw.circle(aura_surface, (200, 0, 200), (raio_aura, raio_aura), raio_aura, 2)
+                    aura_surface = aura_circular(raio_aura, alpha, (200, 0, 200))
                     tela.blit(aura_surface, (self.x + tamanho_atual // 2 - raio_aura, 
                                            self.y + tamanho_atual // 2 - raio_aura))
         
@@ -956,20 +956,23 @@ class BossFusion:
             # Círculo de fundo
             pygame.draw.circle(tela, (50, 50, 50), (centro_x, centro_y), raio + 3, 3)
             
-            # Arco de progresso
+            # Arco de progresso (todos os pontos têm a mesma cor: um disco
+            # em cache, cor quantizada, copiado num Surface.blits)
             if progresso > 0:
+                if progresso < 0.5:
+                    cor = (255, 255 * progresso * 2, 0)
+                else:
+                    cor = (255, 255, 255 * (progresso - 0.5) * 2)
+                ponto = disco(4, quantizar_cor(cor))
+                
                 num_pontos = int(64 * progresso)
+                pontos = []
                 for i in range(num_pontos):
                     angulo = (2 * math.pi * i) / 64
                     x = centro_x + raio * math.cos(angulo - math.pi/2)
                     y = centro_y + raio * math.sin(angulo - math.pi/2)
-                    
-                    if progresso < 0.5:
-                        cor = (255, 255 * progresso * 2, 0)
-                    else:
-                        cor = (255, 255, 255 * (progresso - 0.5) * 2)
-                    
-                    pygame.draw.circle(tela, cor, (int(x), int(y)), 4)
+                    pontos.append((ponto, (int(x) - 4, int(y) - 4)))
+                tela.blits(pontos, doreturn=False)
             
             # Texto do ataque
             if self.ataque_atual:
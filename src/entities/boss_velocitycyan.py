@@ -14,6 +14,8 @@ from src.entities.quadrado import Quadrado
 from src.entities.tiro import Tiro
 from src.entities.particula import criar_explosao
 from src.utils.sound import gerar_som_explosao, gerar_som_tiro, gerar_som_dano
+from src.utils.sprites import cache_sprites, sombra_retangular, aura_circular, disco
+from src.utils.rng import rng_jogo, novo_id_entidade
 
 
 class BossVelocityCyan:
@@ -46,10 +48,10 @@ class BossVelocityCyan:
 
         # Sistema de movimentação independente (não persegue o jogador)
         # Boss se move em direções aleatórias com mudanças periódicas
-        self.direcao_x = random.choice([-1, 1])
-        self.direcao_y = random.choice([-1, 1])
+        self.direcao_x = rng_jogo.choice([-1, 1])
+        self.direcao_y = rng_jogo.choice([-1, 1])
         self.tempo_ultima_mudanca_direcao = 0
-        self.intervalo_mudanca_direcao = random.randint(1000, 2500)  # Muda direção a cada 1-2.5s
+        self.intervalo_mudanca_direcao = rng_jogo.randint(1000, 2500)  # Muda direção a cada 1-2.5s
 
         # Sistema de ataques - Focado em velocidade e quantidade
         self.tempo_ultimo_ataque = 0
@@ -83,7 +85,7 @@ class BossVelocityCyan:
         self.ataque_pronto_para_executar = False
 
         # ID único
-        self.id = id(self)
+        self.id = novo_id_entidade()
 
         print(f"⚡ Boss VelocityCyan criado! Vida: {self.vidas}/{self.vidas_max}")
 
@@ -188,10 +190,10 @@ class BossVelocityCyan:
         else:
             # Mudar direção periodicamente quando longe do jogador
             if tempo_atual - self.tempo_ultima_mudanca_direcao > self.intervalo_mudanca_direcao:
-                self.direcao_x = random.choice([-1, -0.7, 0.7, 1])
-                self.direcao_y = random.choice([-1, -0.7, 0.7, 1])
+                self.direcao_x = rng_jogo.choice([-1, -0.7, 0.7, 1])
+                self.direcao_y = rng_jogo.choice([-1, -0.7, 0.7, 1])
                 self.tempo_ultima_mudanca_direcao = tempo_atual
-                self.intervalo_mudanca_direcao = random.randint(1000, 2500)
+                self.intervalo_mudanca_direcao = rng_jogo.randint(1000, 2500)
 
         # Mover na direção atual
         self.x += self.direcao_x * self.velocidade
@@ -266,7 +268,7 @@ class BossVelocityCyan:
             ataques_avancados = ["dash_ataque", "tiros_rastreadores"]
             padroes_disponiveis.extend(ataques_avancados)
 
-        self.ataque_atual = random.choice(padroes_disponiveis)
+        self.ataque_atual = rng_jogo.choice(padroes_disponiveis)
 
         self.carregando_ataque = True
         self.tempo_carregamento = tempo_atual
@@ -319,7 +321,7 @@ class BossVelocityCyan:
             dx = math.cos(angulo)
             dy = math.sin(angulo)
 
-            velocidade = random.randint(6, 9)  # Tiros rápidos
+            velocidade = rng_jogo.randint(6, 9)  # Tiros rápidos
 
             tiro = Tiro(centro_x, centro_y, dx, dy, self.cor_secundaria, velocidade)
             tiros_inimigo.append(tiro)
@@ -327,14 +329,14 @@ class BossVelocityCyan:
     def ataque_chuva_rapida(self, tiros_inimigo, particulas, flashes):
         """Chuva de tiros rápidos."""
         for _ in range(20):
-            x = random.randint(0, LARGURA)
+            x = rng_jogo.randint(0, LARGURA)
             y = -50
 
-            dx = random.uniform(-0.3, 0.3)
-            dy = random.uniform(4, 7)  # Muito rápido
+            dx = rng_jogo.uniform(-0.3, 0.3)
+            dy = rng_jogo.uniform(4, 7)  # Muito rápido
 
-            tiro = Tiro(x, y, dx, dy, self.cor_secundaria, random.randint(5, 8))
-            tiro.raio = random.randint(5, 10)
+            tiro = Tiro(x, y, dx, dy, self.cor_secundaria, rng_jogo.randint(5, 8))
+            tiro.raio = rng_jogo.randint(5, 10)
             tiros_inimigo.append(tiro)
 
     def ataque_dash_ataque(self, centro_x, centro_y, tiros_inimigo, jogador):
@@ -388,7 +390,7 @@ class BossVelocityCyan:
             dx = math.cos(angulo)
             dy = math.sin(angulo)
 
-            velocidade = random.randint(4, 7)
+            velocidade = rng_jogo.randint(4, 7)
 
             tiro = Tiro(centro_x, centro_y, dx, dy, self.cor_brilho, velocidade)
             tiros_inimigo.append(tiro)
@@ -399,8 +401,8 @@ class BossVelocityCyan:
 
         for i in range(num_tiros):
             # Predição da posição do jogador
-            predicao_x = jogador.x + random.randint(-80, 80)
-            predicao_y = jogador.y + random.randint(-80, 80)
+            predicao_x = jogador.x + rng_jogo.randint(-80, 80)
+            predicao_y = jogador.y + rng_jogo.randint(-80, 80)
 
             dx = predicao_x - centro_x
             dy = predicao_y - centro_y
@@ -477,6 +479,22 @@ class BossVelocityCyan:
             return True
         return False
 
+    def _montar_corpo(self, tamanho_atual, cor_uso):
+        """Borda e corpo com gradiente, com origem na borda (x - 3, y - 3)."""
+        corpo = pygame.Surface((tamanho_atual + 6, tamanho_atual + 6), pygame.SRCALPHA)
+
+        # Borda externa
+        pygame.draw.rect(corpo, (20, 40, 60),
+                        (0, 0, tamanho_atual + 6, tamanho_atual + 6), 0, 10)
+
+        # Corpo principal com gradiente (sem núcleo central)
+        for i in range(5):
+            cor_gradiente = tuple(max(0, min(255, c + i * 10)) for c in cor_uso)
+            pygame.draw.rect(corpo, cor_gradiente,
+                            (3 + i, 3 + i,
+                             tamanho_atual - i * 2, tamanho_atual - i * 2), 0, 8)
+        return corpo
+
     def desenhar(self, tela, tempo_atual):
         """Sistema de desenho com tema de velocidade."""
         # Desenhar rastro (maior e mais detalhado)
@@ -509,26 +527,18 @@ class BossVelocityCyan:
         tamanho_atual = self.tamanho + pulso
 
         # Sombra
-        shadow_surface = pygame.Surface((tamanho_atual + 8, tamanho_atual + 8))
-        shadow_surface.set_alpha(120)
-        shadow_surface.fill((0, 0, 0))
-        tela.blit(shadow_surface, (self.x + 4, self.y + 4))
+        tela.blit(sombra_retangular(tamanho_atual + 8, tamanho_atual + 8, 120),
+                  (self.x + 4, self.y + 4))
 
         # Cor baseada no estado
         cor_uso = self.cor_principal
         if self.invulneravel and tempo_atual % 100 < 50:
             cor_uso = (255, 255, 255)
 
-        # Borda externa
-        pygame.draw.rect(tela, (20, 40, 60),
-                        (self.x - 3, self.y - 3, tamanho_atual + 6, tamanho_atual + 6), 0, 10)
-
-        # Corpo principal com gradiente (sem núcleo central)
-        for i in range(5):
-            cor_gradiente = tuple(max(0, min(255, c + i * 10)) for c in cor_uso)
-            pygame.draw.rect(tela, cor_gradiente,
-                            (self.x + i, self.y + i,
-                             tamanho_atual - i * 2, tamanho_atual - i * 2), 0, 8)
+        # Borda e corpo com gradiente: um sprite por tamanho/cor
+        corpo = cache_sprites.obter(('boss_velocitycyan', tamanho_atual, cor_uso),
+                                    lambda: self._montar_corpo(tamanho_atual, cor_uso))
+        tela.blit(corpo, (int(self.x) - 3, int(self.y) - 3))
 
         # Detalhes de velocidade (linhas de movimento)
         if self.fase_boss >= 2:
@@ -546,10 +556,7 @@ class BossVelocityCyan:
                 raio_aura = tamanho_atual // 2 + 15 + i * 10
                 alpha = 60 - i * 12
                 if alpha > 0:
-                    aura_surface = pygame.Surface((raio_aura * 2, raio_aura * 2))
-                    aura_surface.set_alpha(alpha)
-                    pygame.draw.circle(aura_surface, self.cor_secundaria,
-                                     (raio_aura, raio_aura), raio_aura, 2)
+                    aura_surface = aura_circular(raio_aura, alpha, self.cor_secundaria)
                     tela.blit(aura_surface, (self.x + tamanho_atual // 2 - raio_aura,
                                            self.y + tamanho_atual // 2 - raio_aura))
 
@@ -624,17 +631,17 @@ class BossVelocityCyan:
             # Círculo de fundo
             pygame.draw.circle(tela, (30, 50, 70), (centro_x, centro_y), raio + 3, 3)
 
-            # Arco de progresso
+            # Arco de progresso (um disco em cache copiado num Surface.blits)
             if progresso > 0:
+                ponto = disco(4, self.cor_secundaria)
                 num_pontos = int(64 * progresso)
+                pontos = []
                 for i in range(num_pontos):
                     angulo = (2 * math.pi * i) / 64
                     x = centro_x + raio * math.cos(angulo - math.pi/2)
                     y = centro_y + raio * math.sin(angulo - math.pi/2)
-
-                    cor = self.cor_secundaria
-
-                    pygame.draw.circle(tela, cor, (int(x), int(y)), 4)
+                    pontos.append((ponto, (int(x) - 4, int(y) - 4)))
+                tela.blits(pontos, doreturn=False)
 
             # Texto do ataque
             if self.ataque_atual:
@@ -16,6 +16,7 @@ from src.entities.particula import criar_explosao
 from src.utils.visual import desenhar_texto
 from src.utils.sound import gerar_som_explosao
 from src.utils.display_manager import present_frame
+from src.utils.sprites import sprite_quadrado
 
 class FusionCutscene:
     """
@@ -498,29 +499,15 @@ class FusionCutscene:
                     else:
                         mod_tamanho = 12 - inimigo.pulsando
 
-                # Desenhar sombra
-                pygame.draw.rect(tela_desenho, (20, 20, 20),
-                                (inimigo.x + 4, inimigo.y + 4,
-                                 inimigo.tamanho, inimigo.tamanho), 0, 3)
-
                 # Aplicar cor com brilho de fusão
                 cor_uso = inimigo.cor
                 if inimigo.brilho_fusao > 0:
                     cor_uso = tuple(min(255, c + int(inimigo.brilho_fusao)) for c in inimigo.cor)
 
-                # Quadrado interior (cor escura)
-                pygame.draw.rect(tela_desenho, inimigo.cor_escura,
-                                (inimigo.x, inimigo.y,
-                                 inimigo.tamanho + mod_tamanho, inimigo.tamanho + mod_tamanho), 0, 5)
-
-                # Quadrado exterior (menor)
-                pygame.draw.rect(tela_desenho, cor_uso,
-                                (inimigo.x + 3, inimigo.y + 3,
-                                 inimigo.tamanho + mod_tamanho - 6, inimigo.tamanho + mod_tamanho - 6), 0, 3)
-
-                # Brilho no canto superior esquerdo
-                pygame.draw.rect(tela_desenho, inimigo.cor_brilhante,
-                                (inimigo.x + 5, inimigo.y + 5, 8, 8), 0, 2)
+                # Sombra, quadrado interior, exterior e brilho (sprite em cache)
+                tela_desenho.blit(sprite_quadrado(inimigo.tamanho, mod_tamanho, cor_uso,
+                                                  inimigo.cor_escura, inimigo.cor_brilhante),
+                                  (inimigo.x, inimigo.y))
 
                 # Partículas do inimigo
                 for particula in inimigo.particulas_proprias:
@@ -14,6 +14,7 @@ from src.config import *
 from src.entities.quadrado import Quadrado
 from src.entities.tiro import Tiro
 from src.utils.sound import gerar_som_tiro
+from src.utils.rng import rng_jogo
 
 
 class InimigoFantasma(Quadrado):
@@ -53,7 +54,7 @@ class InimigoFantasma(Quadrado):
         self.tipo_fantasma = True
 
         # Efeito de flutuação
-        self.tempo_flutuacao = random.uniform(0, 2 * math.pi)
+        self.tempo_flutuacao = rng_jogo.uniform(0, 2 * math.pi)
         self.amplitude_flutuacao = 3
 
     def atualizar(self):
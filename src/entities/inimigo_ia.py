@@ -8,7 +8,7 @@ Contém funções para controlar o comportamento dos inimigos no jogo.
 
 import pygame
 import math
-import random
+from src.utils.rng import rng_jogo
 from src.config import *
 from src.entities.particula import criar_explosao
 from src.utils.sound import gerar_som_dano
@@ -136,8 +136,8 @@ def atualizar_IA_inimigo(inimigo, idx, jogador, tiros_jogador, inimigos, tempo_a
             mover_y = 0  # Evitar que fique preso nas bordas superior/inferior
         
         # Adicionar pequena variação para evitar movimento em linha reta perfeita
-        mover_x += random.uniform(-0.1, 0.1)
-        mover_y += random.uniform(-0.1, 0.1)
+        mover_x += rng_jogo.uniform(-0.1, 0.1)
+        mover_y += rng_jogo.uniform(-0.1, 0.1)
         
         # Normalizar o vetor de movimento
         magnitude = math.sqrt(mover_x**2 + mover_y**2)
@@ -184,8 +184,8 @@ def atualizar_IA_inimigo(inimigo, idx, jogador, tiros_jogador, inimigos, tempo_a
         
         # Usar uma semente baseada no ID do inimigo para seu comportamento aleatório
         # Inicializar o gerador de números aleatórios com uma semente baseada no ID
-        random_state = random.getstate()  # Salvar estado atual
-        random.seed(random_seed)
+        random_state = rng_jogo.getstate()  # Salvar estado atual
+        rng_jogo.seed(random_seed)
         
         # Escolher comportamento baseado na situação e fase
         comportamentos = ["perseguir", "flanquear", "recuar", "evasivo"]
@@ -219,7 +219,7 @@ def atualizar_IA_inimigo(inimigo, idx, jogador, tiros_jogador, inimigos, tempo_a
         # Adicionar variação na decisão de tiro baseada no ID do inimigo
         chance_tiro = chance_tiro * (0.8 + offset_fator * 0.4)  # 80%-120% da chance original
         
-        if random.random() < chance_tiro:
+        if rng_jogo.random() < chance_tiro:
             # Calcular direção para o jogador com previsão de movimento
             dir_tiro_x = dir_x
             dir_tiro_y = dir_y
@@ -241,8 +241,8 @@ def atualizar_IA_inimigo(inimigo, idx, jogador, tiros_jogador, inimigos, tempo_a
             # Inimigos diferentes terão níveis diferentes de precisão
             fator_precisao = 1.0 - offset_fator * 0.5  # 0.5-1.0
             imprecisao = max(0.05, min(0.4, (dist / 1000 - (numero_fase * 0.02)) * fator_precisao))
-            dir_tiro_x += random.uniform(-imprecisao, imprecisao)
-            dir_tiro_y += random.uniform(-imprecisao, imprecisao)
+            dir_tiro_x += rng_jogo.uniform(-imprecisao, imprecisao)
+            dir_tiro_y += rng_jogo.uniform(-imprecisao, imprecisao)
 
             # Rajada pendente do peixe (segundo tiro)
             if hasattr(inimigo, 'tipo_peixe') and inimigo.tipo_peixe:
@@ -266,7 +266,7 @@ def atualizar_IA_inimigo(inimigo, idx, jogador, tiros_jogador, inimigos, tempo_a
                 inimigo.atirar(tiros_inimigo, (dir_tiro_x, dir_tiro_y))
         
         # Restaurar o estado original do gerador de números aleatórios
-        random.setstate(random_state)
+        rng_jogo.setstate(random_state)
     
     # Definir zona de segurança das bordas (mais ampla que antes)
     margem_borda = 100
@@ -293,8 +293,8 @@ def atualizar_IA_inimigo(inimigo, idx, jogador, tiros_jogador, inimigos, tempo_a
                           jogador.y > ALTURA - jogador.tamanho - margem_borda)
     
     # Inicializar o gerador de números aleatórios com uma semente baseada no ID
-    random_state = random.getstate()  # Salvar estado atual
-    random.seed(random_seed + tempo_atual // 1000)  # Mudar a cada segundo
+    random_state = rng_jogo.getstate()  # Salvar estado atual
+    rng_jogo.seed(random_seed + tempo_atual // 1000)  # Mudar a cada segundo
     
     # Verificar proximidade com outros inimigos (evitar empilhamento)
     evitar_x, evitar_y = 0, 0
@@ -352,8 +352,8 @@ def atualizar_IA_inimigo(inimigo, idx, jogador, tiros_jogador, inimigos, tempo_a
             mover_y = para_centro_y / dist_centro * 1.5
             
             # Adicionar variação para que inimigos do mesmo tipo não se movam identicamente
-            mover_x += random.uniform(-0.2, 0.2) * offset_fator
-            mover_y += random.uniform(-0.2, 0.2) * offset_fator
+            mover_x += rng_jogo.uniform(-0.2, 0.2) * offset_fator
+            mover_y += rng_jogo.uniform(-0.2, 0.2) * offset_fator
     
     # PRIORIDADE 2: Evite tiros próximos
     elif tiro_mais_proximo is not None:
@@ -391,8 +391,8 @@ def atualizar_IA_inimigo(inimigo, idx, jogador, tiros_jogador, inimigos, tempo_a
             mover_y = vetor_perp_y
             
         # Adicionar variação para que inimigos não se movam de forma idêntica
-        mover_x += random.uniform(-0.2, 0.2) * offset_fator
-        mover_y += random.uniform(-0.2, 0.2) * offset_fator
+        mover_x += rng_jogo.uniform(-0.2, 0.2) * offset_fator
+        mover_y += rng_jogo.uniform(-0.2, 0.2) * offset_fator
     
     # PRIORIDADE 3: Comportamento normal baseado na situação
     elif not perto_da_borda or (jogador_perto_borda and inimigo.x > margem_borda and 
@@ -403,7 +403,7 @@ def atualizar_IA_inimigo(inimigo, idx, jogador, tiros_jogador, inimigos, tempo_a
         if dist < 300:  # Muito perto
             # Modificar a chance com base no ID do inimigo
             recuar_chance = 0.7 + (offset_fator - 0.5) * 0.4  # 0.5-0.9 dependendo do ID
-            if random.random() < recuar_chance:  # Às vezes recuar
+            if rng_jogo.random() < recuar_chance:  # Às vezes recuar
                 mover_x = -dir_x * (0.8 + offset_fator * 0.4)  # Velocidade de recuo variável
                 mover_y = -dir_y * (0.8 + offset_fator * 0.4)
             else:  # Movimento lateral para flanquear
@@ -431,7 +431,7 @@ def atualizar_IA_inimigo(inimigo, idx, jogador, tiros_jogador, inimigos, tempo_a
             
             # Com chance de se aproximar ou afastar
             aprox_chance = 0.3 + (offset_fator - 0.5) * 0.2  # 0.2-0.4
-            if random.random() < aprox_chance:
+            if rng_jogo.random() < aprox_chance:
                 mover_x += dir_x * (0.3 + offset_fator * 0.1)  # 0.3-0.4
                 mover_y += dir_y * (0.3 + offset_fator * 0.1)
     
@@ -468,8 +468,8 @@ def atualizar_IA_inimigo(inimigo, idx, jogador, tiros_jogador, inimigos, tempo_a
     aleatoriedade_base = 0.05 if muito_perto_da_borda else (0.1 if perto_da_borda else 0.2)
     # Variável com base no ID do inimigo
     aleatoriedade = aleatoriedade_base * (1.0 + offset_fator * 0.5)  # 50% mais ou menos aleatório
-    mover_x += random.uniform(-aleatoriedade, aleatoriedade)
-    mover_y += random.uniform(-aleatoriedade, aleatoriedade)
+    mover_x += rng_jogo.uniform(-aleatoriedade, aleatoriedade)
+    mover_y += rng_jogo.uniform(-aleatoriedade, aleatoriedade)
     
     # Verificar se o movimento nos levaria para dentro da borda
     nova_x = inimigo.x + mover_x * inimigo.velocidade
@@ -493,7 +493,7 @@ def atualizar_IA_inimigo(inimigo, idx, jogador, tiros_jogador, inimigos, tempo_a
     velocidade_atual = inimigo.velocidade if muito_perto_da_borda else inimigo.velocidade * (0.8 + offset_fator * 0.1)
     
     # Restaurar o estado original do gerador de números aleatórios
-    random.setstate(random_state)
+    rng_jogo.setstate(random_state)
     
     # Executar o movimento
     inimigo.mover(mover_x, mover_y)
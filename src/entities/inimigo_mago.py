@@ -16,6 +16,7 @@ from src.entities.quadrado import Quadrado
 from src.entities.tiro import Tiro
 from src.entities.particula import Particula
 from src.utils.sound import gerar_som_tiro
+from src.utils.rng import rng_jogo
 
 
 class InimigoMago(Quadrado):
@@ -52,7 +53,7 @@ class InimigoMago(Quadrado):
 
         # Sistema de invocação
         self.tiros_desde_invocacao = 0
-        self.tiros_para_invocar = random.randint(8, 30)  # Quantidade aleatória entre 4-15
+        self.tiros_para_invocar = rng_jogo.randint(8, 30)  # Quantidade aleatória entre 4-15
         self.esta_invocando = False
         self.tempo_inicio_invocacao = 0
         self.duracao_invocacao = 3000  # 2 segundos invocando
@@ -251,7 +252,7 @@ class InimigoMago(Quadrado):
         if tempo_decorrido >= self.duracao_invocacao:
             self.esta_invocando = False
             self.tiros_desde_invocacao = 0
-            self.tiros_para_invocar = random.randint(8, 30)  # Novo alvo aleatório
+            self.tiros_para_invocar = rng_jogo.randint(8, 30)  # Novo alvo aleatório
             print(f"🧙 Mago terminou invocação! Próxima em {self.tiros_para_invocar} tiros")
             return True
 
@@ -14,6 +14,7 @@ from src.entities.quadrado import Quadrado
 from src.entities.tiro import Tiro
 from src.entities.particula import Particula
 from src.utils.sound import gerar_som_tiro
+from src.utils.rng import rng_jogo
 
 
 class InimigoMetralhadora(Quadrado):
@@ -125,8 +126,8 @@ class InimigoMetralhadora(Quadrado):
 
         # Adicionar imprecisão (metralhadora não é perfeitamente precisa)
         imprecisao = 0.1
-        dx += random.uniform(-imprecisao, imprecisao)
-        dy += random.uniform(-imprecisao, imprecisao)
+        dx += rng_jogo.uniform(-imprecisao, imprecisao)
+        dy += rng_jogo.uniform(-imprecisao, imprecisao)
 
         # Normalizar novamente
         distancia_nova = math.sqrt(dx * dx + dy * dy)
@@ -10,6 +10,8 @@ import pygame
 import random
 import math
 from src.config import *
+from src.utils.fonts import obter_fonte, renderizar_texto
+from src.utils.rng import rng_jogo
 
 
 class ItemDrop:
@@ -116,7 +118,7 @@ class ItemDrop:
         pygame.draw.rect(tela, cor_brilho, brilho_rect, 0, 3)
 
         # Ícone/letra indicando tipo
-        fonte_icone = pygame.font.SysFont("Arial", 16, True)
+        fonte_icone = obter_fonte("Arial", 16, True)
         if self.tipo == 'arma':
             icone_letra = self.subtipo[0].upper()  # Primeira letra
         else:
@@ -128,7 +130,7 @@ class ItemDrop:
             }
             icone_letra = icones.get(self.subtipo, '?')
 
-        texto = fonte_icone.render(icone_letra, True, BRANCO)
+        texto = renderizar_texto(icone_letra, fonte_icone, BRANCO)
         tela.blit(texto, (item_rect.centerx - texto.get_width() // 2,
                          item_rect.centery - texto.get_height() // 2))
 
@@ -163,12 +165,12 @@ def gerar_item_aleatorio():
     Retorna (tipo, subtipo).
     """
     # 60% chance de arma, 40% chance de item
-    if random.random() < 0.6:
+    if rng_jogo.random() < 0.6:
         armas = ['espingarda', 'metralhadora', 'desert_eagle']
-        return ('arma', random.choice(armas))
+        return ('arma', rng_jogo.choice(armas))
     else:
         itens = ['granada', 'vida', 'sabre']
-        return ('item', random.choice(itens))
+        return ('item', rng_jogo.choice(itens))
 
 
 def spawnar_item_aleatorio(largura, altura):
@@ -178,8 +180,8 @@ def spawnar_item_aleatorio(largura, altura):
     """
     # Posição aleatória na arena
     margem = 50
-    x = random.randint(margem, largura - margem)
-    y = random.randint(margem, altura - margem)
+    x = rng_jogo.randint(margem, largura - margem)
+    y = rng_jogo.randint(margem, altura - margem)
 
     tipo, subtipo = gerar_item_aleatorio()
 
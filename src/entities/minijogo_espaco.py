@@ -16,7 +16,8 @@ import random
 from src.config import *
 from src.game.fase_base import FaseBase
 from src.utils.display_manager import present_frame
-from src.utils.visual import desenhar_texto
+from src.utils.visual import desenhar_texto, desenhar_overlay_cor
+from src.utils.rng import rng_jogo
 
 
 # ---------------------------------------------------------------------------
@@ -101,10 +102,7 @@ class MinijogoEspacoBase(FaseBase):
                     return 'saiu'
             self.renderizar_fundo()
             if alpha > 0:
-                ov = pygame.Surface((LARGURA, ALTURA_JOGO))
-                ov.fill((0, 0, 0))
-                ov.set_alpha(alpha)
-                self.tela.blit(ov, (0, 0))
+                desenhar_overlay_cor(self.tela, (0, 0, 0), alpha, (LARGURA, ALTURA_JOGO))
             present_frame()
             self.relogio.tick(FPS)
 
@@ -223,10 +221,7 @@ class MinijogoEspacoBase(FaseBase):
         # Fade para preto ao final (esconde transição de volta ao jogo)
         if self._queda_splashado:
             fade_alpha = min(220, self._queda_timer * 3)
-            ov = pygame.Surface((LARGURA, ALTURA_JOGO))
-            ov.fill((0, 0, 0))
-            ov.set_alpha(fade_alpha)
-            self.tela.blit(ov, (0, 0))
+            desenhar_overlay_cor(self.tela, (0, 0, 0), fade_alpha, (LARGURA, ALTURA_JOGO))
 
 
 # ---------------------------------------------------------------------------
@@ -293,8 +288,7 @@ class MinijogoDesviarTiros(MinijogoEspacoBase):
                 return 'saiu'
 
             if self.pausado:
-                self.renderizar_menu_pausa()
-                present_frame()
+                present_frame(self.renderizar_menu_pausa())
                 self.relogio.tick(FPS)
                 continue
 
@@ -456,7 +450,7 @@ class MinijogoBatataQuente(MinijogoEspacoBase):
         dx, dy = cx - fx, cy - fy
         dist = math.hypot(dx, dy)
         if dist < 1:
-            dx, dy = random.uniform(-1, 1), random.uniform(-1, 1)
+            dx, dy = rng_jogo.uniform(-1, 1), rng_jogo.uniform(-1, 1)
             dist = max(1.0, math.hypot(dx, dy))
         ndx, ndy = dx / dist, dy / dist
 
@@ -476,14 +470,14 @@ class MinijogoBatataQuente(MinijogoEspacoBase):
         # Finta lateral periódica
         if not hasattr(inimigo, '_bq_dodge_t'):
             inimigo._bq_dodge_t   = agora
-            inimigo._bq_dodge_dir = random.choice([-1, 1])
-            inimigo._bq_dodge_int = random.randint(900, 1800)
+            inimigo._bq_dodge_dir = rng_jogo.choice([-1, 1])
+            inimigo._bq_dodge_int = rng_jogo.randint(900, 1800)
 
         elapsed = agora - inimigo._bq_dodge_t
         if elapsed > inimigo._bq_dodge_int:
             inimigo._bq_dodge_t   = agora
-            inimigo._bq_dodge_dir = random.choice([-1, 1])
-            inimigo._bq_dodge_int = random.randint(900, 1800)
+            inimigo._bq_dodge_dir = rng_jogo.choice([-1, 1])
+            inimigo._bq_dodge_int = rng_jogo.randint(900, 1800)
             elapsed = 0
 
         # Finta ativa nos primeiros 260ms do intervalo
@@ -572,8 +566,7 @@ class MinijogoBatataQuente(MinijogoEspacoBase):
                 return _sair('saiu')
 
             if self.pausado:
-                self.renderizar_menu_pausa()
-                present_frame()
+                present_frame(self.renderizar_menu_pausa())
                 self.relogio.tick(FPS)
                 continue
 
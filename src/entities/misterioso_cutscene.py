@@ -12,7 +12,7 @@ import random
 from src.config import *
 from src.entities.quadrado import Quadrado
 from src.entities.particula import Particula
-from src.utils.visual import desenhar_texto, desenhar_estrelas
+from src.utils.visual import desenhar_texto, desenhar_estrelas, desenhar_overlay_cor
 from src.utils.display_manager import present_frame
 
 
@@ -376,18 +376,15 @@ class MisteriosoCutscene:
 
         # Efeito de distorção da tela durante teletransporte
         if self.estado == "teletransporte":
-            overlay = pygame.Surface((LARGURA, ALTURA), pygame.SRCALPHA)  # ALTURA completa incluindo HUD
             intensidade = int(100 * (1 - self.intensidade_distorcao))
-            overlay.fill((100, 0, 0, intensidade))
-            tela.blit(overlay, (0, 0))
+            # ALTURA completa incluindo HUD
+            desenhar_overlay_cor(tela, (100, 0, 0), intensidade, (LARGURA, ALTURA))
 
 
         # Efeito de fade in (tela preta no início) - ALTURA completa incluindo HUD
         if self.alpha_fade > 0:
-            fade_surface = pygame.Surface((LARGURA, ALTURA))  # ALTURA total, não ALTURA_JOGO
-            fade_surface.fill((0, 0, 0))
-            fade_surface.set_alpha(self.alpha_fade)
-            tela.blit(fade_surface, (0, 0))
+            # ALTURA total, não ALTURA_JOGO
+            desenhar_overlay_cor(tela, (0, 0, 0), self.alpha_fade, (LARGURA, ALTURA))
 
 
 def executar_cutscene_misterioso(tela, relogio, gradiente_jogo, estrelas, jogador_pos, jogador=None):
@@ -12,7 +12,7 @@ import random
 from src.config import *
 from src.entities.quadrado import Quadrado
 from src.entities.particula import Particula
-from src.utils.visual import desenhar_texto, desenhar_estrelas
+from src.utils.visual import desenhar_texto, desenhar_estrelas, desenhar_overlay_cor
 from src.utils.display_manager import present_frame
 
 
@@ -907,10 +907,7 @@ class MisteriosoFase25Cutscene:
 
         # Efeito de fade in
         if self.alpha_fade > 0:
-            fade_surface = pygame.Surface((LARGURA, ALTURA))
-            fade_surface.fill((0, 0, 0))
-            fade_surface.set_alpha(self.alpha_fade)
-            tela.blit(fade_surface, (0, 0))
+            desenhar_overlay_cor(tela, (0, 0, 0), self.alpha_fade, (LARGURA, ALTURA))
 
     def desenhar_desert_eagle_simples(self, tela, x, y):
         """Desenha a Desert Eagle com rotação (idêntica ao desert_eagle.py)."""
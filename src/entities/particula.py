@@ -85,6 +85,23 @@ class Particula:
                 # Se houver algum erro, apenas ignore esta partícula
                 pass
 
+    def regiao(self):
+        """
+        Retângulo que o próximo desenhar pode pintar (camadas das telas
+        retidas, src/ui/retained_ui.py).
+
+        Returns:
+            pygame.Rect em volta da partícula girada, ou None se ela não aparece
+        """
+        tamanho_surf = int(self.tamanho * 2)
+        if self.tamanho <= 0.5 or tamanho_surf <= 0:
+            return None
+        # A superfície girada tem no máximo o lado vezes raiz de 2
+        lado = int(tamanho_surf * 1.5) + 4
+        rect = pygame.Rect(0, 0, lado, lado)
+        rect.center = (int(self.x), int(self.y))
+        return rect
+
     def acabou(self):
         """Verifica se a partícula completou seu ciclo de vida."""
         return self.vida <= 0
@@ -17,8 +17,11 @@ from src.items.granada import carregar_upgrade_granada,desenhar_granada_selecion
 from src.weapons.espingarda import carregar_upgrade_espingarda,desenhar_espingarda
 from src.weapons.metralhadora import carregar_upgrade_metralhadora, desenhar_metralhadora
 from src.utils.display_manager import convert_mouse_position
+from src.utils.sprites import sprite_quadrado
 from src.weapons.sabre_luz import carregar_upgrade_sabre, desenhar_sabre
 from src.items.dimensional_hop import carregar_upgrade_dimensional_hop, desenhar_dimensional_hop_selecionado, DimensionalHop
+from src.utils.saves import caminho_dados
+from src.utils.rng import novo_id_entidade
 
 class Quadrado:
     """
@@ -160,7 +163,7 @@ class Quadrado:
         self.tempo_recuo = 0
         
         # Identificador (útil para fases)
-        self.id = id(self)
+        self.id = novo_id_entidade()
         
         # OPCIONAL: Log de debug (remover em produção)
         if cor == AZUL:
@@ -174,8 +177,8 @@ class Quadrado:
         """
         try:
             # Verificar se o arquivo existe
-            if os.path.exists("data/upgrades.json"):
-                with open("data/upgrades.json", "r") as f:
+            if os.path.exists(caminho_dados("upgrades.json")):
+                with open(caminho_dados("upgrades.json"), "r") as f:
                     upgrades = json.load(f)
                     return upgrades.get("vida", 1)
             return 1
@@ -189,8 +192,8 @@ class Quadrado:
         Retorna 0 se não houver upgrade.
         """
         try:
-            if os.path.exists("data/upgrades.json"):
-                with open("data/upgrades.json", "r") as f:
+            if os.path.exists(caminho_dados("upgrades.json")):
+                with open(caminho_dados("upgrades.json"), "r") as f:
                     upgrades = json.load(f)
                     return upgrades.get("faca", 0)
             return 0
@@ -204,8 +207,8 @@ class Quadrado:
         Retorna 0 se não houver upgrade.
         """
         try:
-            if os.path.exists("data/upgrades.json"):
-                with open("data/upgrades.json", "r") as f:
+            if os.path.exists(caminho_dados("upgrades.json")):
+                with open(caminho_dados("upgrades.json"), "r") as f:
                     upgrades = json.load(f)
                     return upgrades.get("ampulheta", 0)
             return 0
@@ -219,8 +222,8 @@ class Quadrado:
         Retorna 0 se não houver upgrade.
         """
         try:
-            if os.path.exists("data/upgrades.json"):
-                with open("data/upgrades.json", "r") as f:
+            if os.path.exists(caminho_dados("upgrades.json")):
+                with open(caminho_dados("upgrades.json"), "r") as f:
                     upgrades = json.load(f)
                     return upgrades.get("dash", 0)
             return 0
@@ -528,31 +531,17 @@ class Quadrado:
                                 int(self.y - offset_y + random.uniform(0, self.tamanho))), 
                                 tamanho_particula)
 
-        # Desenhar sombra
-        pygame.draw.rect(tela, (20, 20, 20), 
-                        (self.x + 4, self.y + 4, 
-                        self.tamanho, self.tamanho), 0, 3)
-        
         # Desenhar o quadrado com bordas arredondadas
         cor_uso = self.cor
         if self.efeito_dano > 0:
             cor_uso = BRANCO
             self.efeito_dano -= 1
         
-        # Quadrado interior
-        pygame.draw.rect(tela, self.cor_escura, 
-                        (self.x, self.y, 
-                        self.tamanho + mod_tamanho, self.tamanho + mod_tamanho), 0, 5)
-        
-        # Quadrado exterior (menor)
-        pygame.draw.rect(tela, cor_uso, 
-                        (self.x + 3, self.y + 3, 
-                        self.tamanho + mod_tamanho - 6, self.tamanho + mod_tamanho - 6), 0, 3)
-        
-        # Brilho no canto superior esquerdo
-        pygame.draw.rect(tela, self.cor_brilhante, 
-                        (self.x + 5, self.y + 5, 
-                        8, 8), 0, 2)
+        # Sombra, quadrado interior, exterior (menor) e brilho no canto
+        # superior esquerdo, compostos uma vez por tamanho/pulsação/cor
+        tela.blit(sprite_quadrado(self.tamanho, mod_tamanho, cor_uso,
+                                  self.cor_escura, self.cor_brilhante),
+                  (self.x, self.y))
         
         # Desenhar indicador de vidas (barra de vida)
         vida_largura = 50
@@ -1201,8 +1190,8 @@ class Quadrado:
         Retorna 0 se não houver upgrade.
         """
         try:
-            if os.path.exists("data/upgrades.json"):
-                with open("data/upgrades.json", "r") as f:
+            if os.path.exists(caminho_dados("upgrades.json")):
+                with open(caminho_dados("upgrades.json"), "r") as f:
                     upgrades = json.load(f)
                     return upgrades.get("sabre_luz", 0)
             return 0
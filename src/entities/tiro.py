@@ -10,6 +10,14 @@ import math
 import random
 from src.config import LARGURA, ALTURA
 from src.config import LARGURA_JOGO, ALTURA_JOGO
+from src.utils.sprites import cache_sprites, disco, sprite_brilho
+
+# Brilho aditivo dos projéteis (pixels além do raio do tiro e fração da
+# cor no centro)
+RAIO_BRILHO_TIRO = 8
+RAIO_BRILHO_BOLA_FOGO = 12
+INTENSIDADE_BRILHO_TIRO = 0.6
+COR_BRILHO_BOLA_FOGO = (255, 120, 0)
 
 class Tiro:
     """
@@ -71,79 +79,149 @@ class Tiro:
 
     def desenhar(self, tela):
         """Desenha o tiro e seu rastro de partículas."""
+        desenhar_tiros(tela, (self,))
+
+    def _adicionar_ao_lote(self, lote, lote_brilho):
+        """Coloca o brilho, o rastro e o corpo do tiro nos lotes do desenhar_tiros."""
         # Verificar se é uma bola de fogo especial
         if hasattr(self, 'tipo_bola_fogo') and self.tipo_bola_fogo:
-            self._desenhar_bola_fogo(tela)
+            self._lote_bola_fogo(lote, lote_brilho)
             return
 
         # Verificar se é uma bolha (inimigo peixe - fases aquáticas)
         if hasattr(self, 'tipo_bolha') and self.tipo_bolha:
-            self._desenhar_bolha(tela)
+            self._lote_bolha(lote)
             return
 
-        # Desenhar partículas de rastro
+        x, y = int(self.x), int(self.y)
+
+        # Brilho aditivo em volta do tiro
+        raio_brilho = self.raio + RAIO_BRILHO_TIRO
+        lote_brilho.append((sprite_brilho(raio_brilho, self.cor, INTENSIDADE_BRILHO_TIRO),
+                            (x - raio_brilho, y - raio_brilho), None, pygame.BLEND_ADD))
+
+        # Partículas de rastro (poucos raios: um disco de cada por tiro)
+        discos = {}
         for particula in self.particulas:
-            alpha = int(255 * (particula['vida'] / 15))
             raio = int(particula['raio'])
             if raio > 0:
-                pygame.draw.circle(tela, self.cor, (int(particula['x']), int(particula['y'])), raio)
-
-        # Desenhar brilho externo
-        pygame.draw.circle(tela, self.cor, (int(self.x), int(self.y)), self.raio + 2)
-
-        # Desenhar tiro principal
-        pygame.draw.circle(tela, self.cor_interna, (int(self.x), int(self.y)), self.raio)
-
-    def _desenhar_bola_fogo(self, tela):
-        """Desenha uma bola de fogo com efeito especial."""
+                sprite = discos.get(raio)
+                if sprite is None:
+                    sprite = discos[raio] = disco(raio, self.cor)
+                lote.append((sprite, (int(particula['x']) - raio, int(particula['y']) - raio)))
+
+        # Borda (cor do tiro) e tiro principal
+        externo = self.raio + 2
+        corpo = cache_sprites.obter(('tiro', self.raio, tuple(self.cor), self.cor_interna),
+                                    self._montar_corpo)
+        lote.append((corpo, (x - externo, y - externo)))
+
+    def _montar_corpo(self):
+        """Borda e tiro principal com centro em (raio + 2, raio + 2)."""
+        externo = self.raio + 2
+        corpo = pygame.Surface((2 * externo, 2 * externo), pygame.SRCALPHA)
+        pygame.draw.circle(corpo, self.cor, (externo, externo), externo)
+        pygame.draw.circle(corpo, self.cor_interna, (externo, externo), self.raio)
+        return corpo
+
+    def _lote_bola_fogo(self, lote, lote_brilho):
+        """Bola de fogo: brilho laranja, rastro em gradiente e camadas pulsantes."""
         tempo_atual = pygame.time.get_ticks()
+        x, y = int(self.x), int(self.y)
+
+        # Brilho aditivo do fogo
+        raio_brilho = self.raio + RAIO_BRILHO_BOLA_FOGO
+        lote_brilho.append((sprite_brilho(raio_brilho, COR_BRILHO_BOLA_FOGO, INTENSIDADE_BRILHO_TIRO),
+                            (x - raio_brilho, y - raio_brilho), None, pygame.BLEND_ADD))
 
-        # Desenhar partículas de rastro (mais intensas)
+        # Partículas de rastro (mais intensas)
         for particula in self.particulas:
-            alpha = int(255 * (particula['vida'] / 15))
             raio = int(particula['raio'])
             if raio > 0:
                 # Cor gradiente do fogo (laranja -> vermelho)
                 cor_particula = (255, int(100 * (particula['vida'] / 15)), 0)
-                pygame.draw.circle(tela, cor_particula, (int(particula['x']), int(particula['y'])), raio)
+                lote.append((disco(raio, cor_particula),
+                             (int(particula['x']) - raio, int(particula['y']) - raio)))
 
         # Núcleo da bola de fogo (pulsante)
         pulso = int(2 * abs(math.sin(tempo_atual / 100)))
+        externo = max(self.raio + pulso, 2)
+        corpo = cache_sprites.obter(('bola_fogo', self.raio, pulso),
+                                    lambda: self._montar_bola_fogo(pulso))
+        lote.append((corpo, (x - externo, y - externo)))
+
+    def _montar_bola_fogo(self, pulso):
+        """Camadas da bola de fogo com centro em (externo, externo)."""
+        externo = max(self.raio + pulso, 2)
+        corpo = pygame.Surface((2 * externo, 2 * externo), pygame.SRCALPHA)
+        centro = (externo, externo)
 
         # Camada externa (vermelha escura)
-        pygame.draw.circle(tela, (200, 50, 0), (int(self.x), int(self.y)), self.raio + pulso)
+        pygame.draw.circle(corpo, (200, 50, 0), centro, self.raio + pulso)
 
         # Camada média (laranja)
-        pygame.draw.circle(tela, (255, 100, 0), (int(self.x), int(self.y)), self.raio - 2 + pulso)
+        pygame.draw.circle(corpo, (255, 100, 0), centro, self.raio - 2 + pulso)
 
         # Camada interna (amarela brilhante)
-        pygame.draw.circle(tela, (255, 200, 0), (int(self.x), int(self.y)), self.raio - 4 + pulso)
+        pygame.draw.circle(corpo, (255, 200, 0), centro, self.raio - 4 + pulso)
 
         # Núcleo branco super quente
-        pygame.draw.circle(tela, (255, 255, 200), (int(self.x), int(self.y)), max(2, self.raio - 6))
+        pygame.draw.circle(corpo, (255, 255, 200), centro, max(2, self.raio - 6))
+        return corpo
 
-    def _desenhar_bolha(self, tela):
-        """Desenha uma bolha (projétil do inimigo peixe)."""
+    def _lote_bolha(self, lote):
+        """Bolha (projétil do inimigo peixe): rastro de bolhinhas e a bolha."""
         x, y, r = int(self.x), int(self.y), self.raio
 
         # Rastro de bolhinhas menores
         for particula in self.particulas:
             raio_p = max(1, int(particula['raio']))
-            pygame.draw.circle(tela, (160, 215, 245),
-                               (int(particula['x']), int(particula['y'])), raio_p, 1)
+            lote.append((disco(raio_p, (160, 215, 245), 1),
+                         (int(particula['x']) - raio_p, int(particula['y']) - raio_p)))
+
+        externo = r + 2
+        corpo = cache_sprites.obter(('bolha', r), self._montar_bolha)
+        lote.append((corpo, (x - externo, y - externo)))
+
+    def _montar_bolha(self):
+        """Anéis, interior e reflexo da bolha com centro em (raio + 2, raio + 2)."""
+        r = self.raio
+        externo = r + 2
+        corpo = pygame.Surface((2 * externo, 2 * externo), pygame.SRCALPHA)
+        x = y = externo
 
         # Anel externo (brilho)
-        pygame.draw.circle(tela, (200, 235, 255), (x, y), r + 2, 1)
+        pygame.draw.circle(corpo, (200, 235, 255), (x, y), r + 2, 1)
         # Anel principal
-        pygame.draw.circle(tela, (180, 225, 255), (x, y), r, 2)
+        pygame.draw.circle(corpo, (180, 225, 255), (x, y), r, 2)
         # Interior claro semitransparente
-        pygame.draw.circle(tela, (230, 248, 255), (x, y), max(1, r - 3))
+        pygame.draw.circle(corpo, (230, 248, 255), (x, y), max(1, r - 3))
         # Reflexo de luz (brilho superior esquerdo)
         shine_x = x - max(1, r // 3)
         shine_y = y - max(1, r // 3)
-        pygame.draw.circle(tela, (255, 255, 255), (shine_x, shine_y), max(1, r // 4))
+        pygame.draw.circle(corpo, (255, 255, 255), (shine_x, shine_y), max(1, r // 4))
+        return corpo
 
     def fora_da_tela(self):
         """Verifica se o tiro saiu dos limites da tela de jogo."""
         return (self.x < 0 or self.x > LARGURA or 
-                self.y < 0 or self.y > ALTURA_JOGO)
\ No newline at end of file
+                self.y < 0 or self.y > ALTURA_JOGO)
+
+
+def desenhar_tiros(tela, tiros):
+    """
+    Desenha vários tiros com duas chamadas a Surface.blits: primeiro todos
+    os brilhos (BLEND_ADD), depois rastros e corpos na ordem dos tiros.
+
+    Args:
+        tela: Superfície onde desenhar
+        tiros: Lista de Tiro
+    """
+    lote = []
+    lote_brilho = []
+    for tiro in tiros:
+        tiro._adicionar_ao_lote(lote, lote_brilho)
+    if lote_brilho:
+        tela.blits(lote_brilho, doreturn=False)
+    if lote:
+        tela.blits(lote, doreturn=False)
@@ -18,9 +18,10 @@ import pygame
 import math
 import random
 from src.config import *
-from src.utils.visual import criar_gradiente, criar_estrelas
+from src.utils.visual import criar_gradiente, criar_estrelas, desenhar_overlay_cor
 from src.utils.display_manager import present_frame
 from src.game.fase_base import FaseBase
+from src.utils.rng import rng_jogo
 
 
 # ---------------------------------------------------------------------------
@@ -171,8 +172,7 @@ class FaseEspacoTubarao(FaseBase):
                 break
 
             if self.pausado:
-                self.renderizar_menu_pausa()
-                present_frame()
+                present_frame(self.renderizar_menu_pausa())
                 self.relogio.tick(FPS)
                 continue
 
@@ -244,10 +244,7 @@ class FaseEspacoTubarao(FaseBase):
             self.renderizar_hud(tempo_atual, self.inimigos)
 
             if self.fade_in > 0:
-                fade_surf = pygame.Surface((LARGURA, ALTURA))
-                fade_surf.fill((0, 0, 0))
-                fade_surf.set_alpha(self.fade_in)
-                self.tela.blit(fade_surf, (0, 0))
+                desenhar_overlay_cor(self.tela, (0, 0, 0), self.fade_in, (LARGURA, ALTURA))
 
             self.renderizar_mira(pos_mouse)
             present_frame()
@@ -338,10 +335,7 @@ class FaseEspacoTubarao(FaseBase):
         # Fade para preto após o splash (prepara transição de volta ao jogo)
         if self._queda_splashado:
             fade_alpha = min(255, self._queda_timer * 4)
-            ov = pygame.Surface((LARGURA, ALTURA_JOGO))
-            ov.fill((0, 0, 0))
-            ov.set_alpha(fade_alpha)
-            self.tela.blit(ov, (0, 0))
+            desenhar_overlay_cor(self.tela, (0, 0, 0), fade_alpha, (LARGURA, ALTURA_JOGO))
 
     def _desenhar_arco(self):
         """Arco-íris guia no espaço."""
@@ -389,7 +383,7 @@ class TubaraoMiniCutscene:
         cy = jogador.y + jogador.tamanho // 2
 
         dirs = ['baixo', 'baixo', 'baixo', 'esquerda', 'direita']
-        self.direcao = random.choice(dirs)
+        self.direcao = rng_jogo.choice(dirs)
         if self.direcao == 'baixo':
             self.tx, self.ty = float(cx), float(ALTURA_JOGO + self.TAMANHO + 30)
             self.tvx, self.tvy = 0.0, -self.VEL_PULA
@@ -588,8 +582,7 @@ class TubaraoMiniCutscene:
             desenhar_tubarao(self.tela, self.tx+ox, self.ty+oy, self.TAMANHO, self.t_ang, self.t_boca)
             if e == "engolir":
                 fa = max(0, 160 - int(160 * t / 250))
-                fs = pygame.Surface((LARGURA, ALTURA_JOGO)); fs.fill((200,240,255)); fs.set_alpha(fa)
-                self.tela.blit(fs, (0, 0))
+                desenhar_overlay_cor(self.tela, (200, 240, 255), fa)
 
         elif e == "fade_praia":
             self.render_gameplay(self.tela, show_player=False, show_hud=False)
@@ -669,8 +662,7 @@ class TubaraoMiniCutscene:
         desenhar_tubarao(self.tela,int(self.tp_x),int(self.tp_y)+off,self.TAMANHO,self.tp_ang,False)
 
     def _overlay(self, alpha):
-        ov=pygame.Surface((LARGURA,ALTURA_JOGO)); ov.fill((0,0,0)); ov.set_alpha(alpha)
-        self.tela.blit(ov,(0,0))
+        desenhar_overlay_cor(self.tela, (0, 0, 0), alpha)
 
 
 # ---------------------------------------------------------------------------
@@ -720,12 +712,8 @@ def executar_cutscene_tubarao(tela, relogio, jogador, render_gameplay,
         jogador.invulneravel         = False
         jogador.duracao_invulneravel = 0
         # Fade de preto → jogo (sem HUD para não aparecer abruptamente)
-        ov = pygame.Surface((LARGURA, ALTURA_JOGO))
-        ov.fill((0, 0, 0))
         for alpha in range(255, -1, -10):
             render_gameplay(tela, show_hud=False)
-            if alpha > 0:
-                ov.set_alpha(alpha)
-                tela.blit(ov, (0, 0))
+            desenhar_overlay_cor(tela, (0, 0, 0), alpha)
             present_frame()
             relogio.tick(FPS)
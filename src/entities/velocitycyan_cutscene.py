@@ -13,7 +13,7 @@ import random
 from src.config import *
 from src.entities.quadrado import Quadrado
 from src.entities.particula import Particula
-from src.utils.visual import desenhar_texto, desenhar_estrelas
+from src.utils.visual import desenhar_texto, desenhar_estrelas, desenhar_overlay_cor
 from src.utils.display_manager import present_frame
 
 
@@ -868,10 +868,7 @@ class VelocityCyanCutscene:
 
         # Efeito de fade in (tela preta no início)
         if self.alpha_fade > 0:
-            fade_surface = pygame.Surface((LARGURA, ALTURA))
-            fade_surface.fill((0, 0, 0))
-            fade_surface.set_alpha(self.alpha_fade)
-            tela.blit(fade_surface, (0, 0))
+            desenhar_overlay_cor(tela, (0, 0, 0), self.alpha_fade, (LARGURA, ALTURA))
 
 
 def executar_cutscene_velocitycyan(tela, relogio, gradiente_jogo, estrelas, jogador_pos, jogador=None, musica_path=None):
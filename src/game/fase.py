@@ -13,13 +13,16 @@ import math
 from src.config import *
 from src.game.fase_base import FaseBase
 from src.game.nivel_factory import NivelFactory
-from src.utils.visual import desenhar_texto
+from src.utils.visual import desenhar_texto, desenhar_overlay_cor
 from src.utils.display_manager import present_frame
+from src.utils.profiler import escopo
+from src.utils.replay import iniciar_gravacao_fase
 from src.entities.inimigo_ia import atualizar_IA_inimigo
 from src.items.chucky_invocation import atualizar_invocacoes_com_inimigos
 
 # Importação do sistema modular de boss fights
 from src.game.fase_boss import executar_boss_fight
+from src.utils.rng import rng_jogo
 
 
 class FaseNormal(FaseBase):
@@ -46,7 +49,7 @@ class FaseNormal(FaseBase):
         self._tubarao_disparado    = False
         self._cutscene_tubarao_em_curso = False
         if numero_fase >= 26 and self.inimigos:
-            self._tubarao_inimigo_idx = random.randint(0, len(self.inimigos) - 1)
+            self._tubarao_inimigo_idx = rng_jogo.randint(0, len(self.inimigos) - 1)
 
     def executar(self):
         """
@@ -66,7 +69,8 @@ class FaseNormal(FaseBase):
                 pygame.mouse.set_visible(True)
 
             # Processar eventos
-            resultado = self.processar_eventos()
+            with escopo('eventos'):
+                resultado = self.processar_eventos()
             if resultado == "sair":
                 self.limpar()
                 return False
@@ -90,8 +94,7 @@ class FaseNormal(FaseBase):
 
             # Se pausado, mostrar menu de pausa
             if self.pausado:
-                self.renderizar_menu_pausa()
-                present_frame()
+                present_frame(self.renderizar_menu_pausa())
                 self.relogio.tick(FPS)
                 continue
 
@@ -99,27 +102,31 @@ class FaseNormal(FaseBase):
             fator_tempo = self.jogador.obter_fator_tempo()
 
             # Atualizar jogador
-            self.atualizar_jogador(pos_mouse, tempo_atual)
-            atualizar_invocacoes_com_inimigos(self.inimigos, self.particulas, self.flashes)
+            with escopo('jogador'):
+                self.atualizar_jogador(pos_mouse, tempo_atual)
+                atualizar_invocacoes_com_inimigos(self.inimigos, self.particulas, self.flashes)
 
             # Atualizar moedas
-            self.atualizar_moedas()
+            with escopo('moedas'):
+                self.atualizar_moedas()
 
             # Atualizar IA dos inimigos
-            self._atualizar_inimigos(tempo_atual, fator_tempo)
+            with escopo('ia'):
+                self._atualizar_inimigos(tempo_atual, fator_tempo)
 
             # Atualizar tiros
-            self.atualizar_tiros_jogador(self.inimigos)
-            self.atualizar_tiros_inimigo()
+            with escopo('tiros'):
+                self.atualizar_tiros_jogador(self.inimigos)
+                self.atualizar_tiros_inimigo()
 
-            # Processar sabre de luz
-            self.processar_sabre_luz(self.inimigos)
-
-            # Processar granadas
-            self.processar_granadas(self.inimigos)
+            # Processar sabre de luz e granadas
+            with escopo('armas'):
+                self.processar_sabre_luz(self.inimigos)
+                self.processar_granadas(self.inimigos)
 
             # Atualizar efeitos visuais
-            self.atualizar_efeitos_visuais()
+            with escopo('efeitos'):
+                self.atualizar_efeitos_visuais()
 
             # Mini-cutscene do tubarão: gatilho no inimigo sorteado (1 vez por partida)
             if (self._tubarao_inimigo_idx >= 0
@@ -336,20 +343,20 @@ class FaseNormal(FaseBase):
     def _renderizar_fase(self, tempo_atual, pos_mouse):
         """Renderiza toda a fase."""
         # Fundo
-        self.renderizar_fundo()
+        with escopo('render_fundo'):
+            self.renderizar_fundo()
 
         # Objetos do jogo
-        self.renderizar_objetos_jogo(tempo_atual, self.inimigos)
+        with escopo('render_objetos'):
+            self.renderizar_objetos_jogo(tempo_atual, self.inimigos)
 
         # HUD
-        self.renderizar_hud(tempo_atual, self.inimigos)
+        with escopo('hud'):
+            self.renderizar_hud(tempo_atual, self.inimigos)
 
         # Fade-in
         if self.fade_in > 0:
-            fade = pygame.Surface((LARGURA, ALTURA))
-            fade.fill((0, 0, 0))
-            fade.set_alpha(self.fade_in)
-            self.tela.blit(fade, (0, 0))
+            desenhar_overlay_cor(self.tela, (0, 0, 0), self.fade_in, (LARGURA, ALTURA))
 
         # Mensagem de vitória durante transição
         if self.tempo_transicao_vitoria is not None:
@@ -360,7 +367,8 @@ class FaseNormal(FaseBase):
             self._desenhar_mensagem_derrota()
 
         # Mira do mouse
-        self.renderizar_mira(pos_mouse)
+        with escopo('render_mira'):
+            self.renderizar_mira(pos_mouse)
 
     def _desenhar_mensagem_vitoria(self):
         """Desenha mensagem de vitória."""
@@ -388,10 +396,8 @@ class FaseNormal(FaseBase):
         self.tela.blit(texto_surf, texto_rect)
 
         # Efeito de tela vermelha
-        overlay = pygame.Surface((LARGURA, ALTURA_JOGO))
-        overlay.fill(VERMELHO)
-        overlay.set_alpha(int(50 * (self.duracao_transicao_derrota - self.tempo_transicao_derrota) / self.duracao_transicao_derrota))
-        self.tela.blit(overlay, (0, 0))
+        alpha_overlay = int(50 * (self.duracao_transicao_derrota - self.tempo_transicao_derrota) / self.duracao_transicao_derrota)
+        desenhar_overlay_cor(self.tela, VERMELHO, alpha_overlay, (LARGURA, ALTURA_JOGO))
 
         # Mais partículas de derrota
         if random.random() < 0.3:
@@ -442,7 +448,7 @@ class FaseNormal(FaseBase):
 
 
 
-def jogar_fase(tela, relogio, numero_fase, gradiente_jogo, fonte_titulo, fonte_normal):
+def jogar_fase(tela, relogio, numero_fase, gradiente_jogo, fonte_titulo, fonte_normal, gravar=None):
     """
     Executa uma fase específica do jogo com sistema corrigido.
     REFATORADO: Usa sistema de classes para eliminar duplicação.
@@ -454,6 +460,7 @@ def jogar_fase(tela, relogio, numero_fase, gradiente_jogo, fonte_titulo, fonte_n
         gradiente_jogo: Superfície com o gradiente de fundo do jogo
         fonte_titulo: Fonte para títulos
         fonte_normal: Fonte para textos normais
+        gravar: Gravar um replay da fase (None = usar GRAVAR_REPLAYS)
 
     Returns:
         Resultado da fase:
@@ -461,6 +468,24 @@ def jogar_fase(tela, relogio, numero_fase, gradiente_jogo, fonte_titulo, fonte_n
             - False: jogador perdeu
             - "menu": voltar ao menu (quando pausado)
     """
+    if gravar is None:
+        gravar = GRAVAR_REPLAYS
+    if not gravar:
+        return _jogar_fase(tela, relogio, numero_fase, gradiente_jogo, fonte_titulo, fonte_normal)
+
+    # Seed e entradas de cada frame vão para o replay; a fase usa o relógio do gravador
+    gravador = iniciar_gravacao_fase(relogio, numero_fase)
+    resultado = None
+    try:
+        resultado = _jogar_fase(tela, gravador.relogio, numero_fase, gradiente_jogo,
+                                fonte_titulo, fonte_normal)
+    finally:
+        gravador.finalizar(resultado)
+    return resultado
+
+
+def _jogar_fase(tela, relogio, numero_fase, gradiente_jogo, fonte_titulo, fonte_normal):
+    """Cria e executa a fase (normal ou boss fight)."""
 
     # Criar a fase
     resultado_fase = NivelFactory.criar_fase(numero_fase)
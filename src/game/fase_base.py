@@ -12,12 +12,16 @@ import math
 from src.config import *
 from src.entities.quadrado import Quadrado
 from src.entities.particula import criar_explosao
-from src.utils.visual import criar_estrelas, desenhar_texto, criar_texto_flutuante, desenhar_estrelas, criar_botao, criar_relampagos, desenhar_relampago
+from src.entities.tiro import desenhar_tiros
+from src.utils.visual import criar_estrelas, desenhar_texto, criar_texto_flutuante, criar_botao, criar_relampagos, desenhar_relampago, desenhar_overlay_cor
 from src.utils.sound import gerar_som_explosao, gerar_som_dano
 from src.game.moeda_manager import MoedaManager
 from src.ui.hud import desenhar_hud
 from src.utils.display_manager import present_frame, convert_mouse_position
 from src.utils.visual import desenhar_mira, criar_mira
+from src.utils.fonts import obter_fonte
+from src.ui.retained_ui import TelaRetida
+from src.utils.fundo import FundoParallax
 
 # Importações das armas e itens
 from src.items.granada import Granada, lancar_granada, processar_granadas, inicializar_sistema_granadas, obter_intervalo_lancamento
@@ -30,6 +34,11 @@ from src.items.chucky_invocation import atualizar_invocacoes_com_inimigos, desen
 from src.items.amuleto import usar_amuleto_para_invocacao
 from src.items.ampulheta import usar_ampulheta, desenhar_efeito_tempo_desacelerado
 
+# As estrelas andavam duas vezes por frame (em atualizar_efeitos_visuais e
+# dentro do desenhar_estrelas); o fundo em camadas dá um passo só, com a
+# velocidade que se via na tela
+FATOR_VELOCIDADE_ESTRELAS = 2.0
+
 
 class FaseBase:
     """
@@ -49,7 +58,7 @@ class FaseBase:
         self.gradiente_jogo = gradiente_jogo
         self.fonte_titulo = fonte_titulo
         self.fonte_normal = fonte_normal
-        self.fonte_pequena = pygame.font.SysFont("Arial", 18)
+        self.fonte_pequena = obter_fonte("Arial", 18)
 
         # Criar jogador na posição especificada ou padrão
         if pos_jogador:
@@ -154,6 +163,23 @@ class FaseBase:
             self.proximo_relampago = None
             self.espinhos = []  # Sem espinhos nas fases 1-10
 
+    def _obter_fundo(self):
+        """
+        Fundo em camadas da fase, refeito se as estrelas ou o gradiente
+        forem trocados (minijogo do espaço, cutscene do tubarão).
+        """
+        fundo = getattr(self, '_fundo', None)
+        if fundo is None or fundo.gradiente is not self.gradiente_jogo or (
+                (fundo.peixes if self.tema_aquatico else fundo.estrelas) is not self.estrelas):
+            if self.tema_aquatico:
+                fundo = FundoParallax(self.gradiente_jogo, peixes=self.estrelas,
+                                      bolhas=self.bolhas_ambiente)
+            else:
+                fundo = FundoParallax(self.gradiente_jogo, estrelas=self.estrelas,
+                                      fator_velocidade=FATOR_VELOCIDADE_ESTRELAS)
+            self._fundo = fundo
+        return fundo
+
     def _criar_peixes_fundo(self):
         """Cria peixes triangulares decorativos de fundo para o tema aquático."""
         cores_peixe = [
@@ -197,6 +223,7 @@ class FaseBase:
         pygame.mouse.set_visible(False)
         self.mira_surface, self.mira_rect = criar_mira(12, BRANCO, AMARELO)
         self.rect_menu_pausado = None
+        self._tela_pausa = None
         self.ultimo_clique_mouse = 0
         self.intervalo_minimo_clique = 100
 
@@ -771,7 +798,7 @@ class FaseBase:
         processar_granadas(self.granadas, self.particulas, self.flashes, alvos, self.moeda_manager, self.tiros_jogador, self.jogador, self.tiros_inimigo)
 
     def atualizar_efeitos_visuais(self):
-        """Atualiza partículas, flashes e estrelas."""
+        """Atualiza partículas, flashes e o fundo (estrelas, peixes e bolhas)."""
         # Partículas
         for particula in self.particulas[:]:
             particula.atualizar()
@@ -785,20 +812,8 @@ class FaseBase:
             if flash['vida'] <= 0:
                 self.flashes.remove(flash)
 
-        # Estrelas / peixes de fundo
-        for estrela in self.estrelas:
-            estrela[0] -= estrela[4]  # Mover com base na velocidade
-            if estrela[0] < 0:
-                estrela[0] = LARGURA
-                estrela[1] = random.randint(0, ALTURA_JOGO)
-
-        # Bolhas ambiente (tema aquático)
-        if hasattr(self, 'bolhas_ambiente'):
-            for bolha in self.bolhas_ambiente:
-                bolha[1] -= bolha[3]  # Subir
-                if bolha[1] < -bolha[2]:
-                    bolha[1] = float(ALTURA_JOGO) + bolha[2]
-                    bolha[0] = float(random.randint(0, LARGURA))
+        # Estrelas / peixes e bolhas de fundo (camadas de paralaxe)
+        self._obter_fundo().atualizar()
 
     def _calcular_moedas_alvo(self, alvo):
         """Calcula quantas moedas um alvo deve dar."""
@@ -828,90 +843,13 @@ class FaseBase:
 
     # ==================== RENDERIZAÇÃO ====================
 
-    def _desenhar_peixes_fundo(self):
-        """Desenha peixes decorativos de fundo no estilo do inimigo peixe."""
-        # Ângulo fixo = π (todos nadam para a esquerda)
-        # Com cos_a=-1, sin_a=0: pt(fx,fy) = (cx - fx, cy - fy)
-        for peixe in self.estrelas:
-            x, y, tamanho, cor = peixe[0], peixe[1], peixe[2], peixe[5]
-            cx, cy = int(x), int(y)
-            if cx < -tamanho * 3 or cx > LARGURA + tamanho * 3:
-                continue
-            if cy < -tamanho * 2 or cy > ALTURA_JOGO + tamanho * 2:
-                continue
-
-            s = float(tamanho)
-            esc = tuple(max(0, c - 50) for c in cor)
-
-            # === CAUDA BIFURCADA ===
-            cauda_raiz = (cx + s * 0.35, cy)
-            cauda_top  = (cx + s * 1.05, cy + s * 0.65)
-            cauda_mid  = (cx + s * 0.65, cy)
-            cauda_bot  = (cx + s * 1.05, cy - s * 0.65)
-            pygame.draw.polygon(self.tela, esc, [cauda_raiz, cauda_top, cauda_mid])
-            pygame.draw.polygon(self.tela, esc, [cauda_raiz, cauda_bot, cauda_mid])
-            pygame.draw.polygon(self.tela, cor, [
-                cauda_raiz, (cx + s * 0.95, cy + s * 0.48), (cx + s * 0.60, cy)])
-            pygame.draw.polygon(self.tela, cor, [
-                cauda_raiz, (cx + s * 0.95, cy - s * 0.48), (cx + s * 0.60, cy)])
-
-            # === CORPO TRIANGULAR ===
-            pygame.draw.polygon(self.tela, esc, [
-                (cx - s,       cy),
-                (cx + s * 0.4, cy - s * 0.8),
-                (cx + s * 0.4, cy + s * 0.8),
-            ])
-            pygame.draw.polygon(self.tela, cor, [
-                (cx - s * 0.82, cy),
-                (cx + s * 0.32, cy - s * 0.62),
-                (cx + s * 0.32, cy + s * 0.62),
-            ])
-
-            # === NADADEIRA DORSAL (só para peixes maiores) ===
-            if s >= 9:
-                pygame.draw.polygon(self.tela, esc, [
-                    (cx - s * 0.1,  cy + s * 0.78),
-                    (cx - s * 0.35, cy + s * 1.25),
-                    (cx + s * 0.2,  cy + s * 0.78),
-                ])
-                pygame.draw.polygon(self.tela, cor, [
-                    (cx - s * 0.1,  cy + s * 0.78),
-                    (cx - s * 0.30, cy + s * 1.1),
-                    (cx + s * 0.12, cy + s * 0.78),
-                ])
-
-            # === LINHA LATERAL ===
-            if s >= 6:
-                pygame.draw.line(self.tela, esc,
-                                 (int(cx - s * 0.75), cy),
-                                 (int(cx + s * 0.3),  cy), 1)
-
-    def _desenhar_bolhas_ambiente(self):
-        """Desenha as bolhas decorativas do fundo aquático."""
-        for bolha in self.bolhas_ambiente:
-            x, y, raio = bolha[0], bolha[1], bolha[2]
-            ix, iy, ir = int(x), int(y), max(1, int(raio))
-            if 0 <= ix <= LARGURA and 0 <= iy <= ALTURA_JOGO:
-                # Anel da bolha
-                pygame.draw.circle(self.tela, (160, 215, 250), (ix, iy), ir, 1)
-                # Reflexo
-                shine_x = ix - max(1, ir // 3)
-                shine_y = iy - max(1, ir // 3)
-                pygame.draw.circle(self.tela, (220, 245, 255), (shine_x, shine_y), max(1, ir // 4))
-
     def renderizar_fundo(self):
         """Renderiza o fundo do jogo."""
-        self.tela.fill((0, 0, 0))
-        self.tela.blit(self.gradiente_jogo, (0, 0))
-
-        # Tema aquático (fases 26+)
-        if hasattr(self, 'tema_aquatico') and self.tema_aquatico:
-            self._desenhar_peixes_fundo()
-            self._desenhar_bolhas_ambiente()
+        # Gradiente e estrelas (ou peixes e bolhas no tema aquático, fases 26+)
+        self._obter_fundo().desenhar(self.tela)
+        if self.tema_aquatico:
             return
 
-        desenhar_estrelas(self.tela, self.estrelas)
-
         # Sistema de relâmpagos para fases 11+
         if self.numero_fase >= 11:
             tempo_atual = pygame.time.get_ticks()
@@ -973,12 +911,9 @@ class FaseBase:
                 elif hasattr(alvo, 'tipo_granada') and alvo.tipo_granada:
                     alvo.desenhar_equipamento_granada(self.tela, tempo_atual, self.jogador)
 
-        # Tiros
-        for tiro in self.tiros_jogador:
-            tiro.desenhar(self.tela)
-
-        for tiro in self.tiros_inimigo:
-            tiro.desenhar(self.tela)
+        # Tiros (em lote: brilhos, depois rastros e corpos)
+        desenhar_tiros(self.tela, self.tiros_jogador)
+        desenhar_tiros(self.tela, self.tiros_inimigo)
 
         # Granadas
         for granada in self.granadas:
@@ -1008,15 +943,25 @@ class FaseBase:
             desenhar_mira(self.tela, pos_mouse, (self.mira_surface, self.mira_rect))
 
     def renderizar_menu_pausa(self):
-        """Renderiza o menu de pausa."""
-        self.tela.fill((0, 0, 0))
-        overlay = pygame.Surface((LARGURA, ALTURA))
-        overlay.fill((0, 0, 20))
-        overlay.set_alpha(180)
-        self.tela.blit(overlay, (0, 0))
+        """
+        Renderiza o menu de pausa.
+
+        Returns:
+            Regiões que mudaram, para present_frame (a tela é retida: parada,
+            só o hover do botão a redesenha)
+        """
+        if self._tela_pausa is None:
+            self._tela_pausa = self._criar_tela_pausa()
+        return self._tela_pausa.desenhar(self.tela)
+
+    def _criar_tela_pausa(self):
+        """Monta a tela retida do menu de pausa (fundo fixo e o botão de menu)."""
+        fundo = pygame.Surface((LARGURA, ALTURA))
+        fundo.fill((0, 0, 0))
+        desenhar_overlay_cor(fundo, (0, 0, 20), 180, (LARGURA, ALTURA))
 
-        desenhar_texto(self.tela, "PAUSADO", 60, BRANCO, LARGURA // 2, ALTURA_JOGO // 2 - 50)
-        desenhar_texto(self.tela, "Pressione ESC para continuar", 30, BRANCO, LARGURA // 2, ALTURA_JOGO // 2 + 20)
+        desenhar_texto(fundo, "PAUSADO", 60, BRANCO, LARGURA // 2, ALTURA_JOGO // 2 - 50)
+        desenhar_texto(fundo, "Pressione ESC para continuar", 30, BRANCO, LARGURA // 2, ALTURA_JOGO // 2 + 20)
 
         # Botão de menu
         largura_menu = 250
@@ -1032,9 +977,14 @@ class FaseBase:
                                               largura_ajustada_menu,
                                               altura_ajustada_menu)
 
-        criar_botao(self.tela, "VOLTAR AO MENU", x_menu, y_menu,
-                   largura_menu, altura_menu,
-                   (120, 60, 60), (180, 80, 80), BRANCO)
+        tela_pausa = TelaRetida(fundo)
+        tela_pausa.adicionar(self.rect_menu_pausado,
+                             lambda tela: criar_botao(tela, "VOLTAR AO MENU", x_menu, y_menu,
+                                                      largura_menu, altura_menu,
+                                                      (120, 60, 60), (180, 80, 80), BRANCO),
+                             lambda: self.rect_menu_pausado.collidepoint(
+                                 convert_mouse_position(pygame.mouse.get_pos())))
+        return tela_pausa
 
     # ==================== UTILITÁRIOS ====================
 
@@ -14,8 +14,9 @@ import math
 from src.config import *
 from src.game.fase_base import FaseBase
 from src.entities.particula import criar_explosao
-from src.utils.visual import desenhar_texto
+from src.utils.visual import desenhar_texto, desenhar_overlay_cor
 from src.utils.display_manager import present_frame
+from src.utils.profiler import escopo
 from src.entities.tiro import Tiro
 from src.entities.inimigo_ia import atualizar_IA_inimigo
 from src.items.chucky_invocation import atualizar_invocacoes_com_inimigos
@@ -26,6 +27,7 @@ from src.entities.fusion_cutscene import FusionCutscene
 from src.entities.misterioso_cutscene import executar_cutscene_misterioso
 from src.entities.boss_velocitycyan import BossVelocityCyan
 from src.entities.velocitycyan_cutscene import VelocityCyanCutscene
+from src.utils.rng import rng_jogo
 
 
 class BossDifficultyManager:
@@ -109,7 +111,8 @@ class FaseBoss(FaseBase):
                 frames_contador += 1
 
                 # Processar eventos
-                resultado = self._processar_eventos_boss(tempo_atual, pos_mouse)
+                with escopo('eventos'):
+                    resultado = self._processar_eventos_boss(tempo_atual, pos_mouse)
                 if resultado == "sair":
                     self._parar_musica_boss()
                     self.limpar()
@@ -129,8 +132,7 @@ class FaseBoss(FaseBase):
 
                 # Lógica principal do jogo quando não pausado
                 if self.pausado:
-                    self.renderizar_menu_pausa()
-                    present_frame()
+                    present_frame(self.renderizar_menu_pausa())
                     self.relogio.tick(FPS)
                     continue
 
@@ -316,35 +318,39 @@ class FaseBoss(FaseBase):
         # Obter fator de tempo da ampulheta
         fator_tempo = self.jogador.obter_fator_tempo()
 
-        # Atualizar jogador
-        self.atualizar_jogador(pos_mouse, tempo_atual)
+        with escopo('jogador'):
+            # Atualizar jogador
+            self.atualizar_jogador(pos_mouse, tempo_atual)
 
-        # Atualizar invocações com todos os alvos (boss + inimigos)
-        alvos_totais = self.inimigos + ([self.boss] if self.boss and not self.boss_derrotado else [])
-        atualizar_invocacoes_com_inimigos(alvos_totais, self.particulas, self.flashes)
+            # Atualizar invocações com todos os alvos (boss + inimigos)
+            alvos_totais = self.inimigos + ([self.boss] if self.boss and not self.boss_derrotado else [])
+            atualizar_invocacoes_com_inimigos(alvos_totais, self.particulas, self.flashes)
 
-        # Atualizar boss
-        if self.boss and not self.boss_derrotado:
-            self._atualizar_boss(tempo_atual, fator_tempo)
+        with escopo('ia'):
+            # Atualizar boss
+            if self.boss and not self.boss_derrotado:
+                self._atualizar_boss(tempo_atual, fator_tempo)
 
-        # Atualizar inimigos invocados
-        self._atualizar_inimigos_invocados(tempo_atual, fator_tempo)
+            # Atualizar inimigos invocados
+            self._atualizar_inimigos_invocados(tempo_atual, fator_tempo)
 
         # Atualizar moedas
-        self.atualizar_moedas()
+        with escopo('moedas'):
+            self.atualizar_moedas()
 
         # Atualizar tiros
-        self.atualizar_tiros_jogador(alvos_totais)
-        self.atualizar_tiros_inimigo()
-
-        # Processar sabre de luz
-        self.processar_sabre_luz(alvos_totais)
+        with escopo('tiros'):
+            self.atualizar_tiros_jogador(alvos_totais)
+            self.atualizar_tiros_inimigo()
 
-        # Processar granadas
-        self.processar_granadas(alvos_totais)
+        # Processar sabre de luz e granadas
+        with escopo('armas'):
+            self.processar_sabre_luz(alvos_totais)
+            self.processar_granadas(alvos_totais)
 
         # Atualizar efeitos visuais
-        self.atualizar_efeitos_visuais()
+        with escopo('efeitos'):
+            self.atualizar_efeitos_visuais()
 
         # Verificar condições de fim
         return self._verificar_condicoes_fim_boss()
@@ -361,7 +367,7 @@ class FaseBoss(FaseBase):
         self.boss.velocidade = velocidade_original
 
         # Sistema de ataques especiais
-        if self.boss_modo_desespero and random.random() < 0.001:
+        if self.boss_modo_desespero and rng_jogo.random() < 0.001:
             self._boss_ataque_desespero()
 
         # Ataque final quando quase morto
@@ -484,29 +490,29 @@ class FaseBoss(FaseBase):
         # Efeito de modo desespero
         if self.boss_modo_desespero:
             alpha = int(50 + 30 * math.sin(frames_contador * 0.2))
-            overlay = pygame.Surface((LARGURA, ALTURA_JOGO))
-            overlay.fill((100, 0, 0))
-            overlay.set_alpha(alpha)
-            self.tela.blit(overlay, (0, 0))
+            desenhar_overlay_cor(self.tela, (100, 0, 0), alpha, (LARGURA, ALTURA_JOGO))
 
-        self.renderizar_fundo()
+        with escopo('render_fundo'):
+            self.renderizar_fundo()
 
         # Alvos para desenhar
         alvos = self.inimigos + ([self.boss] if self.boss and self.boss.vidas > 0 else [])
 
-        # Flashes melhorados
-        self._desenhar_flashes_melhorados()
+        with escopo('render_objetos'):
+            # Flashes melhorados
+            self._desenhar_flashes_melhorados()
 
-        # Objetos do jogo
-        self.renderizar_objetos_jogo(tempo_atual, alvos)
+            # Objetos do jogo
+            self.renderizar_objetos_jogo(tempo_atual, alvos)
 
-        # Boss com carregamento de ataque
-        if self.boss and self.boss.vidas > 0:
-            if hasattr(self.boss, 'carregando_ataque') and self.boss.carregando_ataque:
-                self.boss.desenhar_carregamento_ataque(self.tela, tempo_atual)
+            # Boss com carregamento de ataque
+            if self.boss and self.boss.vidas > 0:
+                if hasattr(self.boss, 'carregando_ataque') and self.boss.carregando_ataque:
+                    self.boss.desenhar_carregamento_ataque(self.tela, tempo_atual)
 
         # HUD
-        self.renderizar_hud(tempo_atual, alvos)
+        with escopo('hud'):
+            self.renderizar_hud(tempo_atual, alvos)
 
         # Indicadores especiais
 
@@ -514,7 +520,8 @@ class FaseBoss(FaseBase):
         self._desenhar_mensagens_transicao_boss()
 
         # Mira
-        self.renderizar_mira(pos_mouse)
+        with escopo('render_mira'):
+            self.renderizar_mira(pos_mouse)
 
     def _desenhar_flashes_melhorados(self):
         """Desenha flashes com efeito de brilho adicional."""
@@ -589,13 +596,10 @@ class FaseBoss(FaseBase):
             desenhar_texto(self.tela, mensagem2, 36, (200, 0, 0), LARGURA // 2, ALTURA_JOGO // 2 + 60)
 
             # Efeito de tela escura
-            overlay = pygame.Surface((LARGURA, ALTURA_JOGO))
-            overlay.fill((20, 0, 0))
             duracao = self.duracao_transicao_derrota
             tempo_restante = self.tempo_transicao_derrota
             alpha = int(100 * (duracao - tempo_restante) / duracao)
-            overlay.set_alpha(alpha)
-            self.tela.blit(overlay, (0, 0))
+            desenhar_overlay_cor(self.tela, (20, 0, 0), alpha, (LARGURA, ALTURA_JOGO))
 
     def _parar_musica_boss(self):
         """Para a música do boss."""
@@ -12,6 +12,7 @@ from src.config import *
 from src.entities.quadrado import Quadrado
 from src.network import GameClient
 from src.utils.display_manager import present_frame, convert_mouse_position
+from src.utils.fonts import obter_fonte, renderizar_texto
 
 def jogar_fase_multiplayer_simples(tela, relogio, cliente, nome_jogador):
     """
@@ -34,8 +35,8 @@ def jogar_fase_multiplayer_simples(tela, relogio, cliente, nome_jogador):
     jogador_cor = VERDE
 
     # Fonte para texto
-    fonte = pygame.font.SysFont("Arial", 20)
-    fonte_grande = pygame.font.SysFont("Arial", 36, True)
+    fonte = obter_fonte("Arial", 20)
+    fonte_grande = obter_fonte("Arial", 36, True)
 
     # Estado do jogo
     rodando = True
@@ -63,7 +64,7 @@ def jogar_fase_multiplayer_simples(tela, relogio, cliente, nome_jogador):
         if paused:
             # Mostrar tela de pausa
             tela.fill(PRETO)
-            texto = fonte_grande.render("PAUSADO - P para continuar", True, BRANCO)
+            texto = renderizar_texto("PAUSADO - P para continuar", fonte_grande, BRANCO)
             rect = texto.get_rect(center=(LARGURA // 2, ALTURA // 2))
             tela.blit(texto, rect)
             present_frame()
@@ -130,7 +131,7 @@ def jogar_fase_multiplayer_simples(tela, relogio, cliente, nome_jogador):
                          TAMANHO_QUADRADO))
 
         # Nome acima do jogador local
-        nome_surface = fonte.render(f"{nome_jogador} (Você)", True, AMARELO)
+        nome_surface = renderizar_texto(f"{nome_jogador} (Você)", fonte, AMARELO)
         nome_rect = nome_surface.get_rect(center=(jogador_x, jogador_y - 30))
         tela.blit(nome_surface, nome_rect)
 
@@ -139,6 +140,8 @@ def jogar_fase_multiplayer_simples(tela, relogio, cliente, nome_jogador):
         for player_id, player in jogadores_remotos.items():
             cor_remoto = cores_remotos[cor_index % len(cores_remotos)]
             cor_index += 1
+            if not player.visible:
+                continue
 
             # Quadrado do jogador remoto
             pygame.draw.rect(tela, cor_remoto,
@@ -155,7 +158,7 @@ def jogar_fase_multiplayer_simples(tela, relogio, cliente, nome_jogador):
                             TAMANHO_QUADRADO), 2)
 
             # Nome acima
-            nome_surface = fonte.render(player.name, True, cor_remoto)
+            nome_surface = renderizar_texto(player.name, fonte, cor_remoto)
             nome_rect = nome_surface.get_rect(center=(player.x, player.y - 30))
             tela.blit(nome_surface, nome_rect)
 
@@ -170,21 +173,21 @@ def jogar_fase_multiplayer_simples(tela, relogio, cliente, nome_jogador):
         # Latência
         latencia = cliente.get_latency()
         cor_latencia = VERDE if latencia < 50 else (AMARELO if latencia < 100 else VERMELHO)
-        texto_latencia = fonte.render(f"Latência: {latencia:.0f}ms", True, cor_latencia)
+        texto_latencia = renderizar_texto(f"Latência: {latencia:.0f}ms", fonte, cor_latencia)
         tela.blit(texto_latencia, (info_x, info_y))
 
         # Jogadores conectados
         num_jogadores = len(jogadores_remotos) + 1  # +1 para o jogador local
-        texto_jogadores = fonte.render(f"Jogadores: {num_jogadores}", True, BRANCO)
+        texto_jogadores = renderizar_texto(f"Jogadores: {num_jogadores}", fonte, BRANCO)
         tela.blit(texto_jogadores, (info_x + 200, info_y))
 
         # ID do jogador
-        texto_id = fonte.render(f"Sua ID: {cliente.local_player_id}", True, CIANO)
+        texto_id = renderizar_texto(f"Sua ID: {cliente.local_player_id}", fonte, CIANO)
         tela.blit(texto_id, (info_x + 400, info_y))
 
         # Instruções
         instrucoes_y = info_y + 30
-        texto_instrucoes = fonte.render("ESC: Menu | P: Pausar | WASD: Mover", True, (150, 150, 150))
+        texto_instrucoes = renderizar_texto("ESC: Menu | P: Pausar | WASD: Mover", fonte, (150, 150, 150))
         tela.blit(texto_instrucoes, (info_x, instrucoes_y))
 
         # 7. ATUALIZAR DISPLAY
@@ -11,11 +11,24 @@ import random
 import os
 from src.config import *
 from src.game.fase_base import FaseBase
-from src.utils.display_manager import present_frame
+from src.utils.display_manager import present_frame, escalar_em
+from src.utils.profiler import escopo
+from src.utils.rng import rng_jogo
 from src.game.selecao_times import SelecaoTimes, TelaAguardandoJogadores
 from src.entities.quadrado import Quadrado
 from src.entities.particula import criar_explosao
 from src.utils.tilemap import TileMap
+from src.utils.fonts import obter_fonte, renderizar_texto
+from src.utils.sprites import sprite_quadrado, disco
+from src.utils.visual import desenhar_overlay_cor
+from src.network.interest import view_radius_for
+from src.game.simulacao_bomba import (
+    SimulacaoBomba, mover_com_classe, novo_movimento, movimento_invulneravel, checksum_bomba,
+    CLASSES_MOVIMENTO, FRAME_MS, TEMPO_COMPRA, TEMPO_PLANTAR, TEMPO_DEFUSAR, TEMPO_EXPLOSAO,
+    TEMPO_ENTRE_ROUNDS
+)
+from src.network.checksum import ConferenciaServidor
+from src.ui.network_overlay import desenhar_overlay_rede
 
 # Importar funções de desenho das armas
 from src.weapons.desert_eagle import desenhar_desert_eagle
@@ -30,11 +43,16 @@ class FaseMultiplayer(FaseBase):
     Herda toda a lógica de jogo de FaseBase e adiciona sincronização de rede.
     """
 
+    # Superfícies do mundo guardadas (uma por tamanho visível, ou seja, por zoom)
+    MAX_ALVOS_MUNDO = 3
+    COR_FUNDO_MUNDO = (20, 20, 30)
+
     # Cores dos times
     COR_TIME_T = (255, 100, 100)  # Vermelho claro
     COR_TIME_Q = (100, 150, 255)  # Azul claro
 
-    def __init__(self, tela, relogio, gradiente_jogo, fonte_titulo, fonte_normal, cliente, nome_jogador, bots=None):
+    def __init__(self, tela, relogio, gradiente_jogo, fonte_titulo, fonte_normal, cliente, nome_jogador, bots=None,
+                 simulacao_servidor=False):
         """
         Inicializa a fase multiplayer.
 
@@ -42,6 +60,9 @@ class FaseMultiplayer(FaseBase):
             cliente: Instância do GameClient para comunicação de rede
             nome_jogador: Nome do jogador local
             bots: Lista de dicionários com informações dos bots
+            simulacao_servidor: True se bots, bomba e rounds são simulados no
+                                servidor (o cliente só desenha o GAME_STATE);
+                                senão rodam numa SimulacaoBomba local
         """
         # Guardar referências antes de chamar super().__init__
         self.tela = tela
@@ -52,6 +73,7 @@ class FaseMultiplayer(FaseBase):
         self.cliente = cliente
         self.nome_jogador = nome_jogador
         self.bots_info = bots or []
+        self.simulacao_servidor = simulacao_servidor
 
         # Sistema de times - seleção acontece ANTES de carregar o resto
         self.time_jogador = None  # 'T' ou 'Q'
@@ -68,7 +90,9 @@ class FaseMultiplayer(FaseBase):
         self.habilidade_cooldown = 0  # Tempo do último uso da habilidade
         self.habilidade_ativa = False  # Se a habilidade está ativa
         self.habilidade_tempo_inicio = 0  # Quando a habilidade foi ativada
-        self.velocidade_original = 0  # Velocidade original (para restaurar após turbo)
+        # Turbo, dash, escudo e invisibilidade rodam em mover_com_classe (o
+        # passo da simulação); ESPAÇO só pede a habilidade no próximo input
+        self.pedir_habilidade = False
 
         # === DEV MODE - Sistema de desenho de rotas ===
         self.dev_mode = False  # Ativado quando entra no modo desenvolvedor
@@ -82,6 +106,9 @@ class FaseMultiplayer(FaseBase):
         # Status de times de outros jogadores
         self.status_times = {}  # {player_id: {'team': 'T'/'Q', 'name': 'nome'}}
 
+        # Overlay de telemetria de rede (F4)
+        self.mostrar_overlay_rede = False
+
         # Cores para jogadores remotos
         self.cores_remotos = [CIANO, ROXO, LARANJA, AMARELO]
         self.proximo_cor_index = 0
@@ -93,6 +120,16 @@ class FaseMultiplayer(FaseBase):
         # Bots serão criados após seleção de time
         self.bots_locais = []
 
+        # Bots, bomba e rounds vêm de uma SimulacaoBomba: a do servidor (pelo
+        # GAME_STATE) ou, sem simulação no servidor, uma local criada em
+        # _carregar_jogo. Bots por id da simulação e tiros já recebidos
+        self.simulacao_local = None
+        self.bots_simulacao = {}
+        self.tiros_simulacao_vistos = set()
+        # Conferência do espelho local (vidas, bomba, rounds) com o hash do servidor
+        self.conferencia_servidor = ConferenciaServidor('bomb')
+        self.tick_conferido = None
+
         # Jogadores remotos
         self.jogadores_remotos = {}
 
@@ -148,6 +185,9 @@ class FaseMultiplayer(FaseBase):
                             print(f"[GRANADA] Granada selecionada! ({self.jogador.granadas} disponíveis)")
                         else:
                             print("[GRANADA] Sem granadas!")
+                    # Tecla F4 para mostrar/ocultar a telemetria de rede
+                    elif evento.key == pygame.K_F4:
+                        self.mostrar_overlay_rede = not self.mostrar_overlay_rede
                     # Tecla E para voltar à arma (desselecionar granada)
                     elif evento.key == pygame.K_e:
                         if hasattr(self.jogador, 'granada_selecionada') and self.jogador.granada_selecionada:
@@ -312,7 +352,8 @@ class FaseMultiplayer(FaseBase):
                 pygame.mouse.set_visible(True)
 
             # Processar eventos (herda de FaseBase)
-            resultado = self.processar_eventos()
+            with escopo('eventos'):
+                resultado = self.processar_eventos()
             if resultado == "sair":
                 self.limpar()
                 return "menu"
@@ -320,8 +361,10 @@ class FaseMultiplayer(FaseBase):
                 self.limpar()
                 return "menu"
 
-            # Atualizar contador de introdução
+            # Atualizar contador de introdução (a simulação local já conta o
+            # ATRASO_INICIO dela, como a do servidor)
             if self.mostrando_inicio:
+                self._avancar_simulacao_local()
                 self._mostrar_introducao_multiplayer(tempo_atual)
                 continue
 
@@ -330,6 +373,11 @@ class FaseMultiplayer(FaseBase):
                 self._mostrar_pausa_multiplayer()
                 continue
 
+            # Sem simulação no servidor, rounds, bomba e bots rodam aqui
+            # (também com o menu de compra aberto)
+            with escopo('regras'):
+                self._avancar_simulacao_local()
+
             # Atualizar tempo de compra
             self._atualizar_tempo_compra()
 
@@ -346,74 +394,65 @@ class FaseMultiplayer(FaseBase):
                 self.relogio.tick(60)
                 continue
 
-            # Verificar se deve iniciar próximo round (antes de tudo)
-            self._verificar_proximo_round()
+            # Bots, tiros dos bots, bomba e placar da simulação (antes de tudo)
+            with escopo('rede'):
+                self._aplicar_estado_simulacao(self._obter_estado_simulacao())
 
             # Se round terminou, só atualizar câmera e efeitos visuais
             if self.round_terminado and not self.partida_terminada:
                 self._atualizar_camera()
-                self.atualizar_efeitos_visuais()
+                with escopo('efeitos'):
+                    self.atualizar_efeitos_visuais()
             else:
-                # Atualizar jogador localmente (predição) com colisões do mapa
-                self._atualizar_jogador_com_colisao(pos_mouse, tempo_atual)
-
-                # === METRALHADORA AUTOMÁTICA - Segurar mouse para atirar ===
-                if self.arma_equipada == 'metralhadora' and not self.menu_compra_aberto:
-                    mouse_buttons = pygame.mouse.get_pressed()
-                    if mouse_buttons[0]:  # Botão esquerdo pressionado
-                        # Converter pos_mouse para coordenadas do mundo
-                        pos_mouse_mundo = (
-                            pos_mouse[0] / self.camera_zoom + self.camera_x,
-                            pos_mouse[1] / self.camera_zoom + self.camera_y
-                        )
-                        self._atirar_multiplayer(pos_mouse_mundo)
-
-                # Atualizar habilidade de classe (ambos os times)
-                if self.classe_jogador:
-                    self._atualizar_habilidade_classe(tempo_atual)
+                with escopo('jogador'):
+                    # Atualizar jogador localmente (predição) com colisões do mapa
+                    self._atualizar_jogador_com_colisao(pos_mouse, tempo_atual)
+
+                    # === METRALHADORA AUTOMÁTICA - Segurar mouse para atirar ===
+                    if self.arma_equipada == 'metralhadora' and not self.menu_compra_aberto:
+                        mouse_buttons = pygame.mouse.get_pressed()
+                        if mouse_buttons[0]:  # Botão esquerdo pressionado
+                            # Converter pos_mouse para coordenadas do mundo
+                            pos_mouse_mundo = (
+                                pos_mouse[0] / self.camera_zoom + self.camera_x,
+                                pos_mouse[1] / self.camera_zoom + self.camera_y
+                            )
+                            self._atirar_multiplayer(pos_mouse_mundo)
 
-                # Atualizar câmera para seguir o jogador
-                self._atualizar_camera()
+                    # Atualizar câmera para seguir o jogador
+                    self._atualizar_camera()
 
-                # Enviar estado do jogador para o servidor
-                self._enviar_estado_jogador(pos_mouse)
+                with escopo('rede'):
+                    # Enviar estado do jogador para o servidor (com simulação
+                    # no servidor já foi enviado junto com a predição)
+                    if not self.simulacao_servidor:
+                        self._enviar_estado_jogador(pos_mouse)
 
-                # Receber estados de outros jogadores
-                self._receber_estados_remotos()
+                    # Receber estados de outros jogadores
+                    self._receber_estados_remotos()
 
                 # Atualizar moedas (usa sistema existente)
-                self.atualizar_moedas()
+                with escopo('moedas'):
+                    self.atualizar_moedas()
 
                 # Atualizar tiros (sistema próprio para o mapa grande)
-                self._atualizar_tiros_multiplayer()
+                with escopo('tiros'):
+                    self._atualizar_tiros_multiplayer()
 
-                # Processar sabre de luz (usa sistema existente)
-                self.processar_sabre_luz([])
+                with escopo('armas'):
+                    # Processar sabre de luz (usa sistema existente)
+                    self.processar_sabre_luz([])
 
-                # Processar granadas ativas (com colisão de paredes)
-                self._atualizar_granadas_ativas()
+                    # Processar granadas ativas (com colisão de paredes)
+                    self._atualizar_granadas_ativas()
 
                 # Atualizar efeitos visuais (usa sistema existente)
-                self.atualizar_efeitos_visuais()
-
-                # Atualizar bots com colisões
-                self._atualizar_bots()
-
-                # Atualizar habilidades de classe dos bots
-                tempo_atual = pygame.time.get_ticks()
-                self._atualizar_habilidades_bots(tempo_atual)
+                with escopo('efeitos'):
+                    self.atualizar_efeitos_visuais()
 
                 # Processar colisões de tiros com jogadores (PvP)
-                self._processar_pvp()
-
-                # Processar sistema de bomba
-                self._processar_bomba(tempo_atual)
-
-                # Verificar se alguém pegou a bomba dropada
-                self._verificar_pickup_bomba()
-
-                # Verificar condições de vitória
-                self._verificar_vitoria()
+                with escopo('tiros'):
+                    self._processar_pvp()
 
             # Desenhar tudo
             self._desenhar_tudo(tempo_atual, pos_mouse)
@@ -424,17 +463,32 @@ class FaseMultiplayer(FaseBase):
 
         return "menu"
 
+    def _ler_teclas(self):
+        """
+        Teclas do input deste frame: WASD, F (plantar/defusar) e 'hab' no
+        frame seguinte ao ESPAÇO de uma habilidade de movimento.
+        """
+        teclas_pygame = pygame.key.get_pressed()
+        keys = {
+            'w': teclas_pygame[pygame.K_w],
+            'a': teclas_pygame[pygame.K_a],
+            's': teclas_pygame[pygame.K_s],
+            'd': teclas_pygame[pygame.K_d],
+            'f': teclas_pygame[pygame.K_f]  # Plantar/defusar (simulação no servidor)
+        }
+        if self.pedir_habilidade:
+            keys['hab'] = True
+            self.pedir_habilidade = False
+        return keys
+
     def _enviar_estado_jogador(self, pos_mouse):
         """Envia estado do jogador local para o servidor."""
         try:
             # Preparar estado das teclas
-            teclas_pygame = pygame.key.get_pressed()
-            keys = {
-                'w': teclas_pygame[pygame.K_w],
-                'a': teclas_pygame[pygame.K_a],
-                's': teclas_pygame[pygame.K_s],
-                'd': teclas_pygame[pygame.K_d]
-            }
+            keys = self._ler_teclas()
+
+            # Informar o raio de visão da câmera (o servidor filtra o estado por AOI)
+            self.cliente.send_view_area(view_radius_for(LARGURA, ALTURA, self.camera_zoom))
 
             # Enviar input para o servidor
             self.cliente.send_player_input(
@@ -473,6 +527,7 @@ class FaseMultiplayer(FaseBase):
                     jogador_remoto.y = remote_player.y
                     jogador_remoto.vida = remote_player.health
                     jogador_remoto.vivo = remote_player.alive
+                    jogador_remoto.visivel = remote_player.visible
 
                     print(f"[MULTIPLAYER] Novo jogador conectado: {jogador_remoto.nome}")
                 else:
@@ -482,6 +537,7 @@ class FaseMultiplayer(FaseBase):
                     jogador_remoto.y = remote_player.y
                     jogador_remoto.vida = remote_player.health
                     jogador_remoto.vivo = remote_player.alive
+                    jogador_remoto.visivel = remote_player.visible
 
                 novos_jogadores[player_id] = jogador_remoto
 
@@ -493,9 +549,302 @@ class FaseMultiplayer(FaseBase):
 
             self.jogadores_remotos = novos_jogadores
 
+            # Aplicar acertos em mim validados pelo servidor (compensação de lag)
+            self._aplicar_acertos_remotos()
+
         except Exception as e:
             print(f"[ERRO] Falha ao receber estados: {e}")
 
+    def _aplicar_acertos_remotos(self):
+        """Aplica no jogador local o dano de tiros de jogadores remotos confirmados pelo servidor."""
+        for acerto in self.cliente.get_bullet_hits():
+            if not acerto.get('confirmed'):
+                continue
+            if acerto.get('target_type', 'player') == 'bot':
+                self._aplicar_acerto_bot(acerto)
+                continue
+            if acerto.get('target_id') != self.cliente.local_player_id:
+                continue
+            # Com simulação no servidor, dash e escudo já foram conferidos lá
+            if not self.simulacao_servidor and getattr(self.jogador, 'invulneravel', False):
+                continue
+            self._aplicar_acerto_jogador(acerto)
+
+    def _aplicar_acerto_jogador(self, acerto):
+        """
+        Desconta do jogador local o dano de um acerto confirmado. Se ele era
+        o bomber, a simulação derruba a bomba quando recebe a vida zerada.
+        """
+        if self.jogador.vidas <= 0:
+            return
+
+        dano = acerto.get('damage', 1)
+        self.jogador.vidas = max(0, self.jogador.vidas - dano)
+        criar_explosao(self.jogador.x + TAMANHO_MULTIPLAYER // 2,
+                       self.jogador.y + TAMANHO_MULTIPLAYER // 2,
+                       self.jogador.cor, self.particulas)
+        print(f"[PVP] Jogador {acerto.get('shooter_id')} acertou você! Vida restante: {self.jogador.vidas}")
+
+    def _aplicar_acerto_bot(self, acerto):
+        """Aplica a vida de um bot da simulação após um acerto confirmado (e a recompensa por kill)."""
+        bot = self.bots_simulacao.get(acerto.get('target_id'))
+        if bot is None or 'health' not in acerto:
+            return
+
+        vida_antes = bot.vidas
+        bot.vidas = acerto['health']
+        if acerto.get('shooter_id') == self.cliente.local_player_id and vida_antes > 0 and bot.vidas <= 0:
+            self.moedas += 300  # Recompensa por kill
+            print(f"[RECOMPENSA] +$300 por eliminar {bot.nome}! Saldo: ${self.moedas}")
+
+    def _acertar_bot(self, bot, dano, x, y, time_atirador):
+        """
+        Entrega um acerto do jogador local em um bot para a simulação: a do
+        servidor valida e devolve a vida no BULLET_HIT, a local aplica na hora.
+
+        Args:
+            bot: Bot atingido (de bots_simulacao)
+            dano: Dano do tiro ou da explosão
+            x, y: Ponto do acerto (conferido pela compensação de lag do servidor)
+            time_atirador: Time de quem atirou (a simulação ignora fogo amigo)
+        """
+        if self.simulacao_local is None:
+            self.cliente.send_bullet_hit(bot.id_simulacao, x, y, dano, target_type='bot')
+            return
+
+        vida = self.simulacao_local.dano_bot(bot.id_simulacao, dano, time_atirador)
+        if vida is not None:
+            self._aplicar_acerto_bot({'target_id': bot.id_simulacao, 'health': vida,
+                                      'shooter_id': self.cliente.local_player_id})
+
+    def _avancar_simulacao_local(self):
+        """
+        Sem simulação no servidor, avança um frame da SimulacaoBomba local
+        como o servidor faz a cada tick: posição, vida e tecla F do jogador
+        antes do passo, acertos de bots e respawn aplicados depois.
+        """
+        if self.simulacao_local is None:
+            return
+
+        local_id = self.cliente.local_player_id
+        self.simulacao_local.sincronizar_jogador(local_id, self.jogador.x, self.jogador.y,
+                                                 self.jogador.vidas,
+                                                 bool(pygame.key.get_pressed()[pygame.K_f]))
+
+        for evento in self.simulacao_local.passo(FRAME_MS / 1000.0):
+            if evento['alvo'] != local_id:
+                continue
+            if evento['tipo'] == 'respawn':
+                self.jogador.x, self.jogador.y = evento['x'], evento['y']
+                self.jogador.rect.x = int(evento['x'])
+                self.jogador.rect.y = int(evento['y'])
+                self.jogador.vidas = evento['vidas']
+                continue
+            # Mesmo formato do BULLET_HIT que o servidor manda para acertos de bots
+            # (dash e escudo já foram conferidos na simulação)
+            self._aplicar_acerto_jogador({'damage': evento['dano'],
+                                          'shooter_id': ['bot', evento['atirador']]})
+
+    def _obter_estado_simulacao(self):
+        """
+        Estado da simulação no formato do GAME_STATE ('bomb', 'enemies' e
+        'bullets'): o último do servidor ou o da simulação local.
+        """
+        if self.simulacao_local is None:
+            return self.cliente.get_game_state()
+        return {
+            'bomb': self.simulacao_local.estado(),
+            'enemies': self.simulacao_local.bots(),
+            'bullets': self.simulacao_local.tiros(),
+        }
+
+    def _aplicar_estado_simulacao(self, estado):
+        """
+        Copia do estado da simulação (do servidor ou local) os bots, os tiros
+        dos bots, a bomba e o placar. Nada disso é decidido fora dela.
+
+        Args:
+            estado: Dicionário de _obter_estado_simulacao
+        """
+        bomba = estado.get('bomb')
+        if not bomba:
+            return
+
+        tempo_atual = pygame.time.get_ticks()
+
+        # Novo round no servidor: resetar jogador, compra e efeitos locais
+        if bomba['round'] > self.round_atual:
+            self._iniciar_novo_round()
+            self.round_atual = bomba['round']
+            self.tempo_inicio_round = tempo_atual - bomba['tempo_round']
+
+        if not bomba['tempo_compra']:
+            self._encerrar_tempo_compra()
+
+        self._aplicar_bots_simulacao(estado.get('enemies', []), tempo_atual)
+        self._aplicar_tiros_simulacao(estado.get('bullets', []))
+
+        # Bomba
+        bomber = bomba.get('bomber')
+        local = ['player', self.cliente.local_player_id]
+        self.bomber_é_jogador = bomber == local
+        self.bomba_plantada = bomba['plantada']
+        self.bomba_posicao = tuple(bomba['posicao']) if bomba['posicao'] else None
+        if self.bomba_plantada:
+            self.bomba_tempo_plantio = tempo_atual - (self.bomba_tempo_explosao - bomba['tempo_restante'])
+        self.bomba_dropada = bomba['dropada']
+        self.bomba_drop_posicao = tuple(bomba['drop_posicao']) if bomba['drop_posicao'] else None
+
+        plantando = bomba.get('plantando')
+        self.plantando_bomba = plantando is not None and self.bomber_é_jogador
+        if self.plantando_bomba:
+            self.tempo_inicio_plantar = tempo_atual - plantando
+        for bot in self.bots_locais:
+            bot.bot_plantando = plantando is not None and bot.é_bomber
+            if bot.bot_plantando:
+                bot.bot_tempo_inicio_plantar = tempo_atual - plantando
+
+        defusando = bomba.get('defusando')
+        self.defusando_bomba = defusando is not None and bomba.get('defusador') == local
+        if self.defusando_bomba:
+            self.tempo_inicio_defusar = tempo_atual - defusando
+
+        # Placar e fim de round
+        self.rounds_time_t, self.rounds_time_q = bomba['placar']
+        if bomba['round_terminado'] and not self.round_terminado:
+            self.round_terminado = True
+            self.time_vencedor = bomba['vencedor']
+            self.tempo_proximo_round = tempo_atual + TEMPO_ENTRE_ROUNDS
+            if self.bomba_plantada:
+                if self.time_vencedor == 'T':
+                    self.bomba_explodiu = True
+                    for _ in range(50):
+                        criar_explosao(self.bomba_posicao[0], self.bomba_posicao[1],
+                                       (255, 100, 0), self.particulas)
+                else:
+                    self.bomba_defusada = True
+
+            # Recompensa por vitória/derrota do round
+            if self.time_jogador == self.time_vencedor:
+                self.moedas += 3000
+                print(f"[RECOMPENSA] +$3000 por vencer o round! Saldo: ${self.moedas}")
+            else:
+                self.moedas += 1000
+                print(f"[RECOMPENSA] +$1000 (derrota). Saldo: ${self.moedas}")
+            print(f"[ROUND] Time {self.time_vencedor} venceu o round {self.round_atual}! "
+                  f"Placar: T {self.rounds_time_t} x {self.rounds_time_q} Q")
+
+        if bomba['partida_terminada'] and not self.partida_terminada:
+            self.partida_terminada = True
+            self.jogo_terminado = True
+            self.vencedor = f"Time {bomba['vencedor']}"
+            print(f"[PARTIDA] {self.vencedor} VENCEU A PARTIDA! {self.rounds_time_t} x {self.rounds_time_q}")
+
+        # A simulação local é a própria fonte do estado: só confere a do servidor
+        if self.simulacao_servidor and bomba.get('checksum') is not None and bomba['tick'] != self.tick_conferido:
+            self.tick_conferido = bomba['tick']
+            self._conferir_estado_servidor(bomba)
+
+    def _conferir_estado_servidor(self, bomba):
+        """
+        Monta o checksum_bomba do espelho local e confere com o hash do servidor.
+
+        A vida do jogador local é a que ele desconta dos acertos recebidos;
+        jogadores remotos e bots entram com a vida que o cliente tem deles
+        (os fora da AOI, que o cliente não acompanha, com a do pacote).
+        """
+        local_id = self.cliente.local_player_id
+        vidas = []
+        for tipo, cid, vida in bomba['vidas']:
+            if tipo == 'player' and cid == local_id:
+                vida = self.jogador.vidas
+            elif tipo == 'player':
+                remoto = self.jogadores_remotos.get(cid)
+                if remoto is not None and remoto.visivel:
+                    vida = remoto.vida
+            else:
+                bot = self.bots_simulacao.get(cid)
+                if bot is not None and bot.visivel:
+                    vida = bot.vidas
+            vidas.append([tipo, cid, vida])
+
+        espelho = {
+            'round': self.round_atual,
+            'placar': [self.rounds_time_t, self.rounds_time_q],
+            'round_terminado': self.round_terminado,
+            'partida_terminada': self.partida_terminada,
+            'plantada': self.bomba_plantada,
+            'posicao': self.bomba_posicao,
+            'dropada': self.bomba_dropada,
+            'drop_posicao': self.bomba_drop_posicao,
+            'vidas': vidas,
+        }
+        self.conferencia_servidor.conferir(bomba['tick'], bomba['checksum'], checksum_bomba(espelho),
+                                           checksum_bomba(bomba), local_id)
+
+    def _aplicar_bots_simulacao(self, bots, tempo_atual):
+        """
+        Cria ou atualiza os bots locais a partir da lista 'enemies' da simulação.
+
+        Do servidor, a lista só traz os bots dentro da área de interesse (AOI): os que
+        ficaram de fora saem de bots_locais (não são desenhados nem
+        acertados) mas continuam em bots_simulacao, e voltam com o mesmo
+        estado quando reaparecem.
+        """
+        ids = set()
+        for dados in bots:
+            ids.add(dados['id'])
+            bot = self.bots_simulacao.get(dados['id'])
+            if bot is None:
+                bot = self._criar_bot_com_time({'nome': dados['nome'], 'classe': dados.get('classe')},
+                                               dados['time'])
+                bot.id_simulacao = dados['id']
+                bot.x, bot.y = dados['x'], dados['y']
+                bot.visivel = False
+                self.bots_simulacao[dados['id']] = bot
+            if not bot.visivel:
+                bot.visivel = True
+                self.bots_locais.append(bot)
+
+            # Posição interpolada entre os estados do servidor (como os jogadores remotos)
+            pos = self.cliente.get_enemy_position(dados['id']) if self.simulacao_servidor else None
+            bot.x, bot.y = pos if pos else (dados['x'], dados['y'])
+            bot.rect.x = int(bot.x)
+            bot.rect.y = int(bot.y)
+
+            bot.vidas = dados['vidas']
+            bot.vidas_max = dados['vidas_max']
+            bot.é_bomber = dados['bomber']
+            bot.arma = dados['arma']
+
+        # Bots fora da AOI: esconder até voltarem na lista
+        for bot_id, bot in self.bots_simulacao.items():
+            if bot_id not in ids and bot.visivel:
+                bot.visivel = False
+                self.bots_locais.remove(bot)
+
+    def _aplicar_tiros_simulacao(self, tiros):
+        """
+        Cria os tiros dos bots que ainda não foram vistos (só visuais: o dano
+        vem da simulação) e remove os que a simulação já descartou.
+        """
+        from src.entities.tiro import Tiro
+
+        ids = set()
+        for dados in tiros:
+            ids.add(dados['id'])
+            if dados['id'] in self.tiros_simulacao_vistos:
+                continue
+            tiro = Tiro(dados['x'], dados['y'], dados['dx'], dados['dy'], tuple(dados['cor']), 7)
+            tiro.dano = 0
+            tiro.time_origem = dados['time']
+            tiro.id_simulacao = dados['id']
+            self.tiros_inimigo.append(tiro)
+
+        self.tiros_simulacao_vistos = ids
+        self.tiros_inimigo[:] = [t for t in self.tiros_inimigo
+                                 if getattr(t, 'id_simulacao', None) in ids]
+
     def _mostrar_selecao_time(self):
         """Mostra a tela de seleção de time (T ou Q) - ANTES de carregar o jogo."""
         pygame.mouse.set_visible(True)
@@ -572,7 +921,7 @@ class FaseMultiplayer(FaseBase):
         self.aguardando_jogadores = True
 
         # Enviar seleção para o servidor
-        self.cliente.send_team_selection(self.time_jogador, self.nome_jogador)
+        self.cliente.send_team_selection(self.time_jogador, self.nome_jogador, classe_id)
 
         print(f"[MULTIPLAYER] Classe '{classe_id}' selecionada! Aguardando outros jogadores...")
 
@@ -609,29 +958,12 @@ class FaseMultiplayer(FaseBase):
             # Aplicar vidas
             self.jogador.vidas = dados["vidas"]
             self.jogador.vidas_max = dados["vidas"]
+            if self.cliente and not self.simulacao_servidor:
+                self.cliente.send_respawn(self.jogador.vidas_max, 1)  # Partida começa no round 1
 
-            # Salvar velocidade original
-            self.velocidade_original = self.jogador.velocidade
-
-            # Aplicar modificador de velocidade base
-            if "velocidade_base" in dados and dados["velocidade_base"] != 1.0:
-                self.jogador.velocidade *= dados["velocidade_base"]
-
-            # Resetar invulnerabilidade para garantir que o jogador não fique permanentemente invulnerável
-            self.jogador.invulneravel = False
-
-            # Inicializar atributos específicos de cada classe
-            if self.classe_jogador == "normal":
-                self.jogador.dash_ativo = False
-                self.jogador.dash_frames_restantes = 0
-                self.jogador.dash_direcao = (0, 0)
-                self.jogador.dash_velocidade = dados.get("dash_velocidade", 25)
-            elif self.classe_jogador == "mago":
-                self.jogador.escudo_ativo = False
-            elif self.classe_jogador == "ghost":
-                self.jogador.invisivel = False
-            elif self.classe_jogador == "cyan":
-                self.jogador.posicoes_turbo = []
+            # Velocidade, dash, turbo, escudo e invisibilidade vêm do estado
+            # de movimento da simulação (mover_com_classe), que começa zerado
+            self._aplicar_movimento_classe(novo_movimento())
 
             print(f"[CLASSE] Classe '{dados['nome']}' aplicada! Vidas: {dados['vidas']}")
         else:
@@ -655,6 +987,18 @@ class FaseMultiplayer(FaseBase):
         if not dados:
             return
 
+        # ====== CYAN, NORMAL, MAGO, GHOST - HABILIDADES DE MOVIMENTO ======
+        # Turbo, dash, escudo e invisibilidade vão no próximo input ('hab') e
+        # rodam em mover_com_classe, o mesmo passo do servidor
+        if self.classe_jogador in CLASSES_MOVIMENTO:
+            recarga = self._movimento_atual()['recarga']
+            if recarga > 0:
+                print(f"[CLASSE] Habilidade em cooldown! {recarga * FRAME_MS / 1000:.1f}s restantes")
+                return
+            self.pedir_habilidade = True
+            print(f"[CLASSE] {dados['nome']}: habilidade ativada!")
+            return
+
         cooldown = dados.get("habilidade_cooldown", 0)
 
         # Verificar cooldown
@@ -663,20 +1007,8 @@ class FaseMultiplayer(FaseBase):
             print(f"[CLASSE] Habilidade em cooldown! {tempo_restante:.1f}s restantes")
             return
 
-        # ====== CYAN - VELOCIDADE TURBO ======
-        if self.classe_jogador == "cyan":
-            self.habilidade_ativa = True
-            self.habilidade_tempo_inicio = tempo_atual
-            self.velocidade_original = self.jogador.velocidade
-            # Velocidade turbo: 4x a velocidade normal
-            self.jogador.velocidade = self.velocidade_original * 4.0
-            self.habilidade_cooldown = tempo_atual
-            # Inicializar rastro do turbo
-            self.jogador.posicoes_turbo = []
-            print(f"[CLASSE] TURBO ATIVADO! Velocidade: {self.jogador.velocidade:.1f} (era {self.velocidade_original:.1f})")
-
         # ====== EXPLOSIVE - EXPLOSÃO DE TIROS ======
-        elif self.classe_jogador == "explosive":
+        if self.classe_jogador == "explosive":
             from src.entities.tiro import Tiro
 
             num_tiros = dados.get("tiros_explosao", 12)
@@ -695,67 +1027,12 @@ class FaseMultiplayer(FaseBase):
             self.habilidade_cooldown = tempo_atual
             print(f"[CLASSE] EXPLOSÃO! {num_tiros} tiros disparados em todas as direções!")
 
-        # ====== NORMAL - DASH ======
-        elif self.classe_jogador == "normal":
-            # Obter direção do movimento
-            keys = pygame.key.get_pressed()
-            dx, dy = 0, 0
-
-            if keys[pygame.K_w]:
-                dy = -1
-            if keys[pygame.K_s]:
-                dy = 1
-            if keys[pygame.K_a]:
-                dx = -1
-            if keys[pygame.K_d]:
-                dx = 1
-
-            if dx == 0 and dy == 0:
-                dx = 1  # Dash para a direita se parado
-
-            # Normalizar
-            magnitude = math.sqrt(dx * dx + dy * dy)
-            if magnitude > 0:
-                dx /= magnitude
-                dy /= magnitude
-
-            # Executar dash
-            dash_velocidade = dados.get("dash_velocidade", 25)
-            dash_duracao = dados.get("dash_duracao", 8)
-
-            self.habilidade_ativa = True  # Marcar habilidade como ativa
-            self.jogador.dash_ativo = True
-            self.jogador.dash_frames_restantes = dash_duracao
-            self.jogador.dash_direcao = (dx, dy)
-            self.jogador.dash_velocidade = dash_velocidade
-            self.jogador.invulneravel = True
-
-            self.habilidade_cooldown = tempo_atual
-            print("[CLASSE] DASH!")
-
         # ====== PURPLE - SEM HABILIDADE ATIVA ======
         elif self.classe_jogador == "purple":
             print("[CLASSE] Purple não tem habilidade ativa.")
 
         # ============ CLASSES TIME T ============
 
-        # ====== MAGO - ESCUDO PROTETOR ======
-        elif self.classe_jogador == "mago":
-            self.habilidade_ativa = True
-            self.habilidade_tempo_inicio = tempo_atual
-            self.jogador.escudo_ativo = True
-            self.jogador.invulneravel = True
-            self.habilidade_cooldown = tempo_atual
-            print("[CLASSE] ESCUDO ATIVADO! Proteção por 4 segundos!")
-
-        # ====== GHOST - INVISIBILIDADE ======
-        elif self.classe_jogador == "ghost":
-            self.habilidade_ativa = True
-            self.habilidade_tempo_inicio = tempo_atual
-            self.jogador.invisivel = True
-            self.habilidade_cooldown = tempo_atual
-            print("[CLASSE] INVISIBILIDADE ATIVADA! Invisível por 4 segundos!")
-
         # ====== GRANADA - LANÇA GRANADA COM ESPAÇO ======
         elif self.classe_jogador == "granada":
             # Verificar cooldown
@@ -769,71 +1046,52 @@ class FaseMultiplayer(FaseBase):
         elif self.classe_jogador == "metralhadora":
             pass  # Passivo: metralhadora grátis + dano dobrado
 
-    def _atualizar_habilidade_classe(self, tempo_atual):
-        """Atualiza o estado das habilidades de classe (chamado a cada frame)."""
-        from src.game.selecao_classes import obter_dados_classe
+    def _movimento_atual(self):
+        """Estado de movimento da classe: o previsto com simulação no servidor, senão o da simulação local."""
+        if self.simulacao_local is None:
+            return self.cliente.get_predicted_state() or novo_movimento()
+        return self.simulacao_local.movimento(self.cliente.local_player_id) or novo_movimento()
 
-        if not self.habilidade_ativa:
-            return
+    def _aplicar_movimento_classe(self, movimento):
+        """
+        Copia o estado de movimento da classe (mover_com_classe) para os
+        atributos que o desenho e o HUD usam: dash, escudo, invisibilidade,
+        invulnerabilidade, rastro do turbo e os tempos da habilidade.
 
-        dados = obter_dados_classe(self.classe_jogador, self.time_jogador)
-        if not dados:
-            return
+        Args:
+            movimento: Estado de movimento (None = estado inicial)
+        """
+        from src.game.selecao_classes import obter_dados_classe
 
-        # ====== CYAN - DESATIVAR TURBO APÓS DURAÇÃO ======
-        if self.classe_jogador == "cyan":
-            duracao = dados.get("habilidade_duracao", 5000)
-            if tempo_atual - self.habilidade_tempo_inicio >= duracao:
-                self.jogador.velocidade = self.velocidade_original
-                self.habilidade_ativa = False
-                # Limpar rastro quando turbo termina
-                if hasattr(self.jogador, 'posicoes_turbo'):
-                    self.jogador.posicoes_turbo.clear()
-                print("[CLASSE] Turbo desativado!")
-
-        # ====== NORMAL - ATUALIZAR DASH ======
-        elif self.classe_jogador == "normal":
-            if hasattr(self.jogador, 'dash_ativo') and self.jogador.dash_ativo:
-                if self.jogador.dash_frames_restantes > 0:
-                    # Mover na direção do dash com colisão
-                    dx, dy = self.jogador.dash_direcao
-                    vel_x = dx * self.jogador.dash_velocidade
-                    vel_y = dy * self.jogador.dash_velocidade
-
-                    # Usar rect com tamanho multiplayer para colisões
-                    rect_colisao = pygame.Rect(self.jogador.x, self.jogador.y, TAMANHO_MULTIPLAYER, TAMANHO_MULTIPLAYER)
-
-                    # Resolver colisão com o mapa
-                    novo_x, novo_y, _, _ = self.tilemap.resolver_colisao(rect_colisao, vel_x, vel_y)
-
-                    self.jogador.x = novo_x
-                    self.jogador.y = novo_y
-                    self.jogador.rect.x = novo_x
-                    self.jogador.rect.y = novo_y
-                    self.jogador.dash_frames_restantes -= 1
-                else:
-                    self.jogador.dash_ativo = False
-                    self.jogador.invulneravel = False
-                    self.habilidade_ativa = False
+        movimento = movimento or novo_movimento()
+        self.jogador.dash_ativo = movimento['dash'] > 0
+        self.jogador.escudo_ativo = movimento['escudo'] > 0
+        self.jogador.invisivel = movimento['invisivel'] > 0
+        self.jogador.invulneravel = movimento_invulneravel(movimento)
 
-        # ============ CLASSES TIME T ============
+        # ====== CYAN TURBO - RASTRO ======
+        if not hasattr(self.jogador, 'posicoes_turbo'):
+            self.jogador.posicoes_turbo = []
+        if movimento['turbo'] > 0:
+            self.jogador.posicoes_turbo.insert(0, (self.jogador.x, self.jogador.y))
+            # Limitar a 15 posições
+            del self.jogador.posicoes_turbo[15:]
+        else:
+            self.jogador.posicoes_turbo.clear()
+
+        if self.classe_jogador not in CLASSES_MOVIMENTO:
+            return  # Explosive e granada controlam o próprio cooldown
 
-        # ====== MAGO - DESATIVAR ESCUDO APÓS DURAÇÃO ======
-        elif self.classe_jogador == "mago":
-            duracao = dados.get("habilidade_duracao", 4000)
-            if tempo_atual - self.habilidade_tempo_inicio >= duracao:
-                self.jogador.escudo_ativo = False
-                self.jogador.invulneravel = False
-                self.habilidade_ativa = False
-                print("[CLASSE] Escudo desativado!")
-
-        # ====== GHOST - DESATIVAR INVISIBILIDADE APÓS DURAÇÃO ======
-        elif self.classe_jogador == "ghost":
-            duracao = dados.get("habilidade_duracao", 4000)
-            if tempo_atual - self.habilidade_tempo_inicio >= duracao:
-                self.jogador.invisivel = False
-                self.habilidade_ativa = False
-                print("[CLASSE] Invisibilidade desativada!")
+        # HUD: os contadores (em inputs) viram os horários que ele espera
+        dados = obter_dados_classe(self.classe_jogador, self.time_jogador) or {}
+        tempo_atual = pygame.time.get_ticks()
+        self.habilidade_cooldown = tempo_atual - (dados.get("habilidade_cooldown", 0) -
+                                                  movimento['recarga'] * FRAME_MS)
+        ativo = max(movimento['turbo'], movimento['dash'], movimento['escudo'], movimento['invisivel'])
+        self.habilidade_ativa = ativo > 0
+        if ativo > 0:
+            self.habilidade_tempo_inicio = tempo_atual - (dados.get("habilidade_duracao", 0) -
+                                                          ativo * FRAME_MS)
 
     def _lancar_granada_comprada(self, pos_mouse_mundo):
         """Lança uma granada (Q para selecionar, clique para lançar)."""
@@ -1037,15 +1295,13 @@ class FaseMultiplayer(FaseBase):
             # Só causar dano em bots do time oposto
             if bot.time == granada.time:
                 continue
-            # Verificar invulnerabilidade (escudo do mago)
-            if getattr(bot, 'invulneravel', False):
-                continue
             # Calcular distância
-            dx = granada.x - (bot.x + bot.tamanho // 2)
-            dy = granada.y - (bot.y + bot.tamanho // 2)
-            distancia = math.sqrt(dx**2 + dy**2)
+            centro_x = bot.x + bot.tamanho // 2
+            centro_y = bot.y + bot.tamanho // 2
+            distancia = math.sqrt((granada.x - centro_x)**2 + (granada.y - centro_y)**2)
             if distancia <= granada.raio_explosao:
-                bot.tomar_dano()
+                # A explosão alcança o bot no centro dele (é o ponto do acerto)
+                self._acertar_bot(bot, 1, centro_x, centro_y, granada.time)
 
         # Criar som de explosão
         tamanho_amostra = 10000
@@ -1531,6 +1787,8 @@ class FaseMultiplayer(FaseBase):
         self.camera_x = 0
         self.camera_y = 0
         self.camera_zoom = 2.0  # Zoom 2x para aproximar a câmera do jogador
+        self._alvos_mundo = {}  # (largura, altura) visível -> Surface, do mais antigo ao mais novo
+        self._area_mundo = None  # Subsuperfície da tela que recebe o mundo escalado
 
         # Aplicar efeitos da classe (ambos os times têm classes)
         self._aplicar_classe_jogador()
@@ -1554,15 +1812,29 @@ class FaseMultiplayer(FaseBase):
             self.jogador.rect.y = pos_inicial[1]
             print(f"[MULTIPLAYER] Spawn não encontrado, posição alternativa: {pos_inicial}")
 
-        # Criar bots distribuídos entre os times
-        self._criar_bots_distribuidos()
+        # Sem simulação no servidor, as mesmas regras e IA rodam numa
+        # SimulacaoBomba local (seed do rng_jogo, que o replay semeia); com
+        # ela, os bots chegam no GAME_STATE
+        if not self.simulacao_servidor:
+            self.simulacao_local = SimulacaoBomba(self.tilemap, seed=rng_jogo.getrandbits(32))
+            self.simulacao_local.iniciar({
+                self.cliente.local_player_id: (self.time_jogador, self.nome_jogador, self.classe_jogador)
+            })
+
+        # Com simulação no servidor, o jogador local anda pela predição do
+        # cliente com o mesmo passo (colisão no mapa e habilidade de classe)
+        # que o servidor usa, reconciliada com o último input confirmado e o
+        # estado de movimento de cada GAME_STATE
+        if self.simulacao_servidor and self.cliente:
+            self.cliente.prediction.set_mover(self._mover_previsto, stateful=True)
+            self.cliente.prediction.reset(self.jogador.x, self.jogador.y)
 
         # Marcar mapa como carregado
         self.mapa_carregado = True
 
         # Sistema de compra (estilo Counter-Strike)
         self.tempo_inicio_round = pygame.time.get_ticks()
-        self.tempo_compra = 6000  # 6 segundos de tempo de compra
+        self.tempo_compra = TEMPO_COMPRA
         self.em_tempo_compra = True  # Flag para saber se ainda está no tempo de compra
         self.menu_compra_aberto = False  # Menu de compra aberto (tecla B)
         self.moedas = 800  # Dinheiro inicial
@@ -1576,7 +1848,6 @@ class FaseMultiplayer(FaseBase):
         # Sistema de rounds (primeiro a 5 vitórias)
         self.rounds_time_t = 0
         self.rounds_time_q = 0
-        self.rounds_para_vencer = 5
         self.round_atual = 1
         self.round_terminado = False  # Flag para round individual
         self.partida_terminada = False  # Flag para partida completa (5 rounds)
@@ -1589,18 +1860,17 @@ class FaseMultiplayer(FaseBase):
         self.espectador_delay = 2000  # 2 segundos de delay antes de seguir aliado
 
         # Sistema de bomba
-        self.bomber_id = None  # ID do jogador/bot que é o bomber
         self.bomber_é_jogador = False  # True se o jogador local é o bomber
         self.bomba_plantada = False
         self.bomba_posicao = None  # (x, y) onde a bomba foi plantada
         self.bomba_tempo_plantio = 0  # Quando a bomba foi plantada
-        self.bomba_tempo_explosao = 35000  # 35 segundos para explodir
+        self.bomba_tempo_explosao = TEMPO_EXPLOSAO
         self.plantando_bomba = False  # Se está no processo de plantar
         self.tempo_inicio_plantar = 0  # Quando começou a plantar
-        self.tempo_para_plantar = 4000  # 4 segundos para plantar
+        self.tempo_para_plantar = TEMPO_PLANTAR
         self.defusando_bomba = False  # Se está no processo de defusar
         self.tempo_inicio_defusar = 0  # Quando começou a defusar
-        self.tempo_para_defusar = 5000  # 5 segundos para defusar
+        self.tempo_para_defusar = TEMPO_DEFUSAR
         self.bomba_defusada = False
         self.bomba_explodiu = False
 
@@ -1608,27 +1878,6 @@ class FaseMultiplayer(FaseBase):
         self.bomba_dropada = False
         self.bomba_drop_posicao = None  # (x, y) onde a bomba está no chão
 
-        # Encontrar posições dos bombsites (tile 322)
-        self.bombsites = self._encontrar_bombsites()
-        print(f"[MULTIPLAYER] Bombsites encontrados: {len(self.bombsites)} locais")
-
-        # Criar mapa de navegação (grid de pontos válidos)
-        self.nav_grid = self._criar_mapa_navegacao()
-        print(f"[MULTIPLAYER] Mapa de navegação: {len(self.nav_grid)} pontos válidos")
-
-        # Carregar rotas desenhadas no DEV MODE
-        self._carregar_rotas()
-        if self.dev_rotas_t or self.dev_rotas_q:
-            print(f"[MULTIPLAYER] Rotas carregadas: TIME T={len(self.dev_rotas_t)}, TIME Q={len(self.dev_rotas_q)}")
-
-        # Criar pontos estratégicos por time
-        self.pontos_time_t = []  # Pontos para atacantes
-        self.pontos_time_q = []  # Pontos para defensores
-        self._criar_pontos_estrategicos()
-
-        # Selecionar bomber inicial
-        self._selecionar_bomber()
-
         # Definir armas disponíveis e preços
         self.armas_disponiveis = {
             'desert_eagle': {
@@ -1675,79 +1924,13 @@ class FaseMultiplayer(FaseBase):
         # Aba atual da loja (0 = armas, 1 = itens)
         self.aba_loja_atual = 0
 
-        print(f"[MULTIPLAYER] Jogo carregado! Modo: VERSUS - {len(self.bots_locais)} bots (4v4)")
+        print("[MULTIPLAYER] Jogo carregado! Modo: VERSUS (4v4)")
 
-    def _criar_bots_distribuidos(self):
+    def _criar_bot_com_time(self, bot_info, time_bot):
         """
-        Cria bots distribuídos entre os dois times.
-        Cada time SEMPRE tem 4 quadrados:
-        - Time do jogador: 1 jogador + 3 bots = 4
-        - Time inimigo: 4 bots = 4
-
-        Cada bot recebe uma classe única (sem repetir no mesmo time).
-        A classe do jogador é excluída dos bots do mesmo time.
+        Cria o quadrado que desenha um bot da simulação (posição, vida,
+        bomba e arma são copiadas do estado dela a cada frame).
         """
-        from src.game.selecao_classes import CLASSES_TIME_T, CLASSES_TIME_Q
-
-        self.bots_locais = []
-
-        # Nomes para os bots
-        nomes_time_t = ["Bernado", "Borba", "Melina", "Felipe"]
-        nomes_time_q = ["Duda", "Marcelo", "João", "Emy"]
-
-        # Classes disponíveis para cada time
-        classes_t = list(CLASSES_TIME_T.keys())  # ["mago", "ghost", "granada", "metralhadora"]
-        classes_q = list(CLASSES_TIME_Q.keys())  # ["cyan", "explosive", "normal", "purple"]
-
-        # Embaralhar classes para variedade
-        random.shuffle(classes_t)
-        random.shuffle(classes_q)
-
-        # Remover a classe do jogador da lista do seu time
-        if self.time_jogador == 'T' and self.classe_jogador in classes_t:
-            classes_t.remove(self.classe_jogador)
-        elif self.time_jogador == 'Q' and self.classe_jogador in classes_q:
-            classes_q.remove(self.classe_jogador)
-
-        # Criar bots para cada time
-        # Time do jogador: 3 bots (jogador é o 4º)
-        # Time inimigo: 4 bots
-
-        if self.time_jogador == 'T':
-            # Jogador está no Time T -> criar 3 bots no T e 4 no Q
-            for i in range(3):
-                classe_bot = classes_t[i] if i < len(classes_t) else classes_t[0]
-                bot_info = {'nome': nomes_time_t[i], 'classe': classe_bot}
-                bot = self._criar_bot_com_time(bot_info, 'T')
-                self.bots_locais.append(bot)
-                print(f"[MULTIPLAYER] Bot criado: {bot.nome} ({bot.classe}) - Time T (aliado)")
-
-            for i in range(4):
-                classe_bot = classes_q[i] if i < len(classes_q) else classes_q[0]
-                bot_info = {'nome': nomes_time_q[i], 'classe': classe_bot}
-                bot = self._criar_bot_com_time(bot_info, 'Q')
-                self.bots_locais.append(bot)
-                print(f"[MULTIPLAYER] Bot criado: {bot.nome} ({bot.classe}) - Time Q (inimigo)")
-        else:
-            # Jogador está no Time Q -> criar 4 bots no T e 3 no Q
-            for i in range(4):
-                classe_bot = classes_t[i] if i < len(classes_t) else classes_t[0]
-                bot_info = {'nome': nomes_time_t[i], 'classe': classe_bot}
-                bot = self._criar_bot_com_time(bot_info, 'T')
-                self.bots_locais.append(bot)
-                print(f"[MULTIPLAYER] Bot criado: {bot.nome} ({bot.classe}) - Time T (inimigo)")
-
-            for i in range(3):
-                classe_bot = classes_q[i] if i < len(classes_q) else classes_q[0]
-                bot_info = {'nome': nomes_time_q[i], 'classe': classe_bot}
-                bot = self._criar_bot_com_time(bot_info, 'Q')
-                self.bots_locais.append(bot)
-                print(f"[MULTIPLAYER] Bot criado: {bot.nome} ({bot.classe}) - Time Q (aliado)")
-
-        print(f"[MULTIPLAYER] Times configurados: 4v4 com classes únicas")
-
-    def _criar_bot_com_time(self, bot_info, time_bot):
-        """Cria um bot para um time específico com classe."""
         from src.game.selecao_classes import obter_dados_classe
 
         # Posição no spawn do time
@@ -1755,9 +1938,8 @@ class FaseMultiplayer(FaseBase):
         spawn_obj = self.tilemap.get_objeto(spawn_name)
 
         if spawn_obj:
-            # Posição aleatória dentro da área de spawn
-            x = spawn_obj['x'] + random.random() * spawn_obj['width']
-            y = spawn_obj['y'] + random.random() * spawn_obj['height']
+            x = spawn_obj['x'] + spawn_obj['width'] // 2
+            y = spawn_obj['y'] + spawn_obj['height'] // 2
         else:
             x, y = self._encontrar_posicao_valida()
 
@@ -1784,2073 +1966,179 @@ class FaseMultiplayer(FaseBase):
         bot.cor_escura = cor_escura
 
         # Classe do bot
-        bot.classe = classe_id
-        bot.dados_classe = dados_classe
-
-        # Sistema de habilidade do bot
-        bot.habilidade_cooldown = 0  # Tempo do último uso
-        bot.habilidade_ativa = False
-        bot.habilidade_tempo_inicio = 0
-        bot.velocidade_original = bot.velocidade
-
-        # Atributos específicos de classe
-        if classe_id == 'mago':
-            bot.escudo_ativo = False
-            bot.invulneravel = False
-        elif classe_id == 'ghost':
-            bot.invisivel = False
-        elif classe_id == 'granada':
-            bot.granadas_habilidade = 999  # Ilimitadas com cooldown
-        elif classe_id == 'metralhadora':
-            bot.metralhadora_dano_bonus = dados_classe.get('metralhadora_dano_bonus', 2)
-        elif classe_id == 'cyan':
-            bot.posicoes_turbo = []
-        elif classe_id == 'normal':
-            bot.dash_ativo = False
-            bot.dash_frames_restantes = 0
-            bot.dash_direcao = (0, 0)
-            bot.dash_velocidade = dados_classe.get('dash_velocidade', 25)
-
-        # IA do bot - atributos básicos
-        bot.is_bot = True
-        bot.alvo_x = x
-        bot.alvo_y = y
-        bot.tempo_ultimo_tiro = 0
-        bot.tempo_mudar_alvo = pygame.time.get_ticks()
-
-        # IA avançada - economia e armas
-        bot.moedas = 800  # Dinheiro inicial igual ao jogador
-        bot.arma = None  # Arma equipada (None = sem arma)
-        bot.dano_arma = 1  # Dano da arma
-        bot.cadencia_arma = 500  # Tempo entre tiros (ms) - tiro normal mais lento
-
-        # Classe metralhadora: começa com metralhadora grátis e dano dobrado
-        if classe_id == 'metralhadora':
-            bot.arma = 'metralhadora'
-            bot.dano_arma = 2
-            bot.cadencia_arma = 100  # Metralhadora é rápida
-
-        # IA avançada - comportamento
-        bot.estado = 'comprando'  # Estados: comprando, movendo, atacando, plantando, defusando
-        bot.bombsite_alvo = None  # Qual bombsite o bot vai (índice)
-        bot.alvo_inimigo = None  # Referência ao inimigo mais próximo
-        bot.é_bomber = False  # Se este bot é o bomber do round
-        bot.caminho = []  # Lista de pontos para pathfinding
-        bot.ultimo_caminho = 0  # Tempo do último cálculo de caminho
-        bot.spawn_x = x  # Posição inicial para resetar
-        bot.spawn_y = y
-
-        return bot
-
-    def _encontrar_posicao_valida(self):
-        """Encontra uma posição válida (não sólida) no mapa para spawn."""
-        import random
-
-        # Tentar encontrar uma posição válida
-        for _ in range(100):
-            x = random.randint(100, self.tilemap.largura_pixels - 100)
-            y = random.randint(100, self.tilemap.altura_pixels - 100)
-
-            # Verificar se a posição não é sólida (usar tamanho multiplayer menor)
-            rect_teste = pygame.Rect(x, y, TAMANHO_MULTIPLAYER, TAMANHO_MULTIPLAYER)
-            if not self.tilemap.colide_com_rect(rect_teste):
-                return x, y
-
-        # Fallback para o centro do mapa
-        return self.tilemap.largura_pixels // 2, self.tilemap.altura_pixels // 2
-
-    def _encontrar_bombsites(self):
-        """Encontra todas as posições dos bombsites (tile 322) no mapa."""
-        bombsites = []
-        tile_alvo = 322
-
-        # Percorrer todos os tiles do mapa
-        for y in range(self.tilemap.altura):
-            for x in range(self.tilemap.largura):
-                tile_id = self.tilemap.get_tile(x, y)
-                tile_id_base = tile_id & 0x1FFFFFFF
-
-                if tile_id_base == tile_alvo:
-                    # Converter para coordenadas de pixel (centro do tile)
-                    px = x * self.tilemap.tile_largura + self.tilemap.tile_largura // 2
-                    py = y * self.tilemap.tile_altura + self.tilemap.tile_altura // 2
-                    bombsites.append((px, py))
-
-        # Agrupar bombsites próximos em áreas (clusters)
-        if bombsites:
-            areas = self._agrupar_bombsites(bombsites)
-            print(f"[BOMBSITES] {len(bombsites)} tiles agrupados em {len(areas)} áreas")
-            return areas
-
-        return [(self.tilemap.largura_pixels // 2, self.tilemap.altura_pixels // 2)]
-
-    def _agrupar_bombsites(self, tiles):
-        """Agrupa tiles próximos em áreas de bombsite."""
-        import math
-
-        if not tiles:
-            return []
-
-        # Usar clustering simples - agrupar por distância
-        areas = []
-        tiles_restantes = list(tiles)
-        distancia_agrupamento = 100  # Tiles a menos de 100px são do mesmo bombsite
-
-        while tiles_restantes:
-            # Começar nova área com primeiro tile
-            area_tiles = [tiles_restantes.pop(0)]
-
-            # Encontrar todos os tiles próximos
-            mudou = True
-            while mudou:
-                mudou = False
-                for tile in tiles_restantes[:]:
-                    for area_tile in area_tiles:
-                        dist = math.sqrt((tile[0] - area_tile[0])**2 + (tile[1] - area_tile[1])**2)
-                        if dist < distancia_agrupamento:
-                            area_tiles.append(tile)
-                            tiles_restantes.remove(tile)
-                            mudou = True
-                            break
-
-            # Calcular centro da área
-            centro_x = sum(t[0] for t in area_tiles) // len(area_tiles)
-            centro_y = sum(t[1] for t in area_tiles) // len(area_tiles)
-            areas.append((centro_x, centro_y))
-
-        return areas
-
-    def _criar_mapa_navegacao(self):
-        """Cria um grid de pontos navegáveis no mapa."""
-        nav_grid = []
-        ESPACAMENTO = 32  # Verificar a cada 32 pixels
-
-        for y in range(0, self.tilemap.altura_pixels, ESPACAMENTO):
-            for x in range(0, self.tilemap.largura_pixels, ESPACAMENTO):
-                # Verificar se o ponto é caminhável (não sólido)
-                centro_x = x + TAMANHO_MULTIPLAYER // 2
-                centro_y = y + TAMANHO_MULTIPLAYER // 2
-
-                # Verificar o centro e as bordas
-                if self._ponto_navegavel(centro_x, centro_y):
-                    nav_grid.append((x, y))
-
-        return nav_grid
-
-    def _ponto_navegavel(self, x, y):
-        """Verifica se um ponto é navegável (bot cabe e não é sólido)."""
-        # Verificar múltiplos pontos para garantir que o bot cabe
-        margem = TAMANHO_MULTIPLAYER // 2 + 4
-        pontos = [
-            (x, y),
-            (x - margem, y - margem),
-            (x + margem, y - margem),
-            (x - margem, y + margem),
-            (x + margem, y + margem),
-        ]
-
-        for px, py in pontos:
-            if self.tilemap.is_solid(px, py):
-                return False
-
-        return True
-
-    def _criar_pontos_estrategicos(self):
-        """Cria pontos estratégicos para cada time baseado nos spawns e bombsites."""
-        # Pontos de defesa (Time Q) - ao redor dos bombsites
-        for bombsite in self.bombsites:
-            # Adicionar pontos ao redor do bombsite
-            for angulo in range(0, 360, 45):
-                import math
-                rad = math.radians(angulo)
-                for dist in [60, 100, 140]:
-                    px = int(bombsite[0] + math.cos(rad) * dist)
-                    py = int(bombsite[1] + math.sin(rad) * dist)
-                    if self._ponto_navegavel(px, py):
-                        self.pontos_time_q.append((px, py))
-
-        # Pontos de ataque (Time T) - caminho para os bombsites
-        spawn_t = self.tilemap.get_objeto("Start_T")
-        if spawn_t:
-            spawn_centro = (spawn_t['x'] + spawn_t['width'] // 2,
-                           spawn_t['y'] + spawn_t['height'] // 2)
-
-            # Criar pontos intermediários entre spawn e cada bombsite
-            for bombsite in self.bombsites:
-                for t in [0.25, 0.5, 0.75]:
-                    px = int(spawn_centro[0] + (bombsite[0] - spawn_centro[0]) * t)
-                    py = int(spawn_centro[1] + (bombsite[1] - spawn_centro[1]) * t)
-                    # Encontrar ponto navegável mais próximo
-                    ponto_nav = self._encontrar_ponto_navegavel_proximo(px, py)
-                    if ponto_nav:
-                        self.pontos_time_t.append(ponto_nav)
-
-        # Adicionar bombsites como destino final para Time T
-        for bombsite in self.bombsites:
-            ponto_nav = self._encontrar_ponto_navegavel_proximo(bombsite[0], bombsite[1])
-            if ponto_nav:
-                self.pontos_time_t.append(ponto_nav)
-
-        print(f"[NAV] Pontos Time T: {len(self.pontos_time_t)}, Time Q: {len(self.pontos_time_q)}")
-
-    def _encontrar_ponto_navegavel_proximo(self, x, y):
-        """Encontra o ponto navegável mais próximo de uma posição."""
-        import math
-
-        if not self.nav_grid:
-            return None
-
-        menor_dist = float('inf')
-        ponto_proximo = None
-
-        for ponto in self.nav_grid:
-            dist = math.sqrt((ponto[0] - x)**2 + (ponto[1] - y)**2)
-            if dist < menor_dist:
-                menor_dist = dist
-                ponto_proximo = ponto
-
-        return ponto_proximo
-
-    def _atualizar_jogador_com_colisao(self, pos_mouse, tempo_atual):
-        """Atualiza o jogador com verificação de colisão do mapa."""
-        import math
-
-        if self.jogador.vidas <= 0:
-            return
-
-        # Bloquear movimento durante tempo de compra
-        if self.em_tempo_compra:
-            return
-
-        # Ler teclas diretamente para evitar problemas de estado
-        teclas = pygame.key.get_pressed()
-        mov_x = 0
-        mov_y = 0
-
-        if teclas[pygame.K_a]:
-            mov_x -= 1
-        if teclas[pygame.K_d]:
-            mov_x += 1
-        if teclas[pygame.K_w]:
-            mov_y -= 1
-        if teclas[pygame.K_s]:
-            mov_y += 1
-
-        # Normalizar APENAS movimento diagonal (quando ambos X e Y são pressionados)
-        # Isso evita que diagonal seja mais rápido que cardinal
-        if mov_x != 0 and mov_y != 0:
-            # Diagonal: dividir por sqrt(2) para manter mesma velocidade
-            mov_x *= 0.7071  # 1/sqrt(2) ≈ 0.7071
-            mov_y *= 0.7071
-
-        # Usar velocidade do jogador (permite modificação por habilidades de classe)
-        velocidade = getattr(self.jogador, 'velocidade', 2.0)
-        # Garantir velocidade mínima de 2.0 se não estiver definida corretamente
-        if velocidade < 0.5:
-            velocidade = 2.0
-
-        # Calcular velocidade de movimento
-        vel_x = mov_x * velocidade
-        vel_y = mov_y * velocidade
-
-        # Usar rect com tamanho multiplayer para colisões
-        rect_colisao = pygame.Rect(self.jogador.x, self.jogador.y, TAMANHO_MULTIPLAYER, TAMANHO_MULTIPLAYER)
-
-        # Resolver colisão com o mapa
-        novo_x, novo_y, _, _ = self.tilemap.resolver_colisao(
-            rect_colisao, vel_x, vel_y
-        )
-
-        # Aplicar nova posição
-        self.jogador.x = novo_x
-        self.jogador.y = novo_y
-        self.jogador.rect.x = novo_x
-        self.jogador.rect.y = novo_y
-        self.jogador.rect.width = TAMANHO_MULTIPLAYER
-        self.jogador.rect.height = TAMANHO_MULTIPLAYER
-
-        # ====== CYAN TURBO - RASTRO ======
-        # Salvar posição para o rastro quando turbo está ativo
-        if self.classe_jogador == "cyan" and self.habilidade_ativa:
-            if hasattr(self.jogador, 'posicoes_turbo'):
-                self.jogador.posicoes_turbo.insert(0, (novo_x, novo_y))
-                # Limitar a 15 posições
-                if len(self.jogador.posicoes_turbo) > 15:
-                    self.jogador.posicoes_turbo.pop()
-
-        # Atualizar outros aspectos do jogador
-        self.jogador.atualizar()
-
-    def _converter_mouse_para_mundo(self, pos_mouse):
-        """Converte posição do mouse na tela para coordenadas do mundo (considerando zoom)."""
-        # Converter posição da tela para coordenadas do mundo
-        mundo_x = pos_mouse[0] / self.camera_zoom + self.camera_x
-        mundo_y = pos_mouse[1] / self.camera_zoom + self.camera_y
-        return (mundo_x, mundo_y)
-
-    def _atualizar_camera(self):
-        """Atualiza a posição da câmera para seguir o jogador (ou aliado se espectador)."""
-        # Dimensões da tela com zoom aplicado
-        largura_visivel = LARGURA / self.camera_zoom
-        altura_visivel = ALTURA_JOGO / self.camera_zoom
-
-        # Centro da tela (em coordenadas do mundo)
-        centro_x = largura_visivel / 2
-        centro_y = altura_visivel / 2
-
-        # Determinar alvo da câmera
-        alvo_x = self.jogador.x
-        alvo_y = self.jogador.y
-
-        # Se jogador morreu, ativar modo espectador
-        if self.jogador.vidas <= 0:
-            tempo_atual = pygame.time.get_ticks()
-
-            # Primeira vez que detecta morte - registrar tempo
-            if not self.espectador_ativo:
-                self.espectador_ativo = True
-                self.espectador_tempo_morte = tempo_atual
-                self.espectador_alvo_idx = 0
-
-            # Após o delay, seguir um aliado vivo
-            if tempo_atual - self.espectador_tempo_morte >= self.espectador_delay:
-                aliado = self._obter_aliado_espectador()
-                if aliado:
-                    alvo_x = aliado.x
-                    alvo_y = aliado.y
-
-        # Câmera segue o alvo
-        self.camera_x = alvo_x - centro_x
-        self.camera_y = alvo_y - centro_y
-
-        # Limitar câmera aos limites do mapa
-        self.camera_x = max(0, min(self.camera_x, self.tilemap.largura_pixels - largura_visivel))
-        self.camera_y = max(0, min(self.camera_y, self.tilemap.altura_pixels - altura_visivel))
-
-    def _obter_aliado_espectador(self):
-        """Retorna o bot que a câmera deve seguir no modo espectador."""
-        # Filtrar todos os bots vivos (de qualquer time)
-        bots_vivos = [
-            bot for bot in self.bots_locais
-            if bot.vidas > 0
-        ]
-
-        if not bots_vivos:
-            return None
-
-        # Ajustar índice se necessário
-        if self.espectador_alvo_idx >= len(bots_vivos):
-            self.espectador_alvo_idx = 0
-
-        return bots_vivos[self.espectador_alvo_idx]
-
-    def _alternar_espectador(self):
-        """Alterna para o próximo bot vivo no modo espectador."""
-        if not self.espectador_ativo or self.jogador.vidas > 0:
-            return
-
-        # Contar todos os bots vivos
-        bots_vivos = [
-            bot for bot in self.bots_locais
-            if bot.vidas > 0
-        ]
-
-        if len(bots_vivos) > 0:
-            self.espectador_alvo_idx = (self.espectador_alvo_idx + 1) % len(bots_vivos)
-            bot = bots_vivos[self.espectador_alvo_idx]
-            time_bot = getattr(bot, 'time', '?')
-            print(f"[ESPECTADOR] Observando: {bot.nome} (Time {time_bot})")
-
-    # ==================================================================================
-    # ================================ SISTEMA DE IA v2.0 =============================
-    # ==================================================================================
-
-
-    IA_DISTANCIA_VISAO = 200      # Distância máxima para detectar inimigos
-    IA_DISTANCIA_TIRO = 180       # Distância máxima para atirar
-    IA_WAYPOINT_THRESHOLD = 20    # Distância para considerar waypoint alcançado
-    IA_STUCK_TEMPO = 500          # Tempo em ms para verificar stuck
-    IA_STUCK_DISTANCIA = 5        # Distância mínima para não ser considerado stuck
-    IA_STUCK_MAX = 3              # Vezes seguidas parado para ser considerado stuck
-    IA_RECALC_INTERVALO = 2000    # Intervalo mínimo entre recálculos de rota (ms)
-
-    # ==================== NAVEGAÇÃO SIMPLIFICADA (SEM A* PESADO) ====================
-
-    def _criar_caminho_simples(self, inicio, destino):
-        """
-        Cria um caminho simples do início ao destino.
-        Usa apenas o destino como waypoint (navegação direta com desvio local).
-
-        Args:
-            inicio: Tupla (x, y) posição inicial
-            destino: Tupla (x, y) posição destino
-
-        Returns:
-            Lista com o destino como único waypoint
-        """
-        if not destino:
-            return []
-        return [destino]
-
-    # ==================== SELEÇÃO DE TILE 322 ====================
-
-    def _obter_tiles_322(self):
-        """
-        Encontra todas as posições dos tiles com ID 322 no mapa.
-
-        Returns:
-            Lista de tuplas (x, y) com coordenadas de mundo dos tiles 322
-        """
-        tiles_322 = []
-        TILE_ALVO = 322
-
-        for y in range(self.tilemap.altura):
-            for x in range(self.tilemap.largura):
-                tile_id = self.tilemap.get_tile(x, y)
-                tile_id_base = tile_id & 0x1FFFFFFF  # Remove flags de rotação
-
-                if tile_id_base == TILE_ALVO:
-                    # Converter para coordenadas de mundo (centro do tile)
-                    px = x * self.tilemap.tile_largura + self.tilemap.tile_largura // 2
-                    py = y * self.tilemap.tile_altura + self.tilemap.tile_altura // 2
-                    tiles_322.append((px, py))
-
-        return tiles_322
-
-    def _encontrar_tile_322_mais_proximo(self, bot):
-        """
-        Encontra o tile 322 mais próximo do bot.
-
-        Args:
-            bot: Referência ao bot
-
-        Returns:
-            Tupla (x, y) do tile mais próximo ou None se não existir
-        """
-        import math
-
-        tiles = self._obter_tiles_322()
-        if not tiles:
-            # Fallback para bombsites se tiles 322 não encontrados
-            if self.bombsites:
-                tiles = self.bombsites
-
-        if not tiles:
-            return None
-
-        menor_dist = float('inf')
-        tile_proximo = None
-
-        for tile in tiles:
-            dist = math.sqrt((tile[0] - bot.x)**2 + (tile[1] - bot.y)**2)
-            if dist < menor_dist:
-                menor_dist = dist
-                tile_proximo = tile
-
-        return tile_proximo
-
-    def _escolher_outro_tile_322(self, bot, tile_atual):
-        """
-        Escolhe outro tile 322 diferente do atual (usado quando preso).
-
-        Args:
-            bot: Referência ao bot
-            tile_atual: Tile que deve ser evitado
-
-        Returns:
-            Tupla (x, y) de outro tile ou o mais próximo se só houver um
-        """
-        import math
-        import random
-
-        tiles = self._obter_tiles_322()
-        if not tiles:
-            if self.bombsites:
-                tiles = list(self.bombsites)
-            else:
-                return None
-
-        # Filtrar o tile atual
-        tiles_disponiveis = [t for t in tiles if t != tile_atual]
-
-        if not tiles_disponiveis:
-            # Se só tem um tile, retornar ele mesmo
-            return tile_atual
-
-        # Escolher aleatoriamente entre os disponíveis (com peso para mais próximos)
-        tiles_com_dist = []
-        for tile in tiles_disponiveis:
-            dist = math.sqrt((tile[0] - bot.x)**2 + (tile[1] - bot.y)**2)
-            tiles_com_dist.append((tile, dist))
-
-        # Ordenar por distância e pegar um dos 3 mais próximos
-        tiles_com_dist.sort(key=lambda x: x[1])
-        candidatos = tiles_com_dist[:min(3, len(tiles_com_dist))]
-
-        return random.choice(candidatos)[0]
-
-    # ==================== SISTEMA DE VISÃO ====================
-
-    def _tem_linha_de_visao(self, x1, y1, x2, y2):
-        """
-        Verifica se há linha de visão entre dois pontos (raycast tile a tile).
-
-        Args:
-            x1, y1: Ponto de origem
-            x2, y2: Ponto de destino
-
-        Returns:
-            True se há linha de visão livre, False se há obstáculo
-        """
-        import math
-
-        dx = x2 - x1
-        dy = y2 - y1
-        dist = math.sqrt(dx**2 + dy**2)
-
-        if dist < 1:
-            return True
-
-        # Normalizar direção
-        dx /= dist
-        dy /= dist
-
-        # Verificar a cada 8 pixels (resolução do raycast)
-        passos = int(dist / 8)
-        for i in range(1, passos + 1):
-            check_x = x1 + dx * (i * 8)
-            check_y = y1 + dy * (i * 8)
-            if self.tilemap.is_solid(check_x, check_y):
-                return False
-
-        return True
-
-    def _pode_ver_inimigo(self, bot, alvo):
-        """
-        Verifica se o bot pode ver um inimigo (distância + linha de visão).
-
-        Args:
-            bot: Bot que está olhando
-            alvo: Entidade alvo (jogador ou outro bot)
-
-        Returns:
-            Tupla (pode_ver: bool, distancia: float)
-        """
-        import math
-
-        bot_cx = bot.x + TAMANHO_MULTIPLAYER // 2
-        bot_cy = bot.y + TAMANHO_MULTIPLAYER // 2
-        alvo_cx = alvo.x + TAMANHO_MULTIPLAYER // 2
-        alvo_cy = alvo.y + TAMANHO_MULTIPLAYER // 2
-
-        # Calcular distância
-        dist = math.sqrt((alvo_cx - bot_cx)**2 + (alvo_cy - bot_cy)**2)
-
-        # Verificar se está dentro do raio de visão
-        if dist > self.IA_DISTANCIA_VISAO:
-            return False, dist
-
-        # Verificar linha de visão
-        if not self._tem_linha_de_visao(bot_cx, bot_cy, alvo_cx, alvo_cy):
-            return False, dist
-
-        return True, dist
-
-    # ==================== STUCK DETECTION ====================
-
-    def _ia_verificar_stuck(self, bot, tempo_atual):
-        """
-        Verifica se o bot está preso (não está se movendo).
-
-        Critérios:
-        - Verifica a cada IA_STUCK_TEMPO ms
-        - Se moveu menos que IA_STUCK_DISTANCIA pixels
-        - Se aconteceu IA_STUCK_MAX vezes seguidas -> está stuck
-
-        Args:
-            bot: Bot a verificar
-            tempo_atual: Tempo atual em ms
-
-        Returns:
-            True se o bot está preso, False caso contrário
-        """
-        import math
-
-        # Inicializar variáveis de stuck se não existirem
-        if not hasattr(bot, 'ia_pos_anterior'):
-            bot.ia_pos_anterior = (bot.x, bot.y)
-            bot.ia_tempo_pos_anterior = tempo_atual
-            bot.ia_stuck_contador = 0
-            return False
-
-        # Verificar apenas a cada intervalo definido
-        if tempo_atual - bot.ia_tempo_pos_anterior < self.IA_STUCK_TEMPO:
-            return bot.ia_stuck_contador >= self.IA_STUCK_MAX
-
-        # Calcular distância movida desde última verificação
-        dist_movida = math.sqrt(
-            (bot.x - bot.ia_pos_anterior[0])**2 +
-            (bot.y - bot.ia_pos_anterior[1])**2
-        )
-
-        # Se moveu menos que o mínimo, incrementar contador
-        if dist_movida < self.IA_STUCK_DISTANCIA:
-            bot.ia_stuck_contador += 1
-        else:
-            # Se moveu, decrementar contador (mas não abaixo de 0)
-            bot.ia_stuck_contador = max(0, bot.ia_stuck_contador - 1)
-
-        # Atualizar posição e tempo anterior
-        bot.ia_pos_anterior = (bot.x, bot.y)
-        bot.ia_tempo_pos_anterior = tempo_atual
-
-        return bot.ia_stuck_contador >= self.IA_STUCK_MAX
-
-    def _ia_recuperar_stuck(self, bot, tempo_atual):
-        """
-        Recupera o bot quando está preso.
-
-        Ações:
-        1. Limpar caminho atual
-        2. Escolher outro tile 322 como alvo
-        3. Recalcular rota
-        4. Se falhar, forçar movimento em direção livre
-
-        Args:
-            bot: Bot preso
-            tempo_atual: Tempo atual em ms
-        """
-        import math
-
-        # Resetar contador e estado
-        bot.ia_stuck_contador = 0
-        bot.ia_estado = 'recalculando_rota'
-
-        # Limpar caminho atual
-        bot.ia_caminho = []
-        bot.ia_waypoint_atual = 0
-
-        # Tentar escolher outro tile 322
-        tile_atual = getattr(bot, 'ia_tile_alvo', None)
-        novo_tile = self._escolher_outro_tile_322(bot, tile_atual)
-
-        if novo_tile:
-            bot.ia_tile_alvo = novo_tile
-
-            # Recalcular caminho para novo alvo
-            caminho = self._criar_caminho_simples((bot.x, bot.y), novo_tile)
-
-            if caminho and len(caminho) > 1:
-                bot.ia_caminho = caminho
-                bot.ia_waypoint_atual = 0
-                bot.ia_estado = 'movendo'
-                bot.ia_ultimo_recalculo = tempo_atual
-                print(f"[IA] {bot.nome} recalculou rota para novo tile 322")
-                return
-
-        # Se não conseguiu rota, forçar movimento em direção livre
-        self._ia_forcar_movimento_livre(bot)
-
-    def _ia_forcar_movimento_livre(self, bot):
-        """
-        Força movimento em uma direção livre quando todas outras opções falham.
-
-        Se está em loop (muitas tentativas), usa wandering que move diretamente.
-
-        Args:
-            bot: Bot a mover
-        """
-        tempo_atual = pygame.time.get_ticks()
-
-        # Incrementar contador de tentativas
-        bot.ia_tentativas_escape = getattr(bot, 'ia_tentativas_escape', 0) + 1
-
-        # Se está em loop (mais de 2 tentativas), usar wandering que move diretamente
-        if bot.ia_tentativas_escape > 2:
-            self._ia_wandering_aleatorio(bot, tempo_atual)
-            return
-
-        # Tentar ir para rota do devmode mais próxima
-        ponto_rota, rota_idx, waypoint_idx = self._encontrar_ponto_rota_acessivel(bot, dist_maxima=500, retornar_info_rota=True)
-        if ponto_rota:
-            # Mover diretamente na direção da rota também
-            self._ia_mover_direto(bot, ponto_rota)
-
-            # Pegar rotas do time do bot
-            rotas_time = self.dev_rotas_t if bot.time == 'T' else self.dev_rotas_q
-
-            # === RESETAR TODOS OS CONTADORES DE BLOQUEIO ===
-            bot.ia_bloqueado_contador = 0
-            bot.ia_tempo_parado = tempo_atual
-            bot.ia_pos_parado = (bot.x, bot.y)
-            bot.ia_tentativas_escape = 0  # Resetar tentativas
-
-            # Configurar para seguir a rota a partir do waypoint encontrado
-            bot.ia_rota_idx = rota_idx
-            bot.ia_caminho = list(rotas_time[rota_idx][waypoint_idx:])  # Rota a partir do waypoint
-            bot.ia_waypoint_atual = 0
-            bot.ia_estado = 'movendo'
-            bot.ia_tempo_inicio_rota = tempo_atual
-            # Ativar modo escape por 3 segundos (mais tempo para chegar)
-            bot.ia_modo_escape = True
-            bot.ia_escape_tempo_fim = tempo_atual + 3000
-            print(f"[IA] {bot.nome} preso, entrando na rota {rota_idx+1} waypoint {waypoint_idx+1}")
-            return
-
-        # Fallback: usar wandering aleatório
-        self._ia_wandering_aleatorio(bot, tempo_atual)
-
-    # ==================== MÁQUINA DE ESTADOS DA IA ====================
-
-    def _ia_inicializar_bot(self, bot):
-        """
-        Inicializa os atributos de IA de um bot.
-        Deve ser chamado quando o bot é criado.
-
-        Args:
-            bot: Bot a inicializar
-        """
-        # Estado da máquina de estados
-        bot.ia_estado = 'spawn'
-
-        # Pathfinding
-        bot.ia_caminho = []           # Lista de waypoints [(x,y), ...]
-        bot.ia_waypoint_atual = 0     # Índice do waypoint atual
-        bot.ia_tile_alvo = None       # Tile 322 atual como alvo
-        bot.ia_ultimo_recalculo = 0   # Tempo do último recálculo de rota
-
-        # Stuck detection
-        bot.ia_pos_anterior = (bot.x, bot.y)
-        bot.ia_tempo_pos_anterior = 0
-        bot.ia_stuck_contador = 0
-
-        # Detecção de parado (para escolher novo destino)
-        bot.ia_tempo_parado = pygame.time.get_ticks()
-        bot.ia_pos_parado = (bot.x, bot.y)
-
-        # Timeout de rota (resetar se não chegar em 10 segundos)
-        bot.ia_tempo_inicio_rota = pygame.time.get_ticks()
-
-        # Detecção de bloqueio (forçando movimento sem conseguir)
-        bot.ia_bloqueado_contador = 0
-
-        # Contador de tentativas de escape (para detectar loop)
-        bot.ia_tentativas_escape = 0
-
-        # Modo escape (quando está tentando sair de onde está preso)
-        bot.ia_modo_escape = False
-        bot.ia_escape_tempo_fim = 0
-
-        # Rota do devmode
-        bot.ia_rota_idx = None
-
-        # Flags de ação
-        bot.bot_defusando = False
-        bot.bot_plantando = False
-
-        # Movimento suavizado
-        bot.ia_vel_x = 0
-        bot.ia_vel_y = 0
-        bot.ia_dir_x = 0
-        bot.ia_dir_y = 0
-
-        # Combate
-        bot.ia_alvo_inimigo = None
-        bot.ia_dist_inimigo = float('inf')
-
-    def _atualizar_bots(self):
-        """
-        Loop principal de atualização da IA dos bots.
-
-        Executa a máquina de estados para cada bot vivo.
-        """
-        import math
-        tempo_atual = pygame.time.get_ticks()
-
-        for bot in self.bots_locais[:]:
-            # Bot morreu - pular
-            if bot.vidas <= 0:
-                continue
-
-            # Inicializar IA se necessário
-            if not hasattr(bot, 'ia_estado'):
-                self._ia_inicializar_bot(bot)
-
-            bot_time = getattr(bot, 'time', None)
-
-            # === FASE DE COMPRA (estado especial) ===
-            if self.em_tempo_compra:
-                bot.ia_estado = 'spawn'
-                bot.estado = 'comprando'  # Compatibilidade
-                if not getattr(bot, 'ja_comprou', False):
-                    self._bot_comprar_arma(bot)
-                    bot.ja_comprou = True
-                continue
-
-            # === TIMEOUT DE SEGURANÇA - TELEPORT SE PRESO POR MUITO TEMPO ===
-            # Se o bot está tentando escapar há mais de 5 segundos, teleportar para ponto seguro
-            # IGNORAR se o bot está defusando a bomba
-            if getattr(bot, 'bot_defusando', False):
-                bot.ia_tempo_preso_total = 0
-                bot.ia_tentativas_escape = 0
-
-            tempo_preso_total = getattr(bot, 'ia_tempo_preso_total', 0)
-            if getattr(bot, 'ia_tentativas_escape', 0) > 0 and not getattr(bot, 'bot_defusando', False):
-                bot.ia_tempo_preso_total = tempo_preso_total + 16  # ~16ms por frame
-                if bot.ia_tempo_preso_total > 5000:  # 5 segundos preso
-                    # Encontrar ponto seguro em uma rota
-                    rotas_time = self.dev_rotas_t if bot.time == 'T' else self.dev_rotas_q
-                    if rotas_time and len(rotas_time) > 0:
-                        import random
-                        rota = random.choice(rotas_time)
-                        if rota and len(rota) > 0:
-                            ponto = random.choice(rota)
-                            bot.x = ponto[0]
-                            bot.y = ponto[1]
-                            print(f"[IA] {bot.nome} TELEPORTADO para rota (preso por 5s+)")
-                    # Resetar tudo
-                    bot.ia_tempo_preso_total = 0
-                    bot.ia_tentativas_escape = 0
-                    bot.ia_bloqueado_contador = 0
-                    bot.ia_modo_escape = False
-                    bot.ia_tempo_parado = tempo_atual
-                    bot.ia_pos_parado = (bot.x, bot.y)
-                    continue
-            else:
-                bot.ia_tempo_preso_total = 0
-
-            # === MODO ESCAPE - PRIORIDADE MÁXIMA ===
-            # Se bot está em modo escape, ignorar TODAS outras lógicas e seguir para a rota
-            # EXCEÇÃO: Time Q quando bomba plantada precisa ir defusar (prioridade ainda maior)
-            if getattr(bot, 'ia_modo_escape', False):
-                # Desativar escape se precisa defusar bomba
-                if bot.time == 'Q' and self.bomba_plantada and not self.bomba_defusada:
-                    bot.ia_modo_escape = False
-                # Verificar se o modo escape expirou
-                elif tempo_atual > getattr(bot, 'ia_escape_tempo_fim', 0):
-                    bot.ia_modo_escape = False
-                elif bot.ia_caminho and bot.ia_waypoint_atual < len(bot.ia_caminho):
-                    # Seguir waypoint de escape - PRIORIDADE ABSOLUTA
-                    self._ia_seguir_waypoints(bot, tempo_atual)
-                    continue  # Pular TODAS outras lógicas
-                else:
-                    # Chegou ao destino, desativar modo escape
-                    bot.ia_modo_escape = False
-                    bot.ia_tentativas_escape = 0  # Resetar contador
-
-            # === TRANSIÇÃO DE SPAWN PARA PATRULHANDO ===
-            if bot.ia_estado == 'spawn':
-                bot.ia_estado = 'patrulhando'
-                # Resetar flags que podem estar travando o bot
-                bot.bot_defusando = False
-                bot.bot_plantando = False
-                bot.ia_modo_escape = False
-                bot.ia_tentativas_escape = 0
-                bot.ia_bloqueado_contador = 0
-                bot.ia_rota_idx = None  # Forçar escolha de nova rota
-                bot.ia_caminho = []
-                bot.ia_waypoint_atual = 0
-                bot.ia_tempo_parado = tempo_atual
-                bot.ia_pos_parado = (bot.x, bot.y)
-                # Encontrar tile 322 mais próximo como alvo inicial
-                bot.ia_tile_alvo = self._encontrar_tile_322_mais_proximo(bot)
-                print(f"[IA] {bot.nome} saiu do spawn, iniciando patrulha")
-
-            # === STUCK DETECTION ===
-            # Ignorar stuck detection se o bot está defusando
-            if not getattr(bot, 'bot_defusando', False):
-                if self._ia_verificar_stuck(bot, tempo_atual):
-                    bot.ia_estado = 'stuck'
-                    self._ia_recuperar_stuck(bot, tempo_atual)
-
-            # === DETECÇÃO DE INIMIGOS ===
-            inimigo_visivel, dist_inimigo = self._ia_detectar_inimigo(bot, bot_time)
-            bot.ia_alvo_inimigo = inimigo_visivel
-            bot.ia_dist_inimigo = dist_inimigo
-            bot.alvo_inimigo = inimigo_visivel  # Compatibilidade
-
-            # === MÁQUINA DE ESTADOS ===
-            if bot.ia_estado == 'stuck':
-                # Estado temporário, já tratado acima
-                bot.ia_estado = 'recalculando_rota'
-
-            # === BOT ESTÁ DEFUSANDO BOMBA (PRIORIDADE MÁXIMA) ===
-            elif getattr(bot, 'bot_defusando', False):
-                # Bot fica parado defusando - não fazer nada mais
-                # O defuse é processado em _processar_bomba
-                pass
-
-            # === BOT ESTÁ PLANTANDO BOMBA ===
-            elif getattr(bot, 'bot_plantando', False):
-                # Se inimigo se aproximou muito (< 150 pixels), cancelar plantio
-                if inimigo_visivel and dist_inimigo < 150:
-                    bot.bot_plantando = False
-                    bot.ia_estado = 'atacando'
-                    print(f"[BOMBA] {bot.nome} cancelou plantio - inimigo detectado!")
-                    self._ia_estado_atacando(bot, tempo_atual)
-                else:
-                    # Continuar plantando (bot não se move)
-                    self._bot_plantar_bomba(bot)
-
-            elif inimigo_visivel and dist_inimigo < self.IA_DISTANCIA_VISAO:
-                # EXCEÇÃO: Time Q com bomba plantada prioriza defuse sobre ataque
-                # A menos que o inimigo esteja MUITO perto (< 100 pixels)
-                if bot.time == 'Q' and self.bomba_plantada and not self.bomba_defusada and dist_inimigo > 100:
-                    # Ir defusar ao invés de atacar
-                    bot.ia_estado = 'patrulhando'
-                    self._ia_estado_patrulhando(bot, tempo_atual)
-                else:
-                    # Inimigo visível - entrar em combate
-                    bot.ia_estado = 'atacando'
-                    bot.estado = 'atacando'  # Compatibilidade
-                    self._ia_estado_atacando(bot, tempo_atual)
-
-            elif bot.ia_estado == 'recalculando_rota':
-                # Recalcular caminho
-                self._ia_estado_recalculando(bot, tempo_atual)
-
-            elif bot.ia_estado in ['patrulhando', 'movendo']:
-                # Sem inimigo - patrulhar até tile 322
-                bot.estado = 'patrulhando'  # Compatibilidade
-                self._ia_estado_patrulhando(bot, tempo_atual)
-
-            elif bot.ia_estado == 'atacando':
-                # Estava atacando mas perdeu o alvo
-                bot.ia_estado = 'patrulhando'
-
-            # === ATIRAR SE EM COMBATE ===
-            if inimigo_visivel and dist_inimigo < self.IA_DISTANCIA_TIRO:
-                bot_cx = bot.x + TAMANHO_MULTIPLAYER // 2
-                bot_cy = bot.y + TAMANHO_MULTIPLAYER // 2
-                alvo_cx = inimigo_visivel.x + TAMANHO_MULTIPLAYER // 2
-                alvo_cy = inimigo_visivel.y + TAMANHO_MULTIPLAYER // 2
-
-                if self._tem_linha_de_visao(bot_cx, bot_cy, alvo_cx, alvo_cy):
-                    self._bot_atirar(bot, inimigo_visivel, tempo_atual)
-
-    def _ia_detectar_inimigo(self, bot, bot_time):
-        """
-        Detecta o inimigo visível mais próximo.
-
-        Args:
-            bot: Bot que está procurando
-            bot_time: Time do bot
-
-        Returns:
-            Tupla (inimigo, distancia) ou (None, inf)
-        """
-        inimigo_visivel = None
-        menor_distancia = float('inf')
-
-        # Verificar jogador (se for do time oposto e não invisível)
-        jogador_invisivel = getattr(self.jogador, 'invisivel', False)
-        if self.jogador.vidas > 0 and self.time_jogador != bot_time and not jogador_invisivel:
-            pode_ver, dist = self._pode_ver_inimigo(bot, self.jogador)
-            if pode_ver and dist < menor_distancia:
-                menor_distancia = dist
-                inimigo_visivel = self.jogador
-
-        # Verificar outros bots (do time oposto)
-        for outro_bot in self.bots_locais:
-            if outro_bot == bot or outro_bot.vidas <= 0:
-                continue
-            outro_time = getattr(outro_bot, 'time', None)
-            if outro_time == bot_time:
-                continue
-
-            pode_ver, dist = self._pode_ver_inimigo(bot, outro_bot)
-            if pode_ver and dist < menor_distancia:
-                menor_distancia = dist
-                inimigo_visivel = outro_bot
-
-        return inimigo_visivel, menor_distancia
-
-    # ==================== ESTADOS DA IA ====================
-
-    def _ia_estado_patrulhando(self, bot, tempo_atual):
-        """
-        Estado PATRULHANDO: Bot segue as rotas desenhadas no DEV MODE.
-
-        Comportamento:
-        1. Se há rotas desenhadas para o time do bot, escolher uma e seguir
-        2. Se não há rotas, usar navegação simples para tile 322
-        3. Ao terminar rota, escolher outra
-        """
-        import math
-        import random
-
-        # === DESATIVAR ESCAPE SE PRECISA DEFUSAR (prioridade máxima) ===
-        if bot.time == 'Q' and self.bomba_plantada and not self.bomba_defusada:
-            bot.ia_modo_escape = False
-
-        # === TIME Q: PRIORIDADE DEFUSE SE BOMBA PLANTADA ===
-        if bot.time == 'Q' and self.bomba_plantada and not self.bomba_defusada:
-            # Bot do time Q vai correndo para a bomba para defusar
-            if self.bomba_posicao:
-                dist_bomba = math.sqrt((bot.x - self.bomba_posicao[0])**2 +
-                                       (bot.y - self.bomba_posicao[1])**2)
-
-                # Se está perto da bomba, começar a defusar
-                if dist_bomba < 30:
-                    # Marcar que está defusando (para visual)
-                    bot.bot_defusando = True
-                    # Bot fica parado defusando
-                    return
-                else:
-                    # Verificar posições da bomba e do bot em relação aos sites
-                    bomba_no_site_A = False
-                    bomba_no_site_B = False
-                    bot_perto_site_B = False
-
-                    if hasattr(self, 'bombsites') and len(self.bombsites) >= 2:
-                        # Distância da bomba até cada site
-                        dist_bomba_site_A = math.sqrt((self.bomba_posicao[0] - self.bombsites[0][0])**2 +
-                                                      (self.bomba_posicao[1] - self.bombsites[0][1])**2)
-                        dist_bomba_site_B = math.sqrt((self.bomba_posicao[0] - self.bombsites[1][0])**2 +
-                                                      (self.bomba_posicao[1] - self.bombsites[1][1])**2)
-
-                        # Distância do bot até cada site
-                        dist_bot_site_B = math.sqrt((bot.x - self.bombsites[1][0])**2 +
-                                                    (bot.y - self.bombsites[1][1])**2)
-
-                        bomba_no_site_A = dist_bomba_site_A < 150
-                        bomba_no_site_B = dist_bomba_site_B < 150
-                        bot_perto_site_B = dist_bot_site_B < 200  # Bot está perto do site B
-
-                    # CASO 1: Bomba no site A e bot perto do site B -> usar rota q10 (índice 9)
-                    if bomba_no_site_A and bot_perto_site_B and dist_bomba > 200 and len(self.dev_rotas_q) >= 10:
-                        if not hasattr(bot, 'ia_rota_idx') or bot.ia_rota_idx != 9 or not bot.ia_caminho:
-                            bot.ia_rota_idx = 3
-                            bot.ia_caminho = list(self.dev_rotas_q[3])
-                            bot.ia_waypoint_atual = 0
-                            bot.ia_tempo_inicio_rota = tempo_atual
-                            print(f"[IA] {bot.nome} priorizando rota Q10 (bot no B, bomba no A)")
-
-                        if bot.ia_caminho and bot.ia_waypoint_atual < len(bot.ia_caminho):
-                            self._ia_seguir_waypoints(bot, tempo_atual)
-                            return
-
-                    # CASO 2: Bomba no site B e bot longe -> usar rota q6 (índice 5)
-                    elif bomba_no_site_B and dist_bomba > 200 and len(self.dev_rotas_q) >= 6:
-                        if not hasattr(bot, 'ia_rota_idx') or bot.ia_rota_idx != 5 or not bot.ia_caminho:
-                            bot.ia_rota_idx = 5
-                            bot.ia_caminho = list(self.dev_rotas_q[5])
-                            bot.ia_waypoint_atual = 0
-                            bot.ia_tempo_inicio_rota = tempo_atual
-                            print(f"[IA] {bot.nome} priorizando rota Q6 para bomba no site B")
-
-                        if bot.ia_caminho and bot.ia_waypoint_atual < len(bot.ia_caminho):
-                            self._ia_seguir_waypoints(bot, tempo_atual)
-                            return
-
-                    # Ir direto para a bomba (quando perto ou sem rota especial)
-                    bot.bot_defusando = False
-                    self._ia_mover_direto(bot, self.bomba_posicao)
-                    return
-
-        # === TIME T: PEGAR BOMBA DROPADA ===
-        if bot.time == 'T' and self.bomba_dropada and self.bomba_drop_posicao:
-            # Bot do time T vai correndo para pegar a bomba
-            dist_bomba = math.sqrt((bot.x - self.bomba_drop_posicao[0])**2 +
-                                   (bot.y - self.bomba_drop_posicao[1])**2)
-
-            # Ir direto para a bomba
-            if dist_bomba > 25:
-                self._ia_mover_direto(bot, self.bomba_drop_posicao)
-                return
-
-        # === TIME T: GUARDAR BOMBA PLANTADA ===
-        if bot.time == 'T' and self.bomba_plantada and not self.bomba_defusada:
-            if self.bomba_posicao:
-                dist_bomba = math.sqrt((bot.x - self.bomba_posicao[0])**2 +
-                                       (bot.y - self.bomba_posicao[1])**2)
-
-                # Se está perto da bomba (< 150 pixels), ficar guardando
-                if dist_bomba < 150:
-                    # Ficar na região, não se distanciar
-                    # Apenas se movimenta levemente para não ficar totalmente parado
-                    if not hasattr(bot, 'ia_tempo_guard') or tempo_atual - bot.ia_tempo_guard > 2000:
-                        # A cada 2 segundos, escolher uma posição próxima da bomba
-                        angulo = random.uniform(0, 2 * math.pi)
-                        raio = random.uniform(30, 100)
-                        novo_x = self.bomba_posicao[0] + math.cos(angulo) * raio
-                        novo_y = self.bomba_posicao[1] + math.sin(angulo) * raio
-                        bot.ia_pos_guard = (novo_x, novo_y)
-                        bot.ia_tempo_guard = tempo_atual
-
-                    # Mover para posição de guarda
-                    if hasattr(bot, 'ia_pos_guard'):
-                        self._ia_mover_direto(bot, bot.ia_pos_guard)
-                    return
-
-        # === DETECÇÃO DE BOT PARADO POR 2 SEGUNDOS ===
-        # Ignorar se o bot está defusando a bomba (deve ficar parado)
-        if getattr(bot, 'bot_defusando', False):
-            bot.ia_tempo_parado = tempo_atual
-            bot.ia_pos_parado = (bot.x, bot.y)
-        else:
-            dist_desde_parado = math.sqrt((bot.x - bot.ia_pos_parado[0])**2 +
-                                          (bot.y - bot.ia_pos_parado[1])**2)
-
-            # Se moveu mais de 15 pixels, resetar tempo parado e contador de escape
-            if dist_desde_parado > 15:
-                bot.ia_pos_parado = (bot.x, bot.y)
-                bot.ia_tempo_parado = tempo_atual
-                bot.ia_tentativas_escape = 0  # Resetar contador quando consegue se mover
-            elif bot.ia_tempo_parado > 0 and tempo_atual - bot.ia_tempo_parado > 2000:
-                # Se não moveu por 2 segundos, tentar escapar
-                bot.ia_tempo_parado = tempo_atual
-                bot.ia_pos_parado = (bot.x, bot.y)
-                bot.ia_tentativas_escape = getattr(bot, 'ia_tentativas_escape', 0) + 1
-
-                # Se está em loop (mais de 3 tentativas), fazer wandering
-                if bot.ia_tentativas_escape > 3:
-                    self._ia_wandering_aleatorio(bot, tempo_atual)
-                    return
-
-                # Procurar ponto de rota mais próximo (busca até 500 pixels)
-                ponto_proximo, rota_idx, waypoint_idx = self._encontrar_ponto_rota_acessivel(bot, dist_maxima=500, retornar_info_rota=True)
-
-                if ponto_proximo:
-                    # Verificar distância real do ponto
-                    dist_ponto = math.sqrt((bot.x - ponto_proximo[0])**2 + (bot.y - ponto_proximo[1])**2)
-
-                    # Se o ponto está longe (> 150px), fazer wandering ao invés de ir para rota
-                    if dist_ponto > 150:
-                        print(f"[IA] {bot.nome} parado por 2s, ponto de rota longe ({dist_ponto:.0f}px), movimento livre")
-                        self._ia_wandering_aleatorio(bot, tempo_atual)
-                        return
-
-                    # Pegar rotas do time do bot
-                    rotas_time = self.dev_rotas_t if bot.time == 'T' else self.dev_rotas_q
-
-                    # === RESETAR TODOS OS CONTADORES DE BLOQUEIO ===
-                    bot.ia_bloqueado_contador = 0
-                    bot.ia_tentativas_escape = 0
-                    bot.ia_tempo_parado = tempo_atual
-                    bot.ia_pos_parado = (bot.x, bot.y)
-
-                    # Configurar para seguir a rota a partir do waypoint encontrado
-                    bot.ia_rota_idx = rota_idx
-                    bot.ia_caminho = list(rotas_time[rota_idx][waypoint_idx:])  # Rota a partir do waypoint
-                    bot.ia_waypoint_atual = 0
-                    bot.ia_tempo_inicio_rota = tempo_atual
-                    # Ativar modo escape por 2 segundos
-                    bot.ia_modo_escape = True
-                    bot.ia_escape_tempo_fim = tempo_atual + 2000
-                    print(f"[IA] {bot.nome} parado por 2s, entrando na rota {rota_idx+1} no waypoint {waypoint_idx+1} ({dist_ponto:.0f}px)")
-                    return
-                else:
-                    # Nenhum ponto acessível, fazer wandering
-                    self._ia_wandering_aleatorio(bot, tempo_atual)
-                    return
-
-        # === TIMEOUT DE ROTA (10 SEGUNDOS) ===
-        # Ignorar timeout se o bot está defusando a bomba
-        if not getattr(bot, 'bot_defusando', False):
-            if hasattr(bot, 'ia_tempo_inicio_rota') and bot.ia_caminho:
-                if tempo_atual - bot.ia_tempo_inicio_rota > 10000:
-                    # Resetar rota e caminho para forçar escolha de novo destino
-                    bot.ia_rota_idx = None
-                    bot.ia_caminho = []
-                    bot.ia_waypoint_atual = 0
-                    bot.ia_tile_alvo = None
-                    bot.ia_tempo_inicio_rota = tempo_atual
-                    bot.ia_tempo_parado = tempo_atual
-                    bot.ia_pos_parado = (bot.x, bot.y)
-                    print(f"[IA] {bot.nome} não chegou em 10s, escolhendo nova rota")
-
-        # === DETECÇÃO DE BLOQUEIO (forçando movimento sem conseguir) ===
-        # Ignorar se o bot está defusando a bomba
-        if getattr(bot, 'bot_defusando', False):
-            bot.ia_bloqueado_contador = 0
-        elif getattr(bot, 'ia_bloqueado_contador', 0) >= 30:  # ~0.5 segundo bloqueado
-            bot.ia_bloqueado_contador = 0
-            bot.ia_tentativas_escape = getattr(bot, 'ia_tentativas_escape', 0) + 1
-
-            # Se está em loop (mais de 3 tentativas), fazer wandering
-            if bot.ia_tentativas_escape > 3:
-                self._ia_wandering_aleatorio(bot, tempo_atual)
-                return
-
-            # Procurar ponto de rota mais próximo acessível (busca até 500 pixels)
-            ponto_proximo, rota_idx, waypoint_idx = self._encontrar_ponto_rota_acessivel(bot, dist_maxima=500, retornar_info_rota=True)
-
-            if ponto_proximo:
-                # Verificar distância real do ponto
-                dist_ponto = math.sqrt((bot.x - ponto_proximo[0])**2 + (bot.y - ponto_proximo[1])**2)
-
-                # Se o ponto está longe (> 150px), fazer wandering ao invés de ir para rota
-                if dist_ponto > 150:
-                    print(f"[IA] {bot.nome} bloqueado, ponto de rota longe ({dist_ponto:.0f}px), movimento livre")
-                    self._ia_wandering_aleatorio(bot, tempo_atual)
-                    return
-
-                # Pegar rotas do time do bot
-                rotas_time = self.dev_rotas_t if bot.time == 'T' else self.dev_rotas_q
-
-                # === RESETAR TODOS OS CONTADORES DE BLOQUEIO ===
-                bot.ia_bloqueado_contador = 0
-                bot.ia_tentativas_escape = 0
-                bot.ia_tempo_parado = tempo_atual
-                bot.ia_pos_parado = (bot.x, bot.y)
-
-                # Configurar para seguir a rota a partir do waypoint encontrado
-                bot.ia_rota_idx = rota_idx
-                bot.ia_caminho = list(rotas_time[rota_idx][waypoint_idx:])  # Rota a partir do waypoint
-                bot.ia_waypoint_atual = 0
-                bot.ia_tempo_inicio_rota = tempo_atual
-                # Ativar modo escape por 2 segundos
-                bot.ia_modo_escape = True
-                bot.ia_escape_tempo_fim = tempo_atual + 2000
-                print(f"[IA] {bot.nome} bloqueado, entrando na rota {rota_idx+1} no waypoint {waypoint_idx+1} ({dist_ponto:.0f}px)")
-                return
-            else:
-                # Nenhum ponto próximo acessível, fazer wandering
-                self._ia_wandering_aleatorio(bot, tempo_atual)
-                return
-
-        # === SELECIONAR ROTAS DO TIME DO BOT ===
-        if hasattr(bot, 'time') and bot.time == 'T':
-            rotas_time = self.dev_rotas_t
-        else:
-            rotas_time = self.dev_rotas_q
-
-        # === USAR ROTAS DESENHADAS NO DEV MODE ===
-        if rotas_time and len(rotas_time) > 0:
-            # Se não tem rota atribuída, escolher uma
-            if not hasattr(bot, 'ia_rota_idx') or bot.ia_rota_idx is None:
-                # BOMBER: só escolhe rota 1 ou 2 (índices 0 ou 1)
-                if getattr(bot, 'é_bomber', False) and len(rotas_time) >= 2:
-                    bot.ia_rota_idx = random.randint(0, 1)  # Apenas rotas 1 ou 2
-                    print(f"[IA] {bot.nome} (BOMBER) seguindo rota {bot.ia_rota_idx + 1}")
-                else:
-                    bot.ia_rota_idx = random.randint(0, len(rotas_time) - 1)
-                    print(f"[IA] {bot.nome} (Time {bot.time}) seguindo rota {bot.ia_rota_idx + 1}")
-                bot.ia_caminho = list(rotas_time[bot.ia_rota_idx])
-                bot.ia_waypoint_atual = 0
-                bot.ia_tempo_inicio_rota = tempo_atual  # Resetar timer de rota
-
-            # Se caminho acabou, escolher nova rota
-            if not bot.ia_caminho or bot.ia_waypoint_atual >= len(bot.ia_caminho):
-                # BOMBER: só escolhe rota 1 ou 2
-                if getattr(bot, 'é_bomber', False) and len(rotas_time) >= 2:
-                    rotas_disponiveis = [0, 1]
-                else:
-                    rotas_disponiveis = list(range(len(rotas_time)))
-                if len(rotas_disponiveis) > 1 and bot.ia_rota_idx in rotas_disponiveis:
-                    rotas_disponiveis.remove(bot.ia_rota_idx)
-                bot.ia_rota_idx = random.choice(rotas_disponiveis)
-                bot.ia_caminho = list(rotas_time[bot.ia_rota_idx])
-                bot.ia_waypoint_atual = 0
-                bot.ia_tempo_inicio_rota = tempo_atual  # Resetar timer de rota
-
-            # === BOMBER: Verificar se está perto do tile 322 para plantar ===
-            if getattr(bot, 'é_bomber', False) and not self.bomba_plantada:
-                tile_322_pos = self._encontrar_tile_322_mais_proximo(bot)
-                if tile_322_pos:
-                    dist_bombsite = math.sqrt((bot.x - tile_322_pos[0])**2 + (bot.y - tile_322_pos[1])**2)
-
-                    # Se está perto do bombsite (< 100 pixels)
-                    if dist_bombsite < 100:
-                        # Verificar se há inimigos muito perto (< 200 pixels)
-                        inimigo_perto = False
-                        for inimigo in self.bots_locais:
-                            if inimigo.vidas <= 0 or getattr(inimigo, 'time', '') == bot.time:
-                                continue
-                            dist_inimigo = math.sqrt((bot.x - inimigo.x)**2 + (bot.y - inimigo.y)**2)
-                            if dist_inimigo < 200:
-                                inimigo_perto = True
-                                break
-
-                        # Verificar jogador também se for do time oposto
-                        if self.time_jogador != bot.time and self.jogador.vidas > 0:
-                            dist_jogador = math.sqrt((bot.x - self.jogador.x)**2 + (bot.y - self.jogador.y)**2)
-                            if dist_jogador < 200:
-                                inimigo_perto = True
-
-                        # Se não há inimigos perto, ir para o tile 322 e plantar
-                        if not inimigo_perto:
-                            # Salvar posição do tile 322 para plantar exatamente lá
-                            bot.tile_322_alvo = tile_322_pos
-
-                            # Se está em cima do tile 322 (< 10 pixels), começar a plantar
-                            if dist_bombsite < 10:
-                                self._bot_plantar_bomba(bot, tile_322_pos)
-                                return
-                            else:
-                                # Mover para exatamente em cima do tile 322
-                                self._ia_mover_direto(bot, tile_322_pos)
-                                return
-
-            # Seguir waypoints da rota
-            self._ia_seguir_waypoints(bot, tempo_atual)
-            return
-
-        # === FALLBACK: NAVEGAÇÃO PARA TILE 322 (se não há rotas desenhadas) ===
-        if not bot.ia_tile_alvo:
-            bot.ia_tile_alvo = self._encontrar_tile_322_mais_proximo(bot)
-            if not bot.ia_tile_alvo:
-                return
-
-        if not bot.ia_caminho or bot.ia_waypoint_atual >= len(bot.ia_caminho):
-            if tempo_atual - bot.ia_ultimo_recalculo < self.IA_RECALC_INTERVALO:
-                self._ia_mover_direto(bot, bot.ia_tile_alvo)
-                return
-
-            caminho = self._criar_caminho_simples((bot.x, bot.y), bot.ia_tile_alvo)
-            if caminho:
-                bot.ia_caminho = caminho
-                bot.ia_waypoint_atual = 0
-                bot.ia_ultimo_recalculo = tempo_atual
-                bot.ia_estado = 'movendo'
-            else:
-                bot.ia_tile_alvo = self._escolher_outro_tile_322(bot, bot.ia_tile_alvo)
-                bot.ia_ultimo_recalculo = tempo_atual
-                return
-
-        self._ia_seguir_waypoints(bot, tempo_atual)
-
-        if bot.ia_tile_alvo:
-            dist_alvo = math.sqrt(
-                (bot.x - bot.ia_tile_alvo[0])**2 +
-                (bot.y - bot.ia_tile_alvo[1])**2
-            )
-            if dist_alvo < 50:
-                bot.ia_tile_alvo = self._escolher_outro_tile_322(bot, bot.ia_tile_alvo)
-                bot.ia_caminho = []
-                bot.ia_waypoint_atual = 0
-
-    def _ia_estado_atacando(self, bot, tempo_atual):
-        """
-        Estado ATACANDO: Bot viu um inimigo e está em combate.
-
-        Comportamento:
-        1. Parar avanço ao tile 322
-        2. Movimento de combate (strafe)
-        3. Usar habilidade de classe (se disponível)
-        4. Atirar (feito no loop principal)
-        5. Retornar a patrulhar se perder o alvo
-        """
-        if not bot.ia_alvo_inimigo:
-            bot.ia_estado = 'patrulhando'
-            return
-
-        # Tentar usar habilidade de classe (chance aleatória durante combate)
-        self._bot_tentar_usar_habilidade(bot, tempo_atual)
-
-        # Movimento de combate
-        self._ia_mover_combate(bot, tempo_atual)
-
-    def _bot_tentar_usar_habilidade(self, bot, tempo_atual):
-        """
-        Tenta usar a habilidade de classe do bot durante combate.
-        Uso aleatório baseado em cooldown e situação.
-        """
-        from src.game.selecao_classes import obter_dados_classe
-        import math
-
-        classe = getattr(bot, 'classe', None)
-        if not classe:
-            return
-
-        dados = obter_dados_classe(classe, bot.time)
-        if not dados:
-            return
-
-        cooldown = dados.get('habilidade_cooldown', 0)
-        if cooldown == 0:
-            return  # Classe sem habilidade ativa (purple, metralhadora passiva)
-
-        # Verificar cooldown
-        if tempo_atual - bot.habilidade_cooldown < cooldown:
-            return
-
-        # Chance de usar habilidade baseada na classe e situação
-        chance_uso = 0.03  # Base: 3% por frame
-
-        if classe == 'mago':
-            # Mago usa escudo quando está com pouca vida ou inimigo perto
-            if bot.vidas <= bot.vidas_max * 0.6:
-                chance_uso = 0.20  # 20% quando com pouca vida
-            elif bot.ia_dist_inimigo < 100:
-                chance_uso = 0.15  # 15% quando inimigo perto
-            else:
-                chance_uso = 0.08
-        elif classe == 'granada':
-            # Granada usa frequentemente em combate
-            chance_uso = 0.10  # 10% por frame
-        elif classe == 'ghost':
-            # Ghost usa quando está em perigo
-            if bot.vidas <= bot.vidas_max * 0.5:
-                chance_uso = 0.15
-            else:
-                chance_uso = 0.05
-        elif classe == 'explosive':
-            chance_uso = 0.06
-        elif classe == 'cyan':
-            chance_uso = 0.05
-        elif classe == 'normal':
-            chance_uso = 0.08
-
-        if random.random() > chance_uso:
-            return
-
-        # ====== USAR HABILIDADE BASEADA NA CLASSE ======
-
-        # === MAGO - ESCUDO PROTETOR ===
-        if classe == 'mago':
-            bot.escudo_ativo = True
-            bot.invulneravel = True
-            bot.habilidade_ativa = True
-            bot.habilidade_tempo_inicio = tempo_atual
-            bot.habilidade_cooldown = tempo_atual
-            print(f"[BOT IA] {bot.nome} (Mago) ativou ESCUDO!")
-
-        # === GHOST - INVISIBILIDADE ===
-        elif classe == 'ghost':
-            bot.invisivel = True
-            bot.habilidade_ativa = True
-            bot.habilidade_tempo_inicio = tempo_atual
-            bot.habilidade_cooldown = tempo_atual
-            print(f"[BOT IA] {bot.nome} (Ghost) ficou INVISÍVEL!")
-
-        # === GRANADA - LANÇAR GRANADA ===
-        elif classe == 'granada':
-            self._bot_lancar_granada_classe(bot, tempo_atual)
-            bot.habilidade_cooldown = tempo_atual
-            print(f"[BOT IA] {bot.nome} (Granada) lançou GRANADA!")
-
-        # === CYAN - TURBO VELOCIDADE ===
-        elif classe == 'cyan':
-            bot.velocidade_original = bot.velocidade
-            bot.velocidade = bot.velocidade * 4.0
-            bot.habilidade_ativa = True
-            bot.habilidade_tempo_inicio = tempo_atual
-            bot.habilidade_cooldown = tempo_atual
-            bot.posicoes_turbo = []
-            print(f"[BOT IA] {bot.nome} (Cyan) ativou TURBO!")
-
-        # === EXPLOSIVE - EXPLOSÃO DE TIROS ===
-        elif classe == 'explosive':
-            self._bot_explosao_tiros(bot, tempo_atual)
-            bot.habilidade_cooldown = tempo_atual
-            print(f"[BOT IA] {bot.nome} (Explosive) usou EXPLOSÃO!")
-
-        # === NORMAL - DASH ===
-        elif classe == 'normal':
-            # Dash na direção do inimigo ou oposta (fuga)
-            if bot.ia_alvo_inimigo:
-                dx = bot.ia_alvo_inimigo.x - bot.x
-                dy = bot.ia_alvo_inimigo.y - bot.y
-                dist = math.sqrt(dx**2 + dy**2)
-                if dist > 0:
-                    # 50% chance de ir em direção ao inimigo, 50% fugir
-                    mult = 1 if random.random() > 0.5 else -1
-                    bot.dash_direcao = (mult * dx / dist, mult * dy / dist)
-                    bot.dash_ativo = True
-                    bot.dash_frames_restantes = dados.get('dash_duracao', 8)
-                    bot.invulneravel = True
-                    bot.habilidade_ativa = True
-                    bot.habilidade_tempo_inicio = tempo_atual
-                    bot.habilidade_cooldown = tempo_atual
-                    print(f"[BOT IA] {bot.nome} (Normal) usou DASH!")
-
-    def _bot_lancar_granada_classe(self, bot, tempo_atual):
-        """Bot lança granada da habilidade de classe."""
-        from src.items.granada import Granada
-        import math
-
-        if not bot.ia_alvo_inimigo:
-            return
-
-        centro_x = bot.x + TAMANHO_MULTIPLAYER / 2
-        centro_y = bot.y + TAMANHO_MULTIPLAYER / 2
-
-        # Direção para o inimigo
-        alvo_x = bot.ia_alvo_inimigo.x + TAMANHO_MULTIPLAYER / 2
-        alvo_y = bot.ia_alvo_inimigo.y + TAMANHO_MULTIPLAYER / 2
-
-        dx = alvo_x - centro_x
-        dy = alvo_y - centro_y
-        dist = math.sqrt(dx**2 + dy**2)
-
-        if dist > 0:
-            dx /= dist
-            dy /= dist
-
-        granada = Granada(centro_x, centro_y, dx, dy)
-        granada.time = bot.time  # Marcar time da granada
-        self.granadas_ativas.append(granada)
-
-    def _bot_explosao_tiros(self, bot, tempo_atual):
-        """Bot usa habilidade explosive - tiros em todas direções."""
-        from src.entities.tiro import Tiro
-        from src.game.selecao_classes import obter_dados_classe
-        import math
-
-        dados = obter_dados_classe('explosive', bot.time)
-        num_tiros = dados.get('tiros_explosao', 12) if dados else 12
-
-        centro_x = bot.x + TAMANHO_MULTIPLAYER / 2
-        centro_y = bot.y + TAMANHO_MULTIPLAYER / 2
-
-        for i in range(num_tiros):
-            angulo = (2 * math.pi * i) / num_tiros
-            dx = math.cos(angulo)
-            dy = math.sin(angulo)
-
-            tiro = Tiro(centro_x, centro_y, dx, dy, bot.cor, 8)
-            tiro.dano = 1
-            tiro.time_origem = bot.time
-            self.tiros_inimigo.append(tiro)
-
-    def _atualizar_habilidades_bots(self, tempo_atual):
-        """Atualiza estado das habilidades ativas dos bots."""
-        from src.game.selecao_classes import obter_dados_classe
-
-        for bot in self.bots_locais:
-            if bot.vidas <= 0:
-                continue
-
-            classe = getattr(bot, 'classe', None)
-
-            # ====== NORMAL - ATUALIZAR DASH A CADA FRAME ======
-            # O dash usa frames, não tempo, então precisa ser atualizado independentemente
-            if classe == 'normal' and hasattr(bot, 'dash_ativo') and bot.dash_ativo:
-                if bot.dash_frames_restantes > 0:
-                    # Mover na direção do dash com colisão
-                    dx, dy = bot.dash_direcao
-                    vel_x = dx * bot.dash_velocidade
-                    vel_y = dy * bot.dash_velocidade
-
-                    # Usar rect com tamanho multiplayer para colisões
-                    rect_colisao = pygame.Rect(bot.x, bot.y, TAMANHO_MULTIPLAYER, TAMANHO_MULTIPLAYER)
-
-                    # Resolver colisão com o mapa
-                    novo_x, novo_y, _, _ = self.tilemap.resolver_colisao(rect_colisao, vel_x, vel_y)
-
-                    bot.x = novo_x
-                    bot.y = novo_y
-                    bot.rect.x = novo_x
-                    bot.rect.y = novo_y
-                    bot.dash_frames_restantes -= 1
-                else:
-                    # Dash terminou
-                    bot.dash_ativo = False
-                    bot.invulneravel = False
-                    bot.habilidade_ativa = False
-                continue  # Dash já foi processado, próximo bot
-
-            if not classe or not getattr(bot, 'habilidade_ativa', False):
-                continue
-
-            dados = obter_dados_classe(classe, bot.time)
-            if not dados:
-                continue
-
-            duracao = dados.get('habilidade_duracao', 0)
-            if duracao == 0:
-                continue
-
-            # Verificar se a habilidade expirou
-            if tempo_atual - bot.habilidade_tempo_inicio >= duracao:
-                # Desativar habilidade baseada na classe
-                if classe == 'mago':
-                    bot.escudo_ativo = False
-                    bot.invulneravel = False
-                    bot.habilidade_ativa = False
-                elif classe == 'ghost':
-                    bot.invisivel = False
-                    bot.habilidade_ativa = False
-                elif classe == 'cyan':
-                    bot.velocidade = bot.velocidade_original
-                    bot.habilidade_ativa = False
-                    if hasattr(bot, 'posicoes_turbo'):
-                        bot.posicoes_turbo.clear()
-
-    def _ia_estado_recalculando(self, bot, tempo_atual):
-        """
-        Estado RECALCULANDO_ROTA: Recalcular caminho após obstáculo.
-        """
-        # Limpar caminho atual
-        bot.ia_caminho = []
-        bot.ia_waypoint_atual = 0
-
-        # Forçar recálculo
-        bot.ia_ultimo_recalculo = 0
-        bot.ia_estado = 'patrulhando'
-
-    # ==================== MOVIMENTO POR WAYPOINTS ====================
-
-    def _ia_seguir_waypoints(self, bot, tempo_atual):
-        """
-        Segue o caminho de waypoints calculado pelo A*.
-
-        Args:
-            bot: Bot a mover
-            tempo_atual: Tempo atual em ms
-        """
-        import math
-
-        if not bot.ia_caminho or bot.ia_waypoint_atual >= len(bot.ia_caminho):
-            return
-
-        # Waypoint atual
-        waypoint = bot.ia_caminho[bot.ia_waypoint_atual]
-
-        # Calcular distância ao waypoint
-        dx = waypoint[0] - bot.x
-        dy = waypoint[1] - bot.y
-        dist = math.sqrt(dx**2 + dy**2)
-
-        # Chegou ao waypoint - ir para próximo
-        if dist < self.IA_WAYPOINT_THRESHOLD:
-            bot.ia_waypoint_atual += 1
-            if bot.ia_waypoint_atual >= len(bot.ia_caminho):
-                # Caminho completo
-                bot.ia_caminho = []
-                bot.ia_waypoint_atual = 0
-            return
-
-        # Mover em direção ao waypoint
-        self._ia_mover_suave(bot, waypoint, tempo_atual)
-
-    def _ia_mover_suave(self, bot, destino, tempo_atual):
-        """
-        Move o bot suavemente em direção a um destino.
-
-        Inclui:
-        - Normalização de direção
-        - Suavização (lerp)
-        - Dead zone
-        - Evitar outros bots
-
-        Args:
-            bot: Bot a mover
-            destino: Tupla (x, y) destino
-            tempo_atual: Tempo atual
-        """
-        import math
-
-        # Calcular direção
-        dx = destino[0] - bot.x
-        dy = destino[1] - bot.y
-        dist = math.sqrt(dx**2 + dy**2)
-
-        if dist < 1:
-            return
-
-        # Normalizar
-        dir_x = dx / dist
-        dir_y = dy / dist
-
-        # Evitar paredes à frente
-        centro_x = bot.x + TAMANHO_MULTIPLAYER // 2
-        centro_y = bot.y + TAMANHO_MULTIPLAYER // 2
-        check_dist = 25
-
-        if self.tilemap.is_solid(centro_x + dir_x * check_dist, centro_y + dir_y * check_dist):
-            # Tentar desviar
-            for angulo_off in [30, -30, 60, -60, 90, -90]:
-                rad = math.atan2(dir_y, dir_x) + math.radians(angulo_off)
-                test_x = math.cos(rad)
-                test_y = math.sin(rad)
-                if not self.tilemap.is_solid(centro_x + test_x * check_dist,
-                                              centro_y + test_y * check_dist):
-                    dir_x, dir_y = test_x, test_y
-                    break
-
-        # Evitar outros bots
-        for outro_bot in self.bots_locais:
-            if outro_bot == bot or outro_bot.vidas <= 0:
-                continue
-            bx = bot.x - outro_bot.x
-            by = bot.y - outro_bot.y
-            bd = math.sqrt(bx**2 + by**2)
-            if bd < 40 and bd > 0:
-                dir_x += (bx / bd) * 0.3
-                dir_y += (by / bd) * 0.3
-
-        # Re-normalizar
-        mag = math.sqrt(dir_x**2 + dir_y**2)
-        if mag > 0:
-            dir_x /= mag
-            dir_y /= mag
-
-        # Suavização de direção (lerp) - mais responsivo
-        TAXA_SUAVIZACAO = 0.4
-        bot.ia_dir_x += (dir_x - bot.ia_dir_x) * TAXA_SUAVIZACAO
-        bot.ia_dir_y += (dir_y - bot.ia_dir_y) * TAXA_SUAVIZACAO
-
-        # Re-normalizar após lerp
-        mag = math.sqrt(bot.ia_dir_x**2 + bot.ia_dir_y**2)
-        if mag > 0.1:
-            bot.ia_dir_x /= mag
-            bot.ia_dir_y /= mag
-        else:
-            # Dead zone - direção muito pequena
-            return
-
-        # Calcular velocidade
-        vel_x = bot.ia_dir_x * bot.velocidade
-        vel_y = bot.ia_dir_y * bot.velocidade
-
-        # Suavização de velocidade (mais responsivo)
-        TAXA_VEL = 0.6
-        bot.ia_vel_x += (vel_x - bot.ia_vel_x) * TAXA_VEL
-        bot.ia_vel_y += (vel_y - bot.ia_vel_y) * TAXA_VEL
-
-        # Dead zone para velocidade
-        if abs(bot.ia_vel_x) < 0.1:
-            bot.ia_vel_x = 0
-        if abs(bot.ia_vel_y) < 0.1:
-            bot.ia_vel_y = 0
-
-        # Aplicar movimento com colisão
-        if abs(bot.ia_vel_x) > 0.1 or abs(bot.ia_vel_y) > 0.1:
-            pos_antes_x, pos_antes_y = bot.x, bot.y
-            bot_rect = pygame.Rect(bot.x, bot.y, TAMANHO_MULTIPLAYER, TAMANHO_MULTIPLAYER)
-            novo_x, novo_y, _, _ = self.tilemap.resolver_colisao(
-                bot_rect, bot.ia_vel_x, bot.ia_vel_y
-            )
-            bot.x = novo_x
-            bot.y = novo_y
-
-            # Detectar bloqueio: tentou mover mas não conseguiu
-            movimento_real = math.sqrt((novo_x - pos_antes_x)**2 + (novo_y - pos_antes_y)**2)
-            movimento_esperado = math.sqrt(bot.ia_vel_x**2 + bot.ia_vel_y**2)
-
-            if movimento_esperado > 0.5 and movimento_real < movimento_esperado * 0.2:
-                # Bot está bloqueado - tentando mover mas não consegue
-                bot.ia_bloqueado_contador = getattr(bot, 'ia_bloqueado_contador', 0) + 1
-            else:
-                bot.ia_bloqueado_contador = 0
-
-    def _ia_mover_direto(self, bot, destino):
-        """
-        Move o bot diretamente para um destino (sem pathfinding).
-        Usado como fallback quando não pode recalcular caminho.
-        """
-        import math
-
-        dx = destino[0] - bot.x
-        dy = destino[1] - bot.y
-        dist = math.sqrt(dx**2 + dy**2)
-
-        if dist < 1:
-            return
-
-        dir_x = dx / dist
-        dir_y = dy / dist
-
-        # Movimento simples
-        vel_x = dir_x * bot.velocidade
-        vel_y = dir_y * bot.velocidade
-
-        pos_antes_x, pos_antes_y = bot.x, bot.y
-        bot_rect = pygame.Rect(bot.x, bot.y, TAMANHO_MULTIPLAYER, TAMANHO_MULTIPLAYER)
-        novo_x, novo_y, _, _ = self.tilemap.resolver_colisao(bot_rect, vel_x, vel_y)
-        bot.x = novo_x
-        bot.y = novo_y
-
-        # Detectar bloqueio: tentou mover mas não conseguiu
-        movimento_real = math.sqrt((novo_x - pos_antes_x)**2 + (novo_y - pos_antes_y)**2)
-        movimento_esperado = math.sqrt(vel_x**2 + vel_y**2)
-
-        if movimento_esperado > 0.5 and movimento_real < movimento_esperado * 0.2:
-            # Bot está bloqueado - tentando mover mas não consegue
-            bot.ia_bloqueado_contador = getattr(bot, 'ia_bloqueado_contador', 0) + 1
-        else:
-            bot.ia_bloqueado_contador = 0
-
-    def _encontrar_ponto_rota_acessivel(self, bot, dist_maxima=300, retornar_info_rota=False):
-        """
-        Encontra o ponto de rota do devmode mais próximo que seja acessível
-        (sem paredes no caminho).
-
-        Args:
-            bot: Bot que precisa encontrar um ponto
-            dist_maxima: Distância máxima para procurar
-            retornar_info_rota: Se True, retorna também índice da rota e waypoint
-
-        Returns:
-            Se retornar_info_rota=False: Tupla (x, y) do ponto mais próximo ou None
-            Se retornar_info_rota=True: Tupla (ponto, rota_idx, waypoint_idx) ou (None, None, None)
-        """
-        import math
+        bot.classe = classe_id
+        bot.dados_classe = dados_classe
 
-        # Pegar rotas do time do bot
-        if hasattr(bot, 'time') and bot.time == 'T':
-            rotas = self.dev_rotas_t
-        else:
-            rotas = self.dev_rotas_q
-
-        if not rotas:
-            return (None, None, None) if retornar_info_rota else None
-
-        ponto_mais_proximo = None
-        menor_dist = float('inf')
-        melhor_rota_idx = None
-        melhor_waypoint_idx = None
-
-        centro_x = bot.x + TAMANHO_MULTIPLAYER // 2
-        centro_y = bot.y + TAMANHO_MULTIPLAYER // 2
-
-        for rota_idx, rota in enumerate(rotas):
-            for waypoint_idx, ponto in enumerate(rota):
-                dist_ponto = math.sqrt((bot.x - ponto[0])**2 + (bot.y - ponto[1])**2)
-
-                # Verificar se o ponto está a uma distância razoável
-                if dist_ponto < menor_dist and dist_ponto > 20 and dist_ponto < dist_maxima:
-                    # Verificar se consegue ir direto (sem parede no caminho inteiro)
-                    dir_x = (ponto[0] - bot.x)
-                    dir_y = (ponto[1] - bot.y)
-
-                    # Checar múltiplos pontos ao longo do caminho
-                    caminho_livre = True
-                    num_checks = max(5, int(dist_ponto / 20))  # Check a cada ~20 pixels
-                    for i in range(1, num_checks + 1):
-                        t = i / num_checks
-                        check_x = centro_x + dir_x * t
-                        check_y = centro_y + dir_y * t
-                        if self.tilemap.is_solid(check_x, check_y):
-                            caminho_livre = False
-                            break
+        # Efeitos de classe desenhados (a simulação não usa habilidades nos bots)
+        bot.habilidade_ativa = False
+        bot.escudo_ativo = False
+        bot.invisivel = False
+        bot.posicoes_turbo = []
 
-                    if caminho_livre:
-                        menor_dist = dist_ponto
-                        ponto_mais_proximo = ponto
-                        melhor_rota_idx = rota_idx
-                        melhor_waypoint_idx = waypoint_idx
+        # Mira da arma desenhada
+        bot.is_bot = True
+        bot.alvo_x = x
+        bot.alvo_y = y
+        bot.alvo_inimigo = None
+        bot.tempo_ultimo_tiro = 0
+        bot.cadencia_arma = 500
 
-        if retornar_info_rota:
-            return (ponto_mais_proximo, melhor_rota_idx, melhor_waypoint_idx)
-        return ponto_mais_proximo
+        # Estado copiado da simulação
+        bot.arma = None
+        bot.é_bomber = False
+        bot.bot_plantando = False
+        bot.bot_tempo_inicio_plantar = 0
 
-    def _ia_wandering_aleatorio(self, bot, tempo_atual):
-        """
-        Move o bot em uma direção aleatória não sólida para tentar sair de onde está preso.
-        Move DIRETAMENTE o bot, não apenas cria waypoint.
+        return bot
 
-        Args:
-            bot: Bot a mover
-            tempo_atual: Tempo atual em ms
-        """
-        import math
+    def _encontrar_posicao_valida(self):
+        """Encontra uma posição válida (não sólida) no mapa para spawn."""
         import random
 
-        centro_x = bot.x + TAMANHO_MULTIPLAYER // 2
-        centro_y = bot.y + TAMANHO_MULTIPLAYER // 2
-
-        # Coletar todas as direções livres
-        direcoes_livres = []
+        # Tentar encontrar uma posição válida
+        for _ in range(100):
+            x = random.randint(100, self.tilemap.largura_pixels - 100)
+            y = random.randint(100, self.tilemap.altura_pixels - 100)
 
-        for angulo in range(0, 360, 30):  # Testar mais direções (12 em vez de 8)
-            rad = math.radians(angulo)
-            dir_x = math.cos(rad)
-            dir_y = math.sin(rad)
+            # Verificar se a posição não é sólida (usar tamanho multiplayer menor)
+            rect_teste = pygame.Rect(x, y, TAMANHO_MULTIPLAYER, TAMANHO_MULTIPLAYER)
+            if not self.tilemap.colide_com_rect(rect_teste):
+                return x, y
 
-            # Verificar quão longe pode ir nessa direção
-            dist_livre = 0
-            for d in range(10, 250, 10):
-                check_x = centro_x + dir_x * d
-                check_y = centro_y + dir_y * d
-                if self.tilemap.is_solid(check_x, check_y):
-                    break
-                dist_livre = d
-
-            if dist_livre >= 40:
-                direcoes_livres.append((dir_x, dir_y, dist_livre))
-
-        if direcoes_livres:
-            # Escolher direção aleatória entre as livres
-            escolha = random.choice(direcoes_livres)
-            dir_x, dir_y, dist_livre = escolha
-
-            # MOVER DIRETAMENTE o bot na direção escolhida (forçar movimento)
-            destino_x = bot.x + dir_x * dist_livre * 0.8
-            destino_y = bot.y + dir_y * dist_livre * 0.8
-
-            # Mover o bot diretamente por vários frames
-            vel_x = dir_x * bot.velocidade * 2  # Velocidade dobrada para escapar
-            vel_y = dir_y * bot.velocidade * 2
-
-            bot_rect = pygame.Rect(bot.x, bot.y, TAMANHO_MULTIPLAYER, TAMANHO_MULTIPLAYER)
-            novo_x, novo_y, _, _ = self.tilemap.resolver_colisao(bot_rect, vel_x, vel_y)
-            bot.x = novo_x
-            bot.y = novo_y
-
-            # Também criar waypoint para continuar movimento
-            bot.ia_caminho = [(destino_x, destino_y)]
-            bot.ia_waypoint_atual = 0
-            bot.ia_estado = 'movendo'
-            bot.ia_tempo_inicio_rota = tempo_atual
-            bot.ia_rota_idx = None
-            bot.ia_tentativas_escape = 0  # Resetar após mover
-            bot.ia_bloqueado_contador = 0  # Resetar contador de bloqueio
-
-            # Ativar modo escape por 2 segundos (não sobrescrever waypoints)
-            bot.ia_modo_escape = True
-            bot.ia_escape_tempo_fim = tempo_atual + 2000
-
-            print(f"[IA] {bot.nome} wandering aleatório para escapar")
-        else:
-            # Sem direções livres, tentar micro-movimento em qualquer direção
-            for angulo in range(0, 360, 15):
-                rad = math.radians(angulo)
-                dir_x = math.cos(rad)
-                dir_y = math.sin(rad)
-
-                # Tentar mover só um pouco
-                vel_x = dir_x * bot.velocidade
-                vel_y = dir_y * bot.velocidade
-
-                bot_rect = pygame.Rect(bot.x, bot.y, TAMANHO_MULTIPLAYER, TAMANHO_MULTIPLAYER)
-                novo_x, novo_y, _, _ = self.tilemap.resolver_colisao(bot_rect, vel_x, vel_y)
-
-                # Se conseguiu mover
-                if abs(novo_x - bot.x) > 0.5 or abs(novo_y - bot.y) > 0.5:
-                    bot.x = novo_x
-                    bot.y = novo_y
-                    print(f"[IA] {bot.nome} micro-movimento para escapar")
-                    break
+        # Fallback para o centro do mapa
+        return self.tilemap.largura_pixels // 2, self.tilemap.altura_pixels // 2
 
-            bot.ia_rota_idx = None
-            bot.ia_caminho = []
-            bot.ia_waypoint_atual = 0
-            bot.ia_tile_alvo = None
-            bot.ia_tempo_inicio_rota = tempo_atual
+    def _pode_andar(self):
+        """Mesma regra de SimulacaoBomba.pode_mover: parado morto, no tempo de compra ou com o round encerrado."""
+        return self.jogador.vidas > 0 and not self.em_tempo_compra and not self.round_terminado
 
-    def _ia_mover_combate(self, bot, tempo_atual):
+    def _mover_previsto(self, x, y, keys, movimento):
         """
-        Movimento durante combate - strafe e evasão.
+        Passo da predição com simulação no servidor: o mesmo de
+        SimulacaoBomba.mover_jogador, parado quando o servidor não deixa andar.
         """
-        import math
+        return mover_com_classe(self.tilemap, x, y, keys, movimento,
+                                self.classe_jogador, self.time_jogador, self._pode_andar())
+
+    def _atualizar_jogador_previsto(self, pos_mouse):
+        """Envia o input e posiciona o jogador na predição reconciliada."""
+        self._enviar_estado_jogador(pos_mouse)
+        pos = self.cliente.get_predicted_position()
+        if pos:
+            self.jogador.x, self.jogador.y = pos
+            self.jogador.rect.x = int(pos[0])
+            self.jogador.rect.y = int(pos[1])
+        self._aplicar_movimento_classe(self.cliente.get_predicted_state())
+        self.jogador.atualizar()
 
-        if not bot.ia_alvo_inimigo:
+    def _atualizar_jogador_com_colisao(self, pos_mouse, tempo_atual):
+        """Atualiza o jogador com verificação de colisão do mapa e a habilidade de classe."""
+        # Simulação no servidor: o movimento é o da predição (mesmo passo do servidor)
+        if self.simulacao_servidor and self.cliente:
+            self._atualizar_jogador_previsto(pos_mouse)
             return
 
-        inimigo = bot.ia_alvo_inimigo
-        dx = inimigo.x - bot.x
-        dy = inimigo.y - bot.y
-        dist = math.sqrt(dx**2 + dy**2)
-
-        if dist < 1:
+        # Simulação local: o input vai direto para ela (velocidade, turbo e
+        # dash da classe, com colisão; parado quando ela não deixa andar)
+        local_id = self.cliente.local_player_id
+        pode_andar = self.simulacao_local.pode_mover(local_id)
+        novo_x, novo_y = self.simulacao_local.mover_jogador(local_id, self.jogador.x, self.jogador.y,
+                                                            self._ler_teclas())
+        if not pode_andar:
+            self._aplicar_movimento_classe(self.simulacao_local.movimento(local_id))
             return
 
-        dir_x = dx / dist
-        dir_y = dy / dist
+        # Aplicar nova posição
+        self.jogador.x = novo_x
+        self.jogador.y = novo_y
+        self.jogador.rect.x = novo_x
+        self.jogador.rect.y = novo_y
+        self.jogador.rect.width = TAMANHO_MULTIPLAYER
+        self.jogador.rect.height = TAMANHO_MULTIPLAYER
+        self._aplicar_movimento_classe(self.simulacao_local.movimento(local_id))
+
+        # Atualizar outros aspectos do jogador
+        self.jogador.atualizar()
+
+    def _converter_mouse_para_mundo(self, pos_mouse):
+        """Converte posição do mouse na tela para coordenadas do mundo (considerando zoom)."""
+        # Converter posição da tela para coordenadas do mundo
+        mundo_x = pos_mouse[0] / self.camera_zoom + self.camera_x
+        mundo_y = pos_mouse[1] / self.camera_zoom + self.camera_y
+        return (mundo_x, mundo_y)
 
-        # Strafe perpendicular
-        bot_id = id(bot) % 100
-        strafe_dir = 1 if ((tempo_atual // 800) + bot_id) % 2 == 0 else -1
+    def _atualizar_camera(self):
+        """Atualiza a posição da câmera para seguir o jogador (ou aliado se espectador)."""
+        # Dimensões da tela com zoom aplicado
+        largura_visivel = LARGURA / self.camera_zoom
+        altura_visivel = ALTURA_JOGO / self.camera_zoom
 
-        mover_x = -dir_y * strafe_dir
-        mover_y = dir_x * strafe_dir
+        # Centro da tela (em coordenadas do mundo)
+        centro_x = largura_visivel / 2
+        centro_y = altura_visivel / 2
 
-        # Ajustar distância
-        if dist < 80:
-            mover_x -= dir_x * 0.5
-            mover_y -= dir_y * 0.5
-        elif dist > 150:
-            mover_x += dir_x * 0.3
-            mover_y += dir_y * 0.3
+        # Determinar alvo da câmera
+        alvo_x = self.jogador.x
+        alvo_y = self.jogador.y
 
-        # Evitar paredes
-        centro_x = bot.x + TAMANHO_MULTIPLAYER // 2
-        centro_y = bot.y + TAMANHO_MULTIPLAYER // 2
+        # Se jogador morreu, ativar modo espectador
+        if self.jogador.vidas <= 0:
+            tempo_atual = pygame.time.get_ticks()
 
-        for angulo in range(0, 360, 45):
-            rad = math.radians(angulo)
-            check_x = centro_x + math.cos(rad) * 35
-            check_y = centro_y + math.sin(rad) * 35
+            # Primeira vez que detecta morte - registrar tempo
+            if not self.espectador_ativo:
+                self.espectador_ativo = True
+                self.espectador_tempo_morte = tempo_atual
+                self.espectador_alvo_idx = 0
 
-            if self.tilemap.is_solid(check_x, check_y):
-                mover_x -= math.cos(rad) * 0.6
-                mover_y -= math.sin(rad) * 0.6
+            # Após o delay, seguir um aliado vivo
+            if tempo_atual - self.espectador_tempo_morte >= self.espectador_delay:
+                aliado = self._obter_aliado_espectador()
+                if aliado:
+                    alvo_x = aliado.x
+                    alvo_y = aliado.y
 
-        # Normalizar
-        mag = math.sqrt(mover_x**2 + mover_y**2)
-        if mag > 0:
-            mover_x /= mag
-            mover_y /= mag
-
-        # Aplicar movimento
-        vel_x = mover_x * bot.velocidade
-        vel_y = mover_y * bot.velocidade
-
-        bot_rect = pygame.Rect(bot.x, bot.y, TAMANHO_MULTIPLAYER, TAMANHO_MULTIPLAYER)
-        novo_x, novo_y, _, _ = self.tilemap.resolver_colisao(bot_rect, vel_x, vel_y)
-        bot.x = novo_x
-        bot.y = novo_y
-
-    # ==================== FUNÇÕES DE COMPATIBILIDADE ====================
-
-    def _bot_comprar_arma(self, bot):
-        """Bot compra arma aleatória baseado no dinheiro disponível."""
-        moedas = getattr(bot, 'moedas', 8000)
-
-        # Lista de armas disponíveis
-        armas_disponiveis = [
-            ('sniper', 4750, 6, 1200),      # nome, preço, dano, cadência
-            ('metralhadora', 2700, 1, 100),  # Cadência muito alta
-            ('spas12', 1200, 2, 600),
-            ('desert_eagle', 500, 3, 700),  # Cadência lenta
-        ]
+        # Câmera segue o alvo
+        self.camera_x = alvo_x - centro_x
+        self.camera_y = alvo_y - centro_y
 
-        # Filtrar armas que o bot pode comprar
-        armas_possiveis = [(a, p, d, c) for a, p, d, c in armas_disponiveis if p <= moedas]
-
-        if armas_possiveis:
-            # Escolher aleatoriamente entre as armas que pode comprar
-            arma_nome, preco, dano, cadencia = random.choice(armas_possiveis)
-            bot.moedas = moedas - preco
-            bot.arma = arma_nome
-            bot.dano_arma = dano
-            bot.cadencia_arma = cadencia
-            print(f"[BOT COMPRA] {bot.nome} comprou {arma_nome} por ${preco} (Saldo: ${bot.moedas})")
-            return
+        # Limitar câmera aos limites do mapa
+        self.camera_x = max(0, min(self.camera_x, self.tilemap.largura_pixels - largura_visivel))
+        self.camera_y = max(0, min(self.camera_y, self.tilemap.altura_pixels - altura_visivel))
 
-        # Se não tem dinheiro, fica sem arma (tiro normal)
-        bot.arma = None
-        bot.dano_arma = 1
-        bot.cadencia_arma = 500  # Tiro normal mais lento
+    def _obter_aliado_espectador(self):
+        """Retorna o bot que a câmera deve seguir no modo espectador."""
+        # Filtrar todos os bots vivos (de qualquer time)
+        bots_vivos = [
+            bot for bot in self.bots_locais
+            if bot.vidas > 0
+        ]
 
-    def _bot_atirar(self, bot, alvo, tempo_atual):
-        """Bot atira no alvo."""
-        import math
-        from src.entities.tiro import Tiro
+        if not bots_vivos:
+            return None
 
-        # Verificar cadência
-        cadencia = getattr(bot, 'cadencia_arma', 800)
-        if tempo_atual - bot.tempo_ultimo_tiro < cadencia:
-            return
+        # Ajustar índice se necessário
+        if self.espectador_alvo_idx >= len(bots_vivos):
+            self.espectador_alvo_idx = 0
 
-        # Calcular direção
-        dx = alvo.x - bot.x
-        dy = alvo.y - bot.y
-        dist = math.sqrt(dx**2 + dy**2)
+        return bots_vivos[self.espectador_alvo_idx]
 
-        if dist < 10:
+    def _alternar_espectador(self):
+        """Alterna para o próximo bot vivo no modo espectador."""
+        if not self.espectador_ativo or self.jogador.vidas > 0:
             return
 
-        # Adicionar um pouco de imprecisão baseado na distância
-        imprecisao = min(dist / 800, 0.3)  # Máximo 30% de imprecisão
-        angulo = math.atan2(dy, dx)
-        angulo += random.uniform(-imprecisao, imprecisao)
-
-        tiro_dx = math.cos(angulo)
-        tiro_dy = math.sin(angulo)
+        # Contar todos os bots vivos
+        bots_vivos = [
+            bot for bot in self.bots_locais
+            if bot.vidas > 0
+        ]
 
-        # Criar tiro
-        dano = getattr(bot, 'dano_arma', 1)
-        tiro = Tiro(bot.x + TAMANHO_MULTIPLAYER // 2, bot.y + TAMANHO_MULTIPLAYER // 2,
-                   tiro_dx, tiro_dy, bot.cor, 7)
-        tiro.dano = dano
-        tiro.time_origem = bot.time
-        self.tiros_inimigo.append(tiro)
-        bot.tempo_ultimo_tiro = tempo_atual
+        if len(bots_vivos) > 0:
+            self.espectador_alvo_idx = (self.espectador_alvo_idx + 1) % len(bots_vivos)
+            bot = bots_vivos[self.espectador_alvo_idx]
+            time_bot = getattr(bot, 'time', '?')
+            print(f"[ESPECTADOR] Observando: {bot.nome} (Time {time_bot})")
 
     def _atualizar_tiros_multiplayer(self):
         """Atualiza tiros no mundo do multiplayer (não usa limites da tela)."""
@@ -3883,7 +2171,11 @@ class FaseMultiplayer(FaseBase):
                 self.tiros_inimigo.remove(tiro)
 
     def _processar_pvp(self):
-        """Processa colisões de tiros com jogadores (PvP) - só afeta times opostos."""
+        """
+        Processa colisões dos tiros do jogador local com bots e jogadores
+        remotos (só times opostos). Os tiros dos bots são só visuais: o dano
+        deles é aplicado pela simulação.
+        """
         # Tiros do jogador local atingindo bots do time oposto
         for tiro in self.tiros_jogador[:]:
             tiro_time = getattr(tiro, 'time_origem', self.time_jogador)
@@ -3913,172 +2205,37 @@ class FaseMultiplayer(FaseBase):
                     if tiro in self.tiros_jogador:
                         self.tiros_jogador.remove(tiro)
                         tiro_removido = True
-                    # Verificar invulnerabilidade (escudo do mago, dash, etc)
-                    if getattr(bot, 'invulneravel', False):
-                        print(f"[PVP] {bot.nome} bloqueou o dano (ESCUDO ATIVO)!")
-                        break
-                    dano = getattr(tiro, 'dano', 1)
-                    vida_antes = bot.vidas
-                    bot.vidas = max(0, bot.vidas - dano)
-                    print(f"[PVP] Jogador acertou {bot.nome} (Time {bot_time})! Vida restante: {bot.vidas}")
-
-                    # Recompensa por eliminacao
-                    if vida_antes > 0 and bot.vidas <= 0:
-                        self.moedas += 300  # Recompensa por kill
-                        print(f"[RECOMPENSA] +$300 por eliminar {bot.nome}! Saldo: ${self.moedas}")
-
-                        # Se era o bomber, dropar a bomba
-                        if getattr(bot, 'é_bomber', False) and not self.bomba_plantada:
-                            self._dropar_bomba(bot.x, bot.y)
-
-        # Tiros de bots atingindo jogador e outros bots (só de times opostos)
-        for tiro in self.tiros_inimigo[:]:
-            tiro_time = getattr(tiro, 'time_origem', None)
-            tiro_removido = False
-
-            # Verificar colisão com jogador (só se for do time oposto e não invulnerável)
-            if tiro_time and tiro_time != self.time_jogador and self.jogador.vidas > 0:
-                # Verificar se jogador está invulnerável (escudo do mago ou dash)
-                if getattr(self.jogador, 'invulneravel', False):
-                    continue  # Pular dano se invulnerável
-
-                jogador_rect = pygame.Rect(
-                    self.jogador.x, self.jogador.y, TAMANHO_MULTIPLAYER, TAMANHO_MULTIPLAYER
-                )
+                    # O dano (e o drop da bomba) é decidido pela simulação
+                    self._acertar_bot(bot, getattr(tiro, 'dano', 1),
+                                      tiro.rect.centerx, tiro.rect.centery, tiro_time)
+                    break
 
-                if tiro.rect.colliderect(jogador_rect):
-                    criar_explosao(tiro.x, tiro.y, tiro.cor, self.particulas)
-                    if tiro in self.tiros_inimigo:
-                        self.tiros_inimigo.remove(tiro)
-                        tiro_removido = True
-                    dano = getattr(tiro, 'dano', 1)
-                    vida_antes = self.jogador.vidas
-                    self.jogador.vidas = max(0, self.jogador.vidas - dano)
-                    print(f"[PVP] Bot do Time {tiro_time} acertou você! Vida restante: {self.jogador.vidas}")
-
-                    # Se jogador morreu e era o bomber, dropar a bomba
-                    if vida_antes > 0 and self.jogador.vidas <= 0:
-                        if self.bomber_é_jogador and not self.bomba_plantada:
-                            self._dropar_bomba(self.jogador.x, self.jogador.y)
-
-            # Verificar colisão com bots do time oposto ao tiro
-            if not tiro_removido:
-                for bot in self.bots_locais:
-                    # Ignorar bots mortos - tiro passa através
-                    if bot.vidas <= 0:
+            # Verificar colisão com jogadores remotos do time oposto.
+            # O dano não é aplicado aqui: o servidor valida o acerto contra a
+            # posição que o alvo tinha quando o atirador o via (compensação de lag).
+            if not tiro_removido and self.cliente:
+                for pid, remoto in self.jogadores_remotos.items():
+                    # Fora da AOI a posição é desconhecida: não dá para acertar
+                    if not remoto.vivo or not remoto.visivel:
                         continue
-
-                    bot_time = getattr(bot, 'time', None)
-
-                    # Só causar dano se for do time oposto ao tiro
-                    if bot_time == tiro_time:
+                    remoto_time = self.status_times.get(str(pid), {}).get('team')
+                    if remoto_time is None or remoto_time == tiro_time:
                         continue
 
-                    bot_rect = pygame.Rect(
-                        bot.x, bot.y, TAMANHO_MULTIPLAYER, TAMANHO_MULTIPLAYER
+                    remoto_rect = pygame.Rect(
+                        remoto.x, remoto.y, TAMANHO_MULTIPLAYER, TAMANHO_MULTIPLAYER
                     )
 
-                    if tiro.rect.colliderect(bot_rect):
+                    if tiro.rect.colliderect(remoto_rect):
                         criar_explosao(tiro.x, tiro.y, tiro.cor, self.particulas)
-                        if tiro in self.tiros_inimigo:
-                            self.tiros_inimigo.remove(tiro)
-                        # Verificar invulnerabilidade (escudo do mago, dash, etc)
-                        if getattr(bot, 'invulneravel', False):
-                            print(f"[PVP] {bot.nome} bloqueou o dano (ESCUDO ATIVO)!")
-                            break
-                        dano = getattr(tiro, 'dano', 1)
-                        vida_antes = bot.vidas
-                        bot.vidas = max(0, bot.vidas - dano)
-                        print(f"[PVP] Tiro do Time {tiro_time} acertou {bot.nome} (Time {bot_time})!")
-
-                        # Se era o bomber e morreu, dropar a bomba
-                        if vida_antes > 0 and bot.vidas <= 0:
-                            if getattr(bot, 'é_bomber', False) and not self.bomba_plantada:
-                                self._dropar_bomba(bot.x, bot.y)
+                        if tiro in self.tiros_jogador:
+                            self.tiros_jogador.remove(tiro)
+                        self.cliente.send_bullet_hit(
+                            pid, tiro.rect.centerx, tiro.rect.centery,
+                            getattr(tiro, 'dano', 1)
+                        )
                         break
 
-    def _verificar_vitoria(self):
-        """Verifica se um time venceu o round (todos do time oposto eliminados)."""
-        if self.partida_terminada or self.round_terminado:
-            return
-
-        # Contar membros vivos de cada time
-        time_t_vivos = 0
-        time_q_vivos = 0
-
-        # Jogador local
-        if self.jogador.vidas > 0:
-            if self.time_jogador == 'T':
-                time_t_vivos += 1
-            else:
-                time_q_vivos += 1
-
-        # Bots
-        for bot in self.bots_locais:
-            if bot.vidas > 0:
-                bot_time = getattr(bot, 'time', None)
-                if bot_time == 'T':
-                    time_t_vivos += 1
-                elif bot_time == 'Q':
-                    time_q_vivos += 1
-
-        # Verificar se algum time foi eliminado neste round
-        if time_t_vivos == 0 and time_q_vivos > 0:
-            # Se a bomba está plantada, Time Q precisa defusar para vencer
-            # Se não defusar, a bomba explode e Time T vence
-            if self.bomba_plantada and not self.bomba_defusada:
-                # Não declarar vitória ainda - bomba precisa ser defusada ou explodir
-                pass
-            else:
-                self._time_venceu_round('Q')
-        elif time_q_vivos == 0 and time_t_vivos > 0:
-            self._time_venceu_round('T')
-
-    def _time_venceu_round(self, time_vencedor):
-        """Processa a vitória de um time no round."""
-        self.round_terminado = True
-        self.time_vencedor = time_vencedor
-
-        # Adicionar ponto ao time vencedor
-        if time_vencedor == 'T':
-            self.rounds_time_t += 1
-            print(f"[ROUND] Time T venceu o round {self.round_atual}! Placar: T {self.rounds_time_t} x {self.rounds_time_q} Q")
-        else:
-            self.rounds_time_q += 1
-            print(f"[ROUND] Time Q venceu o round {self.round_atual}! Placar: T {self.rounds_time_t} x {self.rounds_time_q} Q")
-
-        # Recompensa por vitória/derrota do round
-        if self.time_jogador == time_vencedor:
-            self.moedas += 3000  # Bônus por vencer round
-            print(f"[RECOMPENSA] +$3000 por vencer o round! Saldo: ${self.moedas}")
-        else:
-            self.moedas += 1000  # Consolação por perder round
-            print(f"[RECOMPENSA] +$1000 (derrota). Saldo: ${self.moedas}")
-
-        # Verificar se algum time venceu a partida (primeiro a 5)
-        if self.rounds_time_t >= self.rounds_para_vencer:
-            self.partida_terminada = True
-            self.jogo_terminado = True
-            self.vencedor = "Time T"
-            print(f"[PARTIDA] Time T VENCEU A PARTIDA! {self.rounds_time_t} x {self.rounds_time_q}")
-        elif self.rounds_time_q >= self.rounds_para_vencer:
-            self.partida_terminada = True
-            self.jogo_terminado = True
-            self.vencedor = "Time Q"
-            print(f"[PARTIDA] Time Q VENCEU A PARTIDA! {self.rounds_time_t} x {self.rounds_time_q}")
-        else:
-            # Preparar próximo round
-            self.tempo_proximo_round = pygame.time.get_ticks() + 3000  # 3 segundos até próximo round
-
-    def _verificar_proximo_round(self):
-        """Verifica se é hora de iniciar o próximo round."""
-        if not self.round_terminado or self.partida_terminada:
-            return
-
-        tempo_atual = pygame.time.get_ticks()
-        if tempo_atual >= self.tempo_proximo_round:
-            self._iniciar_novo_round()
-
     def _iniciar_novo_round(self):
         """Inicia um novo round, resetando posições e vidas."""
         self.round_atual += 1
@@ -4095,74 +2252,20 @@ class FaseMultiplayer(FaseBase):
             self.jogador.rect.x = spawn_pos[0]
             self.jogador.rect.y = spawn_pos[1]
 
-        # Resetar atributos de classe do jogador
-        self.jogador.invulneravel = False
+        # Avisar o servidor que renascemos (restaura a vida usada na validação de acertos);
+        # com a simulação no servidor, é ela quem decide os respawns
+        if self.cliente and not self.simulacao_servidor:
+            self.cliente.send_respawn(self.jogador.vidas_max, self.round_atual)
+
+        # Resetar atributos de classe do jogador (o estado de movimento
+        # zerado vem da simulação)
         self.habilidade_ativa = False
         self.habilidade_cooldown = 0
         self.habilidade_tempo_inicio = 0
+        self.pedir_habilidade = False
+        self._aplicar_movimento_classe(novo_movimento())
 
-        if self.classe_jogador == "normal":
-            self.jogador.dash_ativo = False
-            self.jogador.dash_frames_restantes = 0
-        elif self.classe_jogador == "mago":
-            self.jogador.escudo_ativo = False
-        elif self.classe_jogador == "ghost":
-            self.jogador.invisivel = False
-        elif self.classe_jogador == "cyan":
-            self.jogador.velocidade = self.velocidade_original
-            if hasattr(self.jogador, 'posicoes_turbo'):
-                self.jogador.posicoes_turbo.clear()
-
-        # Resetar bots
-        for bot in self.bots_locais:
-            bot.vidas = bot.vidas_max
-            bot_time = getattr(bot, 'time', 'T')
-            spawn_name = f"Start_{bot_time}"
-            spawn_obj = self.tilemap.get_objeto(spawn_name)
-            if spawn_obj:
-                bot.x = spawn_obj['x'] + random.random() * spawn_obj['width']
-                bot.y = spawn_obj['y'] + random.random() * spawn_obj['height']
-
-            # Resetar atributos de IA
-            bot.estado = 'comprando'
-            bot.ja_comprou = False
-            bot.alvo_inimigo = None
-            bot.é_bomber = False
-            # Escolher novo bombsite alvo
-            if hasattr(self, 'bombsites') and self.bombsites:
-                bot.bombsite_alvo = random.randint(0, len(self.bombsites) - 1)
-            # Dar recompensa de round
-            bot.moedas = getattr(bot, 'moedas', 0) + 1400  # Bônus por round
-
-            # Resetar rota - bot vai escolher nova rota aleatória no início do round
-            bot.ia_rota_idx = None
-
-            # Resetar atributos de classe
-            bot.habilidade_cooldown = 0
-            bot.habilidade_ativa = False
-            bot.habilidade_tempo_inicio = 0
-
-            classe = getattr(bot, 'classe', None)
-            if classe == 'mago':
-                bot.escudo_ativo = False
-                bot.invulneravel = False
-            elif classe == 'ghost':
-                bot.invisivel = False
-            elif classe == 'cyan':
-                bot.velocidade = 2.5  # Velocidade base
-                bot.velocidade_original = 2.5
-                if hasattr(bot, 'posicoes_turbo'):
-                    bot.posicoes_turbo.clear()
-            elif classe == 'normal':
-                bot.dash_ativo = False
-                bot.dash_frames_restantes = 0
-                bot.invulneravel = False
-            bot.ia_caminho = []
-            bot.ia_waypoint_atual = 0
-
-            # Resetar estado de plantio
-            bot.bot_plantando = False
-            bot.bot_tempo_inicio_plantar = 0
+        # Bots, bomber e bomba chegam no estado da simulação
 
         # Limpar tiros e granadas
         self.tiros_jogador.clear()
@@ -4193,44 +2296,6 @@ class FaseMultiplayer(FaseBase):
         self.espectador_alvo_idx = 0  # Índice do aliado sendo observado
         self.espectador_delay = 2000  # 2 segundos de delay antes de seguir aliado
 
-        # Selecionar novo bomber
-        self._selecionar_bomber()
-
-    def _selecionar_bomber(self):
-        """Seleciona aleatoriamente um membro do time T para ser o bomber."""
-        # Resetar flag de bomber de todos os bots
-        for bot in self.bots_locais:
-            bot.é_bomber = False
-
-        candidatos = []
-
-        # Adicionar jogador se for do time T
-        if self.time_jogador == 'T':
-            candidatos.append({'tipo': 'jogador', 'id': 'local'})
-
-        # Adicionar bots do time T
-        for i, bot in enumerate(self.bots_locais):
-            if getattr(bot, 'time', None) == 'T' and bot.vidas > 0:
-                candidatos.append({'tipo': 'bot', 'id': i, 'nome': bot.nome, 'bot': bot})
-
-        if candidatos:
-            escolhido = random.choice(candidatos)
-            if escolhido['tipo'] == 'jogador':
-                self.bomber_id = 'local'
-                self.bomber_é_jogador = True
-                print(f"[BOMBA] Você é o BOMBER! Plante a bomba no local marcado (tile 322)")
-            else:
-                self.bomber_id = escolhido['id']
-                self.bomber_é_jogador = False
-                # Marcar o bot como bomber
-                escolhido['bot'].é_bomber = True
-                bot_nome = escolhido.get('nome', f'Bot {escolhido["id"]}')
-                print(f"[BOMBA] {bot_nome} é o BOMBER!")
-        else:
-            self.bomber_id = None
-            self.bomber_é_jogador = False
-            print("[BOMBA] Nenhum membro do time T disponível para ser bomber")
-
     def _verificar_no_bombsite(self, x, y):
         """Verifica se a posição está no tile 322 (bombsite)."""
         tile_id = self.tilemap.get_tile_at_pixel(x + TAMANHO_MULTIPLAYER // 2,
@@ -4238,312 +2303,151 @@ class FaseMultiplayer(FaseBase):
         tile_id_base = tile_id & 0x1FFFFFFF
         return tile_id_base == 322
 
-    def _processar_bomba(self, tempo_atual):
-        """Processa toda a lógica da bomba (plantar, defusar, explodir)."""
-        teclas = pygame.key.get_pressed()
-        tecla_f = teclas[pygame.K_f]
-
-        # Se bomba não foi plantada ainda
-        if not self.bomba_plantada and not self.bomba_explodiu:
-            # Verificar se o bomber (jogador) está tentando plantar
-            if self.bomber_é_jogador and self.jogador.vidas > 0:
-                no_bombsite = self._verificar_no_bombsite(self.jogador.x, self.jogador.y)
-
-                if tecla_f and no_bombsite:
-                    if not self.plantando_bomba:
-                        self.plantando_bomba = True
-                        self.tempo_inicio_plantar = tempo_atual
-                        print("[BOMBA] Plantando bomba...")
-                    else:
-                        # Verificar se completou o plantio
-                        tempo_plantando = tempo_atual - self.tempo_inicio_plantar
-                        if tempo_plantando >= self.tempo_para_plantar:
-                            self._plantar_bomba(self.jogador.x, self.jogador.y)
-                else:
-                    if self.plantando_bomba:
-                        print("[BOMBA] Plantio cancelado!")
-                    self.plantando_bomba = False
-
-        # Se bomba foi plantada
-        elif self.bomba_plantada and not self.bomba_defusada and not self.bomba_explodiu:
-            # Verificar explosão por tempo
-            tempo_desde_plantio = tempo_atual - self.bomba_tempo_plantio
-            if tempo_desde_plantio >= self.bomba_tempo_explosao:
-                self._explodir_bomba()
-                return
-
-            # Verificar se jogador do time Q está tentando defusar
-            if self.time_jogador == 'Q' and self.jogador.vidas > 0:
-                # Verificar se está perto da bomba
-                if self.bomba_posicao:
-                    dist_x = abs(self.jogador.x - self.bomba_posicao[0])
-                    dist_y = abs(self.jogador.y - self.bomba_posicao[1])
-                    perto_bomba = dist_x < 30 and dist_y < 30
-
-                    if tecla_f and perto_bomba:
-                        if not self.defusando_bomba:
-                            self.defusando_bomba = True
-                            self.tempo_inicio_defusar = tempo_atual
-                            print("[BOMBA] Defusando bomba...")
-                        else:
-                            # Verificar se completou o defuse
-                            tempo_defusando = tempo_atual - self.tempo_inicio_defusar
-                            if tempo_defusando >= self.tempo_para_defusar:
-                                self._defusar_bomba()
-                    else:
-                        if self.defusando_bomba:
-                            print("[BOMBA] Defuse cancelado!")
-                        self.defusando_bomba = False
-
-            # === BOTS DO TIME Q DEFUSANDO ===
-            for bot in self.bots_locais:
-                if bot.vidas <= 0 or getattr(bot, 'time', '') != 'Q':
-                    continue
-
-                if self.bomba_posicao:
-                    dist_x = abs(bot.x - self.bomba_posicao[0])
-                    dist_y = abs(bot.y - self.bomba_posicao[1])
-                    perto_bomba = dist_x < 30 and dist_y < 30
-
-                    if perto_bomba and getattr(bot, 'bot_defusando', False):
-                        # Iniciar ou continuar defuse
-                        if not hasattr(bot, 'bot_tempo_inicio_defusar'):
-                            bot.bot_tempo_inicio_defusar = tempo_atual
-                            print(f"[BOMBA] {bot.nome} começou a defusar!")
-
-                        tempo_defusando = tempo_atual - bot.bot_tempo_inicio_defusar
-                        if tempo_defusando >= self.tempo_para_defusar:
-                            print(f"[BOMBA] {bot.nome} defusou a bomba!")
-                            self._defusar_bomba()
-                            break
-                    else:
-                        # Resetar tempo de defuse se saiu de perto
-                        if hasattr(bot, 'bot_tempo_inicio_defusar'):
-                            del bot.bot_tempo_inicio_defusar
-
-    def _plantar_bomba(self, x, y):
-        """Planta a bomba na posição especificada."""
-        self.bomba_plantada = True
-        self.bomba_posicao = (x, y)
-        self.bomba_tempo_plantio = pygame.time.get_ticks()
-        self.plantando_bomba = False
-        print(f"[BOMBA] BOMBA PLANTADA! Time Q tem {self.bomba_tempo_explosao // 1000}s para defusar!")
-
-    def _bot_plantar_bomba(self, bot, tile_pos=None):
-        """Bot inicia ou continua o processo de plantar bomba no tile 322."""
-        tempo_atual = pygame.time.get_ticks()
-
-        # Se não está plantando ainda, começar
-        if not getattr(bot, 'bot_plantando', False):
-            bot.bot_plantando = True
-            bot.bot_tempo_inicio_plantar = tempo_atual
-            # Salvar posição do tile 322 para plantar exatamente lá
-            if tile_pos:
-                bot.bot_tile_plantio = tile_pos
-            print(f"[BOMBA] {bot.nome} começou a plantar a bomba no tile 322!")
-            return
-
-        # Calcular progresso do plantio
-        tempo_plantando = tempo_atual - bot.bot_tempo_inicio_plantar
-        if tempo_plantando >= self.tempo_para_plantar:
-            # Terminou de plantar - plantar no tile 322!
-            pos_plantio = getattr(bot, 'bot_tile_plantio', (bot.x, bot.y))
-            self._plantar_bomba(pos_plantio[0], pos_plantio[1])
-            bot.bot_plantando = False
-            bot.é_bomber = False  # Não é mais o bomber após plantar
-            print(f"[BOMBA] {bot.nome} plantou a bomba no tile 322!")
-
-    def _defusar_bomba(self):
-        """Defusa a bomba - Time Q vence o round."""
-        self.bomba_defusada = True
-        self.defusando_bomba = False
-        print("[BOMBA] BOMBA DEFUSADA! Time Q vence o round!")
-        self._time_venceu_round('Q')
-
-    def _explodir_bomba(self):
-        """Explode a bomba - Time T vence o round."""
-        self.bomba_explodiu = True
-        print("[BOMBA] BOMBA EXPLODIU! Time T vence o round!")
-        # Criar explosão visual
-        if self.bomba_posicao:
-            for _ in range(50):
-                criar_explosao(self.bomba_posicao[0], self.bomba_posicao[1],
-                             (255, 100, 0), self.particulas)
-        self._time_venceu_round('T')
-
-    def _dropar_bomba(self, x, y):
-        """Dropa a bomba no chão quando o bomber morre."""
-        if self.bomba_plantada:
-            return  # Bomba já foi plantada, não dropar
-
-        self.bomba_dropada = True
-        self.bomba_drop_posicao = (x, y)
-        self.bomber_é_jogador = False
-
-        # Remover status de bomber de todos
-        for bot in self.bots_locais:
-            bot.é_bomber = False
-
-        print(f"[BOMBA] Bomber morreu! Bomba dropada em ({int(x)}, {int(y)})")
-
-    def _pegar_bomba_dropada(self, entidade, é_jogador=False):
-        """Entidade do time T pega a bomba dropada."""
-        if not self.bomba_dropada:
-            return
-
-        self.bomba_dropada = False
-        self.bomba_drop_posicao = None
-
-        if é_jogador:
-            self.bomber_é_jogador = True
-            print(f"[BOMBA] Você pegou a bomba! Agora é o bomber!")
-        else:
-            entidade.é_bomber = True
-            print(f"[BOMBA] {entidade.nome} pegou a bomba! Agora é o bomber!")
-
-    def _verificar_pickup_bomba(self):
-        """Verifica se alguém do time T pegou a bomba dropada."""
-        if not self.bomba_dropada or not self.bomba_drop_posicao:
-            return
-
-        bomba_x, bomba_y = self.bomba_drop_posicao
-        raio_pickup = 30  # Distância para pegar a bomba
-
-        # Verificar jogador (se for do time T)
-        if self.time_jogador == 'T' and self.jogador.vidas > 0:
-            dist = ((self.jogador.x - bomba_x)**2 + (self.jogador.y - bomba_y)**2)**0.5
-            if dist < raio_pickup:
-                self._pegar_bomba_dropada(self.jogador, é_jogador=True)
-                return
-
-        # Verificar bots do time T
-        for bot in self.bots_locais:
-            if getattr(bot, 'time', '') != 'T' or bot.vidas <= 0:
-                continue
-            dist = ((bot.x - bomba_x)**2 + (bot.y - bomba_y)**2)**0.5
-            if dist < raio_pickup:
-                self._pegar_bomba_dropada(bot, é_jogador=False)
-                return
-
     def _desenhar_tudo(self, tempo_atual, pos_mouse):
         """Desenha todos os elementos do jogo com mapa, câmera e zoom."""
-        # Fundo preto
-        self.tela.fill((20, 20, 30))
-
-        # Criar superfície para o mundo (será escalada depois)
-        largura_visivel = int(LARGURA / self.camera_zoom)
-        altura_visivel = int(ALTURA_JOGO / self.camera_zoom)
-        mundo_surface = pygame.Surface((largura_visivel, altura_visivel))
-        mundo_surface.fill((20, 20, 30))
-
-        # Desenhar o mapa com a câmera na superfície do mundo
-        self.tilemap.desenhar_tiles(
-            mundo_surface,
-            self.camera_x,
-            self.camera_y,
-            cor_chao=(40, 35, 50),    # Cor do chão (tile 111)
-            cor_parede=(80, 60, 45)   # Cor das paredes
-        )
+        with escopo('render_mapa'):
+            # Fundo preto (a área do jogo é toda coberta pelo mundo escalado)
+            self.tela.fill(self.COR_FUNDO_MUNDO, (0, ALTURA_JOGO, LARGURA, ALTURA - ALTURA_JOGO))
+
+            # Superfície para o mundo (será escalada depois), reaproveitada por zoom
+            largura_visivel = int(LARGURA / self.camera_zoom)
+            altura_visivel = int(ALTURA_JOGO / self.camera_zoom)
+            mundo_surface = self._obter_alvo_mundo(largura_visivel, altura_visivel)
+            mundo_surface.fill(self.COR_FUNDO_MUNDO)
+
+            # Desenhar o mapa com a câmera na superfície do mundo
+            self.tilemap.desenhar_tiles(
+                mundo_surface,
+                self.camera_x,
+                self.camera_y,
+                cor_chao=(40, 35, 50),    # Cor do chão (tile 111)
+                cor_parede=(80, 60, 45),  # Cor das paredes
+                cor_fundo=self.COR_FUNDO_MUNDO
+            )
 
-        # Desenhar jogador com visual melhorado (estilo fase_base)
-        if self.jogador.vidas > 0:
-            self._desenhar_jogador_estilizado(mundo_surface, tempo_atual)
-            # Desenhar arma na mão do jogador
-            self._desenhar_arma_jogador(mundo_surface, tempo_atual)
-
-        # Desenhar jogadores remotos
-        self._desenhar_jogadores_remotos(mundo_surface, tempo_atual)
-
-        # Desenhar bots
-        self._desenhar_bots(mundo_surface, tempo_atual)
-
-        # Desenhar tiros do jogador (POR CIMA de tudo, com borda para visibilidade)
-        for tiro in self.tiros_jogador:
-            tiro_x = tiro.x - self.camera_x
-            tiro_y = tiro.y - self.camera_y
-            # Borda preta para contraste
-            pygame.draw.circle(mundo_surface, (0, 0, 0), (int(tiro_x), int(tiro_y)), 3)
-            # Tiro colorido
-            pygame.draw.circle(mundo_surface, tiro.cor, (int(tiro_x), int(tiro_y)), 2)
-
-        # Desenhar tiros dos inimigos/bots (POR CIMA de tudo, com borda para visibilidade)
-        for tiro in self.tiros_inimigo:
-            tiro_x = tiro.x - self.camera_x
-            tiro_y = tiro.y - self.camera_y
-            # Borda preta para contraste
-            pygame.draw.circle(mundo_surface, (0, 0, 0), (int(tiro_x), int(tiro_y)), 3)
-            # Tiro colorido
-            pygame.draw.circle(mundo_surface, tiro.cor, (int(tiro_x), int(tiro_y)), 2)
-
-        # Desenhar granadas em voo
-        self._desenhar_granadas_ativas(mundo_surface)
-
-        # Desenhar bomba se plantada
-        if self.bomba_plantada and self.bomba_posicao and not self.bomba_explodiu:
-            bomba_x = self.bomba_posicao[0] - self.camera_x
-            bomba_y = self.bomba_posicao[1] - self.camera_y
-            # Bomba pulsando
-            pulso = (tempo_atual % 500) / 500
-            tamanho_bomba = 8 + int(pulso * 3)
-            # Desenhar bomba
-            pygame.draw.rect(mundo_surface, (50, 50, 50),
-                           (bomba_x - tamanho_bomba//2, bomba_y - tamanho_bomba//2,
-                            tamanho_bomba, tamanho_bomba), 0, 3)
-            pygame.draw.rect(mundo_surface, (200, 50, 50),
-                           (bomba_x - tamanho_bomba//2, bomba_y - tamanho_bomba//2,
-                            tamanho_bomba, tamanho_bomba), 2, 3)
-            # Luz piscando
-            if tempo_atual % 1000 < 500:
-                pygame.draw.circle(mundo_surface, (255, 0, 0),
-                                 (int(bomba_x), int(bomba_y - tamanho_bomba//2 - 3)), 3)
-
-        # Desenhar bomba dropada no chão
-        if self.bomba_dropada and self.bomba_drop_posicao:
-            bomba_x = self.bomba_drop_posicao[0] - self.camera_x
-            bomba_y = self.bomba_drop_posicao[1] - self.camera_y
-            # Bomba pulsando (mais devagar que plantada)
-            pulso = (tempo_atual % 800) / 800
-            tamanho_bomba = 10 + int(pulso * 4)
-
-            # Círculo de destaque ao redor
-            pygame.draw.circle(mundo_surface, (255, 200, 0),
-                             (int(bomba_x), int(bomba_y)), tamanho_bomba + 8, 2)
-
-            # Desenhar bomba (cor diferente - amarela/laranja)
-            pygame.draw.rect(mundo_surface, (80, 60, 20),
-                           (bomba_x - tamanho_bomba//2, bomba_y - tamanho_bomba//2,
-                            tamanho_bomba, tamanho_bomba), 0, 3)
-            pygame.draw.rect(mundo_surface, (255, 180, 0),
-                           (bomba_x - tamanho_bomba//2, bomba_y - tamanho_bomba//2,
-                            tamanho_bomba, tamanho_bomba), 2, 3)
-
-            # Texto "BOMBA" acima
-            fonte_bomba = pygame.font.Font(None, 16)
-            texto = fonte_bomba.render("BOMBA", True, (255, 200, 0))
-            texto_rect = texto.get_rect(center=(int(bomba_x), int(bomba_y) - 18))
-            mundo_surface.blit(texto, texto_rect)
-
-        # Desenhar partículas (por cima de tudo)
-        for particula in self.particulas:
-            particula.desenhar_offset(mundo_surface, -self.camera_x, -self.camera_y)
+        with escopo('render_objetos'):
+            # Desenhar jogador com visual melhorado (estilo fase_base)
+            if self.jogador.vidas > 0:
+                self._desenhar_jogador_estilizado(mundo_surface, tempo_atual)
+                # Desenhar arma na mão do jogador
+                self._desenhar_arma_jogador(mundo_surface, tempo_atual)
+
+            # Desenhar jogadores remotos
+            self._desenhar_jogadores_remotos(mundo_surface, tempo_atual)
+
+            # Desenhar bots
+            self._desenhar_bots(mundo_surface, tempo_atual)
+
+            # Desenhar tiros do jogador e depois dos inimigos/bots (POR CIMA de
+            # tudo, com borda preta para contraste), todos num Surface.blits
+            borda = disco(3, (0, 0, 0))
+            lote_tiros = []
+            for tiros in (self.tiros_jogador, self.tiros_inimigo):
+                for tiro in tiros:
+                    tiro_x = int(tiro.x - self.camera_x)
+                    tiro_y = int(tiro.y - self.camera_y)
+                    lote_tiros.append((borda, (tiro_x - 3, tiro_y - 3)))
+                    lote_tiros.append((disco(2, tiro.cor), (tiro_x - 2, tiro_y - 2)))
+            if lote_tiros:
+                mundo_surface.blits(lote_tiros, doreturn=False)
+
+            # Desenhar granadas em voo
+            self._desenhar_granadas_ativas(mundo_surface)
+
+            # Desenhar bomba se plantada
+            if self.bomba_plantada and self.bomba_posicao and not self.bomba_explodiu:
+                bomba_x = self.bomba_posicao[0] - self.camera_x
+                bomba_y = self.bomba_posicao[1] - self.camera_y
+                # Bomba pulsando
+                pulso = (tempo_atual % 500) / 500
+                tamanho_bomba = 8 + int(pulso * 3)
+                # Desenhar bomba
+                pygame.draw.rect(mundo_surface, (50, 50, 50),
+                               (bomba_x - tamanho_bomba//2, bomba_y - tamanho_bomba//2,
+                                tamanho_bomba, tamanho_bomba), 0, 3)
+                pygame.draw.rect(mundo_surface, (200, 50, 50),
+                               (bomba_x - tamanho_bomba//2, bomba_y - tamanho_bomba//2,
+                                tamanho_bomba, tamanho_bomba), 2, 3)
+                # Luz piscando
+                if tempo_atual % 1000 < 500:
+                    pygame.draw.circle(mundo_surface, (255, 0, 0),
+                                     (int(bomba_x), int(bomba_y - tamanho_bomba//2 - 3)), 3)
+
+            # Desenhar bomba dropada no chão
+            if self.bomba_dropada and self.bomba_drop_posicao:
+                bomba_x = self.bomba_drop_posicao[0] - self.camera_x
+                bomba_y = self.bomba_drop_posicao[1] - self.camera_y
+                # Bomba pulsando (mais devagar que plantada)
+                pulso = (tempo_atual % 800) / 800
+                tamanho_bomba = 10 + int(pulso * 4)
+
+                # Círculo de destaque ao redor
+                pygame.draw.circle(mundo_surface, (255, 200, 0),
+                                 (int(bomba_x), int(bomba_y)), tamanho_bomba + 8, 2)
+
+                # Desenhar bomba (cor diferente - amarela/laranja)
+                pygame.draw.rect(mundo_surface, (80, 60, 20),
+                               (bomba_x - tamanho_bomba//2, bomba_y - tamanho_bomba//2,
+                                tamanho_bomba, tamanho_bomba), 0, 3)
+                pygame.draw.rect(mundo_surface, (255, 180, 0),
+                               (bomba_x - tamanho_bomba//2, bomba_y - tamanho_bomba//2,
+                                tamanho_bomba, tamanho_bomba), 2, 3)
+
+                # Texto "BOMBA" acima
+                fonte_bomba = obter_fonte(None, 16)
+                texto = renderizar_texto("BOMBA", fonte_bomba, (255, 200, 0))
+                texto_rect = texto.get_rect(center=(int(bomba_x), int(bomba_y) - 18))
+                mundo_surface.blit(texto, texto_rect)
+
+            # Desenhar partículas (por cima de tudo)
+            for particula in self.particulas:
+                particula.desenhar_offset(mundo_surface, -self.camera_x, -self.camera_y)
 
         # Escalar a superfície do mundo para aplicar o zoom
-        mundo_escalado = pygame.transform.scale(mundo_surface, (LARGURA, ALTURA_JOGO))
-        self.tela.blit(mundo_escalado, (0, 0))
+        with escopo('render_zoom'):
+            # Direto na área do jogo da tela, sem superfície escalada nova
+            # (escalar_em volta para o scale com cópia se os formatos diferem)
+            if self._area_mundo is None or self._area_mundo.get_parent() is not self.tela:
+                self._area_mundo = self.tela.subsurface((0, 0, LARGURA, ALTURA_JOGO))
+            escalar_em(mundo_surface, self._area_mundo)
 
         # Desenhar mira (usa método da FaseBase) - na tela principal, não escalada
-        self.renderizar_mira(pos_mouse)
+        with escopo('render_mira'):
+            self.renderizar_mira(pos_mouse)
 
         # Desenhar HUD (usa método da FaseBase)
-        self.renderizar_hud(tempo_atual, [])
+        with escopo('hud'):
+            self.renderizar_hud(tempo_atual, [])
 
-        # Desenhar informações multiplayer
-        self._desenhar_info_multiplayer()
+            # Desenhar informações multiplayer
+            self._desenhar_info_multiplayer()
+
+        # Telemetria de rede (F4)
+        if self.mostrar_overlay_rede:
+            desenhar_overlay_rede(self.tela, self.cliente)
 
         # Tela de vitória/round se o round ou partida acabou
         if self.round_terminado or self.partida_terminada:
             self._desenhar_tela_vitoria()
 
+    def _obter_alvo_mundo(self, largura, altura):
+        """
+        Superfície do mundo no tamanho visível do zoom atual.
+
+        Fica guardada entre frames (até MAX_ALVOS_MUNDO tamanhos, o usado há
+        mais tempo sai primeiro) em vez de uma superfície nova por frame.
+        """
+        chave = (largura, altura)
+        alvo = self._alvos_mundo.pop(chave, None)
+        if alvo is None:
+            alvo = pygame.Surface(chave)
+            if pygame.display.get_surface() is not None:
+                alvo = alvo.convert()
+        self._alvos_mundo[chave] = alvo
+        while len(self._alvos_mundo) > self.MAX_ALVOS_MUNDO:
+            del self._alvos_mundo[next(iter(self._alvos_mundo))]
+        return alvo
+
     def _desenhar_jogador_estilizado(self, surface, tempo_atual):
         """Desenha o jogador com visual idêntico ao da fase_base (Quadrado.desenhar)."""
         import math
@@ -4638,29 +2542,17 @@ class FaseMultiplayer(FaseBase):
                 pygame.draw.circle(surface, (cor_r, cor_g, cor_b),
                                  (particula_x, particula_y), tamanho_particula)
 
-        # Desenhar sombra
-        pygame.draw.rect(surface, (20, 20, 20),
-                        (tela_x + 2, tela_y + 2, tamanho, tamanho), 0, 2)
-
         # Cor a usar (branco se tomou dano recente)
         cor_uso = jogador.cor
         if jogador.efeito_dano > 0:
             cor_uso = BRANCO
             jogador.efeito_dano -= 1
 
-        # Quadrado interior (cor escura)
-        cor_escura = jogador.cor_escura
-        pygame.draw.rect(surface, cor_escura,
-                        (tela_x, tela_y, tamanho + mod_tamanho, tamanho + mod_tamanho), 0, 3)
-
-        # Quadrado exterior (cor principal, menor)
-        pygame.draw.rect(surface, cor_uso,
-                        (tela_x + 1, tela_y + 1, tamanho + mod_tamanho - 2, tamanho + mod_tamanho - 2), 0, 2)
-
-        # Brilho no canto superior esquerdo
-        cor_brilhante = jogador.cor_brilhante
-        pygame.draw.rect(surface, cor_brilhante,
-                        (tela_x + 2, tela_y + 2, 3, 3), 0, 1)
+        # Sombra, quadrado interior (cor escura), exterior (cor principal,
+        # menor) e brilho no canto superior esquerdo
+        surface.blit(sprite_quadrado(tamanho, mod_tamanho, cor_uso, jogador.cor_escura,
+                                     jogador.cor_brilhante, compacto=True),
+                     (tela_x, tela_y))
 
         # ===== MAGO - ESCUDO PROTETOR =====
         if escudo_ativo:
@@ -5242,10 +3134,7 @@ class FaseMultiplayer(FaseBase):
         from src.utils.visual import desenhar_texto
 
         # Overlay escuro
-        overlay = pygame.Surface((LARGURA, ALTURA))
-        overlay.set_alpha(200)
-        overlay.fill((0, 0, 0))
-        self.tela.blit(overlay, (0, 0))
+        desenhar_overlay_cor(self.tela, (0, 0, 0), 200, (LARGURA, ALTURA))
 
         # Verificar se é fim de partida ou fim de round
         if self.partida_terminada:
@@ -5287,8 +3176,8 @@ class FaseMultiplayer(FaseBase):
         altura_visivel = int(ALTURA_JOGO / self.camera_zoom)
 
         for player_id, jogador_remoto in self.jogadores_remotos.items():
-            # Só desenhar se estiver vivo
-            if not getattr(jogador_remoto, 'vivo', True):
+            # Só desenhar se estiver vivo e dentro da área de interesse
+            if not getattr(jogador_remoto, 'vivo', True) or not jogador_remoto.visivel:
                 continue
 
             # Posição na tela (com câmera)
@@ -5298,26 +3187,10 @@ class FaseMultiplayer(FaseBase):
 
             # Só desenhar se estiver visível na tela
             if -50 < tela_x < largura_visivel + 50 and -50 < tela_y < altura_visivel + 50:
-                # Gerar cores derivadas
+                # Sombra, interior, corpo e brilho (as cores derivadas só
+                # são calculadas quando o sprite da cor é montado)
                 cor = jogador_remoto.cor
-                cor_escura = tuple(max(0, c - 50) for c in cor)
-                cor_brilhante = tuple(min(255, c + 70) for c in cor)
-
-                # Desenhar sombra
-                pygame.draw.rect(surface, (20, 20, 20),
-                                (tela_x + 2, tela_y + 2, tamanho, tamanho), 0, 2)
-
-                # Quadrado interior (cor escura)
-                pygame.draw.rect(surface, cor_escura,
-                                (tela_x, tela_y, tamanho, tamanho), 0, 3)
-
-                # Quadrado exterior (cor principal)
-                pygame.draw.rect(surface, cor,
-                                (tela_x + 1, tela_y + 1, tamanho - 2, tamanho - 2), 0, 2)
-
-                # Brilho no canto
-                pygame.draw.rect(surface, cor_brilhante,
-                                (tela_x + 2, tela_y + 2, 3, 3), 0, 1)
+                surface.blit(sprite_quadrado(tamanho, 0, cor, compacto=True), (tela_x, tela_y))
 
                 # Barra de vida
                 vida_largura = tamanho + 4
@@ -5332,7 +3205,7 @@ class FaseMultiplayer(FaseBase):
                                     (tela_x - 2, tela_y - 8, vida_barra, altura_barra), 0, 1)
 
                 # Nome acima do jogador (fonte menor)
-                nome_surface = self.fonte_pequena.render(jogador_remoto.nome, True, BRANCO)
+                nome_surface = renderizar_texto(jogador_remoto.nome, self.fonte_pequena, BRANCO)
                 nome_surface = pygame.transform.scale(nome_surface,
                     (nome_surface.get_width() // 2, nome_surface.get_height() // 2))
                 nome_rect = nome_surface.get_rect(center=(tela_x + tamanho // 2, tela_y - 14))
@@ -5378,10 +3251,7 @@ class FaseMultiplayer(FaseBase):
                         surface.blit(nome_surface, nome_rect)
                         continue  # Pular o resto do desenho
 
-                # Gerar cores derivadas
                 cor = bot.cor
-                cor_escura = tuple(max(0, c - 50) for c in cor)
-                cor_brilhante = tuple(min(255, c + 70) for c in cor)
 
                 # Efeito de pulsação para bots
                 pulsando = getattr(bot, 'pulsando', 0)
@@ -5396,21 +3266,10 @@ class FaseMultiplayer(FaseBase):
                 else:
                     mod_tamanho = int((12 - pulsando) * 0.3)
 
-                # Desenhar sombra
-                pygame.draw.rect(surface, (20, 20, 20),
-                                (tela_x + 2, tela_y + 2, tamanho, tamanho), 0, 2)
-
-                # Quadrado interior (cor escura)
-                pygame.draw.rect(surface, cor_escura,
-                                (tela_x, tela_y, tamanho + mod_tamanho, tamanho + mod_tamanho), 0, 3)
-
-                # Quadrado exterior (cor principal)
-                pygame.draw.rect(surface, cor,
-                                (tela_x + 1, tela_y + 1, tamanho + mod_tamanho - 2, tamanho + mod_tamanho - 2), 0, 2)
-
-                # Brilho no canto
-                pygame.draw.rect(surface, cor_brilhante,
-                                (tela_x + 2, tela_y + 2, 3, 3), 0, 1)
+                # Sombra, interior (cor escura), corpo e brilho no canto; as
+                # cores derivadas só são calculadas quando o sprite é montado
+                surface.blit(sprite_quadrado(tamanho, mod_tamanho, cor, compacto=True),
+                             (tela_x, tela_y))
 
                 # ====== VISUAIS DE CLASSE DO BOT ======
                 classe_bot = getattr(bot, 'classe', None)
@@ -5570,7 +3429,7 @@ class FaseMultiplayer(FaseBase):
 
                 # Indicador "BOMBER" se for o bomber (em cima do nome)
                 if getattr(bot, 'é_bomber', False) and not self.bomba_plantada:
-                    bomber_surface = self.fonte_pequena.render("BOMBER", True, (255, 150, 0))
+                    bomber_surface = renderizar_texto("BOMBER", self.fonte_pequena, (255, 150, 0))
                     bomber_surface = pygame.transform.scale(bomber_surface,
                         (bomber_surface.get_width() // 2, bomber_surface.get_height() // 2))
                     bomber_rect = bomber_surface.get_rect(center=(tela_x + tamanho // 2, tela_y - 22))
@@ -5597,7 +3456,7 @@ class FaseMultiplayer(FaseBase):
                         pygame.draw.rect(surface, (100, 255, 100), (barra_x, barra_y, progresso_largura, barra_altura), 0, 2)
 
                     # Texto "PLANTANDO"
-                    plant_surface = self.fonte_pequena.render("PLANTANDO", True, (255, 200, 50))
+                    plant_surface = renderizar_texto("PLANTANDO", self.fonte_pequena, (255, 200, 50))
                     plant_surface = pygame.transform.scale(plant_surface,
                         (plant_surface.get_width() // 2, plant_surface.get_height() // 2))
                     plant_rect = plant_surface.get_rect(center=(tela_x + tamanho // 2, tela_y - 38))
@@ -5685,7 +3544,7 @@ class FaseMultiplayer(FaseBase):
         # Latência
         latencia = self.cliente.get_latency() if hasattr(self.cliente, 'get_latency') else 0
         cor_latencia = VERDE if latencia < 50 else (AMARELO if latencia < 100 else VERMELHO)
-        texto_latencia = self.fonte_pequena.render(f"Ping: {latencia:.0f}ms", True, cor_latencia)
+        texto_latencia = renderizar_texto(f"Ping: {latencia:.0f}ms", self.fonte_pequena, cor_latencia)
         self.tela.blit(texto_latencia, (LARGURA - 150, ALTURA_JOGO + 10))
 
         # Contar membros vivos de cada time
@@ -5709,14 +3568,14 @@ class FaseMultiplayer(FaseBase):
                     time_q_vivos += 1
 
         # Mostrar contagem por time
-        texto_time_t = self.fonte_pequena.render(f"Time T: {time_t_vivos}", True, self.COR_TIME_T)
-        texto_time_q = self.fonte_pequena.render(f"Time Q: {time_q_vivos}", True, self.COR_TIME_Q)
+        texto_time_t = renderizar_texto(f"Time T: {time_t_vivos}", self.fonte_pequena, self.COR_TIME_T)
+        texto_time_q = renderizar_texto(f"Time Q: {time_q_vivos}", self.fonte_pequena, self.COR_TIME_Q)
         self.tela.blit(texto_time_t, (LARGURA - 150, ALTURA_JOGO + 35))
         self.tela.blit(texto_time_q, (LARGURA - 150, ALTURA_JOGO + 55))
 
         # Mostrar time do jogador
         cor_time = self.COR_TIME_T if self.time_jogador == 'T' else self.COR_TIME_Q
-        texto_meu_time = self.fonte_pequena.render(f"Seu time: {self.time_jogador}", True, cor_time)
+        texto_meu_time = renderizar_texto(f"Seu time: {self.time_jogador}", self.fonte_pequena, cor_time)
         self.tela.blit(texto_meu_time, (10, ALTURA_JOGO + 35))
 
         # Mostrar classe e habilidade (ambos os times)
@@ -5726,7 +3585,7 @@ class FaseMultiplayer(FaseBase):
 
             if dados_classe:
                 # Nome da classe
-                texto_classe = self.fonte_pequena.render(f"Classe: {dados_classe['nome']}", True, dados_classe['cor'])
+                texto_classe = renderizar_texto(f"Classe: {dados_classe['nome']}", self.fonte_pequena, dados_classe['cor'])
                 self.tela.blit(texto_classe, (10, ALTURA_JOGO + 55))
 
                 # Barra de cooldown da habilidade
@@ -5750,19 +3609,19 @@ class FaseMultiplayer(FaseBase):
                             tempo_ativo = tempo_atual - self.habilidade_tempo_inicio
                             progresso = max(0, 1 - (tempo_ativo / duracao))
                             pygame.draw.rect(self.tela, (100, 255, 100), (barra_x, barra_y, int(barra_largura * progresso), barra_altura), 0, 3)
-                            texto_hab = self.fonte_pequena.render("ATIVO!", True, (100, 255, 100))
+                            texto_hab = renderizar_texto("ATIVO!", self.fonte_pequena, (100, 255, 100))
                         else:
-                            texto_hab = self.fonte_pequena.render("ATIVO!", True, (100, 255, 100))
+                            texto_hab = renderizar_texto("ATIVO!", self.fonte_pequena, (100, 255, 100))
                     elif tempo_desde_uso < cooldown:
                         # Barra de cooldown
                         progresso = tempo_desde_uso / cooldown
                         pygame.draw.rect(self.tela, (100, 100, 100), (barra_x, barra_y, int(barra_largura * progresso), barra_altura), 0, 3)
                         tempo_restante = (cooldown - tempo_desde_uso) / 1000
-                        texto_hab = self.fonte_pequena.render(f"ESPACO ({tempo_restante:.1f}s)", True, (150, 150, 150))
+                        texto_hab = renderizar_texto(f"ESPACO ({tempo_restante:.1f}s)", self.fonte_pequena, (150, 150, 150))
                     else:
                         # Pronto para usar
                         pygame.draw.rect(self.tela, dados_classe['cor'], (barra_x, barra_y, barra_largura, barra_altura), 0, 3)
-                        texto_hab = self.fonte_pequena.render("ESPACO (Pronto!)", True, dados_classe['cor'])
+                        texto_hab = renderizar_texto("ESPACO (Pronto!)", self.fonte_pequena, dados_classe['cor'])
 
                     self.tela.blit(texto_hab, (barra_x, barra_y + 12))
 
@@ -5898,10 +3757,7 @@ class FaseMultiplayer(FaseBase):
         from src.utils.display_manager import convert_mouse_position
 
         # Overlay semi-transparente
-        overlay = pygame.Surface((LARGURA, ALTURA_JOGO))
-        overlay.set_alpha(180)
-        overlay.fill((0, 0, 0))
-        self.tela.blit(overlay, (0, 0))
+        desenhar_overlay_cor(self.tela, (0, 0, 0), 180, (LARGURA, ALTURA_JOGO))
 
         mouse_pos = convert_mouse_position(pygame.mouse.get_pos())
         tempo_restante = max(0, (self.tempo_compra - (pygame.time.get_ticks() - self.tempo_inicio_round)) // 1000)
@@ -6191,34 +4047,35 @@ class FaseMultiplayer(FaseBase):
         return True
 
     def _atualizar_tempo_compra(self):
-        """Atualiza o estado do tempo de compra."""
+        """Encerra o tempo de compra quando a simulação encerra (também com o menu aberto)."""
         if not self.mapa_carregado:
             return
 
-        tempo_atual = pygame.time.get_ticks()
-        tempo_decorrido = tempo_atual - self.tempo_inicio_round
+        bomba = self._obter_estado_simulacao().get('bomb')
+        if bomba and not bomba['tempo_compra']:
+            self._encerrar_tempo_compra()
 
-        if tempo_decorrido >= self.tempo_compra:
-            if self.em_tempo_compra:
-                self.em_tempo_compra = False
-                self.menu_compra_aberto = False
-                pygame.mouse.set_visible(False)
-                print("[MULTIPLAYER] Tempo de compra encerrado!")
+    def _encerrar_tempo_compra(self):
+        """Fecha o menu de compra e libera o movimento."""
+        if self.em_tempo_compra:
+            self.em_tempo_compra = False
+            self.menu_compra_aberto = False
+            pygame.mouse.set_visible(False)
+            print("[MULTIPLAYER] Tempo de compra encerrado!")
 
     def _mostrar_introducao_multiplayer(self, tempo_atual):
         """Mostra a tela de introdução do multiplayer."""
         import math
-        from src.utils.visual import desenhar_texto, desenhar_estrelas
+        from src.utils.visual import desenhar_texto
 
         self.contador_inicio -= 1
         if self.contador_inicio <= 0:
             self.mostrando_inicio = False
 
-        self.tela.fill((0, 0, 0))
-        self.tela.blit(self.gradiente_jogo, (0, 0))
-
-        # Desenhar estrelas
-        desenhar_estrelas(self.tela, self.estrelas)
+        # Gradiente e estrelas (camadas de paralaxe da FaseBase)
+        fundo = self._obter_fundo()
+        fundo.atualizar()
+        fundo.desenhar(self.tela)
 
         # Texto de introdução com efeito
         tamanho = 70 + int(math.sin(tempo_atual / 200) * 5)
@@ -6261,10 +4118,7 @@ class FaseMultiplayer(FaseBase):
                         return  # Sair da fase
 
             # Desenhar com overlay escuro
-            overlay = pygame.Surface((LARGURA, ALTURA))
-            overlay.set_alpha(180)
-            overlay.fill((0, 0, 0))
-            self.tela.blit(overlay, (0, 0))
+            desenhar_overlay_cor(self.tela, (0, 0, 0), 180, (LARGURA, ALTURA))
 
             desenhar_texto(self.tela, "PAUSADO", 72, BRANCO, LARGURA // 2, ALTURA // 2 - 80)
 
@@ -6273,7 +4127,7 @@ class FaseMultiplayer(FaseBase):
             cor_continuar = (60, 200, 60) if hover_continuar else (40, 150, 40)
             pygame.draw.rect(self.tela, cor_continuar, btn_continuar, 0, 15)
             pygame.draw.rect(self.tela, BRANCO, btn_continuar, 3, 15)
-            texto_continuar = self.fonte_normal.render("CONTINUAR", True, BRANCO)
+            texto_continuar = renderizar_texto("CONTINUAR", self.fonte_normal, BRANCO)
             self.tela.blit(texto_continuar, (btn_continuar.centerx - texto_continuar.get_width() // 2,
                                             btn_continuar.centery - texto_continuar.get_height() // 2))
 
@@ -6282,7 +4136,7 @@ class FaseMultiplayer(FaseBase):
             cor_sair = (200, 60, 60) if hover_sair else (150, 40, 40)
             pygame.draw.rect(self.tela, cor_sair, btn_sair, 0, 15)
             pygame.draw.rect(self.tela, BRANCO, btn_sair, 3, 15)
-            texto_sair = self.fonte_normal.render("SAIR", True, BRANCO)
+            texto_sair = renderizar_texto("SAIR", self.fonte_normal, BRANCO)
             self.tela.blit(texto_sair, (btn_sair.centerx - texto_sair.get_width() // 2,
                                        btn_sair.centery - texto_sair.get_height() // 2))
 
@@ -6297,6 +4151,7 @@ def jogar_fase_multiplayer(tela, relogio, gradiente_jogo, fonte_titulo, fonte_no
 
     Args:
         customizacao: Dict com 'cor' e 'bots' para customizar o personagem e adicionar bots
+                      ('authoritative' = bots, bomba e rounds simulados no servidor)
 
     Returns:
         "menu" para voltar ao menu
@@ -6314,7 +4169,8 @@ def jogar_fase_multiplayer(tela, relogio, gradiente_jogo, fonte_titulo, fonte_no
         fonte_normal=fonte_normal,
         cliente=cliente,
         nome_jogador=nome_jogador,
-        bots=bots
+        bots=bots,
+        simulacao_servidor=bool(customizacao and customizacao.get('authoritative'))
     )
 
     # A cor do jogador é determinada pelo time escolhido na tela de seleção
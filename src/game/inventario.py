@@ -12,8 +12,10 @@ import os
 import random
 import math
 from src.config import *
-from src.utils.visual import criar_estrelas, desenhar_estrelas, desenhar_texto, criar_botao
+from src.utils.visual import criar_estrelas, desenhar_estrelas, rects_estrelas, desenhar_texto, criar_botao, desenhar_overlay_cor
 from src.utils.display_manager import present_frame,convert_mouse_position
+from src.utils.saves import caminho_dados, pasta_dados
+from src.ui.retained_ui import TelaRetida, AreaAnimada
 
 class InventarioManager:
     """Gerencia o inventário e a seleção de armas/itens do jogador."""
@@ -21,7 +23,7 @@ class InventarioManager:
     def __init__(self):
         self.arma_selecionada = "nenhuma"
         self.item_selecionado = "nenhum"
-        self.arquivo_inventario = "data/inventario.json"
+        self.arquivo_inventario = caminho_dados("inventario.json")
         self.carregar_inventario()
     
     def carregar_inventario(self):
@@ -42,7 +44,7 @@ class InventarioManager:
     def salvar_inventario(self):
         """Salva a configuração atual do inventário."""
         try:
-            os.makedirs("data", exist_ok=True)
+            os.makedirs(pasta_dados(), exist_ok=True)
             data = {
                 "arma_selecionada": self.arma_selecionada,
                 "item_selecionado": self.item_selecionado
@@ -148,8 +150,8 @@ class InventarioManager:
         }
         
         try:
-            if os.path.exists("data/upgrades.json"):
-                with open("data/upgrades.json", "r") as f:
+            if os.path.exists(caminho_dados("upgrades.json")):
+                with open(caminho_dados("upgrades.json"), "r") as f:
                     upgrades = json.load(f)
                     for arma_key in armas_info:
                         armas_info[arma_key]["quantidade"] = upgrades.get(arma_key, 0)
@@ -216,8 +218,8 @@ class InventarioManager:
         }
         
         try:
-            if os.path.exists("data/upgrades.json"):
-                with open("data/upgrades.json", "r") as f:
+            if os.path.exists(caminho_dados("upgrades.json")):
+                with open(caminho_dados("upgrades.json"), "r") as f:
                     upgrades = json.load(f)
                     for item_key in itens_info:
                         itens_info[item_key]["quantidade"] = upgrades.get(item_key, 0)
@@ -226,16 +228,24 @@ class InventarioManager:
         
         return itens_info
 
-def desenhar_fundo_futurista(tela, tempo_atual):
-    """Desenha um fundo futurista com efeitos de particulas."""
-    # Particulas de energia flutuantes
+def _particulas_fundo_futurista(tempo_atual):
+    """Centro e raio das particulas de energia do fundo futurista."""
     for i in range(20):
         x = (tempo_atual / 10 + i * 73) % LARGURA
         y = 100 + 400 * math.sin((tempo_atual / 2000 + i) * 0.5)
         size = 2 + int(math.sin(tempo_atual / 300 + i) * 2)
-        alpha = int(100 + 100 * math.sin(tempo_atual / 500 + i))
-        cor = (0, 150, 255, alpha)
-        pygame.draw.circle(tela, (0, 150, 255), (int(x), int(y)), size)
+        yield int(x), int(y), size
+
+def desenhar_fundo_futurista(tela, tempo_atual):
+    """Desenha um fundo futurista com efeitos de particulas."""
+    # Particulas de energia flutuantes
+    for x, y, size in _particulas_fundo_futurista(tempo_atual):
+        pygame.draw.circle(tela, (0, 150, 255), (x, y), size)
+
+def rects_fundo_futurista(tempo_atual):
+    """Regiões que o desenhar_fundo_futurista pinta no mesmo tempo (camada da tela retida)."""
+    return [pygame.Rect(x - size, y - size, 2 * size + 1, 2 * size + 1)
+            for x, y, size in _particulas_fundo_futurista(tempo_atual) if size > 0]
 
 def desenhar_icone_ampulheta_moderno(tela, x, y, tempo_atual, tamanho=30):
     """Desenha ícone moderno da ampulheta com efeitos visuais avançados."""
@@ -782,8 +792,34 @@ def desenhar_icone_metralhadora_moderno(tela, x, y, tempo_atual, tamanho=35):
     pygame.draw.line(tela, cor_laranja, (x, y), (ponta_metra_x, ponta_metra_y), 1)
 
 
-def desenhar_card_item_moderno(tela, item_data, item_key, x, y, largura, altura, selecionado, tempo_atual, hover=False):
-    """Desenha um card moderno para um item do inventário."""
+def alpha_brilho_lendario(tempo_atual):
+    """Alpha do brilho pulsante dos cards lendários (0 = apagado)."""
+    brilho_pulso = (math.sin(tempo_atual / 300) + 1) / 2
+    if brilho_pulso <= 0.7:
+        return 0
+    return max(0, min(255, int(100 * (brilho_pulso - 0.7) / 0.3)))
+
+def desenhar_brilho_lendario(tela, x, y, tempo_atual, largura, altura, cor_brilho):
+    """Desenha o brilho pulsante em volta de um card lendário."""
+    alpha = alpha_brilho_lendario(tempo_atual)
+    if alpha > 0:
+        brilho_surf = pygame.Surface((largura + 20, altura + 20), pygame.SRCALPHA)
+        brilho_color = tuple(list(cor_brilho) + [alpha])
+        pygame.draw.rect(brilho_surf, brilho_color, (0, 0, largura + 20, altura + 20), 0, 20)
+        tela.blit(brilho_surf, (x - 10, y - 10))
+
+def desenhar_card_item_moderno(tela, item_data, item_key, x, y, largura, altura, selecionado, tempo_atual, hover=False,
+                               animados=None, frente=None):
+    """
+    Desenha um card moderno para um item do inventário.
+
+    Com animados (ConteudoAnimado da tela retida, src/ui/retained_ui.py), o
+    brilho lendário e o ícone viram animações e os textos, o badge e o
+    status vão para a superfície frente, que fica por cima delas.
+    """
+    if frente is None:
+        frente = tela
+    
     # Verificar se tem estoque
     tem_estoque = item_data["quantidade"] > 0
     
@@ -835,88 +871,94 @@ def desenhar_card_item_moderno(tela, item_data, item_key, x, y, largura, altura,
     
     # Efeito de brilho para itens lendários (apenas se tem estoque)
     if tem_estoque and raridade == "Legendary":
-        brilho_pulso = (math.sin(tempo_atual / 300) + 1) / 2
-        if brilho_pulso > 0.7:
-            brilho_surf = pygame.Surface((largura + 20, altura + 20), pygame.SRCALPHA)
-            alpha = max(0, min(255, int(100 * (brilho_pulso - 0.7) / 0.3)))
-            brilho_color = tuple(list(cor_brilho) + [alpha])
-            pygame.draw.rect(brilho_surf, brilho_color, (0, 0, largura + 20, altura + 20), 0, 20)
-            tela.blit(brilho_surf, (x - 10, y - 10))
+        if animados is not None:
+            animados.animar(desenhar_brilho_lendario, x, y, largura, altura, cor_brilho,
+                            rect=(x - 10, y - 10, largura + 20, altura + 20),
+                            estado=lambda: alpha_brilho_lendario(pygame.time.get_ticks()))
+        else:
+            desenhar_brilho_lendario(tela, x, y, tempo_atual, largura, altura, cor_brilho)
     
     # Ícone do item
     icone_x = x + 60
     icone_y = y + altura // 2
     
+    funcao_icone = None
     if item_key == "ampulheta":
-        desenhar_icone_ampulheta_moderno(tela, icone_x, icone_y, tempo_atual)
+        funcao_icone = desenhar_icone_ampulheta_moderno
     elif item_key == "granada":
-        desenhar_icone_granada_moderno(tela, icone_x, icone_y, tempo_atual)
+        funcao_icone = desenhar_icone_granada_moderno
     elif item_key == "faca":
-        desenhar_icone_faca_moderno(tela, icone_x, icone_y, tempo_atual)
+        funcao_icone = desenhar_icone_faca_moderno
     elif item_key == "dimensional_hop":
-        desenhar_icone_dimensional_hop_moderno(tela, icone_x, icone_y, tempo_atual)
+        funcao_icone = desenhar_icone_dimensional_hop_moderno
     elif item_key == "espingarda":
-        desenhar_icone_espingarda_moderno(tela, icone_x, icone_y, tempo_atual)
+        funcao_icone = desenhar_icone_espingarda_moderno
     elif item_key == "spas12":
-        desenhar_icone_spas12_moderno(tela, icone_x, icone_y, tempo_atual)
+        funcao_icone = desenhar_icone_spas12_moderno
     elif item_key == "metralhadora":
-        desenhar_icone_metralhadora_moderno(tela, icone_x, icone_y, tempo_atual)
+        funcao_icone = desenhar_icone_metralhadora_moderno
     elif item_key == "sabre_luz":
-        desenhar_icone_sabre_moderno(tela, icone_x, icone_y, tempo_atual)
+        funcao_icone = desenhar_icone_sabre_moderno
     elif item_key == "desert_eagle":
-        desenhar_icone_desert_eagle_moderno(tela, icone_x, icone_y, tempo_atual)
+        funcao_icone = desenhar_icone_desert_eagle_moderno
     elif item_key == "sniper":
-        desenhar_icone_sniper_moderno(tela, icone_x, icone_y, tempo_atual)
+        funcao_icone = desenhar_icone_sniper_moderno
+    
+    if funcao_icone is not None:
+        if animados is not None:
+            animados.animar(funcao_icone, icone_x, icone_y)
+        else:
+            funcao_icone(tela, icone_x, icone_y, tempo_atual)
 
     # Nome do item
     cor_texto = BRANCO if tem_estoque else (100, 100, 100)
-    desenhar_texto(tela, item_data["nome"], 24, cor_texto, x + 150, y + 25)
+    desenhar_texto(frente, item_data["nome"], 24, cor_texto, x + 150, y + 25)
     
     # Quantidade/munição
     if item_data["tipo"] == "arma":
         if item_key == "sabre_luz":
-            desenhar_texto(tela, f"Energy", 18, cor_texto, x + 150, y + 50)
+            desenhar_texto(frente, f"Energy", 18, cor_texto, x + 150, y + 50)
         else:
-            desenhar_texto(tela, f"Ammo: {item_data['quantidade']}", 18, cor_texto, x + 150, y + 50)
+            desenhar_texto(frente, f"Ammo: {item_data['quantidade']}", 18, cor_texto, x + 150, y + 50)
     else:
-        desenhar_texto(tela, f"Uses: {item_data['quantidade']}", 18, cor_texto, x + 150, y + 50)
+        desenhar_texto(frente, f"Uses: {item_data['quantidade']}", 18, cor_texto, x + 150, y + 50)
     
     # Descrição
-    desenhar_texto(tela, item_data["descricao"], 14, cor_texto, x + 150, y + 75)
+    desenhar_texto(frente, item_data["descricao"], 14, cor_texto, x + 150, y + 75)
     
     # Estatísticas especiais
     cor_stats = (150, 150, 150) if tem_estoque else (80, 80, 80)
     if item_data["tipo"] == "arma":
-        desenhar_texto(tela, f"Damage: {item_data.get('dano', 'N/A')}", 12, cor_stats, x + 150, y + 95)
-        desenhar_texto(tela, f"Range: {item_data.get('alcance', 'N/A')}", 12, cor_stats, x + 350, y + 95)
+        desenhar_texto(frente, f"Damage: {item_data.get('dano', 'N/A')}", 12, cor_stats, x + 150, y + 95)
+        desenhar_texto(frente, f"Range: {item_data.get('alcance', 'N/A')}", 12, cor_stats, x + 350, y + 95)
     else:
-        desenhar_texto(tela, f"Effect: {item_data.get('efeito', 'N/A')}", 12, cor_stats, x + 150, y + 95)
-        desenhar_texto(tela, f"Duration: {item_data.get('duracao', 'N/A')}", 12, cor_stats, x + 300, y + 95)
+        desenhar_texto(frente, f"Effect: {item_data.get('efeito', 'N/A')}", 12, cor_stats, x + 150, y + 95)
+        desenhar_texto(frente, f"Duration: {item_data.get('duracao', 'N/A')}", 12, cor_stats, x + 300, y + 95)
     
     # Badge de raridade
     badge_x = x + largura - 80
     badge_y = y + 10
     badge_rect = pygame.Rect(badge_x, badge_y, 70, 20)
     badge_color = cor_brilho if tem_estoque else (100, 100, 100)
-    pygame.draw.rect(tela, badge_color, badge_rect, 0, 10)
-    desenhar_texto(tela, raridade.upper(), 10, (0, 0, 0), badge_x + 35, badge_y + 10)
+    pygame.draw.rect(frente, badge_color, badge_rect, 0, 10)
+    desenhar_texto(frente, raridade.upper(), 10, (0, 0, 0), badge_x + 35, badge_y + 10)
     
     # Status de seleção
     if tem_estoque and selecionado:
         # Checkmark
         check_x = x + largura - 40
         check_y = y + altura - 40
-        pygame.draw.circle(tela, VERDE, (check_x, check_y), 15)
-        pygame.draw.polygon(tela, BRANCO, [
+        pygame.draw.circle(frente, VERDE, (check_x, check_y), 15)
+        pygame.draw.polygon(frente, BRANCO, [
             (check_x - 8, check_y),
             (check_x - 3, check_y + 5),
             (check_x + 8, check_y - 5)
         ], 3)
-        desenhar_texto(tela, "EQUIPPED", 12, VERDE, x + largura - 100, y + altura - 15)
+        desenhar_texto(frente, "EQUIPPED", 12, VERDE, x + largura - 100, y + altura - 15)
     elif not tem_estoque:
-        desenhar_texto(tela, "NOT PURCHASED", 12, VERMELHO, x + largura - 120, y + altura - 15)
+        desenhar_texto(frente, "NOT PURCHASED", 12, VERMELHO, x + largura - 120, y + altura - 15)
     else:
-        desenhar_texto(tela, "Click to equip", 12, CIANO, x + largura - 120, y + altura - 15)
+        desenhar_texto(frente, "Click to equip", 12, CIANO, x + largura - 120, y + altura - 15)
 
 def tela_inventario(tela, relogio, gradiente_inventario, fonte_titulo, fonte_normal):
     """
@@ -935,109 +977,37 @@ def tela_inventario(tela, relogio, gradiente_inventario, fonte_titulo, fonte_nor
     max_scroll = 0
     aba_ativa = 0
     
-    while True:
-        tempo_atual = pygame.time.get_ticks()
-        
-        for evento in pygame.event.get():
-            if evento.type == pygame.QUIT:
-                return None
-            
-            if evento.type == pygame.KEYDOWN:
-                if evento.key == pygame.K_ESCAPE:
-                    return None
-                if evento.key == pygame.K_1:
-                    aba_ativa = 0
-                    scroll_y = 0
-                if evento.key == pygame.K_2:
-                    aba_ativa = 1
-                    scroll_y = 0
-            
-            if evento.type == pygame.MOUSEBUTTONDOWN:
-                if evento.button == 1:
-                    mouse_pos = convert_mouse_position(pygame.mouse.get_pos())
-                    
-                    # Verificar abas
-                    aba_largura = 250
-                    aba_altura = 60
-                    aba1_x = LARGURA // 2 - 130
-                    aba2_x = LARGURA // 2 + 130
-                    aba_y = 180
-                    
-                    rect_aba1 = pygame.Rect(aba1_x - aba_largura//2, aba_y - aba_altura//2, aba_largura, aba_altura)
-                    rect_aba2 = pygame.Rect(aba2_x - aba_largura//2, aba_y - aba_altura//2, aba_largura, aba_altura)
-                    
-                    if rect_aba1.collidepoint(mouse_pos):
-                        aba_ativa = 0
-                        scroll_y = 0
-                    elif rect_aba2.collidepoint(mouse_pos):
-                        aba_ativa = 1
-                        scroll_y = 0
-                    
-                    # Verificar cliques nos cards
-                    y_inicial = 270 - scroll_y
-                    card_altura = 130
-                    espaco_cards = 20
-                    
-                    if aba_ativa == 0:  # Armas
-                        armas = inventario_manager.obter_armas_disponiveis()
-                        arma_atual = inventario_manager.obter_arma_selecionada()
-                        
-                        for i, (arma_key, arma_data) in enumerate(armas.items()):
-                            # Sempre mostrar todos os itens, não filtrar por quantidade
-                            y_card = y_inicial + i * (card_altura + espaco_cards)
-                            card_rect = pygame.Rect(LARGURA // 2 - 350, y_card, 700, card_altura)
-                            
-                            # Apenas permitir clique se tem estoque e está visível
-                            if (card_rect.collidepoint(mouse_pos) and 
-                                y_card > 200 and y_card < ALTURA - 150 and
-                                arma_data["quantidade"] > 0):
-                                inventario_manager.selecionar_arma(
-                                    arma_key if arma_key != arma_atual else "nenhuma"
-                                )
-                    
-                    else:  # Itens
-                        itens = inventario_manager.obter_itens_disponiveis()
-                        item_atual = inventario_manager.obter_item_selecionado()
-                        
-                        for i, (item_key, item_data) in enumerate(itens.items()):
-                            # Sempre mostrar todos os itens, não filtrar por quantidade
-                            y_card = y_inicial + i * (card_altura + espaco_cards)
-                            card_rect = pygame.Rect(LARGURA // 2 - 350, y_card, 700, card_altura)
-                            
-                            # Apenas permitir clique se tem estoque e está visível
-                            if (card_rect.collidepoint(mouse_pos) and 
-                                y_card > 200 and y_card < ALTURA - 150 and
-                                item_data["quantidade"] > 0):
-                                inventario_manager.selecionar_item(
-                                    item_key if item_key != item_atual else "nenhum"
-                                )
-                    
-                    # Botão voltar
-                    if pygame.Rect(60, ALTURA - 80, 180, 50).collidepoint(mouse_pos):
-                        return "menu"
-                
-                elif evento.button == 4:  # Scroll up
-                    scroll_y = max(0, scroll_y - 40)
-                elif evento.button == 5:  # Scroll down
-                    scroll_y = min(max_scroll, scroll_y + 40)
-        
-        # Atualizar estrelas
-        for estrela in estrelas:
-            estrela[0] -= estrela[4] * 0.5
-            if estrela[0] < 0:
-                estrela[0] = LARGURA
-                estrela[1] = random.randint(0, ALTURA)
-        
-        # Desenhar fundo
-        tela.blit(gradiente_inventario, (0, 0))
-        desenhar_estrelas(tela, estrelas)
-        desenhar_fundo_futurista(tela, tempo_atual)
-        
+    tempo_atual = pygame.time.get_ticks()
+    mouse_pos = convert_mouse_position(pygame.mouse.get_pos())
+    
+    # Sistema de abas futurista
+    aba_largura = 250
+    aba_altura = 60
+    aba1_x = LARGURA // 2 - 130
+    aba2_x = LARGURA // 2 + 130
+    aba_y = 180
+    rect_aba1 = pygame.Rect(aba1_x - aba_largura//2, aba_y - aba_altura//2, aba_largura, aba_altura)
+    rect_aba2 = pygame.Rect(aba2_x - aba_largura//2, aba_y - aba_altura//2, aba_largura, aba_altura)
+    
+    # Área de conteúdo com clipping
+    conteudo_y = 270
+    conteudo_altura = ALTURA - 350
+    area_conteudo = pygame.Rect(0, conteudo_y, LARGURA, conteudo_altura)
+    card_altura = 130
+    espaco_cards = 20
+    
+    moeda_x = LARGURA - 150
+    moeda_y = 40
+    moeda_bg = pygame.Rect(moeda_x - 60, moeda_y - 20, 120, 40)
+    
+    botao_rect = pygame.Rect(60, ALTURA - 80, 180, 50)
+    instrucoes_y = ALTURA - 120
+    
+    def desenhar_overlay(tela):
         # Overlay semi-transparente para profundidade
-        overlay = pygame.Surface((LARGURA, ALTURA), pygame.SRCALPHA)
-        overlay.fill((0, 0, 20, 100))
-        tela.blit(overlay, (0, 0))
-        
+        desenhar_overlay_cor(tela, (0, 0, 20), 100, (LARGURA, ALTURA))
+    
+    def desenhar_titulo(tela):
         # Título principal com efeitos
         titulo_y = 80
         # Sombra do título
@@ -1047,36 +1017,26 @@ def tela_inventario(tela, relogio, gradiente_inventario, fonte_titulo, fonte_nor
         
         # Subtítulo
         desenhar_texto(tela, "Configure your loadout for battle", 24, (150, 170, 200), LARGURA // 2, titulo_y + 40)
-        
+    
+    def tamanho_moeda():
+        # Ícone da moeda animado
+        moeda_pulso = (math.sin(tempo_atual / 300) + 1) / 2
+        return 12 + int(moeda_pulso * 3)
+    
+    def desenhar_moedas(tela):
         # HUD - Moedas com design futurista
-        moeda_x = LARGURA - 150
-        moeda_y = 40
-        
-        # Fundo da moeda
-        moeda_bg = pygame.Rect(moeda_x - 60, moeda_y - 20, 120, 40)
         pygame.draw.rect(tela, (20, 40, 80, 200), moeda_bg, 0, 20)
         pygame.draw.rect(tela, (100, 150, 255), moeda_bg, 2, 20)
         
-        # Ícone da moeda animado
-        moeda_pulso = (math.sin(tempo_atual / 300) + 1) / 2
-        moeda_size = 12 + int(moeda_pulso * 3)
+        moeda_size = tamanho_moeda()
         pygame.draw.circle(tela, AMARELO, (moeda_x - 30, moeda_y), moeda_size)
         pygame.draw.circle(tela, (255, 215, 0), (moeda_x - 30, moeda_y), moeda_size - 2)
         
         # Quantidade de moedas
         desenhar_texto(tela, f"{moeda_manager.obter_quantidade()}", 20, AMARELO, moeda_x + 10, moeda_y)
-        
-        # Sistema de abas futurista
-        aba_largura = 250
-        aba_altura = 60
-        aba1_x = LARGURA // 2 - 130
-        aba2_x = LARGURA // 2 + 130
-        aba_y = 180
-        
-        mouse_pos = convert_mouse_position(pygame.mouse.get_pos())
-        
+    
+    def desenhar_aba_armas(tela):
         # Aba 1 (Armas)
-        rect_aba1 = pygame.Rect(aba1_x - aba_largura//2, aba_y - aba_altura//2, aba_largura, aba_altura)
         hover_aba1 = rect_aba1.collidepoint(mouse_pos)
         
         cor_aba1_base = (100, 50, 50) if aba_ativa == 0 else (60, 30, 30)
@@ -1090,9 +1050,9 @@ def tela_inventario(tela, relogio, gradiente_inventario, fonte_titulo, fonte_nor
         desenhar_icone_espingarda_moderno(tela, aba1_x - 60, aba_y, tempo_atual, 20)
         desenhar_texto(tela, "WEAPONS", 22, BRANCO, aba1_x + 20, aba_y - 5)
         desenhar_texto(tela, "Press 1", 12, (180, 180, 180), aba1_x + 20, aba_y + 15)
-        
+    
+    def desenhar_aba_itens(tela):
         # Aba 2 (Itens)
-        rect_aba2 = pygame.Rect(aba2_x - aba_largura//2, aba_y - aba_altura//2, aba_largura, aba_altura)
         hover_aba2 = rect_aba2.collidepoint(mouse_pos)
         
         cor_aba2_base = (50, 100, 50) if aba_ativa == 1 else (30, 60, 30)
@@ -1106,70 +1066,48 @@ def tela_inventario(tela, relogio, gradiente_inventario, fonte_titulo, fonte_nor
         desenhar_icone_granada_moderno(tela, aba2_x - 60, aba_y, tempo_atual, 15)
         desenhar_texto(tela, "ITEMS", 22, BRANCO, aba2_x + 20, aba_y - 5)
         desenhar_texto(tela, "Press 2", 12, (180, 180, 180), aba2_x + 20, aba_y + 15)
-        
-        # Área de conteúdo com clipping
-        conteudo_y = 270
-        conteudo_altura = ALTURA - 350
-        
-        # Criar superfície para clipping
-        conteudo_surf = pygame.Surface((LARGURA, conteudo_altura), pygame.SRCALPHA)
-        
-        # Desenhar cards na superfície de conteúdo
+    
+    def montar_cards(superficie, animados):
+        nonlocal max_scroll
+        # Desenhar cards na superfície de conteúdo (a subsuperfície corta
+        # o que passa da área); textos e badges vão para a frente
+        conteudo_surf = superficie.subsurface(area_conteudo)
+        frente = pygame.Surface(conteudo_surf.get_size(), pygame.SRCALPHA)
         y_inicial = -scroll_y
-        card_altura = 130
-        espaco_cards = 20
         
         if aba_ativa == 0:  # Armas
-            armas = inventario_manager.obter_armas_disponiveis()
-            arma_atual = inventario_manager.obter_arma_selecionada()
-            
-            for i, (arma_key, arma_data) in enumerate(armas.items()):
-                y_card = y_inicial + i * (card_altura + espaco_cards)
-                
-                if y_card > -card_altura and y_card < conteudo_altura:
-                    card_x = LARGURA // 2 - 350
-                    card_rect = pygame.Rect(card_x, y_card, 700, card_altura)
-                    # Apenas verificar hover se tem estoque
-                    hover_card = (card_rect.move(0, conteudo_y).collidepoint(mouse_pos) and 
-                                conteudo_y <= mouse_pos[1] <= conteudo_y + conteudo_altura and
-                                arma_data["quantidade"] > 0)
-                    
-                    desenhar_card_item_moderno(
-                        conteudo_surf, arma_data, arma_key, 
-                        card_x, y_card, 700, card_altura,
-                        arma_key == arma_atual, tempo_atual, hover_card
-                    )
-            
-            max_scroll = max(0, len(armas) * (card_altura + espaco_cards) - conteudo_altura + 50)
-            
+            cards = inventario_manager.obter_armas_disponiveis()
+            selecionado = inventario_manager.obter_arma_selecionada()
         else:  # Itens
-            itens = inventario_manager.obter_itens_disponiveis()
-            item_atual = inventario_manager.obter_item_selecionado()
+            cards = inventario_manager.obter_itens_disponiveis()
+            selecionado = inventario_manager.obter_item_selecionado()
+        
+        # O hover vale até a última linha da área (inclusive)
+        area_hover = pygame.Rect(0, conteudo_y, LARGURA, conteudo_altura + 1)
+        for i, (card_key, card_data) in enumerate(cards.items()):
+            y_card = y_inicial + i * (card_altura + espaco_cards)
             
-            for i, (item_key, item_data) in enumerate(itens.items()):
-                y_card = y_inicial + i * (card_altura + espaco_cards)
+            if y_card > -card_altura and y_card < conteudo_altura:
+                card_x = LARGURA // 2 - 350
+                card_rect = pygame.Rect(card_x, y_card, 700, card_altura)
+                # Apenas verificar hover se tem estoque
+                hover_card = (card_rect.move(0, conteudo_y).collidepoint(mouse_pos) and 
+                            conteudo_y <= mouse_pos[1] <= conteudo_y + conteudo_altura and
+                            card_data["quantidade"] > 0)
+                if card_data["quantidade"] > 0:
+                    animados.alvo(card_rect.move(0, conteudo_y).clip(area_hover))
                 
-                if y_card > -card_altura and y_card < conteudo_altura:
-                    card_x = LARGURA // 2 - 350
-                    card_rect = pygame.Rect(card_x, y_card, 700, card_altura)
-                    # Apenas verificar hover se tem estoque
-                    hover_card = (card_rect.move(0, conteudo_y).collidepoint(mouse_pos) and 
-                                conteudo_y <= mouse_pos[1] <= conteudo_y + conteudo_altura and
-                                item_data["quantidade"] > 0)
-                    
-                    desenhar_card_item_moderno(
-                        conteudo_surf, item_data, item_key, 
-                        card_x, y_card, 700, card_altura,
-                        item_key == item_atual, tempo_atual, hover_card
-                    )
-            
-            max_scroll = max(0, len(itens) * (card_altura + espaco_cards) - conteudo_altura + 50)
-        
-        # Aplicar clipping e desenhar conteúdo
-        clip_rect = pygame.Rect(0, 0, LARGURA, conteudo_altura)
-        conteudo_surf.set_clip(clip_rect)
-        tela.blit(conteudo_surf, (0, conteudo_y))
+                desenhar_card_item_moderno(
+                    conteudo_surf, card_data, card_key, 
+                    card_x, y_card, 700, card_altura,
+                    card_key == selecionado, tempo_atual, hover_card,
+                    animados, frente
+                )
         
+        animados.frente(frente, area_conteudo.topleft)
+        max_scroll = max(0, len(cards) * (card_altura + espaco_cards) - conteudo_altura + 50)
+    
+    def desenhar_barra_scroll(tela):
         # Barra de scroll moderna
         if max_scroll > 0:
             barra_x = LARGURA - 15
@@ -1187,10 +1125,9 @@ def tela_inventario(tela, relogio, gradiente_inventario, fonte_titulo, fonte_nor
             
             pygame.draw.rect(tela, (150, 200, 255), 
                            (barra_x, indicador_y, barra_largura, indicador_altura), 0, 4)
-        
+    
+    def desenhar_instrucoes(tela):
         # Instruções na parte inferior
-        instrucoes_y = ALTURA - 120
-        
         if aba_ativa == 0:
             desenhar_texto(tela, "Press E during gameplay to switch weapons", 18, (100, 200, 255), 
                           LARGURA // 2, instrucoes_y)
@@ -1200,9 +1137,9 @@ def tela_inventario(tela, relogio, gradiente_inventario, fonte_titulo, fonte_nor
         
         desenhar_texto(tela, "Use number keys 1-2 or click tabs to navigate • Mouse wheel to scroll", 14, 
                       (150, 150, 200), LARGURA // 2, instrucoes_y + 25)
-        
+    
+    def desenhar_voltar(tela):
         # Botão voltar futurista
-        botao_rect = pygame.Rect(60, ALTURA - 80, 180, 50)
         hover_voltar = botao_rect.collidepoint(mouse_pos)
         
         cor_botao = (80, 50, 100) if hover_voltar else (60, 30, 80)
@@ -1217,6 +1154,127 @@ def tela_inventario(tela, relogio, gradiente_inventario, fonte_titulo, fonte_nor
         ]
         pygame.draw.polygon(tela, BRANCO, seta_pontos)
         desenhar_texto(tela, "BACK TO MENU", 16, BRANCO, 150, ALTURA - 55)
+    
+    # Tela retida: estrelas e partículas nas camadas, overlay e título
+    # fixos, abas e moedas com os ícones animados, e os cards numa
+    # AreaAnimada (montada de novo só com aba, scroll, seleção ou hover)
+    tela_retida = TelaRetida(gradiente_inventario)
+    tela_retida.adicionar_camada(lambda: rects_estrelas(estrelas), lambda tela: desenhar_estrelas(tela, estrelas))
+    tela_retida.adicionar_camada(lambda: rects_fundo_futurista(tempo_atual),
+                                 lambda tela: desenhar_fundo_futurista(tela, tempo_atual))
+    tela_retida.adicionar(tela.get_rect(), desenhar_overlay)
+    tela_retida.adicionar((0, 30, LARGURA, 115), desenhar_titulo)
+    tela_retida.adicionar(moeda_bg, desenhar_moedas,
+                          lambda: (tamanho_moeda(), moeda_manager.obter_quantidade()), opaco=True)
+    # O pino da granada passa da borda de cima da aba
+    tela_retida.adicionar(rect_aba1.inflate(20, 20), desenhar_aba_armas,
+                          lambda: (aba_ativa, rect_aba1.collidepoint(mouse_pos), tempo_atual), opaco=True)
+    tela_retida.adicionar(rect_aba2.inflate(20, 20), desenhar_aba_itens,
+                          lambda: (aba_ativa, rect_aba2.collidepoint(mouse_pos), tempo_atual), opaco=True)
+    area_cards = AreaAnimada(tela_retida, area_conteudo, montar_cards,
+                             origem=area_conteudo.topleft, clip=area_conteudo)
+    tela_retida.adicionar((LARGURA - 15, conteudo_y, 8, conteudo_altura), desenhar_barra_scroll,
+                          lambda: (scroll_y, max_scroll))
+    tela_retida.adicionar((0, instrucoes_y - 15, LARGURA, 50), desenhar_instrucoes, lambda: aba_ativa)
+    tela_retida.adicionar(botao_rect, desenhar_voltar, lambda: botao_rect.collidepoint(mouse_pos), opaco=True)
+    
+    while True:
+        tempo_atual = pygame.time.get_ticks()
+        
+        for evento in pygame.event.get():
+            if evento.type == pygame.QUIT:
+                return None
+            
+            if evento.type == pygame.KEYDOWN:
+                if evento.key == pygame.K_ESCAPE:
+                    return None
+                if evento.key == pygame.K_1:
+                    aba_ativa = 0
+                    scroll_y = 0
+                if evento.key == pygame.K_2:
+                    aba_ativa = 1
+                    scroll_y = 0
+            
+            if evento.type == pygame.MOUSEBUTTONDOWN:
+                if evento.button == 1:
+                    mouse_pos = convert_mouse_position(pygame.mouse.get_pos())
+                    
+                    # Verificar abas
+                    aba_largura = 250
+                    aba_altura = 60
+                    aba1_x = LARGURA // 2 - 130
+                    aba2_x = LARGURA // 2 + 130
+                    aba_y = 180
+                    
+                    rect_aba1 = pygame.Rect(aba1_x - aba_largura//2, aba_y - aba_altura//2, aba_largura, aba_altura)
+                    rect_aba2 = pygame.Rect(aba2_x - aba_largura//2, aba_y - aba_altura//2, aba_largura, aba_altura)
+                    
+                    if rect_aba1.collidepoint(mouse_pos):
+                        aba_ativa = 0
+                        scroll_y = 0
+                    elif rect_aba2.collidepoint(mouse_pos):
+                        aba_ativa = 1
+                        scroll_y = 0
+                    
+                    # Verificar cliques nos cards
+                    y_inicial = 270 - scroll_y
+                    card_altura = 130
+                    espaco_cards = 20
+                    
+                    if aba_ativa == 0:  # Armas
+                        armas = inventario_manager.obter_armas_disponiveis()
+                        arma_atual = inventario_manager.obter_arma_selecionada()
+                        
+                        for i, (arma_key, arma_data) in enumerate(armas.items()):
+                            # Sempre mostrar todos os itens, não filtrar por quantidade
+                            y_card = y_inicial + i * (card_altura + espaco_cards)
+                            card_rect = pygame.Rect(LARGURA // 2 - 350, y_card, 700, card_altura)
+                            
+                            # Apenas permitir clique se tem estoque e está visível
+                            if (card_rect.collidepoint(mouse_pos) and 
+                                y_card > 200 and y_card < ALTURA - 150 and
+                                arma_data["quantidade"] > 0):
+                                inventario_manager.selecionar_arma(
+                                    arma_key if arma_key != arma_atual else "nenhuma"
+                                )
+                    
+                    else:  # Itens
+                        itens = inventario_manager.obter_itens_disponiveis()
+                        item_atual = inventario_manager.obter_item_selecionado()
+                        
+                        for i, (item_key, item_data) in enumerate(itens.items()):
+                            # Sempre mostrar todos os itens, não filtrar por quantidade
+                            y_card = y_inicial + i * (card_altura + espaco_cards)
+                            card_rect = pygame.Rect(LARGURA // 2 - 350, y_card, 700, card_altura)
+                            
+                            # Apenas permitir clique se tem estoque e está visível
+                            if (card_rect.collidepoint(mouse_pos) and 
+                                y_card > 200 and y_card < ALTURA - 150 and
+                                item_data["quantidade"] > 0):
+                                inventario_manager.selecionar_item(
+                                    item_key if item_key != item_atual else "nenhum"
+                                )
+                    
+                    # Botão voltar
+                    if pygame.Rect(60, ALTURA - 80, 180, 50).collidepoint(mouse_pos):
+                        return "menu"
+                
+                elif evento.button == 4:  # Scroll up
+                    scroll_y = max(0, scroll_y - 40)
+                elif evento.button == 5:  # Scroll down
+                    scroll_y = min(max_scroll, scroll_y + 40)
+        
+        # Atualizar estrelas
+        for estrela in estrelas:
+            estrela[0] -= estrela[4] * 0.5
+            if estrela[0] < 0:
+                estrela[0] = LARGURA
+                estrela[1] = random.randint(0, ALTURA)
+        
+        mouse_pos = convert_mouse_position(pygame.mouse.get_pos())
+        area_cards.atualizar((aba_ativa, scroll_y, inventario_manager.obter_arma_selecionada(),
+                              inventario_manager.obter_item_selecionado(),
+                              area_cards.conteudo.alvo_em(mouse_pos)))
         
-        present_frame()
+        present_frame(tela_retida.desenhar(tela))
         relogio.tick(FPS)
\ No newline at end of file
@@ -40,6 +40,7 @@ from src.utils.display_manager import (
     convert_mouse_position,
     get_display_manager
 )
+from src.utils.fonts import obter_fonte
 
 def main_game(game_surface=None):
     """
@@ -73,11 +74,11 @@ def main_game(game_surface=None):
     
     # Criar fontes
     try:
-        fonte_titulo = pygame.font.SysFont("Arial", 72, True)
-        fonte_normal = pygame.font.SysFont("Arial", 24)
+        fonte_titulo = obter_fonte("Arial", 72, True)
+        fonte_normal = obter_fonte("Arial", 24)
     except Exception as e:
-        fonte_titulo = pygame.font.Font(None, 72)
-        fonte_normal = pygame.font.Font(None, 24)
+        fonte_titulo = obter_fonte(None, 72)
+        fonte_normal = obter_fonte(None, 24)
     
     # Inicializar gerenciador de progresso
     progress_manager = ProgressManager()
@@ -305,6 +306,15 @@ def main_game(game_surface=None):
                             from src.ui.lobby import tela_lobby_cliente
                             resultado_lobby, customizacao = tela_lobby_cliente(tela, relogio, gradiente_menu, cliente, config)
 
+                            # Servidor de salas: o portal escolhido leva para a sala do modo
+                            while resultado_lobby == "room":
+                                cliente.disconnect()
+                                cliente = GameClient()
+                                if not cliente.connect(config['host'], config['port'], config['player_name'],
+                                                       room=customizacao['sala']):
+                                    break
+                                resultado_lobby, customizacao = tela_lobby_cliente(tela, relogio, gradiente_menu, cliente, config)
+
                             if resultado_lobby == "start":
                                 modo = customizacao.get('modo', 'Bomb')
                                 if modo == 'Aim':
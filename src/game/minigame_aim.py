@@ -11,12 +11,17 @@ import pygame
 import math
 import random
 from src.config import *
-from src.entities.tiro import Tiro
+from src.entities.tiro import Tiro, desenhar_tiros
 from src.entities.particula import Particula, criar_explosao
 from src.entities.misterioso_cutscene import InimigoMisterioso
 from src.weapons.desert_eagle import desenhar_desert_eagle, criar_efeito_disparo_desert_eagle
-from src.utils.visual import criar_gradiente, criar_estrelas, desenhar_estrelas, criar_mira, desenhar_mira
+from src.utils.visual import criar_gradiente, criar_estrelas, desenhar_estrelas, criar_mira, desenhar_mira, desenhar_overlay_cor
 from src.utils.display_manager import present_frame, convert_mouse_position
+from src.utils.profiler import escopo, secao
+from src.utils.fonts import obter_fonte, renderizar_texto
+from src.network.lockstep import LockstepSession
+from src.network.checksum import StateChecksum
+from src.utils.rng import rng_jogo
 
 # ============================================================
 #  CONSTANTES
@@ -69,14 +74,15 @@ TEMPO_SCOREBOARD = 6000
 class AlvoMovel:
     """Alvo que se move horizontalmente."""
 
-    def __init__(self, indice, config):
+    def __init__(self, indice, config, rng):
+        self.rng = rng  # random.Random da partida (igual em todos os clientes)
         self.indice = indice
         self.tamanho = config['tamanho']
         self.cor = config['cor']
         self.velocidade = config['velocidade']
         self.y = config['y_offset']
         self.x = float(LARGURA // 2)
-        self.direcao = 1 if random.random() > 0.5 else -1
+        self.direcao = 1 if rng.random() > 0.5 else -1
         self.ativo = False
         self.acertado = False
 
@@ -87,8 +93,8 @@ class AlvoMovel:
         self.rect = pygame.Rect(int(self.x), int(self.y), self.tamanho, self.tamanho)
 
     def reset(self):
-        self.x = float(random.randint(ALVO_X_MIN + 100, ALVO_X_MAX - 100))
-        self.direcao = 1 if random.random() > 0.5 else -1
+        self.x = float(self.rng.randint(ALVO_X_MIN + 100, ALVO_X_MAX - 100))
+        self.direcao = 1 if self.rng.random() > 0.5 else -1
         self.ativo = False
         self.acertado = False
 
@@ -121,8 +127,8 @@ class AlvoMovel:
         pygame.draw.rect(tela, self.cor_brilhante, (ix + 4, iy + 4, 7, 7), 0, 2)
 
         # Numero do alvo
-        fonte = pygame.font.SysFont("Arial", 14, True)
-        num = fonte.render(str(self.indice + 1), True, BRANCO)
+        fonte = obter_fonte("Arial", 14, True)
+        num = renderizar_texto(str(self.indice + 1), fonte, BRANCO)
         tela.blit(num, (ix + tam // 2 - num.get_width() // 2,
                         iy + tam // 2 - num.get_height() // 2))
 
@@ -135,7 +141,9 @@ class AlvoMovel:
 class JogadorAim:
     """Jogador ou bot no minigame Aim."""
 
-    def __init__(self, nome, cor, is_bot=True, is_remote=False):
+    def __init__(self, nome, cor, rng, is_bot=True, is_remote=False, player_id=None):
+        self.rng = rng  # random.Random da partida (igual em todos os clientes)
+        self.player_id = player_id  # ID de rede dos humanos (None = bot)
         self.nome = nome
         self.cor = cor
         self.is_bot = is_bot
@@ -162,10 +170,10 @@ class JogadorAim:
         self.bot_mouse_x = POS_TIRO_X
         self.bot_mouse_y = POS_TIRO_Y - 100
         # Quantos alvos o bot vai acertar nesta rodada (1 a 5)
-        self.bot_alvos_acertar = random.randint(1, 5)
+        self.bot_alvos_acertar = rng.randint(1, 5)
         # Cada bot tem seu proprio ritmo de tiro (alguns rapidos, outros lentos)
-        self.bot_delay_min = random.randint(200, 800)
-        self.bot_delay_max = self.bot_delay_min + random.randint(200, 800)
+        self.bot_delay_min = rng.randint(200, 800)
+        self.bot_delay_max = self.bot_delay_min + rng.randint(200, 800)
 
     def reset_turno(self):
         self.tiros_restantes = 5
@@ -175,7 +183,7 @@ class JogadorAim:
         self.bot_next_shot = 0
         self.tempo_inicio_turno = 0
         if self.is_bot:
-            self.bot_alvos_acertar = random.randint(1, 5)
+            self.bot_alvos_acertar = self.rng.randint(1, 5)
 
     def desenhar(self, tela, fonte, is_vez=False, pulsacao=0):
         tam = TAM_JOGADOR
@@ -199,7 +207,7 @@ class JogadorAim:
 
         # Nome
         cor_nome = (100, 255, 100) if is_vez else BRANCO
-        nome_surf = fonte.render(self.nome, True, cor_nome)
+        nome_surf = renderizar_texto(self.nome, fonte, cor_nome)
         nx = ix + tam // 2 - nome_surf.get_width() // 2
         ny = iy - 16
 
@@ -297,23 +305,32 @@ def executar_minigame_aim(tela, relogio, gradiente_jogo, fonte_titulo, fonte_nor
     """
     print("[AIM] Minigame Aim iniciado!")
 
-    # --- Seed compartilhado para sincronizar random entre host e clientes ---
+    # --- Seed compartilhado: random.Random próprio da partida, igual em
+    # todos os clientes (partículas e sons continuam no random global).
+    # Sem seed (single player) sorteia no rng_jogo, que o replay semeia ---
     seed = customizacao.get('seed')
+    rng = random.Random(seed) if seed is not None else rng_jogo
     if seed is not None:
-        random.seed(seed)
         print(f"[AIM] Usando seed compartilhado: {seed}")
 
-    # Limpar fila de ações pendentes de sessões anteriores
-    if cliente:
+    # --- Lockstep: ticks fixos, só inputs trafegam ---
+    lockstep = None
+    if cliente and seed is not None and customizacao.get('lockstep'):
+        lockstep = LockstepSession(cliente, seed, nome='aim')
+        rng = lockstep.rng
+        print(f"[AIM] Lockstep ativo ({lockstep.tick_rate} ticks/s, atraso de {lockstep.input_delay} ticks)")
+    elif cliente:
+        # Limpar fila de ações pendentes de sessões anteriores
+        # (no lockstep as ações antigas são descartadas pelo seed)
         cliente.get_minigame_actions()
 
     # --- Fontes ---
-    fonte_grande = pygame.font.SysFont("Arial", 48, True)
-    fonte_media = pygame.font.SysFont("Arial", 28, True)
-    fonte_peq = pygame.font.SysFont("Arial", 14)
-    fonte_nomes = pygame.font.SysFont("Arial", 12)
-    fonte_hud = pygame.font.SysFont("Arial", 18, True)
-    fonte_score = pygame.font.SysFont("Arial", 22, True)
+    fonte_grande = obter_fonte("Arial", 48, True)
+    fonte_media = obter_fonte("Arial", 28, True)
+    fonte_peq = obter_fonte("Arial", 14)
+    fonte_nomes = obter_fonte("Arial", 12)
+    fonte_hud = obter_fonte("Arial", 18, True)
+    fonte_score = obter_fonte("Arial", 22, True)
 
     # --- Fundo (fase 1 style) ---
     estrelas = criar_estrelas(120)
@@ -326,22 +343,23 @@ def executar_minigame_aim(tela, relogio, gradiente_jogo, fonte_titulo, fonte_nor
     jogadores = []
     cor_local = customizacao.get('cor', AZUL)
 
-    # Jogador humano local
-    jogador_humano = JogadorAim(nome_jogador, cor_local, is_bot=False)
-    jogadores.append(jogador_humano)
-
     # Jogadores remotos (se houver)
     remotos = {}
     if cliente:
         remotos = cliente.get_remote_players()
     n_humanos = 1 + len(remotos)
 
-    # Adicionar jogadores remotos (humanos controlados via rede)
-    pid_idx = 1
-    for pid, rp in remotos.items():
-        ci = (pid - 1) % len(PALETA_CORES)
-        jogadores.append(JogadorAim(rp.name, PALETA_CORES[ci], is_bot=False, is_remote=True))
-        pid_idx += 1
+    # Humanos criados em ordem de ID: a lista, os sorteios e a ordem dos
+    # turnos saem iguais em todos os clientes
+    local_id = cliente.local_player_id if cliente else 0
+    humanos = {local_id: None, **{pid: rp for pid, rp in remotos.items()}}
+    for pid in sorted(humanos):
+        if pid == local_id:
+            jogadores.append(JogadorAim(nome_jogador, cor_local, rng, is_bot=False, player_id=pid))
+        else:
+            ci = (pid - 1) % len(PALETA_CORES)
+            jogadores.append(JogadorAim(humanos[pid].name, PALETA_CORES[ci], rng,
+                                        is_bot=False, is_remote=True, player_id=pid))
 
     # Preencher com bots ate 8
     nomes_bots = ["Bot Alpha", "Bot Bravo", "Bot Charlie", "Bot Delta",
@@ -349,12 +367,12 @@ def executar_minigame_aim(tela, relogio, gradiente_jogo, fonte_titulo, fonte_nor
     bot_idx = 0
     while len(jogadores) < 8:
         ci = len(jogadores) % len(PALETA_CORES)
-        jogadores.append(JogadorAim(nomes_bots[bot_idx], PALETA_CORES[ci], is_bot=True))
+        jogadores.append(JogadorAim(nomes_bots[bot_idx], PALETA_CORES[ci], rng, is_bot=True))
         bot_idx += 1
 
     # Ordem aleatoria dos turnos - embaralhar a lista de jogadores diretamente
     # assim a fila ja reflete a ordem de jogo
-    random.shuffle(jogadores)
+    rng.shuffle(jogadores)
 
     # Posicionar na fila (ja na ordem embaralhada)
     for i, j in enumerate(jogadores):
@@ -372,11 +390,11 @@ def executar_minigame_aim(tela, relogio, gradiente_jogo, fonte_titulo, fonte_nor
     # --- Alvos ---
     alvos = []
     for i, cfg in enumerate(ALVOS_CONFIG):
-        alvos.append(AlvoMovel(i, cfg))
+        alvos.append(AlvoMovel(i, cfg, rng))
 
     # --- Estado ---
     estado = "INTRO"
-    tempo_estado = pygame.time.get_ticks()
+    tempo_estado = lockstep.tempo_ms() if lockstep else pygame.time.get_ticks()
     turno_idx = 0
     jogador_vez = None
 
@@ -411,26 +429,40 @@ def executar_minigame_aim(tela, relogio, gradiente_jogo, fonte_titulo, fonte_nor
     jogador_sim = None
 
     # Misterioso jogada (5% de chance)
-    misterioso_joga = random.random() < 0.06
+    misterioso_joga = rng.random() < 0.06
     misterioso_turno = False  # True quando eh a vez do misterioso
 
     # Scoreboard timer
     scoreboard_start = 0
 
+    # Tiro local esperando o próximo tick (lockstep)
+    tiro_pendente = None
+
     while True:
         tempo = pygame.time.get_ticks()
         dt = 1.0 / 60.0
+
+        # Lockstep: o tempo de jogo é o do tick, e o tick só avança com os inputs de todos
+        avancar = True
+        entradas_tick = []
+        if lockstep:
+            lockstep.receber()
+            avancar = lockstep.pronto()
+            if avancar:
+                lockstep.registrar_input(tiro_pendente)
+                tiro_pendente = None
+                entradas_tick = lockstep.entradas()
+            tempo = lockstep.tempo_ms()
         tempo_no_estado = tempo - tempo_estado
 
         # ========== EVENTOS ==========
+        secao('eventos')
         for ev in pygame.event.get():
-            if ev.type == pygame.QUIT:
+            if ev.type == pygame.QUIT or (ev.type == pygame.KEYDOWN and ev.key == pygame.K_ESCAPE):
+                if lockstep:
+                    lockstep.sair()
                 pygame.mouse.set_visible(True)
                 return None
-            if ev.type == pygame.KEYDOWN:
-                if ev.key == pygame.K_ESCAPE:
-                    pygame.mouse.set_visible(True)
-                    return None
 
             # Tiro do jogador humano local
             if ev.type == pygame.MOUSEBUTTONDOWN and ev.button == 1:
@@ -438,13 +470,17 @@ def executar_minigame_aim(tela, relogio, gradiente_jogo, fonte_titulo, fonte_nor
                     if jogador_vez.tiros_restantes > 0 and tempo - ultimo_tiro_humano > COOLDOWN_TIRO:
                         ultimo_tiro_humano = tempo
                         mx, my = convert_mouse_position(pygame.mouse.get_pos())
+                        if lockstep:
+                            # Vai como input e é disparado no mesmo tick em todos os clientes
+                            tiro_pendente = {'tiro': [mx, my]}
+                            continue
                         _disparar_tiro(jogador_vez, mx, my, tiros, particulas, flashes)
                         # Enviar tiro para os outros jogadores via rede
                         if cliente:
                             cliente.send_minigame_action({
                                 'action': 'aim_shot',
                                 'mx': mx, 'my': my,
-                            })
+                            }, critical=True)
 
         # ========== PULSACAO ==========
         if tempo - ultimo_pulso > 100:
@@ -452,8 +488,12 @@ def executar_minigame_aim(tela, relogio, gradiente_jogo, fonte_titulo, fonte_nor
             pulsacao = (pulsacao + 1) % 12
 
         # ========== MAQUINA DE ESTADOS ==========
+        secao('logica')
+
+        if not avancar:
+            pass  # Lockstep esperando inputs de outro jogador
 
-        if estado == "INTRO":
+        elif estado == "INTRO":
             # Fade in
             if tempo_no_estado < 500:
                 alpha_fade = int(255 * (1 - tempo_no_estado / 500))
@@ -486,7 +526,7 @@ def executar_minigame_aim(tela, relogio, gradiente_jogo, fonte_titulo, fonte_nor
                     jogador_sim = _JogadorSimulado(
                         jogador_vez.target_x, jogador_vez.target_y, jogador_vez.cor
                     )
-                    jogador_vez.bot_next_shot = tempo + random.randint(jogador_vez.bot_delay_min, jogador_vez.bot_delay_max)
+                    jogador_vez.bot_next_shot = tempo + rng.randint(jogador_vez.bot_delay_min, jogador_vez.bot_delay_max)
                 else:
                     estado = "DELIVERY"
                     tempo_estado = tempo
@@ -530,7 +570,7 @@ def executar_minigame_aim(tela, relogio, gradiente_jogo, fonte_titulo, fonte_nor
                 )
 
                 if jogador_vez.is_bot:
-                    jogador_vez.bot_next_shot = tempo + random.randint(jogador_vez.bot_delay_min, jogador_vez.bot_delay_max)
+                    jogador_vez.bot_next_shot = tempo + rng.randint(jogador_vez.bot_delay_min, jogador_vez.bot_delay_max)
 
         elif estado == "AIMING":
             # Atualizar alvo atual
@@ -545,8 +585,17 @@ def executar_minigame_aim(tela, relogio, gradiente_jogo, fonte_titulo, fonte_nor
                 jogador_sim.cor = jogador_vez.cor
                 jogador_sim.tiros_desert_eagle = jogador_vez.tiros_restantes
 
+            # Tiros do tick (lockstep): de quem está na vez, na mesma ordem em todos
+            for pid, entrada in entradas_tick:
+                if 'tiro' in entrada and not jogador_vez.is_bot and jogador_vez.player_id == pid:
+                    _disparar_tiro(jogador_vez, entrada['tiro'][0], entrada['tiro'][1],
+                                   tiros, particulas, flashes)
+            # Quem saiu da partida perde o resto do turno (no mesmo tick em todos)
+            if lockstep and jogador_vez.is_remote and lockstep.saiu(jogador_vez.player_id):
+                jogador_vez.tiros_restantes = 0
+
             # Processar tiros de jogadores remotos via rede
-            if jogador_vez.is_remote and jogador_vez.tiros_restantes > 0 and cliente:
+            if not lockstep and jogador_vez.is_remote and jogador_vez.tiros_restantes > 0 and cliente:
                 for action in cliente.get_minigame_actions():
                     if action.get('action') == 'aim_shot':
                         rmx = action.get('mx', 0)
@@ -558,8 +607,9 @@ def executar_minigame_aim(tela, relogio, gradiente_jogo, fonte_titulo, fonte_nor
                 # Misterioso so atira quando nao tem bala voando (espera acertar pra atirar de novo)
                 misterioso_pode = jogador_vez.nome != "???" or len(tiros) == 0
                 if misterioso_pode and tempo >= jogador_vez.bot_next_shot:
-                    _bot_atirar(jogador_vez, alvos, tiros, particulas, flashes, tempo)
-                    jogador_vez.bot_next_shot = tempo + random.randint(jogador_vez.bot_delay_min, jogador_vez.bot_delay_max)
+                    with escopo('ia'):
+                        _bot_atirar(jogador_vez, alvos, tiros, particulas, flashes, tempo)
+                    jogador_vez.bot_next_shot = tempo + rng.randint(jogador_vez.bot_delay_min, jogador_vez.bot_delay_max)
                 else:
                     # Bot jitter de mira
                     if alvo_idx < len(alvos) and alvos[alvo_idx].ativo:
@@ -624,7 +674,7 @@ def executar_minigame_aim(tela, relogio, gradiente_jogo, fonte_titulo, fonte_nor
                     if misterioso_joga:
                         # Misterioso entra na jogada!
                         misterioso_turno = True
-                        misterioso_aim = JogadorAim("???", (20, 20, 20), is_bot=True)
+                        misterioso_aim = JogadorAim("???", (20, 20, 20), rng, is_bot=True)
                         misterioso_aim.bot_alvos_acertar = 5
                         misterioso_aim.bot_delay_min = 300
                         misterioso_aim.bot_delay_max = 400
@@ -659,12 +709,17 @@ def executar_minigame_aim(tela, relogio, gradiente_jogo, fonte_titulo, fonte_nor
                 pygame.mouse.set_visible(True)
                 return None
 
+        if lockstep and avancar:
+            lockstep.concluir_tick(_checksum_aim(estado, turno_idx, jogadores, alvos, tiros))
+
         # ========== INTERPOLACAO DE POSICAO ==========
+        secao('rede')
         for j in jogadores:
             j.x += (j.target_x - j.x) * 0.12
             j.y += (j.target_y - j.y) * 0.12
 
         # ========== PARTICULAS ==========
+        secao('particulas')
         for p in particulas[:]:
             p.atualizar()
             if p.vida <= 0:
@@ -678,168 +733,61 @@ def executar_minigame_aim(tela, relogio, gradiente_jogo, fonte_titulo, fonte_nor
                 flashes.remove(f)
 
         # ========== DESENHAR ==========
+        secao('render')
 
-        # Fundo
-        tela.fill((0, 0, 0))
-        tela.blit(gradiente_jogo, (0, 0))
-        desenhar_estrelas(tela, estrelas)
-
-        # Linhas de demarcacao dos alvos (guias visuais)
-        for i, cfg in enumerate(ALVOS_CONFIG):
-            y_linha = cfg['y_offset'] + cfg['tamanho'] // 2
-            alpha_l = 20 + int(10 * math.sin(tempo / 800 + i))
-            cor_l = (alpha_l, alpha_l, alpha_l + 15)
-            pygame.draw.line(tela, cor_l, (ALVO_X_MIN, y_linha), (ALVO_X_MAX, y_linha), 1)
-
-        # Alvos
-        for a in alvos:
-            a.desenhar(tela, tempo)
-
-        # Posicao de tiro (marca no chao)
-        if estado in ("TURN_START", "DELIVERY", "AIMING"):
-            pulso_marca = int(3 * math.sin(tempo / 300))
-            pygame.draw.circle(tela, (50, 50, 80),
-                              (POS_TIRO_X, POS_TIRO_Y + TAM_JOGADOR + 10),
-                              20 + pulso_marca, 2)
-
-        # Misterioso com aura (nao desenhar no canto se ele esta jogando)
-        if not (misterioso_turno and estado in ("TURN_START", "DELIVERY", "AIMING", "TURN_END")):
-            misterioso.x = MISTERIOSO_X
-            misterioso.y = MISTERIOSO_Y
-            misterioso.rect.x = MISTERIOSO_X
-            misterioso.rect.y = MISTERIOSO_Y
-            misterioso.desenhar_com_aura(tela, tempo)
-
-        # Jogadores na fila
-        for i, j in enumerate(jogadores):
-            if j.nome == "???":
-                # Desenhar misterioso com aura em vez do quadrado generico
-                misterioso.x = int(j.x)
-                misterioso.y = int(j.y)
-                misterioso.rect.x = int(j.x)
-                misterioso.rect.y = int(j.y)
-                misterioso.desenhar_com_aura(tela, tempo)
-                continue
-            is_vez = (jogador_vez is j)
-            j.desenhar(tela, fonte_nomes, is_vez=is_vez, pulsacao=pulsacao)
-
-        # Arma sendo entregue (durante DELIVERY)
-        if estado == "DELIVERY":
-            ax, ay = entrega_arma_pos
-            angulo_arma = math.atan2(
-                jogador_vez.target_y - MISTERIOSO_Y,
-                jogador_vez.target_x - MISTERIOSO_X
-            ) * entrega_progresso
-            _desenhar_deagle_flutuante(tela, ax, ay, angulo_arma)
-
-            # Glow roxo
-            glow_s = int(25 + 10 * math.sin(tempo / 200))
-            glow_surf = pygame.Surface((glow_s * 2, glow_s * 2), pygame.SRCALPHA)
-            pygame.draw.circle(glow_surf, (180, 50, 230, 40), (glow_s, glow_s), glow_s)
-            tela.blit(glow_surf, (int(ax) - glow_s, int(ay) - glow_s))
-
-        # Desert Eagle no jogador durante AIMING
-        if estado == "AIMING" and jogador_sim:
-            if jogador_vez.is_bot:
-                pos_mouse = (int(jogador_vez.bot_mouse_x), int(jogador_vez.bot_mouse_y))
-            else:
-                pos_mouse = convert_mouse_position(pygame.mouse.get_pos())
-            jogador_sim.tempo_ultimo_tiro = ultimo_tiro_humano if not jogador_vez.is_bot else jogador_vez.bot_timer
-            desenhar_desert_eagle(tela, jogador_sim, pos_mouse)
+        with escopo('render_cenario'):
+            _desenhar_cenario(tela, gradiente_jogo, estrelas, alvos, estado, tempo)
 
-        # Tiros
-        for tiro in tiros:
-            tiro.desenhar(tela)
+        with escopo('render_jogadores'):
+            # Misterioso no canto (nao desenhar no canto se ele esta jogando)
+            no_canto = not (misterioso_turno and estado in ("TURN_START", "DELIVERY", "AIMING", "TURN_END"))
+            _desenhar_jogadores(tela, jogadores, jogador_vez, misterioso, no_canto,
+                                fonte_nomes, pulsacao, tempo)
 
-        # Particulas
-        for p in particulas:
-            p.desenhar(tela)
+        with escopo('render_arma'):
+            if estado == "DELIVERY":
+                _desenhar_entrega_arma(tela, entrega_arma_pos, entrega_progresso, jogador_vez, tempo)
+            elif estado == "AIMING" and jogador_sim:
+                _desenhar_arma_mirando(tela, jogador_vez, jogador_sim, ultimo_tiro_humano)
 
-        # Flashes
-        for f in flashes:
-            if f['vida'] > 0 and f['raio'] > 0:
-                flash_surf = pygame.Surface((f['raio'] * 2, f['raio'] * 2), pygame.SRCALPHA)
-                alpha_f = min(255, int(255 * (f['vida'] / 10)))
-                pygame.draw.circle(flash_surf, (*f['cor'], alpha_f),
-                                  (f['raio'], f['raio']), f['raio'])
-                tela.blit(flash_surf, (int(f['x']) - f['raio'], int(f['y']) - f['raio']))
+        with escopo('render_efeitos'):
+            _desenhar_efeitos(tela, tiros, particulas, flashes)
 
         # ========== HUD ==========
-
-        # Barra superior com info
-        hud_bg = pygame.Surface((LARGURA, 50), pygame.SRCALPHA)
-        hud_bg.fill((0, 0, 0, 150))
-        tela.blit(hud_bg, (0, 0))
-
-        # Titulo
-        titulo_s = fonte_hud.render("AIM CHALLENGE", True, (200, 200, 255))
-        tela.blit(titulo_s, (LARGURA // 2 - titulo_s.get_width() // 2, 5))
-
-        # Turno
-        if estado not in ("INTRO", "SCOREBOARD", "FIM"):
-            total_turnos = 9 if misterioso_turno else 8
-            turno_atual = min(turno_idx + 1, total_turnos)
-            turno_s = fonte_peq.render(f"Turno {turno_atual}/{total_turnos}", True, (180, 180, 200))
-            tela.blit(turno_s, (15, 8))
-
-            if jogador_vez:
-                cor_vez = (180, 0, 50) if jogador_vez.nome == "???" else jogador_vez.cor
-                vez_s = fonte_peq.render(f"Vez: {jogador_vez.nome}", True, cor_vez)
-                tela.blit(vez_s, (15, 26))
-
-        # Balas restantes e acertos (durante AIMING)
-        if estado == "AIMING" and jogador_vez:
-            # Balas
-            for i in range(5):
-                bx = LARGURA - 140 + i * 22
-                by = 10
-                if i < jogador_vez.tiros_restantes:
-                    pygame.draw.circle(tela, (255, 200, 0), (bx, by + 6), 5)
-                    pygame.draw.circle(tela, (200, 150, 0), (bx, by + 6), 5, 1)
-                else:
-                    pygame.draw.circle(tela, (60, 60, 60), (bx, by + 6), 5, 1)
-
-            # Acertos
-            acerto_s = fonte_peq.render(f"Acertos: {jogador_vez.acertos}/5", True, VERDE)
-            tela.blit(acerto_s, (LARGURA - 140, 28))
-
-        # Instrucoes
-        if estado == "AIMING" and jogador_vez and not jogador_vez.is_bot:
-            inst_s = fonte_peq.render("CLICK para atirar", True, (150, 150, 170))
-            tela.blit(inst_s, (LARGURA // 2 - inst_s.get_width() // 2, ALTURA_JOGO - 20))
+        secao('hud')
+        with escopo('hud'):
+            _desenhar_hud(tela, estado, jogador_vez, turno_idx, misterioso_turno, fonte_hud, fonte_peq)
 
         # ========== SCOREBOARD ==========
         if estado == "SCOREBOARD":
-            _desenhar_scoreboard(tela, jogadores, fonte_grande, fonte_media, fonte_score,
-                                fonte_peq, tempo, scoreboard_start)
+            with escopo('hud'):
+                _desenhar_scoreboard(tela, jogadores, fonte_grande, fonte_media, fonte_score,
+                                    fonte_peq, tempo, scoreboard_start)
 
         # ========== INTRO TEXTO ==========
         if estado == "INTRO" and tempo_no_estado > 500:
-            titulo_intro = fonte_grande.render("AIM CHALLENGE", True, (255, 220, 100))
+            titulo_intro = renderizar_texto("AIM CHALLENGE", fonte_grande, (255, 220, 100))
             tela.blit(titulo_intro,
                      (LARGURA // 2 - titulo_intro.get_width() // 2, ALTURA_JOGO // 2 - 60))
-            sub_intro = fonte_media.render("Acerte os alvos!", True, (200, 200, 220))
+            sub_intro = renderizar_texto("Acerte os alvos!", fonte_media, (200, 200, 220))
             tela.blit(sub_intro,
                      (LARGURA // 2 - sub_intro.get_width() // 2, ALTURA_JOGO // 2))
 
         # ========== TURN_END texto ==========
         if estado == "TURN_END" and jogador_vez:
             tempo_seg = jogador_vez.tempo_turno / 1000.0
-            res_s = fonte_media.render(
+            res_s = renderizar_texto(
                 f"{jogador_vez.nome}: {jogador_vez.acertos}/5 acertos - {tempo_seg:.1f}s",
-                True, jogador_vez.cor
+                fonte_media, jogador_vez.cor
             )
             tela.blit(res_s, (LARGURA // 2 - res_s.get_width() // 2, ALTURA_JOGO // 2 - 20))
 
         # Fade
         if alpha_fade > 0:
-            fade_surf = pygame.Surface((LARGURA, ALTURA))
-            fade_surf.fill((0, 0, 0))
-            fade_surf.set_alpha(alpha_fade)
-            tela.blit(fade_surf, (0, 0))
+            desenhar_overlay_cor(tela, (0, 0, 0), alpha_fade, (LARGURA, ALTURA))
 
         # ESC hint
-        esc_s = fonte_peq.render("ESC: Sair", True, (80, 80, 100))
+        esc_s = renderizar_texto("ESC: Sair", fonte_peq, (80, 80, 100))
         tela.blit(esc_s, (LARGURA - 70, ALTURA_JOGO - 20))
 
         # Mira customizada
@@ -899,6 +847,20 @@ def _disparar_tiro(jogador_aim, mouse_x, mouse_y, tiros, particulas, flashes):
         pass
 
 
+def _checksum_aim(estado, turno_idx, jogadores, alvos, tiros):
+    """Checksum do que decide a partida (comparado entre os clientes no lockstep)."""
+    checksum = StateChecksum()
+    checksum.add('estado', estado).add('turno', turno_idx)
+    for i, j in enumerate(jogadores):
+        checksum.add(f'jogador{i}', (j.nome, j.acertos, j.tiros_restantes, j.alvo_atual, j.tempo_turno))
+    for i, a in enumerate(alvos):
+        checksum.add_pos(f'alvo{i}.pos', a.x, a.y)
+        checksum.add(f'alvo{i}', (a.direcao, a.ativo, a.acertado))
+    for i, t in enumerate(tiros):
+        checksum.add_pos(f'tiro{i}', t.x, t.y)
+    return checksum
+
+
 def _prever_posicao_alvo_x(alvo, frames):
     """Simula a posicao X central do alvo apos N frames, considerando bounces nas paredes."""
     x = alvo.x
@@ -949,12 +911,12 @@ def _bot_atirar(jogador_aim, alvos, tiros, particulas, flashes, tempo):
             my = alvo_cy
         else:
             # Mira com lead preciso mas com pequeno erro
-            mx = alvo_cx + lead_x + random.uniform(-2, 2)
-            my = alvo_cy + random.uniform(-2, 2)
+            mx = alvo_cx + lead_x + jogador_aim.rng.uniform(-2, 2)
+            my = alvo_cy + jogador_aim.rng.uniform(-2, 2)
     else:
         # Erra de proposito - mira longe do alvo
-        mx = alvo_cx + random.choice([-1, 1]) * random.uniform(60, 120)
-        my = alvo_cy + random.uniform(-40, 40)
+        mx = alvo_cx + jogador_aim.rng.choice([-1, 1]) * jogador_aim.rng.uniform(60, 120)
+        my = alvo_cy + jogador_aim.rng.uniform(-40, 40)
 
     jogador_aim.bot_mouse_x = mx
     jogador_aim.bot_mouse_y = my
@@ -963,16 +925,148 @@ def _bot_atirar(jogador_aim, alvos, tiros, particulas, flashes, tempo):
     _disparar_tiro(jogador_aim, mx, my, tiros, particulas, flashes)
 
 
+def _desenhar_cenario(tela, gradiente_jogo, estrelas, alvos, estado, tempo):
+    """Desenha o fundo, as guias e os alvos e a marca da posicao de tiro."""
+    tela.fill((0, 0, 0))
+    tela.blit(gradiente_jogo, (0, 0))
+    desenhar_estrelas(tela, estrelas)
+
+    # Linhas de demarcacao dos alvos (guias visuais)
+    for i, cfg in enumerate(ALVOS_CONFIG):
+        y_linha = cfg['y_offset'] + cfg['tamanho'] // 2
+        alpha_l = 20 + int(10 * math.sin(tempo / 800 + i))
+        cor_l = (alpha_l, alpha_l, alpha_l + 15)
+        pygame.draw.line(tela, cor_l, (ALVO_X_MIN, y_linha), (ALVO_X_MAX, y_linha), 1)
+
+    # Alvos
+    for a in alvos:
+        a.desenhar(tela, tempo)
+
+    # Posicao de tiro (marca no chao)
+    if estado in ("TURN_START", "DELIVERY", "AIMING"):
+        pulso_marca = int(3 * math.sin(tempo / 300))
+        pygame.draw.circle(tela, (50, 50, 80),
+                          (POS_TIRO_X, POS_TIRO_Y + TAM_JOGADOR + 10),
+                          20 + pulso_marca, 2)
+
+
+def _desenhar_jogadores(tela, jogadores, jogador_vez, misterioso, misterioso_no_canto,
+                        fonte_nomes, pulsacao, tempo):
+    """Desenha o Misterioso no canto e os jogadores na fila (o ??? com a aura dele)."""
+    if misterioso_no_canto:
+        misterioso.x = MISTERIOSO_X
+        misterioso.y = MISTERIOSO_Y
+        misterioso.rect.x = MISTERIOSO_X
+        misterioso.rect.y = MISTERIOSO_Y
+        misterioso.desenhar_com_aura(tela, tempo)
+
+    for j in jogadores:
+        if j.nome == "???":
+            # Desenhar misterioso com aura em vez do quadrado generico
+            misterioso.x = int(j.x)
+            misterioso.y = int(j.y)
+            misterioso.rect.x = int(j.x)
+            misterioso.rect.y = int(j.y)
+            misterioso.desenhar_com_aura(tela, tempo)
+            continue
+        j.desenhar(tela, fonte_nomes, is_vez=(jogador_vez is j), pulsacao=pulsacao)
+
+
+def _desenhar_entrega_arma(tela, entrega_arma_pos, entrega_progresso, jogador_vez, tempo):
+    """Desenha a Desert Eagle voando do Misterioso ate o jogador da vez (DELIVERY)."""
+    ax, ay = entrega_arma_pos
+    angulo_arma = math.atan2(
+        jogador_vez.target_y - MISTERIOSO_Y,
+        jogador_vez.target_x - MISTERIOSO_X
+    ) * entrega_progresso
+    _desenhar_deagle_flutuante(tela, ax, ay, angulo_arma)
+
+    # Glow roxo
+    glow_s = int(25 + 10 * math.sin(tempo / 200))
+    glow_surf = pygame.Surface((glow_s * 2, glow_s * 2), pygame.SRCALPHA)
+    pygame.draw.circle(glow_surf, (180, 50, 230, 40), (glow_s, glow_s), glow_s)
+    tela.blit(glow_surf, (int(ax) - glow_s, int(ay) - glow_s))
+
+
+def _desenhar_arma_mirando(tela, jogador_vez, jogador_sim, ultimo_tiro_humano):
+    """Desenha a Desert Eagle no jogador da vez apontando para o mouse (ou a mira do bot)."""
+    if jogador_vez.is_bot:
+        pos_mouse = (int(jogador_vez.bot_mouse_x), int(jogador_vez.bot_mouse_y))
+    else:
+        pos_mouse = convert_mouse_position(pygame.mouse.get_pos())
+    jogador_sim.tempo_ultimo_tiro = ultimo_tiro_humano if not jogador_vez.is_bot else jogador_vez.bot_timer
+    desenhar_desert_eagle(tela, jogador_sim, pos_mouse)
+
+
+def _desenhar_efeitos(tela, tiros, particulas, flashes):
+    """Desenha os tiros, as particulas e os flashes dos disparos."""
+    desenhar_tiros(tela, tiros)
+
+    for p in particulas:
+        p.desenhar(tela)
+
+    for f in flashes:
+        if f['vida'] > 0 and f['raio'] > 0:
+            flash_surf = pygame.Surface((f['raio'] * 2, f['raio'] * 2), pygame.SRCALPHA)
+            alpha_f = min(255, int(255 * (f['vida'] / 10)))
+            pygame.draw.circle(flash_surf, (*f['cor'], alpha_f),
+                              (f['raio'], f['raio']), f['raio'])
+            tela.blit(flash_surf, (int(f['x']) - f['raio'], int(f['y']) - f['raio']))
+
+
+def _desenhar_hud(tela, estado, jogador_vez, turno_idx, misterioso_turno, fonte_hud, fonte_peq):
+    """Desenha a barra superior: titulo, turno, vez, balas e acertos, e a instrucao de tiro."""
+    # Barra superior com info
+    hud_bg = pygame.Surface((LARGURA, 50), pygame.SRCALPHA)
+    hud_bg.fill((0, 0, 0, 150))
+    tela.blit(hud_bg, (0, 0))
+
+    # Titulo
+    titulo_s = renderizar_texto("AIM CHALLENGE", fonte_hud, (200, 200, 255))
+    tela.blit(titulo_s, (LARGURA // 2 - titulo_s.get_width() // 2, 5))
+
+    # Turno
+    if estado not in ("INTRO", "SCOREBOARD", "FIM"):
+        total_turnos = 9 if misterioso_turno else 8
+        turno_atual = min(turno_idx + 1, total_turnos)
+        turno_s = renderizar_texto(f"Turno {turno_atual}/{total_turnos}", fonte_peq, (180, 180, 200))
+        tela.blit(turno_s, (15, 8))
+
+        if jogador_vez:
+            cor_vez = (180, 0, 50) if jogador_vez.nome == "???" else jogador_vez.cor
+            vez_s = renderizar_texto(f"Vez: {jogador_vez.nome}", fonte_peq, cor_vez)
+            tela.blit(vez_s, (15, 26))
+
+    # Balas restantes e acertos (durante AIMING)
+    if estado == "AIMING" and jogador_vez:
+        # Balas
+        for i in range(5):
+            bx = LARGURA - 140 + i * 22
+            by = 10
+            if i < jogador_vez.tiros_restantes:
+                pygame.draw.circle(tela, (255, 200, 0), (bx, by + 6), 5)
+                pygame.draw.circle(tela, (200, 150, 0), (bx, by + 6), 5, 1)
+            else:
+                pygame.draw.circle(tela, (60, 60, 60), (bx, by + 6), 5, 1)
+
+        # Acertos
+        acerto_s = renderizar_texto(f"Acertos: {jogador_vez.acertos}/5", fonte_peq, VERDE)
+        tela.blit(acerto_s, (LARGURA - 140, 28))
+
+    # Instrucoes
+    if estado == "AIMING" and jogador_vez and not jogador_vez.is_bot:
+        inst_s = renderizar_texto("CLICK para atirar", fonte_peq, (150, 150, 170))
+        tela.blit(inst_s, (LARGURA // 2 - inst_s.get_width() // 2, ALTURA_JOGO - 20))
+
+
 def _desenhar_scoreboard(tela, jogadores, fonte_grande, fonte_media, fonte_score,
                           fonte_peq, tempo, start_time):
     """Desenha o scoreboard final."""
     # Fundo semi-transparente
-    overlay = pygame.Surface((LARGURA, ALTURA_JOGO), pygame.SRCALPHA)
-    overlay.fill((0, 0, 0, 180))
-    tela.blit(overlay, (0, 0))
+    desenhar_overlay_cor(tela, (0, 0, 0), 180, (LARGURA, ALTURA_JOGO))
 
     # Titulo
-    titulo = fonte_grande.render("RESULTADO", True, (255, 220, 100))
+    titulo = renderizar_texto("RESULTADO", fonte_grande, (255, 220, 100))
     tela.blit(titulo, (LARGURA // 2 - titulo.get_width() // 2, 40))
 
     # Ordenar por acertos (maior primeiro), desempate por tempo (menor primeiro)
@@ -1010,7 +1104,7 @@ def _desenhar_scoreboard(tela, jogadores, fonte_grande, fonte_media, fonte_score
         medalhas = ["1st", "2nd", "3rd"]
         pos_text = medalhas[rank] if rank < 3 else f"{rank + 1}th"
         pos_cor = [(255, 215, 0), (200, 200, 210), (205, 127, 50)][rank] if rank < 3 else (150, 150, 160)
-        pos_s = fonte_score.render(pos_text, True, pos_cor)
+        pos_s = renderizar_texto(pos_text, fonte_score, pos_cor)
         tela.blit(pos_s, (linha_x + 15, y + 10))
 
         # Quadrado colorido do jogador
@@ -1022,16 +1116,16 @@ def _desenhar_scoreboard(tela, jogadores, fonte_grande, fonte_media, fonte_score
         pygame.draw.rect(tela, j.cor, (sq_x + 2, sq_y + 2, sq_tam - 4, sq_tam - 4), 0, 3)
 
         # Nome
-        nome_s = fonte_score.render(j.nome, True, BRANCO)
+        nome_s = renderizar_texto(j.nome, fonte_score, BRANCO)
         tela.blit(nome_s, (sq_x + sq_tam + 12, y + 10))
 
         # Acertos
-        ac_s = fonte_peq.render(f"{j.acertos}/5 acertos", True, (180, 255, 180))
+        ac_s = renderizar_texto(f"{j.acertos}/5 acertos", fonte_peq, (180, 255, 180))
         tela.blit(ac_s, (linha_x + 280, y + 8))
 
         # Tempo
         tempo_s_val = j.tempo_turno / 1000.0
-        tempo_s_txt = fonte_peq.render(f"{tempo_s_val:.1f}s", True, (180, 200, 255))
+        tempo_s_txt = renderizar_texto(f"{tempo_s_val:.1f}s", fonte_peq, (180, 200, 255))
         tela.blit(tempo_s_txt, (linha_x + 280, y + 26))
 
         # Borda
@@ -1040,5 +1134,5 @@ def _desenhar_scoreboard(tela, jogadores, fonte_grande, fonte_media, fonte_score
 
     # Instrucao
     if tempo_decorrido > 3000:
-        inst = fonte_peq.render("Voltando ao menu...", True, (120, 120, 140))
+        inst = renderizar_texto("Voltando ao menu...", fonte_peq, (120, 120, 140))
         tela.blit(inst, (LARGURA // 2 - inst.get_width() // 2, ALTURA_JOGO - 30))
@@ -14,10 +14,14 @@ import math
 import random
 from src.config import *
 from src.entities.particula import Particula
-from src.utils.visual import criar_mira, desenhar_mira
+from src.utils.visual import criar_mira, desenhar_mira, desenhar_overlay_cor
 from src.utils.display_manager import present_frame, convert_mouse_position
+from src.utils.profiler import escopo, secao
+from src.utils.fonts import obter_fonte, renderizar_texto
+from src.network.interpolation import InterpolationSet
 from src.weapons.spas12 import desenhar_spas12
 from src.weapons.metralhadora import desenhar_metralhadora
+from src.utils.rng import rng_jogo, semear_jogo
 
 # ============================================================
 #  CONSTANTES
@@ -161,6 +165,7 @@ class JogadorBoxFight:
         self.cor = cor
         self.is_bot = is_bot
         self.is_remote = is_remote
+        self.player_id = None  # ID de rede (apenas jogadores remotos)
         self.hp = HP_MAX
         self.vivo = True
         self.kills = 0
@@ -276,7 +281,7 @@ class JogadorBoxFight:
         pygame.draw.rect(tela, self.cor_brilhante, (sx + 4, sy + 4, 7, 7), 0, 2)
 
         # Nome
-        nome_surf = fonte.render(self.nome, True, BRANCO)
+        nome_surf = renderizar_texto(self.nome, fonte, BRANCO)
         nx = sx + tam // 2 - nome_surf.get_width() // 2
         ny = sy - 16
         bg = pygame.Surface((nome_surf.get_width() + 6, nome_surf.get_height() + 2), pygame.SRCALPHA)
@@ -780,7 +785,7 @@ def _criar_tiro(jogador, projeteis, cx, cy, dx, dy, tempo):
         return
     info = ARMAS[jogador.arma]
     for _ in range(info['num_pellets']):
-        ang = math.atan2(dy, dx) + random.uniform(-info['espalhamento'], info['espalhamento'])
+        ang = math.atan2(dy, dx) + rng_jogo.uniform(-info['espalhamento'], info['espalhamento'])
         vx = math.cos(ang) * info['velocidade_proj']
         vy = math.sin(ang) * info['velocidade_proj']
         projeteis.append({
@@ -964,9 +969,9 @@ def _bot_construir_parede_defensiva(bot, paredes, alvo):
                 return (bx / d) * ndx + (by / d) * ndy
             candidatos.sort(key=_score, reverse=True)
         else:
-            random.shuffle(candidatos)
+            rng_jogo.shuffle(candidatos)
     else:
-        random.shuffle(candidatos)
+        rng_jogo.shuffle(candidatos)
 
     for chave, rect in candidatos:
         gi, gj, _ = chave
@@ -1032,7 +1037,7 @@ def _bot_rush_boxfight(bot, paredes, jogadores, tempo):
             bot.bot_rush_ativo = False
             bot.em_construcao = False
             return
-        bot.bot_rush_alvo = random.choice(vivos)
+        bot.bot_rush_alvo = rng_jogo.choice(vivos)
 
     alvo = bot.bot_rush_alvo
     bot_cx = bot.x + TAM_JOGADOR // 2
@@ -1150,7 +1155,7 @@ def _bot_ai_boxfight(bot, jogadores, paredes, tempo):
     bot_cx, bot_cy = bot.get_centro()
 
     if bot.arma is None:
-        bot.arma = random.choice(['spas', 'metralhadora'])
+        bot.arma = rng_jogo.choice(['spas', 'metralhadora'])
 
     # Encontrar alvo ANTES do bloco de construcao para usar na IA defensiva
     melhor_alvo = None
@@ -1184,7 +1189,7 @@ def _bot_ai_boxfight(bot, jogadores, paredes, tempo):
         return
 
     # Chance aleatoria de re-entrar em rush durante a partida
-    if not bot.bot_rush_ativo and melhor_alvo and random.random() < BOT_RUSH_CHANCE:
+    if not bot.bot_rush_ativo and melhor_alvo and rng_jogo.random() < BOT_RUSH_CHANCE:
         bot.bot_rush_ativo = True
         bot.bot_rush_alvo  = melhor_alvo
         bot.bot_rush_fase  = 'construir'
@@ -1197,7 +1202,7 @@ def _bot_ai_boxfight(bot, jogadores, paredes, tempo):
         else:
             # Constroi com mais frequencia quando HP esta baixo
             freq = 0.18 if hp_ratio < 0.5 else 0.12
-            if random.random() < freq:
+            if rng_jogo.random() < freq:
                 _bot_construir_parede_defensiva(bot, paredes, melhor_alvo)
             bot.vx = 0
             bot.vy = 0
@@ -1207,16 +1212,16 @@ def _bot_ai_boxfight(bot, jogadores, paredes, tempo):
     build_chance = BOT_BUILD_CHANCE * (1.0 + (1.0 - hp_ratio) * 4.0)
     if melhor_dist < 180:
         build_chance *= 2.0  # urgencia quando inimigo esta perto
-    if random.random() < build_chance:
+    if rng_jogo.random() < build_chance:
         bot.em_construcao = True
         duracao = int(BOT_BUILD_DURACAO * (1.5 if hp_ratio < 0.5 else 1.0))
         bot.bot_build_timer = tempo + duracao
 
     # Editar propria parede: abrir gap para atirar ocasionalmente
     if melhor_alvo and tempo > bot.bot_edit_timer:
-        if random.random() < 0.006:
+        if rng_jogo.random() < 0.006:
             _bot_abrir_gap_tiro(bot, paredes, melhor_alvo)
-            bot.bot_edit_timer = tempo + random.randint(1200, 2800)
+            bot.bot_edit_timer = tempo + rng_jogo.randint(1200, 2800)
 
     if not melhor_alvo:
         bot.vx = 0
@@ -1233,7 +1238,7 @@ def _bot_ai_boxfight(bot, jogadores, paredes, tempo):
 
     # Strafe
     if tempo > bot.bot_strafe_timer:
-        bot.bot_strafe_timer = tempo + BOT_STRAFE_INTERVALO + random.randint(-200, 200)
+        bot.bot_strafe_timer = tempo + BOT_STRAFE_INTERVALO + rng_jogo.randint(-200, 200)
         bot.bot_strafe_dir = -bot.bot_strafe_dir
 
     strafe_x = -dir_y * bot.bot_strafe_dir
@@ -1292,8 +1297,8 @@ def _bot_atirar(bot, jogadores, paredes, projeteis, tempo):
     dist_alvo = math.sqrt((alvo.x - bot.x) ** 2 + (alvo.y - bot.y) ** 2)
     imprecisao = min(30, dist_alvo * 0.06)
 
-    alvo_x = alvo.x + TAM_JOGADOR // 2 + random.uniform(-imprecisao, imprecisao)
-    alvo_y = alvo.y + TAM_JOGADOR // 2 + random.uniform(-imprecisao, imprecisao)
+    alvo_x = alvo.x + TAM_JOGADOR // 2 + rng_jogo.uniform(-imprecisao, imprecisao)
+    alvo_y = alvo.y + TAM_JOGADOR // 2 + rng_jogo.uniform(-imprecisao, imprecisao)
 
     cx, cy = bot.get_centro()
     dx = alvo_x - cx
@@ -1306,7 +1311,7 @@ def _bot_atirar(bot, jogadores, paredes, projeteis, tempo):
 
     _criar_tiro(bot, projeteis, cx, cy, dx, dy, tempo)
     bot.tempo_ultimo_tiro = tempo
-    bot.bot_shoot_timer = tempo + random.randint(BOT_SHOOT_BASE_DELAY - 80, BOT_SHOOT_BASE_DELAY + 150)
+    bot.bot_shoot_timer = tempo + rng_jogo.randint(BOT_SHOOT_BASE_DELAY - 80, BOT_SHOOT_BASE_DELAY + 150)
 
 
 # ============================================================
@@ -1388,50 +1393,49 @@ def _desenhar_hud_boxfight(tela, jogador, fonte_hud, fonte_peq, jogadores_vivos,
         arma_cor = (255, 255, 60)
     else:
         arma_cor = (140, 140, 140)
-    arma_s = fonte_peq.render(f"[E] {arma_nome}", True, arma_cor)
+    arma_s = renderizar_texto(f"[E] {arma_nome}", fonte_peq, arma_cor)
     tela.blit(arma_s, (15, 30))
 
     # Modo construcao
     if jogador.em_construcao:
         pulso = int(160 + 95 * abs(math.sin(tempo / 200)))
-        modo_s = fonte_peq.render("[Q] CONSTRUCAO ATIVO", True, (50, pulso, 50))
+        modo_s = renderizar_texto("[Q] CONSTRUCAO ATIVO", fonte_peq, (50, pulso, 50))
     else:
-        modo_s = fonte_peq.render("[Q] Construir", True, (70, 120, 70))
+        modo_s = renderizar_texto("[Q] Construir", fonte_peq, (70, 120, 70))
     tela.blit(modo_s, (15, 47))
 
     # Modo edicao
     if jogador.modo_edicao:
         pulso_e = int(160 + 95 * abs(math.sin(tempo / 200)))
-        edit_s = fonte_peq.render("[G] EDICAO ATIVO", True, (pulso_e, pulso_e, 30))
+        edit_s = renderizar_texto("[G] EDICAO ATIVO", fonte_peq, (pulso_e, pulso_e, 30))
     else:
-        edit_s = fonte_peq.render("[G] Editar Parede", True, (110, 110, 50))
+        edit_s = renderizar_texto("[G] Editar Parede", fonte_peq, (110, 110, 50))
     tela.blit(edit_s, (15, 64))
 
     # Cura
     if jogador.cura_ativo:
         pulso_f = int(160 + 95 * abs(math.sin(tempo / 150)))
-        cura_s = fonte_peq.render("[F] CURANDO...", True, (50, pulso_f, 80))
+        cura_s = renderizar_texto("[F] CURANDO...", fonte_peq, (50, pulso_f, 80))
         tela.blit(cura_s, (15, 81))
     elif jogador.cura_usado:
-        cura_s = fonte_peq.render("[F] Cura: USADA", True, (80, 80, 80))
+        cura_s = renderizar_texto("[F] Cura: USADA", fonte_peq, (80, 80, 80))
         tela.blit(cura_s, (15, 81))
     else:
-        cura_s = fonte_peq.render("[F] Curar (1x)", True, (80, 200, 100))
+        cura_s = renderizar_texto("[F] Curar (1x)", fonte_peq, (80, 200, 100))
         tela.blit(cura_s, (15, 81))
 
     # Info central
-    info = fonte_peq.render(
-        f"Vivos: {jogadores_vivos}  |  Rodada: {rodada}/{NUM_RODADAS}", True, (180, 180, 200))
+    info = renderizar_texto(f"Vivos: {jogadores_vivos}  |  Rodada: {rodada}/{NUM_RODADAS}", fonte_peq, (180, 180, 200))
     tela.blit(info, (LARGURA // 2 - info.get_width() // 2, 8))
 
     # Kills
-    kills_s = fonte_peq.render(f"Kills: {jogador.kills}", True, (180, 255, 180))
+    kills_s = renderizar_texto(f"Kills: {jogador.kills}", fonte_peq, (180, 255, 180))
     tela.blit(kills_s, (LARGURA - kills_s.get_width() - MINIMAP_W - 20, 12))
 
     # Controles
-    ctrl = fonte_peq.render(
+    ctrl = renderizar_texto(
         "WASD: Mover  |  E: Arma  |  Q: Construir  |  G: Editar  |  F: Curar  |  LMB: Atirar/Colocar/Remover",
-        True, (100, 100, 130))
+        fonte_peq, (100, 100, 130))
     tela.blit(ctrl, (LARGURA // 2 - ctrl.get_width() // 2, ALTURA_JOGO - 18))
 
 
@@ -1457,9 +1461,12 @@ def _desenhar_kill_feed(tela, kill_feed, fonte, tempo):
             frac = (idade - (KILL_FEED_DURACAO - KILL_FEED_FADE)) / KILL_FEED_FADE
             alpha = int(255 * (1.0 - frac))
 
-        k_surf = fonte.render(entrada['killer'], True, entrada['killer_cor'])
-        sep_surf = fonte.render(' > ', True, (200, 200, 200))
-        v_surf = fonte.render(entrada['victim'],  True, entrada['victim_cor'])
+        # Texto do cache só com alpha cheio (as superfícies dele são
+        # compartilhadas); no fade renderiza cópias próprias
+        render = renderizar_texto if alpha == 255 else (lambda texto, f, cor: f.render(texto, True, cor))
+        k_surf = render(entrada['killer'], fonte, entrada['killer_cor'])
+        sep_surf = render(' > ', fonte, (200, 200, 200))
+        v_surf = render(entrada['victim'], fonte, entrada['victim_cor'])
 
         total_w = k_surf.get_width() + sep_surf.get_width() + v_surf.get_width()
         row_h   = k_surf.get_height()
@@ -1469,8 +1476,9 @@ def _desenhar_kill_feed(tela, kill_feed, fonte, tempo):
         bg.fill((0, 0, 0, int(140 * alpha / 255)))
         tela.blit(bg, (x_start - 4, kf_y - 2))
 
-        for surf in (k_surf, sep_surf, v_surf):
-            surf.set_alpha(alpha)
+        if alpha < 255:
+            for surf in (k_surf, sep_surf, v_surf):
+                surf.set_alpha(alpha)
 
         tela.blit(k_surf,   (x_start, kf_y))
         tela.blit(sep_surf, (x_start + k_surf.get_width(), kf_y))
@@ -1521,11 +1529,9 @@ def _desenhar_minimap_boxfight(tela, jogadores, jogador_local, paredes, cam_x, c
 # ============================================================
 
 def _desenhar_scoreboard_boxfight(tela, jogadores, fonte_grande, fonte_score, fonte_peq, tempo, start_time):
-    overlay = pygame.Surface((LARGURA, ALTURA_JOGO), pygame.SRCALPHA)
-    overlay.fill((0, 0, 0, 185))
-    tela.blit(overlay, (0, 0))
+    desenhar_overlay_cor(tela, (0, 0, 0), 185, (LARGURA, ALTURA_JOGO))
 
-    titulo = fonte_grande.render("RESULTADO", True, (255, 220, 100))
+    titulo = renderizar_texto("RESULTADO", fonte_grande, (255, 220, 100))
     tela.blit(titulo, (LARGURA // 2 - titulo.get_width() // 2, 40))
 
     ranking = sorted(jogadores, key=lambda j: (-j.rodadas_vencidas, -j.kills))
@@ -1550,7 +1556,7 @@ def _desenhar_scoreboard_boxfight(tela, jogadores, fonte_grande, fonte_score, fo
         pos_text = medalhas[rank] if rank < 3 else f"{rank + 1}th"
         pos_cores = [(255, 215, 0), (200, 200, 210), (205, 127, 50), (150, 150, 160)]
         pos_cor = pos_cores[min(rank, 3)]
-        pos_s = fonte_score.render(pos_text, True, pos_cor)
+        pos_s = renderizar_texto(pos_text, fonte_score, pos_cor)
         tela.blit(pos_s, (linha_x + 15, y + 8))
 
         sq_x, sq_y, sq_tam = linha_x + 80, y + 6, 28
@@ -1562,17 +1568,17 @@ def _desenhar_scoreboard_boxfight(tela, jogadores, fonte_grande, fonte_score, fo
         arma_cor_map = {'spas': (255, 140, 40), 'metralhadora': (255, 255, 60), None: (80, 80, 80)}
         # (mostrar arma que o jogador tinha ao fim)
 
-        nome_s = fonte_score.render(j.nome, True, BRANCO)
+        nome_s = renderizar_texto(j.nome, fonte_score, BRANCO)
         tela.blit(nome_s, (sq_x + sq_tam + 18, y + 8))
 
-        stats_s = fonte_peq.render(f"{j.rodadas_vencidas}R  {j.kills}K", True, (180, 255, 180))
+        stats_s = renderizar_texto(f"{j.rodadas_vencidas}R  {j.kills}K", fonte_peq, (180, 255, 180))
         tela.blit(stats_s, (linha_x + 370, y + 12))
 
         if rank < 3:
             pygame.draw.rect(tela, pos_cor, (linha_x, y, linha_w, 42), 1, 3)
 
     if tempo_decorrido > 3000:
-        inst = fonte_peq.render("Voltando ao menu...", True, (120, 120, 140))
+        inst = renderizar_texto("Voltando ao menu...", fonte_peq, (120, 120, 140))
         tela.blit(inst, (LARGURA // 2 - inst.get_width() // 2, ALTURA_JOGO - 30))
 
 
@@ -1587,20 +1593,20 @@ def executar_minigame_boxfight(tela, relogio, gradiente_jogo, fonte_titulo, font
 
     seed = customizacao.get('seed')
     if seed is not None:
-        random.seed(seed)
+        semear_jogo(seed)
         print(f"[BOXFIGHT] Seed: {seed}")
 
     if cliente:
         cliente.get_minigame_actions()
 
     # Fontes
-    fonte_grande    = pygame.font.SysFont("Arial", 48, True)
-    fonte_media     = pygame.font.SysFont("Arial", 28, True)
-    fonte_peq       = pygame.font.SysFont("Arial", 14)
-    fonte_nomes     = pygame.font.SysFont("Arial", 12)
-    fonte_hud       = pygame.font.SysFont("Arial", 18, True)
-    fonte_score     = pygame.font.SysFont("Arial", 22, True)
-    fonte_countdown = pygame.font.SysFont("Arial", 72, True)
+    fonte_grande    = obter_fonte("Arial", 48, True)
+    fonte_media     = obter_fonte("Arial", 28, True)
+    fonte_peq       = obter_fonte("Arial", 14)
+    fonte_nomes     = obter_fonte("Arial", 12)
+    fonte_hud       = obter_fonte("Arial", 18, True)
+    fonte_score     = obter_fonte("Arial", 22, True)
+    fonte_countdown = obter_fonte("Arial", 72, True)
 
     pygame.mouse.set_visible(False)
     mira_surface, mira_rect = criar_mira(12, BRANCO, (255, 140, 40))
@@ -1620,15 +1626,19 @@ def executar_minigame_boxfight(tela, relogio, gradiente_jogo, fonte_titulo, font
         ci = (pid - 1) % len(PALETA_CORES)
         jr = JogadorBoxFight(rp.name, PALETA_CORES[ci], is_bot=False, is_remote=True)
         jr.arma = 'spas'
+        jr.player_id = pid
         jogadores.append(jr)
 
+    # Posições dos jogadores remotos, interpoladas a partir dos 'boxfight_input'
+    interp_remotos = InterpolationSet()
+
     nomes_bots = ["Bot Alpha", "Bot Bravo", "Bot Charlie", "Bot Delta",
                   "Bot Echo",  "Bot Foxtrot", "Bot Golf",  "Bot Hotel"]
     bot_idx = 0
     while len(jogadores) < 8:
         ci = len(jogadores) % len(PALETA_CORES)
         bot = JogadorBoxFight(nomes_bots[bot_idx], PALETA_CORES[ci], is_bot=True)
-        bot.arma = random.choice(['spas', 'metralhadora'])
+        bot.arma = rng_jogo.choice(['spas', 'metralhadora'])
         jogadores.append(bot)
         bot_idx += 1
 
@@ -1668,6 +1678,7 @@ def executar_minigame_boxfight(tela, relogio, gradiente_jogo, fonte_titulo, font
         # ============================================================
         #  EVENTOS
         # ============================================================
+        secao('eventos')
         for ev in pygame.event.get():
             if ev.type == pygame.QUIT:
                 pygame.mouse.set_visible(True)
@@ -1808,6 +1819,7 @@ def executar_minigame_boxfight(tela, relogio, gradiente_jogo, fonte_titulo, font
         # ============================================================
         #  MAQUINA DE ESTADOS
         # ============================================================
+        secao('logica')
 
         if estado == "INTRO":
             if tempo_no_estado < 500:
@@ -1822,6 +1834,8 @@ def executar_minigame_boxfight(tela, relogio, gradiente_jogo, fonte_titulo, font
             if tempo_no_estado >= TEMPO_COUNTDOWN:
                 estado = "FIGHT"
                 tempo_estado = tempo
+                # Descartar posições remotas da rodada anterior
+                interp_remotos.clear()
                 # Ativar rush mode em todos os bots no inicio da rodada
                 for _j in jogadores:
                     if _j.is_bot and _j.vivo:
@@ -1836,11 +1850,11 @@ def executar_minigame_boxfight(tela, relogio, gradiente_jogo, fonte_titulo, font
                 for action in cliente.get_minigame_actions():
                     act = action.get('action')
                     for j in jogadores:
-                        if not j.is_remote or not j.vivo:
+                        if not j.is_remote or not j.vivo or j.player_id != action.get('player_id'):
                             continue
                         if act == 'boxfight_input':
-                            j.x = action.get('x', j.x)
-                            j.y = action.get('y', j.y)
+                            interp_remotos.push(j.player_id, action.get('x', j.x),
+                                                action.get('y', j.y), action.get('t'))
                             j.mira_x = action.get('mx', j.mira_x)
                             j.mira_y = action.get('my', j.mira_y)
                         elif act == 'boxfight_tiro':
@@ -1924,7 +1938,7 @@ def executar_minigame_boxfight(tela, relogio, gradiente_jogo, fonte_titulo, font
                             'action': 'boxfight_tiro',
                             'cx': cx_h, 'cy': cy_h,
                             'dx': dx_t, 'dy': dy_t,
-                        })
+                        }, critical=True)
                     try:
                         from src.utils.sound import gerar_som_tiro
                         som = pygame.mixer.Sound(gerar_som_tiro())
@@ -1979,13 +1993,18 @@ def executar_minigame_boxfight(tela, relogio, gradiente_jogo, fonte_titulo, font
             # Bot AI
             for j in jogadores:
                 if j.is_bot and j.vivo:
-                    _bot_ai_boxfight(j, jogadores, paredes, tempo)
-                    _bot_atirar(j, jogadores, paredes, projeteis, tempo)
+                    with escopo('ia'):
+                        _bot_ai_boxfight(j, jogadores, paredes, tempo)
+                        _bot_atirar(j, jogadores, paredes, projeteis, tempo)
 
             # Atualizar posicoes
             for j in jogadores:
                 if j.vivo:
-                    if not j.is_remote:
+                    if j.is_remote:
+                        pos = interp_remotos.sample(j.player_id)
+                        if pos:
+                            j.x, j.y = pos
+                    else:
                         j.x += j.vx
                         j.y += j.vy
                     j.x = max(4, min(j.x, ARENA_W - TAM_JOGADOR - 4))
@@ -2009,7 +2028,8 @@ def executar_minigame_boxfight(tela, relogio, gradiente_jogo, fonte_titulo, font
                 })
 
             # Projeteis
-            _atualizar_projeteis(projeteis, jogadores, paredes, particulas, kill_feed, tempo)
+            with escopo('tiros'):
+                _atualizar_projeteis(projeteis, jogadores, paredes, particulas, kill_feed, tempo)
 
             # Checar fim da rodada
             vivos = [j for j in jogadores if j.vivo]
@@ -2031,7 +2051,7 @@ def executar_minigame_boxfight(tela, relogio, gradiente_jogo, fonte_titulo, font
                     for i, j in enumerate(jogadores):
                         j.reset_rodada(SPAWN_POINTS[i][0], SPAWN_POINTS[i][1])
                         if j.is_bot:
-                            j.arma = random.choice(['spas', 'metralhadora'])
+                            j.arma = rng_jogo.choice(['spas', 'metralhadora'])
                     paredes.clear()
                     projeteis.clear()
                     particulas.clear()
@@ -2060,6 +2080,7 @@ def executar_minigame_boxfight(tela, relogio, gradiente_jogo, fonte_titulo, font
         # ============================================================
         #  ATUALIZAR PARTICULAS
         # ============================================================
+        secao('particulas')
         for p in particulas[:]:
             p.atualizar()
             if p.vida <= 0:
@@ -2073,6 +2094,7 @@ def executar_minigame_boxfight(tela, relogio, gradiente_jogo, fonte_titulo, font
         # ============================================================
         #  DESENHAR
         # ============================================================
+        secao('render')
         _desenhar_arena_boxfight(tela, cam_x, cam_y, tempo)
 
         # Preview de construcao
@@ -2109,16 +2131,19 @@ def executar_minigame_boxfight(tela, relogio, gradiente_jogo, fonte_titulo, font
         # HUD
         if estado == "FIGHT":
             jogadores_vivos = len([j for j in jogadores if j.vivo])
-            _desenhar_hud_boxfight(tela, jogador_humano, fonte_hud, fonte_peq,
-                                   jogadores_vivos, rodada_atual, tempo)
+            with escopo('hud'):
+                _desenhar_hud_boxfight(tela, jogador_humano, fonte_hud, fonte_peq,
+                                       jogadores_vivos, rodada_atual, tempo)
 
         # Minimap
         if estado in ("FIGHT", "COUNTDOWN"):
-            _desenhar_minimap_boxfight(tela, jogadores, jogador_humano, paredes, cam_x, cam_y)
+            with escopo('hud'):
+                _desenhar_minimap_boxfight(tela, jogadores, jogador_humano, paredes, cam_x, cam_y)
 
         # Kill feed
         if estado in ("FIGHT", "ROUND_END"):
-            _desenhar_kill_feed(tela, kill_feed, fonte_score, tempo)
+            with escopo('hud'):
+                _desenhar_kill_feed(tela, kill_feed, fonte_score, tempo)
 
         # Mira
         if estado in ("FIGHT", "COUNTDOWN"):
@@ -2130,37 +2155,33 @@ def executar_minigame_boxfight(tela, relogio, gradiente_jogo, fonte_titulo, font
             segundos = 3 - tempo_no_estado // 1000
             cd_text = str(max(0, segundos)) if segundos > 0 else "FIGHT!"
             cd_cor  = AMARELO if segundos > 0 else VERMELHO
-            cd_surf = fonte_countdown.render(cd_text, True, cd_cor)
+            cd_surf = renderizar_texto(cd_text, fonte_countdown, cd_cor)
             tela.blit(cd_surf, (LARGURA // 2 - cd_surf.get_width() // 2,
                                  ALTURA_JOGO // 2 - cd_surf.get_height() // 2))
 
         # Round end
         if estado == "ROUND_END":
-            ov = pygame.Surface((LARGURA, ALTURA_JOGO), pygame.SRCALPHA)
-            ov.fill((0, 0, 0, 110))
-            tela.blit(ov, (0, 0))
+            desenhar_overlay_cor(tela, (0, 0, 0), 110, (LARGURA, ALTURA_JOGO))
             if round_vencedor:
                 msg = f"{round_vencedor.nome} venceu a rodada {rodada_atual}!"
                 cor_msg = round_vencedor.cor
             else:
                 msg = "Empate!"
                 cor_msg = AMARELO
-            msg_surf = fonte_grande.render(msg, True, cor_msg)
+            msg_surf = renderizar_texto(msg, fonte_grande, cor_msg)
             tela.blit(msg_surf, (LARGURA // 2 - msg_surf.get_width() // 2,
                                   ALTURA_JOGO // 2 - msg_surf.get_height() // 2))
 
         # Scoreboard
         if estado == "SCOREBOARD":
-            _desenhar_scoreboard_boxfight(tela, jogadores, fonte_grande, fonte_score,
-                                          fonte_peq, tempo, scoreboard_start)
+            with escopo('hud'):
+                _desenhar_scoreboard_boxfight(tela, jogadores, fonte_grande, fonte_score,
+                                              fonte_peq, tempo, scoreboard_start)
 
         # Intro fade + titulo
         if estado == "INTRO":
             if alpha_fade > 0:
-                fade_surf = pygame.Surface((LARGURA, ALTURA_JOGO))
-                fade_surf.fill((0, 0, 0))
-                fade_surf.set_alpha(alpha_fade)
-                tela.blit(fade_surf, (0, 0))
+                desenhar_overlay_cor(tela, (0, 0, 0), alpha_fade, (LARGURA, ALTURA_JOGO))
             if tempo_no_estado > 500:
                 alpha_t = min(255, int((tempo_no_estado - 500) * 0.5))
                 titulo_s = fonte_grande.render("BOXFIGHT", True, (255, 150, 50))
@@ -11,11 +11,15 @@ import pygame
 import math
 import random
 from src.config import *
-from src.entities.tiro import Tiro
+from src.entities.tiro import Tiro, desenhar_tiros
 from src.entities.particula import Particula, criar_explosao
-from src.utils.visual import criar_estrelas, desenhar_estrelas, criar_mira, desenhar_mira
+from src.utils.visual import criar_estrelas, desenhar_estrelas, criar_mira, desenhar_mira, desenhar_overlay_cor
 from src.utils.display_manager import present_frame, convert_mouse_position
+from src.utils.profiler import escopo, secao
+from src.utils.fonts import obter_fonte, renderizar_texto
+from src.network.interpolation import InterpolationSet
 from src.weapons.desert_eagle import desenhar_desert_eagle
+from src.utils.rng import rng_jogo, semear_jogo
 
 # ============================================================
 #  CONSTANTES
@@ -117,6 +121,7 @@ class JogadorDeadeye:
         self.cor = cor
         self.is_bot = is_bot
         self.is_remote = is_remote
+        self.player_id = None  # ID de rede (apenas jogadores remotos)
         self.hp = HP_MAX
         self.vivo = True
         self.kills = 0
@@ -355,7 +360,7 @@ class JogadorDeadeye:
 
         # Nome (verde se for o jogador humano controlado)
         cor_nome = (0, 255, 100) if not self.is_bot and not self.is_remote else BRANCO
-        nome_surf = fonte.render(self.nome, True, cor_nome)
+        nome_surf = renderizar_texto(self.nome, fonte, cor_nome)
         nx = ix + tam // 2 - nome_surf.get_width() // 2
         ny = iy - 16
         bg = pygame.Surface((nome_surf.get_width() + 6, nome_surf.get_height() + 2), pygame.SRCALPHA)
@@ -564,10 +569,10 @@ def _desenhar_arena(tela, tempo):
                      (LINHA_X, ARENA_Y), (LINHA_X, ARENA_Y + ARENA_H), 1)
 
     # Labels nas zonas de mortos
-    fonte_zona = pygame.font.SysFont("Arial", 10)
-    txt_l = fonte_zona.render("DEAD ZONE", True, (60, 50, 50))
+    fonte_zona = obter_fonte("Arial", 10)
+    txt_l = renderizar_texto("DEAD ZONE", fonte_zona, (60, 50, 50))
     tela.blit(txt_l, (ARENA_X - CORREDOR + 2, ARENA_Y - CORREDOR + 2))
-    txt_r = fonte_zona.render("DEAD ZONE", True, (60, 50, 50))
+    txt_r = renderizar_texto("DEAD ZONE", fonte_zona, (60, 50, 50))
     tela.blit(txt_r, (ARENA_X + ARENA_W + 2, ARENA_Y - CORREDOR + 2))
 
 
@@ -586,7 +591,7 @@ def _desenhar_portador_indicador(tela, jogador, fonte, tempo):
         (px, py + 8), (px - 6, py), (px + 6, py)
     ])
     # Texto "DEAGLE"
-    txt = fonte.render("DEAGLE", True, (255, 220, 80))
+    txt = renderizar_texto("DEAGLE", fonte, (255, 220, 80))
     tela.blit(txt, (px - txt.get_width() // 2, py - 14))
 
 
@@ -594,7 +599,7 @@ def _desenhar_hud(tela, jogadores, jogador_humano, equipe_a_rodadas, equipe_b_ro
                   fonte_hud, fonte_peq, estado, esperando_resultado=False):
     """Desenha o HUD do jogo."""
     # Titulo
-    titulo = fonte_hud.render("DEADEYE", True, (255, 220, 100))
+    titulo = renderizar_texto("DEADEYE", fonte_hud, (255, 220, 100))
     tela.blit(titulo, (LARGURA // 2 - titulo.get_width() // 2, 5))
 
     # Contagem de vivos por equipe
@@ -604,7 +609,7 @@ def _desenhar_hud(tela, jogadores, jogador_humano, equipe_a_rodadas, equipe_b_ro
     mortos_zona_b = sum(1 for j in jogadores if j.equipe == 1 and j.morto_zona)
 
     # Equipe A (esquerda)
-    eq_a_txt = fonte_hud.render(f"EQUIPE A: {vivos_a}/4", True, COR_EQUIPE_A)
+    eq_a_txt = renderizar_texto(f"EQUIPE A: {vivos_a}/4", fonte_hud, COR_EQUIPE_A)
     tela.blit(eq_a_txt, (20, 5))
 
     # Rodadas equipe A
@@ -613,7 +618,7 @@ def _desenhar_hud(tela, jogadores, jogador_humano, equipe_a_rodadas, equipe_b_ro
         pygame.draw.circle(tela, cor_r, (22 + i * 16, 30), 5)
 
     # Equipe B (direita)
-    eq_b_txt = fonte_hud.render(f"EQUIPE B: {vivos_b}/4", True, COR_EQUIPE_B)
+    eq_b_txt = renderizar_texto(f"EQUIPE B: {vivos_b}/4", fonte_hud, COR_EQUIPE_B)
     tela.blit(eq_b_txt, (LARGURA - eq_b_txt.get_width() - 20, 5))
 
     # Rodadas equipe B
@@ -628,7 +633,7 @@ def _desenhar_hud(tela, jogadores, jogador_humano, equipe_a_rodadas, equipe_b_ro
         cor_hp = VERDE if jogador_humano.hp > 1 else VERMELHO
         if jogador_humano.morto_zona:
             cor_hp = (150, 100, 100)
-        hp_surf = fonte_hud.render(hp_txt, True, cor_hp)
+        hp_surf = renderizar_texto(hp_txt, fonte_hud, cor_hp)
         tela.blit(hp_surf, (LARGURA // 2 - hp_surf.get_width() // 2, ALTURA_JOGO - 30))
 
         # Status da arma
@@ -644,7 +649,7 @@ def _desenhar_hud(tela, jogadores, jogador_humano, equipe_a_rodadas, equipe_b_ro
         else:
             arma_nome = "Aguardando turno..."
             arma_cor = (120, 120, 120)
-        arma_surf = fonte_peq.render(arma_nome, True, arma_cor)
+        arma_surf = renderizar_texto(arma_nome, fonte_peq, arma_cor)
         tela.blit(arma_surf, (LARGURA // 2 - arma_surf.get_width() // 2, ALTURA_JOGO - 15))
 
         # Dash cooldown
@@ -664,9 +669,7 @@ def _desenhar_scoreboard(tela, jogadores, equipe_a_rodadas, equipe_b_rodadas,
                          fonte_grande, fonte_media, fonte_score, fonte_peq,
                          tempo, start_time):
     """Desenha o scoreboard final."""
-    overlay = pygame.Surface((LARGURA, ALTURA_JOGO), pygame.SRCALPHA)
-    overlay.fill((0, 0, 0, 180))
-    tela.blit(overlay, (0, 0))
+    desenhar_overlay_cor(tela, (0, 0, 0), 180, (LARGURA, ALTURA_JOGO))
 
     # Vencedor
     if equipe_a_rodadas > equipe_b_rodadas:
@@ -679,11 +682,11 @@ def _desenhar_scoreboard(tela, jogadores, equipe_a_rodadas, equipe_b_rodadas,
         vencedor_txt = "EMPATE!"
         vencedor_cor = (200, 200, 200)
 
-    titulo = fonte_grande.render(vencedor_txt, True, vencedor_cor)
+    titulo = renderizar_texto(vencedor_txt, fonte_grande, vencedor_cor)
     tela.blit(titulo, (LARGURA // 2 - titulo.get_width() // 2, 30))
 
     # Placar rodadas
-    placar = fonte_media.render(f"{equipe_a_rodadas} x {equipe_b_rodadas}", True, BRANCO)
+    placar = renderizar_texto(f"{equipe_a_rodadas} x {equipe_b_rodadas}", fonte_media, BRANCO)
     tela.blit(placar, (LARGURA // 2 - placar.get_width() // 2, 85))
 
     # Ranking por kills
@@ -710,18 +713,18 @@ def _desenhar_scoreboard(tela, jogadores, equipe_a_rodadas, equipe_b_rodadas,
         pygame.draw.rect(tela, cor_eq, (lx, ly, 4, 28))
 
         # Posicao
-        pos_txt = fonte_peq.render(f"#{rank + 1}", True, (180, 180, 180))
+        pos_txt = renderizar_texto(f"#{rank + 1}", fonte_peq, (180, 180, 180))
         tela.blit(pos_txt, (lx + 12, ly + 6))
 
         # Cor do jogador
         pygame.draw.rect(tela, j.cor, (lx + 45, ly + 7, 14, 14), 0, 2)
 
         # Nome
-        nome = fonte_peq.render(j.nome, True, BRANCO)
+        nome = renderizar_texto(j.nome, fonte_peq, BRANCO)
         tela.blit(nome, (lx + 68, ly + 6))
 
         # Kills
-        kills_txt = fonte_peq.render(f"{j.kills} kills", True, (255, 200, 100))
+        kills_txt = renderizar_texto(f"{j.kills} kills", fonte_peq, (255, 200, 100))
         tela.blit(kills_txt, (lx + 330, ly + 6))
 
 
@@ -769,7 +772,7 @@ def _bot_ai_deadeye(bot, jogadores, tiros, particulas, flashes, tempo,
 
     # Strafe
     if tempo > bot.bot_strafe_timer:
-        bot.bot_strafe_timer = tempo + BOT_STRAFE_INTERVALO + random.randint(-300, 100)
+        bot.bot_strafe_timer = tempo + BOT_STRAFE_INTERVALO + rng_jogo.randint(-300, 100)
         bot.bot_strafe_dir = -bot.bot_strafe_dir
 
     strafe_x = -dir_y * bot.bot_strafe_dir
@@ -845,7 +848,7 @@ def _bot_ai_deadeye(bot, jogadores, tiros, particulas, flashes, tempo,
 
     # Mira
     imprecisao = min(dist / 600, 0.2)
-    angulo_mira = math.atan2(dy, dx) + random.uniform(-imprecisao, imprecisao)
+    angulo_mira = math.atan2(dy, dx) + rng_jogo.uniform(-imprecisao, imprecisao)
     bot.mira_x = bot_cx + math.cos(angulo_mira) * dist
     bot.mira_y = bot_cy + math.sin(angulo_mira) * dist
 
@@ -853,7 +856,7 @@ def _bot_ai_deadeye(bot, jogadores, tiros, particulas, flashes, tempo,
     if not bot.dash_ativo and not bot.morto_zona:
         usar_dash = False
         dash_dx, dash_dy = 0.0, 0.0
-        if tiro_muito_perto and random.random() < 0.12:
+        if tiro_muito_perto and rng_jogo.random() < 0.12:
             usar_dash = True
             dash_dx = dodge_perp_x
             dash_dy = dodge_perp_y
@@ -861,7 +864,7 @@ def _bot_ai_deadeye(bot, jogadores, tiros, particulas, flashes, tempo,
             usar_dash = True
             dash_dx = -dir_x
             dash_dy = -dir_y
-        elif random.random() < 0.003:
+        elif rng_jogo.random() < 0.003:
             usar_dash = True
             dash_dx = -dir_y * bot.bot_strafe_dir
             dash_dy = dir_x * bot.bot_strafe_dir
@@ -881,20 +884,20 @@ def executar_minigame_deadeye(tela, relogio, gradiente_jogo, fonte_titulo, fonte
     # Seed compartilhado
     seed = customizacao.get('seed')
     if seed is not None:
-        random.seed(seed)
+        semear_jogo(seed)
 
     # Limpar acoes pendentes
     if cliente:
         cliente.get_minigame_actions()
 
     # Fontes
-    fonte_grande = pygame.font.SysFont("Arial", 48, True)
-    fonte_media = pygame.font.SysFont("Arial", 28, True)
-    fonte_peq = pygame.font.SysFont("Arial", 14)
-    fonte_nomes = pygame.font.SysFont("Arial", 12)
-    fonte_hud = pygame.font.SysFont("Arial", 18, True)
-    fonte_score = pygame.font.SysFont("Arial", 22, True)
-    fonte_countdown = pygame.font.SysFont("Arial", 72, True)
+    fonte_grande = obter_fonte("Arial", 48, True)
+    fonte_media = obter_fonte("Arial", 28, True)
+    fonte_peq = obter_fonte("Arial", 14)
+    fonte_nomes = obter_fonte("Arial", 12)
+    fonte_hud = obter_fonte("Arial", 18, True)
+    fonte_score = obter_fonte("Arial", 22, True)
+    fonte_countdown = obter_fonte("Arial", 72, True)
 
     # Fundo
     estrelas = criar_estrelas(120)
@@ -916,7 +919,12 @@ def executar_minigame_deadeye(tela, relogio, gradiente_jogo, fonte_titulo, fonte
 
     for pid, rp in remotos.items():
         ci = (pid - 1) % len(PALETA_CORES)
-        jogadores.append(JogadorDeadeye(rp.name, PALETA_CORES[ci], is_bot=False, is_remote=True))
+        jr = JogadorDeadeye(rp.name, PALETA_CORES[ci], is_bot=False, is_remote=True)
+        jr.player_id = pid
+        jogadores.append(jr)
+
+    # Posições dos jogadores remotos, interpoladas a partir dos 'deadeye_input'
+    interp_remotos = InterpolationSet()
 
     nomes_bots = ["Bot Alpha", "Bot Bravo", "Bot Charlie", "Bot Delta",
                   "Bot Echo", "Bot Foxtrot", "Bot Golf", "Bot Hotel"]
@@ -928,7 +936,7 @@ def executar_minigame_deadeye(tela, relogio, gradiente_jogo, fonte_titulo, fonte
 
     # Distribuir equipes aleatoriamente
     indices = list(range(8))
-    random.shuffle(indices)
+    rng_jogo.shuffle(indices)
     for i, idx in enumerate(indices):
         jogadores[idx].equipe = 0 if i < 4 else 1
         # Cor do jogador = cor da equipe
@@ -973,7 +981,7 @@ def executar_minigame_deadeye(tela, relogio, gradiente_jogo, fonte_titulo, fonte
         candidatos = [i for i, j in enumerate(jogadores)
                       if j.equipe == equipe_alvo and j.na_arena()]
         if candidatos:
-            return random.choice(candidatos)
+            return rng_jogo.choice(candidatos)
         return None
 
     def _iniciar_rodada():
@@ -996,7 +1004,7 @@ def executar_minigame_deadeye(tela, relogio, gradiente_jogo, fonte_titulo, fonte
                 j.reset_rodada(sx, sy)
                 count_b += 1
         # Deagle para jogador aleatorio de equipe aleatoria
-        equipe_inicial = random.randint(0, 1)
+        equipe_inicial = rng_jogo.randint(0, 1)
         idx = _proximo_portador(equipe_inicial)
         if idx is not None:
             _dar_deagle_para(idx)
@@ -1008,6 +1016,7 @@ def executar_minigame_deadeye(tela, relogio, gradiente_jogo, fonte_titulo, fonte
         tempo_no_estado = tempo - tempo_estado
 
         # ========== EVENTOS ==========
+        secao('eventos')
         for ev in pygame.event.get():
             if ev.type == pygame.QUIT:
                 pygame.mouse.set_visible(True)
@@ -1047,12 +1056,18 @@ def executar_minigame_deadeye(tela, relogio, gradiente_jogo, fonte_titulo, fonte
                             bala_deagle = tiros[-1]
                             bala_deagle.is_deagle = True
                             esperando_resultado = True
+                        if cliente:
+                            cliente.send_minigame_action({
+                                'action': 'deadeye_shot',
+                                'mx': jogador_humano.mira_x, 'my': jogador_humano.mira_y,
+                            })
                     elif jogador_humano.morto_zona:
                         # Na zona de mortos, tiro normal livre
                         _disparar_deadeye(jogador_humano, jogador_humano.mira_x,
                                           jogador_humano.mira_y, tiros, particulas, flashes)
 
         # ========== LOGICA DE ESTADO ==========
+        secao('logica')
         if estado == "INTRO":
             if tempo_no_estado < 500:
                 alpha_fade = int(255 * (1 - tempo_no_estado / 500))
@@ -1071,6 +1086,8 @@ def executar_minigame_deadeye(tela, relogio, gradiente_jogo, fonte_titulo, fonte
             if tempo_no_estado >= TEMPO_COUNTDOWN:
                 estado = "FIGHT"
                 tempo_estado = tempo
+                # Descartar posições remotas da rodada anterior
+                interp_remotos.clear()
 
         elif estado == "FIGHT":
             # Movimento do jogador humano
@@ -1098,7 +1115,11 @@ def executar_minigame_deadeye(tela, relogio, gradiente_jogo, fonte_titulo, fonte
 
             # Atualizar posicoes de todos
             for j in jogadores:
-                if j.vivo and not j.dash_ativo:
+                if j.vivo and j.is_remote:
+                    pos = interp_remotos.sample(j.player_id)
+                    if pos:
+                        j.x, j.y = pos
+                elif j.vivo and not j.dash_ativo:
                     j.x += j.vx
                     j.y += j.vy
                     j._clampar_posicao()
@@ -1107,8 +1128,9 @@ def executar_minigame_deadeye(tela, relogio, gradiente_jogo, fonte_titulo, fonte
             # Bot AI
             for j in jogadores:
                 if j.is_bot and j.vivo:
-                    _bot_ai_deadeye(j, jogadores, tiros, particulas, flashes, tempo,
-                                    esperando_resultado)
+                    with escopo('ia'):
+                        _bot_ai_deadeye(j, jogadores, tiros, particulas, flashes, tempo,
+                                        esperando_resultado)
 
             # Bot com deagle: atirar apos delay
             if portador_idx >= 0 and not esperando_resultado:
@@ -1127,7 +1149,7 @@ def executar_minigame_deadeye(tela, relogio, gradiente_jogo, fonte_titulo, fonte
                 if j.is_bot and j.morto_zona and j.vivo:
                     if tempo >= j.bot_next_shot:
                         _disparar_deadeye(j, j.mira_x, j.mira_y, tiros, particulas, flashes)
-                        j.bot_next_shot = tempo + random.randint(500, 800)
+                        j.bot_next_shot = tempo + rng_jogo.randint(500, 800)
 
             # Rede
             if cliente and jogador_humano.vivo:
@@ -1144,15 +1166,16 @@ def executar_minigame_deadeye(tela, relogio, gradiente_jogo, fonte_titulo, fonte
                     act = acao.get('action', '')
                     if act == 'deadeye_input':
                         for j in jogadores:
-                            if j.is_remote and j.vivo:
-                                j.x = acao.get('x', j.x)
-                                j.y = acao.get('y', j.y)
+                            if j.is_remote and j.vivo and j.player_id == acao.get('player_id'):
+                                interp_remotos.push(j.player_id, acao.get('x', j.x),
+                                                    acao.get('y', j.y), acao.get('t'))
                                 j.mira_x = acao.get('mx', j.mira_x)
                                 j.mira_y = acao.get('my', j.mira_y)
                     elif act == 'deadeye_shot':
                         for j in jogadores:
-                            if j.is_remote and j.vivo and j.tem_deagle:
-                                _disparar_deadeye(j, j.mira_x, j.mira_y,
+                            if (j.is_remote and j.vivo and j.tem_deagle
+                                    and j.player_id == acao.get('player_id')):
+                                _disparar_deadeye(j, acao.get('mx', j.mira_x), acao.get('my', j.mira_y),
                                                   tiros, particulas, flashes)
                                 if tiros:
                                     bala_deagle = tiros[-1]
@@ -1258,11 +1281,11 @@ def executar_minigame_deadeye(tela, relogio, gradiente_jogo, fonte_titulo, fonte
                     novo = _proximo_portador(outra_equipe)
                     if novo is not None:
                         _dar_deagle_para(novo)
-                        jogadores[novo].bot_next_shot = tempo + random.randint(800, 1500)
+                        jogadores[novo].bot_next_shot = tempo + rng_jogo.randint(800, 1500)
                 else:
                     # Portador continua, reseta cooldown do bot
                     if portador_idx >= 0 and jogadores[portador_idx].is_bot:
-                        jogadores[portador_idx].bot_next_shot = tempo + random.randint(800, 1500)
+                        jogadores[portador_idx].bot_next_shot = tempo + rng_jogo.randint(800, 1500)
 
             elif deagle_errou:
                 # Errou! Passa a deagle para alguem da outra equipe
@@ -1278,7 +1301,7 @@ def executar_minigame_deadeye(tela, relogio, gradiente_jogo, fonte_titulo, fonte
                         novo = _proximo_portador(equipe_atual)
                     if novo is not None:
                         _dar_deagle_para(novo)
-                        jogadores[novo].bot_next_shot = tempo + random.randint(800, 1500)
+                        jogadores[novo].bot_next_shot = tempo + rng_jogo.randint(800, 1500)
 
             # Se o portador morreu (levou tiro normal de morto), passar deagle
             if portador_idx >= 0 and jogadores[portador_idx].morto_zona and not esperando_resultado:
@@ -1290,7 +1313,7 @@ def executar_minigame_deadeye(tela, relogio, gradiente_jogo, fonte_titulo, fonte
                     novo = _proximo_portador(equipe_portador)
                 if novo is not None:
                     _dar_deagle_para(novo)
-                    jogadores[novo].bot_next_shot = tempo + random.randint(800, 1500)
+                    jogadores[novo].bot_next_shot = tempo + rng_jogo.randint(800, 1500)
 
             # Verificar condicao de vitoria
             vivos_a = sum(1 for j in jogadores if j.equipe == 0 and j.na_arena())
@@ -1325,6 +1348,7 @@ def executar_minigame_deadeye(tela, relogio, gradiente_jogo, fonte_titulo, fonte
                 return None
 
         # ========== ATUALIZAR PARTICULAS E FLASHES ==========
+        secao('particulas')
         for p in particulas[:]:
             p.atualizar()
             if p.vida <= 0:
@@ -1336,6 +1360,7 @@ def executar_minigame_deadeye(tela, relogio, gradiente_jogo, fonte_titulo, fonte
                 flashes.remove(f)
 
         # ========== DESENHO ==========
+        secao('render')
         tela.fill((4, 2, 12))
         tela.blit(gradiente_jogo, (0, 0))
         desenhar_estrelas(tela, estrelas)
@@ -1355,8 +1380,7 @@ def executar_minigame_deadeye(tela, relogio, gradiente_jogo, fonte_titulo, fonte
                     _desenhar_portador_indicador(tela, j, fonte_peq, tempo)
 
         # Tiros
-        for tiro in tiros:
-            tiro.desenhar(tela)
+        desenhar_tiros(tela, tiros)
 
         # Particulas
         for p in particulas:
@@ -1375,61 +1399,58 @@ def executar_minigame_deadeye(tela, relogio, gradiente_jogo, fonte_titulo, fonte
             desenhar_mira(tela, mouse_pos, (mira_surface, mira_rect))
 
         # HUD
-        _desenhar_hud(tela, jogadores, jogador_humano, equipe_a_rodadas, equipe_b_rodadas,
-                      fonte_hud, fonte_peq, estado, esperando_resultado)
+        with escopo('hud'):
+            _desenhar_hud(tela, jogadores, jogador_humano, equipe_a_rodadas, equipe_b_rodadas,
+                          fonte_hud, fonte_peq, estado, esperando_resultado)
 
         # TEAM_SHOW
         if estado == "TEAM_SHOW":
-            overlay = pygame.Surface((LARGURA, ALTURA_JOGO), pygame.SRCALPHA)
-            overlay.fill((0, 0, 0, 150))
-            tela.blit(overlay, (0, 0))
+            desenhar_overlay_cor(tela, (0, 0, 0), 150, (LARGURA, ALTURA_JOGO))
 
-            titulo = fonte_grande.render("EQUIPES", True, (255, 220, 100))
+            titulo = renderizar_texto("EQUIPES", fonte_grande, (255, 220, 100))
             tela.blit(titulo, (LARGURA // 2 - titulo.get_width() // 2, 40))
 
             # Equipe A
-            eq_a_titulo = fonte_media.render("EQUIPE A", True, COR_EQUIPE_A)
+            eq_a_titulo = renderizar_texto("EQUIPE A", fonte_media, COR_EQUIPE_A)
             tela.blit(eq_a_titulo, (LARGURA // 4 - eq_a_titulo.get_width() // 2, 100))
             y_a = 140
             for j in jogadores:
                 if j.equipe == 0:
                     pygame.draw.rect(tela, j.cor, (LARGURA // 4 - 50, y_a, 20, 20), 0, 3)
-                    nome_s = fonte_hud.render(j.nome, True, BRANCO)
+                    nome_s = renderizar_texto(j.nome, fonte_hud, BRANCO)
                     tela.blit(nome_s, (LARGURA // 4 - 22, y_a + 1))
                     y_a += 30
 
             # Equipe B
-            eq_b_titulo = fonte_media.render("EQUIPE B", True, COR_EQUIPE_B)
+            eq_b_titulo = renderizar_texto("EQUIPE B", fonte_media, COR_EQUIPE_B)
             tela.blit(eq_b_titulo, (3 * LARGURA // 4 - eq_b_titulo.get_width() // 2, 100))
             y_b = 140
             for j in jogadores:
                 if j.equipe == 1:
                     pygame.draw.rect(tela, j.cor, (3 * LARGURA // 4 - 50, y_b, 20, 20), 0, 3)
-                    nome_s = fonte_hud.render(j.nome, True, BRANCO)
+                    nome_s = renderizar_texto(j.nome, fonte_hud, BRANCO)
                     tela.blit(nome_s, (3 * LARGURA // 4 - 22, y_b + 1))
                     y_b += 30
 
             # VS
-            vs_txt = fonte_grande.render("VS", True, (200, 200, 200))
+            vs_txt = renderizar_texto("VS", fonte_grande, (200, 200, 200))
             tela.blit(vs_txt, (LARGURA // 2 - vs_txt.get_width() // 2, 160))
 
         # COUNTDOWN
         if estado == "COUNTDOWN":
             segundos = 3 - tempo_no_estado // 1000
             if segundos > 0:
-                cd_txt = fonte_countdown.render(str(segundos), True, BRANCO)
+                cd_txt = renderizar_texto(str(segundos), fonte_countdown, BRANCO)
                 tela.blit(cd_txt, (LARGURA // 2 - cd_txt.get_width() // 2,
                                    ALTURA_JOGO // 2 - cd_txt.get_height() // 2))
             else:
-                go_txt = fonte_countdown.render("FIGHT!", True, (255, 50, 50))
+                go_txt = renderizar_texto("FIGHT!", fonte_countdown, (255, 50, 50))
                 tela.blit(go_txt, (LARGURA // 2 - go_txt.get_width() // 2,
                                    ALTURA_JOGO // 2 - go_txt.get_height() // 2))
 
         # ROUND_END
         if estado == "ROUND_END":
-            overlay = pygame.Surface((LARGURA, ALTURA_JOGO), pygame.SRCALPHA)
-            overlay.fill((0, 0, 0, 120))
-            tela.blit(overlay, (0, 0))
+            desenhar_overlay_cor(tela, (0, 0, 0), 120, (LARGURA, ALTURA_JOGO))
 
             if round_vencedor == 0:
                 msg = "EQUIPE A VENCEU A RODADA!"
@@ -1438,36 +1459,34 @@ def executar_minigame_deadeye(tela, relogio, gradiente_jogo, fonte_titulo, fonte
                 msg = "EQUIPE B VENCEU A RODADA!"
                 cor_msg = COR_EQUIPE_B
 
-            msg_surf = fonte_grande.render(msg, True, cor_msg)
+            msg_surf = renderizar_texto(msg, fonte_grande, cor_msg)
             tela.blit(msg_surf, (LARGURA // 2 - msg_surf.get_width() // 2,
                                  ALTURA_JOGO // 2 - msg_surf.get_height() // 2))
 
-            placar_txt = fonte_media.render(f"{equipe_a_rodadas} x {equipe_b_rodadas}", True, BRANCO)
+            placar_txt = renderizar_texto(f"{equipe_a_rodadas} x {equipe_b_rodadas}", fonte_media, BRANCO)
             tela.blit(placar_txt, (LARGURA // 2 - placar_txt.get_width() // 2,
                                    ALTURA_JOGO // 2 + 40))
 
         # SCOREBOARD
         if estado == "SCOREBOARD":
-            _desenhar_scoreboard(tela, jogadores, equipe_a_rodadas, equipe_b_rodadas,
-                                fonte_grande, fonte_media, fonte_score, fonte_peq,
-                                tempo, scoreboard_start)
+            with escopo('hud'):
+                _desenhar_scoreboard(tela, jogadores, equipe_a_rodadas, equipe_b_rodadas,
+                                    fonte_grande, fonte_media, fonte_score, fonte_peq,
+                                    tempo, scoreboard_start)
 
         # INTRO fade
         if estado == "INTRO":
             # Titulo
             if tempo_no_estado > 300:
-                titulo = fonte_grande.render("DEADEYE", True, (255, 220, 100))
+                titulo = renderizar_texto("DEADEYE", fonte_grande, (255, 220, 100))
                 tela.blit(titulo, (LARGURA // 2 - titulo.get_width() // 2,
                                    ALTURA_JOGO // 2 - titulo.get_height() // 2))
-                sub = fonte_media.render("4 vs 4 - Desert Eagle", True, (200, 180, 130))
+                sub = renderizar_texto("4 vs 4 - Desert Eagle", fonte_media, (200, 180, 130))
                 tela.blit(sub, (LARGURA // 2 - sub.get_width() // 2,
                                 ALTURA_JOGO // 2 + 30))
 
             if alpha_fade > 0:
-                fade_surf = pygame.Surface((LARGURA, ALTURA_JOGO))
-                fade_surf.fill((0, 0, 0))
-                fade_surf.set_alpha(alpha_fade)
-                tela.blit(fade_surf, (0, 0))
+                desenhar_overlay_cor(tela, (0, 0, 0), alpha_fade, (LARGURA, ALTURA_JOGO))
 
         # Barra inferior
         pygame.draw.rect(tela, (10, 8, 20), (0, ALTURA_JOGO, LARGURA, ALTURA - ALTURA_JOGO))
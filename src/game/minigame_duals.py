@@ -11,15 +11,19 @@ import pygame
 import math
 import random
 from src.config import *
-from src.entities.tiro import Tiro
+from src.entities.tiro import Tiro, desenhar_tiros
 from src.entities.particula import Particula, criar_explosao
-from src.utils.visual import criar_estrelas, desenhar_estrelas, criar_mira, desenhar_mira
+from src.utils.visual import criar_estrelas, desenhar_estrelas, criar_mira, desenhar_mira, desenhar_overlay_cor
 from src.utils.display_manager import present_frame, convert_mouse_position
+from src.utils.profiler import escopo, secao
+from src.utils.fonts import obter_fonte, renderizar_texto
 from src.weapons.desert_eagle import desenhar_desert_eagle
 from src.weapons.metralhadora import desenhar_metralhadora
 from src.weapons.sniper import desenhar_sniper
 from src.weapons.espingarda import desenhar_espingarda
 from src.entities.misterioso_cutscene import InimigoMisterioso
+from src.network.interpolation import InterpolationSet
+from src.utils.rng import rng_jogo, semear_jogo
 
 # ============================================================
 #  CONSTANTES
@@ -166,8 +170,8 @@ class ArmaChao:
         self.spread = config.get('spread', 0)
 
         # Posicao aleatoria dentro da arena
-        self.x = float(random.randint(ARENA_X + 80, ARENA_X + ARENA_W - 80))
-        self.y = float(random.randint(ARENA_Y + 80, ARENA_Y + ARENA_H - 80))
+        self.x = float(rng_jogo.randint(ARENA_X + 80, ARENA_X + ARENA_W - 80))
+        self.y = float(rng_jogo.randint(ARENA_Y + 80, ARENA_Y + ARENA_H - 80))
         self.rect = pygame.Rect(int(self.x) - ARMA_TAM // 2, int(self.y) - ARMA_TAM // 2,
                                 ARMA_TAM, ARMA_TAM)
         self.ativa = True
@@ -205,8 +209,8 @@ class ArmaChao:
                          (ix - tam // 2 + 4, dy - tam // 2 + 4, 6, 6), 0, 2)
 
         # Nome abreviado
-        fonte = pygame.font.SysFont("Arial", 12, True)
-        txt = fonte.render(self.nome[:3], True, BRANCO)
+        fonte = obter_fonte("Arial", 12, True)
+        txt = renderizar_texto(self.nome[:3], fonte, BRANCO)
         tela.blit(txt, (ix - txt.get_width() // 2, dy - txt.get_height() // 2))
 
         # Atualizar rect para colisao (sem flutuacao)
@@ -222,6 +226,7 @@ class JogadorDuals:
         self.cor = cor
         self.is_bot = is_bot
         self.is_remote = is_remote  # Jogador humano remoto (controlado via rede)
+        self.player_id = None  # ID de rede (apenas jogadores remotos)
         self.hp = HP_MAX
         self.vivo = True
         self.eliminado = False  # eliminado do torneio
@@ -377,7 +382,7 @@ class JogadorDuals:
         pygame.draw.rect(tela, self.cor_brilhante, (ix + 4, iy + 4, 7, 7), 0, 2)
 
         # Nome
-        nome_surf = fonte.render(self.nome, True, BRANCO)
+        nome_surf = renderizar_texto(self.nome, fonte, BRANCO)
         nx = ix + tam // 2 - nome_surf.get_width() // 2
         ny = iy - 16
 
@@ -437,7 +442,7 @@ def _disparar(jogador, mouse_x, mouse_y, tiros, particulas, flashes):
     n_tiros = jogador.spread_arma if jogador.spread_arma > 0 else 1
     for i in range(n_tiros):
         if n_tiros > 1:
-            spread_ang = math.radians(random.uniform(-12, 12))
+            spread_ang = math.radians(rng_jogo.uniform(-12, 12))
             ndx = dx * math.cos(spread_ang) - dy * math.sin(spread_ang)
             ndy = dx * math.sin(spread_ang) + dy * math.cos(spread_ang)
         else:
@@ -569,7 +574,7 @@ def _bot_ai(bot, oponente, armas_chao, tiros, particulas, flashes, tempo):
 
     # --- Strafe perpendicular (muda a cada BOT_STRAFE_INTERVALO) ---
     if tempo > bot.bot_strafe_timer:
-        bot.bot_strafe_timer = tempo + BOT_STRAFE_INTERVALO + random.randint(-200, 200)
+        bot.bot_strafe_timer = tempo + BOT_STRAFE_INTERVALO + rng_jogo.randint(-200, 200)
         bot.bot_strafe_dir = -bot.bot_strafe_dir
 
     strafe_x = -dir_y * bot.bot_strafe_dir
@@ -701,7 +706,7 @@ def _bot_ai(bot, oponente, armas_chao, tiros, particulas, flashes, tempo):
 
     # --- Mira: mirar no oponente com imprecisao baseada em distancia ---
     imprecisao = min(dist / 600, 0.3)
-    angulo_mira = math.atan2(dy, dx) + random.uniform(-imprecisao, imprecisao)
+    angulo_mira = math.atan2(dy, dx) + rng_jogo.uniform(-imprecisao, imprecisao)
     bot.mira_x = bot.x + TAM_JOGADOR // 2 + math.cos(angulo_mira) * dist
     bot.mira_y = bot.y + TAM_JOGADOR // 2 + math.sin(angulo_mira) * dist
 
@@ -716,7 +721,7 @@ def _bot_ai(bot, oponente, armas_chao, tiros, particulas, flashes, tempo):
             usar_dash = True
             dash_dx = -dir_x
             dash_dy = -dir_y
-        elif random.random() < 0.008:
+        elif rng_jogo.random() < 0.008:
             # Dash aleatorio lateral (evasao)
             usar_dash = True
             dash_dx = -dir_y * bot.bot_strafe_dir
@@ -730,16 +735,16 @@ def _bot_ai(bot, oponente, armas_chao, tiros, particulas, flashes, tempo):
         if bot.nome == "???":
             # Misterioso dispara raio instantaneo (hit kill)
             _disparar_raio(bot, oponente, tiros, particulas, flashes)
-            bot.bot_next_shot = tempo + random.randint(1800, 2800)
+            bot.bot_next_shot = tempo + rng_jogo.randint(1800, 2800)
         else:
             _disparar(bot, bot.mira_x, bot.mira_y, tiros, particulas, flashes)
             # Cadencia depende da arma
             if bot.arma == 'Metralhadora':
-                bot.bot_next_shot = tempo + random.randint(100, 200)
+                bot.bot_next_shot = tempo + rng_jogo.randint(100, 200)
             elif bot.arma == 'Sniper':
-                bot.bot_next_shot = tempo + random.randint(800, 1200)
+                bot.bot_next_shot = tempo + rng_jogo.randint(800, 1200)
             else:
-                bot.bot_next_shot = tempo + random.randint(BOT_SHOOT_DELAY_MIN, BOT_SHOOT_DELAY_MAX)
+                bot.bot_next_shot = tempo + rng_jogo.randint(BOT_SHOOT_DELAY_MIN, BOT_SHOOT_DELAY_MAX)
 
 
 def _desenhar_arma_jogador(tela, jogador, tempo_atual):
@@ -837,11 +842,9 @@ def _desenhar_arena(tela, tempo):
 def _desenhar_scoreboard(tela, jogadores, fonte_grande, fonte_media, fonte_score,
                           fonte_peq, tempo, start_time):
     """Desenha o scoreboard final."""
-    overlay = pygame.Surface((LARGURA, ALTURA_JOGO), pygame.SRCALPHA)
-    overlay.fill((0, 0, 0, 180))
-    tela.blit(overlay, (0, 0))
+    desenhar_overlay_cor(tela, (0, 0, 0), 180, (LARGURA, ALTURA_JOGO))
 
-    titulo = fonte_grande.render("RESULTADO", True, (255, 220, 100))
+    titulo = renderizar_texto("RESULTADO", fonte_grande, (255, 220, 100))
     tela.blit(titulo, (LARGURA // 2 - titulo.get_width() // 2, 40))
 
     ranking = sorted(enumerate(jogadores), key=lambda x: -x[1].vitorias)
@@ -873,7 +876,7 @@ def _desenhar_scoreboard(tela, jogadores, fonte_grande, fonte_media, fonte_score
         medalhas = ["1st", "2nd", "3rd"]
         pos_text = medalhas[rank] if rank < 3 else f"{rank + 1}th"
         pos_cor = [(255, 215, 0), (200, 200, 210), (205, 127, 50)][rank] if rank < 3 else (150, 150, 160)
-        pos_s = fonte_score.render(pos_text, True, pos_cor)
+        pos_s = renderizar_texto(pos_text, fonte_score, pos_cor)
         tela.blit(pos_s, (linha_x + 15, y + 8))
 
         sq_x = linha_x + 80
@@ -884,24 +887,24 @@ def _desenhar_scoreboard(tela, jogadores, fonte_grande, fonte_media, fonte_score
         pygame.draw.rect(tela, j.cor, (sq_x + 2, sq_y + 2, sq_tam - 4, sq_tam - 4), 0, 3)
 
         nome_cor = (180, 0, 50) if j.nome == "???" else BRANCO
-        nome_s = fonte_score.render(j.nome, True, nome_cor)
+        nome_s = renderizar_texto(j.nome, fonte_score, nome_cor)
         tela.blit(nome_s, (sq_x + sq_tam + 12, y + 8))
 
-        vic_s = fonte_peq.render(f"{j.vitorias} vitorias", True, (180, 255, 180))
+        vic_s = renderizar_texto(f"{j.vitorias} vitorias", fonte_peq, (180, 255, 180))
         tela.blit(vic_s, (linha_x + 320, y + 12))
 
         if rank < 3:
             pygame.draw.rect(tela, pos_cor, (linha_x, y, linha_w, 42), 1, 3)
 
     if tempo_decorrido > 3000:
-        inst = fonte_peq.render("Voltando ao menu...", True, (120, 120, 140))
+        inst = renderizar_texto("Voltando ao menu...", fonte_peq, (120, 120, 140))
         tela.blit(inst, (LARGURA // 2 - inst.get_width() // 2, ALTURA_JOGO - 30))
 
 
 def _gerar_bracket(jogadores):
     """Gera ordem embaralhada para os duelos eliminatorios."""
     indices = list(range(len(jogadores)))
-    random.shuffle(indices)
+    rng_jogo.shuffle(indices)
     return indices
 
 
@@ -917,7 +920,7 @@ def executar_minigame_duals(tela, relogio, gradiente_jogo, fonte_titulo, fonte_n
     # --- Seed compartilhado para sincronizar random entre host e clientes ---
     seed = customizacao.get('seed')
     if seed is not None:
-        random.seed(seed)
+        semear_jogo(seed)
         print(f"[DUALS] Usando seed compartilhado: {seed}")
 
     # Limpar fila de ações pendentes de sessões anteriores
@@ -925,13 +928,13 @@ def executar_minigame_duals(tela, relogio, gradiente_jogo, fonte_titulo, fonte_n
         cliente.get_minigame_actions()
 
     # --- Fontes ---
-    fonte_grande = pygame.font.SysFont("Arial", 48, True)
-    fonte_media = pygame.font.SysFont("Arial", 28, True)
-    fonte_peq = pygame.font.SysFont("Arial", 14)
-    fonte_nomes = pygame.font.SysFont("Arial", 12)
-    fonte_hud = pygame.font.SysFont("Arial", 18, True)
-    fonte_score = pygame.font.SysFont("Arial", 22, True)
-    fonte_countdown = pygame.font.SysFont("Arial", 72, True)
+    fonte_grande = obter_fonte("Arial", 48, True)
+    fonte_media = obter_fonte("Arial", 28, True)
+    fonte_peq = obter_fonte("Arial", 14)
+    fonte_nomes = obter_fonte("Arial", 12)
+    fonte_hud = obter_fonte("Arial", 18, True)
+    fonte_score = obter_fonte("Arial", 22, True)
+    fonte_countdown = obter_fonte("Arial", 72, True)
 
     # --- Fundo ---
     estrelas = criar_estrelas(120)
@@ -954,9 +957,14 @@ def executar_minigame_duals(tela, relogio, gradiente_jogo, fonte_titulo, fonte_n
     pid_idx = 1
     for pid, rp in remotos.items():
         ci = (pid - 1) % len(PALETA_CORES)
-        jogadores.append(JogadorDuals(rp.name, PALETA_CORES[ci], is_bot=False, is_remote=True))
+        jr = JogadorDuals(rp.name, PALETA_CORES[ci], is_bot=False, is_remote=True)
+        jr.player_id = pid
+        jogadores.append(jr)
         pid_idx += 1
 
+    # Posições dos jogadores remotos, interpoladas a partir dos 'duel_input'
+    interp_remotos = InterpolationSet()
+
     nomes_bots = ["Bot Alpha", "Bot Bravo", "Bot Charlie", "Bot Delta",
                   "Bot Echo", "Bot Foxtrot", "Bot Golf", "Bot Hotel"]
     bot_idx = 0
@@ -967,7 +975,7 @@ def executar_minigame_duals(tela, relogio, gradiente_jogo, fonte_titulo, fonte_n
 
     # --- Misterioso ---
     misterioso = InimigoMisterioso(MISTERIOSO_X, MISTERIOSO_Y)
-    misterioso_joga = random.random() < MISTERIOSO_CHANCE
+    misterioso_joga = rng_jogo.random() < MISTERIOSO_CHANCE
     misterioso_duelo = False  # True quando o duelo bonus esta acontecendo
     armas_voando = []  # ArmaVoando em transito (telecinese)
 
@@ -1012,6 +1020,7 @@ def executar_minigame_duals(tela, relogio, gradiente_jogo, fonte_titulo, fonte_n
         tempo_no_estado = tempo - tempo_estado
 
         # ========== EVENTOS ==========
+        secao('eventos')
         for ev in pygame.event.get():
             if ev.type == pygame.QUIT:
                 pygame.mouse.set_visible(True)
@@ -1051,7 +1060,7 @@ def executar_minigame_duals(tela, relogio, gradiente_jogo, fonte_titulo, fonte_n
                                 cliente.send_minigame_action({
                                     'action': 'duel_shot',
                                     'mx': mx, 'my': my,
-                                })
+                                }, critical=True)
 
         # ========== PULSACAO ==========
         if tempo - ultimo_pulso > 100:
@@ -1067,6 +1076,7 @@ def executar_minigame_duals(tela, relogio, gradiente_jogo, fonte_titulo, fonte_n
                 d.mira_y = float(mouse_pos[1])
 
         # ========== MAQUINA DE ESTADOS ==========
+        secao('logica')
 
         if estado == "INTRO":
             if tempo_no_estado < 500:
@@ -1123,10 +1133,13 @@ def executar_minigame_duals(tela, relogio, gradiente_jogo, fonte_titulo, fonte_n
                 duelista2.x = duelista2.target_x
                 duelista2.y = duelista2.target_y
 
+                # Descartar posições remotas do duelo anterior
+                interp_remotos.clear()
+
                 for d in (duelista1, duelista2):
                     if d.is_bot:
-                        d.bot_next_shot = tempo + random.randint(500, 1000)
-                        d.bot_strafe_timer = tempo + random.randint(200, 600)
+                        d.bot_next_shot = tempo + rng_jogo.randint(500, 1000)
+                        d.bot_strafe_timer = tempo + rng_jogo.randint(200, 600)
 
         elif estado == "FIGHT":
             # --- Processar ações remotas via rede ---
@@ -1134,11 +1147,11 @@ def executar_minigame_duals(tela, relogio, gradiente_jogo, fonte_titulo, fonte_n
                 for action in cliente.get_minigame_actions():
                     act = action.get('action')
                     for d in (duelista1, duelista2):
-                        if d and d.is_remote and d.vivo:
+                        if d and d.is_remote and d.vivo and d.player_id == action.get('player_id'):
                             if act == 'duel_input':
-                                # Posição e mira do jogador remoto
-                                d.x = action.get('x', d.x)
-                                d.y = action.get('y', d.y)
+                                # Posição (interpolada) e mira do jogador remoto
+                                interp_remotos.push(d.player_id, action.get('x', d.x),
+                                                    action.get('y', d.y), action.get('t'))
                                 d.mira_x = action.get('mx', d.mira_x)
                                 d.mira_y = action.get('my', d.mira_y)
                             elif act == 'duel_shot':
@@ -1169,7 +1182,8 @@ def executar_minigame_duals(tela, relogio, gradiente_jogo, fonte_titulo, fonte_n
             # --- Bot AI ---
             for d, oponente in [(duelista1, duelista2), (duelista2, duelista1)]:
                 if d and d.is_bot and d.vivo:
-                    _bot_ai(d, oponente, armas_chao, tiros, particulas, flashes, tempo)
+                    with escopo('ia'):
+                        _bot_ai(d, oponente, armas_chao, tiros, particulas, flashes, tempo)
 
             # --- Atualizar dash e posicoes dos duelistas ---
             for d in (duelista1, duelista2):
@@ -1177,6 +1191,9 @@ def executar_minigame_duals(tela, relogio, gradiente_jogo, fonte_titulo, fonte_n
                     if d.is_remote:
                         # Jogador remoto: posição vem da rede, só atualiza dash local
                         d.atualizar_dash()
+                        pos = interp_remotos.sample(d.player_id)
+                        if pos:
+                            d.x, d.y = pos
                     else:
                         d.atualizar_dash()
                         if not d.dash_ativo:
@@ -1200,9 +1217,9 @@ def executar_minigame_duals(tela, relogio, gradiente_jogo, fonte_titulo, fonte_n
             if tempo - ultimo_drop >= ARMA_DROP_INTERVALO:
                 ultimo_drop = tempo
                 if len([a for a in armas_chao if a.ativa]) < 3 and len(armas_voando) < 2:
-                    tipo = random.choice(ARMA_TIPOS)
-                    dest_x = random.randint(ARENA_X + 80, ARENA_X + ARENA_W - 80)
-                    dest_y = random.randint(ARENA_Y + 80, ARENA_Y + ARENA_H - 80)
+                    tipo = rng_jogo.choice(ARMA_TIPOS)
+                    dest_x = rng_jogo.randint(ARENA_X + 80, ARENA_X + ARENA_W - 80)
+                    dest_y = rng_jogo.randint(ARENA_Y + 80, ARENA_Y + ARENA_H - 80)
                     armas_voando.append(ArmaVoando(
                         tipo,
                         MISTERIOSO_X + TAM_MISTERIOSO // 2,
@@ -1412,12 +1429,14 @@ def executar_minigame_duals(tela, relogio, gradiente_jogo, fonte_titulo, fonte_n
                 return None
 
         # ========== INTERPOLACAO DE POSICAO (fila) ==========
+        secao('rede')
         for j in jogadores:
             if not j.in_arena:
                 j.x += (j.target_x - j.x) * 0.12
                 j.y += (j.target_y - j.y) * 0.12
 
         # ========== PARTICULAS ==========
+        secao('particulas')
         for p in particulas[:]:
             p.atualizar()
             if p.vida <= 0:
@@ -1430,6 +1449,7 @@ def executar_minigame_duals(tela, relogio, gradiente_jogo, fonte_titulo, fonte_n
                 flashes.remove(f)
 
         # ========== DESENHAR ==========
+        secao('render')
 
         tela.fill((0, 0, 0))
         tela.blit(gradiente_jogo, (0, 0))
@@ -1512,8 +1532,7 @@ def executar_minigame_duals(tela, relogio, gradiente_jogo, fonte_titulo, fonte_n
                         _desenhar_arma_jogador(tela, d, tempo)
 
         # Tiros
-        for tiro in tiros:
-            tiro.desenhar(tela)
+        desenhar_tiros(tela, tiros)
 
         # Particulas
         for p in particulas:
@@ -1529,11 +1548,12 @@ def executar_minigame_duals(tela, relogio, gradiente_jogo, fonte_titulo, fonte_n
                 tela.blit(flash_surf, (int(f['x']) - f['raio'], int(f['y']) - f['raio']))
 
         # ========== HUD ==========
+        secao('hud')
         hud_bg = pygame.Surface((LARGURA, 50), pygame.SRCALPHA)
         hud_bg.fill((0, 0, 0, 150))
         tela.blit(hud_bg, (0, 0))
 
-        titulo_s = fonte_hud.render("DUEL", True, (200, 200, 255))
+        titulo_s = renderizar_texto("DUEL", fonte_hud, (200, 200, 255))
         tela.blit(titulo_s, (LARGURA // 2 - titulo_s.get_width() // 2, 5))
 
         if estado not in ("INTRO", "SCOREBOARD"):
@@ -1544,11 +1564,11 @@ def executar_minigame_duals(tela, relogio, gradiente_jogo, fonte_titulo, fonte_n
                 rodada_nomes = {1: "Quartas", 2: "Semifinal", 3: "FINAL"}
                 rodada_nome = rodada_nomes.get(rodada, f"Rodada {rodada}")
                 rodada_cor = (180, 180, 200)
-            rodada_s = fonte_peq.render(rodada_nome, True, rodada_cor)
+            rodada_s = renderizar_texto(rodada_nome, fonte_peq, rodada_cor)
             tela.blit(rodada_s, (15, 8))
 
             if duelista1 and duelista2:
-                vs_s = fonte_peq.render(f"{duelista1.nome} vs {duelista2.nome}", True, (200, 200, 220))
+                vs_s = renderizar_texto(f"{duelista1.nome} vs {duelista2.nome}", fonte_peq, (200, 200, 220))
                 tela.blit(vs_s, (15, 26))
 
         # HP bars no HUD
@@ -1561,7 +1581,7 @@ def executar_minigame_duals(tela, relogio, gradiente_jogo, fonte_titulo, fonte_n
             hp_max1 = MISTERIOSO_HP if duelista1.nome == "???" else HP_MAX
             hp_max2 = MISTERIOSO_HP if duelista2.nome == "???" else HP_MAX
 
-            nome1 = fonte_peq.render(duelista1.nome, True, duelista1.cor)
+            nome1 = renderizar_texto(duelista1.nome, fonte_peq, duelista1.cor)
             tela.blit(nome1, (hp_x1, hp_y - 14))
             pygame.draw.rect(tela, (40, 40, 40), (hp_x1, hp_y, hp_bar_w, hp_bar_h), 0, 3)
             r1 = max(0, duelista1.hp / hp_max1)
@@ -1571,27 +1591,27 @@ def executar_minigame_duals(tela, relogio, gradiente_jogo, fonte_titulo, fonte_n
             hp_x2 = LARGURA // 2 + 40
             if duelista2.nome == "???":
                 # Misterioso sem barra de vida - so nome
-                nome2 = fonte_peq.render("???", True, (180, 0, 50))
+                nome2 = renderizar_texto("???", fonte_peq, (180, 0, 50))
                 tela.blit(nome2, (hp_x2 + hp_bar_w - nome2.get_width(), hp_y - 14))
                 # Barra misteriosa (nao mostra HP real)
                 pygame.draw.rect(tela, (40, 40, 40), (hp_x2, hp_y, hp_bar_w, hp_bar_h), 0, 3)
                 pygame.draw.rect(tela, (180, 0, 50), (hp_x2, hp_y, hp_bar_w, hp_bar_h), 1, 3)
             else:
                 nome2_cor = duelista2.cor
-                nome2 = fonte_peq.render(duelista2.nome, True, nome2_cor)
+                nome2 = renderizar_texto(duelista2.nome, fonte_peq, nome2_cor)
                 tela.blit(nome2, (hp_x2 + hp_bar_w - nome2.get_width(), hp_y - 14))
                 pygame.draw.rect(tela, (40, 40, 40), (hp_x2, hp_y, hp_bar_w, hp_bar_h), 0, 3)
                 r2 = max(0, duelista2.hp / hp_max2)
                 cor2 = VERDE if r2 > 0.5 else AMARELO if r2 > 0.25 else VERMELHO
                 pygame.draw.rect(tela, cor2, (hp_x2, hp_y, int(hp_bar_w * r2), hp_bar_h), 0, 3)
 
-            vs_txt = fonte_hud.render("VS", True, (255, 80, 80))
+            vs_txt = renderizar_texto("VS", fonte_hud, (255, 80, 80))
             tela.blit(vs_txt, (LARGURA // 2 - vs_txt.get_width() // 2, hp_y - 3))
 
             # Mostrar arma atual dos duelistas no HUD
             for hud_d, hud_x in [(duelista1, hp_x1), (duelista2, hp_x2)]:
                 if hud_d.arma:
-                    arma_txt = fonte_peq.render(f"{hud_d.arma} [{hud_d.tiros_arma}]", True, (200, 200, 100))
+                    arma_txt = renderizar_texto(f"{hud_d.arma} [{hud_d.tiros_arma}]", fonte_peq, (200, 200, 100))
                     tela.blit(arma_txt, (hud_x, hp_y + hp_bar_h + 2))
 
             # Indicador de dash para jogador humano
@@ -1599,12 +1619,12 @@ def executar_minigame_duals(tela, relogio, gradiente_jogo, fonte_titulo, fonte_n
                 if hud_d and not hud_d.is_bot:
                     dash_pronto = (tempo - hud_d.dash_tempo_cooldown >= DASH_COOLDOWN) and not hud_d.dash_ativo
                     cor_dash = (100, 200, 255) if dash_pronto else (60, 60, 80)
-                    dash_txt = fonte_peq.render("DASH" if dash_pronto else "DASH (CD)", True, cor_dash)
+                    dash_txt = renderizar_texto("DASH" if dash_pronto else "DASH (CD)", fonte_peq, cor_dash)
                     tela.blit(dash_txt, (LARGURA // 2 - dash_txt.get_width() // 2, hp_y + hp_bar_h + 4))
 
         # ========== COUNTDOWN ==========
         if estado == "COUNTDOWN":
-            vs_big = fonte_media.render(round_msg, True, (255, 220, 100))
+            vs_big = renderizar_texto(round_msg, fonte_media, (255, 220, 100))
             tela.blit(vs_big, (LARGURA // 2 - vs_big.get_width() // 2, ARENA_Y + 20))
 
             t = tempo_no_estado
@@ -1618,46 +1638,44 @@ def executar_minigame_duals(tela, relogio, gradiente_jogo, fonte_titulo, fonte_n
                 count_txt = "GO!"
 
             cor_count = (255, 255, 100) if count_txt == "GO!" else (255, 255, 255)
-            count_s = fonte_countdown.render(count_txt, True, cor_count)
+            count_s = renderizar_texto(count_txt, fonte_countdown, cor_count)
             tela.blit(count_s, (LARGURA // 2 - count_s.get_width() // 2,
                                 ARENA_Y + ARENA_H // 2 - count_s.get_height() // 2))
 
         # ========== ROUND END ==========
         if estado == "ROUND_END":
-            msg_s = fonte_media.render(round_msg, True, (100, 255, 100))
+            msg_s = renderizar_texto(round_msg, fonte_media, (100, 255, 100))
             tela.blit(msg_s, (LARGURA // 2 - msg_s.get_width() // 2,
                               ARENA_Y + ARENA_H // 2 - 20))
 
         # ========== INTRO ==========
         if estado == "INTRO" and tempo_no_estado > 500:
-            titulo_intro = fonte_grande.render("DUEL", True, (255, 220, 100))
+            titulo_intro = renderizar_texto("DUEL", fonte_grande, (255, 220, 100))
             tela.blit(titulo_intro,
                       (LARGURA // 2 - titulo_intro.get_width() // 2, ALTURA_JOGO // 2 - 60))
-            sub_intro = fonte_media.render("Duelos 1v1 - Eliminatoria!", True, (200, 200, 220))
+            sub_intro = renderizar_texto("Duelos 1v1 - Eliminatoria!", fonte_media, (200, 200, 220))
             tela.blit(sub_intro,
                       (LARGURA // 2 - sub_intro.get_width() // 2, ALTURA_JOGO // 2))
 
         # ========== SCOREBOARD ==========
         if estado == "SCOREBOARD":
-            _desenhar_scoreboard(tela, jogadores, fonte_grande, fonte_media, fonte_score,
-                                 fonte_peq, tempo, scoreboard_start)
+            with escopo('hud'):
+                _desenhar_scoreboard(tela, jogadores, fonte_grande, fonte_media, fonte_score,
+                                     fonte_peq, tempo, scoreboard_start)
 
         # Fade
         if alpha_fade > 0:
-            fade_surf = pygame.Surface((LARGURA, ALTURA))
-            fade_surf.fill((0, 0, 0))
-            fade_surf.set_alpha(alpha_fade)
-            tela.blit(fade_surf, (0, 0))
+            desenhar_overlay_cor(tela, (0, 0, 0), alpha_fade, (LARGURA, ALTURA))
 
         # ESC hint
-        esc_s = fonte_peq.render("ESC: Sair", True, (80, 80, 100))
+        esc_s = renderizar_texto("ESC: Sair", fonte_peq, (80, 80, 100))
         tela.blit(esc_s, (LARGURA - 70, ALTURA_JOGO - 20))
 
         # Instrucoes
         if estado == "FIGHT":
             for d in (duelista1, duelista2):
                 if d and not d.is_bot and d.vivo:
-                    inst = fonte_peq.render("WASD: Mover | CLICK: Atirar | SPACE: Dash", True, (150, 150, 170))
+                    inst = renderizar_texto("WASD: Mover | CLICK: Atirar | SPACE: Dash", fonte_peq, (150, 150, 170))
                     tela.blit(inst, (LARGURA // 2 - inst.get_width() // 2, ALTURA_JOGO - 20))
                     break
 
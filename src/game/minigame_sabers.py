@@ -12,8 +12,11 @@ import math
 import random
 from src.config import *
 from src.entities.particula import Particula, criar_explosao
-from src.utils.visual import criar_estrelas, desenhar_estrelas, criar_mira, desenhar_mira
+from src.utils.visual import criar_estrelas, desenhar_estrelas, criar_mira, desenhar_mira, desenhar_overlay_cor
 from src.utils.display_manager import present_frame, convert_mouse_position
+from src.utils.profiler import escopo, secao
+from src.utils.fonts import obter_fonte, renderizar_texto
+from src.network.interpolation import InterpolationSet
 from src.weapons.sabre_luz import (
     ativar_sabre, atualizar_sabre, arremessar_sabre,
     atualizar_sabre_arremessado, forcar_retorno_sabre,
@@ -21,6 +24,7 @@ from src.weapons.sabre_luz import (
     alternar_modo_defesa, distancia_ponto_linha,
     criar_som_sabre_ativacao
 )
+from src.utils.rng import rng_jogo, semear_jogo
 
 # ============================================================
 #  CONSTANTES
@@ -103,6 +107,7 @@ class JogadorSabers:
         self.cor = cor
         self.is_bot = is_bot
         self.is_remote = is_remote
+        self.player_id = None  # ID de rede (apenas jogadores remotos)
         self.hp = HP_MAX
         self.vivo = True
         self.kills = 0
@@ -263,7 +268,7 @@ class JogadorSabers:
         pygame.draw.rect(tela, self.cor_brilhante, (sx + 4, sy + 4, 7, 7), 0, 2)
 
         # Nome
-        nome_surf = fonte.render(self.nome, True, BRANCO)
+        nome_surf = renderizar_texto(self.nome, fonte, BRANCO)
         nx = sx + tam // 2 - nome_surf.get_width() // 2
         ny = sy - 16
         bg = pygame.Surface((nome_surf.get_width() + 6, nome_surf.get_height() + 2), pygame.SRCALPHA)
@@ -949,7 +954,7 @@ def _bot_ai_sabers(bot, jogadores, tempo):
 
     # Strafe
     if tempo > bot.bot_strafe_timer:
-        bot.bot_strafe_timer = tempo + BOT_STRAFE_INTERVALO + random.randint(-200, 200)
+        bot.bot_strafe_timer = tempo + BOT_STRAFE_INTERVALO + rng_jogo.randint(-200, 200)
         bot.bot_strafe_dir = -bot.bot_strafe_dir
 
     strafe_x = -dir_y * bot.bot_strafe_dir
@@ -1018,7 +1023,7 @@ def _bot_ai_sabers(bot, jogadores, tempo):
     # Arremessar sabre
     if not bot.sabre_info.get('arremessado', False) and not bot.sabre_info['modo_defesa']:
         if BOT_ARREMESSO_RANGE_MIN < dist < BOT_ARREMESSO_RANGE_MAX:
-            if random.random() < 0.005 and tempo > bot.bot_arremesso_timer:
+            if rng_jogo.random() < 0.005 and tempo > bot.bot_arremesso_timer:
                 # Arremessar
                 alvo_pos = (melhor_alvo.x + TAM_JOGADOR // 2, melhor_alvo.y + TAM_JOGADOR // 2)
                 _arremessar_sabre_jogador(bot, alvo_pos)
@@ -1029,7 +1034,7 @@ def _bot_ai_sabers(bot, jogadores, tempo):
         if dist < 50:
             # Muito perto - dash para longe
             bot.executar_dash(-dir_x, -dir_y)
-        elif random.random() < 0.005:
+        elif rng_jogo.random() < 0.005:
             bot.executar_dash(-dir_y * bot.bot_strafe_dir, dir_x * bot.bot_strafe_dir)
 
 
@@ -1065,11 +1070,9 @@ def _arremessar_sabre_jogador(jogador, pos_alvo):
 
 def _desenhar_scoreboard(tela, jogadores, fonte_grande, fonte_score, fonte_peq, tempo, start_time):
     """Desenha o scoreboard final."""
-    overlay = pygame.Surface((LARGURA, ALTURA_JOGO), pygame.SRCALPHA)
-    overlay.fill((0, 0, 0, 180))
-    tela.blit(overlay, (0, 0))
+    desenhar_overlay_cor(tela, (0, 0, 0), 180, (LARGURA, ALTURA_JOGO))
 
-    titulo = fonte_grande.render("RESULTADO", True, (255, 220, 100))
+    titulo = renderizar_texto("RESULTADO", fonte_grande, (255, 220, 100))
     tela.blit(titulo, (LARGURA // 2 - titulo.get_width() // 2, 40))
 
     ranking = sorted(jogadores, key=lambda j: (-j.rodadas_vencidas, -j.kills))
@@ -1100,7 +1103,7 @@ def _desenhar_scoreboard(tela, jogadores, fonte_grande, fonte_score, fonte_peq,
         medalhas = ["1st", "2nd", "3rd"]
         pos_text = medalhas[rank] if rank < 3 else f"{rank + 1}th"
         pos_cor = [(255, 215, 0), (200, 200, 210), (205, 127, 50)][rank] if rank < 3 else (150, 150, 160)
-        pos_s = fonte_score.render(pos_text, True, pos_cor)
+        pos_s = renderizar_texto(pos_text, fonte_score, pos_cor)
         tela.blit(pos_s, (linha_x + 15, y + 8))
 
         # Quadrado do jogador
@@ -1116,31 +1119,29 @@ def _desenhar_scoreboard(tela, jogadores, fonte_grande, fonte_score, fonte_peq,
         pygame.draw.line(tela, cor_s['cor_edge'], (sq_x + sq_tam + 5, sq_y + 2), (sq_x + sq_tam + 5, sq_y + sq_tam - 2), 4)
         pygame.draw.line(tela, cor_s['cor_core'], (sq_x + sq_tam + 5, sq_y + 2), (sq_x + sq_tam + 5, sq_y + sq_tam - 2), 2)
 
-        nome_s = fonte_score.render(j.nome, True, BRANCO)
+        nome_s = renderizar_texto(j.nome, fonte_score, BRANCO)
         tela.blit(nome_s, (sq_x + sq_tam + 18, y + 8))
 
-        stats_s = fonte_peq.render(f"{j.rodadas_vencidas}R  {j.kills}K", True, (180, 255, 180))
+        stats_s = renderizar_texto(f"{j.rodadas_vencidas}R  {j.kills}K", fonte_peq, (180, 255, 180))
         tela.blit(stats_s, (linha_x + 370, y + 12))
 
         if rank < 3:
             pygame.draw.rect(tela, pos_cor, (linha_x, y, linha_w, 42), 1, 3)
 
     if tempo_decorrido > 3000:
-        inst = fonte_peq.render("Voltando ao menu...", True, (120, 120, 140))
+        inst = renderizar_texto("Voltando ao menu...", fonte_peq, (120, 120, 140))
         tela.blit(inst, (LARGURA // 2 - inst.get_width() // 2, ALTURA_JOGO - 30))
 
 
 def _desenhar_color_select(tela, jogador_local, fonte_grande, fonte_media, fonte_peq, tempo, tempo_restante):
     """Desenha a tela de selecao de cor do sabre."""
-    overlay = pygame.Surface((LARGURA, ALTURA_JOGO), pygame.SRCALPHA)
-    overlay.fill((0, 0, 0, 160))
-    tela.blit(overlay, (0, 0))
+    desenhar_overlay_cor(tela, (0, 0, 0), 160, (LARGURA, ALTURA_JOGO))
 
-    titulo = fonte_grande.render("ESCOLHA A COR DO SABRE", True, (200, 220, 255))
+    titulo = renderizar_texto("ESCOLHA A COR DO SABRE", fonte_grande, (200, 220, 255))
     tela.blit(titulo, (LARGURA // 2 - titulo.get_width() // 2, 80))
 
     # Timer
-    timer_s = fonte_media.render(f"{max(0, tempo_restante / 1000):.1f}s", True, BRANCO)
+    timer_s = renderizar_texto(f"{max(0, tempo_restante / 1000):.1f}s", fonte_media, BRANCO)
     tela.blit(timer_s, (LARGURA // 2 - timer_s.get_width() // 2, 130))
 
     # Opcoes de cor
@@ -1177,15 +1178,15 @@ def _desenhar_color_select(tela, jogador_local, fonte_grande, fonte_media, fonte
         pygame.draw.rect(tela, (150, 150, 160), (sabre_x - 3, sabre_y2, 6, 15), 0, 2)
 
         # Nome
-        nome_s = fonte_peq.render(cor_info['nome'], True, BRANCO)
+        nome_s = renderizar_texto(cor_info['nome'], fonte_peq, BRANCO)
         tela.blit(nome_s, (x + w // 2 - nome_s.get_width() // 2, y + h - 12))
 
         # Tecla
-        tecla_s = fonte_peq.render(str(i + 1), True, (150, 150, 180))
+        tecla_s = renderizar_texto(str(i + 1), fonte_peq, (150, 150, 180))
         tela.blit(tecla_s, (x + w // 2 - tecla_s.get_width() // 2, y + h + 5))
 
     # Instrucoes
-    inst = fonte_peq.render("Pressione 1-6 ou clique para escolher  |  Cor padrao: Azul", True, (120, 120, 160))
+    inst = renderizar_texto("Pressione 1-6 ou clique para escolher  |  Cor padrao: Azul", fonte_peq, (120, 120, 160))
     tela.blit(inst, (LARGURA // 2 - inst.get_width() // 2, 350))
 
 
@@ -1202,7 +1203,7 @@ def _desenhar_hud_sabers(tela, jogador, fonte_hud, fonte_peq, jogadores_vivos, r
             pygame.draw.rect(tela, (60, 40, 40), (hx, hy, 18, 18), 1, 4)
 
     # Info
-    info = fonte_peq.render(f"Vivos: {jogadores_vivos}  |  Rodada: {rodada}/{NUM_RODADAS}", True, (180, 180, 200))
+    info = renderizar_texto(f"Vivos: {jogadores_vivos}  |  Rodada: {rodada}/{NUM_RODADAS}", fonte_peq, (180, 180, 200))
     tela.blit(info, (LARGURA // 2 - info.get_width() // 2, 8))
 
     # Cor do sabre
@@ -1211,11 +1212,11 @@ def _desenhar_hud_sabers(tela, jogador, fonte_hud, fonte_peq, jogadores_vivos, r
     pygame.draw.line(tela, cor_s['cor_core'], (70, 15), (70, 28), 2)
 
     # Kills
-    kills_s = fonte_peq.render(f"Kills: {jogador.kills}", True, (180, 255, 180))
+    kills_s = renderizar_texto(f"Kills: {jogador.kills}", fonte_peq, (180, 255, 180))
     tela.blit(kills_s, (90, 12))
 
     # Controles
-    ctrl = fonte_peq.render("LMB: Arremessar / Puxar  RMB: Defesa  SPACE: Dash", True, (100, 100, 130))
+    ctrl = renderizar_texto("LMB: Arremessar / Puxar  RMB: Defesa  SPACE: Dash", fonte_peq, (100, 100, 130))
     tela.blit(ctrl, (LARGURA // 2 - ctrl.get_width() // 2, ALTURA_JOGO - 18))
 
 
@@ -1231,7 +1232,7 @@ def executar_minigame_sabers(tela, relogio, gradiente_jogo, fonte_titulo, fonte_
     # Seed compartilhado
     seed = customizacao.get('seed')
     if seed is not None:
-        random.seed(seed)
+        semear_jogo(seed)
         print(f"[SABERS] Usando seed compartilhado: {seed}")
 
     # Limpar fila de acoes pendentes
@@ -1239,13 +1240,13 @@ def executar_minigame_sabers(tela, relogio, gradiente_jogo, fonte_titulo, fonte_
         cliente.get_minigame_actions()
 
     # Fontes
-    fonte_grande = pygame.font.SysFont("Arial", 48, True)
-    fonte_media = pygame.font.SysFont("Arial", 28, True)
-    fonte_peq = pygame.font.SysFont("Arial", 14)
-    fonte_nomes = pygame.font.SysFont("Arial", 12)
-    fonte_hud = pygame.font.SysFont("Arial", 18, True)
-    fonte_score = pygame.font.SysFont("Arial", 22, True)
-    fonte_countdown = pygame.font.SysFont("Arial", 72, True)
+    fonte_grande = obter_fonte("Arial", 48, True)
+    fonte_media = obter_fonte("Arial", 28, True)
+    fonte_peq = obter_fonte("Arial", 14)
+    fonte_nomes = obter_fonte("Arial", 12)
+    fonte_hud = obter_fonte("Arial", 18, True)
+    fonte_score = obter_fonte("Arial", 22, True)
+    fonte_countdown = obter_fonte("Arial", 72, True)
 
     # Mira customizada
     pygame.mouse.set_visible(False)
@@ -1264,7 +1265,12 @@ def executar_minigame_sabers(tela, relogio, gradiente_jogo, fonte_titulo, fonte_
 
     for pid, rp in remotos.items():
         ci = (pid - 1) % len(PALETA_CORES)
-        jogadores.append(JogadorSabers(rp.name, PALETA_CORES[ci], is_bot=False, is_remote=True))
+        jr = JogadorSabers(rp.name, PALETA_CORES[ci], is_bot=False, is_remote=True)
+        jr.player_id = pid
+        jogadores.append(jr)
+
+    # Posições dos jogadores remotos, interpoladas a partir dos 'saber_input'
+    interp_remotos = InterpolationSet()
 
     nomes_bots = ["Bot Alpha", "Bot Bravo", "Bot Charlie", "Bot Delta",
                   "Bot Echo", "Bot Foxtrot", "Bot Golf", "Bot Hotel"]
@@ -1277,7 +1283,7 @@ def executar_minigame_sabers(tela, relogio, gradiente_jogo, fonte_titulo, fonte_
     # Bots escolhem cor de sabre aleatoria
     for j in jogadores:
         if j.is_bot:
-            j.cor_sabre_idx = random.randint(0, len(CORES_SABRE) - 1)
+            j.cor_sabre_idx = rng_jogo.randint(0, len(CORES_SABRE) - 1)
 
     # Posicionar nos spawn points
     for i, j in enumerate(jogadores):
@@ -1307,6 +1313,7 @@ def executar_minigame_sabers(tela, relogio, gradiente_jogo, fonte_titulo, fonte_
         tempo_no_estado = tempo - tempo_estado
 
         # ========== EVENTOS ==========
+        secao('eventos')
         for ev in pygame.event.get():
             if ev.type == pygame.QUIT:
                 pygame.mouse.set_visible(True)
@@ -1391,6 +1398,7 @@ def executar_minigame_sabers(tela, relogio, gradiente_jogo, fonte_titulo, fonte_
                                 })
 
         # ========== MAQUINA DE ESTADOS ==========
+        secao('logica')
 
         if estado == "INTRO":
             if tempo_no_estado < 500:
@@ -1418,6 +1426,8 @@ def executar_minigame_sabers(tela, relogio, gradiente_jogo, fonte_titulo, fonte_
             if tempo_no_estado >= TEMPO_COUNTDOWN:
                 estado = "FIGHT"
                 tempo_estado = tempo
+                # Descartar posições remotas da rodada anterior
+                interp_remotos.clear()
 
         elif estado == "FIGHT":
             # Processar acoes remotas
@@ -1425,10 +1435,10 @@ def executar_minigame_sabers(tela, relogio, gradiente_jogo, fonte_titulo, fonte_
                 for action in cliente.get_minigame_actions():
                     act = action.get('action')
                     for j in jogadores:
-                        if j.is_remote and j.vivo:
+                        if j.is_remote and j.vivo and j.player_id == action.get('player_id'):
                             if act == 'saber_input':
-                                j.x = action.get('x', j.x)
-                                j.y = action.get('y', j.y)
+                                interp_remotos.push(j.player_id, action.get('x', j.x),
+                                                    action.get('y', j.y), action.get('t'))
                                 j.mira_x = action.get('mx', j.mira_x)
                                 j.mira_y = action.get('my', j.mira_y)
                             elif act == 'saber_throw':
@@ -1472,13 +1482,18 @@ def executar_minigame_sabers(tela, relogio, gradiente_jogo, fonte_titulo, fonte_
             # Bot AI
             for j in jogadores:
                 if j.is_bot and j.vivo:
-                    _bot_ai_sabers(j, jogadores, tempo)
+                    with escopo('ia'):
+                        _bot_ai_sabers(j, jogadores, tempo)
 
             # Atualizar posicoes
             for j in jogadores:
                 if j.vivo:
                     j.atualizar_dash()
-                    if not j.dash_ativo and not j.is_remote:
+                    if j.is_remote:
+                        pos = interp_remotos.sample(j.player_id)
+                        if pos:
+                            j.x, j.y = pos
+                    elif not j.dash_ativo:
                         j.x += j.vx
                         j.y += j.vy
                     j.x = max(4, min(j.x, ARENA_W - TAM_JOGADOR - 4))
@@ -1684,6 +1699,7 @@ def executar_minigame_sabers(tela, relogio, gradiente_jogo, fonte_titulo, fonte_
                 cam_x, cam_y = _atualizar_camera(vivos[0], cam_x, cam_y)
 
         # ========== ATUALIZAR PARTICULAS ==========
+        secao('particulas')
         for p in particulas[:]:
             p.atualizar()
             if p.vida <= 0:
@@ -1695,6 +1711,7 @@ def executar_minigame_sabers(tela, relogio, gradiente_jogo, fonte_titulo, fonte_
                 flashes.remove(f)
 
         # ========== DESENHAR ==========
+        secao('render')
         _desenhar_arena(tela, cam_x, cam_y, tempo)
 
         # Jogadores
@@ -1730,12 +1747,14 @@ def executar_minigame_sabers(tela, relogio, gradiente_jogo, fonte_titulo, fonte_
         # HUD
         if estado == "FIGHT":
             jogadores_vivos = len([j for j in jogadores if j.vivo])
-            _desenhar_hud_sabers(tela, jogador_humano, fonte_hud, fonte_peq,
-                                 jogadores_vivos, rodada_atual, tempo)
+            with escopo('hud'):
+                _desenhar_hud_sabers(tela, jogador_humano, fonte_hud, fonte_peq,
+                                     jogadores_vivos, rodada_atual, tempo)
 
         # Minimap
         if estado in ("FIGHT", "COUNTDOWN"):
-            _desenhar_minimap(tela, jogadores, jogador_humano, cam_x, cam_y)
+            with escopo('hud'):
+                _desenhar_minimap(tela, jogadores, jogador_humano, cam_x, cam_y)
 
         # Mira customizada
         if estado in ("FIGHT", "COUNTDOWN"):
@@ -1757,15 +1776,13 @@ def executar_minigame_sabers(tela, relogio, gradiente_jogo, fonte_titulo, fonte_
             else:
                 cd_text = "FIGHT!"
                 cd_cor = VERMELHO
-            cd_surf = fonte_countdown.render(cd_text, True, cd_cor)
+            cd_surf = renderizar_texto(cd_text, fonte_countdown, cd_cor)
             tela.blit(cd_surf, (LARGURA // 2 - cd_surf.get_width() // 2,
                                 ALTURA_JOGO // 2 - cd_surf.get_height() // 2))
 
         # Round end
         if estado == "ROUND_END":
-            overlay = pygame.Surface((LARGURA, ALTURA_JOGO), pygame.SRCALPHA)
-            overlay.fill((0, 0, 0, 100))
-            tela.blit(overlay, (0, 0))
+            desenhar_overlay_cor(tela, (0, 0, 0), 100, (LARGURA, ALTURA_JOGO))
 
             if round_vencedor:
                 msg = f"{round_vencedor.nome} venceu a rodada {rodada_atual}!"
@@ -1774,21 +1791,19 @@ def executar_minigame_sabers(tela, relogio, gradiente_jogo, fonte_titulo, fonte_
                 msg = "Empate!"
                 cor_msg = AMARELO
 
-            msg_surf = fonte_grande.render(msg, True, cor_msg)
+            msg_surf = renderizar_texto(msg, fonte_grande, cor_msg)
             tela.blit(msg_surf, (LARGURA // 2 - msg_surf.get_width() // 2,
                                  ALTURA_JOGO // 2 - msg_surf.get_height() // 2))
 
         # Scoreboard
         if estado == "SCOREBOARD":
-            _desenhar_scoreboard(tela, jogadores, fonte_grande, fonte_score,
-                                  fonte_peq, tempo, scoreboard_start)
+            with escopo('hud'):
+                _desenhar_scoreboard(tela, jogadores, fonte_grande, fonte_score,
+                                      fonte_peq, tempo, scoreboard_start)
 
         # Fade de intro
         if alpha_fade > 0:
-            fade_surf = pygame.Surface((LARGURA, ALTURA_JOGO))
-            fade_surf.fill((0, 0, 0))
-            fade_surf.set_alpha(alpha_fade)
-            tela.blit(fade_surf, (0, 0))
+            desenhar_overlay_cor(tela, (0, 0, 0), alpha_fade, (LARGURA, ALTURA_JOGO))
 
         # Titulo durante intro
         if estado == "INTRO" and tempo_no_estado > 500:
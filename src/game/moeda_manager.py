@@ -5,13 +5,14 @@
 Gerenciador de moedas para o jogo.
 """
 
-import random
 import json
 import os
 import pygame
 import math
 from src.config import LARGURA, ALTURA_JOGO
 from src.entities.moeda import Moeda
+from src.utils.saves import caminho_dados, pasta_dados
+from src.utils.rng import rng_jogo
 
 
 class MoedaManager:
@@ -22,7 +23,7 @@ class MoedaManager:
         self.moedas_na_tela = []
         self.quantidade_moedas = self.carregar_moedas()  # Alterado para método sem underline
         self.ultimo_spawn = pygame.time.get_ticks()
-        self.intervalo_spawn = random.randint(1000, 2000)  # Entre 3 e 8 segundos
+        self.intervalo_spawn = rng_jogo.randint(1000, 2000)  # Entre 3 e 8 segundos
         self.som_coleta = self.criar_som_coleta()  # Alterado para método sem underline
     
     def criar_som_coleta(self):  # Alterado para método sem underline
@@ -43,12 +44,12 @@ class MoedaManager:
         """
         try:
             # Criar o diretório de dados se não existir
-            if not os.path.exists("data"):
-                os.makedirs("data")
+            if not os.path.exists(pasta_dados()):
+                os.makedirs(pasta_dados())
             
             # Tentar carregar o arquivo de moedas
-            if os.path.exists("data/moedas.json"):
-                with open("data/moedas.json", "r") as f:
+            if os.path.exists(caminho_dados("moedas.json")):
+                with open(caminho_dados("moedas.json"), "r") as f:
                     data = json.load(f)
                     return data.get("moedas", 0)
             return 0
@@ -60,11 +61,11 @@ class MoedaManager:
         """Salva a quantidade atual de moedas no arquivo."""
         try:
             # Criar o diretório de dados se não existir
-            if not os.path.exists("data"):
-                os.makedirs("data")
+            if not os.path.exists(pasta_dados()):
+                os.makedirs(pasta_dados())
             
             # Salvar as moedas no arquivo
-            with open("data/moedas.json", "w") as f:
+            with open(caminho_dados("moedas.json"), "w") as f:
                 json.dump({"moedas": self.quantidade_moedas}, f)
         except Exception as e:
             print(f"Erro ao salvar moedas: {e}")
@@ -86,7 +87,7 @@ class MoedaManager:
         if tempo_atual - self.ultimo_spawn > self.intervalo_spawn:
             self.gerar_moeda()
             self.ultimo_spawn = tempo_atual
-            self.intervalo_spawn = random.randint(1000, 3000)  # Novo intervalo aleatório
+            self.intervalo_spawn = rng_jogo.randint(1000, 3000)  # Novo intervalo aleatório
         
         # Atualizar moedas existentes
         for moeda in self.moedas_na_tela[:]:
@@ -121,8 +122,8 @@ class MoedaManager:
         margem = 50
         
         # Gerar posição aleatória APENAS na área de jogo, não no HUD
-        x = random.randint(margem, LARGURA - margem)
-        y = random.randint(margem, ALTURA_JOGO - margem)  # Usar ALTURA_JOGO em vez de ALTURA
+        x = rng_jogo.randint(margem, LARGURA - margem)
+        y = rng_jogo.randint(margem, ALTURA_JOGO - margem)  # Usar ALTURA_JOGO em vez de ALTURA
         
         # Criar a moeda
         moeda = Moeda(x, y)
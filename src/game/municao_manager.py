@@ -8,6 +8,7 @@ Salva e carrega munições permanentes (não recarregam entre fases).
 
 import os
 import json
+from src.utils.saves import caminho_dados, pasta_dados
 
 
 def salvar_todas_municoes(jogador):
@@ -20,8 +21,8 @@ def salvar_todas_municoes(jogador):
     try:
         # Carregar upgrades existentes
         upgrades = {}
-        if os.path.exists("data/upgrades.json"):
-            with open("data/upgrades.json", "r") as f:
+        if os.path.exists(caminho_dados("upgrades.json")):
+            with open(caminho_dados("upgrades.json"), "r") as f:
                 upgrades = json.load(f)
 
         # Atualizar todas as munições com os valores atuais
@@ -56,10 +57,10 @@ def salvar_todas_municoes(jogador):
             upgrades["dimensional_hop"] = max(0, jogador.dimensional_hop_uses)
 
         # Criar diretório se não existir
-        os.makedirs("data", exist_ok=True)
+        os.makedirs(pasta_dados(), exist_ok=True)
 
         # Salvar
-        with open("data/upgrades.json", "w") as f:
+        with open(caminho_dados("upgrades.json"), "w") as f:
             json.dump(upgrades, f, indent=4)
 
 
@@ -77,14 +78,14 @@ def salvar_municao_individual(tipo_municao, quantidade):
     """
     try:
         upgrades = {}
-        if os.path.exists("data/upgrades.json"):
-            with open("data/upgrades.json", "r") as f:
+        if os.path.exists(caminho_dados("upgrades.json")):
+            with open(caminho_dados("upgrades.json"), "r") as f:
                 upgrades = json.load(f)
 
         upgrades[tipo_municao] = max(0, quantidade)
 
-        os.makedirs("data", exist_ok=True)
-        with open("data/upgrades.json", "w") as f:
+        os.makedirs(pasta_dados(), exist_ok=True)
+        with open(caminho_dados("upgrades.json"), "w") as f:
             json.dump(upgrades, f, indent=4)
 
     except Exception as e:
@@ -9,12 +9,13 @@ Cada item tem preço base, limite máximo de compras e multiplicador de preço.
 import json
 import os
 import math
+from src.utils.saves import caminho_dados, pasta_dados
 
 class PricingManager:
     """Gerencia preços dinâmicos e limites de compra para todos os itens das lojas."""
     
     def __init__(self):
-        self.arquivo_pricing = "data/pricing.json"
+        self.arquivo_pricing = caminho_dados("pricing.json")
         self.dados_pricing = self.carregar_pricing()
     
     def carregar_pricing(self):
@@ -130,7 +131,7 @@ class PricingManager:
     def salvar_pricing(self, dados=None):
         """Salva os dados de pricing no arquivo."""
         try:
-            os.makedirs("data", exist_ok=True)
+            os.makedirs(pasta_dados(), exist_ok=True)
             dados_para_salvar = dados if dados else self.dados_pricing
             with open(self.arquivo_pricing, "w") as f:
                 json.dump(dados_para_salvar, f, indent=4)
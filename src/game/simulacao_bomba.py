@@ -0,0 +1,1083 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Simulação do modo Bomb sem interface.
+
+É a única implementação das regras do modo: rounds, bomber,
+plantar/defusar/explodir a bomba, tiros e dano entre times, vitória e a
+IA dos bots. Roda no servidor e, quando o servidor não simula a partida,
+dentro do próprio FaseMultiplayer, que a avança um frame por vez e
+desenha o mesmo estado. Nada aqui desenha ou lê teclado/mouse: o
+servidor aplica cada input de movimento com `mover_jogador()` (o mesmo
+passo da predição do cliente, com velocidade, dash, turbo, escudo e
+invisibilidade da classe), informa a posição e a tecla F de cada jogador
+humano, chama `passo()` a cada tick e repassa aos clientes `estado()`,
+`bots()` e `tiros()`. O `estado()` leva um checksum das vidas, da bomba e dos
+rounds (checksum_bomba), que o cliente confere com o espelho dele.
+
+A simulação avança em passos fixos de 1/60 s (o mesmo frame usado pelo
+cliente), então velocidades de movimento e de tiro são as do jogo local.
+
+A IA dos bots compra arma no tempo de compra, anda até o objetivo
+(bombsite, bomba plantada ou bomba dropada) por um caminho em grade de
+tiles, troca tiros com o inimigo visível mais próximo (com strafe) e
+planta/defusa a bomba.
+"""
+
+import math
+import random
+from collections import deque
+from typing import Dict, List, Optional, Tuple
+
+import pygame
+
+from src.config import TAMANHO_MULTIPLAYER
+from src.game.selecao_classes import CLASSES_TIME_T, CLASSES_TIME_Q, obter_dados_classe
+from src.network.checksum import StateChecksum, quantizar
+
+FRAME_MS = 1000.0 / 60.0  # Duração de um passo da simulação
+
+# Regras do modo (o HUD de FaseMultiplayer usa os mesmos tempos)
+ATRASO_INICIO = 2000  # Introdução do cliente antes do primeiro round (ms)
+TEMPO_COMPRA = 6000
+TEMPO_PLANTAR = 4000
+TEMPO_DEFUSAR = 5000
+TEMPO_EXPLOSAO = 35000
+TEMPO_ENTRE_ROUNDS = 3000
+ROUNDS_PARA_VENCER = 5
+RAIO_PICKUP = 30  # Distância para pegar a bomba dropada
+DISTANCIA_BOMBA = 30  # Distância (por eixo) para defusar
+TILE_BOMBSITE = 322
+
+JOGADORES_POR_TIME = 4
+VELOCIDADE = 2.5
+TURBO_MULTIPLICADOR = 4.0  # Velocidade do turbo da classe cyan
+CLASSES_MOVIMENTO = ('cyan', 'normal', 'mago', 'ghost')  # Habilidades simuladas em mover_com_classe
+VELOCIDADE_TIRO = 7
+RAIO_TIRO = 6
+
+# IA
+IA_DISTANCIA_VISAO = 200
+IA_DISTANCIA_TIRO = 180
+IA_DISTANCIA_CANCELAR_PLANTIO = 150
+IA_DISTANCIA_PRIORIDADE_DEFUSE = 100
+IA_RECALC_INTERVALO = 2000  # Intervalo mínimo entre recálculos de caminho (ms)
+IA_STUCK_TEMPO = 500
+IA_STUCK_DISTANCIA = 5
+
+NOMES_BOTS = {
+    'T': ["Bernado", "Borba", "Melina", "Felipe"],
+    'Q': ["Duda", "Marcelo", "João", "Emy"],
+}
+COR_TIME = {'T': (255, 100, 100), 'Q': (100, 150, 255)}
+
+# nome, preço, dano, cadência (ms)
+ARMAS_BOTS = [
+    ('sniper', 4750, 6, 1200),
+    ('metralhadora', 2700, 1, 100),
+    ('spas12', 1200, 2, 600),
+    ('desert_eagle', 500, 3, 700),
+]
+
+
+def mover_no_mapa(tilemap, x: float, y: float, keys: Dict[str, bool],
+                  velocidade: float = VELOCIDADE) -> Tuple[float, float]:
+    """
+    Um input de movimento com colisão no mapa (mesma conta de
+    FaseMultiplayer._atualizar_jogador_com_colisao). Roda no servidor e na
+    predição do cliente, então os dois chegam na mesma posição.
+
+    Args:
+        tilemap: TileMap do mapa
+        x, y: Posição atual
+        keys: Estado das teclas WASD
+        velocidade: Deslocamento por input
+
+    Returns:
+        Nova posição (x, y)
+    """
+    mov_x = (1 if keys.get('d') else 0) - (1 if keys.get('a') else 0)
+    mov_y = (1 if keys.get('s') else 0) - (1 if keys.get('w') else 0)
+    if mov_x != 0 and mov_y != 0:
+        mov_x *= 0.7071
+        mov_y *= 0.7071
+    rect = pygame.Rect(x, y, TAMANHO_MULTIPLAYER, TAMANHO_MULTIPLAYER)
+    novo_x, novo_y, _, _ = tilemap.resolver_colisao(rect, mov_x * velocidade, mov_y * velocidade)
+    return novo_x, novo_y
+
+
+def novo_movimento() -> Dict:
+    """
+    Estado de movimento de um jogador recém-nascido. Os contadores são em
+    inputs (um input = um frame de FRAME_MS): 'recarga' até poder usar a
+    habilidade de novo, 'turbo' (cyan), 'dash' com a direção (normal),
+    'escudo' (mago) e 'invisivel' (ghost).
+    """
+    return {'recarga': 0, 'turbo': 0, 'dash': 0, 'dash_x': 0.0, 'dash_y': 0.0,
+            'escudo': 0, 'invisivel': 0}
+
+
+def movimento_invulneravel(movimento: Optional[Dict]) -> bool:
+    """Dash e escudo deixam o jogador imune a tiros."""
+    return bool(movimento) and (movimento['dash'] > 0 or movimento['escudo'] > 0)
+
+
+def _frames(ms: float) -> int:
+    return int(round(ms / FRAME_MS))
+
+
+def mover_com_classe(tilemap, x: float, y: float, keys: Dict[str, bool],
+                     movimento: Optional[Dict], classe: Optional[str], time: str,
+                     pode_andar: bool = True) -> Tuple[float, float, Dict]:
+    """
+    Um input de movimento com a classe do jogador: velocidade base, turbo
+    (cyan), dash (normal) e a duração do escudo (mago) e da invisibilidade
+    (ghost). `keys['hab']` pede a habilidade (tecla ESPAÇO). Roda no
+    servidor (SimulacaoBomba.mover_jogador) e na predição do cliente, então
+    os dois chegam na mesma posição e no mesmo estado.
+
+    Args:
+        tilemap: TileMap do mapa
+        x, y: Posição atual
+        keys: Estado das teclas WASD e 'hab'
+        movimento: Estado anterior (novo_movimento() se None); não é alterado
+        classe: Classe do jogador (None = sem habilidade)
+        time: Time do jogador ('T' ou 'Q')
+        pode_andar: False no tempo de compra, com o round encerrado ou morto
+                    (os tempos correm, mas não anda nem usa a habilidade)
+
+    Returns:
+        Nova posição (x, y) e o novo estado de movimento
+    """
+    movimento = dict(movimento) if movimento else novo_movimento()
+    for campo in ('recarga', 'turbo', 'escudo', 'invisivel'):
+        if movimento[campo] > 0:
+            movimento[campo] -= 1
+    if not pode_andar:
+        return x, y, movimento
+
+    dados = obter_dados_classe(classe, time) if classe else None
+    dados = dados or {}
+    if keys.get('hab') and classe in CLASSES_MOVIMENTO and dados and movimento['recarga'] == 0:
+        movimento['recarga'] = _frames(dados.get('habilidade_cooldown', 0))
+        if classe == 'cyan':
+            movimento['turbo'] = _frames(dados.get('habilidade_duracao', 5000))
+        elif classe == 'mago':
+            movimento['escudo'] = _frames(dados.get('habilidade_duracao', 4000))
+        elif classe == 'ghost':
+            movimento['invisivel'] = _frames(dados.get('habilidade_duracao', 4000))
+        else:
+            # Dash na direção das teclas (para a direita se parado)
+            dx = (1 if keys.get('d') else 0) - (1 if keys.get('a') else 0)
+            dy = (1 if keys.get('s') else 0) - (1 if keys.get('w') else 0)
+            if dx == 0 and dy == 0:
+                dx = 1
+            magnitude = math.hypot(dx, dy)
+            movimento['dash'] = dados.get('dash_duracao', 8)
+            movimento['dash_x'] = dx / magnitude
+            movimento['dash_y'] = dy / magnitude
+
+    velocidade = VELOCIDADE * dados.get('velocidade_base', 1.0)
+    if movimento['turbo'] > 0:
+        velocidade *= TURBO_MULTIPLICADOR
+    x, y = mover_no_mapa(tilemap, x, y, keys, velocidade)
+
+    if movimento['dash'] > 0:
+        dash_velocidade = dados.get('dash_velocidade', 25)
+        rect = pygame.Rect(x, y, TAMANHO_MULTIPLAYER, TAMANHO_MULTIPLAYER)
+        x, y, _, _ = tilemap.resolver_colisao(rect, movimento['dash_x'] * dash_velocidade,
+                                              movimento['dash_y'] * dash_velocidade)
+        movimento['dash'] -= 1
+    return x, y, movimento
+
+
+class Combatente:
+    """Jogador humano ou bot dentro da simulação."""
+
+    def __init__(self, id, nome: str, time: str, x: float, y: float, vidas: int,
+                 is_bot: bool, classe: Optional[str] = None, cor=None):
+        self.id = id
+        self.nome = nome
+        self.time = time
+        self.x = x
+        self.y = y
+        self.vidas = vidas
+        self.vidas_max = vidas
+        self.is_bot = is_bot
+        self.classe = classe
+        self.cor = tuple(cor or COR_TIME[time])
+
+        self.movimento = novo_movimento()  # Habilidade de classe (ver mover_com_classe)
+        self.bomber = False
+        self.usando = False  # Tecla F (humanos)
+        self.plantando_desde: Optional[float] = None
+        self.defusando_desde: Optional[float] = None
+
+        # Economia e arma (bots)
+        self.moedas = 800
+        self.arma = None
+        self.dano_arma = 1
+        self.cadencia_arma = 500
+        self.ultimo_tiro = -1e9
+        self.ja_comprou = False
+
+        # Navegação (bots)
+        self.caminho: List[Tuple[float, float]] = []
+        self.destino: Optional[Tuple[float, float]] = None
+        self.ultimo_caminho = -1e9
+        self.pos_parado = (x, y)
+        self.tempo_parado = 0.0
+        self.bombsite_alvo = 0
+
+    @property
+    def vivo(self) -> bool:
+        return self.vidas > 0
+
+    def centro(self) -> Tuple[float, float]:
+        return self.x + TAMANHO_MULTIPLAYER / 2, self.y + TAMANHO_MULTIPLAYER / 2
+
+
+class TiroSimulado:
+    """Projétil de um bot."""
+
+    def __init__(self, id: int, x: float, y: float, dx: float, dy: float,
+                 dano: int, time: str, dono, cor):
+        self.id = id
+        self.x = x
+        self.y = y
+        self.dx = dx
+        self.dy = dy
+        self.dano = dano
+        self.time = time
+        self.dono = dono
+        self.cor = cor
+
+    def acerta(self, alvo: Combatente) -> bool:
+        """Mesmo teste do cliente: rect do tiro (2*raio) contra o quadrado do alvo."""
+        return (self.x - RAIO_TIRO < alvo.x + TAMANHO_MULTIPLAYER and
+                self.x + RAIO_TIRO > alvo.x and
+                self.y - RAIO_TIRO < alvo.y + TAMANHO_MULTIPLAYER and
+                self.y + RAIO_TIRO > alvo.y)
+
+
+def checksum_bomba(estado: Dict) -> StateChecksum:
+    """
+    Checksum do que decide a partida: rounds e placar, estado da bomba e
+    vidas de todos os combatentes.
+
+    O servidor aplica sobre o `estado()` da simulação e o cliente sobre um
+    dicionário com as mesmas chaves montado do espelho dele, então os dois
+    lados acrescentam os campos na mesma ordem.
+
+    Args:
+        estado: Dicionário com as chaves do estado() ('round', 'placar',
+                'round_terminado', 'partida_terminada', 'plantada',
+                'posicao', 'dropada', 'drop_posicao' e 'vidas')
+    """
+    checksum = StateChecksum()
+    checksum.add('round', estado['round'])
+    checksum.add('placar', list(estado['placar']))
+    checksum.add('round_terminado', estado['round_terminado'])
+    checksum.add('partida_terminada', estado['partida_terminada'])
+    checksum.add('plantada', estado['plantada'])
+    for campo in ('posicao', 'drop_posicao'):
+        pos = estado[campo]
+        checksum.add(campo, [quantizar(pos[0]), quantizar(pos[1])] if pos else None)
+    checksum.add('dropada', estado['dropada'])
+    for tipo, cid, vidas in sorted(estado['vidas'], key=lambda v: (v[0], v[1])):
+        checksum.add(f'vidas.{tipo}{cid}', vidas)
+    return checksum
+
+
+class SimulacaoBomba:
+    """Regras do modo Bomb e IA dos bots, sem display."""
+
+    def __init__(self, tilemap, seed: Optional[int] = None,
+                 jogadores_por_time: int = JOGADORES_POR_TIME):
+        """
+        Args:
+            tilemap: TileMap do mapa (pode ser carregado sem imagens)
+            seed: Seed do random da simulação (bots, bomber, imprecisão dos tiros)
+            jogadores_por_time: Tamanho de cada time (completado com bots)
+        """
+        self.tilemap = tilemap
+        self.rng = random.Random(seed)
+        self.jogadores_por_time = jogadores_por_time
+
+        self.tempo = 0.0  # Relógio da simulação (ms)
+        self._acumulado = 0.0
+
+        self.jogadores: Dict[int, Combatente] = {}
+        self.bots_sim: List[Combatente] = []
+        self.tiros_sim: List[TiroSimulado] = []
+        self._proximo_tiro_id = 1
+        self._eventos: List[Dict] = []
+
+        # Rounds
+        self.iniciada = False
+        self.round_atual = 0
+        self.rounds_t = 0
+        self.rounds_q = 0
+        self.inicio_round = 0.0
+        self.round_terminado = False
+        self.time_vencedor: Optional[str] = None
+        self.partida_terminada = False
+        self.proximo_round = 0.0
+
+        # Bomba
+        self.bomba_plantada = False
+        self.bomba_posicao: Optional[Tuple[float, float]] = None
+        self.bomba_tempo_plantio = 0.0
+        self.bomba_defusada = False
+        self.bomba_explodiu = False
+        self.bomba_dropada = False
+        self.bomba_drop_posicao: Optional[Tuple[float, float]] = None
+
+        # Só tiles 322 alcançáveis a pé (o mapa tem um bombsite decorativo murado)
+        self.tiles_bombsite = self._encontrar_tiles_bombsite()
+        self.bombsites = self._agrupar_bombsites(self.tiles_bombsite)
+
+    # ==================== API DO SERVIDOR ====================
+
+    def iniciar(self, times: Dict[int, Tuple[str, str, Optional[str]]]):
+        """
+        Começa a partida com os jogadores que escolheram time.
+        Cada time é completado com bots até jogadores_por_time.
+
+        Args:
+            times: {player_id: (time, nome, classe)}; a vida vem da classe
+        """
+        self.jogadores = {}
+        for pid, (time_jogador, nome, classe) in times.items():
+            if time_jogador not in ('T', 'Q'):
+                continue
+            dados = obter_dados_classe(classe, time_jogador) or {}
+            x, y = self._ponto_spawn(time_jogador, aleatorio=False)
+            self.jogadores[pid] = Combatente(pid, nome, time_jogador, x, y, dados.get('vidas', 5),
+                                             is_bot=False, classe=classe if dados else None)
+
+        self.bots_sim = []
+        for time_bot, classes in (('T', CLASSES_TIME_T), ('Q', CLASSES_TIME_Q)):
+            humanos = sum(1 for j in self.jogadores.values() if j.time == time_bot)
+            ids_classes = list(classes.keys())
+            self.rng.shuffle(ids_classes)
+            nomes = NOMES_BOTS[time_bot]
+            for i in range(max(0, self.jogadores_por_time - humanos)):
+                nome = nomes[i % len(nomes)]
+                if i >= len(nomes):
+                    nome = f"{nome} {i // len(nomes) + 1}"
+                self.bots_sim.append(self._criar_bot(time_bot, nome,
+                                                     ids_classes[i % len(ids_classes)]))
+
+        self.iniciada = True
+        self.round_atual = 0
+        self.rounds_t = 0
+        self.rounds_q = 0
+        self.partida_terminada = False
+        self._iniciar_novo_round(atraso=ATRASO_INICIO)
+        print(f"[SIMULAÇÃO] Partida iniciada: {len(self.jogadores)} jogadores, {len(self.bots_sim)} bots")
+
+    def remover_jogador(self, player_id: int):
+        """Tira um jogador que desconectou (a bomba cai se ele era o bomber)."""
+        jogador = self.jogadores.pop(player_id, None)
+        if jogador and jogador.bomber and not self.bomba_plantada:
+            self._dropar_bomba(jogador.x, jogador.y)
+
+    def pode_mover(self, player_id: int) -> bool:
+        """Jogadores não andam no tempo de compra, com o round encerrado ou mortos."""
+        jogador = self.jogadores.get(player_id)
+        if jogador is None:
+            return True
+        return jogador.vivo and not self._em_tempo_compra() and not self.round_terminado
+
+    def mover_jogador(self, player_id: int, x: float, y: float,
+                      keys: Dict[str, bool]) -> Tuple[float, float]:
+        """
+        Aplica um input de movimento com colisão no mapa e a habilidade de
+        classe do jogador (ver mover_com_classe).
+
+        Returns:
+            Nova posição (x, y)
+        """
+        jogador = self.jogadores.get(player_id)
+        if jogador is None:
+            return mover_no_mapa(self.tilemap, x, y, keys)  # Antes da partida começar
+        x, y, jogador.movimento = mover_com_classe(self.tilemap, x, y, keys, jogador.movimento,
+                                                   jogador.classe, jogador.time,
+                                                   self.pode_mover(player_id))
+        return x, y
+
+    def movimento(self, player_id: int) -> Optional[Dict]:
+        """Estado de movimento do jogador (vai no GAME_STATE para a predição)."""
+        jogador = self.jogadores.get(player_id)
+        return jogador.movimento if jogador else None
+
+    def invulneravel(self, player_id: int) -> bool:
+        """Se o jogador está de dash ou escudo (tiros não pegam)."""
+        jogador = self.jogadores.get(player_id)
+        return jogador is not None and movimento_invulneravel(jogador.movimento)
+
+    def sincronizar_jogador(self, player_id: int, x: float, y: float,
+                            vidas: int, usando: bool):
+        """Atualiza posição, vida e tecla F de um jogador com o estado do servidor."""
+        jogador = self.jogadores.get(player_id)
+        if jogador is None:
+            return
+        jogador.x = x
+        jogador.y = y
+        if jogador.vivo and vidas <= 0 and jogador.bomber and not self.bomba_plantada:
+            self._dropar_bomba(x, y)
+        jogador.vidas = vidas
+        jogador.usando = usando
+
+    def dano_bot(self, bot_id: int, dano: int, time_atirador: Optional[str]) -> Optional[int]:
+        """
+        Aplica um acerto (já validado) de um jogador humano em um bot.
+
+        Returns:
+            Vida restante do bot, ou None se o acerto não vale (bot morto,
+            mesmo time ou id inválido)
+        """
+        if not 0 <= bot_id < len(self.bots_sim):
+            return None
+        bot = self.bots_sim[bot_id]
+        if not bot.vivo or bot.time == time_atirador:
+            return None
+        self._aplicar_dano(bot, dano)
+        return bot.vidas
+
+    def passo(self, dt: float) -> List[Dict]:
+        """
+        Avança a simulação em passos fixos de FRAME_MS.
+
+        Args:
+            dt: Tempo real desde a última chamada (s)
+
+        Returns:
+            Eventos para o servidor aplicar nos jogadores humanos:
+            {'tipo': 'acerto', 'alvo', 'dano', 'atirador'} e
+            {'tipo': 'respawn', 'alvo', 'x', 'y', 'vidas'}
+        """
+        if not self.iniciada:
+            return []
+
+        self._acumulado += dt * 1000.0
+        # Evitar espiral de passos se o servidor travar
+        self._acumulado = min(self._acumulado, FRAME_MS * 30)
+        while self._acumulado >= FRAME_MS:
+            self._acumulado -= FRAME_MS
+            self.tempo += FRAME_MS
+            self._frame()
+
+        eventos, self._eventos = self._eventos, []
+        return eventos
+
+    def estado(self) -> Dict:
+        """Resumo do round e da bomba (vai para todos os clientes, sem filtro de AOI)."""
+        bomber = None
+        for c in self._todos():
+            if c.bomber:
+                bomber = ['bot' if c.is_bot else 'player', c.id]
+                break
+
+        plantando = next((c for c in self._todos() if c.plantando_desde is not None), None)
+        defusando = next((c for c in self._todos() if c.defusando_desde is not None), None)
+        vivos = {'T': 0, 'Q': 0}
+        for c in self._todos():
+            if c.vivo:
+                vivos[c.time] += 1
+
+        vidas = [['bot' if c.is_bot else 'player', c.id, c.vidas] for c in self._todos()]
+        estado = {
+            'tick': int(round(self.tempo / FRAME_MS)),
+            'round': self.round_atual,
+            'placar': [self.rounds_t, self.rounds_q],
+            'tempo_round': self.tempo - self.inicio_round,
+            'tempo_compra': self._em_tempo_compra(),
+            'round_terminado': self.round_terminado,
+            'vencedor': self.time_vencedor,
+            'partida_terminada': self.partida_terminada,
+            'vivos': vivos,
+            'bomber': bomber,
+            'plantada': self.bomba_plantada,
+            'posicao': self.bomba_posicao,
+            'tempo_restante': (max(0.0, TEMPO_EXPLOSAO - (self.tempo - self.bomba_tempo_plantio))
+                               if self.bomba_plantada else None),
+            'dropada': self.bomba_dropada,
+            'drop_posicao': self.bomba_drop_posicao,
+            'plantando': (self.tempo - plantando.plantando_desde) if plantando else None,
+            'defusando': (self.tempo - defusando.defusando_desde) if defusando else None,
+            'defusador': ['bot' if defusando.is_bot else 'player', defusando.id] if defusando else None,
+            'vidas': vidas,
+        }
+        estado['checksum'] = checksum_bomba(estado).digest()
+        return estado
+
+    def bots(self) -> List[Dict]:
+        """Estado dos bots para o GAME_STATE (lista 'enemies')."""
+        return [{
+            'id': bot.id,
+            'nome': bot.nome,
+            'time': bot.time,
+            'classe': bot.classe,
+            'x': round(bot.x, 1),
+            'y': round(bot.y, 1),
+            'vidas': bot.vidas,
+            'vidas_max': bot.vidas_max,
+            'bomber': bot.bomber,
+            'arma': bot.arma,
+        } for bot in self.bots_sim]
+
+    def tiros(self) -> List[Dict]:
+        """Tiros dos bots em voo para o GAME_STATE (lista 'bullets')."""
+        return [{
+            'id': t.id,
+            'x': round(t.x, 1),
+            'y': round(t.y, 1),
+            'dx': round(t.dx, 4),
+            'dy': round(t.dy, 4),
+            'time': t.time,
+            'cor': t.cor,
+        } for t in self.tiros_sim]
+
+    # ==================== LOOP ====================
+
+    def _frame(self):
+        if self.round_terminado:
+            if not self.partida_terminada and self.tempo >= self.proximo_round:
+                self._iniciar_novo_round()
+            return
+
+        if self.tempo < self.inicio_round:
+            return  # Introdução do cliente
+
+        self._atualizar_bots()
+        self._atualizar_tiros()
+        self._processar_bomba()
+        self._verificar_pickup_bomba()
+        self._verificar_vitoria()
+
+    def _todos(self):
+        yield from self.jogadores.values()
+        yield from self.bots_sim
+
+    def _em_tempo_compra(self) -> bool:
+        return self.tempo - self.inicio_round < TEMPO_COMPRA
+
+    # ==================== ROUNDS ====================
+
+    def _iniciar_novo_round(self, atraso: float = 0.0):
+        self.round_atual += 1
+        self.round_terminado = False
+        self.time_vencedor = None
+        self.inicio_round = self.tempo + atraso
+
+        for jogador in self.jogadores.values():
+            jogador.x, jogador.y = self._ponto_spawn(jogador.time, aleatorio=False)
+            jogador.vidas = jogador.vidas_max
+            jogador.movimento = novo_movimento()
+            jogador.bomber = False
+            jogador.plantando_desde = None
+            jogador.defusando_desde = None
+            self._eventos.append({'tipo': 'respawn', 'alvo': jogador.id,
+                                  'x': jogador.x, 'y': jogador.y, 'vidas': jogador.vidas})
+
+        for bot in self.bots_sim:
+            bot.x, bot.y = self._ponto_spawn(bot.time)
+            bot.vidas = bot.vidas_max
+            bot.bomber = False
+            bot.plantando_desde = None
+            bot.defusando_desde = None
+            bot.ja_comprou = False
+            bot.caminho = []
+            bot.destino = None
+            bot.pos_parado = (bot.x, bot.y)
+            bot.tempo_parado = self.inicio_round
+            if self.round_atual > 1:
+                bot.moedas += 1400  # Bônus por round
+            if self.bombsites:
+                bot.bombsite_alvo = self.rng.randrange(len(self.bombsites))
+
+        self.tiros_sim.clear()
+        self.bomba_plantada = False
+        self.bomba_posicao = None
+        self.bomba_tempo_plantio = 0.0
+        self.bomba_defusada = False
+        self.bomba_explodiu = False
+        self.bomba_dropada = False
+        self.bomba_drop_posicao = None
+
+        self._selecionar_bomber()
+        print(f"[SIMULAÇÃO] Round {self.round_atual} | T {self.rounds_t} x {self.rounds_q} Q")
+
+    def _selecionar_bomber(self):
+        candidatos = [c for c in self._todos() if c.time == 'T' and c.vivo]
+        if candidatos:
+            self.rng.choice(candidatos).bomber = True
+
+    def _verificar_vitoria(self):
+        if self.round_terminado:
+            return
+
+        vivos_t = sum(1 for c in self._todos() if c.time == 'T' and c.vivo)
+        vivos_q = sum(1 for c in self._todos() if c.time == 'Q' and c.vivo)
+
+        if vivos_t == 0 and vivos_q > 0:
+            # Com a bomba plantada, o Time Q ainda precisa defusar
+            if not (self.bomba_plantada and not self.bomba_defusada):
+                self._time_venceu_round('Q')
+        elif vivos_q == 0 and vivos_t > 0:
+            self._time_venceu_round('T')
+
+    def _time_venceu_round(self, time_vencedor: str):
+        self.round_terminado = True
+        self.time_vencedor = time_vencedor
+        if time_vencedor == 'T':
+            self.rounds_t += 1
+        else:
+            self.rounds_q += 1
+        print(f"[SIMULAÇÃO] Time {time_vencedor} venceu o round {self.round_atual}! "
+              f"T {self.rounds_t} x {self.rounds_q} Q")
+
+        if max(self.rounds_t, self.rounds_q) >= ROUNDS_PARA_VENCER:
+            self.partida_terminada = True
+            print(f"[SIMULAÇÃO] Time {time_vencedor} venceu a partida!")
+        else:
+            self.proximo_round = self.tempo + TEMPO_ENTRE_ROUNDS
+
+    # ==================== BOMBA ====================
+
+    def _no_bombsite(self, c: Combatente) -> bool:
+        cx, cy = c.centro()
+        return self.tilemap.get_tile_at_pixel(cx, cy) & 0x1FFFFFFF == TILE_BOMBSITE
+
+    def _perto_bomba(self, c: Combatente) -> bool:
+        return (self.bomba_posicao is not None and
+                abs(c.x - self.bomba_posicao[0]) < DISTANCIA_BOMBA and
+                abs(c.y - self.bomba_posicao[1]) < DISTANCIA_BOMBA)
+
+    def _processar_bomba(self):
+        if self.bomba_explodiu or self.bomba_defusada:
+            return
+
+        if not self.bomba_plantada:
+            for c in self._todos():
+                if not c.bomber or not c.vivo:
+                    c.plantando_desde = None
+                    continue
+                # Bots decidem plantar na IA; humanos seguram F no bombsite
+                quer_plantar = c.plantando_desde is not None if c.is_bot else c.usando
+                if quer_plantar and self._no_bombsite(c):
+                    if c.plantando_desde is None:
+                        c.plantando_desde = self.tempo
+                    elif self.tempo - c.plantando_desde >= TEMPO_PLANTAR:
+                        self._plantar_bomba(c)
+                        return
+                else:
+                    c.plantando_desde = None
+            return
+
+        if self.tempo - self.bomba_tempo_plantio >= TEMPO_EXPLOSAO:
+            self.bomba_explodiu = True
+            print("[SIMULAÇÃO] Bomba explodiu!")
+            self._time_venceu_round('T')
+            return
+
+        for c in self._todos():
+            quer_defusar = c.time == 'Q' and c.vivo and self._perto_bomba(c) and (c.usando or c.is_bot)
+            if not quer_defusar:
+                c.defusando_desde = None
+                continue
+            if c.defusando_desde is None:
+                c.defusando_desde = self.tempo
+            elif self.tempo - c.defusando_desde >= TEMPO_DEFUSAR:
+                self.bomba_defusada = True
+                c.defusando_desde = None
+                print(f"[SIMULAÇÃO] {c.nome} defusou a bomba!")
+                self._time_venceu_round('Q')
+                return
+
+    def _plantar_bomba(self, c: Combatente):
+        self.bomba_plantada = True
+        self.bomba_posicao = (c.x, c.y)
+        self.bomba_tempo_plantio = self.tempo
+        c.plantando_desde = None
+        c.bomber = False
+        print(f"[SIMULAÇÃO] {c.nome} plantou a bomba!")
+
+    def _dropar_bomba(self, x: float, y: float):
+        if self.bomba_plantada:
+            return
+        for c in self._todos():
+            c.bomber = False
+            c.plantando_desde = None
+        self.bomba_dropada = True
+        self.bomba_drop_posicao = (x, y)
+
+    def _verificar_pickup_bomba(self):
+        if not self.bomba_dropada:
+            return
+        bx, by = self.bomba_drop_posicao
+        for c in self._todos():
+            if c.time == 'T' and c.vivo and math.hypot(c.x - bx, c.y - by) < RAIO_PICKUP:
+                self.bomba_dropada = False
+                self.bomba_drop_posicao = None
+                c.bomber = True
+                return
+
+    # ==================== TIROS E DANO ====================
+
+    def _aplicar_dano(self, alvo: Combatente, dano: int):
+        vida_antes = alvo.vidas
+        alvo.vidas = max(0, alvo.vidas - dano)
+        if vida_antes > 0 and alvo.vidas <= 0:
+            alvo.plantando_desde = None
+            alvo.defusando_desde = None
+            if alvo.bomber and not self.bomba_plantada:
+                self._dropar_bomba(alvo.x, alvo.y)
+
+    def _atualizar_tiros(self):
+        largura = self.tilemap.largura_pixels
+        altura = self.tilemap.altura_pixels
+
+        for tiro in self.tiros_sim[:]:
+            tiro.x += tiro.dx * VELOCIDADE_TIRO
+            tiro.y += tiro.dy * VELOCIDADE_TIRO
+
+            if not (0 <= tiro.x <= largura and 0 <= tiro.y <= altura) or self.tilemap.is_solid(tiro.x, tiro.y):
+                self.tiros_sim.remove(tiro)
+                continue
+
+            for alvo in self._todos():
+                if not alvo.vivo or alvo.time == tiro.time or not tiro.acerta(alvo):
+                    continue
+                if movimento_invulneravel(alvo.movimento):
+                    continue  # Dash ou escudo: o tiro passa
+                self.tiros_sim.remove(tiro)
+                if alvo.is_bot:
+                    self._aplicar_dano(alvo, tiro.dano)
+                else:
+                    # O servidor aplica o dano no jogador e avisa os clientes
+                    self._eventos.append({'tipo': 'acerto', 'alvo': alvo.id,
+                                          'dano': tiro.dano, 'atirador': tiro.dono})
+                break
+
+    def _bot_atirar(self, bot: Combatente, alvo: Combatente):
+        if self.tempo - bot.ultimo_tiro < bot.cadencia_arma:
+            return
+
+        bx, by = bot.centro()
+        ax, ay = alvo.centro()
+        dist = math.hypot(ax - bx, ay - by)
+        if dist < 10:
+            return
+
+        imprecisao = min(dist / 800, 0.3)
+        angulo = math.atan2(ay - by, ax - bx) + self.rng.uniform(-imprecisao, imprecisao)
+        self.tiros_sim.append(TiroSimulado(self._proximo_tiro_id, bx, by,
+                                           math.cos(angulo), math.sin(angulo),
+                                           bot.dano_arma, bot.time, bot.id, bot.cor))
+        self._proximo_tiro_id += 1
+        bot.ultimo_tiro = self.tempo
+
+    # ==================== BOTS ====================
+
+    def _criar_bot(self, time_bot: str, nome: str, classe: str) -> Combatente:
+        dados = obter_dados_classe(classe, time_bot) or {}
+        x, y = self._ponto_spawn(time_bot)
+        bot = Combatente(len(self.bots_sim), nome, time_bot, x, y, dados.get('vidas', 5),
+                         is_bot=True, classe=classe, cor=dados.get('cor'))
+        if classe == 'metralhadora':
+            # Classe metralhadora começa com a arma e dano dobrado
+            bot.arma = 'metralhadora'
+            bot.dano_arma = 2
+            bot.cadencia_arma = 100
+        return bot
+
+    def _bot_comprar_arma(self, bot: Combatente):
+        possiveis = [a for a in ARMAS_BOTS if a[1] <= bot.moedas]
+        if possiveis:
+            bot.arma, preco, bot.dano_arma, bot.cadencia_arma = self.rng.choice(possiveis)
+            bot.moedas -= preco
+        elif bot.classe != 'metralhadora':
+            bot.arma = None
+            bot.dano_arma = 1
+            bot.cadencia_arma = 500
+
+    def _atualizar_bots(self):
+        compra = self._em_tempo_compra()
+
+        for bot in self.bots_sim:
+            if not bot.vivo:
+                continue
+
+            if compra:
+                if not bot.ja_comprou:
+                    self._bot_comprar_arma(bot)
+                    bot.ja_comprou = True
+                continue
+
+            inimigo, dist = self._detectar_inimigo(bot)
+
+            if bot.plantando_desde is not None:
+                # Plantando: só para se um inimigo chegar perto
+                if inimigo is not None and dist < IA_DISTANCIA_CANCELAR_PLANTIO:
+                    bot.plantando_desde = None
+                else:
+                    continue
+
+            if bot.defusando_desde is not None and (inimigo is None or dist > IA_DISTANCIA_PRIORIDADE_DEFUSE):
+                continue  # Defusando: fica parado (processado em _processar_bomba)
+
+            defusar_primeiro = (bot.time == 'Q' and self.bomba_plantada and
+                                inimigo is not None and dist > IA_DISTANCIA_PRIORIDADE_DEFUSE)
+
+            if inimigo is not None and not defusar_primeiro:
+                self._mover_combate(bot, inimigo)
+            else:
+                self._ir_para_objetivo(bot)
+
+            if inimigo is not None and dist < IA_DISTANCIA_TIRO:
+                self._bot_atirar(bot, inimigo)
+
+    def _detectar_inimigo(self, bot: Combatente) -> Tuple[Optional[Combatente], float]:
+        melhor, menor = None, float('inf')
+        bx, by = bot.centro()
+        for outro in self._todos():
+            if outro is bot or not outro.vivo or outro.time == bot.time or outro.movimento['invisivel'] > 0:
+                continue
+            ox, oy = outro.centro()
+            dist = math.hypot(ox - bx, oy - by)
+            if dist < menor and dist <= IA_DISTANCIA_VISAO and self._linha_de_visao(bx, by, ox, oy):
+                melhor, menor = outro, dist
+        return melhor, menor
+
+    def _objetivo(self, bot: Combatente) -> Optional[Tuple[float, float]]:
+        """Para onde o bot vai quando não há inimigo à vista."""
+        if bot.time == 'Q' and self.bomba_plantada:
+            return self.bomba_posicao
+        if bot.time == 'T' and self.bomba_dropada:
+            return self.bomba_drop_posicao
+        if bot.bomber and self.tiles_bombsite:
+            # Tile 322 mais próximo: é onde a bomba pode ser plantada
+            cx, cy = bot.centro()
+            tx, ty = min(self.tiles_bombsite, key=lambda t: (t[0] - cx) ** 2 + (t[1] - cy) ** 2)
+            return tx - TAMANHO_MULTIPLAYER / 2, ty - TAMANHO_MULTIPLAYER / 2
+        if not self.bomba_plantada and not any(b.vivo and b.time != bot.time for b in self.bots_sim):
+            # Só restam humanos no outro time: ir atrás do mais próximo para o round não travar
+            alvos = [c for c in self._todos() if c.vivo and c.time != bot.time]
+            if alvos:
+                alvo = min(alvos, key=lambda c: (c.x - bot.x) ** 2 + (c.y - bot.y) ** 2)
+                return alvo.x, alvo.y
+        if self.bombsites:
+            bx, by = self.bombsites[bot.bombsite_alvo % len(self.bombsites)]
+            return bx - TAMANHO_MULTIPLAYER / 2, by - TAMANHO_MULTIPLAYER / 2
+        return None
+
+    def _ir_para_objetivo(self, bot: Combatente):
+        destino = self._objetivo(bot)
+        if destino is None:
+            return
+
+        if bot.bomber and self._no_bombsite(bot):
+            bot.plantando_desde = self.tempo  # _processar_bomba completa o plantio
+            return
+        if bot.time == 'Q' and self.bomba_plantada and self._perto_bomba(bot):
+            return  # Parado em cima da bomba: _processar_bomba defusa
+
+        # Recalcular o caminho quando o destino muda ou o bot ficou preso
+        preso = self._verificar_preso(bot)
+        if (bot.destino != destino or not bot.caminho or preso) and \
+                self.tempo - bot.ultimo_caminho >= (0 if bot.destino != destino else IA_RECALC_INTERVALO):
+            bot.destino = destino
+            bot.caminho = self._calcular_caminho((bot.x, bot.y), destino)
+            bot.ultimo_caminho = self.tempo
+
+        if bot.caminho:
+            wx, wy = bot.caminho[0]
+            if math.hypot(wx - bot.x, wy - bot.y) <= VELOCIDADE:
+                bot.caminho.pop(0)
+            self._mover_para(bot, wx, wy)
+        else:
+            self._mover_para(bot, destino[0], destino[1])
+
+    def _verificar_preso(self, bot: Combatente) -> bool:
+        if self.tempo - bot.tempo_parado < IA_STUCK_TEMPO:
+            return False
+        movimento = math.hypot(bot.x - bot.pos_parado[0], bot.y - bot.pos_parado[1])
+        bot.pos_parado = (bot.x, bot.y)
+        bot.tempo_parado = self.tempo
+        return movimento < IA_STUCK_DISTANCIA
+
+    def _mover_para(self, bot: Combatente, x: float, y: float):
+        dx, dy = x - bot.x, y - bot.y
+        dist = math.hypot(dx, dy)
+        if dist < 0.5:
+            return
+        passo = min(VELOCIDADE, dist)
+        bot.x, bot.y = self._mover(bot.x, bot.y, dx / dist * passo, dy / dist * passo)
+
+    def _mover_combate(self, bot: Combatente, inimigo: Combatente):
+        """Strafe perpendicular ao inimigo, mantendo distância e fugindo de paredes."""
+        dx, dy = inimigo.x - bot.x, inimigo.y - bot.y
+        dist = math.hypot(dx, dy)
+        if dist < 1:
+            return
+        dir_x, dir_y = dx / dist, dy / dist
+
+        strafe = 1 if ((int(self.tempo) // 800) + bot.id) % 2 == 0 else -1
+        mover_x, mover_y = -dir_y * strafe, dir_x * strafe
+        if dist < 80:
+            mover_x -= dir_x * 0.5
+            mover_y -= dir_y * 0.5
+        elif dist > 150:
+            mover_x += dir_x * 0.3
+            mover_y += dir_y * 0.3
+
+        cx, cy = bot.centro()
+        for angulo in range(0, 360, 45):
+            rad = math.radians(angulo)
+            if self.tilemap.is_solid(cx + math.cos(rad) * 35, cy + math.sin(rad) * 35):
+                mover_x -= math.cos(rad) * 0.6
+                mover_y -= math.sin(rad) * 0.6
+
+        mag = math.hypot(mover_x, mover_y)
+        if mag > 0:
+            bot.x, bot.y = self._mover(bot.x, bot.y, mover_x / mag * VELOCIDADE, mover_y / mag * VELOCIDADE)
+
+    # ==================== MAPA ====================
+
+    def _mover(self, x: float, y: float, vel_x: float, vel_y: float) -> Tuple[float, float]:
+        rect = pygame.Rect(x, y, TAMANHO_MULTIPLAYER, TAMANHO_MULTIPLAYER)
+        novo_x, novo_y, _, _ = self.tilemap.resolver_colisao(rect, vel_x, vel_y)
+        return novo_x, novo_y
+
+    def _linha_de_visao(self, x1: float, y1: float, x2: float, y2: float) -> bool:
+        """Raycast a cada 8 px contra tiles sólidos (igual ao cliente)."""
+        dist = math.hypot(x2 - x1, y2 - y1)
+        if dist < 1:
+            return True
+        dx, dy = (x2 - x1) / dist, (y2 - y1) / dist
+        for i in range(1, int(dist / 8) + 1):
+            if self.tilemap.is_solid(x1 + dx * i * 8, y1 + dy * i * 8):
+                return False
+        return True
+
+    def _ponto_spawn(self, time_spawn: str, aleatorio: bool = True) -> Tuple[float, float]:
+        """Ponto na área Start_T/Start_Q (o centro para jogadores, como no cliente)."""
+        obj = self.tilemap.get_objeto(f"Start_{time_spawn}")
+        if not obj:
+            return self.tilemap.largura_pixels / 2, self.tilemap.altura_pixels / 2
+        if not aleatorio:
+            return obj['x'] + obj['width'] / 2, obj['y'] + obj['height'] / 2
+        return (obj['x'] + self.rng.random() * obj['width'],
+                obj['y'] + self.rng.random() * obj['height'])
+
+    def _encontrar_tiles_bombsite(self) -> List[Tuple[int, int]]:
+        """Centros (px) dos tiles 322 alcançáveis a partir do spawn do Time T."""
+        tl, ta = self.tilemap.tile_largura, self.tilemap.tile_altura
+        sx, sy = self._ponto_spawn('T', aleatorio=False)
+        alcancaveis = self._tiles_alcancaveis((int(sx // tl), int(sy // ta)))
+        return [(x * tl + tl // 2, y * ta + ta // 2)
+                for x, y in sorted(alcancaveis, key=lambda t: (t[1], t[0]))
+                if self.tilemap.get_tile(x, y) & 0x1FFFFFFF == TILE_BOMBSITE]
+
+    def _tiles_alcancaveis(self, inicio: Tuple[int, int]) -> set:
+        """Tiles livres ligados a `inicio` (BFS, 4 vizinhos)."""
+        if not self._tile_livre(*inicio):
+            return set()
+        vistos = {inicio}
+        fila = deque([inicio])
+        while fila:
+            x, y = fila.popleft()
+            for vizinho in ((x + 1, y), (x - 1, y), (x, y + 1), (x, y - 1)):
+                if vizinho not in vistos and self._tile_livre(*vizinho):
+                    vistos.add(vizinho)
+                    fila.append(vizinho)
+        return vistos
+
+    @staticmethod
+    def _agrupar_bombsites(tiles: List[Tuple[int, int]], distancia: float = 100) -> List[Tuple[int, int]]:
+        """Agrupa tiles de bombsite próximos e devolve o centro de cada área."""
+        areas = []
+        restantes = list(tiles)
+        while restantes:
+            area = [restantes.pop(0)]
+            mudou = True
+            while mudou:
+                mudou = False
+                for tile in restantes[:]:
+                    if any(math.hypot(tile[0] - a[0], tile[1] - a[1]) < distancia for a in area):
+                        area.append(tile)
+                        restantes.remove(tile)
+                        mudou = True
+            areas.append((sum(t[0] for t in area) // len(area), sum(t[1] for t in area) // len(area)))
+        return areas
+
+    def _tile_livre(self, tx: int, ty: int) -> bool:
+        if not (0 <= tx < self.tilemap.largura and 0 <= ty < self.tilemap.altura):
+            return False
+        tl, ta = self.tilemap.tile_largura, self.tilemap.tile_altura
+        return not self.tilemap.is_solid(tx * tl + tl / 2, ty * ta + ta / 2)
+
+    def _tile_livre_proximo(self, tx: int, ty: int, raio: int = 4) -> Optional[Tuple[int, int]]:
+        """Tile livre mais próximo (o centro de um bombsite pode ser parede)."""
+        for r in range(raio + 1):
+            livres = [(x, y)
+                      for x in range(tx - r, tx + r + 1)
+                      for y in range(ty - r, ty + r + 1)
+                      if max(abs(x - tx), abs(y - ty)) == r and self._tile_livre(x, y)]
+            if livres:
+                return min(livres, key=lambda t: (t[0] - tx) ** 2 + (t[1] - ty) ** 2)
+        return None
+
+    def _calcular_caminho(self, origem: Tuple[float, float],
+                          destino: Tuple[float, float]) -> List[Tuple[float, float]]:
+        """
+        Caminho em grade de tiles (BFS, 4 vizinhos) entre duas posições
+        (canto superior esquerdo do quadrado).
+
+        Returns:
+            Posições do quadrado centralizado em cada tile do caminho,
+            sem os pontos intermediários de trechos retos
+        """
+        tl, ta = self.tilemap.tile_largura, self.tilemap.tile_altura
+        meio = TAMANHO_MULTIPLAYER / 2
+        inicio = (int((origem[0] + meio) // tl), int((origem[1] + meio) // ta))
+        fim = self._tile_livre_proximo(int((destino[0] + meio) // tl), int((destino[1] + meio) // ta))
+        if fim is None or inicio == fim:
+            return []
+
+        anterior = {inicio: None}
+        fila = deque([inicio])
+        while fila:
+            atual = fila.popleft()
+            if atual == fim:
+                break
+            x, y = atual
+            for vizinho in ((x + 1, y), (x - 1, y), (x, y + 1), (x, y - 1)):
+                if vizinho not in anterior and self._tile_livre(*vizinho):
+                    anterior[vizinho] = atual
+                    fila.append(vizinho)
+
+        if fim not in anterior:
+            return []
+
+        tiles = []
+        atual = fim
+        while atual is not None:
+            tiles.append(atual)
+            atual = anterior[atual]
+        tiles.reverse()
+
+        # Manter só os tiles onde a direção muda (e o último)
+        pontos = []
+        for i in range(1, len(tiles)):
+            ultimo = i == len(tiles) - 1
+            if ultimo or (tiles[i + 1][0] - tiles[i][0], tiles[i + 1][1] - tiles[i][1]) != \
+                    (tiles[i][0] - tiles[i - 1][0], tiles[i][1] - tiles[i - 1][1]):
+                tx, ty = tiles[i]
+                pontos.append((tx * tl + (tl - TAMANHO_MULTIPLAYER) / 2,
+                               ty * ta + (ta - TAMANHO_MULTIPLAYER) / 2))
+        return pontos
@@ -13,8 +13,10 @@ import os
 import json
 from src.config import *
 from src.entities.particula import criar_explosao
-from src.utils.visual import criar_texto_flutuante
+from src.utils.visual import criar_texto_flutuante, desenhar_overlay_cor
 from src.utils.display_manager import convert_mouse_position
+from src.utils.fonts import obter_fonte, renderizar_texto
+from src.utils.saves import caminho_dados
 
 def carregar_upgrade_ampulheta():
     """
@@ -22,8 +24,8 @@ def carregar_upgrade_ampulheta():
     Retorna 0 se não houver upgrade.
     """
     try:
-        if os.path.exists("data/upgrades.json"):
-            with open("data/upgrades.json", "r") as f:
+        if os.path.exists(caminho_dados("upgrades.json")):
+            with open(caminho_dados("upgrades.json"), "r") as f:
                 upgrades = json.load(f)
                 return upgrades.get("ampulheta", 0)
         return 0
@@ -266,8 +268,8 @@ def desenhar_ampulheta_selecionada(tela, jogador, tempo_atual):
                           20, 2)
     
     # Desenhar contador de ampulhetas perto do jogador
-    fonte = pygame.font.SysFont("Arial", 20, True)
-    texto_amp = fonte.render(f"{jogador.ampulheta_uses}", True, (150, 200, 255))
+    fonte = obter_fonte("Arial", 20, True)
+    texto_amp = renderizar_texto(f"{jogador.ampulheta_uses}", fonte, (150, 200, 255))
     texto_rect = texto_amp.get_rect(center=(jogador.x + jogador.tamanho + 15, jogador.y - 10))
     tela.blit(texto_amp, texto_rect)
 
@@ -282,9 +284,7 @@ def desenhar_efeito_tempo_desacelerado(tela, ativo, tempo_atual):
     """
     if ativo:
         # Criar overlay azulado sutil
-        overlay = pygame.Surface((LARGURA, ALTURA_JOGO), pygame.SRCALPHA)
-        overlay.fill((100, 150, 255, 30))  # Azul transparente
-        tela.blit(overlay, (0, 0))
+        desenhar_overlay_cor(tela, (100, 150, 255), 30, (LARGURA, ALTURA_JOGO))
         
         # Efeito de ondas temporais nas bordas
         for i in range(3):
@@ -13,6 +13,7 @@ import os
 import json
 from src.config import *
 from src.items.chucky_invocation import criar_invocacao_chucky
+from src.utils.saves import caminho_dados
 
 def desenhar_amuleto_segurado(tela, jogador, tempo_atual):
     """
@@ -147,8 +148,8 @@ def carregar_upgrade_faca():
         int: Quantidade de Combat Knives/amuletos disponíveis
     """
     try:
-        if os.path.exists("data/upgrades.json"):
-            with open("data/upgrades.json", "r") as f:
+        if os.path.exists(caminho_dados("upgrades.json")):
+            with open(caminho_dados("upgrades.json"), "r") as f:
                 upgrades = json.load(f)
                 return upgrades.get("faca", 0)
         return 0
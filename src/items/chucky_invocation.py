@@ -11,6 +11,7 @@ import pygame
 import math
 import random
 from src.config import *
+from src.utils.rng import rng_jogo
 
 class ChuckyInvocation:
     """Classe para gerenciar a invocação do Chucky."""
@@ -766,8 +767,8 @@ class ChuckyInvocation:
 
     def _iniciar_movimento_chucky(self):
         """Inicia o movimento aleatório do Chucky."""
-        self.velocidade_x = random.uniform(-self.velocidade_max, self.velocidade_max)
-        self.velocidade_y = random.uniform(-self.velocidade_max, self.velocidade_max)
+        self.velocidade_x = rng_jogo.uniform(-self.velocidade_max, self.velocidade_max)
+        self.velocidade_y = rng_jogo.uniform(-self.velocidade_max, self.velocidade_max)
         self.mudanca_direcao_timer = self.intervalo_mudanca_direcao
 
     def _atualizar_movimento_chucky(self):
@@ -778,9 +779,9 @@ class ChuckyInvocation:
         # Mudar direção periodicamente
         self.mudanca_direcao_timer -= 1
         if self.mudanca_direcao_timer <= 0:
-            self.velocidade_x = random.uniform(-self.velocidade_max, self.velocidade_max)
-            self.velocidade_y = random.uniform(-self.velocidade_max, self.velocidade_max)
-            self.mudanca_direcao_timer = random.randint(8, 25)
+            self.velocidade_x = rng_jogo.uniform(-self.velocidade_max, self.velocidade_max)
+            self.velocidade_y = rng_jogo.uniform(-self.velocidade_max, self.velocidade_max)
+            self.mudanca_direcao_timer = rng_jogo.randint(8, 25)
 
         # Mover o Chucky
         self.x += self.velocidade_x
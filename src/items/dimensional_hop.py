@@ -13,6 +13,8 @@ import json
 from src.config import *
 from src.entities.particula import Particula
 from src.utils.display_manager import convert_mouse_position
+from src.utils.fonts import obter_fonte, renderizar_texto
+from src.utils.saves import caminho_dados
 
 
 class DimensionalHop:
@@ -277,8 +279,8 @@ def carregar_upgrade_dimensional_hop():
     Retorna 0 se não houver upgrade.
     """
     try:
-        if os.path.exists("data/upgrades.json"):
-            with open("data/upgrades.json", "r") as f:
+        if os.path.exists(caminho_dados("upgrades.json")):
+            with open(caminho_dados("upgrades.json"), "r") as f:
                 upgrades = json.load(f)
                 return upgrades.get("dimensional_hop", 0)
         return 0
@@ -305,7 +307,7 @@ def desenhar_dimensional_hop_selecionado(tela, jogador, tempo_atual):
 
     # Desenhar contador de usos perto do jogador
     if hasattr(jogador, 'dimensional_hop_uses'):
-        fonte = pygame.font.SysFont("Arial", 20, True)
-        texto_hop = fonte.render(f"{jogador.dimensional_hop_uses}", True, (200, 150, 255))
+        fonte = obter_fonte("Arial", 20, True)
+        texto_hop = renderizar_texto(f"{jogador.dimensional_hop_uses}", fonte, (200, 150, 255))
         texto_rect = texto_hop.get_rect(center=(jogador.x + jogador.tamanho + 15, jogador.y - 10))
         tela.blit(texto_hop, texto_rect)
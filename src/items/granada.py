@@ -15,6 +15,9 @@ from src.config import *
 from src.entities.particula import criar_explosao
 from src.utils.visual import criar_texto_flutuante
 from src.utils.display_manager import convert_mouse_position
+from src.utils.fonts import obter_fonte, renderizar_texto
+from src.utils.saves import caminho_dados
+from src.utils.rng import rng_jogo
 class Granada:
     """
     Classe para representar a granada que o jogador pode lançar.
@@ -40,8 +43,8 @@ class Granada:
             self.dy = 0
             
         # Adicionar um pouco de aleatoriedade à trajetória
-        self.dx += random.uniform(-0.5, 0.5)
-        self.dy += random.uniform(-0.5, 0.5)
+        self.dx += rng_jogo.uniform(-0.5, 0.5)
+        self.dy += rng_jogo.uniform(-0.5, 0.5)
         
         # Física da granada
         self.gravidade = 0.0  # Removendo a gravidade
@@ -298,8 +301,8 @@ def carregar_upgrade_granada():
     """
     try:
         # Verificar se o arquivo existe
-        if os.path.exists("data/upgrades.json"):
-            with open("data/upgrades.json", "r") as f:
+        if os.path.exists(caminho_dados("upgrades.json")):
+            with open(caminho_dados("upgrades.json"), "r") as f:
                 upgrades = json.load(f)
                 return upgrades.get("granada", 0)
         return 0
@@ -659,7 +662,7 @@ def desenhar_granada_selecionada(tela, jogador, tempo_atual):
                         tamanho_granada + 5, 2)
     
     # Desenhar contador de granadas perto do jogador
-    fonte = pygame.font.SysFont("Arial", 20, True)
-    texto_granada = fonte.render(f"{jogador.granadas}", True, (60, 255, 60))
+    fonte = obter_fonte("Arial", 20, True)
+    texto_granada = renderizar_texto(f"{jogador.granadas}", fonte, (60, 255, 60))
     texto_rect = texto_granada.get_rect(center=(jogador.x + jogador.tamanho + 15, jogador.y - 10))
     tela.blit(texto_granada, texto_rect)
\ No newline at end of file
@@ -8,10 +8,13 @@ Módulo de rede para multiplayer LAN.
 from .network_protocol import NetworkProtocol, PacketType
 from .game_server import GameServer
 from .game_client import GameClient
+from .network_simulator import NetworkConditions, NetworkConditionProxy
 
 __all__ = [
     'NetworkProtocol',
     'PacketType',
     'GameServer',
-    'GameClient'
+    'GameClient',
+    'NetworkConditions',
+    'NetworkConditionProxy'
 ]
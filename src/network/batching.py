@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Fila de saída do cliente: junta inputs e ações num único pacote BATCH.
+
+Em vez de montar e enviar um pacote JSON a cada chamada de
+`send_player_input`/`send_minigame_action`, o cliente acumula tudo o que
+foi produzido entre dois envios e manda um só pacote a cada 1/SEND_RATE
+segundos (ou na hora, em eventos críticos como um tiro).
+
+Dentro do lote:
+- inputs seguidos com as mesmas teclas viram uma única entrada
+  [primeiro_seq, quantidade, teclas] (o servidor expande de volta);
+- uma ação '*_input' dos minigames (posição contínua) substitui a última
+  ação da fila se ela for o mesmo '*_input' (só junta sem mudar a ordem
+  em relação às outras ações); as demais ações vão todas, em ordem.
+"""
+
+import threading
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from .config_network import MAX_QUEUED_INPUTS
+from .network_protocol import NetworkProtocol, PacketType
+
+
+class OutboundBatch:
+    """Acumula inputs e ações até o próximo envio."""
+
+    def __init__(self):
+        # [primeiro_seq, quantidade, teclas]
+        self.inputs: List[List[Any]] = []
+        self.mouse: Optional[Tuple[int, int, bool]] = None
+        self.actions: List[Dict[str, Any]] = []
+        self.lock = threading.Lock()
+
+    def add_input(self, seq: int, keys: Dict[str, bool],
+                  mouse_x: int, mouse_y: int, shooting: bool):
+        """Adiciona um input numerado (juntando com o anterior se as teclas forem iguais)."""
+        keys = {k: bool(v) for k, v in keys.items()}
+        with self.lock:
+            if self.inputs:
+                first_seq, count, last_keys = self.inputs[-1]
+                if last_keys == keys and first_seq + count == seq:
+                    self.inputs[-1][1] += 1
+                    self.mouse = (mouse_x, mouse_y, shooting)
+                    return
+            self.inputs.append([seq, 1, keys])
+            self.mouse = (mouse_x, mouse_y, shooting)
+
+    def add_action(self, action_data: Dict[str, Any]):
+        """Adiciona uma ação de minigame ('*_input' substitui o mesmo '*_input' no fim da fila)."""
+        name = action_data.get('action', '')
+        with self.lock:
+            if (name.endswith('_input') and self.actions
+                    and self.actions[-1].get('action') == name):
+                self.actions[-1] = action_data
+                return
+            self.actions.append(action_data)
+
+    def is_empty(self) -> bool:
+        with self.lock:
+            return not self.inputs and not self.actions
+
+    def depth(self) -> int:
+        """Quantidade de inputs e ações esperando o próximo envio."""
+        with self.lock:
+            return sum(entry[1] for entry in self.inputs) + len(self.actions)
+
+    def build_packet(self, player_id: int) -> Optional[bytes]:
+        """
+        Monta o pacote BATCH com tudo o que está pendente e esvazia o lote.
+
+        Args:
+            player_id: ID do jogador local
+
+        Returns:
+            Pacote pronto para envio, ou None se não houver nada pendente
+        """
+        with self.lock:
+            if not self.inputs and not self.actions:
+                return None
+
+            data: Dict[str, Any] = {'player_id': player_id}
+            if self.inputs:
+                data['inputs'] = self.inputs
+                mouse_x, mouse_y, shooting = self.mouse
+                data['mouse_x'] = mouse_x
+                data['mouse_y'] = mouse_y
+                data['shooting'] = shooting
+            if self.actions:
+                data['actions'] = self.actions
+
+            self.inputs = []
+            self.mouse = None
+            self.actions = []
+
+        return NetworkProtocol.create_packet(PacketType.BATCH, data)
+
+
+def expand_inputs(data: Dict[str, Any]) -> Iterator[Tuple[int, Dict[str, bool]]]:
+    """
+    Expande as entradas [primeiro_seq, quantidade, teclas] de um BATCH.
+    A quantidade de cada entrada é limitada ao tamanho da fila do servidor.
+
+    Yields:
+        (seq, teclas) de cada input, em ordem
+    """
+    for entry in data.get('inputs', []):
+        try:
+            first_seq, count, keys = entry
+            first_seq = int(first_seq)
+            count = int(count)
+        except (TypeError, ValueError):
+            continue
+        if not isinstance(keys, dict):
+            continue
+        for seq in range(first_seq, first_seq + max(0, min(count, MAX_QUEUED_INPUTS))):
+            yield seq, keys
@@ -0,0 +1,296 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Checksum do estado de jogo e detector de desync entre clientes.
+
+Cada cliente que simula a mesma partida (ex: minigame em lockstep) monta
+a cada tick um StateChecksum com o que decide o jogo: posições quantizadas,
+vidas, bomba, placar. O hash é incremental (cada campo entra no CRC32
+corrente), então não é preciso serializar o estado inteiro.
+
+O DesyncDetector guarda os últimos ticks, troca o hash com os outros
+clientes de tempos em tempos e, quando dois hashes do mesmo tick
+diferem, pede ao outro cliente os campos daquele tick e grava os dois
+lados num arquivo JSON (DESYNC_DUMP_DIR) para comparar depois. Só o
+primeiro tick divergente de cada jogador é gravado: depois dele, todos
+os ticks divergem.
+
+Quando a simulação roda no servidor (modo Bomb), o ConferenciaServidor
+compara o hash que vem no GAME_STATE com o mesmo checksum montado do
+espelho que o cliente mantém daquele estado.
+"""
+
+import json
+import os
+import struct
+import time
+import zlib
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Tuple
+
+from .config_network import DESYNC_HISTORY_TICKS, DESYNC_DUMP_DIR, DESYNC_SERVER_TOLERANCE
+
+# Casas decimais mantidas nas posições (0.1 px): abaixo disso é ruído de float
+ESCALA_POSICAO = 10
+
+
+def quantizar(valor: float, escala: int = ESCALA_POSICAO) -> int:
+    """Converte um float em inteiro com a precisão usada no checksum."""
+    return int(round(valor * escala))
+
+
+class StateChecksum:
+    """Hash incremental do estado de um tick, campo a campo."""
+
+    def __init__(self):
+        self.valor = 0
+        self.campos: List[Tuple[str, Any]] = []
+
+    def add(self, nome: str, valor: Any) -> 'StateChecksum':
+        """
+        Acrescenta um campo (int, bool, str, None ou lista/tupla deles).
+        Floats devem passar por add_pos/quantizar antes.
+
+        Args:
+            nome: Nome do campo (vai para o arquivo de desync)
+            valor: Valor do campo
+        """
+        self.campos.append((nome, valor))
+        self.valor = zlib.crc32(nome.encode('utf-8'), self.valor)
+        self.valor = zlib.crc32(self._bytes(valor), self.valor)
+        return self
+
+    def add_pos(self, nome: str, x: float, y: float) -> 'StateChecksum':
+        """Acrescenta uma posição, quantizada."""
+        return self.add(nome, (quantizar(x), quantizar(y)))
+
+    def digest(self) -> int:
+        """Hash de 32 bits de tudo o que foi acrescentado."""
+        return self.valor
+
+    def _bytes(self, valor: Any) -> bytes:
+        if isinstance(valor, bool) or valor is None:
+            return b'\x01' if valor else b'\x00'
+        if isinstance(valor, int):
+            return struct.pack('!q', valor)
+        if isinstance(valor, str):
+            return valor.encode('utf-8')
+        if isinstance(valor, (list, tuple)):
+            return b'\x1e'.join(self._bytes(v) for v in valor)
+        if isinstance(valor, float):
+            raise TypeError("floats entram no checksum quantizados (use quantizar/add_pos)")
+        return repr(valor).encode('utf-8')
+
+
+class DesyncDetector:
+    """Compara o checksum local com o dos outros clientes e grava os desyncs."""
+
+    def __init__(self, cliente, sessao: Any, nome: str = 'partida',
+                 historico: int = DESYNC_HISTORY_TICKS, pasta: Optional[str] = DESYNC_DUMP_DIR):
+        """
+        Args:
+            cliente: GameClient (envia e recebe pelas ações de minigame)
+            sessao: Identificador da partida (ex: seed), para ignorar sobras de outra
+            nome: Nome da partida nos arquivos de desync
+            historico: Ticks guardados para responder pedidos de estado
+            pasta: Onde gravar os desyncs (None = só avisar no console)
+        """
+        self.cliente = cliente
+        self.sessao = sessao
+        self.nome = nome
+        self.historico = historico
+        self.pasta = pasta
+
+        # {tick: (hash, campos)} dos últimos ticks
+        self.locais: 'OrderedDict[int, Tuple[int, List]]' = OrderedDict()
+        # Hashes que chegaram antes do tick local correspondente: {(pid, tick): hash}
+        self.remotos: Dict[Tuple[int, int], int] = {}
+        # Desyncs esperando os campos do outro lado: {(pid, tick): desync}
+        self.aguardando: Dict[Tuple[int, int], Dict] = {}
+        self.desyncs: List[Dict] = []
+        # Ticks divergentes vistos depois do primeiro, por jogador
+        self.divergencias: Dict[int, int] = {}
+
+    def registrar(self, tick: int, checksum: StateChecksum, enviar: bool = False):
+        """
+        Guarda o checksum de um tick (e o envia aos outros, se pedido).
+
+        Args:
+            tick: Tick simulado
+            checksum: Estado do tick
+            enviar: True nos ticks de troca de hash
+        """
+        valor = checksum.digest()
+        self.locais[tick] = (valor, checksum.campos)
+        while len(self.locais) > self.historico:
+            self.locais.popitem(last=False)
+
+        if enviar:
+            self._enviar({'action': 'checksum', 'tick': tick, 'hash': valor})
+
+        for (pid, t) in [k for k in self.remotos if k[1] == tick]:
+            self._comparar(pid, tick, self.remotos.pop((pid, t)))
+
+    def processar(self, action: Dict) -> bool:
+        """
+        Trata uma ação de checksum recebida.
+
+        Returns:
+            True se a ação era do detector (não precisa ir para o jogo)
+        """
+        nome = action.get('action')
+        if nome not in ('checksum', 'checksum_pedido', 'checksum_estado'):
+            return False
+        if action.get('sessao') != self.sessao:
+            return True  # Sobra de outra partida
+
+        pid = action.get('player_id')
+        tick = int(action.get('tick', -1))
+        if nome == 'checksum':
+            self._comparar(pid, tick, int(action['hash']))
+        elif nome == 'checksum_pedido':
+            local = self.locais.get(tick)
+            if local is not None:
+                self._enviar({'action': 'checksum_estado', 'tick': tick,
+                              'hash': local[0], 'campos': local[1]})
+        else:
+            desync = self.aguardando.pop((pid, tick), None)
+            if desync is not None:
+                desync['campos_remotos'] = action.get('campos')
+                self._gravar(desync)
+        return True
+
+    def _comparar(self, pid: int, tick: int, valor: int):
+        local = self.locais.get(tick)
+        if local is None:
+            # O tick local ainda não foi simulado (ou já saiu do histórico)
+            if not self.locais or tick > next(reversed(self.locais)):
+                self.remotos[(pid, tick)] = valor
+            return
+        if local[0] == valor:
+            return
+        if pid in self.divergencias:
+            self.divergencias[pid] += 1
+            return
+        self.divergencias[pid] = 0
+
+        desync = {
+            'partida': self.nome,
+            'sessao': self.sessao,
+            'tick': tick,
+            'local_id': self.cliente.local_player_id,
+            'remoto_id': pid,
+            'hash_local': local[0],
+            'hash_remoto': valor,
+            'campos_locais': local[1],
+            'campos_remotos': None,
+        }
+        self.desyncs.append(desync)
+        print(f"⚠️ [DESYNC] {self.nome}: tick {tick} diverge do jogador {pid} "
+              f"(local {local[0]:08x}, remoto {valor:08x})")
+
+        # Pedir os campos do outro lado para gravar o par
+        self.aguardando[(pid, tick)] = desync
+        self._enviar({'action': 'checksum_pedido', 'tick': tick}, critical=True)
+
+    def _enviar(self, dados: Dict, critical: bool = False):
+        self.cliente.send_minigame_action({**dados, 'sessao': self.sessao}, critical=critical)
+
+    def _gravar(self, desync: Dict):
+        gravar_desync(desync, self.pasta)
+
+
+class ConferenciaServidor:
+    """
+    Compara o espelho que o cliente mantém de um estado simulado no
+    servidor (ex: rounds, bomba e vidas do modo Bomb) com o hash que o
+    servidor manda junto do estado.
+
+    Acertos e respawns chegam em pacotes separados do GAME_STATE, então
+    uma divergência de poucos estados é normal; só uma que dure
+    `tolerancia` estados seguidos vira desync (avisado e gravado uma vez,
+    até os dois lados voltarem a bater).
+    """
+
+    def __init__(self, nome: str, tolerancia: int = DESYNC_SERVER_TOLERANCE,
+                 pasta: Optional[str] = DESYNC_DUMP_DIR):
+        """
+        Args:
+            nome: Nome da partida nos arquivos de desync
+            tolerancia: Estados seguidos divergindo antes de acusar o desync
+            pasta: Onde gravar os desyncs (None = só avisar no console)
+        """
+        self.nome = nome
+        self.tolerancia = tolerancia
+        self.pasta = pasta
+        self.seguidos = 0
+        self.desyncs: List[Dict] = []
+
+    def conferir(self, tick: int, hash_servidor: int, local: StateChecksum,
+                 servidor: StateChecksum, local_id: Any = None) -> bool:
+        """
+        Confere um estado recebido do servidor.
+
+        Args:
+            tick: Tick do servidor em que o estado foi montado
+            hash_servidor: Hash calculado no servidor
+            local: Checksum montado do espelho local
+            servidor: Checksum montado dos campos que vieram no pacote
+                      (campos do outro lado no arquivo de desync)
+            local_id: Id do jogador local (nome do arquivo)
+
+        Returns:
+            True se o espelho bate com o servidor
+        """
+        if local.digest() == hash_servidor:
+            self.seguidos = 0
+            return True
+
+        self.seguidos += 1
+        if self.seguidos != self.tolerancia:
+            return False
+
+        desync = {
+            'partida': self.nome,
+            'sessao': 'servidor',
+            'tick': tick,
+            'local_id': local_id,
+            'remoto_id': 'servidor',
+            'hash_local': local.digest(),
+            'hash_remoto': hash_servidor,
+            'campos_locais': local.campos,
+            'campos_remotos': json.loads(json.dumps(servidor.campos)),
+        }
+        self.desyncs.append(desync)
+        print(f"⚠️ [DESYNC] {self.nome}: espelho local diverge do servidor há {self.seguidos} estados "
+              f"(tick {tick}, local {local.digest():08x}, servidor {hash_servidor:08x})")
+        gravar_desync(desync, self.pasta)
+        return False
+
+
+def gravar_desync(desync: Dict, pasta: Optional[str]):
+    """Grava os dois lados do desync (campos lado a lado) num JSON."""
+    if not pasta:
+        return
+    # Mesma forma dos dois lados (tuplas locais viram listas, como as que vieram no JSON)
+    desync['campos_locais'] = json.loads(json.dumps(desync['campos_locais']))
+    locais = dict((nome, valor) for nome, valor in desync['campos_locais'])
+    remotos = dict((nome, valor) for nome, valor in (desync['campos_remotos'] or []))
+    desync['diferencas'] = sorted(
+        nome for nome in set(locais) | set(remotos) if locais.get(nome) != remotos.get(nome)
+    )
+
+    try:
+        os.makedirs(pasta, exist_ok=True)
+        arquivo = os.path.join(
+            pasta,
+            f"desync_{desync['partida']}_{int(time.time())}_t{desync['tick']}"
+            f"_{desync['local_id']}x{desync['remoto_id']}.json"
+        )
+        with open(arquivo, 'w', encoding='utf-8') as f:
+            json.dump(desync, f, indent=1, ensure_ascii=False)
+        print(f"💾 [DESYNC] Estados gravados em {arquivo} "
+              f"({len(desync['diferencas'])} campos diferentes)")
+    except OSError as e:
+        print(f"❌ [DESYNC] Não foi possível gravar o desync: {e}")
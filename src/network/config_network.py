@@ -5,20 +5,87 @@
 Configurações de rede para o multiplayer.
 """
 
+import os
+
 # Configurações do servidor
 DEFAULT_SERVER_PORT = 5555
 DEFAULT_MAX_PLAYERS = 4
+# Mapa do modo Bomb (simulado no servidor e usado na predição do cliente)
+MAP_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))),
+                        'map_tiled.tmx')
 
 # Configurações de sincronização
 TICK_RATE = 20  # Atualizações por segundo
 SEND_RATE = 20  # Envios por segundo
+# Ações de minigame que saem na hora (sem esperar o próximo envio) e nunca
+# são juntadas com outras: tiros, arremessos, dashes e trocas de estado
+CRITICAL_ACTIONS = frozenset({
+    'aim_shot',
+    'duel_shot', 'duel_dash',
+    'deadeye_shot',
+    'saber_throw', 'saber_recall', 'saber_dash', 'saber_defense', 'saber_color',
+    'boxfight_tiro', 'boxfight_parede', 'boxfight_arma',
+})
 
 # Timeouts
 CONNECTION_TIMEOUT = 5.0  # Segundos
 PING_INTERVAL = 1.0  # Intervalo entre pings (segundos)
 
-# Interpolação
-INTERPOLATION_SPEED = 0.3  # Velocidade de interpolação (0-1)
+# Interpolação de snapshots (jogadores remotos)
+INTERPOLATION_DELAY = 0.1  # Atraso mínimo de renderização (s) - ~2 estados do servidor
+INTERPOLATION_MAX_DELAY = 0.35  # Atraso máximo mesmo com muito jitter (s)
+INTERPOLATION_JITTER_FACTOR = 2.0  # Atraso extra = fator * jitter medido
+MAX_EXTRAPOLATION = 0.2  # Tempo máximo extrapolando sem snapshots novos (s)
+SNAPSHOT_BUFFER_SIZE = 64  # Snapshots guardados por entidade
+TELEPORT_DISTANCE = 100  # Salto entre snapshots tratado como teleporte/respawn (px), sem interpolar
+
+# Predição no cliente / movimento autoritativo
+PLAYER_MOVE_SPEED = 10.0  # Deslocamento por input (um frame de movimento no lobby)
+LOBBY_BOUNDS = (33, 73, 1417, 662)  # (min_x, min_y, max_x, max_y) da sala do lobby
+
+MAX_PENDING_INPUTS = 120  # Inputs não confirmados guardados no cliente (~2s a 60 FPS)
+MAX_INPUTS_PER_TICK = 10  # Inputs aplicados por jogador a cada tick do servidor
+MAX_QUEUED_INPUTS = 60  # Fila de inputs por jogador no servidor (~1s)
+
+# Compensação de lag (validação de acertos no servidor)
+LAG_COMP_HISTORY = 1.0  # Histórico de posições guardado por entidade (s)
+MAX_REWIND = 0.4  # Máximo que o servidor volta no tempo para validar um acerto (s)
+HIT_TOLERANCE = 4  # Folga (px) na caixa do alvo ao validar um acerto
+PLAYER_HITBOX_SIZE = 12  # Lado do quadrado do jogador (igual a TAMANHO_MULTIPLAYER)
+MAX_HIT_DAMAGE = 5  # Dano máximo aceito num único acerto
+MIN_ROUND_INTERVAL = 3.0  # Menor tempo entre dois respawns de round aceitos sem simulação (pausa do fim de round, s)
+
+# Gerência de interesse (AOI): só enviar a cada cliente o que está perto dele
+AOI_CELL_SIZE = 256  # Lado da célula da grade espacial (px)
+AOI_VIEW_RADIUS = 1700  # Raio padrão: diagonal da tela (câmera fixa do lobby vê a sala toda)
+AOI_MIN_RADIUS = 300  # Limites do raio informado pelo cliente
+AOI_MAX_RADIUS = 3000
+AOI_HYSTERESIS = 1.2  # Quem já está visível só sai após radius * AOI_HYSTERESIS
+
+# Telemetria de rede
+TELEMETRY_SAMPLE_WINDOW = 512  # Amostras de RTT/tick guardadas para os percentis
+TELEMETRY_DUMP_INTERVAL = 1.0  # Intervalo entre linhas do arquivo JSON lines (s)
+TELEMETRY_DUMP_PATH = None  # Ex: 'telemetria_{role}.jsonl' (None = não gravar)
+RTT_HISTOGRAM_EDGES = (5, 10, 20, 50, 100, 200, 500)  # Limites das faixas do histograma (ms)
+
+# Lockstep determinístico nos minigames (só inputs trafegam; estado conferido por hash)
+LOCKSTEP_MODES = ('Aim',)  # Modos jogados em lockstep (vazio = desligado)
+LOCKSTEP_TICK_RATE = 60  # Ticks por segundo (um frame dos minigames)
+LOCKSTEP_INPUT_DELAY = 8  # Ticks entre produzir um input e aplicá-lo (~133ms)
+LOCKSTEP_SEND_EVERY = 3  # Ticks de input juntados em cada envio
+LOCKSTEP_HASH_INTERVAL = 60  # Ticks entre trocas de hash do estado (1s)
+
+# Detector de desync (checksum do estado trocado entre clientes)
+DESYNC_HISTORY_TICKS = 240  # Ticks de estado guardados para montar o par divergente (~4s)
+DESYNC_DUMP_DIR = 'desyncs'  # Pasta dos arquivos de desync (None = só avisar no console)
+DESYNC_SERVER_TOLERANCE = 20  # Estados seguidos (~1s) com o espelho diferente do servidor antes de acusar
+
+# Replays gravados pelo servidor (ver src/utils/replay.py)
+REPLAY_DIR = None  # Pasta dos replays das partidas (None = não gravar)
+
+# Servidor de salas (um processo por sala)
+LOBBY_ROOM = 'lobby'  # Sala de quem conecta sem pedir uma (só o lobby, sem partida)
+ROOM_IDLE_TIMEOUT = 60.0  # Segundos que uma sala vazia continua viva
 
 # Tamanhos de buffer
 RECEIVE_BUFFER_SIZE = 4096
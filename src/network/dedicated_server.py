@@ -0,0 +1,299 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Servidor dedicado sem interface: hospeda partidas numa máquina sem display
+(ex: um Linux em nuvem), sem abrir janela nem inicializar o mixer.
+
+O servidor carrega o mapa (só tiles, colisões e spawn points) e, no modo
+Bomb, simula bots, bomba e rounds (src/game/simulacao_bomba.py); os
+clientes recebem o resultado no GAME_STATE. Como não há host para entrar no
+portal do lobby, a partida começa sozinha quando `--min-players` jogadores
+estão conectados há `--start-delay` segundos. Quando todos saem, o
+servidor volta a esperar jogadores.
+
+Várias partidas podem rodar ao mesmo tempo, cada uma num processo e numa
+porta (porta base, base + 1, ...).
+
+Uso:
+    python -m src.network.dedicated_server --port 5555 --mode Bomb --bots 6
+    python -m src.network.dedicated_server --matches 4 --min-players 2
+    python -m src.network.dedicated_server --record replays  (ver src/utils/replay.py)
+"""
+
+import os
+
+# Sem display nem áudio: precisa vir antes de qualquer import do pygame
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+
+import argparse
+import multiprocessing
+import random
+import signal
+import time
+from typing import Dict, List, Optional
+
+from .config_network import DEFAULT_SERVER_PORT, DEFAULT_MAX_PLAYERS, LOBBY_ROOM, MAP_PATH
+from .game_server import GameServer
+
+# Modos disponíveis no lobby (mesmos nomes dos portais)
+MODOS = ('Bomb', 'Aim', 'Duel', 'Sabers', 'Deadeye', 'BoxFight')
+
+# Mapa do modo Bomb (mesmo caminho usado por FaseMultiplayer)
+MAPA_PADRAO = MAP_PATH
+
+# Spawn points que o modo Bomb exige no mapa
+OBJETOS_OBRIGATORIOS = ('Start_T', 'Start_Q', 'Bomb_A', 'Bomb_B')
+
+# Mesmas cores dos bots criados pelo host no lobby
+CORES_BOTS = [(255, 0, 0), (0, 255, 0), (128, 0, 128), (255, 165, 0),
+              (0, 255, 255), (255, 105, 180), (255, 255, 0), (100, 200, 255)]
+
+INTERVALO_STATUS = 10.0  # Segundos entre linhas de status no console
+
+
+def criar_bots(quantidade: int) -> List[Dict]:
+    """
+    Monta a lista de bots enviada no GAME_START.
+
+    Args:
+        quantidade: Número de bots
+
+    Returns:
+        Lista de {'nome', 'cor'}, no mesmo formato do lobby
+    """
+    return [{'nome': f"Bot {i + 1}", 'cor': list(CORES_BOTS[i % len(CORES_BOTS)])}
+            for i in range(quantidade)]
+
+
+class DedicatedServer:
+    """Uma partida hospedada sem interface."""
+
+    def __init__(self, port: int = DEFAULT_SERVER_PORT, max_players: int = DEFAULT_MAX_PLAYERS,
+                 modo: str = 'Bomb', num_bots: int = 8, mapa: str = MAPA_PADRAO,
+                 min_players: int = 1, start_delay: float = 10.0, host: str = '0.0.0.0',
+                 nome: Optional[str] = None, conexoes=None, ocupacao=None,
+                 replay_dir: Optional[str] = None):
+        """
+        Args:
+            port: Porta TCP da partida
+            max_players: Máximo de jogadores humanos
+            modo: Modo de jogo iniciado automaticamente (None = sala sem partida, ex: lobby)
+            num_bots: Bots da partida (modo Bomb)
+            mapa: Arquivo .tmx carregado para validação e spawn points
+            min_players: Jogadores conectados para começar
+            start_delay: Espera (s) com jogadores suficientes antes de começar
+            host: Interface de rede
+            nome: Nome da partida nos logs
+            conexoes: Ponta de leitura de um Pipe com (socket, endereço, CONNECT)
+                      vindos do servidor de salas; se dado, não abre porta própria
+            ocupacao: multiprocessing.Value onde publicar o número de jogadores
+            replay_dir: Pasta onde gravar o replay de cada partida (None = REPLAY_DIR)
+        """
+        self.port = port
+        self.max_players = max_players
+        self.modo = modo
+        self.num_bots = num_bots
+        self.mapa = mapa
+        self.min_players = max(1, min_players)
+        self.start_delay = start_delay
+        self.host = host
+        self.nome = nome or f"partida:{port}"
+        self.conexoes = conexoes
+        self.ocupacao = ocupacao
+        self.replay_dir = replay_dir
+
+        self.server: Optional[GameServer] = None
+        self.tilemap = None
+        self.bots: List[Dict] = []
+        self.running = False
+
+        # Estado da partida: 'aguardando' ou 'em_jogo'
+        self.estado = 'aguardando'
+        self.pronto_desde: Optional[float] = None
+
+    def carregar(self) -> bool:
+        """
+        Carrega o mapa (sem imagens) e monta os bots.
+
+        Returns:
+            True se o mapa tem tudo que o modo precisa
+        """
+        if self.modo == 'Bomb':
+            from src.utils.tilemap import TileMap
+
+            self.tilemap = TileMap(self.mapa, carregar_imagens=False)
+            faltando = [nome for nome in OBJETOS_OBRIGATORIOS if not self.tilemap.get_objeto(nome)]
+            if faltando:
+                print(f"❌ [{self.nome}] Mapa {self.mapa} sem objetos: {', '.join(faltando)}")
+                return False
+            self.bots = criar_bots(self.num_bots)
+        else:
+            self.bots = []
+
+        print(f"🗺️ [{self.nome}] Modo {self.modo or 'livre'}, {len(self.bots)} bots")
+        return True
+
+    def run(self):
+        """Executa a partida até stop() ou SIGINT/SIGTERM."""
+        if not self.carregar():
+            return
+
+        self.server = GameServer(host=self.host, port=self.port, max_players=self.max_players)
+        if self.replay_dir:
+            self.server.replay_dir = self.replay_dir
+        if self.conexoes is not None:
+            # Sala do servidor de salas: o cliente precisa saber onde caiu
+            self.server.room = self.modo or LOBBY_ROOM
+        if not self.server.start(listen=self.conexoes is None):
+            print(f"❌ [{self.nome}] Não foi possível abrir a porta {self.port}")
+            return
+
+        self.running = True
+        proximo_status = time.time()
+        try:
+            while self.running:
+                agora = time.time()
+                self._receber_conexoes()
+                self._atualizar_partida(agora)
+
+                if agora >= proximo_status:
+                    self._imprimir_status()
+                    proximo_status = agora + INTERVALO_STATUS
+
+                time.sleep(0.1)
+        finally:
+            self.server.stop()
+
+    def stop(self):
+        """Pede para o loop principal terminar."""
+        self.running = False
+
+    def _receber_conexoes(self):
+        """Adota as conexões repassadas pelo servidor de salas e publica a ocupação."""
+        if self.conexoes is not None:
+            try:
+                while self.conexoes.poll():
+                    client_socket, address, first_packet = self.conexoes.recv()
+                    self.server.adopt_connection(client_socket, address, first_packet)
+            except (EOFError, OSError):
+                # Servidor de salas fechou o pipe: encerrar a sala
+                self.running = False
+
+        if self.ocupacao is not None:
+            with self.server.players_lock:
+                self.ocupacao.value = len(self.server.players)
+
+    def _atualizar_partida(self, agora: float):
+        """Começa a partida quando há jogadores suficientes e reinicia quando todos saem."""
+        if self.modo is None:
+            return
+
+        conectados = len(self.server.get_connected_players())
+
+        if self.estado == 'em_jogo':
+            if conectados == 0:
+                print(f"🔄 [{self.nome}] Todos saíram, aguardando nova partida")
+                self.server.stop_simulation()
+                self.server.reset_team_selections()
+                self.estado = 'aguardando'
+                self.pronto_desde = None
+            return
+
+        if conectados < self.min_players:
+            self.pronto_desde = None
+            return
+
+        if self.pronto_desde is None:
+            self.pronto_desde = agora
+            print(f"⏳ [{self.nome}] {conectados} jogadores, começando em {self.start_delay:.0f}s")
+            return
+
+        if agora - self.pronto_desde >= self.start_delay:
+            seed = random.randint(0, 2**31)
+            if self.modo == 'Bomb':
+                # Bots, bomba e rounds rodam aqui; os clientes só desenham
+                self.server.start_bomb_simulation(self.tilemap, seed)
+            self.server.broadcast_game_start(modo=self.modo, seed=seed, bots=self.bots)
+            self.estado = 'em_jogo'
+
+    def _imprimir_status(self):
+        info = self.server.get_server_info()
+        tick = self.server.telemetry.snapshot('status')['tick_ms']
+        print(f"📊 [{self.nome}] {self.estado} | {info['players_connected']}/{info['max_players']} jogadores | "
+              f"tick médio {tick['mean']:.2f}ms (max {tick['max']:.2f}ms)")
+
+
+def _executar_partida(kwargs: Dict):
+    """Alvo de cada processo: roda uma partida e encerra com SIGTERM/SIGINT."""
+    partida = DedicatedServer(**kwargs)
+
+    def _parar(signum, frame):
+        partida.stop()
+
+    signal.signal(signal.SIGTERM, _parar)
+    signal.signal(signal.SIGINT, _parar)
+    partida.run()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Servidor dedicado sem interface")
+    parser.add_argument('--host', default='0.0.0.0', help="Interface de rede")
+    parser.add_argument('--port', type=int, default=DEFAULT_SERVER_PORT, help="Porta da primeira partida")
+    parser.add_argument('--max-players', type=int, default=DEFAULT_MAX_PLAYERS)
+    parser.add_argument('--mode', choices=MODOS, default='Bomb', help="Modo de jogo")
+    parser.add_argument('--bots', type=int, default=8, help="Bots por partida (modo Bomb)")
+    parser.add_argument('--map', default=MAPA_PADRAO, help="Arquivo .tmx do modo Bomb")
+    parser.add_argument('--min-players', type=int, default=1, help="Jogadores para começar")
+    parser.add_argument('--start-delay', type=float, default=10.0,
+                        help="Espera (s) com jogadores suficientes antes de começar")
+    parser.add_argument('--matches', type=int, default=1,
+                        help="Partidas simultâneas (uma por processo, portas seguidas)")
+    parser.add_argument('--record', metavar='PASTA', default=None,
+                        help="Gravar o replay de cada partida nesta pasta")
+    args = parser.parse_args()
+
+    partidas = [{
+        'host': args.host,
+        'port': args.port + i,
+        'max_players': args.max_players,
+        'modo': args.mode,
+        'num_bots': args.bots,
+        'mapa': args.map,
+        'min_players': args.min_players,
+        'start_delay': args.start_delay,
+        'replay_dir': args.record,
+    } for i in range(max(1, args.matches))]
+
+    if len(partidas) == 1:
+        _executar_partida(partidas[0])
+        return
+
+    processos = [multiprocessing.Process(target=_executar_partida, args=(p,), name=f"partida:{p['port']}")
+                 for p in partidas]
+    for processo in processos:
+        processo.start()
+
+    def _repassar_sigterm(signum, frame):
+        # Cada partida trata o SIGTERM e fecha o servidor de forma limpa
+        for processo in processos:
+            if processo.is_alive():
+                processo.terminate()
+
+    signal.signal(signal.SIGTERM, _repassar_sigterm)
+    print(f"🌐 {len(processos)} partidas nas portas {args.port}-{args.port + len(processos) - 1}")
+
+    try:
+        for processo in processos:
+            processo.join()
+    except KeyboardInterrupt:
+        # O Ctrl+C também chega nos filhos; só esperar eles terminarem
+        for processo in processos:
+            processo.join(timeout=5.0)
+            if processo.is_alive():
+                processo.terminate()
+
+
+if __name__ == '__main__':
+    main()
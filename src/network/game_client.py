@@ -6,11 +6,17 @@ Cliente de jogo para multiplayer LAN.
 Conecta ao servidor e sincroniza o estado do jogo.
 """
 
+import math
 import socket
 import threading
 import time
-from typing import Dict, Optional, Callable, Any
+from typing import Dict, Optional, Callable, Any, Tuple
 from .network_protocol import NetworkProtocol, PacketType
+from .prediction import ClientPrediction
+from .interpolation import InterpolationSet, SnapshotBuffer
+from .batching import OutboundBatch
+from .config_network import CRITICAL_ACTIONS, SEND_RATE, TELEPORT_DISTANCE
+from .telemetry import NetworkTelemetry
 
 
 class RemotePlayer:
@@ -28,11 +34,24 @@ class RemotePlayer:
         self.health = 5
         self.alive = True
         self.score = 0
+        # False fora da área de interesse (AOI): não desenhar nem acertar
+        self.visible = True
 
-        # Interpolação
+        # Último estado recebido e buffer de snapshots para interpolação
         self.target_x = 0
         self.target_y = 0
-        self.interpolation_speed = 0.3
+        self.snapshots = SnapshotBuffer()
+
+    def push_snapshot(self, x: float, y: float, sent_time: Optional[float] = None):
+        """Registra uma posição recebida do servidor."""
+        self.target_x = x
+        self.target_y = y
+        self.snapshots.push(x, y, sent_time)
+
+    def hide(self):
+        """Saiu da área de interesse: esconde e esquece as posições antigas."""
+        self.visible = False
+        self.snapshots.clear()
 
 
 class GameClient:
@@ -54,6 +73,10 @@ class GameClient:
         self.local_player_id = None
         self.local_player_name = "Player"
         self.local_player_pos = None  # (x, y) posição inicial recebida do servidor
+        self.room = None  # Sala atual num servidor de salas (None = servidor do host)
+
+        # Predição do movimento local e reconciliação com o servidor
+        self.prediction = ClientPrediction()
 
         # Jogadores remotos
         self.remote_players: Dict[int, RemotePlayer] = {}
@@ -72,6 +95,15 @@ class GameClient:
         # Thread de recepção
         self.receive_thread = None
 
+        # Fila de saída: inputs e ações vão juntos num BATCH a cada 1/SEND_RATE s
+        self.outbox = OutboundBatch()
+        self.send_interval = 1.0 / SEND_RATE
+        self.send_lock = threading.Lock()  # Envios vêm do jogo e da thread de envio
+        self.send_thread = None
+
+        # Métricas de rede (overlay e arquivo JSON lines)
+        self.telemetry = NetworkTelemetry('client')
+
         # Callbacks para eventos
         self.callbacks = {
             'on_connected': None,
@@ -83,12 +115,27 @@ class GameClient:
             'on_team_status': None,  # Callback quando recebe status de times
             'on_all_ready': None,  # Callback quando todos escolheram time
             'on_minigame_action': None,  # Callback para ações de minigame
+            'on_bullet_hit': None,  # Callback para acertos validados pelo servidor
         }
 
         # Fila thread-safe de ações de minigame recebidas
         self.minigame_actions = []
         self.minigame_actions_lock = threading.Lock()
 
+        # Fila thread-safe de acertos validados (ou rejeitados) pelo servidor
+        self.bullet_hits = []
+        self.bullet_hits_lock = threading.Lock()
+
+        # Último raio de visão informado ao servidor (filtragem por AOI)
+        self.view_radius_sent: Optional[float] = None
+
+        # Horário do servidor no último GAME_STATE
+        self.last_state_time: Optional[float] = None
+
+        # Posições dos inimigos do GAME_STATE (bots da simulação), interpoladas
+        # como as dos jogadores remotos
+        self.enemy_snapshots = InterpolationSet()
+
         # Status de seleção de times
         self.team_status = {}  # {player_id: {'team': 'T'/'Q', 'name': 'nome'}}
 
@@ -96,7 +143,7 @@ class GameClient:
         self.latency = 0.0
         self.last_ping_time = 0.0
 
-    def connect(self, host: str, port: int, player_name: str) -> bool:
+    def connect(self, host: str, port: int, player_name: str, room: Optional[str] = None) -> bool:
         """
         Conecta ao servidor.
 
@@ -104,6 +151,7 @@ class GameClient:
             host: Endereço do servidor
             port: Porta do servidor
             player_name: Nome do jogador
+            room: Sala desejada, quando o servidor é um servidor de salas (opcional)
 
         Returns:
             True se conectado com sucesso
@@ -118,6 +166,9 @@ class GameClient:
             # Conectar
             self.socket.connect((host, port))
 
+            # Desativar Nagle: os lotes já são agrupados pelo cliente
+            self.socket.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+
             self.server_host = host
             self.server_port = port
             self.local_player_name = player_name
@@ -129,13 +180,17 @@ class GameClient:
             self.socket.settimeout(None)
 
             # Enviar pacote de conexão
-            connect_packet = NetworkProtocol.create_connect_packet(player_name)
-            self.socket.sendall(connect_packet)
+            connect_packet = NetworkProtocol.create_connect_packet(player_name, room)
+            self._send(connect_packet)
 
             # Iniciar thread de recepção
             self.receive_thread = threading.Thread(target=self._receive_loop, daemon=True)
             self.receive_thread.start()
 
+            # Iniciar thread de envio dos lotes
+            self.send_thread = threading.Thread(target=self._send_loop, daemon=True)
+            self.send_thread.start()
+
             # Chamar callback
             if self.callbacks['on_connected']:
                 self.callbacks['on_connected']()
@@ -159,10 +214,11 @@ class GameClient:
         print("👋 Desconectando do servidor...")
 
         try:
-            # Enviar pacote de desconexão
+            # Enviar o que ainda estava na fila e o pacote de desconexão
             if self.local_player_id:
+                self.flush()
                 disconnect_packet = NetworkProtocol.create_disconnect_packet(self.local_player_id)
-                self.socket.sendall(disconnect_packet)
+                self._send(disconnect_packet)
         except:
             pass
 
@@ -205,6 +261,49 @@ class GameClient:
             if self.callbacks['on_disconnected']:
                 self.callbacks['on_disconnected']()
 
+    def _send(self, packet: bytes):
+        """Envia um pacote já montado (serializado entre as threads)."""
+        with self.send_lock:
+            self.socket.sendall(packet)
+        self.telemetry.record_sent(packet)
+
+    def flush(self):
+        """Envia agora o lote pendente de inputs e ações, se houver."""
+        if not self.local_player_id:
+            return
+        # Montar e enviar sob a mesma trava: com as duas threads chamando
+        # flush, um lote montado antes não pode sair depois de um mais novo
+        with self.send_lock:
+            packet = self.outbox.build_packet(self.local_player_id)
+            if not packet:
+                return
+            self.socket.sendall(packet)
+        self.telemetry.record_sent(packet)
+
+    def _send_loop(self):
+        """Loop de envio: descarrega a fila de saída a cada 1/SEND_RATE segundos."""
+        next_send = time.time()
+        while self.connected:
+            next_send += self.send_interval
+            delay = next_send - time.time()
+            if delay > 0:
+                time.sleep(delay)
+            else:
+                next_send = time.time()  # Atrasou: não tentar compensar
+
+            self.telemetry.set_queue_depth('outbox', self.outbox.depth())
+            self.telemetry.set_queue_depth('unacked_inputs', len(self.prediction.pending))
+
+            try:
+                self.flush()
+            except Exception as e:
+                if self.connected:
+                    print(f"❌ Erro ao enviar lote: {e}")
+                    self.connected = False
+                break
+
+            self.telemetry.maybe_dump()
+
     def _receive_packet(self) -> Optional[bytes]:
         """
         Recebe um pacote completo do socket.
@@ -245,6 +344,7 @@ class GameClient:
         Args:
             packet_data: Dados do pacote
         """
+        self.telemetry.record_received(packet_data)
         parsed = NetworkProtocol.parse_packet(packet_data)
         if not parsed:
             return
@@ -288,6 +388,15 @@ class GameClient:
             # Ação de minigame recebida de outro jogador
             self._handle_minigame_action(data)
 
+        elif packet_type == PacketType.BULLET_HIT:
+            # Resultado da validação de um acerto
+            self._handle_bullet_hit(data)
+
+        elif packet_type == PacketType.BATCH:
+            # Lote de ações de minigame de outro jogador
+            for action in data.get('actions', []):
+                self._handle_minigame_action({**action, 'player_id': data.get('player_id')})
+
     def _handle_full_sync(self, data: Dict):
         """
         Processa sincronização completa.
@@ -297,6 +406,7 @@ class GameClient:
         """
         # Armazenar ID do jogador local
         self.local_player_id = data.get('player_id')
+        self.room = data.get('room')
         print(f"🎮 ID do jogador local: {self.local_player_id}")
 
         # Processar jogadores
@@ -309,13 +419,13 @@ class GameClient:
                 # Armazenar posição do jogador local
                 if player_id == self.local_player_id:
                     self.local_player_pos = (player_data['x'], player_data['y'])
+                    self.prediction.reset(player_data['x'], player_data['y'])
                     continue
 
                 player = RemotePlayer(player_id, player_data['name'])
                 player.x = player_data['x']
                 player.y = player_data['y']
-                player.target_x = player.x
-                player.target_y = player.y
+                player.push_snapshot(player.x, player.y, data.get('server_time'))
                 player.health = player_data['health']
                 player.alive = player_data['alive']
                 player.score = player_data.get('score', 0)
@@ -340,29 +450,77 @@ class GameClient:
             for player_data in data.get('players', []):
                 player_id = player_data['id']
 
-                # Ignorar jogador local
+                # Jogador local: reconciliar a predição com o estado autoritativo
                 if player_id == self.local_player_id:
+                    if 'ack' in player_data:
+                        self.prediction.reconcile(player_data['x'], player_data['y'],
+                                                  player_data['ack'], player_data.get('mov'))
                     continue
 
                 player = self.remote_players.get(player_id)
                 if player:
-                    # Atualizar posição alvo (para interpolação)
-                    player.target_x = player_data['x']
-                    player.target_y = player_data['y']
+                    if not player.visible:
+                        # Voltou para a AOI: aparece direto na posição nova
+                        player.visible = True
+                        player.x, player.y = player_data['x'], player_data['y']
+                    # Guardar snapshot com o horário do servidor (para interpolação)
+                    player.push_snapshot(player_data['x'], player_data['y'],
+                                         data.get('server_time'))
                     player.health = player_data['health']
                     player.alive = player_data['alive']
 
+            # Saíram da AOI: esconder até voltarem num GAME_STATE
+            for player_id in data.get('left_players', []):
+                player = self.remote_players.get(player_id)
+                if player:
+                    player.hide()
+
         # Atualizar estado do jogo
         with self.game_state_lock:
             if 'enemies' in data:
+                self._push_enemy_snapshots(data['enemies'], data.get('server_time'))
                 self.game_state['enemies'] = data['enemies']
+            for enemy_id in data.get('left_enemies', []):
+                self.enemy_snapshots.remove(enemy_id)
             if 'bullets' in data:
                 self.game_state['bullets'] = data['bullets']
+            if 'bomb' in data:
+                self.game_state['bomb'] = data['bomb']
+        self.last_state_time = data.get('server_time', self.last_state_time)
 
         # Chamar callback
         if self.callbacks['on_game_state_update']:
             self.callbacks['on_game_state_update'](data)
 
+    def _push_enemy_snapshots(self, enemies, server_time: Optional[float]):
+        """
+        Guarda as posições dos inimigos recebidos para interpolação.
+        Um salto maior que TELEPORT_DISTANCE (respawn) recomeça o buffer.
+
+        Args:
+            enemies: Lista 'enemies' do GAME_STATE (chamar com game_state_lock)
+            server_time: Horário do servidor no GAME_STATE
+        """
+        previous = {e.get('id'): e for e in self.game_state.get('enemies', [])}
+        for enemy in enemies:
+            enemy_id = enemy.get('id')
+            if enemy_id is None or 'x' not in enemy or 'y' not in enemy:
+                continue
+            before = previous.get(enemy_id)
+            if before is not None and math.hypot(enemy['x'] - before['x'],
+                                                 enemy['y'] - before['y']) > TELEPORT_DISTANCE:
+                self.enemy_snapshots.remove(enemy_id)
+            self.enemy_snapshots.push(enemy_id, enemy['x'], enemy['y'], server_time)
+
+    def get_enemy_position(self, enemy_id) -> Optional[Tuple[float, float]]:
+        """
+        Posição interpolada de um inimigo do GAME_STATE (bot da simulação).
+
+        Returns:
+            (x, y), ou None se ainda não houver snapshots dele
+        """
+        return self.enemy_snapshots.sample(enemy_id)
+
     def _handle_player_update(self, data: Dict):
         """
         Processa atualização de um jogador.
@@ -380,8 +538,7 @@ class GameClient:
                 player = RemotePlayer(player_id, data.get('name', f'Player{player_id}'))
                 player.x = data.get('x', 0)
                 player.y = data.get('y', 0)
-                player.target_x = player.x
-                player.target_y = player.y
+                player.push_snapshot(player.x, player.y, data.get('server_time'))
                 player.health = data.get('health', 5)
                 player.alive = data.get('alive', True)
 
@@ -395,8 +552,9 @@ class GameClient:
             else:
                 # Atualizar jogador existente
                 player = self.remote_players[player_id]
-                player.target_x = data.get('x', player.x)
-                player.target_y = data.get('y', player.y)
+                player.push_snapshot(data.get('x', player.target_x),
+                                     data.get('y', player.target_y),
+                                     data.get('server_time'))
                 player.health = data.get('health', player.health)
                 player.alive = data.get('alive', player.alive)
 
@@ -430,6 +588,7 @@ class GameClient:
         timestamp = data.get('timestamp', 0)
         if timestamp > 0:
             self.latency = (time.time() - timestamp) * 1000  # Em milissegundos
+            self.telemetry.record_rtt(self.latency)
 
     def _handle_game_start(self, data: Dict):
         """
@@ -484,21 +643,134 @@ class GameClient:
         if self.callbacks.get('on_minigame_action'):
             self.callbacks['on_minigame_action'](data)
 
-    def send_minigame_action(self, action_data: dict):
+    def _handle_bullet_hit(self, data: Dict):
+        """
+        Processa o resultado de um acerto validado pelo servidor.
+
+        Args:
+            data: Dados do acerto ('target_id', 'shooter_id', 'damage', 'confirmed', 'health')
+        """
+        with self.players_lock:
+            player = None
+            if data.get('target_type', 'player') == 'player':
+                player = self.remote_players.get(data.get('target_id'))
+            if player and data.get('confirmed') and 'health' in data:
+                player.health = data['health']
+                player.alive = data['health'] > 0
+
+        with self.bullet_hits_lock:
+            self.bullet_hits.append(data)
+
+        if self.callbacks.get('on_bullet_hit'):
+            self.callbacks['on_bullet_hit'](data)
+
+    def get_bullet_hits(self):
+        """Retorna e limpa a fila de acertos recebidos do servidor."""
+        with self.bullet_hits_lock:
+            hits = list(self.bullet_hits)
+            self.bullet_hits.clear()
+            return hits
+
+    def get_view_time(self, target_id: int, target_type: str = 'player') -> Optional[float]:
+        """
+        Instante (relógio do servidor) em que o jogador remoto (ou o bot)
+        atingido está sendo desenhado agora. Vai junto com os acertos para
+        a compensação de lag.
+
+        Args:
+            target_id: ID do jogador (ou do bot) atingido
+            target_type: 'player' ou 'bot'
+
+        Returns:
+            Horário do servidor, ou None se ainda não houver snapshots dele
+        """
+        if target_type == 'bot':
+            buffer = self.enemy_snapshots.buffers.get(target_id)
+        else:
+            with self.players_lock:
+                player = self.remote_players.get(target_id)
+                buffer = player.snapshots if player else None
+        if buffer is None:
+            return None
+        return buffer.sender_time_at()
+
+    def send_bullet_hit(self, target_id: int, hit_x: float, hit_y: float,
+                        damage: int = 1, bullet_id: int = 0, target_type: str = 'player'):
+        """
+        Informa ao servidor que um tiro local acertou um jogador remoto
+        (ou um bot simulado no servidor).
+        O dano só é aplicado depois que o servidor valida o acerto.
+
+        Args:
+            target_id: ID do jogador (ou do bot) atingido
+            hit_x, hit_y: Ponto de impacto
+            damage: Dano do tiro
+            bullet_id: ID do tiro (opcional)
+            target_type: 'player' ou 'bot'
         """
-        Envia uma ação de minigame para o servidor (que faz relay para os outros).
+        if not self.connected or not self.local_player_id:
+            return
+
+        try:
+            self.flush()  # Manter a ordem com o que já está na fila
+            view_time = self.get_view_time(target_id, target_type)
+            packet = NetworkProtocol.create_bullet_hit_packet(bullet_id, target_id, target_type, {
+                'x': hit_x,
+                'y': hit_y,
+                'damage': damage,
+                'view_time': view_time,
+            })
+            self._send(packet)
+        except Exception as e:
+            print(f"❌ Erro ao enviar acerto: {e}")
+            self.connected = False
+
+    def send_respawn(self, health: int = 5, round_number: int = 0):
+        """
+        Avisa o servidor que o jogador local renasceu (novo round). Sem
+        simulação no servidor, ele só aceita num round novo ou depois de
+        uma morte que ele mesmo confirmou, com a vida limitada à da classe.
+
+        Args:
+            health: Vida após o respawn
+            round_number: Round que está começando
+        """
+        if not self.connected or not self.local_player_id:
+            return
+
+        try:
+            self.flush()  # Manter a ordem com o que já está na fila
+            packet = NetworkProtocol.create_packet(PacketType.PLAYER_RESPAWN, {
+                'player_id': self.local_player_id,
+                'health': health,
+                'round': round_number,
+            })
+            self._send(packet)
+        except Exception as e:
+            print(f"❌ Erro ao enviar respawn: {e}")
+            self.connected = False
+
+    def send_minigame_action(self, action_data: dict, critical: bool = False):
+        """
+        Enfileira uma ação de minigame para o servidor (que faz relay para os outros).
 
         Args:
             action_data: Dados da ação (ex: {'action': 'aim_shot', 'mx': 100, 'my': 200})
+            critical: Envia o lote na hora em vez de esperar o próximo envio
+                      (as ações de CRITICAL_ACTIONS sempre são)
         """
         if not self.connected or not self.local_player_id:
             return
 
+        # Horário do envio, usado por quem recebe para interpolar posições
+        action_data = {'t': time.time(), **action_data}
+        self.outbox.add_action(action_data)
+
+        if not critical and action_data.get('action') not in CRITICAL_ACTIONS:
+            return
+
         try:
-            packet = NetworkProtocol.create_minigame_action_packet(
-                self.local_player_id, action_data
-            )
-            self.socket.sendall(packet)
+            self.flush()
         except Exception as e:
             print(f"Erro ao enviar minigame action: {e}")
             self.connected = False
@@ -510,24 +782,27 @@ class GameClient:
             self.minigame_actions.clear()
             return actions
 
-    def send_team_selection(self, team: str, player_name: str):
+    def send_team_selection(self, team: str, player_name: str, player_class: Optional[str] = None):
         """
         Envia a seleção de time para o servidor.
 
         Args:
             team: Time escolhido ('T' ou 'Q')
             player_name: Nome do jogador
+            player_class: Classe escolhida (o servidor tira dela a vida máxima)
         """
         if not self.connected or not self.local_player_id:
             return
 
         try:
+            self.flush()  # Manter a ordem com o que já está na fila
             packet = NetworkProtocol.create_team_select_packet(
                 self.local_player_id,
                 team,
-                player_name
+                player_name,
+                player_class
             )
-            self.socket.sendall(packet)
+            self._send(packet)
             print(f"[CLIENT] Enviado seleção de time: {team}")
         except Exception as e:
             print(f"❌ Erro ao enviar seleção de time: {e}")
@@ -539,7 +814,7 @@ class GameClient:
 
     def send_player_input(self, keys: Dict[str, bool], mouse_x: int, mouse_y: int, shooting: bool):
         """
-        Envia input do jogador para o servidor.
+        Enfileira o input do jogador para o próximo lote enviado ao servidor.
 
         Args:
             keys: Estado das teclas
@@ -550,18 +825,27 @@ class GameClient:
         if not self.connected or not self.local_player_id:
             return
 
-        try:
-            packet = NetworkProtocol.create_player_input_packet(
-                self.local_player_id,
-                keys,
-                mouse_x,
-                mouse_y,
-                shooting
-            )
-            self.socket.sendall(packet)
-        except Exception as e:
-            print(f"❌ Erro ao enviar input: {e}")
-            self.connected = False
+        # Aplicar o movimento localmente e numerar o input
+        seq = self.prediction.record_input(keys)
+
+        # Vai no próximo lote (ver _send_loop)
+        self.outbox.add_input(seq, keys, mouse_x, mouse_y, shooting)
+
+    def get_predicted_position(self) -> Optional[Tuple[float, float]]:
+        """
+        Retorna a posição prevista do jogador local.
+
+        Returns:
+            (x, y) já com os inputs não confirmados aplicados, ou None antes do FULL_SYNC
+        """
+        return self.prediction.get_position()
+
+    def get_predicted_state(self) -> Any:
+        """
+        Retorna o estado previsto do passo de movimento do jogador local
+        (no modo Bomb, o de mover_com_classe: recarga, turbo, dash...).
+        """
+        return self.prediction.get_state()
 
     def send_ping(self):
         """Envia um ping para medir latência."""
@@ -571,26 +855,48 @@ class GameClient:
         try:
             self.last_ping_time = time.time()
             packet = NetworkProtocol.create_ping_packet()
-            self.socket.sendall(packet)
+            self._send(packet)
         except Exception as e:
             print(f"❌ Erro ao enviar ping: {e}")
 
-    def update_interpolation(self, delta_time: float):
+    def send_view_area(self, radius: float):
         """
-        Atualiza interpolação dos jogadores remotos.
+        Informa ao servidor o raio de visão da câmera, para que o GAME_STATE
+        traga só o que está perto. Só envia quando o raio muda mais de 10%.
 
         Args:
-            delta_time: Tempo desde a última atualização (em segundos)
+            radius: Raio de visão em pixels do mundo
         """
+        if not self.connected or not self.local_player_id:
+            return
+
+        if self.view_radius_sent and abs(radius - self.view_radius_sent) < self.view_radius_sent * 0.1:
+            return
+
+        try:
+            packet = NetworkProtocol.create_packet(PacketType.VIEW_AREA, {'radius': radius})
+            self._send(packet)
+            self.view_radius_sent = radius
+        except Exception as e:
+            print(f"❌ Erro ao enviar área de visão: {e}")
+            self.connected = False
+
+    def update_interpolation(self, delta_time: float = 0.0):
+        """
+        Atualiza a posição desenhada dos jogadores remotos a partir dos snapshots.
+
+        A posição depende apenas do relógio (instante atual menos o atraso de
+        interpolação), não do FPS; delta_time é mantido por compatibilidade.
+
+        Args:
+            delta_time: Tempo desde a última atualização (em segundos, não usado)
+        """
+        agora = time.time()
         with self.players_lock:
             for player in self.remote_players.values():
-                # Interpolar posição
-                dx = player.target_x - player.x
-                dy = player.target_y - player.y
-
-                # Mover em direção ao alvo
-                player.x += dx * player.interpolation_speed
-                player.y += dy * player.interpolation_speed
+                pos = player.snapshots.sample(agora)
+                if pos:
+                    player.x, player.y = pos
 
     def set_callback(self, event: str, callback: Callable):
         """
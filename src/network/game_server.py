@@ -6,12 +6,23 @@ Servidor de jogo para multiplayer LAN.
 Gerencia a lógica do jogo e sincroniza o estado entre os clientes.
 """
 
+import os
 import socket
 import threading
 import time
 import json
+from collections import deque
 from typing import Dict, List, Optional, Tuple
 from .network_protocol import NetworkProtocol, PacketType
+from .config_network import (
+    MAX_INPUTS_PER_TICK, MAX_QUEUED_INPUTS, PLAYER_HITBOX_SIZE, MAX_HIT_DAMAGE, MIN_ROUND_INTERVAL,
+    AOI_VIEW_RADIUS, AOI_MIN_RADIUS, AOI_MAX_RADIUS, MAP_PATH, LOCKSTEP_MODES, REPLAY_DIR
+)
+from .prediction import apply_movement_input
+from .lag_compensation import LagCompensator
+from .interest import InterestGrid
+from .batching import expand_inputs
+from .telemetry import NetworkTelemetry
 
 
 class PlayerConnection:
@@ -32,6 +43,8 @@ class PlayerConnection:
         self.health = 5
         self.alive = True
         self.score = 0
+        self.respawn_round = 0  # Último round em que o respawn do cliente foi aceito
+        self.respawn_time = 0.0
 
         # Input do jogador
         self.keys = {}
@@ -39,6 +52,15 @@ class PlayerConnection:
         self.mouse_y = 0
         self.shooting = False
 
+        # Inputs numerados aguardando o próximo tick: (seq, keys)
+        self.input_queue = deque(maxlen=MAX_QUEUED_INPUTS)
+        self.last_processed_seq = 0
+
+        # Área de interesse: raio de visão e o que estava visível no último estado
+        self.view_radius = AOI_VIEW_RADIUS
+        self.visible_players = set()
+        self.visible_entities = set()
+
 
 class GameServer:
     """
@@ -62,6 +84,9 @@ class GameServer:
         self.server_socket = None
         self.running = False
 
+        # Sala do servidor de salas que este servidor atende (None = partida avulsa)
+        self.room: Optional[str] = None
+
         # Conexões dos jogadores
         self.players: Dict[int, PlayerConnection] = {}
         self.next_player_id = 1
@@ -85,37 +110,63 @@ class GameServer:
         self.tick_rate = 20  # Atualizações por segundo
         self.tick_interval = 1.0 / self.tick_rate
 
+        # Histórico de posições para validar acertos com compensação de lag
+        self.lag_compensator = LagCompensator(tick_rate=self.tick_rate)
+
+        # Métricas de rede (banda por tipo de pacote, duração do tick, filas)
+        self.telemetry = NetworkTelemetry('server')
+
+        # Grades espaciais para filtrar o GAME_STATE de cada cliente (AOI)
+        self.player_grid = InterestGrid()
+        self.entity_grid = InterestGrid()
+
         # Sistema de seleção de times
         self.team_selections = {}  # {player_id: {'team': 'T' ou 'Q', 'name': 'nome'}}
         self.team_selections_lock = threading.Lock()
 
-    def start(self) -> bool:
+        # Simulação autoritativa do modo Bomb (bots, bomba, rounds); None = só relay
+        self.simulation = None
+        self.simulation_lock = threading.Lock()
+
+        # Replays: no modo Bomb a simulação é gravada (SimulacaoGravada no lugar
+        # de self.simulation); nos outros modos, snapshots de cada tick
+        self.replay_dir = REPLAY_DIR
+        self.snapshot_replay = None
+
+    def start(self, listen: bool = True) -> bool:
         """
         Inicia o servidor.
 
+        Args:
+            listen: Se False, não abre porta; as conexões chegam por
+                    adopt_connection() (sala de um servidor de salas)
+
         Returns:
             True se iniciado com sucesso
         """
         try:
-            # Criar socket
-            self.server_socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-            self.server_socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+            if listen:
+                # Criar socket
+                self.server_socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+                self.server_socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
 
-            # Fazer bind
-            self.server_socket.bind((self.host, self.port))
-            self.server_socket.listen(self.max_players)
+                # Fazer bind
+                self.server_socket.bind((self.host, self.port))
+                self.server_socket.listen(self.max_players)
 
             self.running = True
 
-            # Iniciar thread de aceitação de conexões
-            self.accept_thread = threading.Thread(target=self._accept_connections, daemon=True)
-            self.accept_thread.start()
+            if listen:
+                # Iniciar thread de aceitação de conexões
+                self.accept_thread = threading.Thread(target=self._accept_connections, daemon=True)
+                self.accept_thread.start()
 
             # Iniciar thread de atualização do jogo
             self.update_thread = threading.Thread(target=self._update_loop, daemon=True)
             self.update_thread.start()
 
-            print(f"🌐 Servidor iniciado em {self.host}:{self.port}")
+            if listen:
+                print(f"🌐 Servidor iniciado em {self.host}:{self.port}")
             print(f"📊 Aguardando até {self.max_players} jogadores...")
 
             return True
@@ -129,10 +180,13 @@ class GameServer:
         print("🛑 Parando servidor...")
         self.running = False
 
-        # Desconectar todos os jogadores
+        # Desconectar todos os jogadores (fora do lock: _disconnect_player já o adquire)
         with self.players_lock:
-            for player in list(self.players.values()):
-                self._disconnect_player(player.player_id)
+            player_ids = list(self.players.keys())
+        for player_id in player_ids:
+            self._disconnect_player(player_id)
+
+        self._close_replays()
 
         # Fechar socket
         if self.server_socket:
@@ -146,45 +200,67 @@ class GameServer:
             try:
                 # Aceitar conexão
                 client_socket, address = self.server_socket.accept()
-
-                # Verificar se há espaço para mais jogadores
-                with self.players_lock:
-                    if len(self.players) >= self.max_players:
-                        print(f"⚠️ Conexão recusada de {address}: servidor cheio")
-                        client_socket.close()
-                        continue
-
-                print(f"🔗 Nova conexão de {address}")
-
-                # Iniciar thread para lidar com este cliente
-                client_thread = threading.Thread(
-                    target=self._handle_client,
-                    args=(client_socket, address),
-                    daemon=True
-                )
-                client_thread.start()
+                self.adopt_connection(client_socket, address)
 
             except Exception as e:
                 if self.running:
                     print(f"❌ Erro ao aceitar conexão: {e}")
 
-    def _handle_client(self, client_socket: socket.socket, address: tuple):
+    def adopt_connection(self, client_socket: socket.socket, address: tuple,
+                         first_packet: Optional[bytes] = None) -> bool:
+        """
+        Passa a atender uma conexão já aceita (pelo próprio servidor ou pelo
+        servidor de salas, que já leu o CONNECT para escolher a sala).
+
+        Args:
+            client_socket: Socket do cliente
+            address: Endereço do cliente
+            first_packet: Pacote CONNECT já lido do socket (opcional)
+
+        Returns:
+            True se a conexão foi aceita
+        """
+        # Verificar se há espaço para mais jogadores
+        with self.players_lock:
+            if len(self.players) >= self.max_players:
+                print(f"⚠️ Conexão recusada de {address}: servidor cheio")
+                client_socket.close()
+                return False
+
+        print(f"🔗 Nova conexão de {address}")
+
+        # Estados saem a cada tick: não esperar o Nagle juntar pacotes
+        client_socket.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+
+        # Iniciar thread para lidar com este cliente
+        client_thread = threading.Thread(
+            target=self._handle_client,
+            args=(client_socket, address, first_packet),
+            daemon=True
+        )
+        client_thread.start()
+        return True
+
+    def _handle_client(self, client_socket: socket.socket, address: tuple,
+                       first_packet: Optional[bytes] = None):
         """
         Thread que lida com um cliente específico.
 
         Args:
             client_socket: Socket do cliente
             address: Endereço do cliente
+            first_packet: Pacote CONNECT já lido (None = ler do socket)
         """
         player_id = None
 
         try:
             # Receber pacote de conexão
-            data = self._receive_packet(client_socket)
+            data = first_packet or self._receive_packet(client_socket)
             if not data:
                 client_socket.close()
                 return
 
+            self.telemetry.record_received(data)
             packet_type, packet_data = NetworkProtocol.parse_packet(data)
 
             if packet_type != PacketType.CONNECT:
@@ -281,6 +357,7 @@ class GameServer:
 
             try:
                 player.socket.sendall(packet)
+                self.telemetry.record_sent(packet)
             except Exception as e:
                 print(f"❌ Erro ao enviar para jogador {player_id}: {e}")
                 player.connected = False
@@ -298,6 +375,7 @@ class GameServer:
                 if player_id != exclude_player and player.connected:
                     try:
                         player.socket.sendall(packet)
+                        self.telemetry.record_sent(packet)
                     except Exception as e:
                         print(f"❌ Erro ao broadcast para jogador {player_id}: {e}")
                         player.connected = False
@@ -310,6 +388,7 @@ class GameServer:
             player_id: ID do jogador que enviou
             packet_data: Dados do pacote
         """
+        self.telemetry.record_received(packet_data)
         parsed = NetworkProtocol.parse_packet(packet_data)
         if not parsed:
             return
@@ -337,6 +416,28 @@ class GameServer:
         elif packet_type == PacketType.MINIGAME_ACTION:
             # Relay puro: reenviar para todos os outros clientes
             self._broadcast_packet(packet_data, exclude_player=player_id)
+            if self.snapshot_replay is not None:
+                self.snapshot_replay.acao(player_id, data)
+
+        elif packet_type == PacketType.BATCH:
+            # Lote de inputs e ações enviados juntos pelo cliente
+            self._process_batch(player_id, data)
+
+        elif packet_type == PacketType.VIEW_AREA:
+            # Cliente mudou o zoom da câmera
+            self._update_view_area(player_id, data)
+
+        elif packet_type == PacketType.BULLET_FIRED:
+            # Tiro disparado: repassar aos outros (efeito visual)
+            self._broadcast_packet(packet_data, exclude_player=player_id)
+
+        elif packet_type == PacketType.BULLET_HIT:
+            # Acerto informado pelo atirador: validar com compensação de lag
+            self._process_bullet_hit(player_id, data)
+
+        elif packet_type == PacketType.PLAYER_RESPAWN:
+            # Novo round/respawn: restaurar vida no servidor
+            self._respawn_player(player_id, data)
 
     def _update_player_input(self, player_id: int, data: Dict):
         """
@@ -352,10 +453,44 @@ class GameServer:
                 return
 
             player.keys = data.get('keys', {})
+            player.input_queue.append((data.get('seq', 0), player.keys))
             player.mouse_x = data.get('mouse_x', 0)
             player.mouse_y = data.get('mouse_y', 0)
             player.shooting = data.get('shooting', False)
 
+    def _process_batch(self, player_id: int, data: Dict):
+        """
+        Processa um lote do cliente: enfileira os inputs e repassa as ações
+        de minigame aos outros jogadores (também num único lote).
+
+        Args:
+            player_id: ID do jogador
+            data: Dados do lote ('inputs', 'mouse_x', 'mouse_y', 'shooting', 'actions')
+        """
+        if 'inputs' in data:
+            with self.players_lock:
+                player = self.players.get(player_id)
+                if not player:
+                    return
+
+                for seq, keys in expand_inputs(data):
+                    player.keys = keys
+                    player.input_queue.append((seq, keys))
+                player.mouse_x = data.get('mouse_x', 0)
+                player.mouse_y = data.get('mouse_y', 0)
+                player.shooting = data.get('shooting', False)
+
+        actions = data.get('actions')
+        if actions:
+            if self.snapshot_replay is not None:
+                for action in actions:
+                    self.snapshot_replay.acao(player_id, action)
+            packet = NetworkProtocol.create_packet(PacketType.BATCH, {
+                'player_id': player_id,
+                'actions': actions
+            })
+            self._broadcast_packet(packet, exclude_player=player_id)
+
     def _disconnect_player(self, player_id: int):
         """
         Desconecta um jogador.
@@ -377,6 +512,13 @@ class GameServer:
 
             del self.players[player_id]
 
+        self.lag_compensator.remove(player_id)
+
+        if self.simulation is not None:
+            with self.simulation_lock:
+                if self.simulation is not None:
+                    self.simulation.remover_jogador(player_id)
+
         print(f"👋 Jogador {player_id} desconectado")
 
         # Broadcast desconexão
@@ -408,9 +550,12 @@ class GameServer:
         with self.game_state_lock:
             full_state = {
                 'player_id': player_id,  # Informar qual é o ID deste jogador
+                'server_time': time.time(),
                 'players': players_data,
                 'game_state': self.game_state.copy()
             }
+        if self.room is not None:
+            full_state['room'] = self.room
 
         packet = NetworkProtocol.create_packet(PacketType.FULL_SYNC, full_state)
         self._send_packet(player_id, packet)
@@ -433,7 +578,8 @@ class GameServer:
                 'x': player.x,
                 'y': player.y,
                 'health': player.health,
-                'alive': player.alive
+                'alive': player.alive,
+                'server_time': time.time()
             }
 
         packet = NetworkProtocol.create_player_update_packet(player_data)
@@ -448,12 +594,23 @@ class GameServer:
             delta_time = current_time - last_update
 
             if delta_time >= self.tick_interval:
+                # Filas de input antes do tick (quanto os clientes estão à frente)
+                with self.players_lock:
+                    depths = [len(p.input_queue) for p in self.players.values()]
+                self.telemetry.set_queue_depth('input_queue_max', max(depths, default=0))
+                self.telemetry.set_queue_depth('input_queue_total', sum(depths))
+
+                tick_start = time.perf_counter()
+
                 # Atualizar lógica do jogo
                 self._update_game_logic(delta_time)
 
                 # Sincronizar estado com clientes
                 self._sync_game_state()
 
+                self.telemetry.record_tick(time.perf_counter() - tick_start)
+                self.telemetry.maybe_dump()
+
                 last_update = current_time
             else:
                 # Dormir um pouco para não usar 100% da CPU
@@ -466,67 +623,402 @@ class GameServer:
         Args:
             delta_time: Tempo desde a última atualização
         """
-        # Atualizar movimento dos jogadores baseado no input
+        # Aplicar os inputs recebidos desde o último tick, um passo por input
+        # (mesmo passo que o cliente usa na predição)
         with self.players_lock:
             for player in self.players.values():
                 if not player.alive:
+                    player.input_queue.clear()
                     continue
 
-                # Velocidade de movimento (igual a VEL_LOBBY do lobby)
-                velocidade = 4.0
-
-                # Processar teclas de movimento (WASD)
-                dx = 0
-                dy = 0
-
-                if player.keys.get('w', False):
-                    dy -= velocidade
-                if player.keys.get('s', False):
-                    dy += velocidade
-                if player.keys.get('a', False):
-                    dx -= velocidade
-                if player.keys.get('d', False):
-                    dx += velocidade
-
-                # Normalizar movimento diagonal
-                if dx != 0 and dy != 0:
-                    import math
-                    fator = velocidade / math.sqrt(dx**2 + dy**2)
-                    dx *= fator
-                    dy *= fator
-
-                # Atualizar posição
-                player.x += dx
-                player.y += dy
-
-                # Limitar às bordas do lobby (sala.x+8 até sala.right-TAM_PLAYER-8)
-                player.x = max(33, min(1417, player.x))
-                player.y = max(73, min(682, player.y))
+                for _ in range(min(len(player.input_queue), MAX_INPUTS_PER_TICK)):
+                    seq, keys = player.input_queue.popleft()
+                    player.x, player.y = self._apply_input(player, keys)
+                    player.last_processed_seq = max(player.last_processed_seq, seq)
+
+            # Guardar as posições deste tick no histórico de compensação de lag
+            agora = time.time()
+            for pid, player in self.players.items():
+                if player.alive:
+                    self.lag_compensator.record(pid, player.x, player.y, agora)
+
+        if self.simulation is not None:
+            self._update_simulation(delta_time, agora)
+
+    def _apply_input(self, player: PlayerConnection, keys: Dict) -> Tuple[float, float]:
+        """
+        Um passo de movimento: limites do lobby, ou colisão com o mapa e
+        habilidade de classe na simulação (parado quando ela não deixa andar).
+        """
+        simulation = self.simulation
+        if simulation is None:
+            return apply_movement_input(player.x, player.y, keys)
+        return simulation.mover_jogador(player.player_id, player.x, player.y, keys)
+
+    def _update_simulation(self, delta_time: float, now: float):
+        """
+        Avança a simulação do modo Bomb e aplica nos jogadores humanos o
+        que ela decidiu (acertos de bots, respawn no início do round).
+
+        Args:
+            delta_time: Tempo desde o último tick (s)
+            now: Horário deste tick (para o histórico de compensação de lag)
+        """
+        with self.simulation_lock:
+            simulation = self.simulation
+
+            with self.players_lock:
+                for pid, player in self.players.items():
+                    simulation.sincronizar_jogador(pid, player.x, player.y,
+                                                   player.health if player.alive else 0,
+                                                   bool(player.keys.get('f')))
+
+            events = simulation.passo(delta_time)
+
+            with self.game_state_lock:
+                self.game_state['enemies'] = simulation.bots()
+                self.game_state['bullets'] = simulation.tiros()
+                self.game_state['bomb'] = simulation.estado()
+
+            for bot in self.game_state['enemies']:
+                if bot['vidas'] > 0:
+                    self.lag_compensator.record(('bot', bot['id']), bot['x'], bot['y'], now)
+
+        for event in events:
+            with self.players_lock:
+                player = self.players.get(event['alvo'])
+                if not player:
+                    continue
+                if event['tipo'] == 'respawn':
+                    player.x = event['x']
+                    player.y = event['y']
+                    player.health = event['vidas']
+                    player.alive = True
+                    continue
+                player.health = max(0, player.health - event['dano'])
+                player.alive = player.health > 0
+                health = player.health
+
+            # Mesmo formato de um acerto validado entre jogadores
+            packet = NetworkProtocol.create_bullet_hit_packet(0, event['alvo'], 'player', {
+                'shooter_id': ['bot', event['atirador']],
+                'damage': event['dano'],
+                'confirmed': True,
+                'health': health,
+            })
+            self._broadcast_packet(packet)
+
+    def start_bomb_simulation(self, tilemap=None, seed: Optional[int] = None):
+        """
+        Passa a simular o modo Bomb no servidor. A partida começa quando
+        todos os jogadores escolherem time (ALL_READY).
+
+        Args:
+            tilemap: TileMap já carregado (None = carregar o mapa padrão sem imagens)
+            seed: Seed da simulação
+        """
+        from src.game.simulacao_bomba import SimulacaoBomba
+
+        if tilemap is None:
+            from src.utils.tilemap import TileMap
+            tilemap = TileMap(MAP_PATH, carregar_imagens=False)
+
+        simulation = SimulacaoBomba(tilemap, seed)
+        if self.replay_dir and seed is not None:
+            # Com o mesmo seed e as mesmas chamadas, a simulação se repete
+            from src.utils.replay import SimulacaoGravada
+            simulation = SimulacaoGravada(simulation, self._replay_path('Bomb'),
+                                          {'modo': 'Bomb', 'seed': seed, 'mapa': tilemap.caminho,
+                                           'tick_rate': self.tick_rate})
+
+        self._close_replays()
+        with self.simulation_lock:
+            self.simulation = simulation
+        print("🧠 Simulação do modo Bomb ativa no servidor")
+
+    def stop_simulation(self):
+        """Volta ao modo relay (fim da partida)."""
+        self._close_replays()
+        with self.simulation_lock:
+            self.simulation = None
+        with self.game_state_lock:
+            self.game_state['enemies'] = []
+            self.game_state['bullets'] = []
+            self.game_state.pop('bomb', None)
+
+    def _process_bullet_hit(self, shooter_id: int, data: Dict):
+        """
+        Valida um acerto informado pelo atirador e aplica o dano.
+
+        O alvo é rebobinado até o instante que o atirador via (view_time),
+        limitado a MAX_REWIND segundos atrás.
+
+        Args:
+            shooter_id: ID de quem atirou
+            data: Dados do BULLET_HIT ('target_id', 'x', 'y', 'damage', 'view_time')
+        """
+        target_id = data.get('target_id')
+        if data.get('target_type') == 'bot':
+            self._process_bot_hit(shooter_id, data)
+            return
+        if data.get('target_type', 'player') != 'player' or target_id == shooter_id:
+            return
+
+        try:
+            hit_x = float(data['x'])
+            hit_y = float(data['y'])
+            damage = max(0, min(int(data.get('damage', 1)), MAX_HIT_DAMAGE))
+        except (KeyError, TypeError, ValueError):
+            return
+
+        with self.players_lock:
+            target = self.players.get(target_id)
+            if not target or not target.alive:
+                return
+
+        valid = self.lag_compensator.validate_hit(
+            target_id, hit_x, hit_y, PLAYER_HITBOX_SIZE, data.get('view_time')
+        )
+        simulation = self.simulation
+        if valid and simulation is not None and simulation.invulneravel(target_id):
+            valid = False  # Dash ou escudo da classe
+
+        result = {
+            'shooter_id': shooter_id,
+            'damage': damage,
+            'confirmed': valid,
+        }
+
+        if not valid:
+            # Avisar só o atirador, para desfazer efeitos previstos
+            packet = NetworkProtocol.create_bullet_hit_packet(
+                data.get('bullet_id', 0), target_id, 'player', result
+            )
+            self._send_packet(shooter_id, packet)
+            return
+
+        with self.players_lock:
+            target = self.players.get(target_id)
+            if not target or not target.alive:
+                return
+            target.health = max(0, target.health - damage)
+            if target.health <= 0:
+                target.alive = False
+            result['health'] = target.health
+
+        packet = NetworkProtocol.create_bullet_hit_packet(
+            data.get('bullet_id', 0), target_id, 'player', result
+        )
+        self._broadcast_packet(packet)
+
+    def _process_bot_hit(self, shooter_id: int, data: Dict):
+        """
+        Valida o acerto de um jogador em um bot da simulação (mesma
+        compensação de lag dos jogadores) e aplica o dano.
+
+        Args:
+            shooter_id: ID de quem atirou
+            data: Dados do BULLET_HIT ('target_id' = id do bot)
+        """
+        if self.simulation is None:
+            return
+
+        try:
+            bot_id = int(data['target_id'])
+            hit_x = float(data['x'])
+            hit_y = float(data['y'])
+            damage = max(0, min(int(data.get('damage', 1)), MAX_HIT_DAMAGE))
+        except (KeyError, TypeError, ValueError):
+            return
+
+        valid = self.lag_compensator.validate_hit(
+            ('bot', bot_id), hit_x, hit_y, PLAYER_HITBOX_SIZE, data.get('view_time')
+        )
+
+        with self.team_selections_lock:
+            team = self.team_selections.get(shooter_id, {}).get('team')
+
+        health = None
+        if valid:
+            with self.simulation_lock:
+                if self.simulation is not None:
+                    health = self.simulation.dano_bot(bot_id, damage, team)
+
+        result = {
+            'shooter_id': shooter_id,
+            'damage': damage,
+            'confirmed': health is not None,
+        }
+        if health is None:
+            packet = NetworkProtocol.create_bullet_hit_packet(data.get('bullet_id', 0), bot_id, 'bot', result)
+            self._send_packet(shooter_id, packet)
+            return
+
+        result['health'] = health
+        packet = NetworkProtocol.create_bullet_hit_packet(data.get('bullet_id', 0), bot_id, 'bot', result)
+        self._broadcast_packet(packet)
+
+    def _respawn_player(self, player_id: int, data: Dict):
+        """
+        Restaura a vida de um jogador a pedido do cliente. Com a simulação
+        ativa o pacote é ignorado (ela decide os respawns); sem ela, só vale
+        no início de um round novo ou depois de uma morte que o servidor
+        confirmou, e a vida fica limitada à da classe.
+
+        Args:
+            player_id: ID do jogador
+            data: Dados do respawn ('health' e 'round' opcionais)
+        """
+        if self.simulation is not None:
+            return
+
+        try:
+            health = int(data.get('health', 5))
+            round_number = int(data.get('round', 0))
+        except (TypeError, ValueError):
+            return
+        health = max(1, min(health, self._max_health(player_id)))
+
+        now = time.time()
+        with self.players_lock:
+            player = self.players.get(player_id)
+            if not player:
+                return
+            new_round = (round_number > player.respawn_round and
+                         now - player.respawn_time >= MIN_ROUND_INTERVAL)
+            if player.alive and not new_round:
+                return
+            if new_round:
+                player.respawn_round = round_number
+                player.respawn_time = now
+            player.health = health
+            player.alive = True
+
+    def _max_health(self, player_id: int) -> int:
+        """
+        Vida máxima do jogador: a da classe que ele escolheu ou, sem classe
+        conhecida, a maior entre as classes do time.
+
+        Args:
+            player_id: ID do jogador
+
+        Returns:
+            Vida máxima aceita pelo servidor
+        """
+        from src.game.selecao_classes import CLASSES_TIME_T, CLASSES_TIME_Q
+
+        with self.team_selections_lock:
+            selection = self.team_selections.get(player_id, {})
+        classes = {'T': CLASSES_TIME_T, 'Q': CLASSES_TIME_Q}.get(selection.get('team'))
+        if classes is None:
+            classes = {**CLASSES_TIME_T, **CLASSES_TIME_Q}
+        dados = classes.get(selection.get('class'))
+        if dados:
+            return dados['vidas']
+        return max(dados['vidas'] for dados in classes.values())
+
+    def _update_view_area(self, player_id: int, data: Dict):
+        """
+        Atualiza o raio de visão de um jogador (usado na filtragem por AOI).
+
+        Args:
+            player_id: ID do jogador
+            data: Dados com 'radius'
+        """
+        try:
+            radius = float(data.get('radius', AOI_VIEW_RADIUS))
+        except (TypeError, ValueError):
+            return
+
+        with self.players_lock:
+            player = self.players.get(player_id)
+            if player:
+                player.view_radius = max(AOI_MIN_RADIUS, min(AOI_MAX_RADIUS, radius))
 
     def _sync_game_state(self):
-        """Sincroniza o estado do jogo com todos os clientes."""
+        """
+        Sincroniza o estado do jogo com os clientes.
+
+        Cada cliente recebe só os jogadores, inimigos e tiros dentro do seu
+        raio de visão (AOI), além do próprio jogador. Quem saiu da visão desde
+        o último envio vai em 'left_players'/'left_enemies', para o cliente
+        esconder (senão ficaria parado na última posição recebida).
+        """
+        now = time.time()
+
         # Preparar dados dos jogadores
-        players_data = []
+        simulation = self.simulation
         with self.players_lock:
-            for pid, player in self.players.items():
-                players_data.append({
+            players_data = {
+                pid: {
                     'id': pid,
                     'x': player.x,
                     'y': player.y,
                     'health': player.health,
-                    'alive': player.alive
-                })
+                    'alive': player.alive,
+                    'ack': player.last_processed_seq
+                }
+                for pid, player in self.players.items()
+            }
+            if simulation is not None:
+                # Estado de movimento da classe: a predição reaplica os inputs a partir dele
+                for pid, data in players_data.items():
+                    movement = simulation.movimento(pid)
+                    if movement is not None:
+                        data['mov'] = movement
+            viewers = [(pid, player.x, player.y, player.view_radius,
+                        player.visible_players, player.visible_entities)
+                       for pid, player in self.players.items() if player.connected]
+
+        snapshot_replay = self.snapshot_replay
+        if snapshot_replay is not None:
+            snapshot_replay.registrar(list(players_data.values()))
 
-        # Criar pacote de estado
         with self.game_state_lock:
+            # Chave estável entre ticks: (tipo, id da entidade ou índice na lista)
+            entities = [(('enemies', e.get('id', i)), e)
+                        for i, e in enumerate(self.game_state.get('enemies', []))]
+            entities += [(('bullets', b.get('id', i)), b)
+                         for i, b in enumerate(self.game_state.get('bullets', []))]
+            # Round e bomba: sem posição na AOI, vão para todos
+            bomb = self.game_state.get('bomb')
+
+        self.player_grid.rebuild((pid, p['x'], p['y']) for pid, p in players_data.items())
+        self.entity_grid.rebuild((key, e['x'], e['y'])
+                                 for key, e in entities if 'x' in e and 'y' in e)
+        # Entidades sem posição não podem ser filtradas: vão para todos
+        sem_posicao = {key for key, e in entities if 'x' not in e or 'y' not in e}
+
+        for pid, x, y, radius, prev_players, prev_entities in viewers:
+            visible_players = self.player_grid.query(x, y, radius, prev_players)
+            visible_players.add(pid)
+            visible_entities = self.entity_grid.query(x, y, radius, prev_entities) | sem_posicao
+
             state_data = {
-                'players': players_data,
-                'enemies': self.game_state.get('enemies', []),
-                'bullets': self.game_state.get('bullets', [])
+                'server_time': now,
+                'players': [players_data[v] for v in visible_players if v in players_data],
+                'enemies': [e for key, e in entities
+                            if key[0] == 'enemies' and key in visible_entities],
+                'bullets': [e for key, e in entities
+                            if key[0] == 'bullets' and key in visible_entities],
             }
+            if bomb is not None:
+                state_data['bomb'] = bomb
+            left_players = prev_players - visible_players
+            if left_players:
+                state_data['left_players'] = sorted(left_players)
+            left_enemies = [key[1] for key in prev_entities - visible_entities if key[0] == 'enemies']
+            if left_enemies:
+                state_data['left_enemies'] = left_enemies
+
+            packet = NetworkProtocol.create_game_state_packet(state_data)
+            self._send_packet(pid, packet)
 
-        packet = NetworkProtocol.create_game_state_packet(state_data)
-        self._broadcast_packet(packet)
+            with self.players_lock:
+                player = self.players.get(pid)
+                if player:
+                    player.visible_players = visible_players
+                    player.visible_entities = visible_entities
 
     def get_server_info(self) -> Dict:
         """
@@ -565,7 +1057,7 @@ class GameServer:
                 for pid, player in self.players.items()
             ]
 
-    def broadcast_game_start(self, modo='Bomb', seed=None):
+    def broadcast_game_start(self, modo='Bomb', seed=None, bots=None):
         """
         Envia sinal para todos os clientes que a partida está iniciando.
         Deve ser chamado pelo host quando clicar em INICIAR.
@@ -573,36 +1065,70 @@ class GameServer:
         Args:
             modo: Nome do modo de jogo ('Bomb', 'Aim', 'Duel')
             seed: Seed para sincronizar random entre clientes
+            bots: Bots da partida (servidor dedicado, que não tem um host para criá-los)
         """
         import random as _rnd
         if seed is None:
             seed = _rnd.randint(0, 2**31)
         print(f"[SERVER] Broadcasting GAME_START modo={modo} seed={seed}")
-        packet = NetworkProtocol.create_packet(PacketType.GAME_START, {
+        data = {
             'message': 'Host iniciou a partida',
             'modo': modo,
             'seed': seed,
-        })
+            'authoritative': self.simulation is not None,
+            'lockstep': modo in LOCKSTEP_MODES,
+        }
+        if bots is not None:
+            data['bots'] = bots
+
+        if self.replay_dir and self.simulation is None:
+            # Sem simulação no servidor, o jogo depende do tempo da rede: gravar snapshots
+            from src.utils.replay import GravadorSnapshots
+            self._close_replays()
+            self.snapshot_replay = GravadorSnapshots(
+                self._replay_path(modo), {'modo': modo, 'seed': seed, 'tick_rate': self.tick_rate}
+            )
+
+        packet = NetworkProtocol.create_packet(PacketType.GAME_START, data)
         self._broadcast_packet(packet)
 
+    def _replay_path(self, modo: str) -> str:
+        return os.path.join(self.replay_dir, f"{modo}_{int(time.time())}_{self.port}.ssr")
+
+    def _close_replays(self):
+        """Fecha o replay da partida atual (simulação gravada ou snapshots)."""
+        with self.simulation_lock:
+            fechar = getattr(self.simulation, 'fechar', None)
+            if fechar is not None:
+                fechar()
+        replay, self.snapshot_replay = self.snapshot_replay, None
+        if replay is not None:
+            replay.fechar()
+
     def _process_team_selection(self, player_id: int, data: Dict):
         """
         Processa a seleção de time de um jogador.
 
         Args:
             player_id: ID do jogador
-            data: Dados com 'team' e 'player_name'
+            data: Dados com 'team', 'player_name' e 'player_class'
         """
+        from src.game.selecao_classes import obter_dados_classe
+
         team = data.get('team')
         player_name = data.get('player_name', f'Player{player_id}')
+        player_class = data.get('player_class')
 
         if team not in ['T', 'Q']:
             return
+        if not isinstance(player_class, str) or not obter_dados_classe(player_class, team):
+            player_class = None  # Classe desconhecida: vale a maior vida do time
 
         with self.team_selections_lock:
             self.team_selections[player_id] = {
                 'team': team,
-                'name': player_name
+                'name': player_name,
+                'class': player_class
             }
             print(f"[SERVER] Jogador {player_name} (ID:{player_id}) escolheu Time {team}")
 
@@ -637,6 +1163,13 @@ class GameServer:
 
         if selected_count >= connected_count and connected_count > 0:
             print("[SERVER] Todos os jogadores escolheram time! Enviando ALL_READY...")
+            if self.simulation is not None:
+                with self.team_selections_lock:
+                    teams = {pid: (sel['team'], sel['name'], sel.get('class'))
+                             for pid, sel in self.team_selections.items()}
+                with self.simulation_lock:
+                    if self.simulation is not None and not self.simulation.iniciada:
+                        self.simulation.iniciar(teams)
             packet = NetworkProtocol.create_all_ready_packet()
             self._broadcast_packet(packet)
 
@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Gerência de interesse (AOI - area of interest) no servidor.
+
+O mapa multiplayer é bem maior que o que cabe na câmera de um jogador,
+então não faz sentido mandar para cada cliente todas as entidades do
+mundo em todo GAME_STATE. A cada tick o servidor distribui as entidades
+numa grade de células; para cada cliente consulta só as células que
+cobrem o círculo de visão em volta da última posição dele.
+
+Para a entidade não ficar piscando na borda da visão, quem já estava
+visível só sai depois de passar do raio vezes AOI_HYSTERESIS.
+"""
+
+import math
+from typing import Dict, Hashable, Iterable, List, Optional, Set, Tuple
+
+from .config_network import AOI_CELL_SIZE, AOI_HYSTERESIS
+
+
+class InterestGrid:
+    """Grade espacial de entidades, reconstruída a cada tick."""
+
+    def __init__(self, cell_size: float = AOI_CELL_SIZE):
+        """
+        Args:
+            cell_size: Lado de cada célula da grade (px)
+        """
+        self.cell_size = cell_size
+        self.cells: Dict[Tuple[int, int], List[Tuple[Hashable, float, float]]] = {}
+
+    def _cell(self, x: float, y: float) -> Tuple[int, int]:
+        return (int(x // self.cell_size), int(y // self.cell_size))
+
+    def rebuild(self, entities: Iterable[Tuple[Hashable, float, float]]):
+        """
+        Redistribui as entidades na grade.
+
+        Args:
+            entities: Iterável de (id, x, y)
+        """
+        self.cells = {}
+        for entity_id, x, y in entities:
+            self.cells.setdefault(self._cell(x, y), []).append((entity_id, x, y))
+
+    def _cells_in_square(self, x: float, y: float, half: float):
+        """Células que cobrem o quadrado de lado 2*half centrado em (x, y)."""
+        min_cx, min_cy = self._cell(x - half, y - half)
+        max_cx, max_cy = self._cell(x + half, y + half)
+        for cx in range(min_cx, max_cx + 1):
+            for cy in range(min_cy, max_cy + 1):
+                yield (cx, cy)
+
+    def query(self, x: float, y: float, radius: float,
+              previous: Optional[Set[Hashable]] = None,
+              hysteresis: float = AOI_HYSTERESIS) -> Set[Hashable]:
+        """
+        Entidades dentro do círculo de visão.
+
+        Args:
+            x, y: Centro da visão
+            radius: Raio de entrada na visão (px)
+            previous: Ids visíveis no tick anterior (ficam até radius * hysteresis)
+            hysteresis: Multiplicador do raio de saída
+
+        Returns:
+            Conjunto de ids visíveis
+        """
+        inner_sq = radius * radius
+        outer = radius * max(1.0, hysteresis) if previous else radius
+        outer_sq = outer * outer
+
+        found = set()
+        for cell in self._cells_in_square(x, y, outer):
+            for entity_id, ex, ey in self.cells.get(cell, ()):
+                dist_sq = (ex - x) ** 2 + (ey - y) ** 2
+                if dist_sq <= inner_sq or (dist_sq <= outer_sq and entity_id in previous):
+                    found.add(entity_id)
+        return found
+
+
+def view_radius_for(screen_width: float, screen_height: float, zoom: float) -> float:
+    """
+    Raio que cobre a tela inteira (metade da diagonal) para um zoom de câmera.
+
+    Args:
+        screen_width, screen_height: Tamanho da área visível em pixels de tela
+        zoom: Zoom da câmera (1.0 = sem zoom)
+
+    Returns:
+        Raio em pixels do mundo
+    """
+    return math.hypot(screen_width, screen_height) / 2.0 / max(zoom, 0.01)
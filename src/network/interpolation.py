@@ -0,0 +1,203 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Interpolação de snapshots para entidades remotas.
+
+Cada entidade remota guarda um buffer de posições com horário. O desenho
+acontece um pouco "no passado" (atraso de interpolação), entre os dois
+snapshots que cercam esse instante, então o movimento não depende do FPS
+do cliente e não dá tranco quando os pacotes chegam irregulares.
+
+O horário de cada snapshot vem do relógio de quem enviou; o buffer estima
+o tempo mínimo de trânsito para trazê-lo ao relógio local e mede o jitter
+(variação do trânsito, como no RFC 3550) para aumentar o atraso quando a
+rede fica instável. Se os snapshots param de chegar, a posição é
+extrapolada pela última velocidade, até um limite.
+"""
+
+import threading
+import time
+from collections import deque
+from typing import Dict, Hashable, Optional, Tuple
+
+from .config_network import (
+    INTERPOLATION_DELAY,
+    INTERPOLATION_MAX_DELAY,
+    INTERPOLATION_JITTER_FACTOR,
+    MAX_EXTRAPOLATION,
+    SNAPSHOT_BUFFER_SIZE,
+)
+
+
+class SnapshotBuffer:
+    """Buffer de posições com horário de uma entidade remota."""
+
+    def __init__(self, delay: float = INTERPOLATION_DELAY,
+                 max_delay: float = INTERPOLATION_MAX_DELAY,
+                 jitter_factor: float = INTERPOLATION_JITTER_FACTOR,
+                 max_extrapolation: float = MAX_EXTRAPOLATION,
+                 size: int = SNAPSHOT_BUFFER_SIZE):
+        """
+        Args:
+            delay: Atraso mínimo de interpolação (s)
+            max_delay: Atraso máximo, mesmo com muito jitter (s)
+            jitter_factor: Quantos "jitters" somar ao atraso mínimo
+            max_extrapolation: Tempo máximo de extrapolação sem snapshots (s)
+            size: Quantidade de snapshots guardados
+        """
+        self.base_delay = delay
+        self.max_delay = max(delay, max_delay)
+        self.jitter_factor = jitter_factor
+        self.max_extrapolation = max_extrapolation
+
+        # (horário local estimado, x, y), em ordem crescente de horário
+        self.snapshots = deque(maxlen=size)
+        self.lock = threading.Lock()
+
+        # Estimativas de trânsito (recebido - enviado) e jitter, em segundos
+        self.min_transit: Optional[float] = None
+        self.last_transit: Optional[float] = None
+        self.jitter = 0.0
+
+        # Velocidade entre os dois últimos snapshots (px/s), para extrapolar
+        self.velocity: Tuple[float, float] = (0.0, 0.0)
+
+    def push(self, x: float, y: float, sent_time: Optional[float] = None,
+             received_time: Optional[float] = None):
+        """
+        Adiciona um snapshot.
+
+        Args:
+            x, y: Posição da entidade
+            sent_time: Horário do envio no relógio do remetente (None = usar chegada)
+            received_time: Horário local da chegada (None = agora)
+        """
+        received = time.time() if received_time is None else received_time
+        sent = received if sent_time is None else sent_time
+        transit = received - sent
+
+        with self.lock:
+            if self.min_transit is None or transit < self.min_transit:
+                self.min_transit = transit
+            else:
+                # Subir devagar, para acompanhar deriva de relógio ou mudança de rota
+                self.min_transit += (transit - self.min_transit) * 0.01
+
+            if self.last_transit is not None:
+                self.jitter += (abs(transit - self.last_transit) - self.jitter) / 16.0
+            self.last_transit = transit
+
+            local_time = sent + self.min_transit
+            if self.snapshots and local_time <= self.snapshots[-1][0]:
+                return  # Duplicado ou fora de ordem
+
+            if self.snapshots:
+                t_prev, x_prev, y_prev = self.snapshots[-1]
+                dt = local_time - t_prev
+                self.velocity = ((x - x_prev) / dt, (y - y_prev) / dt)
+
+            self.snapshots.append((local_time, float(x), float(y)))
+
+    def get_delay(self) -> float:
+        """Atraso de interpolação atual (s), já ajustado pelo jitter."""
+        delay = self.base_delay + self.jitter_factor * self.jitter
+        return min(self.max_delay, delay)
+
+    def sender_time_at(self, now: Optional[float] = None) -> Optional[float]:
+        """
+        Instante, no relógio do remetente, que está sendo desenhado agora.
+
+        Returns:
+            Horário do remetente, ou None se ainda não houver snapshots
+        """
+        if now is None:
+            now = time.time()
+        with self.lock:
+            if self.min_transit is None:
+                return None
+            return now - self.get_delay() - self.min_transit
+
+    def sample(self, now: Optional[float] = None) -> Optional[Tuple[float, float]]:
+        """
+        Calcula a posição da entidade no instante de renderização.
+
+        Args:
+            now: Horário local atual (None = agora)
+
+        Returns:
+            (x, y) interpolado, ou None se o buffer estiver vazio
+        """
+        if now is None:
+            now = time.time()
+
+        with self.lock:
+            if not self.snapshots:
+                return None
+
+            render_time = now - self.get_delay()
+            snaps = self.snapshots
+
+            # Descartar snapshots que já ficaram para trás
+            while len(snaps) >= 2 and snaps[1][0] <= render_time:
+                snaps.popleft()
+
+            t0, x0, y0 = snaps[0]
+            if render_time <= t0:
+                return (x0, y0)
+
+            if len(snaps) >= 2:
+                t1, x1, y1 = snaps[1]
+                alpha = (render_time - t0) / (t1 - t0)
+                return (x0 + (x1 - x0) * alpha, y0 + (y1 - y0) * alpha)
+
+            return self._extrapolate(render_time)
+
+    def _extrapolate(self, render_time: float) -> Tuple[float, float]:
+        """Continua o movimento do último snapshot por um tempo limitado."""
+        t1, x1, y1 = self.snapshots[-1]
+        vx, vy = self.velocity
+        dt = min(render_time - t1, self.max_extrapolation)
+        return (x1 + vx * dt, y1 + vy * dt)
+
+    def clear(self):
+        """Esvazia o buffer (ex: teleporte ou respawn)."""
+        with self.lock:
+            self.snapshots.clear()
+            self.velocity = (0.0, 0.0)
+
+
+class InterpolationSet:
+    """Conjunto de SnapshotBuffers indexado pelo id da entidade remota."""
+
+    def __init__(self, **buffer_kwargs):
+        """
+        Args:
+            buffer_kwargs: Parâmetros repassados a cada SnapshotBuffer criado
+        """
+        self.buffer_kwargs = buffer_kwargs
+        self.buffers: Dict[Hashable, SnapshotBuffer] = {}
+
+    def push(self, entity_id: Hashable, x: float, y: float,
+             sent_time: Optional[float] = None):
+        """Adiciona um snapshot à entidade (criando o buffer se necessário)."""
+        buffer = self.buffers.get(entity_id)
+        if buffer is None:
+            buffer = SnapshotBuffer(**self.buffer_kwargs)
+            self.buffers[entity_id] = buffer
+        buffer.push(x, y, sent_time)
+
+    def sample(self, entity_id: Hashable, now: Optional[float] = None) -> Optional[Tuple[float, float]]:
+        """Posição interpolada da entidade, ou None se ainda não houver snapshots."""
+        buffer = self.buffers.get(entity_id)
+        if buffer is None:
+            return None
+        return buffer.sample(now)
+
+    def remove(self, entity_id: Hashable):
+        """Esquece uma entidade (ex: jogador saiu ou morreu)."""
+        self.buffers.pop(entity_id, None)
+
+    def clear(self):
+        """Esquece todas as entidades (ex: início de um novo round)."""
+        self.buffers.clear()
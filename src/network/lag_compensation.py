@@ -0,0 +1,147 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Compensação de lag no servidor.
+
+O servidor guarda, para cada entidade, as posições do último ~1 segundo
+(um buffer circular por entidade). Quando um cliente diz que acertou
+alguém, ele informa o instante (no relógio do servidor) em que estava
+vendo o alvo; o servidor "volta no tempo" até esse instante e confere o
+acerto contra a posição que o alvo tinha ali, e não contra a posição
+atual. Assim quem tem ping alto acerta o que viu na tela.
+
+Para evitar abuso, o quanto se pode voltar no tempo é limitado
+(MAX_REWIND): pedidos mais antigos são tratados como se fossem do limite.
+"""
+
+import bisect
+import math
+import threading
+import time
+from collections import deque
+from typing import Dict, Hashable, Optional, Tuple
+
+from .config_network import LAG_COMP_HISTORY, MAX_REWIND, TICK_RATE, HIT_TOLERANCE
+
+
+class PositionHistory:
+    """Buffer circular de posições (t, x, y) de uma entidade."""
+
+    def __init__(self, max_samples: int):
+        self.samples = deque(maxlen=max_samples)
+
+    def record(self, t: float, x: float, y: float):
+        """Registra a posição da entidade no instante t."""
+        if self.samples and t <= self.samples[-1][0]:
+            # Mesmo tick: substituir a última amostra
+            self.samples[-1] = (t, x, y)
+        else:
+            self.samples.append((t, x, y))
+
+    def position_at(self, t: float) -> Optional[Tuple[float, float]]:
+        """
+        Posição interpolada da entidade no instante t.
+
+        Returns:
+            (x, y), ou None se não houver histórico
+        """
+        if not self.samples:
+            return None
+
+        oldest = self.samples[0]
+        newest = self.samples[-1]
+        if t <= oldest[0]:
+            return (oldest[1], oldest[2])
+        if t >= newest[0]:
+            return (newest[1], newest[2])
+
+        # Busca binária pela primeira amostra depois de t
+        times = [s[0] for s in self.samples]
+        i = bisect.bisect_right(times, t)
+        t0, x0, y0 = self.samples[i - 1]
+        t1, x1, y1 = self.samples[i]
+        alpha = (t - t0) / (t1 - t0)
+        return (x0 + (x1 - x0) * alpha, y0 + (y1 - y0) * alpha)
+
+
+class LagCompensator:
+    """Histórico de posições de todas as entidades e validação de acertos."""
+
+    def __init__(self, history_seconds: float = LAG_COMP_HISTORY,
+                 max_rewind: float = MAX_REWIND, tick_rate: int = TICK_RATE):
+        """
+        Args:
+            history_seconds: Quanto tempo de histórico guardar por entidade
+            max_rewind: Quanto o servidor aceita voltar no tempo (s)
+            tick_rate: Ticks por segundo (define o tamanho do buffer)
+        """
+        self.max_samples = max(2, int(math.ceil(history_seconds * tick_rate)) + 1)
+        self.max_rewind = min(max_rewind, history_seconds)
+        self.histories: Dict[Hashable, PositionHistory] = {}
+        self.lock = threading.Lock()
+
+    def record(self, entity_id: Hashable, x: float, y: float, t: Optional[float] = None):
+        """Registra a posição atual de uma entidade."""
+        if t is None:
+            t = time.time()
+        with self.lock:
+            history = self.histories.get(entity_id)
+            if history is None:
+                history = PositionHistory(self.max_samples)
+                self.histories[entity_id] = history
+            history.record(t, x, y)
+
+    def remove(self, entity_id: Hashable):
+        """Esquece o histórico de uma entidade (ex: desconectou)."""
+        with self.lock:
+            self.histories.pop(entity_id, None)
+
+    def clamp_view_time(self, view_time: Optional[float], now: Optional[float] = None) -> float:
+        """
+        Limita o instante pedido pelo cliente à janela permitida.
+
+        Args:
+            view_time: Instante (relógio do servidor) que o atirador via
+            now: Instante atual (None = agora)
+
+        Returns:
+            Instante entre now - max_rewind e now
+        """
+        if now is None:
+            now = time.time()
+        if view_time is None:
+            return now
+        return max(now - self.max_rewind, min(now, view_time))
+
+    def position_at(self, entity_id: Hashable, t: float) -> Optional[Tuple[float, float]]:
+        """Posição da entidade no instante t (None se não houver histórico)."""
+        with self.lock:
+            history = self.histories.get(entity_id)
+            if history is None:
+                return None
+            return history.position_at(t)
+
+    def validate_hit(self, entity_id: Hashable, hit_x: float, hit_y: float,
+                     size: float, view_time: Optional[float],
+                     tolerance: float = HIT_TOLERANCE) -> bool:
+        """
+        Confere um acerto contra a posição rebobinada do alvo.
+
+        Args:
+            entity_id: Alvo
+            hit_x, hit_y: Ponto de impacto informado pelo atirador
+            size: Lado do quadrado do alvo
+            view_time: Instante (relógio do servidor) que o atirador via
+            tolerance: Folga em pixels (arredondamentos e interpolação)
+
+        Returns:
+            True se o ponto estava dentro do alvo naquele instante
+        """
+        pos = self.position_at(entity_id, self.clamp_view_time(view_time))
+        if pos is None:
+            return False
+
+        x, y = pos
+        return (x - tolerance <= hit_x <= x + size + tolerance and
+                y - tolerance <= hit_y <= y + size + tolerance)
@@ -0,0 +1,240 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Lockstep determinístico para os minigames.
+
+No modo normal cada cliente roda a própria física e troca ações soltas
+(MINIGAME_ACTION) quando algo acontece. Em lockstep, todos simulam o mesmo
+jogo em ticks fixos e só trocam inputs:
+
+- o input produzido no tick T é aplicado no tick T + input_delay, em todos
+  os clientes ao mesmo tempo;
+- um tick só avança quando o input de todos os jogadores para ele chegou
+  (quem está adiantado espera);
+- o sorteio usa um random.Random(seed) por partida, nunca o random global
+  (que partículas e sons continuam usando à vontade);
+- a cada tick o jogo informa o checksum do estado; a cada hash_interval
+  ticks ele é trocado com os outros clientes, e um tick divergente é
+  gravado pelo DesyncDetector (checksum.py).
+
+Os inputs são enviados em grupos de send_every ticks (um input não vazio,
+como um tiro, vai na hora).
+
+A saída de um jogador também vale a partir de um tick combinado
+(lockstep_saida): quem sai avisa o primeiro tick sem input dele; se ele
+cair sem avisar, o jogador de menor id entre os que ficaram (sem contar
+quem já saiu avisando) anuncia esse tick. Até lá o jogador continua sendo esperado, então todos os clientes
+aplicam os mesmos inputs dele e param de esperá-lo no mesmo tick.
+"""
+
+import random
+from typing import Any, Dict, List, Optional, Tuple
+
+from .config_network import (
+    LOCKSTEP_TICK_RATE, LOCKSTEP_INPUT_DELAY, LOCKSTEP_SEND_EVERY,
+    LOCKSTEP_HASH_INTERVAL
+)
+from .checksum import DesyncDetector, StateChecksum
+
+
+class LockstepSession:
+    """Uma partida de minigame em lockstep entre os jogadores da sala."""
+
+    def __init__(self, cliente, seed: int, tick_rate: int = LOCKSTEP_TICK_RATE,
+                 input_delay: int = LOCKSTEP_INPUT_DELAY, send_every: int = LOCKSTEP_SEND_EVERY,
+                 hash_interval: int = LOCKSTEP_HASH_INTERVAL, nome: str = 'minigame'):
+        """
+        Args:
+            cliente: GameClient conectado
+            seed: Seed compartilhado da partida (também identifica a sessão)
+            tick_rate: Ticks por segundo
+            input_delay: Ticks entre produzir um input e aplicá-lo
+            send_every: Ticks de input juntados em cada envio
+            hash_interval: Ticks entre trocas de hash do estado
+            nome: Nome do minigame (nos arquivos de desync)
+        """
+        self.cliente = cliente
+        self.seed = seed
+        self.rng = random.Random(seed)
+        self.tick_rate = tick_rate
+        self.input_delay = input_delay
+        self.send_every = max(1, send_every)
+        self.hash_interval = hash_interval
+
+        self.tick = 0
+        self.local_id = cliente.local_player_id
+        self.peers = {self.local_id, *cliente.get_remote_players().keys()}
+
+        # Inputs por tick: {tick: {player_id: input}} (None = tick sem input)
+        self.inputs: Dict[int, Dict[int, Any]] = {}
+        # Último tick com input conhecido de cada jogador
+        # (os primeiros input_delay ticks não têm input de ninguém)
+        self.recebido_ate: Dict[int, int] = {pid: input_delay - 1 for pid in self.peers}
+
+        # Inputs locais ainda não enviados, a partir do tick primeiro_pendente
+        self.pendentes: List[Any] = []
+        self.primeiro_pendente = input_delay
+
+        # Saídas combinadas: {player_id: primeiro tick sem o jogador}
+        self.saidas: Dict[int, int] = {}
+
+        self.detector = DesyncDetector(cliente, seed, nome=nome)
+
+        # Frames em que a simulação ficou esperando inputs
+        self.ticks_esperando = 0
+
+    @property
+    def desyncs(self) -> List[Dict]:
+        """Desyncs detectados nesta sessão."""
+        return self.detector.desyncs
+
+    def tempo_ms(self) -> int:
+        """Tempo de jogo (ms) do tick atual, igual em todos os clientes."""
+        return self.tick * 1000 // self.tick_rate
+
+    def receber(self) -> List[Dict]:
+        """
+        Lê as ações recebidas: guarda inputs e hashes desta sessão.
+
+        Returns:
+            Ações que não são do lockstep (para o minigame tratar)
+        """
+        # Lida antes das ações: o servidor repassa as ações de um jogador antes
+        # do aviso de saída dele, então quem já não o vê aqui tem todos os inputs dele
+        remotos = self.cliente.get_remote_players()
+
+        outras = []
+        for action in self.cliente.get_minigame_actions():
+            if self.detector.processar(action):
+                continue
+            if action.get('action') not in ('lockstep_inputs', 'lockstep_saida'):
+                outras.append(action)
+                continue
+            if action.get('seed') != self.seed:
+                continue  # Sobra de uma partida anterior
+
+            if action['action'] == 'lockstep_saida':
+                self._aplicar_saida(action['saiu'], int(action['tick']))
+                continue
+
+            pid = action.get('player_id')
+            primeiro = int(action['de'])
+            entradas = action.get('inputs', [])
+            for i, entrada in enumerate(entradas):
+                self.inputs.setdefault(primeiro + i, {})[pid] = entrada
+            if entradas:
+                ultimo = primeiro + len(entradas) - 1
+                self.recebido_ate[pid] = max(self.recebido_ate.get(pid, -1), ultimo)
+
+        # Jogador que caiu sem avisar: o de menor id entre os que ficaram
+        # anuncia o tick da saída (o primeiro sem input dele). Quem já saiu
+        # com sair() pode continuar conectado, mas não conta mais
+        conectados = [pid for pid in self.peers
+                      if (pid == self.local_id or pid in remotos) and pid not in self.saidas]
+        if conectados and self.local_id == min(conectados):
+            for pid in sorted(self.peers):
+                if pid not in remotos and pid != self.local_id and pid not in self.saidas:
+                    self._anunciar_saida(pid, self.recebido_ate.get(pid, -1) + 1)
+
+        return outras
+
+    def sair(self):
+        """
+        Avisa os outros que o jogador local saiu da partida: envia os
+        inputs pendentes e o primeiro tick sem input dele.
+        """
+        self._enviar_pendentes()
+        self._anunciar_saida(self.local_id, self.primeiro_pendente)
+
+    def saiu(self, pid: int) -> bool:
+        """True se o jogador já saiu da partida no tick atual (igual em todos os clientes)."""
+        return not self._ativo(pid, self.tick)
+
+    def pronto(self) -> bool:
+        """
+        True se o input de todos os jogadores para o tick atual já chegou.
+        Enquanto espera, envia o que estiver pendente (os outros podem
+        estar esperando justamente por esses inputs).
+        """
+        if all(self.recebido_ate.get(pid, -1) >= self.tick
+               for pid in self.peers if self._ativo(pid, self.tick)):
+            return True
+        self._enviar_pendentes()
+        self.ticks_esperando += 1
+        return False
+
+    def registrar_input(self, entrada: Optional[Dict] = None):
+        """
+        Registra o input local produzido neste tick (aplicado em tick + input_delay).
+
+        Args:
+            entrada: Dict com o input (JSON), ou None se nada aconteceu
+        """
+        tick_alvo = self.tick + self.input_delay
+        self.inputs.setdefault(tick_alvo, {})[self.local_id] = entrada
+        self.recebido_ate[self.local_id] = tick_alvo
+
+        self.pendentes.append(entrada)
+        if entrada is not None or len(self.pendentes) >= self.send_every:
+            self._enviar_pendentes()
+
+    def entradas(self) -> List[Tuple[int, Dict]]:
+        """
+        Inputs do tick atual, na mesma ordem em todos os clientes.
+
+        Returns:
+            Lista de (player_id, input), só os não vazios, por player_id
+        """
+        do_tick = self.inputs.get(self.tick, {})
+        return sorted((pid, entrada) for pid, entrada in do_tick.items()
+                      if entrada is not None and pid in self.peers and self._ativo(pid, self.tick))
+
+    def concluir_tick(self, checksum: Optional[StateChecksum] = None):
+        """
+        Fecha o tick atual e passa para o próximo.
+
+        Args:
+            checksum: Estado do jogo depois deste tick
+        """
+        if checksum is not None:
+            enviar = bool(self.hash_interval) and self.tick % self.hash_interval == 0
+            self.detector.registrar(self.tick, checksum, enviar=enviar)
+
+        self.inputs.pop(self.tick, None)
+        self.tick += 1
+
+    def _ativo(self, pid: int, tick: int) -> bool:
+        return tick < self.saidas.get(pid, tick + 1)
+
+    def _anunciar_saida(self, pid: int, tick: int):
+        self.cliente.send_minigame_action({
+            'action': 'lockstep_saida',
+            'seed': self.seed,
+            'saiu': pid,
+            'tick': tick,
+        }, critical=True)
+        self._aplicar_saida(pid, tick)
+
+    def _aplicar_saida(self, pid: int, tick: int):
+        """Tira o jogador da partida a partir do tick (vale o primeiro aviso)."""
+        if pid not in self.peers or pid in self.saidas:
+            return
+        self.saidas[pid] = tick
+        if tick < self.tick:
+            print(f"❌ [LOCKSTEP] Saída do jogador {pid} no tick {tick}, mas este cliente "
+                  f"já está no tick {self.tick} (o estado vai divergir)")
+        else:
+            print(f"⚠️ [LOCKSTEP] Jogador {pid} saiu, seguindo sem ele a partir do tick {tick}")
+
+    def _enviar_pendentes(self):
+        if not self.pendentes:
+            return
+        self.cliente.send_minigame_action({
+            'action': 'lockstep_inputs',
+            'seed': self.seed,
+            'de': self.primeiro_pendente,
+            'inputs': self.pendentes,
+        }, critical=True)
+        self.primeiro_pendente += len(self.pendentes)
+        self.pendentes = []
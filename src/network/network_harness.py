@@ -0,0 +1,430 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Harness de teste de rede: sobe um GameServer, um proxy com condições de
+rede simuladas e N clientes sem interface, movimenta os clientes com
+inputs aleatórios e reporta latência (percentis de RTT), dessincronia
+(distância entre a posição que cada cliente vê dos outros jogadores e a
+posição autoritativa no servidor) e a banda por tipo de pacote.
+
+Com --lockstep os clientes jogam uma partida de lockstep (LockstepSession)
+com uma simulação mínima movida pelos inputs e pelo rng da sessão; com
+3+ clientes um sai avisando a um terço do teste e outro cai na metade, e o
+relatório compara os hashes de todos os ticks que os clientes que ficaram
+simularam. --lockstep-saidas escolhe quem sai: os de maior id (quem anuncia
+a queda continua sendo o de menor id) ou o de menor id (outro jogador
+precisa anunciar a queda).
+
+Uso:
+    python -m src.network.network_harness --clients 4 --duration 20 --profile wifi
+    python -m src.network.network_harness --latency 80 --jitter 30 --loss 0.02
+    python -m src.network.network_harness --telemetry telemetria_{role}.jsonl
+    python -m src.network.network_harness --clients 4 --lockstep --profile wifi
+    python -m src.network.network_harness --clients 3 --lockstep --lockstep-saidas menor
+"""
+
+import argparse
+import math
+import random
+import socket
+import threading
+import time
+from typing import Dict, List
+
+from .checksum import StateChecksum
+from .game_client import GameClient
+from .game_server import GameServer
+from .lockstep import LockstepSession
+from .network_simulator import NetworkConditions, NetworkConditionProxy
+from .telemetry import percentile
+
+# Um cliente que ficou no lockstep está travado se terminou abaixo desta
+# fração dos ticks esperados pelo tempo jogado, ou se ficou mais que estes
+# segundos seguidos esperando inputs (a latência sozinha causa esperas curtas)
+LOCKSTEP_TICKS_MIN = 0.4
+LOCKSTEP_ESPERA_MAX_S = 2.0
+
+
+def _free_port() -> int:
+    """Pede ao sistema uma porta TCP livre."""
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
+        s.bind(('127.0.0.1', 0))
+        return s.getsockname()[1]
+
+
+class HeadlessClient(GameClient):
+    """GameClient sem interface que guarda todas as medições de RTT."""
+
+    def __init__(self):
+        super().__init__()
+        self.rtt_samples: List[float] = []
+
+    def _handle_pong(self, data: Dict):
+        super()._handle_pong(data)
+        if data.get('timestamp', 0) > 0:
+            self.rtt_samples.append(self.latency)
+
+
+class NetworkHarness:
+    """Executa um cenário de teste com servidor, proxy e clientes."""
+
+    def __init__(self, num_clients: int = 2, duration: float = 10.0,
+                 upstream: NetworkConditions = None, downstream: NetworkConditions = None,
+                 input_rate: float = 60.0, seed: int = 0, telemetry_path: str = None,
+                 lockstep: bool = False, lockstep_saidas: str = 'maiores'):
+        self.num_clients = num_clients
+        self.duration = duration
+        self.upstream = upstream or NetworkConditions()
+        self.downstream = downstream or NetworkConditions()
+        self.input_rate = input_rate
+        self.seed = seed
+        self.telemetry_path = telemetry_path
+        self.lockstep = lockstep
+        self.lockstep_saidas = lockstep_saidas
+
+        self.server = None
+        self.proxy = None
+        self.clients: List[HeadlessClient] = []
+
+        # Erros de posição (px) de jogadores remotos vistos por cada cliente
+        self.desync_samples: List[float] = []
+        # Tamanho das correções que o servidor aplicou à predição local (px)
+        self.correction_samples: List[float] = []
+        self.desync_lock = threading.Lock()
+
+        # Sessões de lockstep por índice do cliente (--lockstep)
+        self.sessions: Dict[int, LockstepSession] = {}
+        # Tempo (s) que cada cliente que ficou jogou a partida e a maior
+        # sequência de frames seguidos esperando inputs
+        self.lockstep_tempos: Dict[int, float] = {}
+        self.lockstep_esperas: Dict[int, int] = {}
+
+    def run(self) -> Dict:
+        """
+        Executa o cenário completo.
+
+        Returns:
+            Dicionário com o relatório de métricas
+        """
+        port = _free_port()
+        self.server = GameServer(host='127.0.0.1', port=port, max_players=self.num_clients)
+        if self.telemetry_path:
+            self.server.telemetry.dump_path = self.telemetry_path.format(role='server')
+        if not self.server.start():
+            raise RuntimeError("Não foi possível iniciar o servidor")
+
+        self.proxy = NetworkConditionProxy('127.0.0.1', port,
+                                           upstream=self.upstream,
+                                           downstream=self.downstream)
+        if not self.proxy.start():
+            self.server.stop()
+            raise RuntimeError("Não foi possível iniciar o proxy")
+
+        try:
+            for i in range(self.num_clients):
+                client = HeadlessClient()
+                if self.telemetry_path:
+                    client.telemetry.dump_path = self.telemetry_path.format(role=f'client{i + 1}')
+                if not client.connect('127.0.0.1', self.proxy.listen_port, f"Bot{i + 1}"):
+                    raise RuntimeError(f"Cliente {i + 1} não conectou")
+                self.clients.append(client)
+
+            # Esperar todos receberem o FULL_SYNC
+            limite = time.time() + 10.0
+            while time.time() < limite and not all(c.local_player_id for c in self.clients):
+                time.sleep(0.01)
+
+            alvo = self._drive_client
+            if self.lockstep:
+                alvo = self._drive_lockstep
+                # A sessão começa com todos os jogadores conhecidos
+                while time.time() < limite and not all(
+                        len(c.get_remote_players()) == self.num_clients - 1 for c in self.clients):
+                    time.sleep(0.01)
+
+            threads = [
+                threading.Thread(target=alvo, args=(client, i), daemon=True)
+                for i, client in enumerate(self.clients)
+            ]
+            for t in threads:
+                t.start()
+            for t in threads:
+                t.join()
+
+            return self._build_report()
+
+        finally:
+            for client in self.clients:
+                client.disconnect()
+            self.proxy.stop()
+            self.server.stop()
+
+    def _drive_client(self, client: HeadlessClient, index: int):
+        """Simula um jogador: inputs aleatórios, pings e amostragem de dessincronia."""
+        rng = random.Random(self.seed + index)
+        dt = 1.0 / self.input_rate
+        fim = time.time() + self.duration
+        keys = {'w': False, 'a': False, 's': False, 'd': False}
+        proxima_troca = 0.0
+        proximo_ping = 0.0
+        proxima_amostra = 0.0
+
+        while time.time() < fim and client.is_connected():
+            agora = time.time()
+
+            if agora >= proxima_troca:
+                keys = {k: rng.random() < 0.35 for k in keys}
+                proxima_troca = agora + rng.uniform(0.2, 0.8)
+
+            client.send_player_input(keys, 0, 0, False)
+            client.update_interpolation(dt)
+
+            if agora >= proximo_ping:
+                client.send_ping()
+                proximo_ping = agora + 0.25
+
+            if agora >= proxima_amostra:
+                self._sample_desync(client)
+                proxima_amostra = agora + 0.1
+
+            time.sleep(dt)
+
+    def _drive_lockstep(self, client: HeadlessClient, index: int):
+        """
+        Joga uma partida de lockstep: cada input é um passo do próprio
+        quadrado, e o rng da sessão move um alvo comum. O jogador de maior
+        id cai na metade do teste e, com 3+ clientes, outro sai avisando
+        (sair()) a um terço: o segundo maior id, ou o menor id com
+        lockstep_saidas='menor'.
+        """
+        rng = random.Random(self.seed + index)
+        sessao = LockstepSession(client, seed=self.seed, nome='harness')
+        self.sessions[index] = sessao
+        posicoes = {pid: [0, 0] for pid in sorted(sessao.peers)}
+        alvo = [0, 0]
+
+        # Os papéis saem dos ids (iguais em todos os clientes), não da ordem de conexão
+        ids = sorted(sessao.peers)
+        saida = None
+        fim_saida = time.time() + self.duration / 2
+        if len(ids) >= 2 and sessao.local_id == ids[-1]:
+            saida = 'queda'
+        elif len(ids) >= 3 and sessao.local_id == (ids[0] if self.lockstep_saidas == 'menor' else ids[-2]):
+            saida = 'aviso'
+            fim_saida = time.time() + self.duration / 3
+        inicio = time.time()
+        fim = inicio + self.duration
+        dt = 1.0 / sessao.tick_rate
+        proximo_ping = 0.0
+        esperando = 0
+        self.lockstep_esperas[index] = 0
+
+        while time.time() < fim and client.is_connected():
+            if saida and time.time() >= fim_saida:
+                if saida == 'queda':
+                    client.disconnect()
+                else:
+                    sessao.sair()
+                return
+
+            sessao.receber()
+            if not sessao.pronto():
+                esperando += 1
+                self.lockstep_esperas[index] = max(self.lockstep_esperas[index], esperando)
+            else:
+                esperando = 0
+                entrada = None
+                if rng.random() < 0.2:
+                    entrada = {'passo': [rng.randint(-3, 3), rng.randint(-3, 3)]}
+                sessao.registrar_input(entrada)
+
+                for pid, entrada in sessao.entradas():
+                    posicoes[pid][0] += entrada['passo'][0]
+                    posicoes[pid][1] += entrada['passo'][1]
+                alvo[0] += sessao.rng.randint(-1, 1)
+                alvo[1] += sessao.rng.randint(-1, 1)
+
+                checksum = StateChecksum().add('alvo', alvo)
+                for pid in sorted(posicoes):
+                    checksum.add(f'pos.{pid}', posicoes[pid])
+                sessao.concluir_tick(checksum)
+
+            if time.time() >= proximo_ping:
+                client.send_ping()
+                proximo_ping = time.time() + 0.25
+            time.sleep(dt)
+
+        self.lockstep_tempos[index] = time.time() - inicio
+
+    def _lockstep_report(self) -> Dict:
+        """
+        Compara os hashes dos ticks guardados pelos clientes que ficaram até
+        o fim e aponta os que travaram esperando inputs.
+        """
+        indices = [i for i in sorted(self.sessions)
+                   if self.clients[i].is_connected() and self.sessions[i].local_id not in self.sessions[i].saidas]
+        ficaram = [self.sessions[i] for i in indices]
+        esperados = [int(self.lockstep_tempos.get(i, 0.0) * self.sessions[i].tick_rate) for i in indices]
+        esperas = [self.lockstep_esperas.get(i, 0) for i in indices]
+        travados = [s.local_id for s, esperado, espera in zip(ficaram, esperados, esperas)
+                    if s.tick < esperado * LOCKSTEP_TICKS_MIN
+                    or espera > LOCKSTEP_ESPERA_MAX_S * s.tick_rate]
+        comuns = set.intersection(*(set(s.detector.locais) for s in ficaram)) if ficaram else set()
+        divergentes = [t for t in sorted(comuns)
+                       if len({s.detector.locais[t][0] for s in ficaram}) > 1]
+        return {
+            'ticks': [s.tick for s in ficaram],
+            'expected_ticks': esperados,
+            'waiting_ticks': [s.ticks_esperando for s in ficaram],
+            'longest_wait': esperas,
+            'departures': {pid: tick for s in ficaram for pid, tick in s.saidas.items()},
+            'compared_ticks': len(comuns),
+            'diverged_ticks': len(divergentes),
+            'desyncs': sum(len(s.desyncs) for s in ficaram),
+            'stalled': travados,
+        }
+
+    def _sample_desync(self, client: HeadlessClient):
+        """Compara a visão do cliente com as posições autoritativas do servidor."""
+        verdade = {p['id']: (p['x'], p['y']) for p in self.server.get_connected_players()}
+        erros = []
+        for pid, remoto in client.get_remote_players().items():
+            if pid in verdade:
+                vx, vy = verdade[pid]
+                erros.append(math.hypot(remoto.x - vx, remoto.y - vy))
+
+        with self.desync_lock:
+            self.desync_samples.extend(erros)
+            self.correction_samples.append(client.prediction.last_correction)
+
+    def _build_report(self) -> Dict:
+        todos_rtt = [rtt for c in self.clients for rtt in c.rtt_samples]
+        por_cliente = []
+        for c in self.clients:
+            por_cliente.append({
+                'id': c.local_player_id,
+                'name': c.local_player_name,
+                'rtt_samples': len(c.rtt_samples),
+                'rtt_p50': percentile(c.rtt_samples, 50),
+                'rtt_p95': percentile(c.rtt_samples, 95),
+                'rtt_p99': percentile(c.rtt_samples, 99),
+            })
+
+        with self.desync_lock:
+            desync = list(self.desync_samples)
+            correcoes = list(self.correction_samples)
+
+        report = {
+            'clients': por_cliente,
+            'rtt_ms': {
+                'p50': percentile(todos_rtt, 50),
+                'p90': percentile(todos_rtt, 90),
+                'p95': percentile(todos_rtt, 95),
+                'p99': percentile(todos_rtt, 99),
+                'max': max(todos_rtt) if todos_rtt else 0.0,
+            },
+            'desync_px': {
+                'samples': len(desync),
+                'mean': sum(desync) / len(desync) if desync else 0.0,
+                'p50': percentile(desync, 50),
+                'p95': percentile(desync, 95),
+                'max': max(desync) if desync else 0.0,
+            },
+            'prediction_correction_px': {
+                'p50': percentile(correcoes, 50),
+                'p95': percentile(correcoes, 95),
+                'max': max(correcoes) if correcoes else 0.0,
+            },
+            'proxy': self.proxy.get_stats(),
+            'server_telemetry': self.server.telemetry.snapshot(),
+        }
+        if self.lockstep:
+            report['lockstep'] = self._lockstep_report()
+        return report
+
+
+def print_report(report: Dict):
+    """Imprime o relatório do harness em formato legível."""
+    print("\n===== RELATÓRIO DE REDE =====")
+    rtt = report['rtt_ms']
+    print(f"RTT (ms): p50={rtt['p50']:.1f} p90={rtt['p90']:.1f} "
+          f"p95={rtt['p95']:.1f} p99={rtt['p99']:.1f} max={rtt['max']:.1f}")
+    for c in report['clients']:
+        print(f"  {c['name']} (ID {c['id']}): {c['rtt_samples']} amostras, "
+              f"p50={c['rtt_p50']:.1f} p95={c['rtt_p95']:.1f} p99={c['rtt_p99']:.1f}")
+
+    d = report['desync_px']
+    print(f"Dessincronia (px): média={d['mean']:.1f} p50={d['p50']:.1f} "
+          f"p95={d['p95']:.1f} max={d['max']:.1f} ({d['samples']} amostras)")
+
+    c = report['prediction_correction_px']
+    print(f"Correção da predição (px): p50={c['p50']:.1f} p95={c['p95']:.1f} max={c['max']:.1f}")
+
+    tele = report['server_telemetry']
+    print(f"Tick do servidor (ms): média={tele['tick_ms']['mean']:.2f} "
+          f"p95={tele['tick_ms']['p95']:.2f} max={tele['tick_ms']['max']:.2f}")
+    print("Pacotes no servidor (por bytes enviados + recebidos):")
+    por_tipo = sorted(tele['packets'].items(),
+                      key=lambda item: item[1]['out_bytes'] + item[1]['in_bytes'], reverse=True)
+    for nome, p in por_tipo:
+        print(f"  {nome:<16} out {p['out_packets']:>6} pk {p['out_bytes'] / 1024:>8.1f} KB | "
+              f"in {p['in_packets']:>6} pk {p['in_bytes'] / 1024:>8.1f} KB | "
+              f"enc {p['encode_us']:.0f}us dec {p['decode_us']:.0f}us")
+
+    proxy = report['proxy']
+    for direcao in ('upstream', 'downstream'):
+        s = proxy[direcao]
+        print(f"Proxy {direcao}: {s['packets']} pacotes, {s['bytes'] / 1024:.1f} KB, "
+              f"{s['lost']} retransmitidos")
+
+    ls = report.get('lockstep')
+    if ls:
+        print(f"Lockstep: ticks {ls['ticks']} de {ls['expected_ticks']} esperados, "
+              f"esperando {ls['waiting_ticks']} (no máximo {ls['longest_wait']} seguidos), "
+              f"saídas {ls['departures']}")
+        print(f"  {ls['compared_ticks']} ticks conferidos, {ls['diverged_ticks']} divergentes, "
+              f"{ls['desyncs']} desyncs detectados")
+        if ls['stalled']:
+            print(f"  ❌ Travados esperando inputs: {ls['stalled']}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Testa o multiplayer sob condições de rede simuladas")
+    parser.add_argument('--clients', type=int, default=2, help="Número de clientes sem interface")
+    parser.add_argument('--duration', type=float, default=10.0, help="Duração do teste (s)")
+    parser.add_argument('--profile', choices=sorted(NetworkConditions.PROFILES),
+                        help="Perfil de rede pronto (sobrescreve os parâmetros abaixo)")
+    parser.add_argument('--latency', type=float, default=0.0, help="Latência de ida (ms)")
+    parser.add_argument('--jitter', type=float, default=0.0, help="Jitter (ms)")
+    parser.add_argument('--distribution', choices=NetworkConditions.DISTRIBUTIONS, default='uniform')
+    parser.add_argument('--loss', type=float, default=0.0, help="Probabilidade de perda (0-1)")
+    parser.add_argument('--bandwidth', type=float, default=0.0, help="Banda em kbit/s (0 = ilimitada)")
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--telemetry', help="Arquivo JSON lines da telemetria ('{role}' vira server/clientN)")
+    parser.add_argument('--lockstep', action='store_true',
+                        help="Jogar uma partida em lockstep (com um cliente caindo e outro saindo)")
+    parser.add_argument('--lockstep-saidas', choices=('maiores', 'menor'), default='maiores',
+                        help="Quem sai avisando no lockstep: o segundo maior id ou o menor id")
+    args = parser.parse_args()
+
+    def condicoes(seed):
+        if args.profile:
+            return NetworkConditions.from_profile(args.profile, seed=seed)
+        return NetworkConditions(latency_ms=args.latency, jitter_ms=args.jitter,
+                                 distribution=args.distribution, loss=args.loss,
+                                 bandwidth_kbps=args.bandwidth, seed=seed)
+
+    harness = NetworkHarness(num_clients=args.clients, duration=args.duration,
+                             upstream=condicoes(args.seed), downstream=condicoes(args.seed + 1),
+                             seed=args.seed, telemetry_path=args.telemetry, lockstep=args.lockstep,
+                             lockstep_saidas=args.lockstep_saidas)
+    report = harness.run()
+    print_report(report)
+    lockstep = report.get('lockstep', {})
+    if lockstep.get('diverged_ticks') or lockstep.get('stalled'):
+        raise SystemExit(1)
+
+
+if __name__ == '__main__':
+    main()
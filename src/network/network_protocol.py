@@ -8,6 +8,8 @@ Define os tipos de pacotes e métodos de serialização/deserialização.
 
 import json
 import struct
+import threading
+import time
 from enum import IntEnum
 from typing import Dict, Any, Optional
 
@@ -23,6 +25,7 @@ class PacketType(IntEnum):
     GAME_STATE = 10
     PLAYER_INPUT = 11
     PLAYER_UPDATE = 12
+    VIEW_AREA = 13  # Cliente informa o raio de visão (zoom da câmera)
 
     # Entidades
     ENEMY_UPDATE = 20
@@ -43,6 +46,7 @@ class PacketType(IntEnum):
     # Sincronização
     FULL_SYNC = 40
     PARTIAL_SYNC = 41
+    BATCH = 42  # Lote de inputs e ações juntados pelo cliente
 
     # Minigame
     MINIGAME_ACTION = 50
@@ -61,6 +65,23 @@ class NetworkProtocol:
     HEADER_SIZE = 6
     HEADER_FORMAT = '!BBI'  # unsigned char, unsigned char, unsigned int
 
+    # Tempo gasto em JSON por tipo (telemetria): {tipo: [n_encode, s_encode, n_decode, s_decode]}
+    _codec_stats: Dict[int, list] = {}
+    _codec_lock = threading.Lock()
+
+    @staticmethod
+    def _record_codec(packet_type: int, index: int, seconds: float):
+        with NetworkProtocol._codec_lock:
+            entry = NetworkProtocol._codec_stats.setdefault(packet_type, [0, 0.0, 0, 0.0])
+            entry[index] += 1
+            entry[index + 1] += seconds
+
+    @staticmethod
+    def get_codec_stats() -> Dict[int, tuple]:
+        """Cópia dos tempos de codificação/decodificação por tipo de pacote."""
+        with NetworkProtocol._codec_lock:
+            return {t: tuple(v) for t, v in NetworkProtocol._codec_stats.items()}
+
     @staticmethod
     def create_packet(packet_type: PacketType, data: Optional[Dict[str, Any]] = None) -> bytes:
         """
@@ -77,7 +98,9 @@ class NetworkProtocol:
         if data is None:
             data = {}
 
+        start = time.perf_counter()
         json_data = json.dumps(data, separators=(',', ':')).encode('utf-8')
+        NetworkProtocol._record_codec(int(packet_type), 0, time.perf_counter() - start)
 
         # Verificar tamanho
         if len(json_data) > NetworkProtocol.MAX_PACKET_SIZE - NetworkProtocol.HEADER_SIZE:
@@ -130,19 +153,22 @@ class NetworkProtocol:
         # Extrair dados JSON
         json_data = packet_data[NetworkProtocol.HEADER_SIZE:NetworkProtocol.HEADER_SIZE + data_length]
 
+        start = time.perf_counter()
         try:
             data = json.loads(json_data.decode('utf-8'))
         except (json.JSONDecodeError, UnicodeDecodeError):
             return None
+        NetworkProtocol._record_codec(packet_type, 2, time.perf_counter() - start)
 
         return (PacketType(packet_type), data)
 
     @staticmethod
-    def create_connect_packet(player_name: str) -> bytes:
-        """Cria um pacote de conexão."""
-        return NetworkProtocol.create_packet(PacketType.CONNECT, {
-            'player_name': player_name
-        })
+    def create_connect_packet(player_name: str, room: Optional[str] = None) -> bytes:
+        """Cria um pacote de conexão (room: sala desejada no servidor de salas)."""
+        data = {'player_name': player_name}
+        if room:
+            data['room'] = room
+        return NetworkProtocol.create_packet(PacketType.CONNECT, data)
 
     @staticmethod
     def create_disconnect_packet(player_id: int) -> bytes:
@@ -169,10 +195,11 @@ class NetworkProtocol:
     @staticmethod
     def create_player_input_packet(player_id: int, keys: Dict[str, bool],
                                    mouse_x: int, mouse_y: int,
-                                   shooting: bool) -> bytes:
-        """Cria um pacote de input do jogador."""
+                                   shooting: bool, seq: int = 0) -> bytes:
+        """Cria um pacote de input do jogador (seq numera o input para reconciliação)."""
         return NetworkProtocol.create_packet(PacketType.PLAYER_INPUT, {
             'player_id': player_id,
+            'seq': seq,
             'keys': keys,
             'mouse_x': mouse_x,
             'mouse_y': mouse_y,
@@ -203,21 +230,24 @@ class NetworkProtocol:
 
     @staticmethod
     def create_bullet_hit_packet(bullet_id: int, target_id: int,
-                                 target_type: str) -> bytes:
-        """Cria um pacote de tiro acertado."""
+                                 target_type: str, extra: Optional[Dict[str, Any]] = None) -> bytes:
+        """Cria um pacote de tiro acertado (extra: ponto de impacto, view_time, dano...)."""
         return NetworkProtocol.create_packet(PacketType.BULLET_HIT, {
             'bullet_id': bullet_id,
             'target_id': target_id,
-            'target_type': target_type
+            'target_type': target_type,
+            **(extra or {})
         })
 
     @staticmethod
-    def create_team_select_packet(player_id: int, team: str, player_name: str) -> bytes:
-        """Cria um pacote de seleção de time."""
+    def create_team_select_packet(player_id: int, team: str, player_name: str,
+                                  player_class: Optional[str] = None) -> bytes:
+        """Cria um pacote de seleção de time (com a classe, que define a vida máxima)."""
         return NetworkProtocol.create_packet(PacketType.TEAM_SELECT, {
             'player_id': player_id,
             'team': team,
-            'player_name': player_name
+            'player_name': player_name,
+            'player_class': player_class
         })
 
     @staticmethod
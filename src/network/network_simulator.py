@@ -0,0 +1,339 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Simulador de condições de rede para testes do multiplayer.
+
+Funciona como um proxy TCP local entre o GameClient e o GameServer:
+os clientes conectam na porta do proxy, que repassa os pacotes para o
+servidor aplicando latência, jitter, perda e limite de banda em cada
+direção. Nenhuma alteração no servidor ou no cliente é necessária.
+
+Como o transporte é TCP, um pacote "perdido" não some: ele é
+retransmitido após um tempo de RTO, e todos os pacotes seguintes ficam
+esperando por ele (head-of-line blocking), exatamente como acontece
+numa rede real.
+"""
+
+import random
+import socket
+import struct
+import threading
+import time
+from collections import deque
+from typing import Dict, Optional
+
+from .network_protocol import NetworkProtocol
+
+
+class NetworkConditions:
+    """Descreve as condições de uma direção do link simulado."""
+
+    # Perfis prontos para testes rápidos
+    PROFILES = {
+        'lan': {'latency_ms': 1, 'jitter_ms': 0.5},
+        'wifi': {'latency_ms': 15, 'jitter_ms': 8, 'loss': 0.005},
+        'dsl': {'latency_ms': 40, 'jitter_ms': 10, 'loss': 0.005, 'bandwidth_kbps': 1024},
+        '4g': {'latency_ms': 60, 'jitter_ms': 25, 'distribution': 'pareto', 'loss': 0.01},
+        '3g': {'latency_ms': 150, 'jitter_ms': 50, 'distribution': 'pareto',
+               'loss': 0.02, 'bandwidth_kbps': 384},
+        'ruim': {'latency_ms': 250, 'jitter_ms': 120, 'distribution': 'pareto',
+                 'loss': 0.05, 'bandwidth_kbps': 128},
+    }
+
+    DISTRIBUTIONS = ('uniform', 'normal', 'pareto')
+
+    def __init__(self, latency_ms: float = 0.0, jitter_ms: float = 0.0,
+                 distribution: str = 'uniform', loss: float = 0.0,
+                 bandwidth_kbps: float = 0.0, retransmit_ms: float = 200.0,
+                 seed: Optional[int] = None):
+        """
+        Args:
+            latency_ms: Atraso base de cada pacote (apenas uma direção)
+            jitter_ms: Variação do atraso
+            distribution: Forma do jitter ('uniform', 'normal' ou 'pareto')
+            loss: Probabilidade (0-1) de um pacote precisar ser retransmitido
+            bandwidth_kbps: Limite de banda em kbit/s (0 = ilimitado)
+            retransmit_ms: Tempo até a retransmissão de um pacote perdido
+            seed: Seed do gerador (para repetir o mesmo cenário)
+        """
+        if distribution not in self.DISTRIBUTIONS:
+            raise ValueError(f"Distribuição desconhecida: {distribution}")
+
+        self.latency_ms = max(0.0, latency_ms)
+        self.jitter_ms = max(0.0, jitter_ms)
+        self.distribution = distribution
+        self.loss = min(1.0, max(0.0, loss))
+        self.bandwidth_kbps = max(0.0, bandwidth_kbps)
+        self.retransmit_ms = max(0.0, retransmit_ms)
+        self.rng = random.Random(seed)
+
+    @classmethod
+    def from_profile(cls, name: str, seed: Optional[int] = None) -> 'NetworkConditions':
+        """Cria as condições a partir de um perfil pronto (ex: 'wifi', '3g')."""
+        if name not in cls.PROFILES:
+            raise ValueError(f"Perfil desconhecido: {name}")
+        return cls(seed=seed, **cls.PROFILES[name])
+
+    def sample_delay(self) -> float:
+        """Sorteia o atraso de um pacote, em segundos."""
+        jitter = 0.0
+        if self.jitter_ms > 0:
+            if self.distribution == 'uniform':
+                jitter = self.rng.uniform(-self.jitter_ms, self.jitter_ms)
+            elif self.distribution == 'normal':
+                jitter = self.rng.gauss(0.0, self.jitter_ms)
+            else:
+                # Pareto: maioria dos pacotes rápida, cauda longa de atrasos
+                jitter = (self.rng.paretovariate(3.0) - 1.0) * self.jitter_ms
+
+        return max(0.0, self.latency_ms + jitter) / 1000.0
+
+    def is_lost(self) -> bool:
+        """Sorteia se o pacote será perdido (e retransmitido)."""
+        return self.loss > 0 and self.rng.random() < self.loss
+
+    def transmit_time(self, size: int) -> float:
+        """Tempo para colocar `size` bytes no link, em segundos."""
+        if self.bandwidth_kbps <= 0:
+            return 0.0
+        return (size * 8) / (self.bandwidth_kbps * 1000.0)
+
+
+class _SimulatedLink:
+    """
+    Uma direção do proxy: lê pacotes de um socket e os entrega no outro
+    depois do atraso calculado pelas condições de rede.
+    """
+
+    def __init__(self, source: socket.socket, destination: socket.socket,
+                 conditions: NetworkConditions, stats: Dict[str, int], on_close):
+        self.source = source
+        self.destination = destination
+        self.conditions = conditions
+        self.stats = stats
+        self.on_close = on_close
+
+        # Fila de (horário de entrega, pacote) em ordem de entrega
+        self.queue = deque()
+        self.queue_cond = threading.Condition()
+        self.running = True
+
+        # Instante em que o link termina de transmitir o último pacote
+        self.link_free_at = 0.0
+        self.last_release = 0.0
+
+    def start(self):
+        threading.Thread(target=self._read_loop, daemon=True).start()
+        threading.Thread(target=self._write_loop, daemon=True).start()
+
+    def stop(self):
+        with self.queue_cond:
+            self.running = False
+            self.queue_cond.notify_all()
+
+    def _read_exact(self, size: int) -> Optional[bytes]:
+        data = b''
+        while len(data) < size:
+            chunk = self.source.recv(size - len(data))
+            if not chunk:
+                return None
+            data += chunk
+        return data
+
+    def _read_loop(self):
+        try:
+            while self.running:
+                header = self._read_exact(NetworkProtocol.HEADER_SIZE)
+                if header is None:
+                    break
+                _, _, payload_length = struct.unpack(NetworkProtocol.HEADER_FORMAT, header)
+                payload = self._read_exact(payload_length)
+                if payload is None:
+                    break
+                self._schedule(header + payload)
+        except OSError:
+            pass
+        finally:
+            self.on_close()
+
+    def _schedule(self, packet: bytes):
+        """Calcula quando o pacote deve ser entregue e o coloca na fila."""
+        now = time.time()
+        cond = self.conditions
+
+        # Banda: o pacote só começa a ser transmitido quando o link liberar
+        self.link_free_at = max(self.link_free_at, now) + cond.transmit_time(len(packet))
+        release = self.link_free_at + cond.sample_delay()
+
+        lost = cond.is_lost()
+        if lost:
+            release += cond.retransmit_ms / 1000.0 + cond.sample_delay()
+
+        # TCP entrega em ordem: nenhum pacote passa na frente do anterior
+        release = max(release, self.last_release)
+        self.last_release = release
+
+        with self.queue_cond:
+            self.queue.append((release, packet))
+            self.stats['packets'] += 1
+            self.stats['bytes'] += len(packet)
+            if lost:
+                self.stats['lost'] += 1
+            self.queue_cond.notify()
+
+    def _write_loop(self):
+        try:
+            while True:
+                with self.queue_cond:
+                    while self.running and not self.queue:
+                        self.queue_cond.wait()
+                    if not self.running:
+                        return
+                    release, packet = self.queue[0]
+                    wait = release - time.time()
+                    if wait > 0:
+                        self.queue_cond.wait(wait)
+                        continue
+                    self.queue.popleft()
+
+                self.destination.sendall(packet)
+        except OSError:
+            self.on_close()
+
+
+class NetworkConditionProxy:
+    """
+    Proxy TCP que aplica condições de rede entre clientes e servidor.
+
+    Exemplo:
+        proxy = NetworkConditionProxy('127.0.0.1', 5555,
+                                      upstream=NetworkConditions(latency_ms=50),
+                                      downstream=NetworkConditions(latency_ms=50))
+        proxy.start()
+        cliente.connect('127.0.0.1', proxy.listen_port, 'Player')
+    """
+
+    def __init__(self, target_host: str, target_port: int,
+                 listen_host: str = '127.0.0.1', listen_port: int = 0,
+                 upstream: Optional[NetworkConditions] = None,
+                 downstream: Optional[NetworkConditions] = None):
+        """
+        Args:
+            target_host: Endereço do GameServer real
+            target_port: Porta do GameServer real
+            listen_host: Endereço onde o proxy escuta
+            listen_port: Porta onde o proxy escuta (0 = escolher porta livre)
+            upstream: Condições no sentido cliente -> servidor
+            downstream: Condições no sentido servidor -> cliente
+        """
+        self.target_host = target_host
+        self.target_port = target_port
+        self.listen_host = listen_host
+        self.listen_port = listen_port
+        self.upstream = upstream or NetworkConditions()
+        self.downstream = downstream or NetworkConditions()
+
+        self.server_socket = None
+        self.running = False
+        self.links = []
+        self.links_lock = threading.Lock()
+
+        self.stats = {
+            'connections': 0,
+            'upstream': {'packets': 0, 'bytes': 0, 'lost': 0},
+            'downstream': {'packets': 0, 'bytes': 0, 'lost': 0},
+        }
+
+    def start(self) -> bool:
+        """
+        Inicia o proxy.
+
+        Returns:
+            True se iniciado com sucesso
+        """
+        try:
+            self.server_socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+            self.server_socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+            self.server_socket.bind((self.listen_host, self.listen_port))
+            self.server_socket.listen(16)
+            self.listen_port = self.server_socket.getsockname()[1]
+            self.running = True
+
+            threading.Thread(target=self._accept_loop, daemon=True).start()
+
+            print(f"🧪 Proxy de rede em {self.listen_host}:{self.listen_port} "
+                  f"-> {self.target_host}:{self.target_port}")
+            return True
+
+        except Exception as e:
+            print(f"❌ Erro ao iniciar proxy de rede: {e}")
+            return False
+
+    def stop(self):
+        """Para o proxy e fecha todas as conexões."""
+        self.running = False
+        if self.server_socket:
+            try:
+                self.server_socket.close()
+            except OSError:
+                pass
+
+        with self.links_lock:
+            for link in self.links:
+                link.stop()
+                for sock in (link.source, link.destination):
+                    try:
+                        sock.close()
+                    except OSError:
+                        pass
+            self.links.clear()
+
+    def _accept_loop(self):
+        while self.running:
+            try:
+                client_socket, _ = self.server_socket.accept()
+            except OSError:
+                break
+
+            try:
+                server_socket = socket.create_connection((self.target_host, self.target_port))
+            except OSError as e:
+                print(f"❌ Proxy não conseguiu alcançar o servidor: {e}")
+                client_socket.close()
+                continue
+
+            for sock in (client_socket, server_socket):
+                sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+
+            self._create_pair(client_socket, server_socket)
+
+    def _create_pair(self, client_socket: socket.socket, server_socket: socket.socket):
+        """Cria os dois links (ida e volta) de uma conexão."""
+        def close_pair():
+            for sock in (client_socket, server_socket):
+                try:
+                    sock.shutdown(socket.SHUT_RDWR)
+                except OSError:
+                    pass
+
+        up = _SimulatedLink(client_socket, server_socket, self.upstream,
+                            self.stats['upstream'], close_pair)
+        down = _SimulatedLink(server_socket, client_socket, self.downstream,
+                              self.stats['downstream'], close_pair)
+
+        with self.links_lock:
+            self.links.extend([up, down])
+            self.stats['connections'] += 1
+
+        up.start()
+        down.start()
+
+    def get_stats(self) -> Dict:
+        """Retorna contadores de pacotes, bytes e perdas por direção."""
+        with self.links_lock:
+            return {
+                'connections': self.stats['connections'],
+                'upstream': dict(self.stats['upstream']),
+                'downstream': dict(self.stats['downstream']),
+            }
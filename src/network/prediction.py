@@ -0,0 +1,182 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Predição no cliente e reconciliação com o servidor.
+
+O cliente numera cada input enviado, aplica o movimento localmente na
+hora (sem esperar o servidor) e guarda os inputs ainda não confirmados.
+Quando chega um estado autoritativo com o número do último input
+processado pelo servidor (`ack`), o cliente volta para a posição do
+servidor e reaplica os inputs pendentes. Assim a resposta ao teclado não
+depende do ping, e qualquer divergência é corrigida no próximo estado.
+
+O mesmo passo de movimento roda no servidor e no cliente, o que garante
+que a predição bate com o resultado autoritativo: `apply_movement_input`
+no lobby e, no modo Bomb, o passo com colisão no mapa e habilidade de
+classe da simulação (`set_mover(..., stateful=True)` com
+`mover_com_classe`, de src/game/simulacao_bomba.py). Esse passo tem
+estado (recarga, turbo, dash...), que o servidor manda junto com a
+posição e a reconciliação usa como ponto de partida.
+"""
+
+import math
+import threading
+from collections import deque
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from .config_network import LOBBY_BOUNDS, PLAYER_MOVE_SPEED, MAX_PENDING_INPUTS
+
+
+def apply_movement_input(x: float, y: float, keys: Dict[str, bool],
+                         speed: float = PLAYER_MOVE_SPEED,
+                         bounds: Tuple[float, float, float, float] = LOBBY_BOUNDS) -> Tuple[float, float]:
+    """
+    Aplica um input (um frame de movimento) a uma posição.
+
+    Args:
+        x, y: Posição atual
+        keys: Estado das teclas WASD
+        speed: Deslocamento por input
+        bounds: Limites (min_x, min_y, max_x, max_y)
+
+    Returns:
+        Nova posição (x, y)
+    """
+    dx = 0.0
+    dy = 0.0
+
+    if keys.get('w', False):
+        dy -= speed
+    if keys.get('s', False):
+        dy += speed
+    if keys.get('a', False):
+        dx -= speed
+    if keys.get('d', False):
+        dx += speed
+
+    # Normalizar movimento diagonal
+    if dx != 0 and dy != 0:
+        fator = speed / math.sqrt(dx * dx + dy * dy)
+        dx *= fator
+        dy *= fator
+
+    min_x, min_y, max_x, max_y = bounds
+    return (max(min_x, min(max_x, x + dx)),
+            max(min_y, min(max_y, y + dy)))
+
+
+class ClientPrediction:
+    """Mantém a posição prevista do jogador local e os inputs pendentes."""
+
+    def __init__(self):
+        self.x: Optional[float] = None
+        self.y: Optional[float] = None
+
+        # Número de sequência do próximo input
+        self.next_seq = 1
+
+        # Inputs enviados e ainda não confirmados: (seq, keys)
+        self.pending = deque(maxlen=MAX_PENDING_INPUTS)
+        self.last_ack = 0
+
+        # Distância da última correção feita pelo servidor (diagnóstico)
+        self.last_correction = 0.0
+
+        # Passo de movimento (x, y, keys) -> (x, y); o mesmo do servidor
+        self.mover: Callable = apply_movement_input
+        self.stateful = False
+        # Estado do passo de movimento (só com stateful; None = estado inicial)
+        self.state: Any = None
+
+        self.lock = threading.Lock()
+
+    def set_mover(self, mover: Optional[Callable], stateful: bool = False):
+        """
+        Troca o passo de movimento (ex: colisão com o mapa no modo Bomb).
+
+        Args:
+            mover: Função (x, y, keys) -> (x, y), ou (x, y, keys, state) ->
+                   (x, y, state) com stateful; None volta ao movimento do lobby
+            stateful: Se o passo tem estado (ex: recarga e duração de habilidades)
+        """
+        with self.lock:
+            self.mover = mover or apply_movement_input
+            self.stateful = bool(mover) and stateful
+            self.state = None
+
+    def _step(self, x: float, y: float, keys: Dict[str, bool], state: Any) -> Tuple[float, float, Any]:
+        if self.stateful:
+            return self.mover(x, y, keys, state)
+        x, y = self.mover(x, y, keys)
+        return x, y, state
+
+    def reset(self, x: float, y: float, state: Any = None):
+        """Reinicia a predição a partir de uma posição (e estado) autoritativa."""
+        with self.lock:
+            self.x = float(x)
+            self.y = float(y)
+            self.state = state
+            self.pending.clear()
+            self.last_correction = 0.0
+
+    def record_input(self, keys: Dict[str, bool]) -> int:
+        """
+        Registra um novo input e aplica o movimento na posição prevista.
+
+        Args:
+            keys: Estado das teclas
+
+        Returns:
+            Número de sequência atribuído ao input
+        """
+        with self.lock:
+            seq = self.next_seq
+            self.next_seq += 1
+
+            self.pending.append((seq, dict(keys)))
+            if self.x is not None:
+                self.x, self.y, self.state = self._step(self.x, self.y, keys, self.state)
+
+            return seq
+
+    def reconcile(self, server_x: float, server_y: float, ack: int, server_state: Any = None):
+        """
+        Corrige a predição com um estado autoritativo.
+
+        Args:
+            server_x, server_y: Posição do jogador local no servidor
+            ack: Último número de sequência processado pelo servidor
+            server_state: Estado do passo de movimento no servidor (None =
+                          seguir do previsto)
+        """
+        with self.lock:
+            if ack < self.last_ack:
+                return  # Estado antigo chegando fora de ordem
+            self.last_ack = ack
+
+            # Descartar inputs já processados pelo servidor
+            while self.pending and self.pending[0][0] <= ack:
+                self.pending.popleft()
+
+            # Reaplicar os inputs ainda não confirmados
+            x, y = float(server_x), float(server_y)
+            state = server_state if server_state is not None else self.state
+            for _, keys in self.pending:
+                x, y, state = self._step(x, y, keys, state)
+
+            if self.x is not None:
+                self.last_correction = math.hypot(x - self.x, y - self.y)
+            self.x, self.y, self.state = x, y, state
+
+    def get_state(self) -> Any:
+        """Retorna o estado previsto do passo de movimento (None sem stateful)."""
+        with self.lock:
+            return self.state
+
+    def get_position(self) -> Optional[Tuple[float, float]]:
+        """Retorna a posição prevista, ou None se ainda não sincronizada."""
+        with self.lock:
+            if self.x is None:
+                return None
+            return (self.x, self.y)
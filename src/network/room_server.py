@@ -0,0 +1,316 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Servidor de salas: uma porta só, várias partidas, um processo por sala.
+
+O GameServer atende uma partida por processo (um dict de jogadores, um
+estado de jogo, uma tabela de times). Aqui um processo de entrada aceita
+as conexões, lê o CONNECT para saber a sala pedida ('lobby', 'Bomb',
+'Aim', ...) e entrega o socket já aberto a um processo de sala, que roda
+o próprio GameServer e o seu loop de ticks. Assim uma máquina usa todos
+os núcleos, e uma sala pesada não atrasa as outras.
+
+Cada modo pode ter várias instâncias ('Bomb', 'Bomb-2', ...): quando uma
+fica cheia, a próxima é criada. Salas vazias são encerradas depois de
+ROOM_IDLE_TIMEOUT segundos.
+
+O cliente conecta sem sala e cai no lobby; o FULL_SYNC diz a sala em que
+ele está, e pisar num portal do lobby reconecta o cliente na sala do modo
+(ver _lobby_loop em src/ui/lobby.py), que começa a partida sozinha.
+
+Uso:
+    python -m src.network.room_server --port 5555 --max-players 8
+    (cliente) GameClient().connect(host, 5555, "Nome", room='Bomb')
+"""
+
+import os
+
+# Sem display nem áudio: precisa vir antes de qualquer import do pygame
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+
+import argparse
+import multiprocessing
+import signal
+import socket
+import struct
+import threading
+import time
+from typing import Dict, Optional
+
+from .config_network import (
+    DEFAULT_SERVER_PORT, DEFAULT_MAX_PLAYERS, CONNECTION_TIMEOUT, LOBBY_ROOM, ROOM_IDLE_TIMEOUT
+)
+from .network_protocol import NetworkProtocol, PacketType
+from .dedicated_server import DedicatedServer, MODOS, MAPA_PADRAO
+
+SALA_PADRAO = LOBBY_ROOM
+
+
+def _executar_sala(config: Dict, conexoes, ocupacao):
+    """Alvo do processo de cada sala."""
+    sala = DedicatedServer(conexoes=conexoes, ocupacao=ocupacao, **config)
+
+    def _parar(signum, frame):
+        sala.stop()
+
+    signal.signal(signal.SIGTERM, _parar)
+    signal.signal(signal.SIGINT, signal.SIG_IGN)  # O processo de entrada cuida do Ctrl+C
+    sala.run()
+
+
+class RoomWorker:
+    """Processo de uma sala, visto pelo processo de entrada."""
+
+    def __init__(self, nome: str, modo: Optional[str], config: Dict):
+        self.nome = nome
+        self.modo = modo
+        self.max_players = config['max_players']
+
+        leitura, self.envio = multiprocessing.Pipe(duplex=False)
+        self.ocupacao = multiprocessing.Value('i', 0)
+        self.process = multiprocessing.Process(
+            target=_executar_sala,
+            args=({**config, 'modo': modo, 'nome': nome}, leitura, self.ocupacao),
+            name=f"sala:{nome}",
+            daemon=True,
+        )
+        self.process.start()
+        leitura.close()
+
+        # Conexões entregues que a sala talvez ainda não tenha publicado na ocupação
+        self.entregues_recentes = 0
+        self.vazia_desde: Optional[float] = None
+
+    def jogadores(self) -> int:
+        return self.ocupacao.value
+
+    def tem_vaga(self) -> bool:
+        return self.process.is_alive() and self.jogadores() + self.entregues_recentes < self.max_players
+
+    def entregar(self, client_socket: socket.socket, address: tuple, first_packet: bytes):
+        """
+        Repassa uma conexão aceita para o processo da sala.
+        O socket é duplicado para a sala durante o send (pickle síncrono).
+        """
+        self.envio.send((client_socket, address, first_packet))
+        self.entregues_recentes += 1
+
+    def parar(self):
+        try:
+            self.envio.close()
+        except OSError:
+            pass
+        if self.process.is_alive():
+            self.process.terminate()
+        self.process.join(timeout=5.0)
+
+
+class RoomManager:
+    """Aceita conexões numa porta e distribui os jogadores entre as salas."""
+
+    def __init__(self, host: str = '0.0.0.0', port: int = DEFAULT_SERVER_PORT,
+                 max_players: int = DEFAULT_MAX_PLAYERS, num_bots: int = 8,
+                 min_players: int = 1, start_delay: float = 10.0, mapa: str = MAPA_PADRAO,
+                 idle_timeout: float = ROOM_IDLE_TIMEOUT, replay_dir: Optional[str] = None):
+        """
+        Args:
+            host: Interface de rede
+            port: Porta única do servidor
+            max_players: Jogadores por sala
+            num_bots: Bots das salas Bomb
+            min_players: Jogadores para uma sala de partida começar
+            start_delay: Espera (s) antes de começar, com jogadores suficientes
+            mapa: Arquivo .tmx do modo Bomb
+            idle_timeout: Tempo (s) que uma sala vazia continua viva
+            replay_dir: Pasta onde as salas gravam o replay de cada partida
+        """
+        self.host = host
+        self.port = port
+        self.idle_timeout = idle_timeout
+        self.config_sala = {
+            'host': host,
+            'port': port,
+            'max_players': max_players,
+            'num_bots': num_bots,
+            'min_players': min_players,
+            'start_delay': start_delay,
+            'mapa': mapa,
+            'replay_dir': replay_dir,
+        }
+
+        self.server_socket: Optional[socket.socket] = None
+        self.rooms: Dict[str, RoomWorker] = {}
+        self.rooms_lock = threading.Lock()
+        self.running = False
+
+    def run(self):
+        """Aceita conexões até stop() ou Ctrl+C."""
+        self.server_socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        self.server_socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        self.server_socket.bind((self.host, self.port))
+        self.server_socket.listen(64)
+        self.server_socket.settimeout(1.0)
+        self.running = True
+
+        print(f"🌐 Servidor de salas em {self.host}:{self.port} "
+              f"(salas: {SALA_PADRAO}, {', '.join(MODOS)})")
+
+        try:
+            while self.running:
+                try:
+                    client_socket, address = self.server_socket.accept()
+                except socket.timeout:
+                    self._encerrar_salas_ociosas()
+                    continue
+                except OSError:
+                    break
+
+                threading.Thread(target=self._rotear, args=(client_socket, address),
+                                 daemon=True).start()
+        finally:
+            self.stop()
+
+    def stop(self):
+        """Fecha a porta e encerra todas as salas."""
+        self.running = False
+        if self.server_socket:
+            try:
+                self.server_socket.close()
+            except OSError:
+                pass
+        with self.rooms_lock:
+            rooms = list(self.rooms.values())
+            self.rooms.clear()
+        for room in rooms:
+            room.parar()
+
+    def _rotear(self, client_socket: socket.socket, address: tuple):
+        """Lê o CONNECT de uma conexão nova e a entrega à sala pedida."""
+        try:
+            client_socket.settimeout(CONNECTION_TIMEOUT)
+            first_packet = self._ler_pacote(client_socket)
+            parsed = NetworkProtocol.parse_packet(first_packet) if first_packet else None
+            if not parsed or parsed[0] != PacketType.CONNECT:
+                print(f"⚠️ Primeiro pacote não é CONNECT de {address}")
+                client_socket.close()
+                return
+            client_socket.settimeout(None)
+
+            pedido = parsed[1].get('room') or SALA_PADRAO
+            with self.rooms_lock:
+                room = self._sala_para(pedido)
+                if room is None:
+                    print(f"⚠️ Sala desconhecida '{pedido}' pedida por {address}")
+                    client_socket.close()
+                    return
+                room.entregar(client_socket, address, first_packet)
+
+            print(f"➡️ {parsed[1].get('player_name', '?')} ({address[0]}) -> sala {room.nome}")
+            client_socket.close()  # A sala ficou com a sua cópia do socket
+
+        except Exception as e:
+            print(f"❌ Erro ao rotear {address}: {e}")
+            try:
+                client_socket.close()
+            except OSError:
+                pass
+
+    def _sala_para(self, pedido: str) -> Optional[RoomWorker]:
+        """Sala com vaga para o modo pedido, criando uma nova instância se preciso."""
+        if pedido == SALA_PADRAO:
+            modo = None
+        elif pedido in MODOS:
+            modo = pedido
+        else:
+            return None
+
+        indice = 1
+        while True:
+            nome = pedido if indice == 1 else f"{pedido}-{indice}"
+            room = self.rooms.get(nome)
+            if room is None or not room.process.is_alive():
+                room = RoomWorker(nome, modo, self.config_sala)
+                self.rooms[nome] = room
+                print(f"🚪 Sala {nome} criada (pid {room.process.pid})")
+                return room
+            if room.tem_vaga():
+                return room
+            indice += 1
+
+    def _encerrar_salas_ociosas(self):
+        """Encerra salas vazias há mais de idle_timeout segundos."""
+        agora = time.time()
+        with self.rooms_lock:
+            for nome, room in list(self.rooms.items()):
+                jogadores = room.jogadores()
+                # A ocupação publicada já inclui as entregas anteriores
+                room.entregues_recentes = 0
+
+                if jogadores > 0:
+                    room.vazia_desde = None
+                    continue
+                if room.vazia_desde is None:
+                    room.vazia_desde = agora
+                elif agora - room.vazia_desde >= self.idle_timeout:
+                    print(f"🧹 Sala {nome} vazia, encerrando")
+                    room.parar()
+                    del self.rooms[nome]
+
+    @staticmethod
+    def _ler_pacote(sock: socket.socket) -> Optional[bytes]:
+        """Lê exatamente um pacote (cabeçalho + dados) do socket."""
+        def ler(n):
+            dados = b''
+            while len(dados) < n:
+                parte = sock.recv(n - len(dados))
+                if not parte:
+                    return None
+                dados += parte
+            return dados
+
+        header = ler(NetworkProtocol.HEADER_SIZE)
+        if not header:
+            return None
+        _, _, tamanho = struct.unpack(NetworkProtocol.HEADER_FORMAT, header)
+        if tamanho > NetworkProtocol.MAX_PACKET_SIZE:
+            return None
+        corpo = ler(tamanho)
+        if corpo is None:
+            return None
+        return header + corpo
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Servidor de salas (um processo por sala)")
+    parser.add_argument('--host', default='0.0.0.0', help="Interface de rede")
+    parser.add_argument('--port', type=int, default=DEFAULT_SERVER_PORT)
+    parser.add_argument('--max-players', type=int, default=DEFAULT_MAX_PLAYERS, help="Jogadores por sala")
+    parser.add_argument('--bots', type=int, default=8, help="Bots por sala Bomb")
+    parser.add_argument('--map', default=MAPA_PADRAO, help="Arquivo .tmx do modo Bomb")
+    parser.add_argument('--min-players', type=int, default=1, help="Jogadores para uma partida começar")
+    parser.add_argument('--start-delay', type=float, default=10.0)
+    parser.add_argument('--idle-timeout', type=float, default=ROOM_IDLE_TIMEOUT,
+                        help="Segundos até encerrar uma sala vazia")
+    parser.add_argument('--record', metavar='PASTA', default=None,
+                        help="Gravar o replay de cada partida nesta pasta")
+    args = parser.parse_args()
+
+    manager = RoomManager(host=args.host, port=args.port, max_players=args.max_players,
+                          num_bots=args.bots, min_players=args.min_players,
+                          start_delay=args.start_delay, mapa=args.map,
+                          idle_timeout=args.idle_timeout, replay_dir=args.record)
+
+    def _parar(signum, frame):
+        manager.running = False
+
+    signal.signal(signal.SIGTERM, _parar)
+    try:
+        manager.run()
+    except KeyboardInterrupt:
+        manager.stop()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,208 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Telemetria de rede: contadores por tipo de pacote, histograma de RTT,
+duração do tick do servidor e profundidade das filas.
+
+Cliente e servidor têm cada um a sua NetworkTelemetry. O `snapshot()`
+resume tudo num dicionário (usado pelo overlay do jogo e pelo harness) e,
+se houver um arquivo configurado, `maybe_dump()` grava um snapshot por
+linha (JSON lines) a cada TELEMETRY_DUMP_INTERVAL segundos.
+
+O tempo de codificação/decodificação é medido em NetworkProtocol e é do
+processo todo (no host, servidor e cliente somam juntos).
+"""
+
+import json
+import threading
+import time
+from collections import defaultdict, deque
+from typing import Dict, List, Optional
+
+from .config_network import (
+    TELEMETRY_SAMPLE_WINDOW, TELEMETRY_DUMP_INTERVAL, TELEMETRY_DUMP_PATH, RTT_HISTOGRAM_EDGES
+)
+from .network_protocol import NetworkProtocol, PacketType
+
+
+def percentile(values: List[float], p: float) -> float:
+    """
+    Calcula o percentil `p` (0-100) de uma lista, com interpolação linear.
+
+    Returns:
+        Valor do percentil ou 0.0 se a lista estiver vazia
+    """
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    k = (len(ordered) - 1) * (p / 100.0)
+    low = int(k)
+    high = min(low + 1, len(ordered) - 1)
+    return ordered[low] + (ordered[high] - ordered[low]) * (k - low)
+
+
+def packet_type_name(packet_type: int) -> str:
+    """Nome legível de um tipo de pacote (ou o número, se desconhecido)."""
+    try:
+        return PacketType(packet_type).name
+    except ValueError:
+        return str(packet_type)
+
+
+class NetworkTelemetry:
+    """Coleta métricas de rede de um cliente ou servidor."""
+
+    def __init__(self, role: str = 'client', dump_path: Optional[str] = TELEMETRY_DUMP_PATH,
+                 dump_interval: float = TELEMETRY_DUMP_INTERVAL,
+                 window: int = TELEMETRY_SAMPLE_WINDOW):
+        """
+        Args:
+            role: 'client' ou 'server' (vai no snapshot e no nome do arquivo)
+            dump_path: Arquivo JSON lines; '{role}' é trocado pelo papel (None = não gravar)
+            dump_interval: Intervalo entre linhas gravadas (s)
+            window: Quantas amostras de RTT/tick guardar para os percentis
+        """
+        self.role = role
+        self.dump_path = dump_path.format(role=role) if dump_path else None
+        self.dump_interval = dump_interval
+        self.lock = threading.Lock()
+
+        self.started = time.time()
+        # {tipo: [pacotes, bytes]}
+        self.sent = defaultdict(lambda: [0, 0])
+        self.received = defaultdict(lambda: [0, 0])
+
+        self.rtt_samples = deque(maxlen=window)
+        self.tick_samples = deque(maxlen=window)
+        self.queues: Dict[str, int] = {}
+
+        # Totais vistos no snapshot anterior de cada consumidor (overlay, dump...),
+        # para calcular taxas (pacotes/s, kbit/s): {consumidor: (horário, {tipo: totais})}
+        self._baselines: Dict[str, tuple] = {}
+        self._last_dump = 0.0
+
+    def record_sent(self, packet: bytes, copies: int = 1):
+        """Conta um pacote enviado (o tipo vem do cabeçalho)."""
+        if len(packet) < NetworkProtocol.HEADER_SIZE:
+            return
+        with self.lock:
+            entry = self.sent[packet[1]]
+            entry[0] += copies
+            entry[1] += len(packet) * copies
+
+    def record_received(self, packet: bytes):
+        """Conta um pacote recebido (o tipo vem do cabeçalho)."""
+        if len(packet) < NetworkProtocol.HEADER_SIZE:
+            return
+        with self.lock:
+            entry = self.received[packet[1]]
+            entry[0] += 1
+            entry[1] += len(packet)
+
+    def record_rtt(self, rtt_ms: float):
+        """Guarda uma medição de RTT (ms)."""
+        with self.lock:
+            self.rtt_samples.append(rtt_ms)
+
+    def record_tick(self, seconds: float):
+        """Guarda a duração de um tick do servidor (s)."""
+        with self.lock:
+            self.tick_samples.append(seconds * 1000.0)
+
+    def set_queue_depth(self, name: str, depth: int):
+        """Atualiza a profundidade atual de uma fila."""
+        with self.lock:
+            self.queues[name] = depth
+
+    def snapshot(self, consumer: str = 'default') -> Dict:
+        """
+        Resume as métricas atuais.
+
+        Args:
+            consumer: Quem está lendo; as taxas (pps/kbps) são calculadas desde
+                      o snapshot anterior do mesmo consumidor
+
+        Returns:
+            Dicionário serializável em JSON
+        """
+        now = time.time()
+        codec = NetworkProtocol.get_codec_stats()
+
+        with self.lock:
+            last_time, last_totals = self._baselines.get(consumer, (self.started, {}))
+            elapsed = max(now - last_time, 1e-6)
+            totals = {}
+
+            packets = {}
+            for type_id in set(self.sent) | set(self.received) | set(codec):
+                sent_pk, sent_b = self.sent.get(type_id, (0, 0))
+                recv_pk, recv_b = self.received.get(type_id, (0, 0))
+                last = last_totals.get(type_id, (0, 0, 0, 0))
+                totals[type_id] = (sent_pk, sent_b, recv_pk, recv_b)
+
+                enc_n, enc_t, dec_n, dec_t = codec.get(type_id, (0, 0.0, 0, 0.0))
+                packets[packet_type_name(type_id)] = {
+                    'out_packets': sent_pk,
+                    'out_bytes': sent_b,
+                    'in_packets': recv_pk,
+                    'in_bytes': recv_b,
+                    'out_pps': (sent_pk - last[0]) / elapsed,
+                    'out_kbps': (sent_b - last[1]) * 8 / 1000.0 / elapsed,
+                    'in_pps': (recv_pk - last[2]) / elapsed,
+                    'in_kbps': (recv_b - last[3]) * 8 / 1000.0 / elapsed,
+                    'encode_us': enc_t / enc_n * 1e6 if enc_n else 0.0,
+                    'decode_us': dec_t / dec_n * 1e6 if dec_n else 0.0,
+                }
+
+            self._baselines[consumer] = (now, totals)
+
+            rtt = list(self.rtt_samples)
+            ticks = list(self.tick_samples)
+            queues = dict(self.queues)
+
+        histogram = [0] * (len(RTT_HISTOGRAM_EDGES) + 1)
+        for value in rtt:
+            bucket = 0
+            while bucket < len(RTT_HISTOGRAM_EDGES) and value > RTT_HISTOGRAM_EDGES[bucket]:
+                bucket += 1
+            histogram[bucket] += 1
+
+        return {
+            'time': now,
+            'role': self.role,
+            'uptime': now - self.started,
+            'packets': packets,
+            'rtt_ms': {
+                'samples': len(rtt),
+                'p50': percentile(rtt, 50),
+                'p95': percentile(rtt, 95),
+                'p99': percentile(rtt, 99),
+                'max': max(rtt) if rtt else 0.0,
+                'histogram_edges': list(RTT_HISTOGRAM_EDGES),
+                'histogram': histogram,
+            },
+            'tick_ms': {
+                'samples': len(ticks),
+                'mean': sum(ticks) / len(ticks) if ticks else 0.0,
+                'p95': percentile(ticks, 95),
+                'max': max(ticks) if ticks else 0.0,
+            },
+            'queues': queues,
+        }
+
+    def maybe_dump(self):
+        """Grava um snapshot no arquivo JSON lines se já passou o intervalo."""
+        if not self.dump_path:
+            return
+        now = time.time()
+        if now - self._last_dump < self.dump_interval:
+            return
+        self._last_dump = now
+
+        try:
+            with open(self.dump_path, 'a', encoding='utf-8') as f:
+                f.write(json.dumps(self.snapshot('dump')) + '\n')
+        except OSError as e:
+            print(f"⚠️ Telemetria: não foi possível gravar {self.dump_path}: {e}")
+            self.dump_path = None
@@ -11,18 +11,113 @@ import pygame
 import math
 from src.config import LARGURA, ALTURA, LARGURA_JOGO, ALTURA_JOGO, ALTURA_HUD
 from src.config import BRANCO, AMARELO, VERDE, VERMELHO, CINZA_ESCURO, AZUL, ROXO, LARANJA
-from src.utils.visual import desenhar_texto
+from src.utils.visual import desenhar_texto, desenhar_overlay_cor
+from src.entities.tiro import desenhar_tiros
 from src.weapons.espingarda import desenhar_espingarda
 from src.weapons.metralhadora import desenhar_metralhadora
 from src.items.granada import desenhar_granada_selecionada
 from src.weapons.sabre_luz import desenhar_icone_sabre_hud
 
 
+# Camadas do HUD: o fundo da barra é fixo e cada indicador (moedas, fase,
+# arma, inimigos) fica numa superfície refeita só quando o valor muda
+_camadas = {'fundo': None, 'widgets': {}, 'icone': None}
+
+# Cada indicador ocupa um quarto da barra, abaixo da linha divisória
+LARGURA_WIDGET = LARGURA // 4
+TOPO_WIDGET = 2
+# Coordenadas dentro do widget (placas começam 10px abaixo do topo da barra)
+TOPO_PLACA = 10 - TOPO_WIDGET
+CENTRO_WIDGET = ALTURA_HUD // 2 - TOPO_WIDGET
+
+
+def _fundo_hud():
+    """Superfície fixa da barra de HUD (fundo e linha divisória)."""
+    fundo = _camadas['fundo']
+    if fundo is None:
+        fundo = pygame.Surface((LARGURA, ALTURA_HUD))
+        fundo.fill(CINZA_ESCURO)
+        pygame.draw.line(fundo, (100, 100, 150), (0, 0), (LARGURA, 0), 2)
+        _camadas['fundo'] = fundo
+    return fundo
+
+
+def _fundo_coluna(tela, coluna):
+    """Desenha só o fundo na coluna de um indicador que não aparece."""
+    x = coluna * LARGURA_WIDGET
+    tela.blit(_fundo_hud(), (x, ALTURA_JOGO + TOPO_WIDGET),
+              (x, TOPO_WIDGET, LARGURA_WIDGET, ALTURA_HUD - TOPO_WIDGET))
+
+
+def _widget_hud(tela, coluna, chave, desenhar, *valores):
+    """
+    Desenha o indicador da coluna, redesenhando a superfície só se `chave` mudou.
+
+    Args:
+        tela: Superfície onde desenhar
+        coluna: 0 a 3 (moedas, fase, arma, inimigos)
+        chave: Valores que o indicador mostra (comparados com os do último frame)
+        desenhar: Função (superfície, centro_x, *valores) que pinta o indicador
+    """
+    x = coluna * LARGURA_WIDGET
+    widget = _camadas['widgets'].get(coluna)
+    if widget is None or widget[0] != chave:
+        # Começa de uma cópia do fundo: o widget é opaco e sai num blit simples
+        superficie = _fundo_hud().subsurface(
+            (x, TOPO_WIDGET, LARGURA_WIDGET, ALTURA_HUD - TOPO_WIDGET)).copy()
+        desenhar(superficie, LARGURA // 8 * (2 * coluna + 1) - x, *valores)
+        widget = _camadas['widgets'][coluna] = (chave, superficie)
+    tela.blit(widget[1], (x, ALTURA_JOGO + TOPO_WIDGET))
+
+
+def _desenhar_widget_moedas(superficie, pos, quantidade):
+    pygame.draw.rect(superficie, (80, 80, 40), (pos - 80, TOPO_PLACA, 160, ALTURA_HUD - 20), 0, 10)
+    pygame.draw.rect(superficie, AMARELO, (pos - 80, TOPO_PLACA, 160, ALTURA_HUD - 20), 2, 10)
+
+    # Ícone de moeda pequeno
+    pygame.draw.circle(superficie, AMARELO, (pos - 30, CENTRO_WIDGET), 8)
+    desenhar_texto(superficie, f"{quantidade}", 24, AMARELO, pos + 20, CENTRO_WIDGET)
+
+
+def _desenhar_widget_fase(superficie, pos, fase_atual):
+    pygame.draw.rect(superficie, (40, 80, 40), (pos - 80, TOPO_PLACA, 160, ALTURA_HUD - 20), 0, 10)
+    pygame.draw.rect(superficie, VERDE, (pos - 80, TOPO_PLACA, 160, ALTURA_HUD - 20), 2, 10)
+    desenhar_texto(superficie, f"FASE {fase_atual}", 28, VERDE, pos, CENTRO_WIDGET)
+
+
+def _desenhar_widget_arma(superficie, pos, arma_ativa, municao, cor_fundo, cor_borda, cor_texto,
+                          tem_arma_especial):
+    pygame.draw.rect(superficie, cor_fundo, (pos - 100, TOPO_PLACA, 200, ALTURA_HUD - 20), 0, 10)
+    pygame.draw.rect(superficie, cor_borda, (pos - 100, TOPO_PLACA, 200, ALTURA_HUD - 20), 2, 10)
+
+    # Ícone de tiro normal (quadrado simples) e o texto entram no widget; com
+    # arma especial o ícone é animado e o texto vai por cima dele a cada frame
+    if not tem_arma_especial:
+        pygame.draw.rect(superficie, AZUL, (pos - 8, CENTRO_WIDGET - 8, 16, 16), 0, 3)
+        pygame.draw.rect(superficie, BRANCO, (pos - 8, CENTRO_WIDGET - 8, 16, 16), 2, 3)
+        _desenhar_texto_arma(superficie, pos, CENTRO_WIDGET, arma_ativa, municao, cor_texto, cor_borda)
+
+
+def _desenhar_texto_arma(superficie, pos, centro_y, arma_ativa, municao, cor_texto, cor_borda):
+    """Texto da arma e munição (acima do ícone, como na barra original)."""
+    desenhar_texto(superficie, arma_ativa, 18, cor_texto, pos, centro_y + 12)
+    desenhar_texto(superficie, f"Munição: {municao}", 14, cor_borda, pos, centro_y + 28)
+
+
+def _desenhar_widget_inimigos(superficie, pos, inimigos_restantes):
+    pygame.draw.rect(superficie, (80, 40, 40), (pos - 100, TOPO_PLACA, 200, ALTURA_HUD - 20), 0, 10)
+    pygame.draw.rect(superficie, VERMELHO, (pos - 100, TOPO_PLACA, 200, ALTURA_HUD - 20), 2, 10)
+    desenhar_texto(superficie, f"Inimigos: {inimigos_restantes}", 28, VERMELHO, pos, CENTRO_WIDGET)
+
+
 def desenhar_hud(tela, fase_atual, inimigos, tempo_atual, moeda_manager=None, jogador=None, apenas_fundo=False):
     """
     Desenha a interface de usuário durante o jogo.
     Agora inclui indicador da arma selecionada no sistema de inventário, ampulheta e amuleto.
 
+    O fundo e os indicadores ficam em superfícies guardadas; por frame só
+    são refeitos os indicadores cujo valor mudou (e o ícone animado da arma).
+
     Args:
         tela: Superfície onde desenhar
         fase_atual: Número da fase atual
@@ -33,38 +128,25 @@ def desenhar_hud(tela, fase_atual, inimigos, tempo_atual, moeda_manager=None, jo
         apenas_fundo: Se True, desenha apenas o frame/fundo sem o conteúdo
     """
     # Fundo da barra de HUD (área separada) — sempre visível
-    pygame.draw.rect(tela, CINZA_ESCURO, (0, ALTURA_JOGO, LARGURA, ALTURA_HUD))
-    pygame.draw.line(tela, (100, 100, 150), (0, ALTURA_JOGO), (LARGURA, ALTURA_JOGO), 2)
-
     if apenas_fundo:
+        tela.blit(_fundo_hud(), (0, ALTURA_JOGO))
         return
 
+    # Só a linha divisória: abaixo dela cada coluna vem pronta no seu widget
+    tela.blit(_fundo_hud(), (0, ALTURA_JOGO), (0, 0, LARGURA, TOPO_WIDGET))
+
     # Calcular inimigos restantes
     inimigos_restantes = sum(1 for inimigo in inimigos if inimigo.vidas > 0)
     
-    # Posições horizontais para distribuir elementos na barra de HUD
-    pos_moedas = LARGURA // 8        # 1/8 da largura
-    pos_fase = 3 * LARGURA // 8      # 3/8 da largura  
-    pos_equipamento = 5 * LARGURA // 8  # 5/8 da largura
-    pos_inimigos = 7 * LARGURA // 8     # 7/8 da largura
-    
-    # Posição vertical central da barra de HUD
-    centro_y = ALTURA_JOGO + ALTURA_HUD // 2
-    
     # Indicador de moedas
     if moeda_manager:
-        pygame.draw.rect(tela, (80, 80, 40), (pos_moedas - 80, ALTURA_JOGO + 10, 160, ALTURA_HUD - 20), 0, 10)
-        pygame.draw.rect(tela, AMARELO, (pos_moedas - 80, ALTURA_JOGO + 10, 160, ALTURA_HUD - 20), 2, 10)
-        
-        # Ícone de moeda pequeno
-        pygame.draw.circle(tela, AMARELO, (pos_moedas - 30, centro_y), 8)
-        desenhar_texto(tela, f"{moeda_manager.obter_quantidade()}", 24, AMARELO, pos_moedas + 20, centro_y)
+        quantidade = moeda_manager.obter_quantidade()
+        _widget_hud(tela, 0, quantidade, _desenhar_widget_moedas, quantidade)
+    else:
+        _fundo_coluna(tela, 0)
     
     # Indicador de fase atual
-    pygame.draw.rect(tela, (40, 80, 40), (pos_fase - 80, ALTURA_JOGO + 10, 160, ALTURA_HUD - 20), 0, 10)
-    pygame.draw.rect(tela, VERDE, (pos_fase - 80, ALTURA_JOGO + 10, 160, ALTURA_HUD - 20), 2, 10)
-    desenhar_texto(tela, f"FASE {fase_atual}", 28, VERDE, pos_fase, centro_y)
-    
+    _widget_hud(tela, 1, fase_atual, _desenhar_widget_fase, fase_atual)
 
     # NOVO: Indicador de arma atual baseado no sistema de inventário
     if jogador and jogador.cor == AZUL:  # Só para o jogador
@@ -172,14 +254,15 @@ def desenhar_hud(tela, fase_atual, inimigos, tempo_atual, moeda_manager=None, jo
             municao = str(jogador.dimensional_hop_uses)
             tem_arma_especial = True
                 
-        # Desenhar fundo do indicador de arma
-        pygame.draw.rect(tela, cor_fundo, (pos_equipamento - 100, ALTURA_JOGO + 10, 200, ALTURA_HUD - 20), 0, 10)
-        pygame.draw.rect(tela, cor_borda, (pos_equipamento - 100, ALTURA_JOGO + 10, 200, ALTURA_HUD - 20), 2, 10)
-        
-        # Se tem arma especial, desenhar ícone
+        valores = (arma_ativa, municao, cor_fundo, cor_borda, cor_texto, tem_arma_especial)
+        _widget_hud(tela, 2, valores, _desenhar_widget_arma, *valores)
+
+        # Se tem arma especial, desenhar ícone (animado, refeito a cada frame)
         if tem_arma_especial:
-            # Criar uma superfície temporária para desenhar o ícone da arma
-            icone_surface = pygame.Surface((60, 40), pygame.SRCALPHA)
+            icone_surface = _camadas['icone']
+            if icone_surface is None:
+                icone_surface = _camadas['icone'] = pygame.Surface((60, 40), pygame.SRCALPHA)
+            icone_surface.fill((0, 0, 0, 0))
             
             if hasattr(jogador, 'metralhadora_ativa') and jogador.metralhadora_ativa:
                 # Desenhar ícone da metralhadora
@@ -219,20 +302,15 @@ def desenhar_hud(tela, fase_atual, inimigos, tempo_atual, moeda_manager=None, jo
                 desenhar_icone_dimensional_hop_hud(icone_surface, 30, 20, tempo_atual)
 
             # Aplicar o ícone na posição correta do HUD
-            tela.blit(icone_surface, (pos_equipamento - 30, centro_y - 20))
-        else:
-            # Desenhar ícone de tiro normal (quadrado simples)
-            pygame.draw.rect(tela, AZUL, (pos_equipamento - 8, centro_y - 8, 16, 16), 0, 3)
-            pygame.draw.rect(tela, BRANCO, (pos_equipamento - 8, centro_y - 8, 16, 16), 2, 3)
-        
-        # Texto da arma e munição
-        desenhar_texto(tela, arma_ativa, 18, cor_texto, pos_equipamento, centro_y + 12)
-        desenhar_texto(tela, f"Munição: {municao}", 14, cor_borda, pos_equipamento, centro_y + 28)
+            pos_equipamento = 5 * LARGURA // 8
+            tela.blit(icone_surface, (pos_equipamento - 30, ALTURA_JOGO + ALTURA_HUD // 2 - 20))
+            _desenhar_texto_arma(tela, pos_equipamento, ALTURA_JOGO + ALTURA_HUD // 2,
+                                 arma_ativa, municao, cor_texto, cor_borda)
+    else:
+        _fundo_coluna(tela, 2)
     
     # Inimigos restantes
-    pygame.draw.rect(tela, (80, 40, 40), (pos_inimigos - 100, ALTURA_JOGO + 10, 200, ALTURA_HUD - 20), 0, 10)
-    pygame.draw.rect(tela, VERMELHO, (pos_inimigos - 100, ALTURA_JOGO + 10, 200, ALTURA_HUD - 20), 2, 10)
-    desenhar_texto(tela, f"Inimigos: {inimigos_restantes}", 28, VERMELHO, pos_inimigos, centro_y)
+    _widget_hud(tela, 3, inimigos_restantes, _desenhar_widget_inimigos, inimigos_restantes)
 
 
 def desenhar_icone_espingarda(tela, x, y, tempo_atual):
@@ -635,10 +713,7 @@ def aplicar_fade(tela, fade_in):
         fade_in: Valor de alpha (0-255)
     """
     if fade_in > 0:
-        fade = pygame.Surface((LARGURA, ALTURA))
-        fade.fill((0, 0, 0))
-        fade.set_alpha(fade_in)
-        tela.blit(fade, (0, 0))
+        desenhar_overlay_cor(tela, (0, 0, 0), fade_in, (LARGURA, ALTURA))
 
 
 def desenhar_transicao_fase(tela, numero_fase, tempo_transicao, fonte_titulo, fonte_normal):
@@ -658,9 +733,7 @@ def desenhar_transicao_fase(tela, numero_fase, tempo_transicao, fonte_titulo, fo
     texto_rect = texto_surf.get_rect(center=(LARGURA // 2, ALTURA_JOGO // 2))
     
     # Criar superfície para o fundo semitransparente (apenas área de jogo)
-    overlay = pygame.Surface((LARGURA, ALTURA_JOGO), pygame.SRCALPHA)
-    overlay.fill((0, 0, 0, min(180, alpha)))
-    tela.blit(overlay, (0, 0))
+    desenhar_overlay_cor(tela, (0, 0, 0), min(180, alpha), (LARGURA, ALTURA_JOGO))
     
     # Ajustar transparência do texto
     texto_surf.set_alpha(alpha)
@@ -723,11 +796,8 @@ def desenhar_tela_jogo(tela, jogador, inimigos, tiros_jogador, tiros_inimigo,
         if inimigo.vidas > 0:
             inimigo.desenhar(tela, tempo_atual)
     
-    for tiro in tiros_jogador:
-        tiro.desenhar(tela)
-    
-    for tiro in tiros_inimigo:
-        tiro.desenhar(tela)
+    desenhar_tiros(tela, tiros_jogador)
+    desenhar_tiros(tela, tiros_inimigo)
     
     # Desenhar granadas se existirem
     if granadas is not None:
@@ -16,6 +16,7 @@ import os
 
 # Importar o sistema de pricing
 from src.game.pricing_system import PricingManager, aplicar_pricing_sistema
+from src.utils.saves import caminho_dados, pasta_dados
 
 def salvar_upgrades(upgrades):
     """
@@ -23,11 +24,11 @@ def salvar_upgrades(upgrades):
     """
     try:
         # Criar o diretório de dados se não existir
-        if not os.path.exists("data"):
-            os.makedirs("data")
+        if not os.path.exists(pasta_dados()):
+            os.makedirs(pasta_dados())
         
         # Salvar os upgrades no arquivo
-        with open("data/upgrades.json", "w") as f:
+        with open(caminho_dados("upgrades.json"), "w") as f:
             json.dump(upgrades, f)
     except Exception as e:
         print(f"Erro ao salvar upgrades: {e}")
@@ -356,7 +357,46 @@ def desenhar_icone_faca(tela, x, y, tempo_atual):
         if tamanho_particula > 1:
             pygame.draw.circle(tela, (255, 255, 200), (particula_x, particula_y), tamanho_particula)
 
-def desenhar_items_shop(tela, area_conteudo, moeda_manager, upgrades, mouse_pos, clique_ocorreu, som_compra, som_erro, scroll_y=0):
+def desenhar_icone_granada(tela, x, y, tempo_atual):
+    """
+    Desenha o ícone da granada com brilho pulsante.
+    
+    Args:
+        tela: Superfície onde desenhar
+        x, y: Posição central do ícone
+        tempo_atual: Tempo atual para animações
+    """
+    tamanho_granada = 22
+    cor_granada = (60, 120, 60)
+    cor_granada_escura = (40, 80, 40)
+    
+    # Corpo da granada (esfera)
+    pygame.draw.circle(tela, cor_granada, (x, y), tamanho_granada)
+    
+    # Detalhes da granada (linhas cruzadas para textura)
+    pygame.draw.line(tela, cor_granada_escura, 
+                   (x - tamanho_granada + 6, y), 
+                   (x + tamanho_granada - 6, y), 3)
+    pygame.draw.line(tela, cor_granada_escura, 
+                   (x, y - tamanho_granada + 6), 
+                   (x, y + tamanho_granada - 6), 3)
+    
+    # Parte superior (bocal)
+    pygame.draw.rect(tela, (150, 150, 150), 
+                   (x - 7, y - tamanho_granada - 10, 14, 10), 0, 3)
+    
+    # Pino da granada
+    pin_x = x + 12
+    pin_y = y - tamanho_granada - 5
+    pygame.draw.circle(tela, (220, 220, 100), (pin_x, pin_y), 8, 3)
+    
+    # Brilho pulsante
+    pulso = (math.sin(tempo_atual / 200) + 1) / 2
+    cor_brilho = (100 + int(pulso * 50), 200 + int(pulso * 55), 100 + int(pulso * 50))
+    pygame.draw.circle(tela, cor_brilho, 
+                     (x - tamanho_granada//2, y - tamanho_granada//2), 6)
+
+def desenhar_items_shop(tela, area_conteudo, moeda_manager, upgrades, mouse_pos, clique_ocorreu, som_compra, som_erro, scroll_y=0, animados=None):
     """
     Desenha a seção de itens da loja com sistema de preços dinâmicos completo.
     
@@ -370,6 +410,7 @@ def desenhar_items_shop(tela, area_conteudo, moeda_manager, upgrades, mouse_pos,
         som_compra: Som para compra bem-sucedida
         som_erro: Som para erro na compra
         scroll_y: Posição atual do scroll (padrão: 0)
+        animados: ConteudoAnimado da loja retida (src/ui/retained_ui.py)
         
     Returns:
         Tupla (mensagem, cor, max_scroll) ou (None, None, max_scroll)
@@ -481,6 +522,14 @@ def desenhar_items_shop(tela, area_conteudo, moeda_manager, upgrades, mouse_pos,
                           area_scroll_altura - (margem_clipping * 2))
     conteudo_surf.set_clip(cliprect)
     
+    # Ícones dos itens animam sozinhos; nomes, usos e botões de compra
+    # ficam numa superfície à parte, copiada por cima deles
+    frente_surf = conteudo_surf
+    if animados is not None:
+        frente_surf = pygame.Surface(conteudo_surf.get_size(), pygame.SRCALPHA)
+        frente_surf.set_clip(cliprect)
+        clip_icones = cliprect.move(area_conteudo.x, area_scroll_y)
+    
     # Desenhar cada item na superfície de conteúdo
     for i, item in enumerate(itens_loja):
         # Calcular posição Y do item considerando o scroll e margem de clipping
@@ -518,50 +567,26 @@ def desenhar_items_shop(tela, area_conteudo, moeda_manager, upgrades, mouse_pos,
         icone_x = item_rect.x + 60
         icone_y = y_item_relativo + altura_item // 2
         
+        funcao_icone = None
         if item["icone_func"] == "granada":
-            # Ícone da granada com efeitos
-            tamanho_granada = 22
-            cor_granada = (60, 120, 60)
-            cor_granada_escura = (40, 80, 40)
-            
-            # Corpo da granada (esfera)
-            pygame.draw.circle(conteudo_surf, cor_granada, (icone_x, icone_y), tamanho_granada)
-            
-            # Detalhes da granada (linhas cruzadas para textura)
-            pygame.draw.line(conteudo_surf, cor_granada_escura, 
-                           (icone_x - tamanho_granada + 6, icone_y), 
-                           (icone_x + tamanho_granada - 6, icone_y), 3)
-            pygame.draw.line(conteudo_surf, cor_granada_escura, 
-                           (icone_x, icone_y - tamanho_granada + 6), 
-                           (icone_x, icone_y + tamanho_granada - 6), 3)
-            
-            # Parte superior (bocal)
-            pygame.draw.rect(conteudo_surf, (150, 150, 150), 
-                           (icone_x - 7, icone_y - tamanho_granada - 10, 14, 10), 0, 3)
-            
-            # Pino da granada
-            pin_x = icone_x + 12
-            pin_y = icone_y - tamanho_granada - 5
-            pygame.draw.circle(conteudo_surf, (220, 220, 100), (pin_x, pin_y), 8, 3)
-            
-            # Brilho pulsante
-            pulso = (math.sin(tempo_atual / 200) + 1) / 2
-            cor_brilho = (100 + int(pulso * 50), 200 + int(pulso * 55), 100 + int(pulso * 50))
-            pygame.draw.circle(conteudo_surf, cor_brilho, 
-                             (icone_x - tamanho_granada//2, icone_y - tamanho_granada//2), 6)
-            
+            funcao_icone = desenhar_icone_granada
         elif item["icone_func"] == "ampulheta":
-            desenhar_icone_ampulheta(conteudo_surf, icone_x, icone_y, tempo_atual)
-
+            funcao_icone = desenhar_icone_ampulheta
         elif item["icone_func"] == "faca":
-            desenhar_icone_faca(conteudo_surf, icone_x, icone_y, tempo_atual)
-
+            funcao_icone = desenhar_icone_faca
         elif item["icone_func"] == "dimensional_hop":
-            desenhar_icone_dimensional_hop(conteudo_surf, icone_x, icone_y, tempo_atual)
+            funcao_icone = desenhar_icone_dimensional_hop
+        
+        if funcao_icone is not None:
+            if animados is not None:
+                animados.animar(funcao_icone, area_conteudo.x + icone_x, area_scroll_y + icone_y,
+                                clip=clip_icones)
+            else:
+                funcao_icone(conteudo_surf, icone_x, icone_y, tempo_atual)
         
         # Nome do item (ajustado para o novo tamanho)
         cor_texto = item["cor_texto"] if item.get("pode_comprar", True) else (100, 100, 100)
-        desenhar_texto(conteudo_surf, item["nome"], 24, cor_texto, 
+        desenhar_texto(frente_surf, item["nome"], 24, cor_texto, 
                       item_rect.x + 170, y_item_relativo + 18)
         
         # Descrição e status do item (espaçamento ajustado)
@@ -573,24 +598,24 @@ def desenhar_items_shop(tela, area_conteudo, moeda_manager, upgrades, mouse_pos,
                         "Combat Dolls"
             status = f"{nome_item}: {upgrades[item['key']]}"
         
-        desenhar_texto(conteudo_surf, status, 15, BRANCO if item.get("pode_comprar", True) else (120, 120, 120), 
+        desenhar_texto(frente_surf, status, 15, BRANCO if item.get("pode_comprar", True) else (120, 120, 120), 
                       item_rect.x + 170, y_item_relativo + 38)
         
         # Informações de limite do sistema de pricing
         info_limite = item.get("info_limite", "")
-        desenhar_texto(conteudo_surf, info_limite, 12, (180, 180, 180),
+        desenhar_texto(frente_surf, info_limite, 12, (180, 180, 180),
                       item_rect.x + 170, y_item_relativo + 56)
 
         # Mostrar dano do item
         if item.get("pode_comprar", True):
-            desenhar_texto(conteudo_surf, f"Damage: {item.get('dano', 1)}", 16, (255, 200, 100),
+            desenhar_texto(frente_surf, f"Damage: {item.get('dano', 1)}", 16, (255, 200, 100),
                           item_rect.x + 170, y_item_relativo + 73)
         else:
-            desenhar_texto(conteudo_surf, "SOLD OUT", 14, VERMELHO,
+            desenhar_texto(frente_surf, "SOLD OUT", 14, VERMELHO,
                           item_rect.x + 170, y_item_relativo + 73)
         
         # Informações adicionais do item
-        desenhar_texto(conteudo_surf, item["info_extra"], 10, (150, 150, 150), 
+        desenhar_texto(frente_surf, item["info_extra"], 10, (150, 150, 150), 
                       item_rect.x + 170, y_item_relativo + 90)
         
         # Botão de compra (ajustado para o tamanho menor)
@@ -615,9 +640,12 @@ def desenhar_items_shop(tela, area_conteudo, moeda_manager, upgrades, mouse_pos,
                                       botao_largura, botao_altura)
         
         # Verificar hover
+        botao_visivel = area_scroll_y <= botao_y_real <= area_scroll_y + area_scroll_altura
         hover_compra = (rect_compra_real.collidepoint(mouse_pos) and 
-                       area_scroll_y <= botao_y_real <= area_scroll_y + area_scroll_altura and
+                       botao_visivel and
                        pode_comprar)
+        if animados is not None and botao_visivel and pode_comprar:
+            animados.alvo(rect_compra_real)
         
         # Cores do botão baseadas na capacidade de compra e disponibilidade
         if not item.get("pode_comprar", True):
@@ -634,17 +662,17 @@ def desenhar_items_shop(tela, area_conteudo, moeda_manager, upgrades, mouse_pos,
             cor_hover = cor_botao
         
         # Desenhar botão de compra na superfície de conteúdo
-        pygame.draw.rect(conteudo_surf, cor_hover if hover_compra else cor_botao, 
+        pygame.draw.rect(frente_surf, cor_hover if hover_compra else cor_botao, 
                         rect_compra_relativo, 0, 8)
-        pygame.draw.rect(conteudo_surf, item["cor_borda"], rect_compra_relativo, 2, 8)
+        pygame.draw.rect(frente_surf, item["cor_borda"], rect_compra_relativo, 2, 8)
         
         # Ícone de moeda e custo
         moeda_mini_x = botao_x_relativo - 25
         moeda_mini_y = botao_y_relativo
-        pygame.draw.circle(conteudo_surf, AMARELO, (moeda_mini_x, moeda_mini_y), 6)
+        pygame.draw.circle(frente_surf, AMARELO, (moeda_mini_x, moeda_mini_y), 6)
         
         # Texto de custo (preço dinâmico do sistema de pricing)
-        desenhar_texto(conteudo_surf, f"{item['custo']}", 16, BRANCO, 
+        desenhar_texto(frente_surf, f"{item['custo']}", 16, BRANCO, 
                       botao_x_relativo + 8, botao_y_relativo)
         
         # Verificar clique no botão de compra
@@ -679,6 +707,8 @@ def desenhar_items_shop(tela, area_conteudo, moeda_manager, upgrades, mouse_pos,
     
     # Aplicar a superfície de conteúdo à tela
     tela.blit(conteudo_surf, (area_conteudo.x, area_scroll_y))
+    if animados is not None:
+        animados.frente(frente_surf, (area_conteudo.x, area_scroll_y))
     
     # Desenhar barra de scroll se necessário (mais visível)
     if max_scroll > 0:
@@ -12,6 +12,8 @@ import math
 import random
 from src.config import *
 from src.utils.display_manager import present_frame
+from src.utils.fonts import obter_fonte, renderizar_texto
+from src.network.config_network import LOBBY_ROOM, LOCKSTEP_MODES
 
 
 def obter_ip_local_simples():
@@ -29,7 +31,6 @@ def obter_ip_local_simples():
 
 # --- Constantes ---
 TAM_PLAYER = 30
-VEL_LOBBY = 10.0
 TEMPO_ZONA = 5000  # 5s em ms
 
 # Cores da arena
@@ -151,7 +152,7 @@ def _desenhar_player(tela, x, y, cor, nome, fonte, is_host=False, pulsacao=0):
         label = nome
         cor_nome = BRANCO
 
-    nome_surf = fonte.render(label, True, cor_nome)
+    nome_surf = renderizar_texto(label, fonte, cor_nome)
     nx = ix + tam // 2 - nome_surf.get_width() // 2
     ny = iy - 18
 
@@ -344,7 +345,7 @@ def _desenhar_portal(tela, rect, portal, tempo, idx, fonte_titulo, fonte_peq, jo
         nome_cor = BRANCO
     else:
         nome_cor = (100, 95, 120)
-    s = fonte_titulo.render(portal['nome'], True, nome_cor)
+    s = renderizar_texto(portal['nome'], fonte_titulo, nome_cor)
     tela.blit(s, (cx - s.get_width() // 2, cy - 14))
 
     # Descrição
@@ -352,7 +353,7 @@ def _desenhar_portal(tela, rect, portal, tempo, idx, fonte_titulo, fonte_peq, jo
         desc_cor = (180, 255, 180)
     else:
         desc_cor = (120, 110, 80)
-    desc_s = fonte_peq.render(portal['desc'], True, desc_cor)
+    desc_s = renderizar_texto(portal['desc'], fonte_peq, desc_cor)
     tela.blit(desc_s, (cx - desc_s.get_width() // 2, rect.bottom - 18))
 
 
@@ -377,7 +378,7 @@ def _desenhar_barra_timer(tela, jx, jy, progresso, fonte):
 
     # Tempo
     restante = max(0, (1 - progresso) * 5)
-    ts = fonte.render(f"{restante:.1f}s", True, BRANCO)
+    ts = renderizar_texto(f"{restante:.1f}s", fonte, BRANCO)
     tela.blit(ts, (bx + barra_w + 5, by - 1))
 
 
@@ -391,16 +392,16 @@ def _lobby_loop(tela, relogio, gradiente, cliente, config, is_host, servidor=Non
 
     # Fontes
     try:
-        fonte_grande = pygame.font.Font(FONTE_PIXEL_PATH, 24)
-        fonte_lobby_sub = pygame.font.Font(FONTE_PIXEL_PATH, 12)
+        fonte_grande = obter_fonte(FONTE_PIXEL_PATH, 24)
+        fonte_lobby_sub = obter_fonte(FONTE_PIXEL_PATH, 12)
     except:
-        fonte_grande = pygame.font.SysFont("Arial", 34, True)
-        fonte_lobby_sub = pygame.font.SysFont("Arial", 14)
-    fonte_titulo = pygame.font.SysFont("Arial", 16, True)
-    fonte_peq = pygame.font.SysFont("Arial", 13)
-    fonte_nomes = pygame.font.SysFont("Arial", 12)
-    fonte_msg = pygame.font.SysFont("Arial", 20, True)
-    fonte_ip = pygame.font.SysFont("Arial", 14)
+        fonte_grande = obter_fonte("Arial", 34, True)
+        fonte_lobby_sub = obter_fonte("Arial", 14)
+    fonte_titulo = obter_fonte("Arial", 16, True)
+    fonte_peq = obter_fonte("Arial", 13)
+    fonte_nomes = obter_fonte("Arial", 12)
+    fonte_msg = obter_fonte("Arial", 20, True)
+    fonte_ip = obter_fonte("Arial", 14)
 
     # Área da sala
     margem = 25
@@ -485,37 +486,23 @@ def _lobby_loop(tela, relogio, gradiente, cliente, config, is_host, servidor=Non
         if game_start_data[0] is not None:
             cor_local = PALETA_JOGADORES[cor_index_local]
             gsd = game_start_data[0]
+            if 'bots' in gsd:
+                # Servidor dedicado envia os bots (cores chegam como listas no JSON)
+                bots = [{**b, 'cor': tuple(b['cor'])} for b in gsd['bots']]
             return ("start", {
                 'cor': cor_local,
                 'cor_nome': str(cor_index_local),
                 'bots': bots,
                 'modo': gsd.get('modo', 'Bomb'),
                 'seed': gsd.get('seed'),
+                'authoritative': gsd.get('authoritative', False),
+                'lockstep': gsd.get('lockstep', False),
             })
 
         # ========== MOVIMENTO ==========
+        # O movimento é previsto localmente com o mesmo passo do servidor
+        # e reconciliado a cada estado autoritativo (ver network/prediction.py)
         teclas = pygame.key.get_pressed()
-        dx, dy = 0.0, 0.0
-        if teclas[pygame.K_w] or teclas[pygame.K_UP]:
-            dy -= VEL_LOBBY
-        if teclas[pygame.K_s] or teclas[pygame.K_DOWN]:
-            dy += VEL_LOBBY
-        if teclas[pygame.K_a] or teclas[pygame.K_LEFT]:
-            dx -= VEL_LOBBY
-        if teclas[pygame.K_d] or teclas[pygame.K_RIGHT]:
-            dx += VEL_LOBBY
-
-        if dx != 0 and dy != 0:
-            f = VEL_LOBBY / math.sqrt(dx * dx + dy * dy)
-            dx *= f
-            dy *= f
-
-        jx += dx
-        jy += dy
-        jx = max(float(sala.x + 8), min(float(sala.right - TAM_PLAYER - 8), jx))
-        jy = max(float(sala.y + 8), min(float(sala.bottom - TAM_PLAYER - 8), jy))
-
-        # Enviar input
         keys_net = {
             'w': bool(teclas[pygame.K_w] or teclas[pygame.K_UP]),
             's': bool(teclas[pygame.K_s] or teclas[pygame.K_DOWN]),
@@ -525,6 +512,10 @@ def _lobby_loop(tela, relogio, gradiente, cliente, config, is_host, servidor=Non
         cliente.send_player_input(keys_net, 0, 0, False)
         cliente.update_interpolation(dt)
 
+        pos_prevista = cliente.get_predicted_position()
+        if pos_prevista:
+            jx, jy = pos_prevista
+
         # Pulsação (ciclo 0-11)
         if tempo - ultimo_pulso > 100:
             ultimo_pulso = tempo
@@ -557,16 +548,29 @@ def _lobby_loop(tela, relogio, gradiente, cliente, config, is_host, servidor=Non
                     if is_host:
                         cor_local = PALETA_JOGADORES[cor_index_local]
                         seed = random.randint(0, 2**31)
+                        if portal['nome'] == 'Bomb':
+                            # Bots, bomba e rounds simulados pelo servidor do host
+                            servidor.start_bomb_simulation(seed=seed)
                         cust = {
                             'cor': cor_local,
                             'cor_nome': str(cor_index_local),
                             'bots': bots,
                             'modo': portal['nome'],
                             'seed': seed,
+                            'authoritative': servidor.simulation is not None,
+                            'lockstep': portal['nome'] in LOCKSTEP_MODES,
                         }
                         print(f"[LOBBY] Host iniciou {portal['nome']}!")
                         servidor.broadcast_game_start(modo=portal['nome'], seed=seed)
                         return ("start", cust)
+                    elif cliente.room is not None and portal['nome'] != cliente.room:
+                        # Servidor de salas: reconectar na sala do modo
+                        print(f"[LOBBY] Indo para a sala {portal['nome']}")
+                        return ("room", {'sala': portal['nome']})
+                    elif cliente.room is not None:
+                        msg = "Aguardando a partida começar..."
+                        msg_fim = tempo + 2000
+                        zona_timer_start = tempo
                     else:
                         msg = "Somente o HOST pode iniciar!"
                         msg_fim = tempo + 2000
@@ -617,11 +621,12 @@ def _lobby_loop(tela, relogio, gradiente, cliente, config, is_host, servidor=Non
         # ========== UI OVERLAY ==========
 
         # Título estilizado (pixel)
-        titulo = fonte_grande.render("SQUARESTORM", True, (200, 200, 255))
+        titulo = renderizar_texto("SQUARESTORM", fonte_grande, (200, 200, 255))
         tela.blit(titulo, (LARGURA // 2 - titulo.get_width() // 2, 8))
 
-        # Subtítulo (pixel)
-        sub = fonte_lobby_sub.render("LOBBY", True, (120, 120, 160))
+        # Subtítulo (pixel): a sala, num servidor de salas
+        sala_nome = cliente.room if cliente.room not in (None, LOBBY_ROOM) else "LOBBY"
+        sub = renderizar_texto(sala_nome.upper(), fonte_lobby_sub, (120, 120, 160))
         tela.blit(sub, (LARGURA // 2 - sub.get_width() // 2, 38))
 
         # IP
@@ -629,19 +634,19 @@ def _lobby_loop(tela, relogio, gradiente, cliente, config, is_host, servidor=Non
 
         # Jogadores conectados
         n_total = 1 + len(remotos)
-        cnt = fonte_ip.render(f"Jogadores: {n_total}", True, VERDE)
+        cnt = renderizar_texto(f"Jogadores: {n_total}", fonte_ip, VERDE)
         tela.blit(cnt, (LARGURA - cnt.get_width() - 15, 12))
 
         # Preview da cor do jogador
         pygame.draw.rect(tela, cor_local, (12, 12, 16, 16), 0, 3)
         cor_escura, _ = _gerar_cor_derivadas(cor_local)
         pygame.draw.rect(tela, cor_escura, (12, 12, 16, 16), 2, 3)
-        nome_cor_s = fonte_ip.render(config.get('player_name', ''), True, cor_local)
+        nome_cor_s = renderizar_texto(config.get('player_name', ''), fonte_ip, cor_local)
         tela.blit(nome_cor_s, (32, 13))
 
         # Mensagem temporária
         if msg and tempo < msg_fim:
-            ms = fonte_msg.render(msg, True, AMARELO)
+            ms = renderizar_texto(msg, fonte_msg, AMARELO)
             mw = ms.get_width() + 30
             mh = 40
             mr = pygame.Rect(LARGURA // 2 - mw // 2, sala.centery + 50, mw, mh)
@@ -654,12 +659,12 @@ def _lobby_loop(tela, relogio, gradiente, cliente, config, is_host, servidor=Non
         # Aguardando jogadores
         if is_host and len(remotos) == 0:
             p_a = int(100 + math.sin(tempo / 500) * 80)
-            ag = fonte_ip.render("Aguardando jogadores se conectarem...", True, (p_a, p_a, 255))
+            ag = renderizar_texto("Aguardando jogadores se conectarem...", fonte_ip, (p_a, p_a, 255))
             tela.blit(ag, (LARGURA // 2 - ag.get_width() // 2, sala.bottom + 4))
 
         # Instruções
         inst = "WASD: Mover  |  ESC: Sair  |  Fique no portal por 5s para iniciar"
-        is_s = fonte_peq.render(inst, True, (100, 100, 120))
+        is_s = renderizar_texto(inst, fonte_peq, (100, 100, 120))
         tela.blit(is_s, (LARGURA // 2 - is_s.get_width() // 2, ALTURA_JOGO - 18))
 
         present_frame()
@@ -676,5 +681,11 @@ def tela_lobby_servidor(tela, relogio, gradiente, servidor, cliente, config):
 
 
 def tela_lobby_cliente(tela, relogio, gradiente, cliente, config):
-    """Lobby interativo para CLIENTES."""
+    """
+    Lobby interativo para CLIENTES.
+
+    Returns:
+        ("start", customização), ("cancel", None) ou, num servidor de salas,
+        ("room", {'sala': modo}) quando o jogador pisa no portal de outro modo
+    """
     return _lobby_loop(tela, relogio, gradiente, cliente, config, is_host=False)
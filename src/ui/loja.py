@@ -11,13 +11,16 @@ import math
 import json
 import os
 from src.config import *
-from src.utils.visual import criar_estrelas, desenhar_estrelas, desenhar_texto, criar_botao
+from src.utils.visual import criar_estrelas, desenhar_estrelas, rects_estrelas, desenhar_texto, criar_botao, desenhar_overlay_cor
 from src.game.moeda_manager import MoedaManager
 import sys
 from src.ui.weapons_shop import desenhar_weapons_shop
 from src.ui.upgrades_shop import desenhar_upgrades_shop
 from src.ui.items_shop import desenhar_items_shop
 from src.utils.display_manager import present_frame,convert_mouse_position
+from src.utils.fonts import obter_fonte, renderizar_texto
+from src.utils.saves import caminho_dados, pasta_dados
+from src.ui.retained_ui import TelaRetida, AreaAnimada
 
 
 
@@ -78,126 +81,62 @@ def tela_loja(tela, relogio, gradiente_loja):
     max_scroll_upgrades = 0 # máximo scroll para upgrades
     max_scroll_items = 0    # máximo scroll para items
     
-    # Loop principal da loja
-    rodando = True
-    while rodando:
-        tempo_atual = pygame.time.get_ticks()
-        clique_ocorreu = False
-        
-        for evento in pygame.event.get():
-            if evento.type == pygame.QUIT:
-                pygame.quit()
-                sys.exit()
-            if evento.type == pygame.KEYDOWN:
-                # Tecla ESC, Backspace ou M para voltar ao menu
-                if evento.key == pygame.K_ESCAPE or evento.key == pygame.K_BACKSPACE or evento.key == pygame.K_m:
-                    # Efeito de fade out ao sair
-                    for i in range(30):
-                        fade = pygame.Surface((LARGURA, ALTURA))
-                        fade.fill((0, 0, 0))
-                        fade.set_alpha(i * 8)
-                        tela.blit(fade, (0, 0))
-                        present_frame()
-                        pygame.time.delay(5)
-                    return "menu"
-                # Teclas numéricas para trocar de categoria
-                if evento.key == pygame.K_1:
-                    aba_ativa = 0  # Armas
-                if evento.key == pygame.K_2:
-                    aba_ativa = 1  # Upgrades
-                if evento.key == pygame.K_3:
-                    aba_ativa = 2  # Items
-            # Verificação de clique do mouse
-            if evento.type == pygame.MOUSEBUTTONDOWN and evento.button == 1:
-                clique_ocorreu = True
-            # Scroll do mouse - ATUALIZADO para funcionar em todas as abas
-            if evento.type == pygame.MOUSEBUTTONDOWN:
-                if evento.button == 4:  # Scroll up
-                    if aba_ativa == 0:  # Armas
-                        scroll_weapons = max(0, scroll_weapons - 30)
-                    elif aba_ativa == 1:  # Upgrades
-                        scroll_upgrades = max(0, scroll_upgrades - 30)
-                    elif aba_ativa == 2:  # Items
-                        scroll_items = max(0, scroll_items - 30)
-                elif evento.button == 5:  # Scroll down
-                    if aba_ativa == 0:  # Armas
-                        scroll_weapons = min(max_scroll_weapons, scroll_weapons + 30)
-                    elif aba_ativa == 1:  # Upgrades
-                        scroll_upgrades = min(max_scroll_upgrades, scroll_upgrades + 30)
-                    elif aba_ativa == 2:  # Items
-                        scroll_items = min(max_scroll_items, scroll_items + 30)
-        
-        # Atualizar mensagem de feedback
-        if mensagem:
-            mensagem_tempo += 1
-            if mensagem_tempo >= mensagem_duracao:
-                mensagem = ""
-                mensagem_tempo = 0
-                
-        # Efeito de fade in ao entrar
-        if fade_in > 0:
-            fade_in = max(0, fade_in - 10)
-        
-        # Desenhar fundo com gradiente
-        tela.blit(gradiente_loja, (0, 0))
-        
-        # Desenhar estrelas animadas no fundo
-        desenhar_estrelas(tela, estrelas)
-        
-        # Primeiro criar uma superfície com transparência
-        s = pygame.Surface((LARGURA - 200, ALTURA - 200), pygame.SRCALPHA)
-        
-        # Desenhar retângulo preenchido com cantos arredondados diretamente na superfície
-        pygame.draw.rect(s, (10, 10, 30, 200), (0, 0, LARGURA - 200, ALTURA - 200), 0, 15)
-        
-        # Aplicar a superfície com o retângulo na tela
-        tela.blit(s, (100, 100))
-        
-        # Desenhar borda brilhante
-        pygame.draw.rect(tela, (100, 100, 255), (100, 100, LARGURA - 200, ALTURA - 200), 3, 15)
-        
-        # Desenhar título da loja
+    mouse_pos = convert_mouse_position(pygame.mouse.get_pos())
+    clique_ocorreu = False
+    
+    # Dimensões e posições das abas (centralizadas)
+    aba_largura = 250
+    aba_altura = 60
+    espaco_entre_abas = 15
+    altura_aba_y = 280
+    aba1_x = LARGURA // 2 - aba_largura - espaco_entre_abas
+    aba2_x = LARGURA // 2 
+    aba3_x = LARGURA // 2 + aba_largura + espaco_entre_abas
+    rect_aba1 = pygame.Rect(aba1_x - aba_largura//2, altura_aba_y - aba_altura//2, aba_largura, aba_altura)
+    rect_aba2 = pygame.Rect(aba2_x - aba_largura//2, altura_aba_y - aba_altura//2, aba_largura, aba_altura)
+    rect_aba3 = pygame.Rect(aba3_x - aba_largura//2, altura_aba_y - aba_altura//2, aba_largura, aba_altura)
+    
+    # Área de conteúdo da aba ativa - movida para cima
+    area_conteudo = pygame.Rect(150, 330, LARGURA - 300, ALTURA - 450)
+    
+    # Botão de voltar (ajustado para ficar mais abaixo)
+    botao_voltar_largura = 240
+    botao_voltar_altura = 50
+    botao_voltar_x = LARGURA // 2
+    botao_voltar_y = ALTURA - 50
+    rect_voltar = pygame.Rect(botao_voltar_x - botao_voltar_largura//2, 
+                           botao_voltar_y - botao_voltar_altura//2, 
+                           botao_voltar_largura, botao_voltar_altura)
+    
+    # Painel translúcido com cantos arredondados (montado uma vez)
+    painel = pygame.Surface((LARGURA - 200, ALTURA - 200), pygame.SRCALPHA)
+    pygame.draw.rect(painel, (10, 10, 30, 200), (0, 0, LARGURA - 200, ALTURA - 200), 0, 15)
+    # Borda brilhante (no painel: uma borda desenhada com clip perde pixels)
+    pygame.draw.rect(painel, (100, 100, 255), (0, 0, LARGURA - 200, ALTURA - 200), 3, 15)
+    
+    def desenhar_painel(tela):
+        tela.blit(painel, (100, 100))
+        # Título da loja
         desenhar_texto(tela, "SHOP", 80, (200, 200, 255), LARGURA // 2, 140)
-        
+    
+    def desenhar_moedas(tela):
         # Mostrar quantidade de moedas - design simplificado
         moedas_x = LARGURA // 2
         moedas_y = 210
-        
-        # Desenhar uma única moeda circular
         moeda_cor = AMARELO
-        
-        # Moeda simples
         pygame.draw.circle(tela, moeda_cor, (moedas_x - 50, moedas_y), 20)
-        
-        # Mostrar quantidade de moedas
         desenhar_texto(tela, f"{moeda_manager.obter_quantidade()}", 45, moeda_cor, moedas_x + 50, moedas_y)
-        
-        # Definir dimensões e posições para as abas
-        aba_largura = 250
-        aba_altura = 60
-        espaco_entre_abas = 15
-        altura_aba_y = 280
-        
-        # Calcular posições das abas (centralizadas)
-        aba1_x = LARGURA // 2 - aba_largura - espaco_entre_abas
-        aba2_x = LARGURA // 2 
-        aba3_x = LARGURA // 2 + aba_largura + espaco_entre_abas
-        
-        # Desenhar as abas (botões de categoria)
-        rect_aba1 = pygame.Rect(aba1_x - aba_largura//2, altura_aba_y - aba_altura//2, aba_largura, aba_altura)
-        rect_aba2 = pygame.Rect(aba2_x - aba_largura//2, altura_aba_y - aba_altura//2, aba_largura, aba_altura)
-        rect_aba3 = pygame.Rect(aba3_x - aba_largura//2, altura_aba_y - aba_altura//2, aba_largura, aba_altura)
-        
-        # Verificar hover para as abas
-        mouse_pos = convert_mouse_position(pygame.mouse.get_pos())
-        hover_aba1 = rect_aba1.collidepoint(mouse_pos)
-        hover_aba2 = rect_aba2.collidepoint(mouse_pos)
-        hover_aba3 = rect_aba3.collidepoint(mouse_pos)
-        
-        # Desenhar aba 1 (Armas)
+    
+    def tiro_visivel():
+        return (pygame.time.get_ticks() % 1000) / 1000.0 > 0.7
+    
+    def granada_pulsando():
+        return (pygame.time.get_ticks() % 2000) / 2000.0 > 0.7
+    
+    def desenhar_aba_armas(tela):
         cor_aba1 = (150, 50, 50) if aba_ativa == 0 else (80, 30, 30)
         cor_hover_aba1 = (200, 70, 70) if aba_ativa == 0 else (100, 40, 40)
-        pygame.draw.rect(tela, cor_hover_aba1 if hover_aba1 else cor_aba1, rect_aba1, 0, 10)
+        pygame.draw.rect(tela, cor_hover_aba1 if rect_aba1.collidepoint(mouse_pos) else cor_aba1, rect_aba1, 0, 10)
         pygame.draw.rect(tela, (255, 100, 100), rect_aba1, 3 if aba_ativa == 0 else 1, 10)
         
         # Ícone de arma para aba 1 (código do ícone mantido igual)
@@ -206,10 +145,7 @@ def tela_loja(tela, relogio, gradiente_loja):
         arma_cor = (255, 100, 100)
         arma_cor_escura = (200, 80, 80)
         
-        tempo_pulso = (pygame.time.get_ticks() % 1000) / 1000.0
-        tiro_visivel = tempo_pulso > 0.7
-        
-        if tiro_visivel:
+        if tiro_visivel():
             pygame.draw.circle(tela, (255, 255, 100), (arma_x - 22, arma_y), 7)
             pygame.draw.circle(tela, (255, 200, 50), (arma_x - 22, arma_y), 4)
         
@@ -221,17 +157,20 @@ def tela_loja(tela, relogio, gradiente_loja):
         pygame.draw.rect(tela, arma_cor, (arma_x + 2, arma_y + 12, 7, 12), 0, 3)
         
         desenhar_texto(tela, "WEAPONS", 28, BRANCO, aba1_x, altura_aba_y)
-        
-        # Desenhar aba 2 (Upgrades) - código mantido igual
+    
+    def desenhar_aba_upgrades(tela):
         cor_aba2 = (50, 80, 150) if aba_ativa == 1 else (30, 50, 80)
         cor_hover_aba2 = (70, 100, 200) if aba_ativa == 1 else (40, 60, 100)
-        pygame.draw.rect(tela, cor_hover_aba2 if hover_aba2 else cor_aba2, rect_aba2, 0, 10)
+        pygame.draw.rect(tela, cor_hover_aba2 if rect_aba2.collidepoint(mouse_pos) else cor_aba2, rect_aba2, 0, 10)
         pygame.draw.rect(tela, (100, 150, 255), rect_aba2, 3 if aba_ativa == 1 else 1, 10)
-        
-        upgrade_x = aba2_x - 100
-        upgrade_y = altura_aba_y
-        upgrade_cor = (100, 150, 255)
-        
+        desenhar_texto(tela, "UPGRADES", 28, BRANCO, aba2_x, altura_aba_y)
+    
+    # Seta da aba 2: anima a cada frame, num widget pequeno por cima da aba
+    upgrade_x = aba2_x - 100
+    upgrade_y = altura_aba_y
+    rect_icone_upgrade = pygame.Rect(upgrade_x - 15, upgrade_y - 20, 30, 41)
+    
+    def desenhar_icone_aba_upgrades(tela):
         tempo_anim = pygame.time.get_ticks() / 1000.0
         offset_y = math.sin(tempo_anim * 3) * 5
         
@@ -257,13 +196,11 @@ def tela_loja(tela, relogio, gradiente_loja):
             cor_brilho = (150, 200, 255, alpha_brilho)
             pygame.draw.polygon(brilho_surf, cor_brilho, [(15, 5), (5, 20), (25, 20)])
             tela.blit(brilho_surf, (upgrade_x - 15, upgrade_y - 15 + offset_y))
-        
-        desenhar_texto(tela, "UPGRADES", 28, BRANCO, aba2_x, altura_aba_y)
-        
-        # Desenhar aba 3 (Items) - código mantido igual
+    
+    def desenhar_aba_items(tela):
         cor_aba3 = (50, 120, 50) if aba_ativa == 2 else (30, 70, 30)
         cor_hover_aba3 = (70, 160, 70) if aba_ativa == 2 else (40, 90, 40)
-        pygame.draw.rect(tela, cor_hover_aba3 if hover_aba3 else cor_aba3, rect_aba3, 0, 10)
+        pygame.draw.rect(tela, cor_hover_aba3 if rect_aba3.collidepoint(mouse_pos) else cor_aba3, rect_aba3, 0, 10)
         pygame.draw.rect(tela, (120, 220, 120), rect_aba3, 3 if aba_ativa == 2 else 1, 10)
         
         item_x = aba3_x - 100
@@ -279,11 +216,137 @@ def tela_loja(tela, relogio, gradiente_loja):
         pin_y = item_y - tamanho_granada - 2
         pygame.draw.circle(tela, (220, 220, 100), (pin_x, pin_y), 5, 2)
         
-        tempo_pulso = (pygame.time.get_ticks() % 2000) / 2000.0
-        if tempo_pulso > 0.7:
+        if granada_pulsando():
             pygame.draw.circle(tela, (150, 255, 150), (item_x, item_y), tamanho_granada+3, 2)
         
         desenhar_texto(tela, "ITEMS", 28, BRANCO, aba3_x, altura_aba_y)
+    
+    # Resultado da última montagem do conteúdo (mensagem, cor, max_scroll)
+    resultado_conteudo = [None]
+    
+    def montar_conteudo(superficie, animados):
+        # Opaco, como o (20, 20, 50, 150) ficava na tela sem alpha
+        pygame.draw.rect(superficie, (20, 20, 50), area_conteudo, 0, 10)
+        pygame.draw.rect(superficie, (70, 70, 130), area_conteudo, 2, 10)
+        if aba_ativa == 0:  # Armas - ATUALIZADO para usar scroll
+            desenhar = desenhar_weapons_shop
+            scroll = scroll_weapons
+        elif aba_ativa == 1:  # Upgrades
+            desenhar = desenhar_upgrades_shop
+            scroll = scroll_upgrades
+        else:  # Items (aba 2)
+            desenhar = desenhar_items_shop
+            scroll = scroll_items
+        resultado_conteudo[0] = desenhar(superficie, area_conteudo, moeda_manager, upgrades,
+                                         mouse_pos, clique_ocorreu, som_compra, som_erro, scroll, animados)
+    
+    def desenhar_voltar(tela):
+        # Desenhar o botão voltar com estilo Figma
+        cor_voltar = (80, 80, 220) if rect_voltar.collidepoint(mouse_pos) else (60, 60, 150)
+        pygame.draw.rect(tela, cor_voltar, rect_voltar, 0, 10)
+        pygame.draw.rect(tela, BRANCO, rect_voltar, 2, 10)
+        
+        # Texto do botão voltar
+        texto_voltar = renderizar_texto("BACK TO MENU", obter_fonte("Arial", 26), BRANCO)
+        texto_rect_voltar = texto_voltar.get_rect(center=(botao_voltar_x, botao_voltar_y))
+        tela.blit(texto_voltar, texto_rect_voltar)
+    
+    def alpha_mensagem():
+        return int(255 * (1.0 - mensagem_tempo / mensagem_duracao))
+    
+    def desenhar_mensagem(tela):
+        # Mostrar mensagem de feedback se existir
+        if mensagem:
+            # Fazer a mensagem pulsar
+            y_mensagem = area_conteudo.y - 20
+            fonte = obter_fonte("Arial", 30, True)
+            texto_surf = fonte.render(mensagem, True, mensagem_cor)
+            texto_surf.set_alpha(alpha_mensagem())
+            texto_rect = texto_surf.get_rect(center=(LARGURA // 2, y_mensagem))
+            tela.blit(texto_surf, texto_rect)
+    
+    # Tela retida: estrelas numa camada, painel fixo e o resto em widgets
+    # redesenhados só quando o estado (hover, aba, moedas, animação) muda
+    tela_retida = TelaRetida(gradiente_loja)
+    tela_retida.adicionar_camada(lambda: rects_estrelas(estrelas),
+                                 lambda tela: desenhar_estrelas(tela, estrelas))
+    tela_retida.adicionar((100, 100, LARGURA - 200, ALTURA - 200), desenhar_painel)
+    tela_retida.adicionar((LARGURA // 2 - 75, 180, 300, 60), desenhar_moedas,
+                          moeda_manager.obter_quantidade)
+    # O clarão do tiro passa 4 px da borda esquerda da aba
+    tela_retida.adicionar(rect_aba1.inflate(10, 0), desenhar_aba_armas,
+                          lambda: (aba_ativa, rect_aba1.collidepoint(mouse_pos), tiro_visivel()),
+                          opaco=True)
+    tela_retida.adicionar(rect_aba2, desenhar_aba_upgrades,
+                          lambda: (aba_ativa, rect_aba2.collidepoint(mouse_pos)), opaco=True)
+    tela_retida.adicionar(rect_icone_upgrade, desenhar_icone_aba_upgrades, pygame.time.get_ticks)
+    tela_retida.adicionar(rect_aba3, desenhar_aba_items,
+                          lambda: (aba_ativa, rect_aba3.collidepoint(mouse_pos), granada_pulsando()),
+                          opaco=True)
+    area_animada = AreaAnimada(tela_retida, area_conteudo, montar_conteudo)
+    tela_retida.adicionar(rect_voltar, desenhar_voltar, lambda: rect_voltar.collidepoint(mouse_pos),
+                          opaco=True)
+    tela_retida.adicionar((area_conteudo.x, area_conteudo.y - 40, area_conteudo.width, 40), desenhar_mensagem,
+                          lambda: (mensagem, mensagem_cor, alpha_mensagem()) if mensagem else None)
+    
+    # Loop principal da loja
+    rodando = True
+    while rodando:
+        tempo_atual = pygame.time.get_ticks()
+        clique_ocorreu = False
+        
+        for evento in pygame.event.get():
+            if evento.type == pygame.QUIT:
+                pygame.quit()
+                sys.exit()
+            if evento.type == pygame.KEYDOWN:
+                # Tecla ESC, Backspace ou M para voltar ao menu
+                if evento.key == pygame.K_ESCAPE or evento.key == pygame.K_BACKSPACE or evento.key == pygame.K_m:
+                    # Efeito de fade out ao sair
+                    for i in range(30):
+                        desenhar_overlay_cor(tela, (0, 0, 0), i * 8, (LARGURA, ALTURA))
+                        present_frame()
+                        pygame.time.delay(5)
+                    return "menu"
+                # Teclas numéricas para trocar de categoria
+                if evento.key == pygame.K_1:
+                    aba_ativa = 0  # Armas
+                if evento.key == pygame.K_2:
+                    aba_ativa = 1  # Upgrades
+                if evento.key == pygame.K_3:
+                    aba_ativa = 2  # Items
+            # Verificação de clique do mouse
+            if evento.type == pygame.MOUSEBUTTONDOWN and evento.button == 1:
+                clique_ocorreu = True
+            # Scroll do mouse - ATUALIZADO para funcionar em todas as abas
+            if evento.type == pygame.MOUSEBUTTONDOWN:
+                if evento.button == 4:  # Scroll up
+                    if aba_ativa == 0:  # Armas
+                        scroll_weapons = max(0, scroll_weapons - 30)
+                    elif aba_ativa == 1:  # Upgrades
+                        scroll_upgrades = max(0, scroll_upgrades - 30)
+                    elif aba_ativa == 2:  # Items
+                        scroll_items = max(0, scroll_items - 30)
+                elif evento.button == 5:  # Scroll down
+                    if aba_ativa == 0:  # Armas
+                        scroll_weapons = min(max_scroll_weapons, scroll_weapons + 30)
+                    elif aba_ativa == 1:  # Upgrades
+                        scroll_upgrades = min(max_scroll_upgrades, scroll_upgrades + 30)
+                    elif aba_ativa == 2:  # Items
+                        scroll_items = min(max_scroll_items, scroll_items + 30)
+        
+        # Atualizar mensagem de feedback
+        if mensagem:
+            mensagem_tempo += 1
+            if mensagem_tempo >= mensagem_duracao:
+                mensagem = ""
+                mensagem_tempo = 0
+                
+        # Efeito de fade in ao entrar
+        if fade_in > 0:
+            fade_in = max(0, fade_in - 10)
+        
+        mouse_pos = convert_mouse_position(pygame.mouse.get_pos())
         
         # Verificar cliques nas abas
         if clique_ocorreu:
@@ -294,91 +357,47 @@ def tela_loja(tela, relogio, gradiente_loja):
             elif rect_aba3.collidepoint(mouse_pos):
                 aba_ativa = 2  # Items
         
-        # Área de conteúdo da aba ativa - movida para cima
-        area_conteudo = pygame.Rect(150, 330, LARGURA - 300, ALTURA - 450)
-        pygame.draw.rect(tela, (20, 20, 50, 150), area_conteudo, 0, 10)
-        pygame.draw.rect(tela, (70, 70, 130), area_conteudo, 2, 10)
-        
-        if aba_ativa == 0:  # Armas - ATUALIZADO para usar scroll
-            resultado = desenhar_weapons_shop(tela, area_conteudo, moeda_manager, upgrades, 
-                                            mouse_pos, clique_ocorreu, som_compra, som_erro, scroll_weapons)
-            if resultado and resultado[0]:  # Se há mensagem
-                mensagem, mensagem_cor, max_scroll_weapons = resultado
-                mensagem_tempo = 0
-            elif resultado:  # Só atualizar max_scroll se não houver mensagem
-                _, _, max_scroll_weapons = resultado
-
-        elif aba_ativa == 1:  # Upgrades
-            resultado = desenhar_upgrades_shop(tela, area_conteudo, moeda_manager, upgrades,
-                                             mouse_pos, clique_ocorreu, som_compra, som_erro, scroll_upgrades)
-            if resultado and resultado[0]:  # Se há mensagem
-                mensagem, mensagem_cor, max_scroll_upgrades = resultado
-                mensagem_tempo = 0
-            elif resultado:  # Só atualizar max_scroll se não houver mensagem
-                _, _, max_scroll_upgrades = resultado
-
-        else:  # Items (aba 2)
-            resultado = desenhar_items_shop(tela, area_conteudo, moeda_manager, upgrades, 
-                                          mouse_pos, clique_ocorreu, som_compra, som_erro, scroll_items)
-            if resultado and resultado[0]:  # Verificar se há mensagem
-                mensagem, mensagem_cor, max_scroll_items = resultado
+        # O conteúdo da aba só é montado de novo quando muda o que ele
+        # mostra, ou num clique (que pode comprar)
+        scroll_atual = (scroll_weapons, scroll_upgrades, scroll_items)[aba_ativa]
+        area_animada.atualizar((aba_ativa, scroll_atual, moeda_manager.obter_quantidade(),
+                                tuple(sorted(upgrades.items())),
+                                area_animada.conteudo.alvo_em(mouse_pos)),
+                               forcar=clique_ocorreu)
+        resultado = resultado_conteudo[0]
+        resultado_conteudo[0] = None
+        if resultado:
+            if resultado[0]:  # Se há mensagem
+                mensagem, mensagem_cor, max_scroll = resultado
                 mensagem_tempo = 0
-            elif resultado:  # Só atualizar max_scroll se não houver mensagem
-                _, _, max_scroll_items = resultado
-        
-        # Desenhar botão de voltar (ajustado para ficar mais abaixo)
-        botao_voltar_largura = 240
-        botao_voltar_altura = 50
-        botao_voltar_x = LARGURA // 2
-        botao_voltar_y = ALTURA - 50
-        rect_voltar = pygame.Rect(botao_voltar_x - botao_voltar_largura//2, 
-                               botao_voltar_y - botao_voltar_altura//2, 
-                               botao_voltar_largura, botao_voltar_altura)
-        
-        # Verificar hover para o botão voltar
-        hover_voltar = rect_voltar.collidepoint(mouse_pos)
-        
-        # Desenhar o botão voltar com estilo Figma
-        cor_voltar = (80, 80, 220) if hover_voltar else (60, 60, 150)
-        pygame.draw.rect(tela, cor_voltar, rect_voltar, 0, 10)
-        pygame.draw.rect(tela, BRANCO, rect_voltar, 2, 10)
-        
-        # Texto do botão voltar
-        texto_voltar = pygame.font.SysFont("Arial", 26).render("BACK TO MENU", True, BRANCO)
-        texto_rect_voltar = texto_voltar.get_rect(center=(botao_voltar_x, botao_voltar_y))
-        tela.blit(texto_voltar, texto_rect_voltar)
+            else:  # Só atualizar max_scroll se não houver mensagem
+                _, _, max_scroll = resultado
+            if aba_ativa == 0:
+                max_scroll_weapons = max_scroll
+            elif aba_ativa == 1:
+                max_scroll_upgrades = max_scroll
+            else:
+                max_scroll_items = max_scroll
         
         # Verificar clique no botão de voltar
         if clique_ocorreu and rect_voltar.collidepoint(mouse_pos):
             # Efeito de fade out ao sair
             for i in range(30):
-                fade = pygame.Surface((LARGURA, ALTURA))
-                fade.fill((0, 0, 0))
-                fade.set_alpha(i * 8)
-                tela.blit(fade, (0, 0))
+                desenhar_overlay_cor(tela, (0, 0, 0), i * 8, (LARGURA, ALTURA))
                 present_frame()
                 pygame.time.delay(5)
             return "menu"
         
-        # Mostrar mensagem de feedback se existir
-        if mensagem:
-            # Fazer a mensagem pulsar
-            alpha = int(255 * (1.0 - mensagem_tempo / mensagem_duracao))
-            y_mensagem = area_conteudo.y - 20
-            fonte = pygame.font.SysFont("Arial", 30, True)
-            texto_surf = fonte.render(mensagem, True, mensagem_cor)
-            texto_surf.set_alpha(alpha)
-            texto_rect = texto_surf.get_rect(center=(LARGURA // 2, y_mensagem))
-            tela.blit(texto_surf, texto_rect)
+        rects = tela_retida.desenhar(tela)
         
-        # Aplicar efeito de fade-in
+        # Aplicar efeito de fade-in (por cima de tudo: a tela inteira é
+        # refeita no frame seguinte)
         if fade_in > 0:
-            fade = pygame.Surface((LARGURA, ALTURA))
-            fade.fill((0, 0, 0))
-            fade.set_alpha(fade_in)
-            tela.blit(fade, (0, 0))
+            desenhar_overlay_cor(tela, (0, 0, 0), fade_in, (LARGURA, ALTURA))
+            tela_retida.invalidar()
+            rects = None
         
-        present_frame()
+        present_frame(rects)
         relogio.tick(FPS)
     
     return "menu"
@@ -406,12 +425,12 @@ def carregar_upgrades():
     
     try:
         # Criar o diretório de dados se não existir
-        if not os.path.exists("data"):
-            os.makedirs("data")
+        if not os.path.exists(pasta_dados()):
+            os.makedirs(pasta_dados())
         
         # Tentar carregar o arquivo de upgrades
-        if os.path.exists("data/upgrades.json"):
-            with open("data/upgrades.json", "r") as f:
+        if os.path.exists(caminho_dados("upgrades.json")):
+            with open(caminho_dados("upgrades.json"), "r") as f:
                 upgrades = json.load(f)
                 # Verificar se todas as chaves existem
                 for chave in upgrades_padrao:
@@ -432,11 +451,11 @@ def salvar_upgrades(upgrades):
     """
     try:
         # Criar o diretório de dados se não existir
-        if not os.path.exists("data"):
-            os.makedirs("data")
+        if not os.path.exists(pasta_dados()):
+            os.makedirs(pasta_dados())
         
         # Salvar os upgrades no arquivo
-        with open("data/upgrades.json", "w") as f:
+        with open(caminho_dados("upgrades.json"), "w") as f:
             json.dump(upgrades, f)
     except Exception as e:
         print(f"Erro ao salvar upgrades: {e}")
\ No newline at end of file
@@ -10,13 +10,15 @@ import random
 import math
 import sys
 from src.config import *
-from src.utils.visual import criar_estrelas, desenhar_estrelas, desenhar_texto, criar_botao
+from src.utils.visual import criar_estrelas, desenhar_estrelas, rects_estrelas, desenhar_texto, criar_botao, desenhar_overlay_cor
 from src.utils.sound import gerar_som_explosao
 from src.entities.particula import criar_explosao, Particula
 from src.utils.progress import ProgressManager
 from src.utils.display_manager import present_frame,convert_mouse_position
 import pygame
 from src.utils.visual import desenhar_grid_consistente
+from src.utils.fonts import obter_fonte, renderizar_texto
+from src.ui.retained_ui import TelaRetida
 
 # IMPORTAÇÃO CORRIGIDA: agora do local correto
 from src.game.inventario import tela_inventario
@@ -45,11 +47,11 @@ def tela_inicio(tela, relogio, gradiente_menu, fonte_titulo):
     
     # Fonte pixel para título
     try:
-        fonte_pixel_grande = pygame.font.Font(FONTE_PIXEL_PATH, 48)
-        fonte_pixel_sub = pygame.font.Font(FONTE_PIXEL_PATH, 16)
+        fonte_pixel_grande = obter_fonte(FONTE_PIXEL_PATH, 48)
+        fonte_pixel_sub = obter_fonte(FONTE_PIXEL_PATH, 16)
     except:
-        fonte_pixel_grande = pygame.font.SysFont("Arial", 48, True)
-        fonte_pixel_sub = pygame.font.SysFont("Arial", 16, True)
+        fonte_pixel_grande = obter_fonte("Arial", 48, True)
+        fonte_pixel_sub = obter_fonte("Arial", 16, True)
 
     # Animação de título
     titulo_escala = 0
@@ -69,146 +71,182 @@ def tela_inicio(tela, relogio, gradiente_menu, fonte_titulo):
     except Exception as e:
         return False
 
-    # Loop principal
-    frame_count = 0
-    while True:
-        frame_count += 1
-
-        
-        tempo_atual = pygame.time.get_ticks()
-        
-        clique_ocorreu = False
-        
+    def quantidade_moedas():
         try:
-            for evento in pygame.event.get():
-                if evento.type == pygame.QUIT:
-                    pygame.quit()
-                    sys.exit()
-                if evento.type == pygame.KEYDOWN:
-                    if evento.key == pygame.K_RETURN:
-                        # MODIFICADO: Retornar a fase máxima em vez de sempre "jogar"
-                        return ("jogar", fase_maxima)
-                    if evento.key == pygame.K_l:
-                        return "loja"
-                    if evento.key == pygame.K_i:  # NOVO - tecla I para inventário
-                        return "inventario"
+            return moeda_manager.obter_quantidade()
+        except:
+            return 0
 
-                if evento.type == pygame.MOUSEBUTTONDOWN and evento.button == 1:
-                    clique_ocorreu = True
-        except Exception as e:
-            import traceback
-            traceback.print_exc()
-        
-        # Adicionar efeitos visuais aleatórios
-        if tempo_atual - tempo_ultimo_efeito > 1500:
-            tempo_ultimo_efeito = tempo_atual
-            x = random.randint(100, LARGURA - 100)
-            y = random.randint(100, ALTURA - 100)
-            cor = random.choice([AZUL, CIANO, ROXO])
-            flash = criar_explosao(x, y, cor, particulas, 12)
-            flashes.append(flash)
-            
-            # Som suave
-            try:
-                som = pygame.mixer.Sound(gerar_som_explosao())
-                som.set_volume(0.3)
-                pygame.mixer.Channel(0).play(som)
-            except:
-                pass  # Ignorar erros de som
-        
-        # Atualizar partículas e flashes
-        for particula in particulas[:]:
-            particula.atualizar()
-            if particula.acabou():
-                particulas.remove(particula)
-        
-        for flash in flashes[:]:
-            flash['vida'] -= 1
-            flash['raio'] += 3
-            if flash['vida'] <= 0:
-                flashes.remove(flash)
-        
-        # Atualizar estrelas
-        for estrela in estrelas:
-            estrela[0] -= estrela[4]
-            if estrela[0] < 0:
-                estrela[0] = LARGURA
-                estrela[1] = random.randint(0, ALTURA)
-        
-        # Animar título
-        titulo_escala += (titulo_alvo - titulo_escala) * 0.05
-        subtitulo_alpha = min(255, subtitulo_alpha + 3)
-        nevoa_offset = (nevoa_offset + 1) % 360
-        
-        # Desenhar fundo
-        try:
-            tela.blit(gradiente_menu, (0, 0))
-        except Exception as e:
-            tela.fill((30, 0, 60))  # Cor de fallback
-        
-        # Desenhar névoa colorida ondulante
+    tempo_atual = pygame.time.get_ticks()
+    mouse_pos = convert_mouse_position(pygame.mouse.get_pos())
+
+    # Ajustar dimensões para a resolução atual
+    escala_y = ALTURA / 848
+    
+    # Definir botões estilizados
+    largura_botao = 320
+    altura_botao = 65
+    espacamento = 75
+    y_inicial = ALTURA * 3 // 4 - 100
+    
+    # Botão Jogar
+    x_jogar = LARGURA // 2
+    y_jogar = y_inicial
+    largura_ajustada_jogar = int(largura_botao * escala_y)
+    altura_ajustada_jogar = int(altura_botao * escala_y)
+    rect_jogar = pygame.Rect(x_jogar - largura_ajustada_jogar // 2, 
+                            y_jogar - altura_ajustada_jogar // 2, 
+                            largura_ajustada_jogar, 
+                            altura_ajustada_jogar)
+    
+    # Botão Loja
+    x_loja = LARGURA // 2
+    y_loja = y_inicial + espacamento
+    largura_ajustada_loja = int(largura_botao * escala_y)
+    altura_ajustada_loja = int(altura_botao * escala_y)
+    rect_loja = pygame.Rect(x_loja - largura_ajustada_loja // 2, 
+                           y_loja - altura_ajustada_loja // 2, 
+                           largura_ajustada_loja, 
+                           altura_ajustada_loja)
+    
+    # Botão Inventário
+    x_inventario = LARGURA // 2
+    y_inventario = y_inicial + espacamento * 2  # Posicionar entre Loja e Sair
+    largura_ajustada_inventario = int(largura_botao * escala_y)
+    altura_ajustada_inventario = int(altura_botao * escala_y)
+    rect_inventario = pygame.Rect(x_inventario - largura_ajustada_inventario // 2,
+                                y_inventario - altura_ajustada_inventario // 2,
+                                largura_ajustada_inventario,
+                                altura_ajustada_inventario)
+
+    # Botão Multiplayer (NO CANTO ESQUERDO)
+    largura_multi_btn = 200
+    altura_multi_btn = 80
+    x_multiplayer = 120  # Esquerda da tela
+    y_multiplayer = ALTURA // 2
+    rect_multiplayer = pygame.Rect(20, y_multiplayer - altura_multi_btn // 2,
+                                  largura_multi_btn,
+                                  altura_multi_btn)
+
+    # Submenu Multiplayer (aparece quando menu_multi_aberto = True)
+    sub_x = rect_multiplayer.right + 10
+    sub_y = rect_multiplayer.y
+    sub_largura = 180
+    sub_altura = 140
+    rect_submenu = pygame.Rect(sub_x, sub_y, sub_largura, sub_altura)
+    btn_altura = 50
+    btn_margem = 15
+    rect_criar_sala = pygame.Rect(sub_x + 10, sub_y + btn_margem, sub_largura - 20, btn_altura)
+    rect_entrar_sala = pygame.Rect(sub_x + 10, sub_y + btn_margem + btn_altura + 10, sub_largura - 20, btn_altura)
+
+    # Botão Sair (DE VOLTA AO ORIGINAL)
+    x_sair = LARGURA // 2
+    y_sair = y_inicial + espacamento * 3  # Voltou ao original
+    largura_ajustada_sair = int(largura_botao * 0.7 * escala_y)
+    altura_ajustada_sair = int(altura_botao * 0.8 * escala_y)
+    rect_sair = pygame.Rect(x_sair - largura_ajustada_sair // 2,
+                           y_sair - altura_ajustada_sair // 2,
+                           largura_ajustada_sair,
+                           altura_ajustada_sair)
+    
+    # Botão de Seleção de Fase
+    largura_selecao = 100
+    altura_selecao = 50
+    x_selecao = LARGURA - 80
+    y_selecao = 80
+    largura_ajustada_selecao = int(largura_selecao * escala_y)
+    altura_ajustada_selecao = int(altura_selecao * escala_y)
+    rect_selecao = pygame.Rect(x_selecao - largura_ajustada_selecao // 2, 
+                            y_selecao - altura_ajustada_selecao // 2, 
+                            largura_ajustada_selecao, 
+                            altura_ajustada_selecao)
+
+    # Névoa colorida ondulante: uma linha de 2 px a cada 20 px, que anda
+    # até 10 px para os lados (a linha de cada alpha é montada uma vez)
+    linhas_nevoa = {}
+    rects_nevoa = [pygame.Rect(0, y, LARGURA, 2) for y in range(0, ALTURA, 20)]
+
+    def desenhar_nevoa(tela):
         for y in range(0, ALTURA, 20):
             wave_offset = math.sin((y + nevoa_offset) / 30) * 10
             alpha = int(20 + 15 * math.sin((y + nevoa_offset) / 50))
-            linha_surf = pygame.Surface((LARGURA, 2), pygame.SRCALPHA)
-            linha_surf.fill((100, 200, 255, alpha))
+            linha_surf = linhas_nevoa.get(alpha)
+            if linha_surf is None:
+                linha_surf = pygame.Surface((LARGURA, 2), pygame.SRCALPHA)
+                linha_surf.fill((100, 200, 255, alpha))
+                linhas_nevoa[alpha] = linha_surf
             tela.blit(linha_surf, (wave_offset, y))
-        
-        # Desenhar estrelas
-        desenhar_estrelas(tela, estrelas)
-        
-        # Desenhar flashes
+
+    def rects_flashes():
+        rects = []
+        for flash in flashes:
+            raio = int(flash['raio'])
+            rects.append(pygame.Rect(int(flash['x']) - raio, int(flash['y']) - raio, 2 * raio + 1, 2 * raio + 1))
+        return rects
+
+    def desenhar_flashes(tela):
         for flash in flashes:
             pygame.draw.circle(tela, flash['cor'], (int(flash['x']), int(flash['y'])), int(flash['raio']))
-        
-        # Desenhar partículas
+
+    def rects_particulas():
+        return [rect for rect in (particula.regiao() for particula in particulas) if rect]
+
+    def desenhar_particulas(tela):
         for particula in particulas:
             particula.desenhar(tela)
-        
-        # Desenhar grid sutil
-        for i in range(0, LARGURA, 60):
-            pygame.draw.line(tela, (30, 30, 60, 100), (i, 0), (i, ALTURA), 1)
-        for i in range(0, ALTURA, 60):
-            pygame.draw.line(tela, (30, 30, 60, 100), (0, i), (LARGURA, i), 1)
-        
-        # Desenhar título SquareStorm com fonte pixel retro
+
+    # Grid sutil (montado uma vez; o preto é transparente)
+    grid = pygame.Surface((LARGURA, ALTURA))
+    grid.set_colorkey((0, 0, 0))
+    for i in range(0, LARGURA, 60):
+        pygame.draw.line(grid, (30, 30, 60), (i, 0), (i, ALTURA), 1)
+    for i in range(0, ALTURA, 60):
+        pygame.draw.line(grid, (30, 30, 60), (0, i), (LARGURA, i), 1)
+
+    def desenhar_grid(tela):
+        tela.blit(grid, (0, 0))
+
+    # Título SquareStorm com fonte pixel retro
+    sombra_surf = renderizar_texto("SQUARESTORM", fonte_pixel_grande, (0, 0, 50))
+    sombra_rect = sombra_surf.get_rect(center=(LARGURA // 2 + 4, titulo_y + 4))
+    cont_surf = renderizar_texto("SQUARESTORM", fonte_pixel_grande, (100, 150, 255))
+    cont_rect = cont_surf.get_rect(center=(LARGURA // 2 + 2, titulo_y + 2))
+    titulo_rect = cont_surf.get_rect(center=(LARGURA // 2, titulo_y))
+    subtitulo_surf = fonte_pixel_sub.render("THE GEOMETRY BATTLE ARENA", True, CIANO)
+    subtitulo_rect = subtitulo_surf.get_rect(center=(LARGURA // 2, titulo_y + 55))
+    rect_titulo = titulo_rect.unionall([sombra_rect, cont_rect, subtitulo_rect])
+
+    def cor_titulo():
+        # Texto principal com brilho pulsante
+        pulse = (math.sin(tempo_atual / 500) + 1) * 0.5
+        return tuple(int(c * (0.8 + 0.2 * pulse)) for c in BRANCO)
+
+    def desenhar_titulo(tela):
         if titulo_escala > 0.1:
             # Sombra profunda
-            sombra_surf = fonte_pixel_grande.render("SQUARESTORM", True, (0, 0, 50))
-            sombra_rect = sombra_surf.get_rect(center=(LARGURA // 2 + 4, titulo_y + 4))
             tela.blit(sombra_surf, sombra_rect)
-
             # Contorno
-            cont_surf = fonte_pixel_grande.render("SQUARESTORM", True, (100, 150, 255))
-            cont_rect = cont_surf.get_rect(center=(LARGURA // 2 + 2, titulo_y + 2))
             tela.blit(cont_surf, cont_rect)
-
-            # Texto principal com brilho pulsante
-            pulse = (math.sin(tempo_atual / 500) + 1) * 0.5
-            cor_principal = tuple(int(c * (0.8 + 0.2 * pulse)) for c in BRANCO)
-            titulo_surf = fonte_pixel_grande.render("SQUARESTORM", True, cor_principal)
-            titulo_rect = titulo_surf.get_rect(center=(LARGURA // 2, titulo_y))
-            tela.blit(titulo_surf, titulo_rect)
-
+            tela.blit(renderizar_texto("SQUARESTORM", fonte_pixel_grande, cor_titulo()), titulo_rect)
             # Subtítulo estilizado com fonte pixel
-            subtitulo_surf = fonte_pixel_sub.render("THE GEOMETRY BATTLE ARENA", True, CIANO)
             subtitulo_surf.set_alpha(subtitulo_alpha)
-            subtitulo_rect = subtitulo_surf.get_rect(center=(LARGURA // 2, titulo_y + 55))
             tela.blit(subtitulo_surf, subtitulo_rect)
-        
+
+    def desenhar_moedas(tela):
         # Exibir quantidade de moedas com estilo
         moeda_size = 12
         pygame.draw.circle(tela, AMARELO, (30, 30), moeda_size)
         pygame.draw.circle(tela, (255, 215, 0), (30, 30), moeda_size - 2)
-        try:
-            desenhar_texto(tela, f"{moeda_manager.obter_quantidade()}", 24, AMARELO, 60, 30)
-        except:
-            desenhar_texto(tela, "0", 24, AMARELO, 60, 30)
-        
-        # Controles com design mais clean
-        controles_y = ALTURA // 2 - 30
-        fonte_controles = pygame.font.SysFont("Arial", 22, False)
-        
+        desenhar_texto(tela, f"{quantidade_moedas()}", 24, AMARELO, 60, 30)
+
+    # Controles com design mais clean
+    controles_y = ALTURA // 2 - 30
+    rect_controles = pygame.Rect(LARGURA // 2 - 130, controles_y - 45, 240, 100)
+
+    def clique_piscando():
+        return tempo_atual % 1000 < 500  # Pisca a cada 0.5 segundos
+
+    def desenhar_controles(tela):
         # Icones de teclas
         # WASD
         pygame.draw.rect(tela, (50, 50, 80), (LARGURA//2 - 80, controles_y - 40, 30, 30), 0, 3)
@@ -251,171 +289,191 @@ def tela_inicio(tela, relogio, gradiente_menu, fonte_titulo):
         pygame.draw.line(tela, (150, 150, 170), (mouse_x, mouse_y - 11), (mouse_x, mouse_y - 7), 1)
         
         # Indicador de clique (animado)
-        if tempo_atual % 1000 < 500:  # Pisca a cada 0.5 segundos
+        if clique_piscando():
             pygame.draw.circle(tela, (255, 50, 50), (mouse_x - 6, mouse_y - 12), 3)
         
         # Texto de atirar
         desenhar_texto(tela, "Atirar", 20, BRANCO, LARGURA//2 + 70, controles_y + 40)
-        
-        # Ajustar dimensões para a resolução atual
-        escala_y = ALTURA / 848
-        
-        # Definir botões estilizados
-        largura_botao = 320
-        altura_botao = 65
-        espacamento = 75
-        y_inicial = ALTURA * 3 // 4 - 100
-        
-        # Botão Jogar
-        x_jogar = LARGURA // 2
-        y_jogar = y_inicial
-        largura_ajustada_jogar = int(largura_botao * escala_y)
-        altura_ajustada_jogar = int(altura_botao * escala_y)
-        rect_jogar = pygame.Rect(x_jogar - largura_ajustada_jogar // 2, 
-                                y_jogar - altura_ajustada_jogar // 2, 
-                                largura_ajustada_jogar, 
-                                altura_ajustada_jogar)
-        
-        # Botão Loja
-        x_loja = LARGURA // 2
-        y_loja = y_inicial + espacamento
-        largura_ajustada_loja = int(largura_botao * escala_y)
-        altura_ajustada_loja = int(altura_botao * escala_y)
-        rect_loja = pygame.Rect(x_loja - largura_ajustada_loja // 2, 
-                               y_loja - altura_ajustada_loja // 2, 
-                               largura_ajustada_loja, 
-                               altura_ajustada_loja)
-        
-        # Botão Inventário
-        x_inventario = LARGURA // 2
-        y_inventario = y_inicial + espacamento * 2  # Posicionar entre Loja e Sair
-        largura_ajustada_inventario = int(largura_botao * escala_y)
-        altura_ajustada_inventario = int(altura_botao * escala_y)
-        rect_inventario = pygame.Rect(x_inventario - largura_ajustada_inventario // 2,
-                                    y_inventario - altura_ajustada_inventario // 2,
-                                    largura_ajustada_inventario,
-                                    altura_ajustada_inventario)
-
-        # Botão Multiplayer (NO CANTO ESQUERDO)
-        largura_multi_btn = 200
-        altura_multi_btn = 80
-        x_multiplayer = 120  # Esquerda da tela
-        y_multiplayer = ALTURA // 2
-        rect_multiplayer = pygame.Rect(20, y_multiplayer - altura_multi_btn // 2,
-                                      largura_multi_btn,
-                                      altura_multi_btn)
-
-        # Botão Sair (DE VOLTA AO ORIGINAL)
-        x_sair = LARGURA // 2
-        y_sair = y_inicial + espacamento * 3  # Voltou ao original
-        largura_ajustada_sair = int(largura_botao * 0.7 * escala_y)
-        altura_ajustada_sair = int(altura_botao * 0.8 * escala_y)
-        rect_sair = pygame.Rect(x_sair - largura_ajustada_sair // 2,
-                               y_sair - altura_ajustada_sair // 2,
-                               largura_ajustada_sair,
-                               altura_ajustada_sair)
-        
-        # Botão de Seleção de Fase
-        largura_selecao = 100
-        altura_selecao = 50
-        x_selecao = LARGURA - 80
-        y_selecao = 80
-        largura_ajustada_selecao = int(largura_selecao * escala_y)
-        altura_ajustada_selecao = int(altura_selecao * escala_y)
-        rect_selecao = pygame.Rect(x_selecao - largura_ajustada_selecao // 2, 
-                                y_selecao - altura_ajustada_selecao // 2, 
-                                largura_ajustada_selecao, 
-                                altura_ajustada_selecao)
-                
-        # Desenhar botões com novo estilo
-        botao_jogar = criar_botao(tela, "PLAY", x_jogar, y_jogar, largura_botao, altura_botao, 
-                                 (0, 100, 200), (0, 150, 255), BRANCO)
-        
-        botao_loja = criar_botao(tela, "SHOP", x_loja, y_loja, largura_botao, altura_botao, 
-                                (150, 100, 0), (255, 180, 0), BRANCO)
-        
-        botao_inventario = criar_botao(tela, "INVENTORY", x_inventario, y_inventario, largura_botao, altura_botao,
-                                      (100, 50, 150), (150, 80, 200), BRANCO)
-
-        botao_sair = criar_botao(tela, "EXIT", x_sair, y_sair, largura_botao * 0.7, altura_botao * 0.8,
-                               (150, 50, 50), (200, 80, 80), BRANCO)
 
-        # Botão MINI GAMES (Lado Esquerdo) - cor rainbow animada
-        mouse_pos = convert_mouse_position(pygame.mouse.get_pos())
-        hover_multi = rect_multiplayer.collidepoint(mouse_pos)
+    def botao(texto, x, y, largura, altura, cor_normal, cor_hover):
+        def desenhar(tela):
+            criar_botao(tela, texto, x, y, largura, altura, cor_normal, cor_hover, BRANCO)
+        return desenhar
 
+    def cores_multi():
         # Cor que muda com o tempo (ciclo rainbow)
         t = tempo_atual / 1000.0
         r_cor = int(127 + 127 * math.sin(t * 2.0))
         g_cor = int(127 + 127 * math.sin(t * 2.0 + 2.094))
         b_cor = int(127 + 127 * math.sin(t * 2.0 + 4.189))
-        cor_multi = (min(255, r_cor + 40), min(255, g_cor + 40), min(255, b_cor + 40)) if hover_multi else (r_cor, g_cor, b_cor)
-
-        # Fundo do botão
-        pygame.draw.rect(tela, cor_multi, rect_multiplayer, 0, 12)
+        cor_multi = (min(255, r_cor + 40), min(255, g_cor + 40), min(255, b_cor + 40)) if rect_multiplayer.collidepoint(mouse_pos) else (r_cor, g_cor, b_cor)
         # Borda brilhante que também muda de cor
         r_b = int(127 + 127 * math.sin(t * 3.0 + 1.0))
         g_b = int(127 + 127 * math.sin(t * 3.0 + 3.094))
         b_b = int(127 + 127 * math.sin(t * 3.0 + 5.189))
-        pygame.draw.rect(tela, (r_b, g_b, b_b), rect_multiplayer, 3, 12)
+        return cor_multi, (r_b, g_b, b_b)
+
+    fonte_multi = obter_fonte("Arial", 18, True)
+
+    def desenhar_multi(tela):
+        # Botão MINI GAMES (Lado Esquerdo) - cor rainbow animada
+        cor_multi, cor_borda = cores_multi()
+        # Fundo do botão
+        pygame.draw.rect(tela, cor_multi, rect_multiplayer, 0, 12)
+        pygame.draw.rect(tela, cor_borda, rect_multiplayer, 3, 12)
 
         # Texto "MINI GAMES" centralizado
-        fonte_multi = pygame.font.SysFont("Arial", 18, True)
-        texto_multi = fonte_multi.render("MINI GAMES", True, BRANCO)
+        texto_multi = renderizar_texto("MINI GAMES", fonte_multi, BRANCO)
         texto_rect = texto_multi.get_rect(center=rect_multiplayer.center)
         tela.blit(texto_multi, texto_rect)
 
-        # Submenu Multiplayer (aparece quando menu_multi_aberto = True)
-        rect_criar = None
-        rect_entrar = None
-        if menu_multi_aberto:
-            # Painel do submenu
-            sub_x = rect_multiplayer.right + 10
-            sub_y = rect_multiplayer.y
-            sub_largura = 180
-            sub_altura = 140
-            rect_submenu = pygame.Rect(sub_x, sub_y, sub_largura, sub_altura)
-
-            # Fundo do submenu
-            pygame.draw.rect(tela, (30, 30, 50), rect_submenu, 0, 10)
-            pygame.draw.rect(tela, (80, 200, 150), rect_submenu, 3, 10)
-
-            # Botão "Criar Sala"
-            btn_altura = 50
-            btn_margem = 15
-            rect_criar = pygame.Rect(sub_x + 10, sub_y + btn_margem, sub_largura - 20, btn_altura)
-            hover_criar = rect_criar.collidepoint(mouse_pos)
-            cor_criar = (80, 180, 130) if hover_criar else (60, 140, 100)
-            pygame.draw.rect(tela, cor_criar, rect_criar, 0, 8)
-            pygame.draw.rect(tela, BRANCO, rect_criar, 2, 8)
-
-            texto_criar = fonte_multi.render("CRIAR SALA", True, BRANCO)
-            texto_criar_rect = texto_criar.get_rect(center=rect_criar.center)
-            tela.blit(texto_criar, texto_criar_rect)
-
-            # Botão "Entrar na Sala"
-            rect_entrar = pygame.Rect(sub_x + 10, sub_y + btn_margem + btn_altura + 10, sub_largura - 20, btn_altura)
-            hover_entrar = rect_entrar.collidepoint(mouse_pos)
-            cor_entrar = (80, 180, 200) if hover_entrar else (60, 140, 160)
-            pygame.draw.rect(tela, cor_entrar, rect_entrar, 0, 8)
-            pygame.draw.rect(tela, BRANCO, rect_entrar, 2, 8)
-
-            texto_entrar = fonte_multi.render("ENTRAR NA SALA", True, BRANCO)
-            texto_entrar_rect = texto_entrar.get_rect(center=rect_entrar.center)
-            tela.blit(texto_entrar, texto_entrar_rect)
-
+    def estado_submenu():
+        if not menu_multi_aberto:
+            return None
+        return rect_criar_sala.collidepoint(mouse_pos), rect_entrar_sala.collidepoint(mouse_pos)
+
+    def desenhar_submenu(tela):
+        if not menu_multi_aberto:
+            return
+        # Fundo do submenu
+        pygame.draw.rect(tela, (30, 30, 50), rect_submenu, 0, 10)
+        pygame.draw.rect(tela, (80, 200, 150), rect_submenu, 3, 10)
+
+        # Botão "Criar Sala"
+        hover_criar = rect_criar_sala.collidepoint(mouse_pos)
+        cor_criar = (80, 180, 130) if hover_criar else (60, 140, 100)
+        pygame.draw.rect(tela, cor_criar, rect_criar_sala, 0, 8)
+        pygame.draw.rect(tela, BRANCO, rect_criar_sala, 2, 8)
+
+        texto_criar = renderizar_texto("CRIAR SALA", fonte_multi, BRANCO)
+        texto_criar_rect = texto_criar.get_rect(center=rect_criar_sala.center)
+        tela.blit(texto_criar, texto_criar_rect)
+
+        # Botão "Entrar na Sala"
+        hover_entrar = rect_entrar_sala.collidepoint(mouse_pos)
+        cor_entrar = (80, 180, 200) if hover_entrar else (60, 140, 160)
+        pygame.draw.rect(tela, cor_entrar, rect_entrar_sala, 0, 8)
+        pygame.draw.rect(tela, BRANCO, rect_entrar_sala, 2, 8)
+
+        texto_entrar = renderizar_texto("ENTRAR NA SALA", fonte_multi, BRANCO)
+        texto_entrar_rect = texto_entrar.get_rect(center=rect_entrar_sala.center)
+        tela.blit(texto_entrar, texto_entrar_rect)
+
+    def desenhar_selecao(tela):
         # Desenhar botão de seleção de fase com ícone de menu
-        mouse_pos = convert_mouse_position(pygame.mouse.get_pos())
-        hover_selecao = rect_selecao.collidepoint(mouse_pos)
-        cor_botao_selecao = (70, 70, 200) if hover_selecao else (50, 50, 150)
+        cor_botao_selecao = (70, 70, 200) if rect_selecao.collidepoint(mouse_pos) else (50, 50, 150)
         pygame.draw.rect(tela, cor_botao_selecao, rect_selecao, 0, 10)
         pygame.draw.rect(tela, BRANCO, rect_selecao, 2, 10)
 
         # Desenhar texto "LEVELS" no botão
-        fonte_levels = pygame.font.SysFont("Arial", 18, True)
-        texto_levels = fonte_levels.render("LEVELS", True, BRANCO)
+        fonte_levels = obter_fonte("Arial", 18, True)
+        texto_levels = renderizar_texto("LEVELS", fonte_levels, BRANCO)
         texto_rect = texto_levels.get_rect(center=rect_selecao.center)
         tela.blit(texto_levels, texto_rect)
+
+    # Tela retida: névoa, estrelas, flashes e partículas nas camadas; grid,
+    # título, controles e botões em widgets (os botões são opacos: uma linha
+    # de névoa que corta um botão não refaz o botão inteiro na tela)
+    tela_retida = TelaRetida(gradiente_menu)
+    tela_retida.adicionar_camada(lambda: rects_nevoa, desenhar_nevoa)
+    tela_retida.adicionar_camada(lambda: rects_estrelas(estrelas), lambda tela: desenhar_estrelas(tela, estrelas))
+    tela_retida.adicionar_camada(rects_flashes, desenhar_flashes)
+    tela_retida.adicionar_camada(rects_particulas, desenhar_particulas)
+    tela_retida.adicionar(tela.get_rect(), desenhar_grid)
+    tela_retida.adicionar(rect_titulo, desenhar_titulo,
+                          lambda: (titulo_escala > 0.1, cor_titulo(), subtitulo_alpha))
+    tela_retida.adicionar((0, 0, 200, 60), desenhar_moedas, quantidade_moedas)
+    tela_retida.adicionar(rect_controles, desenhar_controles, clique_piscando)
+    for rect, texto, x, y, largura, altura, cor_normal, cor_hover in (
+            (rect_jogar, "PLAY", x_jogar, y_jogar, largura_botao, altura_botao, (0, 100, 200), (0, 150, 255)),
+            (rect_loja, "SHOP", x_loja, y_loja, largura_botao, altura_botao, (150, 100, 0), (255, 180, 0)),
+            (rect_inventario, "INVENTORY", x_inventario, y_inventario, largura_botao, altura_botao,
+             (100, 50, 150), (150, 80, 200)),
+            (rect_sair, "EXIT", x_sair, y_sair, largura_botao * 0.7, altura_botao * 0.8,
+             (150, 50, 50), (200, 80, 80))):
+        tela_retida.adicionar(rect, botao(texto, x, y, largura, altura, cor_normal, cor_hover),
+                              lambda rect=rect: rect.collidepoint(mouse_pos), opaco=True)
+    tela_retida.adicionar(rect_multiplayer, desenhar_multi, cores_multi, opaco=True)
+    tela_retida.adicionar(rect_submenu, desenhar_submenu, estado_submenu, opaco=True)
+    tela_retida.adicionar(rect_selecao, desenhar_selecao, lambda: rect_selecao.collidepoint(mouse_pos), opaco=True)
+
+    # Loop principal
+    frame_count = 0
+    while True:
+        frame_count += 1
+
+        
+        tempo_atual = pygame.time.get_ticks()
+        
+        clique_ocorreu = False
+        
+        try:
+            for evento in pygame.event.get():
+                if evento.type == pygame.QUIT:
+                    pygame.quit()
+                    sys.exit()
+                if evento.type == pygame.KEYDOWN:
+                    if evento.key == pygame.K_RETURN:
+                        # MODIFICADO: Retornar a fase máxima em vez de sempre "jogar"
+                        return ("jogar", fase_maxima)
+                    if evento.key == pygame.K_l:
+                        return "loja"
+                    if evento.key == pygame.K_i:  # NOVO - tecla I para inventário
+                        return "inventario"
+
+                if evento.type == pygame.MOUSEBUTTONDOWN and evento.button == 1:
+                    clique_ocorreu = True
+        except Exception as e:
+            import traceback
+            traceback.print_exc()
+        
+        # Adicionar efeitos visuais aleatórios
+        if tempo_atual - tempo_ultimo_efeito > 1500:
+            tempo_ultimo_efeito = tempo_atual
+            x = random.randint(100, LARGURA - 100)
+            y = random.randint(100, ALTURA - 100)
+            cor = random.choice([AZUL, CIANO, ROXO])
+            flash = criar_explosao(x, y, cor, particulas, 12)
+            flashes.append(flash)
+            
+            # Som suave
+            try:
+                som = pygame.mixer.Sound(gerar_som_explosao())
+                som.set_volume(0.3)
+                pygame.mixer.Channel(0).play(som)
+            except:
+                pass  # Ignorar erros de som
+        
+        # Atualizar partículas e flashes
+        for particula in particulas[:]:
+            particula.atualizar()
+            if particula.acabou():
+                particulas.remove(particula)
+        
+        for flash in flashes[:]:
+            flash['vida'] -= 1
+            flash['raio'] += 3
+            if flash['vida'] <= 0:
+                flashes.remove(flash)
+        
+        # Atualizar estrelas
+        for estrela in estrelas:
+            estrela[0] -= estrela[4]
+            if estrela[0] < 0:
+                estrela[0] = LARGURA
+                estrela[1] = random.randint(0, ALTURA)
+        
+        # Animar título
+        titulo_escala += (titulo_alvo - titulo_escala) * 0.05
+        subtitulo_alpha = min(255, subtitulo_alpha + 3)
+        nevoa_offset = (nevoa_offset + 1) % 360
+        
+        mouse_pos = convert_mouse_position(pygame.mouse.get_pos())
+        rects = tela_retida.desenhar(tela)
+
+        # Os botões do submenu só valem se ele estava aberto neste frame
+        rect_criar = rect_criar_sala if menu_multi_aberto else None
+        rect_entrar = rect_entrar_sala if menu_multi_aberto else None
         
         # Verificar cliques nos botões
         if clique_ocorreu:
@@ -468,7 +526,7 @@ def tela_inicio(tela, relogio, gradiente_menu, fonte_titulo):
             if rect_selecao.collidepoint(mouse_pos):
                 return "selecao_fase"
         
-        present_frame()
+        present_frame(rects)
         relogio.tick(FPS)
 
 def tela_game_over(tela, relogio, gradiente_vitoria, gradiente_derrota, vitoria, fase_atual):
@@ -582,9 +640,7 @@ def tela_game_over(tela, relogio, gradiente_vitoria, gradiente_derrota, vitoria,
         
         # Desenhar overlay escuro pulsante
         overlay_alpha = int(30 + 20 * math.sin(tempo_atual / 300))
-        overlay = pygame.Surface((LARGURA, ALTURA), pygame.SRCALPHA)
-        overlay.fill((0, 0, 0, overlay_alpha))
-        tela.blit(overlay, (0, 0))
+        desenhar_overlay_cor(tela, (0, 0, 0), overlay_alpha, (LARGURA, ALTURA))
         
         # Desenhar estrelas (mais lentas)
         for estrela in estrelas:
@@ -624,7 +680,7 @@ def tela_game_over(tela, relogio, gradiente_vitoria, gradiente_derrota, vitoria,
             # Texto principal com brilho pulsante
             pulse = (math.sin(tempo_atual / 200) + 1) * 0.5
             cor_principal = tuple(int(c * (0.7 + 0.3 * pulse)) for c in VERMELHO)
-            texto_surf = pygame.font.SysFont("Arial", tamanho_texto, True).render("GAME OVER", True, cor_principal)
+            texto_surf = obter_fonte("Arial", tamanho_texto, True).render("GAME OVER", True, cor_principal)
             texto_surf.set_alpha(alpha_texto)
             texto_rect = texto_surf.get_rect(center=(LARGURA // 2 + shake_offset, ALTURA // 3))
             tela.blit(texto_surf, texto_rect)
@@ -637,7 +693,7 @@ def tela_game_over(tela, relogio, gradiente_vitoria, gradiente_derrota, vitoria,
         else:
             msg = "O inimigo te derrotou!"
             
-        msg_surf = pygame.font.SysFont("Arial", 28).render(msg, True, (200, 200, 200))
+        msg_surf = obter_fonte("Arial", 28).render(msg, True, (200, 200, 200))
         msg_surf.set_alpha(min(200, alpha_texto - 50))
         msg_rect = msg_surf.get_rect(center=(LARGURA // 2, ALTURA // 3 + 100))
         tela.blit(msg_surf, msg_rect)
@@ -673,9 +729,7 @@ def tela_game_over(tela, relogio, gradiente_vitoria, gradiente_derrota, vitoria,
             if rect_menu.collidepoint(mouse_pos):
                 # Efeito de fade out
                 for i in range(20):
-                    fade_surf = pygame.Surface((LARGURA, ALTURA), pygame.SRCALPHA)
-                    fade_surf.fill((0, 0, 0, i * 12))
-                    tela.blit(fade_surf, (0, 0))
+                    desenhar_overlay_cor(tela, (0, 0, 0), i * 12, (LARGURA, ALTURA))
                     present_frame()
                     pygame.time.delay(30)
                 return True
@@ -834,9 +888,7 @@ def tela_vitoria_fase(tela, relogio, gradiente_vitoria, fase_atual):
         
         # Desenhar overlay dourado pulsante
         overlay_alpha = int(15 + 10 * math.sin(tempo_atual / 400))
-        overlay = pygame.Surface((LARGURA, ALTURA), pygame.SRCALPHA)
-        overlay.fill((255, 215, 0, overlay_alpha))
-        tela.blit(overlay, (0, 0))
+        desenhar_overlay_cor(tela, (255, 215, 0), overlay_alpha, (LARGURA, ALTURA))
         
         # Desenhar raios de luz atrás do texto
         centro_x, centro_y = LARGURA // 2, ALTURA // 3
@@ -895,7 +947,7 @@ def tela_vitoria_fase(tela, relogio, gradiente_vitoria, fase_atual):
             # Texto principal com brilho pulsante
             pulse = (math.sin(tempo_atual / 250) + 1) * 0.5
             cor_principal = tuple(int(c * (0.8 + 0.2 * pulse)) for c in VERDE)
-            texto_surf = pygame.font.SysFont("Arial", tamanho_texto, True).render(texto, True, cor_principal)
+            texto_surf = obter_fonte("Arial", tamanho_texto, True).render(texto, True, cor_principal)
             texto_surf.set_alpha(alpha_texto)
             texto_rect = texto_surf.get_rect(center=(LARGURA // 2, ALTURA // 3))
             tela.blit(texto_surf, texto_rect)
@@ -912,7 +964,7 @@ def tela_vitoria_fase(tela, relogio, gradiente_vitoria, fase_atual):
         
         # Mensagem de inimigos derrotados com estilo
         msg = f"Inimigos derrotados: {fase_atual if fase_atual < 3 else 1}"
-        msg_surf = pygame.font.SysFont("Arial", 26, True).render(msg, True, CIANO)
+        msg_surf = obter_fonte("Arial", 26, True).render(msg, True, CIANO)
         msg_surf.set_alpha(min(220, alpha_texto - 30))
         msg_rect = msg_surf.get_rect(center=(LARGURA // 2, ALTURA // 3 + 90))
         tela.blit(msg_surf, msg_rect)
@@ -998,9 +1050,9 @@ def obter_ip_local_simples():
 def tela_criar_servidor_simples(tela, relogio, gradiente):
     """Tela de configuração completa para criar servidor multiplayer."""
     print("[CRIAR SERVIDOR] Tela aberta")
-    fonte = pygame.font.SysFont("Arial", 32, True)
-    fonte_normal = pygame.font.SysFont("Arial", 24)
-    fonte_pequena = pygame.font.SysFont("Arial", 18)
+    fonte = obter_fonte("Arial", 32, True)
+    fonte_normal = obter_fonte("Arial", 24)
+    fonte_pequena = obter_fonte("Arial", 18)
 
     # Valores padrão
     nome = "Host"
@@ -1015,6 +1067,55 @@ def tela_criar_servidor_simples(tela, relogio, gradiente):
     input_nome = pygame.Rect(LARGURA // 2 - 200, 220, 400, 50)
     input_porta = pygame.Rect(LARGURA // 2 - 200, 300, 400, 50)
 
+    # Tela retida: fundo fixo e só campos/botões redesenhados quando mudam
+    fundo = gradiente.copy()
+    titulo = renderizar_texto("CONFIGURAR SERVIDOR", fonte, BRANCO)
+    fundo.blit(titulo, (LARGURA // 2 - titulo.get_width() // 2, 80))
+    fundo.blit(renderizar_texto("Nome do Host:", fonte_normal, BRANCO), (LARGURA // 2 - 200, 190))
+    fundo.blit(renderizar_texto("Porta:", fonte_normal, BRANCO), (LARGURA // 2 - 200, 270))
+    inst = renderizar_texto("Clique nos campos para editar | ESC para cancelar", fonte_pequena, (150, 150, 150))
+    fundo.blit(inst, (LARGURA // 2 - inst.get_width() // 2, ALTURA - 30))
+
+    def desenhar_campo_nome(tela):
+        cor_nome = AZUL if campo_ativo == "nome" else AZUL_ESCURO
+        pygame.draw.rect(tela, cor_nome, input_nome, 0, 8)
+        pygame.draw.rect(tela, BRANCO, input_nome, 3, 8)
+        texto_nome = renderizar_texto(nome if nome else "Digite seu nome", fonte_normal, BRANCO if nome else (100, 100, 100))
+        tela.blit(texto_nome, (input_nome.x + 10, input_nome.y + 12))
+
+    def desenhar_campo_porta(tela):
+        cor_porta = AZUL if campo_ativo == "porta" else AZUL_ESCURO
+        pygame.draw.rect(tela, cor_porta, input_porta, 0, 8)
+        pygame.draw.rect(tela, BRANCO, input_porta, 3, 8)
+        texto_porta = renderizar_texto(porta if porta else "5555", fonte_normal, BRANCO if porta else (100, 100, 100))
+        tela.blit(texto_porta, (input_porta.x + 10, input_porta.y + 12))
+
+    def hover(rect):
+        return rect.collidepoint(convert_mouse_position(pygame.mouse.get_pos()))
+
+    def desenhar_botao_criar(tela):
+        cor_criar = VERDE if hover(btn_criar) else (40, 120, 40)
+        pygame.draw.rect(tela, cor_criar, btn_criar, 0, 10)
+        pygame.draw.rect(tela, BRANCO, btn_criar, 3, 10)
+        texto_criar = renderizar_texto("CRIAR SERVIDOR", fonte_normal, BRANCO)
+        tela.blit(texto_criar, (btn_criar.centerx - texto_criar.get_width() // 2, btn_criar.centery - texto_criar.get_height() // 2))
+
+    def desenhar_botao_cancelar(tela):
+        cor_cancelar = VERMELHO if hover(btn_cancelar) else (120, 40, 40)
+        pygame.draw.rect(tela, cor_cancelar, btn_cancelar, 0, 10)
+        pygame.draw.rect(tela, BRANCO, btn_cancelar, 3, 10)
+        texto_cancelar = renderizar_texto("CANCELAR", fonte_pequena, BRANCO)
+        tela.blit(texto_cancelar, (btn_cancelar.centerx - texto_cancelar.get_width() // 2, btn_cancelar.centery - texto_cancelar.get_height() // 2))
+
+    # Os campos ocupam a linha inteira (o texto pode passar da caixa)
+    tela_retida = TelaRetida(fundo)
+    tela_retida.adicionar((0, input_nome.y, LARGURA, input_nome.height), desenhar_campo_nome,
+                          lambda: (campo_ativo == "nome", nome))
+    tela_retida.adicionar((0, input_porta.y, LARGURA, input_porta.height), desenhar_campo_porta,
+                          lambda: (campo_ativo == "porta", porta))
+    tela_retida.adicionar(btn_criar, desenhar_botao_criar, lambda: hover(btn_criar))
+    tela_retida.adicionar(btn_cancelar, desenhar_botao_cancelar, lambda: hover(btn_cancelar))
+
     while True:
         for evento in pygame.event.get():
             if evento.type == pygame.QUIT:
@@ -1077,63 +1178,15 @@ def tela_criar_servidor_simples(tela, relogio, gradiente):
                 if btn_cancelar.collidepoint(mouse_click_pos):
                     return None
 
-        # Desenhar
-        tela.blit(gradiente, (0, 0))
-        mouse_pos = convert_mouse_position(pygame.mouse.get_pos())
-
-        # Título
-        titulo = fonte.render("CONFIGURAR SERVIDOR", True, BRANCO)
-        tela.blit(titulo, (LARGURA // 2 - titulo.get_width() // 2, 80))
-
-
-
-        # Campo Nome
-        label_nome = fonte_normal.render("Nome do Host:", True, BRANCO)
-        tela.blit(label_nome, (LARGURA // 2 - 200, 190))
-        cor_nome = AZUL if campo_ativo == "nome" else AZUL_ESCURO
-        pygame.draw.rect(tela, cor_nome, input_nome, 0, 8)
-        pygame.draw.rect(tela, BRANCO, input_nome, 3, 8)
-        texto_nome = fonte_normal.render(nome if nome else "Digite seu nome", True, BRANCO if nome else (100, 100, 100))
-        tela.blit(texto_nome, (input_nome.x + 10, input_nome.y + 12))
-
-        # Campo Porta
-        label_porta = fonte_normal.render("Porta:", True, BRANCO)
-        tela.blit(label_porta, (LARGURA // 2 - 200, 270))
-        cor_porta = AZUL if campo_ativo == "porta" else AZUL_ESCURO
-        pygame.draw.rect(tela, cor_porta, input_porta, 0, 8)
-        pygame.draw.rect(tela, BRANCO, input_porta, 3, 8)
-        texto_porta = fonte_normal.render(porta if porta else "5555", True, BRANCO if porta else (100, 100, 100))
-        tela.blit(texto_porta, (input_porta.x + 10, input_porta.y + 12))
-
-        # Botão Criar
-        hover_criar = btn_criar.collidepoint(mouse_pos)
-        cor_criar = VERDE if hover_criar else (40, 120, 40)
-        pygame.draw.rect(tela, cor_criar, btn_criar, 0, 10)
-        pygame.draw.rect(tela, BRANCO, btn_criar, 3, 10)
-        texto_criar = fonte_normal.render("CRIAR SERVIDOR", True, BRANCO)
-        tela.blit(texto_criar, (btn_criar.centerx - texto_criar.get_width() // 2, btn_criar.centery - texto_criar.get_height() // 2))
-
-        # Botão Cancelar
-        hover_cancelar = btn_cancelar.collidepoint(mouse_pos)
-        cor_cancelar = VERMELHO if hover_cancelar else (120, 40, 40)
-        pygame.draw.rect(tela, cor_cancelar, btn_cancelar, 0, 10)
-        pygame.draw.rect(tela, BRANCO, btn_cancelar, 3, 10)
-        texto_cancelar = fonte_pequena.render("CANCELAR", True, BRANCO)
-        tela.blit(texto_cancelar, (btn_cancelar.centerx - texto_cancelar.get_width() // 2, btn_cancelar.centery - texto_cancelar.get_height() // 2))
-
-        # Instruções
-        inst = fonte_pequena.render("Clique nos campos para editar | ESC para cancelar", True, (150, 150, 150))
-        tela.blit(inst, (LARGURA // 2 - inst.get_width() // 2, ALTURA - 30))
-
-        present_frame()
+        present_frame(tela_retida.desenhar(tela))
         relogio.tick(60)
 
 
 def tela_conectar_servidor_simples(tela, relogio, gradiente):
     """Tela simplificada para conectar a servidor."""
     print("[CONECTAR] Tela aberta")
-    fonte = pygame.font.SysFont("Arial", 32, True)
-    fonte_normal = pygame.font.SysFont("Arial", 24)
+    fonte = obter_fonte("Arial", 32, True)
+    fonte_normal = obter_fonte("Arial", 24)
 
     # Valores
     nome = "Player"
@@ -1148,6 +1201,50 @@ def tela_conectar_servidor_simples(tela, relogio, gradiente):
     input_ip = pygame.Rect(LARGURA // 2 - 200, 280, 400, 50)
     input_porta = pygame.Rect(LARGURA // 2 - 200, 360, 400, 50)
 
+    # Tela retida: fundo fixo e só campos/botão redesenhados quando mudam
+    fundo = gradiente.copy()
+    titulo = renderizar_texto("ENTRAR NA SALA", fonte, BRANCO)
+    fundo.blit(titulo, (LARGURA // 2 - titulo.get_width() // 2, 100))
+    fundo.blit(renderizar_texto("IP do Servidor:", fonte_normal, BRANCO), (LARGURA // 2 - 200, 250))
+    fundo.blit(renderizar_texto("Porta:", fonte_normal, BRANCO), (LARGURA // 2 - 200, 330))
+    inst = renderizar_texto("Clique nos campos para editar", fonte_normal, (150, 150, 150))
+    fundo.blit(inst, (LARGURA // 2 - inst.get_width() // 2, ALTURA - 100))
+    inst2 = renderizar_texto("ENTER para conectar | ESC para cancelar", fonte_normal, (150, 150, 150))
+    fundo.blit(inst2, (LARGURA // 2 - inst2.get_width() // 2, ALTURA - 60))
+
+    def desenhar_campo_ip(tela):
+        cor_ip = AZUL if campo_ativo == "ip" else AZUL_ESCURO
+        pygame.draw.rect(tela, cor_ip, input_ip, 0, 8)
+        pygame.draw.rect(tela, BRANCO, input_ip, 3, 8)
+        texto_ip = renderizar_texto(ip if ip else "Ex: 127.0.0.1", fonte_normal, BRANCO if ip else (100, 100, 100))
+        tela.blit(texto_ip, (input_ip.x + 10, input_ip.y + 12))
+
+    def desenhar_campo_porta(tela):
+        cor_porta = AZUL if campo_ativo == "porta" else AZUL_ESCURO
+        pygame.draw.rect(tela, cor_porta, input_porta, 0, 8)
+        pygame.draw.rect(tela, BRANCO, input_porta, 3, 8)
+        texto_porta = renderizar_texto(porta if porta else "5555", fonte_normal, BRANCO if porta else (100, 100, 100))
+        tela.blit(texto_porta, (input_porta.x + 10, input_porta.y + 12))
+
+    def ok_ativo():
+        mouse_pos = convert_mouse_position(pygame.mouse.get_pos())
+        return bool(btn_ok.collidepoint(mouse_pos) and ip and porta)
+
+    def desenhar_botao_ok(tela):
+        cor = VERDE if ok_ativo() else (100, 100, 100)
+        pygame.draw.rect(tela, cor, btn_ok, 0, 10)
+        pygame.draw.rect(tela, BRANCO, btn_ok, 3, 10)
+        texto_ok = renderizar_texto("CONECTAR", fonte_normal, BRANCO)
+        tela.blit(texto_ok, (btn_ok.centerx - texto_ok.get_width() // 2, btn_ok.centery - texto_ok.get_height() // 2))
+
+    # Os campos ocupam a linha inteira (o IP pode passar da caixa)
+    tela_retida = TelaRetida(fundo)
+    tela_retida.adicionar((0, input_ip.y, LARGURA, input_ip.height), desenhar_campo_ip,
+                          lambda: (campo_ativo == "ip", ip))
+    tela_retida.adicionar((0, input_porta.y, LARGURA, input_porta.height), desenhar_campo_porta,
+                          lambda: (campo_ativo == "porta", porta))
+    tela_retida.adicionar(btn_ok, desenhar_botao_ok, ok_ativo)
+
     while True:
         for evento in pygame.event.get():
             if evento.type == pygame.QUIT:
@@ -1212,47 +1309,5 @@ def tela_conectar_servidor_simples(tela, relogio, gradiente):
                     elif campo_ativo == "porta" and len(porta) < 5 and evento.unicode.isdigit():
                         porta += evento.unicode
 
-        # Desenhar
-        tela.blit(gradiente, (0, 0))
-
-        # Título
-        titulo = fonte.render("ENTRAR NA SALA", True, BRANCO)
-        tela.blit(titulo, (LARGURA // 2 - titulo.get_width() // 2, 100))
-
-        # Labels
-        label_ip = fonte_normal.render("IP do Servidor:", True, BRANCO)
-        tela.blit(label_ip, (LARGURA // 2 - 200, 250))
-
-        label_porta = fonte_normal.render("Porta:", True, BRANCO)
-        tela.blit(label_porta, (LARGURA // 2 - 200, 330))
-
-        # Input boxes
-        cor_ip = AZUL if campo_ativo == "ip" else AZUL_ESCURO
-        pygame.draw.rect(tela, cor_ip, input_ip, 0, 8)
-        pygame.draw.rect(tela, BRANCO, input_ip, 3, 8)
-        texto_ip = fonte_normal.render(ip if ip else "Ex: 127.0.0.1", True, BRANCO if ip else (100, 100, 100))
-        tela.blit(texto_ip, (input_ip.x + 10, input_ip.y + 12))
-
-        cor_porta = AZUL if campo_ativo == "porta" else AZUL_ESCURO
-        pygame.draw.rect(tela, cor_porta, input_porta, 0, 8)
-        pygame.draw.rect(tela, BRANCO, input_porta, 3, 8)
-        texto_porta = fonte_normal.render(porta if porta else "5555", True, BRANCO if porta else (100, 100, 100))
-        tela.blit(texto_porta, (input_porta.x + 10, input_porta.y + 12))
-
-        # Botão OK
-        mouse_pos = convert_mouse_position(pygame.mouse.get_pos())
-        cor = VERDE if btn_ok.collidepoint(mouse_pos) and ip and porta else (100, 100, 100)
-        pygame.draw.rect(tela, cor, btn_ok, 0, 10)
-        pygame.draw.rect(tela, BRANCO, btn_ok, 3, 10)
-        texto_ok = fonte_normal.render("CONECTAR", True, BRANCO)
-        tela.blit(texto_ok, (btn_ok.centerx - texto_ok.get_width() // 2, btn_ok.centery - texto_ok.get_height() // 2))
-
-        # Instruções
-        inst = fonte_normal.render("Clique nos campos para editar", True, (150, 150, 150))
-        tela.blit(inst, (LARGURA // 2 - inst.get_width() // 2, ALTURA - 100))
-
-        inst2 = fonte_normal.render("ENTER para conectar | ESC para cancelar", True, (150, 150, 150))
-        tela.blit(inst2, (LARGURA // 2 - inst2.get_width() // 2, ALTURA - 60))
-
-        present_frame()
+        present_frame(tela_retida.desenhar(tela))
         relogio.tick(60)
@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Overlay de telemetria de rede (tecla F4 no multiplayer).
+Mostra RTT, filas e os tipos de pacote que mais gastam banda.
+"""
+
+import time
+import pygame
+
+# Intervalo entre atualizações do texto (taxas ficam legíveis e o custo é baixo)
+INTERVALO_ATUALIZACAO = 0.5
+MAX_TIPOS_LISTADOS = 6
+
+_fonte = None
+_cache = {'tempo': 0.0, 'linhas': []}
+
+
+def _montar_linhas(snapshot):
+    """Converte um snapshot da telemetria nas linhas de texto do overlay."""
+    rtt = snapshot['rtt_ms']
+    linhas = [
+        f"RTT p50 {rtt['p50']:.0f}ms  p95 {rtt['p95']:.0f}ms  p99 {rtt['p99']:.0f}ms",
+        "Filas: " + "  ".join(f"{nome} {valor}" for nome, valor in sorted(snapshot['queues'].items())),
+    ]
+
+    por_banda = sorted(snapshot['packets'].items(),
+                       key=lambda item: item[1]['in_kbps'] + item[1]['out_kbps'], reverse=True)
+    for nome, p in por_banda[:MAX_TIPOS_LISTADOS]:
+        linhas.append(f"{nome:<14} in {p['in_pps']:4.0f}/s {p['in_kbps']:6.1f}kb/s  "
+                      f"out {p['out_pps']:4.0f}/s {p['out_kbps']:6.1f}kb/s")
+    return linhas
+
+
+def desenhar_overlay_rede(tela, cliente, x=10, y=10):
+    """
+    Desenha o overlay de telemetria de rede do cliente.
+
+    Args:
+        tela: Superfície onde desenhar
+        cliente: GameClient conectado (usa cliente.telemetry)
+        x, y: Canto superior esquerdo do painel
+    """
+    global _fonte
+    if cliente is None:
+        return
+    if _fonte is None:
+        _fonte = pygame.font.Font(None, 18)
+
+    agora = time.time()
+    if agora - _cache['tempo'] >= INTERVALO_ATUALIZACAO:
+        _cache['tempo'] = agora
+        _cache['linhas'] = _montar_linhas(cliente.telemetry.snapshot('overlay'))
+
+    linhas = _cache['linhas']
+    altura_linha = 16
+    largura = 430
+    painel = pygame.Surface((largura, altura_linha * len(linhas) + 10), pygame.SRCALPHA)
+    painel.fill((0, 0, 0, 170))
+    tela.blit(painel, (x, y))
+
+    for i, linha in enumerate(linhas):
+        texto = _fonte.render(linha, True, (180, 255, 180))
+        tela.blit(texto, (x + 6, y + 5 + i * altura_linha))
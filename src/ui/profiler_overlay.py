@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Overlay do profiler de frame (tecla F3 em qualquer loop de jogo).
+Mostra o frame e as etapas que mais gastam tempo, cada uma com média,
+p95, fração do frame e o histograma dos últimos frames, e no rodapé a
+taxa de acertos dos caches de texto e de sprites.
+"""
+
+import time
+import pygame
+
+from src.utils.profiler import BALDES_MS
+from src.utils.fonts import cache_texto
+from src.utils.sprites import cache_sprites
+
+# Intervalo entre atualizações do painel (números legíveis e custo baixo)
+INTERVALO_ATUALIZACAO = 0.25
+MAX_ETAPAS_LISTADAS = 10
+
+LARGURA_PAINEL = 420
+ALTURA_LINHA = 16
+LARGURA_BARRA = 5
+COLUNAS = (6, 140, 200, 260)  # x de etapa, média (ms), p95 (ms), fração do frame
+COR_TEXTO = (255, 230, 150)
+COR_FRAME = (150, 220, 255)
+
+_fonte = None
+_cache = {'tempo': 0.0, 'painel': None}
+
+
+def _cor_balde(i):
+    """Verde nos baldes rápidos, vermelho nos lentos."""
+    t = i / len(BALDES_MS)
+    return (int(80 + 175 * t), int(220 - 160 * t), 80)
+
+
+def _montar_painel(perfil):
+    """Desenha o painel inteiro numa superfície (refeita a cada INTERVALO_ATUALIZACAO)."""
+    estatisticas = perfil.estatisticas()
+    etapas = list(estatisticas.items())[:MAX_ETAPAS_LISTADAS + 1]
+
+    altura = ALTURA_LINHA * (len(etapas) + 3) + 10
+    painel = pygame.Surface((LARGURA_PAINEL, altura), pygame.SRCALPHA)
+    painel.fill((0, 0, 0, 170))
+
+    for texto, x in zip(("etapa", "média", "p95", "% frame"), COLUNAS):
+        painel.blit(_fonte.render(texto, True, (200, 200, 200)), (x, 5))
+
+    for linha, (nome, e) in enumerate(etapas, start=1):
+        y = 5 + linha * ALTURA_LINHA
+        if nome == 'frame':
+            ultima = f"{1000.0 / max(e['media'], 0.01):.0f} fps"
+            cor = COR_FRAME
+        else:
+            ultima = f"{e['fracao'] * 100:.1f}%"
+            cor = COR_TEXTO
+        for texto, x in zip((nome[:16], f"{e['media']:.2f}", f"{e['p95']:.2f}", ultima), COLUNAS):
+            painel.blit(_fonte.render(texto, True, cor), (x, y))
+
+        # Histograma: uma barra por balde, altura proporcional aos frames nele
+        total = max(1, sum(e['histograma']))
+        x = LARGURA_PAINEL - 10 - len(e['histograma']) * (LARGURA_BARRA + 1)
+        for i, quantidade in enumerate(e['histograma']):
+            h = int((ALTURA_LINHA - 4) * quantidade / total)
+            if h:
+                pygame.draw.rect(painel, _cor_balde(i),
+                                 (x + i * (LARGURA_BARRA + 1), y + ALTURA_LINHA - 3 - h, LARGURA_BARRA, h))
+
+    # Rodapé: aproveitamento dos caches de texto (src/utils/fonts.py) e de
+    # sprites (src/utils/sprites.py)
+    texto = cache_texto.estatisticas()
+    sprites = cache_sprites.estatisticas()
+    rodape = (f"cache de texto: {texto['taxa'] * 100:.1f}% acertos, "
+              f"{texto['textos']} textos, {texto['fontes']} fontes",
+              f"cache de sprites: {sprites['taxa'] * 100:.1f}% acertos, "
+              f"{sprites['sprites']} sprites, {sprites['pixels'] / 1e6:.1f} Mpx")
+    for i, linha in enumerate(rodape):
+        painel.blit(_fonte.render(linha, True, (200, 200, 200)),
+                    (COLUNAS[0], 5 + (len(etapas) + 1 + i) * ALTURA_LINHA))
+    return painel
+
+
+def desenhar_overlay_perfil(tela, perfil, margem=10):
+    """
+    Desenha o overlay do profiler no canto superior direito.
+
+    Args:
+        tela: Superfície onde desenhar
+        perfil: Profiler (src.utils.profiler.perfil)
+        margem: Distância das bordas
+    """
+    global _fonte
+    if tela is None:
+        return
+    if _fonte is None:
+        _fonte = pygame.font.Font(None, 18)
+
+    agora = time.time()
+    if _cache['painel'] is None or agora - _cache['tempo'] >= INTERVALO_ATUALIZACAO:
+        _cache['tempo'] = agora
+        _cache['painel'] = _montar_painel(perfil)
+
+    painel = _cache['painel']
+    tela.blit(painel, (tela.get_width() - painel.get_width() - margem, margem))
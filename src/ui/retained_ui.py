@@ -0,0 +1,401 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Telas de UI retidas: um fundo fixo e widgets redesenhados só quando o
+estado deles muda, devolvendo os retângulos sujos para o present_frame.
+
+    tela_retida = TelaRetida(fundo)
+    tela_retida.adicionar_camada(rects_estrelas, desenhar_estrelas_menu)
+    tela_retida.adicionar(rect_botao, desenhar_botao, lambda: hover)
+    present_frame(tela_retida.desenhar(tela))
+
+Camadas são o que se move sobre o fundo (estrelas, partículas, névoa):
+a cada frame as regiões onde elas estavam e onde estão agora são
+refeitas, e os widgets ficam sempre por cima delas. Widgets animados
+(ícones, pulsos) usam um estado que muda com o tempo; widgets opacos
+(botões e abas com borda) cortados por uma região são copiados de um
+rascunho montado uma vez por estado. Áreas roláveis com
+ícones animados (cards da loja e do inventário) ficam numa AreaAnimada:
+o conteúdo fixo é montado uma vez por chave (aba, scroll, hover...) e só
+os ícones são redesenhados a cada frame.
+
+Com a tela parada (nenhum estado mudou) a lista volta vazia e o
+present_frame não copia nada para a janela. Se outro código apresentou
+um frame desde o último desenhar (o jogo antes da pausa, outra tela), a
+tela inteira é redesenhada e apresentada de novo. Em tela cheia o
+present continua escalando o frame inteiro; as regiões só valem em
+modo janela.
+"""
+
+from typing import Callable, Hashable, List, Optional
+
+import pygame
+
+from src.utils.display_manager import get_display_manager
+from src.utils.profiler import perfil
+
+# Estado que nunca é igual ao de um widget (força o primeiro desenho)
+_NUNCA = object()
+
+# Meia largura e meia altura da região de um ícone animado da loja e do
+# inventário em volta do ponto de desenho (o maior, o dash, vai de -68 a
+# +42 na horizontal; a granada, de -40 a +25 na vertical)
+MARGEM_ICONE = (70, 42)
+
+# Fundo do rascunho dos widgets opacos (colorkey: os pixels que o widget
+# não pinta não são copiados)
+COR_RASCUNHO = (255, 0, 255)
+
+
+class Widget:
+    """Região da tela com a função que a desenha e a função que dá o estado."""
+
+    __slots__ = ('rect', 'desenhar', 'estado', 'opaco', '_ultimo', '_copia', '_estado_copia')
+
+    def __init__(self, rect, desenhar: Callable[[pygame.Surface], None],
+                 estado: Optional[Callable[[], Hashable]] = None, opaco: bool = False):
+        """
+        Args:
+            rect: Região ocupada (o desenho é cortado nela)
+            desenhar: Função que recebe a tela e desenha o widget
+            estado: Função que devolve o estado atual (hover, texto, ...);
+                    None = widget fixo, desenhado só com a tela inteira
+            opaco: O desenho não mistura nada com o que está por baixo;
+                   cortado por uma região, ele é feito inteiro num rascunho
+                   (uma vez por estado) e só copiado (bordas com espessura
+                   do pygame.draw.rect perdem pixels quando o clip corta o
+                   retângulo)
+        """
+        self.rect = pygame.Rect(rect)
+        self.desenhar = desenhar
+        self.estado = estado
+        self.opaco = opaco
+        self._ultimo = _NUNCA
+        self._copia: Optional[pygame.Surface] = None
+        self._estado_copia = _NUNCA
+
+
+class Camada:
+    """Elementos que se movem sobre o fundo, por baixo de todos os widgets."""
+
+    __slots__ = ('rects', 'desenhar', '_anteriores')
+
+    def __init__(self, rects: Callable[[], List[pygame.Rect]],
+                 desenhar: Callable[[pygame.Surface], None]):
+        """
+        Args:
+            rects: Função que devolve a região de cada elemento na posição
+                   atual (chamada antes de desenhar, no mesmo frame)
+            desenhar: Função que desenha todos os elementos (uma vez por
+                      frame, sem clip: nada pode sair das regiões)
+        """
+        self.rects = rects
+        self.desenhar = desenhar
+        self._anteriores: List[pygame.Rect] = []
+
+
+def _unir_regioes(rects) -> List[pygame.Rect]:
+    """
+    Junta os retângulos que se cruzam até sobrarem regiões disjuntas.
+
+    Um widget translúcido (painel, overlay) desenhado duas vezes no mesmo
+    pixel ficaria mais escuro; com as regiões disjuntas cada pixel é
+    refeito uma vez só.
+    """
+    regioes = []
+    for rect in rects:
+        if not rect.w or not rect.h:
+            continue
+        rect = pygame.Rect(rect)
+        indice = rect.collidelist(regioes)
+        while indice != -1:
+            rect.union_ip(regioes.pop(indice))
+            indice = rect.collidelist(regioes)
+        regioes.append(rect)
+    return regioes
+
+
+class TelaRetida:
+    """Fundo fixo, camadas móveis e widgets, redesenhados por região suja."""
+
+    def __init__(self, fundo: pygame.Surface):
+        """
+        Args:
+            fundo: Parte fixa da tela já composta (gradiente, títulos, legendas)
+        """
+        self.fundo = fundo
+        self.widgets: List[Widget] = []
+        self.camadas: List[Camada] = []
+        self._rects_widgets: Optional[List[pygame.Rect]] = None
+        self._rascunho: Optional[pygame.Surface] = None
+        self._pendentes: List[pygame.Rect] = []
+        self._tela = None
+        self._quadro = None
+        self._com_overlay = False
+
+    def adicionar(self, rect, desenhar, estado=None, apos: Optional[Widget] = None,
+                  opaco: bool = False) -> Widget:
+        """
+        Adiciona um widget e o devolve.
+
+        Args:
+            rect: Região do widget
+            desenhar: Função que recebe a tela e desenha o widget
+            estado: Função que devolve o estado atual (None = widget fixo)
+            apos: Widget logo abaixo do novo (None = por cima de todos)
+            opaco: Desenho sem transparência, copiado de um rascunho quando cortado
+        """
+        widget = Widget(rect, desenhar, estado, opaco)
+        if apos is None:
+            self.widgets.append(widget)
+        else:
+            self.widgets.insert(self.widgets.index(apos) + 1, widget)
+            # Entra no meio da pilha: a região dele é refeita no próximo frame
+            self._pendentes.append(widget.rect)
+        self._rects_widgets = None
+        return widget
+
+    def remover(self, widget: Widget):
+        """Tira um widget (a região dele é refeita no próximo frame)."""
+        self.widgets.remove(widget)
+        self._rects_widgets = None
+        self._pendentes.append(widget.rect)
+
+    def adicionar_camada(self, rects, desenhar) -> Camada:
+        """Adiciona uma camada móvel (por cima das anteriores) e a devolve."""
+        camada = Camada(rects, desenhar)
+        self.camadas.append(camada)
+        return camada
+
+    def sujar(self, rect):
+        """Faz o próximo desenhar() refazer uma região."""
+        self._pendentes.append(pygame.Rect(rect))
+
+    def invalidar(self):
+        """Faz o próximo desenhar() refazer a tela inteira."""
+        self._tela = None
+
+    def _desenhar_widget(self, tela: pygame.Surface, widget: Widget, regiao: pygame.Rect):
+        """Desenha um widget cortado na interseção da região com o rect dele."""
+        corte = regiao.clip(widget.rect)
+        tela.set_clip(corte)
+        if not widget.opaco or corte == widget.rect:
+            widget.desenhar(tela)
+            return
+        visivel = widget.rect.clip(tela.get_rect())
+        if widget._copia is None or widget._estado_copia != widget._ultimo:
+            if self._rascunho is None:
+                self._rascunho = pygame.Surface(self.fundo.get_size())
+                self._rascunho.set_colorkey(COR_RASCUNHO)
+            self._rascunho.set_clip(visivel)
+            self._rascunho.fill(COR_RASCUNHO, visivel)
+            widget.desenhar(self._rascunho)
+            widget._copia = self._rascunho.subsurface(visivel).copy()
+            widget._estado_copia = widget._ultimo
+        tela.blit(widget._copia, corte, corte.move(-visivel.x, -visivel.y))
+
+    def desenhar(self, tela: pygame.Surface) -> List[pygame.Rect]:
+        """
+        Atualiza a tela e devolve as regiões que mudaram.
+
+        Args:
+            tela: Superfície do jogo
+
+        Returns:
+            Retângulos sujos para present_frame (vazio se nada mudou)
+        """
+        quadros = get_display_manager().quadros
+        # O overlay do profiler (F3) pinta por cima da tela: enquanto ele
+        # aparece, e no frame em que some, tudo é refeito
+        com_overlay = perfil.overlay_visivel
+        inteira = (tela is not self._tela or quadros != self._quadro
+                   or com_overlay or self._com_overlay)
+        self._tela = tela
+        self._com_overlay = com_overlay
+        # O present que vem a seguir conta um quadro
+        self._quadro = quadros + 1
+
+        sujos = self._pendentes
+        self._pendentes = []
+        for camada in self.camadas:
+            atuais = camada.rects()
+            sujos.extend(camada._anteriores)
+            sujos.extend(atuais)
+            camada._anteriores = atuais
+
+        if inteira:
+            tela_inteira = tela.get_rect()
+            tela.blit(self.fundo, (0, 0))
+            for camada in self.camadas:
+                camada.desenhar(tela)
+            for widget in self.widgets:
+                widget._ultimo = widget.estado() if widget.estado else None
+                self._desenhar_widget(tela, widget, tela_inteira)
+            tela.set_clip(None)
+            return [tela_inteira]
+
+        for widget in self.widgets:
+            if widget.estado is None:
+                continue
+            estado = widget.estado()
+            if estado != widget._ultimo:
+                widget._ultimo = estado
+                sujos.append(widget.rect)
+        regioes = _unir_regioes(sujos)
+        if not regioes:
+            return []
+
+        # Fundo por baixo de todas as regiões, as camadas inteiras (os
+        # elementos só pintam dentro delas) e, em cada região, os widgets
+        # que a cruzam, na ordem da pilha
+        for regiao in regioes:
+            tela.blit(self.fundo, regiao, regiao)
+        for camada in self.camadas:
+            camada.desenhar(tela)
+        if self._rects_widgets is None:
+            self._rects_widgets = [widget.rect for widget in self.widgets]
+        for regiao in regioes:
+            for indice in regiao.collidelistall(self._rects_widgets):
+                self._desenhar_widget(tela, self.widgets[indice], regiao)
+        tela.set_clip(None)
+        return regioes
+
+
+class ConteudoAnimado:
+    """
+    O que uma função de desenho deixa para os widgets de uma AreaAnimada:
+    os ícones animados (desenhados depois, cada um no seu widget), as
+    superfícies de frente (texto e botões, por cima dos ícones) e os alvos
+    de hover.
+    """
+
+    def __init__(self, origem=(0, 0), clip=None):
+        """
+        Args:
+            origem: Posição na tela da superfície onde a função desenha
+                    (somada às coordenadas dos ícones)
+            clip: Região da tela que corta os ícones (None = sem corte)
+        """
+        self.origem = origem
+        self.clip = pygame.Rect(clip) if clip is not None else None
+        self.animacoes = []
+        self.frentes = []
+        self.alvos: List[pygame.Rect] = []
+
+    def animar(self, funcao, x, y, *args, rect=None, clip=None, estado=None):
+        """
+        Guarda uma animação no lugar de desenhá-la.
+
+        Args:
+            funcao: Função (tela, x, y, tempo_atual, *args) que desenha o ícone
+            x, y: Ponto de desenho na superfície da função
+            rect: Região da animação na mesma superfície (None = MARGEM_ICONE em volta de x, y)
+            clip: Corte na tela (None = o clip do conteúdo)
+            estado: Função de estado do widget (None = muda a cada frame)
+        """
+        if rect is None:
+            rect = (x - MARGEM_ICONE[0], y - MARGEM_ICONE[1], 2 * MARGEM_ICONE[0], 2 * MARGEM_ICONE[1])
+        dx, dy = self.origem
+        rect = pygame.Rect(rect).move(dx, dy)
+        clip = pygame.Rect(clip) if clip is not None else self.clip
+        if clip is not None:
+            rect = rect.clip(clip)
+        self.animacoes.append((rect, funcao, x + dx, y + dy, args, estado))
+
+    def frente(self, superficie: pygame.Surface, posicao):
+        """Guarda uma superfície que vai por cima das animações."""
+        self.frentes.append((superficie, posicao))
+
+    def alvo(self, rect):
+        """Guarda uma região (na tela) onde o hover muda o desenho."""
+        self.alvos.append(pygame.Rect(rect))
+
+    def alvo_em(self, posicao) -> int:
+        """Índice do alvo sob a posição do mouse (-1 se nenhum)."""
+        return pygame.Rect(posicao, (1, 1)).collidelist(self.alvos)
+
+
+class AreaAnimada:
+    """
+    Área de uma TelaRetida com conteúdo montado em cache e ícones animados.
+
+    A função de montagem desenha a parte fixa numa superfície do tamanho
+    da tela e registra no ConteudoAnimado os ícones e a frente; ela só roda
+    de novo quando a chave muda:
+
+        area = AreaAnimada(tela_retida, area_conteudo, montar_aba)
+        area.atualizar((aba, scroll, moedas, area.conteudo.alvo_em(mouse)))
+    """
+
+    def __init__(self, tela_retida: TelaRetida, rect,
+                 montar: Callable[[pygame.Surface, ConteudoAnimado], None],
+                 origem=(0, 0), clip=None):
+        """
+        Args:
+            tela_retida: Tela onde a área entra (por cima dos widgets já adicionados)
+            rect: Região da área na tela
+            montar: Função (superficie, conteudo) que desenha o conteúdo fixo
+            origem, clip: Repassados ao ConteudoAnimado de cada montagem
+        """
+        self.tela_retida = tela_retida
+        self.rect = pygame.Rect(rect)
+        self.montar = montar
+        self.origem = origem
+        self.clip = clip
+        self.superficie = pygame.Surface(tela_retida.fundo.get_size(), pygame.SRCALPHA)
+        self.conteudo = ConteudoAnimado(origem, clip)
+        self.chave = _NUNCA
+        self.widget = tela_retida.adicionar(self.rect, self._desenhar_cache)
+        self._filhos: List[Widget] = []
+
+    def _desenhar_cache(self, tela: pygame.Surface):
+        tela.blit(self.superficie, self.rect, self.rect)
+
+    def atualizar(self, chave: Hashable, forcar: bool = False):
+        """
+        Monta o conteúdo de novo se a chave mudou.
+
+        Args:
+            chave: Tudo de que o conteúdo fixo depende
+            forcar: Monta mesmo com a chave igual (cliques que compram)
+        """
+        if chave == self.chave and not forcar:
+            return
+        self.chave = chave
+        for widget in self._filhos:
+            self.tela_retida.remover(widget)
+        self._filhos = []
+
+        self.superficie.fill((0, 0, 0, 0), self.rect)
+        self.conteudo = ConteudoAnimado(self.origem, self.clip)
+        self.montar(self.superficie, self.conteudo)
+        self.tela_retida.sujar(self.rect)
+
+        anterior = self.widget
+        for rect, funcao, x, y, args, estado in self.conteudo.animacoes:
+            rect = rect.clip(self.rect)
+            if not rect.w or not rect.h:
+                continue
+            anterior = self._filho(anterior, rect, _desenho_animado(funcao, x, y, args),
+                                   estado or pygame.time.get_ticks)
+        for superficie, posicao in self.conteudo.frentes:
+            rect = superficie.get_rect(topleft=posicao).clip(self.rect)
+            anterior = self._filho(anterior, rect, _desenho_frente(superficie, posicao))
+
+    def _filho(self, anterior: Widget, rect, desenhar, estado=None) -> Widget:
+        widget = self.tela_retida.adicionar(rect, desenhar, estado, apos=anterior)
+        self._filhos.append(widget)
+        return widget
+
+
+def _desenho_animado(funcao, x, y, args):
+    def desenhar(tela):
+        funcao(tela, x, y, pygame.time.get_ticks(), *args)
+    return desenhar
+
+
+def _desenho_frente(superficie, posicao):
+    def desenhar(tela):
+        tela.blit(superficie, posicao)
+    return desenhar
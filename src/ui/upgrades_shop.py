@@ -15,6 +15,7 @@ import os
 
 # Importar o sistema de pricing
 from src.game.pricing_system import PricingManager, aplicar_pricing_sistema
+from src.utils.saves import caminho_dados, pasta_dados
 
 def salvar_upgrades(upgrades):
     """
@@ -22,11 +23,11 @@ def salvar_upgrades(upgrades):
     """
     try:
         # Criar o diretório de dados se não existir
-        if not os.path.exists("data"):
-            os.makedirs("data")
+        if not os.path.exists(pasta_dados()):
+            os.makedirs(pasta_dados())
         
         # Salvar os upgrades no arquivo
-        with open("data/upgrades.json", "w") as f:
+        with open(caminho_dados("upgrades.json"), "w") as f:
             json.dump(upgrades, f)
     except Exception as e:
         print(f"Erro ao salvar upgrades: {e}")
@@ -155,7 +156,7 @@ def desenhar_icone_dash(tela, x, y, tempo_atual):
                         (linha_x, linha_y),
                         (linha_x + linha_comprimento, linha_y), 3)
 
-def desenhar_upgrades_shop(tela, area_conteudo, moeda_manager, upgrades, mouse_pos, clique_ocorreu, som_compra, som_erro, scroll_y=0):
+def desenhar_upgrades_shop(tela, area_conteudo, moeda_manager, upgrades, mouse_pos, clique_ocorreu, som_compra, som_erro, scroll_y=0, animados=None):
     """
     Desenha a seção de upgrades da loja com sistema de preços dinâmicos e scroll.
     
@@ -169,6 +170,7 @@ def desenhar_upgrades_shop(tela, area_conteudo, moeda_manager, upgrades, mouse_p
         som_compra: Som para compra bem-sucedida
         som_erro: Som para erro na compra
         scroll_y: Posição atual do scroll (padrão: 0)
+        animados: ConteudoAnimado da loja retida (src/ui/retained_ui.py)
         
     Returns:
         Tupla (mensagem, cor, max_scroll) ou (None, None, max_scroll)
@@ -249,6 +251,14 @@ def desenhar_upgrades_shop(tela, area_conteudo, moeda_manager, upgrades, mouse_p
                           area_scroll_altura - (margem_clipping * 2))
     conteudo_surf.set_clip(cliprect)
     
+    # Com animados, só os ícones são redesenhados a cada frame;
+    # o texto e os botões vão para a frente, que cobre os ícones
+    frente_surf = conteudo_surf
+    if animados is not None:
+        frente_surf = pygame.Surface(conteudo_surf.get_size(), pygame.SRCALPHA)
+        frente_surf.set_clip(cliprect)
+        clip_icones = cliprect.move(area_conteudo.x, area_scroll_y)
+    
     # Desenhar cada upgrade na superfície de conteúdo
     for i, upgrade in enumerate(upgrades_loja):
         # Calcular posição Y do item considerando o scroll e margem de clipping
@@ -286,15 +296,23 @@ def desenhar_upgrades_shop(tela, area_conteudo, moeda_manager, upgrades, mouse_p
         icone_x = item_rect.x + 60
         icone_y = y_item_relativo + altura_item // 2
 
+        funcao_icone = None
         if upgrade["icone_func"] == "coracao":
-            desenhar_icone_coracao(conteudo_surf, icone_x, icone_y, tempo_atual)
+            funcao_icone = desenhar_icone_coracao
         elif upgrade["icone_func"] == "dash":
-            desenhar_icone_dash(conteudo_surf, icone_x, icone_y, tempo_atual)
+            funcao_icone = desenhar_icone_dash
         # Aqui você pode adicionar mais ícones conforme necessário
         
+        if funcao_icone is not None:
+            if animados is not None:
+                animados.animar(funcao_icone, area_conteudo.x + icone_x, area_scroll_y + icone_y,
+                                clip=clip_icones)
+            else:
+                funcao_icone(conteudo_surf, icone_x, icone_y, tempo_atual)
+        
         # Nome do upgrade
         cor_texto = upgrade["cor_texto"] if upgrade.get("pode_comprar", True) else (100, 100, 100)
-        desenhar_texto(conteudo_surf, upgrade["nome"], 24, cor_texto, 
+        desenhar_texto(frente_surf, upgrade["nome"], 24, cor_texto, 
                       item_rect.x + 170, y_item_relativo + 20)
         
         # Descrição e status do upgrade
@@ -306,24 +324,24 @@ def desenhar_upgrades_shop(tela, area_conteudo, moeda_manager, upgrades, mouse_p
             else:
                 status = f"{upgrade['descricao']} (Active)"
         
-        desenhar_texto(conteudo_surf, status, 15, BRANCO if upgrade.get("pode_comprar", True) else (120, 120, 120), 
+        desenhar_texto(frente_surf, status, 15, BRANCO if upgrade.get("pode_comprar", True) else (120, 120, 120), 
                       item_rect.x + 170, y_item_relativo + 40)
         
         # Informações de limite e próximo preço
         info_limite = upgrade.get("info_limite", "")
-        desenhar_texto(conteudo_surf, info_limite, 12, (180, 180, 180), 
+        desenhar_texto(frente_surf, info_limite, 12, (180, 180, 180), 
                       item_rect.x + 170, y_item_relativo + 58)
         
         # Próximo preço (se houver)
         if upgrade.get("proximo_preco") and upgrade.get("pode_comprar", True):
-            desenhar_texto(conteudo_surf, f"Next: {upgrade['proximo_preco']} coins", 11, (200, 200, 100), 
+            desenhar_texto(frente_surf, f"Next: {upgrade['proximo_preco']} coins", 11, (200, 200, 100), 
                           item_rect.x + 170, y_item_relativo + 75)
         elif not upgrade.get("pode_comprar", True):
-            desenhar_texto(conteudo_surf, "MAXED OUT", 14, VERMELHO, 
+            desenhar_texto(frente_surf, "MAXED OUT", 14, VERMELHO, 
                           item_rect.x + 170, y_item_relativo + 75)
         
         # Informações adicionais do upgrade
-        desenhar_texto(conteudo_surf, upgrade["info_extra"], 10, (150, 150, 150), 
+        desenhar_texto(frente_surf, upgrade["info_extra"], 10, (150, 150, 150), 
                       item_rect.x + 170, y_item_relativo + 92)
         
         # Botão de compra
@@ -348,9 +366,12 @@ def desenhar_upgrades_shop(tela, area_conteudo, moeda_manager, upgrades, mouse_p
                                       botao_largura, botao_altura)
         
         # Verificar hover
+        botao_visivel = area_scroll_y <= botao_y_real <= area_scroll_y + area_scroll_altura
         hover_compra = (rect_compra_real.collidepoint(mouse_pos) and 
-                       area_scroll_y <= botao_y_real <= area_scroll_y + area_scroll_altura and
+                       botao_visivel and
                        pode_comprar)
+        if animados is not None and botao_visivel and pode_comprar:
+            animados.alvo(rect_compra_real)
         
         # Cores do botão baseadas na capacidade de compra
         if not upgrade.get("pode_comprar", True):
@@ -367,17 +388,17 @@ def desenhar_upgrades_shop(tela, area_conteudo, moeda_manager, upgrades, mouse_p
             cor_hover = cor_botao
         
         # Desenhar botão de compra na superfície de conteúdo
-        pygame.draw.rect(conteudo_surf, cor_hover if hover_compra else cor_botao, 
+        pygame.draw.rect(frente_surf, cor_hover if hover_compra else cor_botao, 
                         rect_compra_relativo, 0, 8)
-        pygame.draw.rect(conteudo_surf, upgrade["cor_borda"], rect_compra_relativo, 2, 8)
+        pygame.draw.rect(frente_surf, upgrade["cor_borda"], rect_compra_relativo, 2, 8)
         
         # Ícone de moeda e custo
         moeda_mini_x = botao_x_relativo - 25
         moeda_mini_y = botao_y_relativo
-        pygame.draw.circle(conteudo_surf, AMARELO, (moeda_mini_x, moeda_mini_y), 6)
+        pygame.draw.circle(frente_surf, AMARELO, (moeda_mini_x, moeda_mini_y), 6)
         
         # Texto de custo
-        desenhar_texto(conteudo_surf, f"{upgrade['custo']}", 16, BRANCO, 
+        desenhar_texto(frente_surf, f"{upgrade['custo']}", 16, BRANCO, 
                       botao_x_relativo + 8, botao_y_relativo)
         
         # Verificar clique no botão de compra
@@ -412,6 +433,8 @@ def desenhar_upgrades_shop(tela, area_conteudo, moeda_manager, upgrades, mouse_p
     
     # Aplicar a superfície de conteúdo à tela
     tela.blit(conteudo_surf, (area_conteudo.x, area_scroll_y))
+    if animados is not None:
+        animados.frente(frente_surf, (area_conteudo.x, area_scroll_y))
     
     # Desenhar barra de scroll se necessário
     if max_scroll > 0:
@@ -16,6 +16,7 @@ import os
 
 # Importar o sistema de pricing
 from src.game.pricing_system import PricingManager, aplicar_pricing_sistema
+from src.utils.saves import caminho_dados, pasta_dados
 
 def salvar_upgrades(upgrades):
     """
@@ -23,11 +24,11 @@ def salvar_upgrades(upgrades):
     """
     try:
         # Criar o diretório de dados se não existir
-        if not os.path.exists("data"):
-            os.makedirs("data")
+        if not os.path.exists(pasta_dados()):
+            os.makedirs(pasta_dados())
         
         # Salvar os upgrades no arquivo
-        with open("data/upgrades.json", "w") as f:
+        with open(caminho_dados("upgrades.json"), "w") as f:
             json.dump(upgrades, f)
     except Exception as e:
         print(f"Erro ao salvar upgrades: {e}")
@@ -529,7 +530,7 @@ def desenhar_icone_sabre_luz(tela, x, y, tempo_atual):
             pygame.draw.circle(tela, cor_lamina_glow, 
                              (int(particle_x), int(particle_y)), 2)
 
-def desenhar_weapons_shop(tela, area_conteudo, moeda_manager, upgrades, mouse_pos, clique_ocorreu, som_compra, som_erro, scroll_y=0):
+def desenhar_weapons_shop(tela, area_conteudo, moeda_manager, upgrades, mouse_pos, clique_ocorreu, som_compra, som_erro, scroll_y=0, animados=None):
     """
     Desenha a seção de armas da loja com sistema de preços dinâmicos e scroll.
     
@@ -543,6 +544,7 @@ def desenhar_weapons_shop(tela, area_conteudo, moeda_manager, upgrades, mouse_po
         som_compra: Som para compra bem-sucedida
         som_erro: Som para erro na compra
         scroll_y: Posição atual do scroll (padrão: 0)
+        animados: ConteudoAnimado da loja retida (src/ui/retained_ui.py)
         
     Returns:
         Tupla (mensagem, cor, max_scroll) ou (None, None, max_scroll)
@@ -683,6 +685,14 @@ def desenhar_weapons_shop(tela, area_conteudo, moeda_manager, upgrades, mouse_po
                           area_scroll_altura - (margem_clipping * 2))
     conteudo_surf.set_clip(cliprect)
     
+    # Na loja retida o texto e os botões vão para uma superfície de frente,
+    # por cima dos ícones animados (que viram widgets próprios)
+    frente_surf = conteudo_surf
+    if animados is not None:
+        frente_surf = pygame.Surface(conteudo_surf.get_size(), pygame.SRCALPHA)
+        frente_surf.set_clip(cliprect)
+        clip_icones = cliprect.move(area_conteudo.x, area_scroll_y)
+    
     # Desenhar cada arma na superfície de conteúdo
     for i, arma in enumerate(armas_loja):
         # Calcular posição Y do item considerando o scroll e margem de clipping
@@ -720,23 +730,31 @@ def desenhar_weapons_shop(tela, area_conteudo, moeda_manager, upgrades, mouse_po
         icone_x = item_rect.x + 60
         icone_y = y_item_relativo + altura_item // 2
         
+        funcao_icone = None
         if arma["icone_func"] == "desert_eagle":
-            desenhar_icone_desert_eagle(conteudo_surf, icone_x, icone_y, tempo_atual)
+            funcao_icone = desenhar_icone_desert_eagle
         elif arma["icone_func"] == "espingarda":
-            desenhar_icone_espingarda(conteudo_surf, icone_x, icone_y, tempo_atual)
+            funcao_icone = desenhar_icone_espingarda
         elif arma["icone_func"] == "spas12":
-            desenhar_icone_spas12(conteudo_surf, icone_x, icone_y, tempo_atual)
+            funcao_icone = desenhar_icone_spas12
         elif arma["icone_func"] == "metralhadora":
-            desenhar_icone_metralhadora(conteudo_surf, icone_x, icone_y, tempo_atual)
+            funcao_icone = desenhar_icone_metralhadora
         elif arma["icone_func"] == "sniper":
             from src.weapons.sniper import desenhar_icone_sniper
-            desenhar_icone_sniper(conteudo_surf, icone_x, icone_y, tempo_atual)
+            funcao_icone = desenhar_icone_sniper
         elif arma["icone_func"] == "sabre_luz":
-            desenhar_icone_sabre_luz(conteudo_surf, icone_x, icone_y, tempo_atual)
+            funcao_icone = desenhar_icone_sabre_luz
+        
+        if funcao_icone is not None:
+            if animados is not None:
+                animados.animar(funcao_icone, area_conteudo.x + icone_x, area_scroll_y + icone_y,
+                                clip=clip_icones)
+            else:
+                funcao_icone(conteudo_surf, icone_x, icone_y, tempo_atual)
         
         # Nome da arma
         cor_texto = arma["cor_texto"] if arma.get("pode_comprar", True) else (100, 100, 100)
-        desenhar_texto(conteudo_surf, arma["nome"], 24, cor_texto, 
+        desenhar_texto(frente_surf, arma["nome"], 24, cor_texto, 
                       item_rect.x + 170, y_item_relativo + 20)
         
         # Descrição e status da arma
@@ -751,24 +769,24 @@ def desenhar_weapons_shop(tela, area_conteudo, moeda_manager, upgrades, mouse_po
             else:
                 status = f"Ammunition: {upgrades[arma['key']]}"
         
-        desenhar_texto(conteudo_surf, status, 15, BRANCO if arma.get("pode_comprar", True) else (120, 120, 120), 
+        desenhar_texto(frente_surf, status, 15, BRANCO if arma.get("pode_comprar", True) else (120, 120, 120), 
                       item_rect.x + 170, y_item_relativo + 40)
         
         # Informações de limite e próximo preço
         info_limite = arma.get("info_limite", "")
-        desenhar_texto(conteudo_surf, info_limite, 12, (180, 180, 180),
+        desenhar_texto(frente_surf, info_limite, 12, (180, 180, 180),
                       item_rect.x + 170, y_item_relativo + 58)
 
         # Mostrar dano da arma
         if arma.get("pode_comprar", True):
-            desenhar_texto(conteudo_surf, f"Damage: {arma.get('dano', 1)}", 16, (255, 200, 100),
+            desenhar_texto(frente_surf, f"Damage: {arma.get('dano', 1)}", 16, (255, 200, 100),
                           item_rect.x + 170, y_item_relativo + 75)
         else:
-            desenhar_texto(conteudo_surf, "SOLD OUT", 14, VERMELHO,
+            desenhar_texto(frente_surf, "SOLD OUT", 14, VERMELHO,
                           item_rect.x + 170, y_item_relativo + 75)
         
         # Informações adicionais da arma
-        desenhar_texto(conteudo_surf, arma["info_extra"], 10, (150, 150, 150), 
+        desenhar_texto(frente_surf, arma["info_extra"], 10, (150, 150, 150), 
                       item_rect.x + 170, y_item_relativo + 92)
         
         # Botão de compra
@@ -793,9 +811,12 @@ def desenhar_weapons_shop(tela, area_conteudo, moeda_manager, upgrades, mouse_po
                                       botao_largura, botao_altura)
         
         # Verificar hover
+        botao_visivel = area_scroll_y <= botao_y_real <= area_scroll_y + area_scroll_altura
         hover_compra = (rect_compra_real.collidepoint(mouse_pos) and 
-                       area_scroll_y <= botao_y_real <= area_scroll_y + area_scroll_altura and
+                       botao_visivel and
                        pode_comprar)
+        if animados is not None and botao_visivel and pode_comprar:
+            animados.alvo(rect_compra_real)
         
         # Cores do botão baseadas na capacidade de compra
         if not arma.get("pode_comprar", True):
@@ -812,17 +833,17 @@ def desenhar_weapons_shop(tela, area_conteudo, moeda_manager, upgrades, mouse_po
             cor_hover = cor_botao
         
         # Desenhar botão de compra na superfície de conteúdo
-        pygame.draw.rect(conteudo_surf, cor_hover if hover_compra else cor_botao, 
+        pygame.draw.rect(frente_surf, cor_hover if hover_compra else cor_botao, 
                         rect_compra_relativo, 0, 6)
-        pygame.draw.rect(conteudo_surf, arma["cor_borda"], rect_compra_relativo, 2, 6)
+        pygame.draw.rect(frente_surf, arma["cor_borda"], rect_compra_relativo, 2, 6)
         
         # Ícone de moeda e custo
         moeda_mini_x = botao_x_relativo - 25
         moeda_mini_y = botao_y_relativo
-        pygame.draw.circle(conteudo_surf, AMARELO, (moeda_mini_x, moeda_mini_y), 6)
+        pygame.draw.circle(frente_surf, AMARELO, (moeda_mini_x, moeda_mini_y), 6)
         
         # Texto de custo
-        desenhar_texto(conteudo_surf, f"{arma['custo']}", 16, BRANCO, 
+        desenhar_texto(frente_surf, f"{arma['custo']}", 16, BRANCO, 
                       botao_x_relativo + 8, botao_y_relativo)
         
         # Verificar clique no botão de compra
@@ -860,6 +881,8 @@ def desenhar_weapons_shop(tela, area_conteudo, moeda_manager, upgrades, mouse_po
     
     # Aplicar a superfície de conteúdo à tela
     tela.blit(conteudo_surf, (area_conteudo.x, area_scroll_y))
+    if animados is not None:
+        animados.frente(frente_surf, (area_conteudo.x, area_scroll_y))
     
     # Desenhar barra de scroll se necessário
     if max_scroll > 0:
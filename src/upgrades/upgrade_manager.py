@@ -9,6 +9,7 @@ Contém funções para carregar, salvar e gerenciar os upgrades.
 import os
 import json
 from src.config import *
+from src.utils.saves import caminho_dados, pasta_dados
 
 # Lista de upgrades disponíveis com seus preços e descrições
 UPGRADES_DISPONIVEIS = {
@@ -55,8 +56,8 @@ def carregar_todos_upgrades():
     """
     try:
         # Verificar se o arquivo existe
-        if os.path.exists("data/upgrades.json"):
-            with open("data/upgrades.json", "r") as f:
+        if os.path.exists(caminho_dados("upgrades.json")):
+            with open(caminho_dados("upgrades.json"), "r") as f:
                 return json.load(f)
         
         # Se não existir, retorna valores padrão
@@ -84,11 +85,11 @@ def salvar_upgrades(upgrades):
     """
     try:
         # Criar o diretório de dados se não existir
-        if not os.path.exists("data"):
-            os.makedirs("data")
+        if not os.path.exists(pasta_dados()):
+            os.makedirs(pasta_dados())
         
         # Salvar os upgrades no arquivo
-        with open("data/upgrades.json", "w") as f:
+        with open(caminho_dados("upgrades.json"), "w") as f:
             json.dump(upgrades, f)
     except Exception as e:
         print(f"Erro ao salvar upgrades: {e}")
@@ -172,8 +173,8 @@ def carregar_moedas():
         int: Quantidade de moedas
     """
     try:
-        if os.path.exists("data/moedas.json"):
-            with open("data/moedas.json", "r") as f:
+        if os.path.exists(caminho_dados("moedas.json")):
+            with open(caminho_dados("moedas.json"), "r") as f:
                 data = json.load(f)
                 return data.get("moedas", 0)
         return 0
@@ -189,10 +190,10 @@ def salvar_moedas(quantidade):
         quantidade: Quantidade de moedas a ser salva
     """
     try:
-        if not os.path.exists("data"):
-            os.makedirs("data")
+        if not os.path.exists(pasta_dados()):
+            os.makedirs(pasta_dados())
         
-        with open("data/moedas.json", "w") as f:
+        with open(caminho_dados("moedas.json"), "w") as f:
             json.dump({"moedas": quantidade}, f)
     except Exception as e:
         print(f"Erro ao salvar moedas: {e}")
@@ -0,0 +1,519 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Suíte de desempenho: cenários fixos rodados sem janela a partir de
+entradas gravadas (src/utils/replay.py), com o tempo de cada subsistema
+comparado a uma baseline salva.
+
+Cenários: fase 1, fase 25 (magos e granadas do NivelFactory), as duas
+boss fights (fases 10 e 20), um round do modo Bomb com 10 bots e cada
+minigame contra bots. As entradas de cada cenário ficam em
+benchmarks/replays/; se o arquivo não existe, um piloto automático
+(movimento, mira, tiros e dash sorteados com seed fixo) joga o cenário e
+a gravação é salva. Assim toda execução repete exatamente a mesma carga.
+
+O tempo de cada frame é dividido por subsistema (IA, tiros, partículas,
+render, HUD, apresentação e o resto) envolvendo os métodos de cada um;
+uma chamada dentro de outra conta só para a mais interna.
+
+Uso (da raiz do projeto):
+    python -m src.utils.benchmark                      # roda tudo e compara com a baseline
+    python -m src.utils.benchmark fase1 boss_fusion    # só alguns cenários
+    python -m src.utils.benchmark --salvar-baseline    # grava os tempos atuais como baseline
+    python -m src.utils.benchmark --regravar           # joga os cenários de novo com o piloto
+    python -m src.utils.benchmark --trace perfis       # também grava o trace de frame de cada cenário
+"""
+
+import argparse
+import functools
+import importlib
+import json
+import os
+import platform
+import random
+import sys
+import time
+import zlib
+from collections import defaultdict
+from typing import Dict, List, Optional, Tuple
+
+import pygame
+
+from src.config import LARGURA, ALTURA, FPS, AZUL
+from src.utils import replay as rp
+from src.utils.profiler import perfil
+
+PASTA_BENCHMARK = "benchmarks"
+PASTA_ENTRADAS = os.path.join(PASTA_BENCHMARK, "replays")
+ARQUIVO_BASELINE = os.path.join(PASTA_BENCHMARK, "baseline.json")
+
+# Piora aceita antes de acusar regressão (fração e mínimo absoluto, em ms por frame)
+TOLERANCIA = 0.15
+TOLERANCIA_MS = 0.05
+
+# Saves usados na gravação: vida extra para o piloto chegar ao fim do cenário
+SAVES_BENCHMARK = {'upgrades.json': json.dumps({'vida': 20})}
+
+CENARIOS: Dict[str, Dict] = {
+    'fase1': {'modo': 'fase', 'fase': 1, 'frames': 1800},
+    'fase25_mago_granada': {'modo': 'fase', 'fase': 25, 'frames': 1800},
+    'boss_fusion': {'modo': 'fase', 'fase': 10, 'frames': 2400},
+    'boss_velocitycyan': {'modo': 'fase', 'fase': 20, 'frames': 2400},
+    'bomb_10_bots': {'modo': 'Bomb', 'jogadores_por_time': 5, 'segundos': 180},
+    **{f"minigame_{nome}": {'modo': 'minigame', 'minigame': nome, 'frames': 2400}
+       for nome in rp.MINIGAMES},
+}
+
+ZONAS = ('ia', 'tiros', 'particulas', 'render', 'hud', 'apresentacao', 'outros')
+
+# (zona, módulo, atributo): funções de módulo ou 'Classe.metodo'
+ALVOS = (
+    ('ia', 'src.game.fase', 'FaseNormal._atualizar_inimigos'),
+    ('ia', 'src.game.fase_boss', 'FaseBoss._atualizar_boss'),
+    ('ia', 'src.game.fase_boss', 'FaseBoss._atualizar_inimigos_invocados'),
+    ('ia', 'src.game.simulacao_bomba', 'SimulacaoBomba._atualizar_bots'),
+    ('tiros', 'src.game.fase_base', 'FaseBase.atualizar_tiros_jogador'),
+    ('tiros', 'src.game.fase_base', 'FaseBase.atualizar_tiros_inimigo'),
+    ('tiros', 'src.game.simulacao_bomba', 'SimulacaoBomba._atualizar_tiros'),
+    ('particulas', 'src.game.fase_base', 'FaseBase.atualizar_efeitos_visuais'),
+    ('particulas', 'src.entities.particula', 'Particula.atualizar'),
+    ('particulas', 'src.entities.particula', 'Particula.desenhar'),
+    ('render', 'src.game.fase', 'FaseNormal._renderizar_fase'),
+    ('render', 'src.game.fase_boss', 'FaseBoss._renderizar_boss_fight'),
+    ('hud', 'src.game.fase_base', 'FaseBase.renderizar_hud'),
+    ('apresentacao', 'src.utils.display_manager', 'DisplayManager.present'),
+)
+
+# Funções dos minigames, pelo prefixo do nome (a primeira regra que casa vale)
+PREFIXOS_MINIGAME = (
+    ('ia', '_bot'),
+    ('hud', '_desenhar_hud'),
+    ('hud', '_desenhar_scoreboard'),
+    ('hud', '_desenhar_minimap'),
+    ('hud', '_desenhar_kill_feed'),
+    ('render', '_desenhar'),
+    ('tiros', '_disparar'),
+    ('tiros', '_criar_tiro'),
+    ('tiros', '_atualizar_projeteis'),
+)
+
+
+# ==================== MEDIÇÃO ====================
+
+class Medidor:
+    """
+    Soma o tempo exclusivo de cada zona: uma chamada medida desconta o que
+    rodou dentro dela em outras chamadas medidas.
+    """
+
+    def __init__(self):
+        self.tempos: Dict[str, float] = defaultdict(float)  # s
+        self._pilha: List[List[float]] = []
+        self._originais: List[Tuple[object, str, object]] = []
+
+    def zerar(self):
+        self.tempos = defaultdict(float)
+
+    def instalar(self):
+        """Envolve as funções de ALVOS e as dos minigames."""
+        for zona, modulo, atributo in ALVOS:
+            dono = importlib.import_module(modulo)
+            nome = atributo
+            if '.' in atributo:
+                classe, nome = atributo.split('.')
+                dono = getattr(dono, classe)
+            self._envolver(zona, dono, nome)
+
+        for modulo, _ in rp.MINIGAMES.values():
+            modulo = importlib.import_module(modulo)
+            for nome, valor in list(vars(modulo).items()):
+                if not callable(valor) or getattr(valor, '__module__', None) != modulo.__name__:
+                    continue
+                for zona, prefixo in PREFIXOS_MINIGAME:
+                    if nome.startswith(prefixo):
+                        self._envolver(zona, modulo, nome)
+                        break
+
+    def remover(self):
+        for dono, nome, original in reversed(self._originais):
+            setattr(dono, nome, original)
+        self._originais = []
+
+    def _envolver(self, zona: str, dono, nome: str):
+        original = vars(dono)[nome]
+        funcao = getattr(dono, nome)
+        pilha = self._pilha
+
+        @functools.wraps(funcao)
+        def medida(*args, **kwargs):
+            filhos = [0.0]
+            pilha.append(filhos)
+            inicio = time.perf_counter()
+            try:
+                return funcao(*args, **kwargs)
+            finally:
+                total = time.perf_counter() - inicio
+                pilha.pop()
+                self.tempos[zona] += total - filhos[0]
+                if pilha:
+                    pilha[-1][0] += total
+
+        self._originais.append((dono, nome, original))
+        setattr(dono, nome, medida)
+
+
+def _percentil(valores: List[float], p: float) -> float:
+    if not valores:
+        return 0.0
+    ordenados = sorted(valores)
+    return ordenados[min(len(ordenados) - 1, int(len(ordenados) * p))]
+
+
+def _resumir(duracoes: List[float], tempos: Dict[str, float]) -> Dict:
+    """Tempos de frame (ms) e custo médio de cada zona por frame (ms)."""
+    frames = max(1, len(duracoes))
+    total = sum(duracoes)
+    zonas = {zona: tempos.get(zona, 0.0) * 1000.0 / frames for zona in ZONAS if zona != 'outros'}
+    zonas['outros'] = max(0.0, total / frames - sum(zonas.values()))
+    return {
+        'frames': len(duracoes),
+        'frame_ms': {
+            'media': total / frames,
+            'p50': _percentil(duracoes, 0.50),
+            'p95': _percentil(duracoes, 0.95),
+            'max': max(duracoes, default=0.0),
+        },
+        'zonas_ms': zonas,
+    }
+
+
+# ==================== GRAVAÇÃO (PILOTO AUTOMÁTICO) ====================
+
+class PilotoAutomatico:
+    """
+    Jogador sorteado no lugar do teclado, mouse e relógio do pygame. Fica
+    por baixo do GravadorEntradas: cada get_ticks() do gravador é um frame.
+    Depois de `frames` frames, manda QUIT.
+    """
+
+    # Teclas de movimento: (key, scancode)
+    MOVIMENTO = ((pygame.K_w, pygame.KSCAN_W), (pygame.K_a, pygame.KSCAN_A),
+                 (pygame.K_s, pygame.KSCAN_S), (pygame.K_d, pygame.KSCAN_D))
+
+    def __init__(self, seed: int, frames: int):
+        self.rng = random.Random(seed)
+        self.limite = frames
+        self.frame = 0
+        self.tempo = 1000.0
+        self.apertadas: Dict[int, int] = {}  # key -> scancode
+        self.mouse = (LARGURA // 2, ALTURA // 2)
+        self.atirando = False
+        self.eventos: List[pygame.event.Event] = []
+        self._originais = None
+
+    def instalar(self):
+        self._originais = (pygame.time.get_ticks, pygame.event.get, pygame.key.get_pressed,
+                           pygame.mouse.get_pressed, pygame.mouse.get_pos)
+        pygame.time.get_ticks = self._get_ticks
+        pygame.event.get = self._event_get
+        pygame.key.get_pressed = self._key_get_pressed
+        pygame.mouse.get_pressed = self._mouse_get_pressed
+        pygame.mouse.get_pos = self._mouse_get_pos
+
+    def remover(self):
+        if self._originais is None:
+            return
+        (pygame.time.get_ticks, pygame.event.get, pygame.key.get_pressed,
+         pygame.mouse.get_pressed, pygame.mouse.get_pos) = self._originais
+        self._originais = None
+
+    def _proximo_frame(self):
+        self.frame += 1
+        self.tempo += 1000.0 / FPS
+        rng = self.rng
+
+        if self.frame > self.limite:
+            self.eventos.append(pygame.event.Event(pygame.QUIT))
+            return
+
+        # Nova direção a cada meio segundo, mais ou menos
+        if rng.random() < 1 / 30:
+            novas = dict(t for t in self.MOVIMENTO if rng.random() < 0.35)
+            for key, scancode in self.apertadas.items():
+                if key not in novas:
+                    self.eventos.append(pygame.event.Event(
+                        pygame.KEYUP, key=key, mod=0, scancode=scancode))
+            for key, scancode in novas.items():
+                if key not in self.apertadas:
+                    self.eventos.append(pygame.event.Event(
+                        pygame.KEYDOWN, key=key, mod=0, scancode=scancode, unicode=''))
+            self.apertadas = novas
+
+        # Dash / ação de vez em quando
+        if rng.random() < 1 / 180:
+            for tipo in (pygame.KEYDOWN, pygame.KEYUP):
+                self.eventos.append(pygame.event.Event(
+                    tipo, key=pygame.K_SPACE, mod=0, scancode=pygame.KSCAN_SPACE, unicode=' '))
+
+        # Mira passeando pela tela
+        if self.frame % 4 == 0:
+            x = min(LARGURA - 1, max(0, self.mouse[0] + rng.randint(-60, 60)))
+            y = min(ALTURA - 1, max(0, self.mouse[1] + rng.randint(-60, 60)))
+            self.eventos.append(pygame.event.Event(
+                pygame.MOUSEMOTION, pos=(x, y), rel=(x - self.mouse[0], y - self.mouse[1]),
+                buttons=(int(self.atirando), 0, 0)))
+            self.mouse = (x, y)
+
+        # Rajadas de tiro (botão segurado) e cliques soltos
+        if rng.random() < 1 / 20:
+            self.atirando = not self.atirando
+            tipo = pygame.MOUSEBUTTONDOWN if self.atirando else pygame.MOUSEBUTTONUP
+            self.eventos.append(pygame.event.Event(tipo, button=1, pos=self.mouse))
+        elif not self.atirando and rng.random() < 1 / 15:
+            for tipo in (pygame.MOUSEBUTTONDOWN, pygame.MOUSEBUTTONUP):
+                self.eventos.append(pygame.event.Event(tipo, button=1, pos=self.mouse))
+
+    def _get_ticks(self) -> int:
+        self._proximo_frame()
+        return int(self.tempo)
+
+    def _event_get(self, *args, **kwargs) -> List:
+        self._originais[1]()  # Esvaziar a fila real
+        eventos, self.eventos = self.eventos, []
+        return eventos
+
+    def _key_get_pressed(self):
+        estado = [False] * 512
+        for scancode in self.apertadas.values():
+            estado[scancode] = True
+        return estado
+
+    def _mouse_get_pressed(self, num_buttons: int = 3) -> Tuple[bool, ...]:
+        return (self.atirando,) + (False,) * (num_buttons - 1)
+
+    def _mouse_get_pos(self) -> Tuple[int, int]:
+        return self.mouse
+
+
+class _RelogioSemEspera:
+    """Clock da gravação: o tempo é o do piloto, ninguém precisa dormir."""
+
+    def tick(self, framerate: int = 0) -> int:
+        return 1000 // framerate if framerate else 0
+
+    def get_fps(self) -> float:
+        return float(FPS)
+
+
+def _seed_cenario(nome: str) -> int:
+    return zlib.crc32(nome.encode('utf-8'))
+
+
+def gravar_cenario(nome: str, caminho: str):
+    """Joga o cenário com o piloto automático e grava as entradas (ou as chamadas da simulação)."""
+    cenario = CENARIOS[nome]
+    os.makedirs(os.path.dirname(caminho), exist_ok=True)
+    seed = _seed_cenario(nome)
+    random.seed(seed)
+
+    if cenario['modo'] == 'Bomb':
+        _gravar_bomb(cenario, caminho, seed)
+        return
+
+    cabecalho = {k: v for k, v in cenario.items() if k != 'frames'}
+    if cenario['modo'] == 'minigame':
+        cabecalho['customizacao'] = {'seed': seed, 'cor': list(AZUL)}
+        cabecalho['nome_jogador'] = 'Benchmark'
+
+    piloto = PilotoAutomatico(seed, cenario['frames'])
+    gravador = None
+    resultado = None
+    with rp.usar_saves(SAVES_BENCHMARK):
+        piloto.instalar()
+        try:
+            jogar = rp.preparar_partida(cabecalho)
+            gravador = rp.iniciar_gravacao(_RelogioSemEspera(), cabecalho, caminho)
+            resultado = jogar(gravador.relogio)
+        finally:
+            if gravador is not None:
+                gravador.finalizar(resultado)
+            piloto.remover()
+
+
+def _gravar_bomb(cenario: Dict, caminho: str, seed: int):
+    from src.game.simulacao_bomba import SimulacaoBomba
+    from src.network.config_network import MAP_PATH, TICK_RATE
+    from src.utils.tilemap import TileMap
+
+    mapa = os.path.relpath(MAP_PATH)
+    por_time = cenario['jogadores_por_time']
+    simulacao = rp.SimulacaoGravada(
+        SimulacaoBomba(TileMap(mapa, carregar_imagens=False), seed, por_time), caminho,
+        {'modo': 'Bomb', 'seed': seed, 'mapa': mapa, 'tick_rate': TICK_RATE,
+         'jogadores_por_time': por_time}
+    )
+    simulacao.iniciar({})  # Só bots
+    for _ in range(cenario['segundos'] * TICK_RATE):
+        simulacao.passo(1.0 / TICK_RATE)
+        if simulacao.round_terminado:
+            break
+    simulacao.fechar()
+
+
+# ==================== EXECUÇÃO ====================
+
+def rodar_cenario(nome: str, medidor: Medidor, regravar: bool = False,
+                  pasta_trace: Optional[str] = None) -> Dict:
+    """
+    Reproduz as entradas do cenário medindo cada zona (grava antes, se preciso).
+
+    Args:
+        nome: Cenário (chave de CENARIOS)
+        medidor: Medidor já instalado
+        regravar: Jogar o cenário de novo com o piloto antes de medir
+        pasta_trace: Se dada, liga o profiler de frame e grava o trace dos
+            últimos frames em pasta_trace/<nome>.json
+
+    Returns:
+        Resumo do cenário (ver _resumir) e se a reprodução conferiu
+    """
+    caminho = os.path.join(PASTA_ENTRADAS, f"{nome}.ssr")
+    if regravar or not os.path.exists(caminho):
+        print(f"🔴 Gravando entradas de {nome} com o piloto automático...")
+        gravar_cenario(nome, caminho)
+
+    replay = rp.ler_replay(caminho)
+    medidor.zerar()
+    if pasta_trace:
+        perfil.ligar()
+        perfil.zerar()
+    resumo = rp.reproduzir(replay)
+    if pasta_trace:
+        perfil.exportar_trace(os.path.join(pasta_trace, f"{nome}.json"))
+        perfil.desligar()
+    resultado = _resumir(resumo['duracoes_ms'], medidor.tempos)
+    resultado['confere'] = resumo['confere']
+    return resultado
+
+
+def comparar(atual: Dict, baseline: Dict, tolerancia: float = TOLERANCIA) -> List[str]:
+    """
+    Compara o frame médio e cada zona com a baseline.
+
+    Returns:
+        Regressões encontradas (texto)
+    """
+    regressoes = []
+    for nome, resultado in atual.items():
+        base = baseline.get(nome)
+        if base is None:
+            continue
+        pares = [('frame', resultado['frame_ms']['media'], base['frame_ms']['media'])]
+        pares += [(zona, resultado['zonas_ms'].get(zona, 0.0), base['zonas_ms'].get(zona, 0.0))
+                  for zona in ZONAS]
+        for zona, valor, referencia in pares:
+            if valor > referencia * (1 + tolerancia) and valor - referencia > TOLERANCIA_MS:
+                regressoes.append(f"{nome}/{zona}: {referencia:.3f} -> {valor:.3f} ms "
+                                  f"({_variacao(valor, referencia)})")
+    return regressoes
+
+
+def _variacao(valor: float, referencia: float) -> str:
+    if referencia <= 0:
+        return "novo"
+    return f"{(valor / referencia - 1) * 100:+.1f}%"
+
+
+def _imprimir(nome: str, resultado: Dict, base: Optional[Dict]):
+    frame = resultado['frame_ms']
+    linha = (f"📊 {nome}: {resultado['frames']} frames, {frame['media']:.2f} ms/frame "
+             f"(p95 {frame['p95']:.2f}, máx {frame['max']:.1f})")
+    if base:
+        linha += f"  [baseline {base['frame_ms']['media']:.2f}, " \
+                 f"{_variacao(frame['media'], base['frame_ms']['media'])}]"
+    if not resultado['confere']:
+        linha += "  ⚠️ reprodução divergiu da gravação"
+    print(linha)
+
+    partes = []
+    for zona in ZONAS:
+        valor = resultado['zonas_ms'][zona]
+        parte = f"{zona} {valor:.3f}"
+        if base and zona in base['zonas_ms']:
+            parte += f" ({_variacao(valor, base['zonas_ms'][zona])})"
+        partes.append(parte)
+    print("   " + "  ".join(partes))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark de frame por subsistema a partir de entradas gravadas")
+    parser.add_argument('cenarios', nargs='*', help=f"Cenários (padrão: todos): {', '.join(CENARIOS)}")
+    parser.add_argument('--salvar-baseline', action='store_true', help="Gravar os resultados como baseline")
+    parser.add_argument('--regravar', action='store_true', help="Jogar os cenários de novo com o piloto")
+    parser.add_argument('--repeticoes', type=int, default=1,
+                        help="Rodar cada cenário N vezes e ficar com o menor tempo")
+    parser.add_argument('--trace', metavar='PASTA', default=None,
+                        help="Gravar o trace (Chrome) dos últimos frames de cada cenário na pasta")
+    parser.add_argument('--tolerancia', type=float, default=TOLERANCIA,
+                        help="Piora aceita antes de acusar regressão (fração)")
+    args = parser.parse_args()
+
+    nomes = args.cenarios or list(CENARIOS)
+    desconhecidos = [n for n in nomes if n not in CENARIOS]
+    if desconhecidos:
+        print(f"❌ Cenários desconhecidos: {', '.join(desconhecidos)}")
+        sys.exit(2)
+
+    baseline = {}
+    if os.path.exists(ARQUIVO_BASELINE):
+        with open(ARQUIVO_BASELINE, 'r', encoding='utf-8') as f:
+            baseline = json.load(f).get('cenarios', {})
+
+    rp.iniciar_sem_janela()
+    medidor = Medidor()
+    medidor.instalar()
+    resultados = {}
+    try:
+        for nome in nomes:
+            melhor = None
+            for i in range(max(1, args.repeticoes)):
+                resultado = rodar_cenario(nome, medidor, regravar=args.regravar and i == 0,
+                                          pasta_trace=args.trace)
+                if melhor is None or resultado['frame_ms']['media'] < melhor['frame_ms']['media']:
+                    melhor = resultado
+            resultados[nome] = melhor
+            _imprimir(nome, melhor, baseline.get(nome))
+    finally:
+        medidor.remover()
+
+    if args.salvar_baseline:
+        baseline.update(resultados)
+        os.makedirs(PASTA_BENCHMARK, exist_ok=True)
+        with open(ARQUIVO_BASELINE, 'w', encoding='utf-8') as f:
+            json.dump({
+                'gerado_em': time.strftime('%Y-%m-%d %H:%M:%S'),
+                'maquina': f"{platform.node()} {platform.processor() or platform.machine()}",
+                'python': platform.python_version(),
+                'pygame': pygame.version.ver,
+                'cenarios': baseline,
+            }, f, indent=1, ensure_ascii=False)
+        print(f"💾 Baseline salva em {ARQUIVO_BASELINE}")
+        return
+
+    divergentes = [n for n, r in resultados.items() if not r['confere']]
+    regressoes = comparar(resultados, baseline, args.tolerancia) if baseline else []
+    if not baseline:
+        print("ℹ️ Sem baseline para comparar (use --salvar-baseline)")
+    for regressao in regressoes:
+        print(f"🐢 Regressão: {regressao}")
+    if divergentes:
+        print(f"❌ Reprodução divergiu: {', '.join(divergentes)} (regravar com --regravar)")
+    if regressoes or divergentes:
+        sys.exit(1)
+    if baseline:
+        print("✅ Nenhuma regressão acima da tolerância")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Custo de apresentar um frame em tela cheia (caminho surface do
+DisplayManager) em 1080p, 1440p e 4K, sem janela (driver dummy).
+
+Compara três formas para cada resolução:
+    antigo   - preenche a tela de preto, aloca a superfície escalada e copia
+    atual    - escala direto na área do jogo, barras só na troca de modo
+    inteira  - o atual com ESCALA_INTEIRA (múltiplo inteiro de 1480x820)
+
+Uso (da raiz do projeto):
+    python -m src.utils.benchmark_display
+    python -m src.utils.benchmark_display --frames 300 4K
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+from typing import Dict, Tuple
+
+import pygame
+
+from src.utils.display_manager import DisplayManager
+
+RESOLUCOES: Dict[str, Tuple[int, int]] = {
+    '1080p': (1920, 1080),
+    '1440p': (2560, 1440),
+    '4K': (3840, 2160),
+}
+
+
+def _present_antigo(manager: DisplayManager):
+    """O present de tela cheia antes do destino pré-alocado (referência)."""
+    manager.display_surface.fill((0, 0, 0))
+    scaled_width = int(manager.BASE_WIDTH * manager.scale_x)
+    scaled_height = int(manager.BASE_HEIGHT * manager.scale_y)
+    scaled_surface = pygame.transform.scale(manager.game_surface, (scaled_width, scaled_height))
+    manager.display_surface.blit(scaled_surface, (manager.offset_x, manager.offset_y))
+    pygame.display.flip()
+
+
+def _preparar(tamanho: Tuple[int, int], escala_inteira: bool) -> DisplayManager:
+    """DisplayManager em 'tela cheia' numa tela dummy do tamanho dado."""
+    manager = DisplayManager()
+    manager.display_surface = pygame.display.set_mode(tamanho)
+    manager.game_surface = pygame.Surface((manager.BASE_WIDTH, manager.BASE_HEIGHT))
+    manager.fullscreen = True
+    manager.escala_inteira = escala_inteira
+    manager.screen_width, manager.screen_height = tamanho
+    manager._calculate_scaling()
+
+    # Conteúdo qualquer (o scale não depende dele, mas evita tela lisa)
+    rng = random.Random(0)
+    manager.game_surface.fill((10, 0, 30))
+    for _ in range(400):
+        cor = (rng.randrange(256), rng.randrange(256), rng.randrange(256))
+        pos = (rng.randrange(manager.BASE_WIDTH), rng.randrange(manager.BASE_HEIGHT))
+        pygame.draw.circle(manager.game_surface, cor, pos, rng.randint(3, 30))
+    return manager
+
+
+def _medir(apresentar, frames: int) -> float:
+    """Média (ms) do melhor de três blocos de `frames` chamadas."""
+    apresentar()  # Barras e caches da primeira vez fora da medida
+    melhor = float('inf')
+    for _ in range(3):
+        inicio = time.perf_counter()
+        for _ in range(frames):
+            apresentar()
+        melhor = min(melhor, (time.perf_counter() - inicio) * 1000.0 / frames)
+    return melhor
+
+
+def medir_resolucao(nome: str, frames: int) -> Dict[str, float]:
+    """
+    Mede as três formas de apresentar numa resolução.
+
+    Returns:
+        {'antigo', 'atual', 'inteira'} em ms por frame
+    """
+    tamanho = RESOLUCOES[nome]
+    manager = _preparar(tamanho, escala_inteira=False)
+    resultado = {
+        'antigo': _medir(lambda: _present_antigo(manager), frames),
+        'atual': _medir(manager.present, frames),
+    }
+    escala = manager.scale_x
+    manager = _preparar(tamanho, escala_inteira=True)
+    resultado['inteira'] = _medir(manager.present, frames)
+
+    print(f"📊 {nome} {tamanho[0]}x{tamanho[1]} (escala {escala:.2f}, inteira {manager.scale_x:.0f}x): "
+          f"antigo {resultado['antigo']:.2f} ms, atual {resultado['atual']:.2f} ms "
+          f"({(resultado['atual'] / resultado['antigo'] - 1) * 100:+.1f}%), "
+          f"inteira {resultado['inteira']:.2f} ms")
+    return resultado
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Custo do present em tela cheia por resolução")
+    parser.add_argument('resolucoes', nargs='*', help=f"Resoluções (padrão: todas): {', '.join(RESOLUCOES)}")
+    parser.add_argument('--frames', type=int, default=120, help="Frames por bloco medido")
+    args = parser.parse_args()
+
+    nomes = args.resolucoes or list(RESOLUCOES)
+    desconhecidas = [n for n in nomes if n not in RESOLUCOES]
+    if desconhecidas:
+        print(f"❌ Resoluções desconhecidas: {', '.join(desconhecidas)}")
+        sys.exit(2)
+
+    os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+    pygame.init()
+    for nome in nomes:
+        medir_resolucao(nome, max(1, args.frames))
+    pygame.quit()
+
+
+if __name__ == '__main__':
+    main()
@@ -8,6 +8,9 @@ Mantém as proporções corretas em qualquer monitor
 
 import pygame
 
+from src.config import BACKEND_VIDEO, ESCALA_INTEIRA, TITULO
+from src.utils.profiler import perfil
+
 class DisplayManager:
     """Gerencia a resolução e modo de tela do jogo."""
     
@@ -35,17 +38,37 @@ class DisplayManager:
         
         # Estado do modo tela cheia
         self.fullscreen = False
+        # Tela cheia só em múltiplos inteiros da resolução base
+        self.escala_inteira = ESCALA_INTEIRA
+        # Área do jogo dentro da tela cheia (o scale escreve direto nela)
+        self._destino = None
+
+        # Frames apresentados (telas retidas detectam quem apresentou no meio)
+        self.quadros = 0
+        # Janela recriada: o próximo present copia a tela inteira
+        self._apresentar_inteira = True
+
+        # Backend "renderer": janela, renderer e textura do SDL2
+        self.backend = "surface"
+        self.window = None
+        self.renderer = None
+        self.texture = None
         
-    def initialize_display(self, fullscreen=False):
+    def initialize_display(self, fullscreen=False, backend=BACKEND_VIDEO):
         """
         Inicializa o display do pygame com a configuração adequada.
         
         Args:
             fullscreen: Se True, inicia em modo tela cheia
+            backend: "renderer", "surface" ou "auto" (ver BACKEND_VIDEO);
+                     se o renderer falhar, usa surface
         """
         self.fullscreen = fullscreen
-        
-        if fullscreen:
+        self.backend = "surface"
+        if backend != "surface" and self._criar_renderer(fullscreen, backend == "renderer"):
+            self.backend = "renderer"
+            self.screen_width, self.screen_height = self.window.size
+        elif fullscreen:
             # Obter resolução nativa do monitor
             info = pygame.display.Info()
             monitor_width = info.current_w
@@ -74,8 +97,50 @@ class DisplayManager:
         
         # Calcular escala e offsets
         self._calculate_scaling()
+        self._apresentar_inteira = True
         
         return self.display_surface
+
+    def _criar_renderer(self, fullscreen, aceitar_software):
+        """
+        Cria a janela com renderer e a textura do frame (pygame._sdl2.video).
+
+        A janela não passa pelo pygame.display.set_mode (um renderer não
+        pode dividir a janela com a surface do display).
+
+        Args:
+            fullscreen: Se True, cria a janela em tela cheia
+            aceitar_software: Se True, aceita o renderer por software (máquina
+                              sem GPU); senão exige aceleração, já que em
+                              software o blit do caminho surface é mais barato
+
+        Returns:
+            True se o renderer foi criado
+        """
+        try:
+            from pygame._sdl2.video import Window, Renderer, Texture
+        except ImportError as e:
+            print(f"⚠️ [DISPLAY] pygame._sdl2 indisponível ({e}), usando surface")
+            return False
+
+        window = None
+        try:
+            window = Window(TITULO, size=(self.BASE_WIDTH, self.BASE_HEIGHT),
+                            fullscreen_desktop=fullscreen)
+            renderer = Renderer(window, accelerated=-1 if aceitar_software else 1)
+            texture = Texture(renderer, (self.BASE_WIDTH, self.BASE_HEIGHT), streaming=True)
+        except (pygame.error, RuntimeError) as e:
+            print(f"⚠️ [DISPLAY] Renderer SDL2 indisponível ({e}), usando surface")
+            if window is not None:
+                window.destroy()
+            return False
+
+        self.window = window
+        self.renderer = renderer
+        self.texture = texture
+        self.display_surface = None
+        print("[OK] Apresentação pelo renderer SDL2")
+        return True
     
     def _calculate_scaling(self):
         """Calcula a escala e offsets para manter proporções."""
@@ -86,6 +151,7 @@ class DisplayManager:
             self.scale_y = 1.0
             self.offset_x = 0
             self.offset_y = 0
+            self._destino = None
             return
         
         # Calcular proporção do monitor
@@ -114,43 +180,137 @@ class DisplayManager:
             # Centralizar verticalmente
             self.offset_x = 0
             self.offset_y = (self.screen_height - scaled_height) // 2
+
+        if self.escala_inteira and self.scale_x >= 1:
+            # Múltiplo inteiro: pixels nítidos e o scale mais barato (barras maiores)
+            self.scale_x = self.scale_y = float(int(self.scale_x))
+            self.offset_x = (self.screen_width - int(self.BASE_WIDTH * self.scale_x)) // 2
+            self.offset_y = (self.screen_height - int(self.BASE_HEIGHT * self.scale_y)) // 2
+
+        self._preparar_destino()
+
+    def _preparar_destino(self):
+        """
+        Recorta da tela a área onde o jogo escalado fica (uma vez por modo).
+
+        O present escala direto nessa subsuperfície em vez de alocar uma
+        superfície escalada por frame e depois copiá-la.
+        """
+        self._destino = None
+        if self.display_surface is None or self.game_surface is None:
+            return
+        if not pode_escalar_em(self.game_surface, self.display_surface):
+            return  # O scale com destino exige o mesmo formato
+        tamanho = (int(self.BASE_WIDTH * self.scale_x), int(self.BASE_HEIGHT * self.scale_y))
+        if tamanho == (self.BASE_WIDTH, self.BASE_HEIGHT):
+            return  # Escala 1: o present copia direto
+        try:
+            self._destino = self.display_surface.subsurface((self.offset_x, self.offset_y) + tamanho)
+        except ValueError:
+            pass  # Fora da tela (arredondamento): fica o scale com superfície nova
     
     def get_game_surface(self):
         """Retorna a superfície onde o jogo deve desenhar."""
         return self.game_surface
     
-    def present(self):
-        """Apresenta o frame na tela com escalonamento adequado."""
-        
+    def present(self, rects=None):
+        """
+        Apresenta o frame na tela com escalonamento adequado.
+
+        Args:
+            rects: Regiões que mudaram desde o frame anterior (None = tela
+                   inteira). Em modo janela só elas são copiadas e enviadas
+                   com pygame.display.update; lista vazia não apresenta nada
+        """
+        self.quadros += 1
+        if self.renderer is not None:
+            self._present_renderer(rects)
+            return
+
+        if rects is not None and not self.fullscreen and not self._apresentar_inteira:
+            for rect in rects:
+                self.display_surface.blit(self.game_surface, rect, rect)
+            if rects:
+                pygame.display.update(rects)
+            return
+        barras = self._apresentar_inteira
+        self._apresentar_inteira = False
+
         if not self.fullscreen:
             # Modo janela: copiar diretamente
             self.display_surface.blit(self.game_surface, (0, 0))
         else:
             # Modo tela cheia: escalar e centralizar
             
-            # Preencher tela com preto (barras pretas nas bordas)
-            self.display_surface.fill((0, 0, 0))
+            # Barras pretas nas bordas: só quando o modo muda (o scale
+            # não escreve fora da área do jogo)
+            if barras:
+                self.display_surface.fill((0, 0, 0))
             
             # Calcular dimensões escaladas
             scaled_width = int(self.BASE_WIDTH * self.scale_x)
             scaled_height = int(self.BASE_HEIGHT * self.scale_y)
             
-            # Escalar a superfície do jogo
-            scaled_surface = pygame.transform.scale(
-                self.game_surface, 
-                (scaled_width, scaled_height)
-            )
-            
-            # Desenhar na posição centralizada
-            self.display_surface.blit(scaled_surface, (self.offset_x, self.offset_y))
+            if (scaled_width, scaled_height) == (self.BASE_WIDTH, self.BASE_HEIGHT):
+                # Escala 1: sem scale
+                self.display_surface.blit(self.game_surface, (self.offset_x, self.offset_y))
+            elif self._destino is not None:
+                # Escalar direto na área do jogo na tela (vizinho mais próximo;
+                # em múltiplos inteiros é o caso mais rápido do scale)
+                pygame.transform.scale(self.game_surface, (scaled_width, scaled_height), self._destino)
+            else:
+                # Escalar a superfície do jogo
+                scaled_surface = pygame.transform.scale(
+                    self.game_surface, 
+                    (scaled_width, scaled_height)
+                )
+                
+                # Desenhar na posição centralizada
+                self.display_surface.blit(scaled_surface, (self.offset_x, self.offset_y))
         
         pygame.display.flip()
+
+    def _present_renderer(self, rects):
+        """
+        Envia o frame para a textura e deixa o SDL escalar e centralizar.
+
+        Com regiões sujas só elas são enviadas (a textura guarda o resto do
+        frame anterior), em janela ou em tela cheia.
+        """
+        if rects is not None and not self._apresentar_inteira:
+            if not rects:
+                return
+            area = self.game_surface.get_rect()
+            for rect in rects:
+                rect = area.clip(rect)
+                if rect.w and rect.h:
+                    self.texture.update(self.game_surface.subsurface(rect), rect)
+        else:
+            self.texture.update(self.game_surface)
+        self._apresentar_inteira = False
+
+        # O destino usa a mesma escala/offset do convert_mouse_pos (o
+        # logical_size do SDL converteria só os eventos, não o get_pos)
+        destino = (self.offset_x, self.offset_y,
+                   int(self.BASE_WIDTH * self.scale_x), int(self.BASE_HEIGHT * self.scale_y))
+        self.renderer.draw_color = (0, 0, 0, 255)
+        self.renderer.clear()
+        self.texture.draw(dstrect=destino)
+        self.renderer.present()
     
     def toggle_fullscreen(self):
         """Alterna entre modo janela e tela cheia."""
         self.fullscreen = not self.fullscreen
-        
-        if self.fullscreen:
+
+        if self.window is not None:
+            if self.fullscreen:
+                self.window.set_fullscreen(desktop=True)
+            else:
+                self.window.set_windowed()
+                self.window.size = (self.BASE_WIDTH, self.BASE_HEIGHT)
+            self.screen_width, self.screen_height = self.window.size
+
+        elif self.fullscreen:
             # Mudar para tela cheia
             info = pygame.display.Info()
             monitor_width = info.current_w
@@ -175,6 +335,7 @@ class DisplayManager:
         
         # Recalcular escala
         self._calculate_scaling()
+        self._apresentar_inteira = True
     
     def convert_mouse_pos(self, mouse_pos):
         """
@@ -215,29 +376,70 @@ class DisplayManager:
 _display_manager = DisplayManager()
 
 
+def pode_escalar_em(origem, destino):
+    """
+    Indica se pygame.transform.scale pode escrever de origem direto em destino.
+
+    O scale com superfície de destino exige o mesmo formato de pixel (com
+    formatos diferentes ele levanta ValueError em vez de converter).
+    """
+    return (origem.get_bitsize() == destino.get_bitsize()
+            and origem.get_bytesize() == destino.get_bytesize())
+
+
+def escalar_em(origem, destino):
+    """
+    Escala origem para ocupar todo o destino.
+
+    Escreve direto no destino quando os formatos batem; senão escala numa
+    superfície nova e copia (o caminho antigo, mais lento mas sempre válido).
+    """
+    tamanho = destino.get_size()
+    if pode_escalar_em(origem, destino):
+        pygame.transform.scale(origem, tamanho, destino)
+    else:
+        destino.blit(pygame.transform.scale(origem, tamanho), (0, 0))
+
+
 def get_display_manager():
     """Retorna a instância global do gerenciador de display."""
     return _display_manager
 
 
-def initialize_game_display(fullscreen=False):
+def initialize_game_display(fullscreen=False, backend=BACKEND_VIDEO):
     """
     Inicializa o sistema de display do jogo.
     
     Args:
         fullscreen: Se True, inicia em modo tela cheia
+        backend: "renderer", "surface" ou "auto" (padrão: BACKEND_VIDEO)
         
     Returns:
         Superfície onde o jogo deve desenhar
     """
-    display_surface = _display_manager.initialize_display(fullscreen)
+    display_surface = _display_manager.initialize_display(fullscreen, backend)
     pygame.display.set_caption("SquareStorm")
     return _display_manager.get_game_surface()
 
 
-def present_frame():
-    """Apresenta o frame atual na tela."""
-    _display_manager.present()
+def present_frame(rects=None):
+    """
+    Apresenta o frame atual na tela (e fecha o frame do profiler).
+
+    Args:
+        rects: Regiões sujas (telas retidas, src/ui/retained_ui.py) ou None
+               para a tela inteira
+    """
+    perfil.fechar_secao()
+    if perfil.overlay_visivel:
+        from src.ui.profiler_overlay import desenhar_overlay_perfil
+        with perfil.escopo('overlay'):
+            desenhar_overlay_perfil(_display_manager.game_surface, perfil)
+        # O painel fica por cima de qualquer região: apresenta tudo
+        rects = None
+    with perfil.escopo('present'):
+        _display_manager.present(rects)
+    perfil.fim_frame()
 
 
 def toggle_fullscreen():
@@ -0,0 +1,147 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Registro de fontes e cache de textos renderizados.
+
+pygame.font.SysFont procura a fonte entre as fontes do sistema e carrega
+o arquivo a cada chamada, e Font.render rasteriza o texto de novo a cada
+frame. As telas do jogo chamavam os dois dentro do loop (textos do HUD,
+"+N" das moedas, placares dos minigames), então:
+
+    fonte = obter_fonte("Arial", 18, True)      # uma Font por (face, tamanho, negrito)
+    surf = renderizar_texto("FASE 3", fonte, VERDE)  # superfície reaproveitada
+
+As superfícies do cache são compartilhadas: quem precisa mudar o alpha
+(fade) deve renderizar a própria superfície com fonte.render.
+"""
+
+import os
+from collections import OrderedDict
+from typing import Dict, Optional, Tuple
+
+import pygame
+
+# Limites do cache (o texto usado há mais tempo sai primeiro). O limite de
+# pixels segura textos grandes com cor animada (títulos pulsando), que
+# geram uma superfície nova por frame
+MAX_TEXTOS_CACHE = 512
+MAX_PIXELS_CACHE = 4_000_000
+# Deslocamento da sombra em pixels (o mesmo do desenhar_texto)
+DESLOCAMENTO_SOMBRA = 2
+
+_fontes: Dict[Tuple[Optional[str], int, bool], pygame.font.Font] = {}
+
+
+def obter_fonte(face: Optional[str], tamanho: int, negrito: bool = False) -> pygame.font.Font:
+    """
+    Devolve a fonte do registro, criando-a na primeira vez.
+
+    Args:
+        face: Nome da fonte do sistema ("Arial"), caminho de um arquivo
+              .ttf/.otf ou None para a fonte padrão do pygame
+        tamanho: Tamanho em pontos
+        negrito: Se True, usa a versão em negrito
+
+    Returns:
+        pygame.font.Font compartilhada
+    """
+    chave = (face, tamanho, negrito)
+    fonte = _fontes.get(chave)
+    if fonte is None:
+        if face is None or os.path.splitext(face)[1].lower() in ('.ttf', '.otf'):
+            fonte = pygame.font.Font(face, tamanho)
+            if negrito:
+                fonte.set_bold(True)
+        else:
+            fonte = pygame.font.SysFont(face, tamanho, negrito)
+        _fontes[chave] = fonte
+    return fonte
+
+
+class CacheTexto:
+    """Cache LRU de superfícies de texto com contadores de acerto."""
+
+    def __init__(self, maximo: int = MAX_TEXTOS_CACHE, maximo_pixels: int = MAX_PIXELS_CACHE):
+        self.maximo = maximo
+        self.maximo_pixels = maximo_pixels
+        self._superficies: 'OrderedDict[tuple, pygame.Surface]' = OrderedDict()
+        self.pixels = 0
+        self.acertos = 0
+        self.falhas = 0
+
+    def renderizar(self, texto: str, fonte: pygame.font.Font, cor, antialias: bool = True,
+                   sombra=None) -> pygame.Surface:
+        """
+        Devolve a superfície do texto (renderizando só se não estiver no cache).
+
+        Args:
+            texto: String a ser renderizada
+            fonte: Fonte (de preferência do obter_fonte)
+            cor: Cor RGB do texto
+            antialias: Suavização das bordas
+            sombra: Cor da sombra (deslocada DESLOCAMENTO_SOMBRA pixels) ou None
+
+        Returns:
+            Superfície compartilhada (não alterar)
+        """
+        if type(cor) is not tuple:
+            cor = tuple(cor)
+        if sombra is not None and type(sombra) is not tuple:
+            sombra = tuple(sombra)
+        chave = (texto, fonte, cor, antialias, sombra)
+
+        superficie = self._superficies.get(chave)
+        if superficie is not None:
+            self.acertos += 1
+            self._superficies.move_to_end(chave)
+            return superficie
+
+        self.falhas += 1
+        superficie = fonte.render(texto, antialias, cor)
+        if sombra is not None:
+            largura, altura = superficie.get_size()
+            composta = pygame.Surface((largura + DESLOCAMENTO_SOMBRA, altura + DESLOCAMENTO_SOMBRA),
+                                      pygame.SRCALPHA)
+            composta.blit(fonte.render(texto, antialias, sombra), (DESLOCAMENTO_SOMBRA, DESLOCAMENTO_SOMBRA))
+            composta.blit(superficie, (0, 0))
+            superficie = composta
+
+        self._superficies[chave] = superficie
+        self.pixels += superficie.get_width() * superficie.get_height()
+        while len(self._superficies) > 1 and (len(self._superficies) > self.maximo
+                                              or self.pixels > self.maximo_pixels):
+            _, antiga = self._superficies.popitem(last=False)
+            self.pixels -= antiga.get_width() * antiga.get_height()
+        return superficie
+
+    def limpar(self):
+        """Descarta as superfícies e zera os contadores."""
+        self._superficies.clear()
+        self.pixels = 0
+        self.acertos = 0
+        self.falhas = 0
+
+    def estatisticas(self) -> Dict:
+        """
+        Returns:
+            {'acertos', 'falhas', 'taxa' (0-1), 'textos', 'fontes'}
+        """
+        total = self.acertos + self.falhas
+        return {
+            'acertos': self.acertos,
+            'falhas': self.falhas,
+            'taxa': self.acertos / total if total else 0.0,
+            'textos': len(self._superficies),
+            'fontes': len(_fontes),
+        }
+
+
+# Cache do processo (só o loop de jogo renderiza)
+cache_texto = CacheTexto()
+
+
+def renderizar_texto(texto: str, fonte: pygame.font.Font, cor, antialias: bool = True,
+                     sombra=None) -> pygame.Surface:
+    """Atalho para cache_texto.renderizar (a superfície devolvida é compartilhada)."""
+    return cache_texto.renderizar(texto, fonte, cor, antialias, sombra)
@@ -0,0 +1,237 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Fundo das fases em camadas de paralaxe pré-renderizadas.
+
+O fundo desenhava cada estrela com pygame.draw.circle (e cada peixe e bolha
+do tema aquático com 6 a 10 primitivas) e ainda movia as estrelas duas
+vezes por frame: em atualizar_efeitos_visuais e dentro do desenhar_estrelas.
+Aqui os objetos são agrupados por velocidade e desenhados uma vez em
+camadas que se repetem (a camada sai por um lado e volta pelo outro):
+
+    fundo = FundoParallax(gradiente, estrelas=estrelas)
+    fundo.atualizar()        # um passo por frame (só desloca as camadas)
+    fundo.desenhar(tela)     # gradiente + uma ou duas cópias por camada
+
+As listas de estrelas/peixes/bolhas não são alteradas: o padrão de cada
+camada é a posição dos objetos no momento em que o fundo é criado.
+"""
+
+from typing import Callable, List, Optional
+
+import pygame
+
+from src.config import LARGURA, ALTURA_JOGO
+
+# Quantas camadas por tipo de objeto (objetos com velocidades próximas
+# dividem a mesma camada e a velocidade média dela)
+NUM_CAMADAS_PARALLAX = 4
+# Cor de fundo das camadas (colorkey com RLE: só as linhas com objetos custam)
+COR_CHAVE = (255, 0, 255)
+# Folga além da borda para peixes e bolhas saírem inteiros antes de voltar
+MARGEM_PEIXES = 20
+MARGEM_BOLHAS = 12
+
+COR_BOLHA = (160, 215, 250)
+COR_REFLEXO_BOLHA = (220, 245, 255)
+
+
+class CamadaParallax:
+    """Superfície repetida em um eixo e deslocada a velocidade constante."""
+
+    def __init__(self, superficie: pygame.Surface, velocidade: float,
+                 vertical: bool = False, origem: int = 0):
+        """
+        Args:
+            superficie: Padrão da camada; a largura (ou altura, se vertical)
+                        é o período da repetição
+            velocidade: Pixels por atualizar() (para a esquerda, ou para cima)
+            vertical: Se True, a camada sobe em vez de ir para a esquerda
+            origem: Coordenada da tela onde começa o padrão com deslocamento 0
+        """
+        self.superficie = superficie
+        self.velocidade = velocidade
+        self.vertical = vertical
+        self.origem = origem
+        self.periodo = superficie.get_height() if vertical else superficie.get_width()
+        self.deslocamento = 0.0
+
+    def atualizar(self):
+        """Avança um passo."""
+        self.deslocamento = (self.deslocamento + self.velocidade) % self.periodo
+
+    def desenhar(self, tela: pygame.Surface):
+        """Copia o padrão duas vezes, emendadas no ponto de repetição."""
+        inicio = self.origem - int(self.deslocamento)
+        for pos in (inicio, inicio + self.periodo):
+            tela.blit(self.superficie, (0, pos) if self.vertical else (pos, 0))
+
+
+def _criar_camadas(objetos, velocidade_de: Callable, desenhar_objeto: Callable,
+                   tamanho, vertical: bool, origem: int, fator: float) -> List[CamadaParallax]:
+    """
+    Agrupa os objetos por velocidade e desenha cada grupo numa camada.
+
+    Args:
+        objetos: Lista de objetos (listas no formato do jogo)
+        velocidade_de: Função objeto -> velocidade por passo
+        desenhar_objeto: Função (superficie, objeto, dx, dy) que desenha o
+                         objeto deslocado de (dx, dy)
+        tamanho: (largura, altura) da camada
+        vertical: Eixo da repetição
+        origem: Início do padrão na tela
+        fator: Multiplicador das velocidades
+    """
+    if not objetos:
+        return []
+
+    velocidades = [velocidade_de(obj) for obj in objetos]
+    minima, maxima = min(velocidades), max(velocidades)
+    faixa = (maxima - minima) / NUM_CAMADAS_PARALLAX or 1.0
+    grupos = [[] for _ in range(NUM_CAMADAS_PARALLAX)]
+    for obj, vel in zip(objetos, velocidades):
+        grupos[min(NUM_CAMADAS_PARALLAX - 1, int((vel - minima) / faixa))].append((obj, vel))
+
+    periodo = tamanho[1] if vertical else tamanho[0]
+    camadas = []
+    for grupo in grupos:
+        if not grupo:
+            continue
+        superficie = pygame.Surface(tamanho)
+        superficie.fill(COR_CHAVE)
+        for obj, _ in grupo:
+            # Cópias de um período antes e depois: quem cruza a emenda
+            # aparece inteiro dos dois lados
+            for copia in (-periodo, 0, periodo):
+                if vertical:
+                    desenhar_objeto(superficie, obj, 0, copia - origem)
+                else:
+                    desenhar_objeto(superficie, obj, copia - origem, 0)
+        superficie.set_colorkey(COR_CHAVE, pygame.RLEACCEL)
+        velocidade = sum(vel for _, vel in grupo) / len(grupo) * fator
+        camadas.append(CamadaParallax(superficie, velocidade, vertical, origem))
+    return camadas
+
+
+def desenhar_estrela(superficie: pygame.Surface, estrela, dx: int = 0, dy: int = 0):
+    """Desenha uma estrela ([x, y, tamanho, brilho, vel(, cor)]) deslocada de (dx, dy)."""
+    if len(estrela) >= 6:
+        cor = estrela[5]
+    else:
+        cor = (estrela[3], estrela[3], estrela[3])
+    pygame.draw.circle(superficie, cor, (int(estrela[0]) + dx, int(estrela[1]) + dy), int(estrela[2]))
+
+
+def desenhar_peixe(superficie: pygame.Surface, peixe, dx: int = 0, dy: int = 0):
+    """Desenha um peixe decorativo ([x, y, tamanho, brilho, vel, cor]) no estilo do inimigo peixe."""
+    # Ângulo fixo = π (todos nadam para a esquerda)
+    # Com cos_a=-1, sin_a=0: pt(fx,fy) = (cx - fx, cy - fy)
+    cx, cy = int(peixe[0]) + dx, int(peixe[1]) + dy
+    s = float(peixe[2])
+    cor = peixe[5]
+    esc = tuple(max(0, c - 50) for c in cor)
+
+    # === CAUDA BIFURCADA ===
+    cauda_raiz = (cx + s * 0.35, cy)
+    cauda_top  = (cx + s * 1.05, cy + s * 0.65)
+    cauda_mid  = (cx + s * 0.65, cy)
+    cauda_bot  = (cx + s * 1.05, cy - s * 0.65)
+    pygame.draw.polygon(superficie, esc, [cauda_raiz, cauda_top, cauda_mid])
+    pygame.draw.polygon(superficie, esc, [cauda_raiz, cauda_bot, cauda_mid])
+    pygame.draw.polygon(superficie, cor, [
+        cauda_raiz, (cx + s * 0.95, cy + s * 0.48), (cx + s * 0.60, cy)])
+    pygame.draw.polygon(superficie, cor, [
+        cauda_raiz, (cx + s * 0.95, cy - s * 0.48), (cx + s * 0.60, cy)])
+
+    # === CORPO TRIANGULAR ===
+    pygame.draw.polygon(superficie, esc, [
+        (cx - s,       cy),
+        (cx + s * 0.4, cy - s * 0.8),
+        (cx + s * 0.4, cy + s * 0.8),
+    ])
+    pygame.draw.polygon(superficie, cor, [
+        (cx - s * 0.82, cy),
+        (cx + s * 0.32, cy - s * 0.62),
+        (cx + s * 0.32, cy + s * 0.62),
+    ])
+
+    # === NADADEIRA DORSAL (só para peixes maiores) ===
+    if s >= 9:
+        pygame.draw.polygon(superficie, esc, [
+            (cx - s * 0.1,  cy + s * 0.78),
+            (cx - s * 0.35, cy + s * 1.25),
+            (cx + s * 0.2,  cy + s * 0.78),
+        ])
+        pygame.draw.polygon(superficie, cor, [
+            (cx - s * 0.1,  cy + s * 0.78),
+            (cx - s * 0.30, cy + s * 1.1),
+            (cx + s * 0.12, cy + s * 0.78),
+        ])
+
+    # === LINHA LATERAL ===
+    if s >= 6:
+        pygame.draw.line(superficie, esc,
+                         (int(cx - s * 0.75), cy),
+                         (int(cx + s * 0.3),  cy), 1)
+
+
+def desenhar_bolha(superficie: pygame.Surface, bolha, dx: int = 0, dy: int = 0):
+    """Desenha uma bolha ([x, y, raio, vel_y]) deslocada de (dx, dy)."""
+    ix, iy, ir = int(bolha[0]) + dx, int(bolha[1]) + dy, max(1, int(bolha[2]))
+    # Anel da bolha
+    pygame.draw.circle(superficie, COR_BOLHA, (ix, iy), ir, 1)
+    # Reflexo
+    shine_x = ix - max(1, ir // 3)
+    shine_y = iy - max(1, ir // 3)
+    pygame.draw.circle(superficie, COR_REFLEXO_BOLHA, (shine_x, shine_y), max(1, ir // 4))
+
+
+class FundoParallax:
+    """Gradiente fixo mais camadas de estrelas, peixes e bolhas."""
+
+    def __init__(self, gradiente: Optional[pygame.Surface], estrelas=None, peixes=None,
+                 bolhas=None, fator_velocidade: float = 1.0):
+        """
+        Args:
+            gradiente: Superfície do fundo (criar_gradiente) ou None para preto
+            estrelas: Lista de estrelas do criar_estrelas (vão para a esquerda)
+            peixes: Lista de peixes no formato das estrelas (vão para a esquerda)
+            bolhas: Lista de bolhas [x, y, raio, vel_y] (sobem)
+            fator_velocidade: Multiplicador das velocidades de estrelas e peixes
+        """
+        self.gradiente = gradiente
+        self.estrelas = estrelas
+        self.peixes = peixes
+        self.bolhas = bolhas
+        self.area = pygame.Rect(0, 0, LARGURA, ALTURA_JOGO)
+
+        self.camadas = (
+            _criar_camadas(estrelas or [], lambda e: e[4], desenhar_estrela,
+                           (LARGURA, ALTURA_JOGO), False, 0, fator_velocidade)
+            + _criar_camadas(peixes or [], lambda p: p[4], desenhar_peixe,
+                             (LARGURA + 2 * MARGEM_PEIXES, ALTURA_JOGO), False,
+                             -MARGEM_PEIXES, fator_velocidade)
+            + _criar_camadas(bolhas or [], lambda b: b[3], desenhar_bolha,
+                             (LARGURA, ALTURA_JOGO + 2 * MARGEM_BOLHAS), True,
+                             -MARGEM_BOLHAS, 1.0)
+        )
+
+    def atualizar(self):
+        """Avança todas as camadas um passo (chamar uma vez por frame)."""
+        for camada in self.camadas:
+            camada.atualizar()
+
+    def desenhar(self, tela: pygame.Surface):
+        """Desenha o gradiente e as camadas (limitadas à área de jogo)."""
+        if self.gradiente is None or (self.gradiente.get_width() < tela.get_width()
+                                      or self.gradiente.get_height() < tela.get_height()):
+            tela.fill((0, 0, 0))
+        if self.gradiente is not None:
+            tela.blit(self.gradiente, (0, 0))
+
+        clip_anterior = tela.get_clip()
+        tela.set_clip(self.area.clip(clip_anterior))
+        for camada in self.camadas:
+            camada.desenhar(tela)
+        tela.set_clip(clip_anterior)
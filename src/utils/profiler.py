@@ -0,0 +1,293 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Profiler de frame por etapa (F3 liga/desliga o overlay, Shift+F3 exporta
+os últimos frames em formato Chrome trace).
+
+Os loops de jogo marcam cada etapa com um escopo nomeado:
+
+    with escopo('ia'):
+        self._atualizar_inimigos(tempo_atual, fator_tempo)
+
+Loops longos e lineares (os minigames) usam seções: secao('ia') fecha a
+seção anterior e abre a próxima, sem reindentar o loop:
+
+    secao('eventos')
+    for ev in pygame.event.get():
+        ...
+    secao('render')
+
+O frame fecha no present_frame (que também fecha a seção aberta). Para
+cada etapa fica guardado o tempo exclusivo (o que rodou num escopo
+interno conta só para ele) dos últimos JANELA_FRAMES frames, de onde saem
+média, p95 e o histograma mostrados no overlay. O frame conta do primeiro
+escopo depois do present anterior até o fim do present, então a espera do
+relogio.tick fica de fora.
+
+Desligado, escopo() devolve sempre o mesmo contexto vazio e secao() só
+retorna: o custo é uma chamada de função. O trace abre em
+chrome://tracing ou ui.perfetto.dev.
+"""
+
+import json
+import os
+import threading
+import time
+from collections import defaultdict, deque
+from contextlib import nullcontext
+from typing import Deque, Dict, List, Optional, Tuple
+
+import pygame
+
+from src.config import PROFILER_ATIVO, PASTA_PERFIS
+
+# Frames guardados por etapa (histograma rolante)
+JANELA_FRAMES = 240
+# Frames guardados para o trace
+TRACE_FRAMES = 300
+# Limites dos baldes do histograma (ms); o último balde é "acima de 16"
+BALDES_MS = (0.25, 0.5, 1.0, 2.0, 4.0, 8.0, 16.0)
+
+_NULO = nullcontext()
+
+
+class _Escopo:
+    """Contexto de uma etapa (um por nome, reaproveitado)."""
+
+    __slots__ = ('perfil', 'nome')
+
+    def __init__(self, perfil: 'Profiler', nome: str):
+        self.perfil = perfil
+        self.nome = nome
+
+    def __enter__(self):
+        self.perfil._entrar(self.nome)
+        return self
+
+    def __exit__(self, *exc):
+        self.perfil._sair()
+        return False
+
+
+class Profiler:
+    """Tempos por etapa dos últimos frames e trace dos últimos frames."""
+
+    def __init__(self, ativo: bool = PROFILER_ATIVO):
+        self.ativo = ativo
+        self.overlay_visivel = False
+        self.thread = threading.get_ident()
+
+        self._escopos: Dict[str, _Escopo] = {}
+        self._pilha: List[List] = []  # [nome, inicio, tempo dos filhos, é seção]
+        self._inicio_frame: Optional[float] = None
+        self._frame: Dict[str, float] = defaultdict(float)  # s, exclusivo
+        self._eventos: List[Tuple[str, float, float]] = []  # (nome, inicio, duração)
+
+        # Histórico em ms: {etapa: deque}; 'frame' é o frame inteiro
+        self.historico: Dict[str, Deque[float]] = {}
+        self.frames = 0
+        self.trace: Deque[Tuple[float, float, List]] = deque(maxlen=TRACE_FRAMES)
+        self._origem = time.perf_counter()
+        self._f3_apertada = False
+
+    # ==================== ESCOPOS ====================
+
+    def escopo(self, nome: str):
+        """Contexto que mede uma etapa do frame (vazio se o profiler está desligado)."""
+        if not self.ativo or threading.get_ident() != self.thread:
+            return _NULO
+        escopo = self._escopos.get(nome)
+        if escopo is None:
+            escopo = self._escopos[nome] = _Escopo(self, nome)
+        return escopo
+
+    def secao(self, nome: str):
+        """Fecha a seção aberta (se houver) e abre a seção `nome`."""
+        if not self.ativo or threading.get_ident() != self.thread:
+            return
+        self.fechar_secao()
+        self._entrar(nome, secao=True)
+
+    def fechar_secao(self):
+        """Fecha a seção aberta (escopos abertos dentro dela não são fechados)."""
+        if self._pilha and self._pilha[-1][3]:
+            self._sair()
+
+    def _entrar(self, nome: str, secao: bool = False):
+        agora = time.perf_counter()
+        if self._inicio_frame is None:
+            self._inicio_frame = agora
+        self._pilha.append([nome, agora, 0.0, secao])
+
+    def _sair(self):
+        if not self._pilha:
+            return  # Ligado no meio do escopo
+        if self._pilha[-1][3] and len(self._pilha) > 1:
+            # Seção aberta dentro do escopo que está fechando: termina junto
+            self._sair()
+        agora = time.perf_counter()
+        nome, inicio, filhos, _ = self._pilha.pop()
+        duracao = agora - inicio
+        self._frame[nome] += duracao - filhos
+        if self._pilha:
+            self._pilha[-1][2] += duracao
+        self._eventos.append((nome, inicio, duracao))
+
+    # ==================== FRAMES ====================
+
+    def fim_frame(self):
+        """Fecha o frame (chamado pelo present_frame) e trata F3/Shift+F3."""
+        self._verificar_tecla()
+        if not self.ativo:
+            return
+        self.fechar_secao()
+
+        agora = time.perf_counter()
+        inicio = self._inicio_frame if self._inicio_frame is not None else agora
+        self._guardar('frame', (agora - inicio) * 1000.0)
+        for nome in set(self.historico) | set(self._frame):
+            if nome != 'frame':
+                self._guardar(nome, self._frame.get(nome, 0.0) * 1000.0)
+        self.trace.append((inicio, agora, self._eventos))
+        self.frames += 1
+
+        self._frame = defaultdict(float)
+        self._eventos = []
+        # Escopos que atravessam o present (ex: cutscene) começam o próximo frame
+        self._inicio_frame = agora if self._pilha else None
+
+    def _guardar(self, nome: str, ms: float):
+        historico = self.historico.get(nome)
+        if historico is None:
+            historico = self.historico[nome] = deque(maxlen=JANELA_FRAMES)
+        historico.append(ms)
+
+    def _verificar_tecla(self):
+        # A tecla é lida no present para valer em todos os loops (fases,
+        # multiplayer, minigames) sem mexer no tratamento de eventos de cada um
+        try:
+            apertada = pygame.key.get_pressed()[pygame.K_F3]
+        except (pygame.error, IndexError):
+            return
+        if apertada and not self._f3_apertada:
+            if pygame.key.get_mods() & pygame.KMOD_SHIFT:
+                if self.ativo:
+                    self.exportar_trace()
+            else:
+                self.alternar_overlay()
+        self._f3_apertada = apertada
+
+    def alternar_overlay(self):
+        """Mostra/esconde o overlay (liga o profiler se estava desligado)."""
+        self.overlay_visivel = not self.overlay_visivel
+        if self.overlay_visivel and not self.ativo:
+            self.ligar()
+
+    def ligar(self):
+        self.ativo = True
+        self.thread = threading.get_ident()
+
+    def desligar(self):
+        self.ativo = False
+        self.overlay_visivel = False
+        self.zerar()
+
+    def zerar(self):
+        """Descarta o histórico e o trace."""
+        self._pilha = []
+        self._inicio_frame = None
+        self._frame = defaultdict(float)
+        self._eventos = []
+        self.historico = {}
+        self.trace.clear()
+        self.frames = 0
+
+    # ==================== RELATÓRIOS ====================
+
+    def estatisticas(self) -> Dict[str, Dict]:
+        """
+        Resumo da janela rolante por etapa.
+
+        Returns:
+            {etapa: {'media', 'p95', 'max' (ms), 'fracao' do frame, 'histograma'}}
+            ordenado do maior consumidor para o menor ('frame' primeiro)
+        """
+        frame = self.historico.get('frame')
+        media_frame = sum(frame) / len(frame) if frame else 0.0
+        resultado = {}
+        for nome, valores in self.historico.items():
+            if not valores:
+                continue
+            ordenados = sorted(valores)
+            media = sum(valores) / len(valores)
+            histograma = [0] * (len(BALDES_MS) + 1)
+            for valor in valores:
+                i = 0
+                while i < len(BALDES_MS) and valor > BALDES_MS[i]:
+                    i += 1
+                histograma[i] += 1
+            resultado[nome] = {
+                'media': media,
+                'p95': ordenados[min(len(ordenados) - 1, int(len(ordenados) * 0.95))],
+                'max': ordenados[-1],
+                'fracao': media / media_frame if media_frame else 0.0,
+                'histograma': histograma,
+            }
+        return dict(sorted(resultado.items(),
+                           key=lambda item: (item[0] != 'frame', -item[1]['media'])))
+
+    def exportar_trace(self, caminho: Optional[str] = None) -> Optional[str]:
+        """
+        Grava os últimos TRACE_FRAMES frames em formato Chrome trace (JSON).
+
+        Args:
+            caminho: Arquivo de saída (None = PASTA_PERFIS/trace_<hora>.json)
+
+        Returns:
+            Caminho gravado, ou None se não havia frames
+        """
+        if not self.trace:
+            print("⚠️ [PROFILER] Nenhum frame medido para exportar")
+            return None
+        if caminho is None:
+            caminho = os.path.join(PASTA_PERFIS, f"trace_{time.strftime('%Y%m%d_%H%M%S')}.json")
+
+        def us(t: float) -> float:
+            return round((t - self._origem) * 1e6, 1)
+
+        eventos = [{'name': 'thread_name', 'ph': 'M', 'pid': 1, 'tid': 1,
+                    'args': {'name': 'loop do jogo'}}]
+        for numero, (inicio, fim, escopos) in enumerate(self.trace):
+            eventos.append({'name': 'frame', 'cat': 'frame', 'ph': 'X', 'pid': 1, 'tid': 1,
+                            'ts': us(inicio), 'dur': round((fim - inicio) * 1e6, 1),
+                            'args': {'frame': self.frames - len(self.trace) + numero}})
+            for nome, comeco, duracao in escopos:
+                eventos.append({'name': nome, 'cat': 'etapa', 'ph': 'X', 'pid': 1, 'tid': 1,
+                                'ts': us(comeco), 'dur': round(duracao * 1e6, 1)})
+
+        try:
+            pasta = os.path.dirname(caminho)
+            if pasta:
+                os.makedirs(pasta, exist_ok=True)
+            with open(caminho, 'w', encoding='utf-8') as f:
+                json.dump({'traceEvents': eventos, 'displayTimeUnit': 'ms'}, f)
+        except OSError as e:
+            print(f"❌ [PROFILER] Não foi possível gravar o trace: {e}")
+            return None
+        print(f"💾 [PROFILER] Trace de {len(self.trace)} frames gravado em {caminho}")
+        return caminho
+
+
+# Profiler do processo (o loop de jogo roda numa thread só)
+perfil = Profiler()
+
+
+def escopo(nome: str):
+    """Atalho para perfil.escopo(nome)."""
+    return perfil.escopo(nome)
+
+
+def secao(nome: str):
+    """Atalho para perfil.secao(nome)."""
+    perfil.secao(nome)
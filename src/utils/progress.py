@@ -1,19 +1,20 @@
 import json
 import os
+from src.utils.saves import caminho_dados, pasta_dados
 
 class ProgressManager:
     """Gerencia o progresso do jogador no jogo."""
     
     def __init__(self):
-        self.arquivo_progresso = "data/progresso.json"
+        self.arquivo_progresso = caminho_dados("progresso.json")
         self.fase_maxima = 1
         self._criar_diretorio()
         self._carregar_progresso()
     
     def _criar_diretorio(self):
         """Cria o diretório data se não existir."""
-        if not os.path.exists("data"):
-            os.makedirs("data")
+        if not os.path.exists(pasta_dados()):
+            os.makedirs(pasta_dados())
     
     def _carregar_progresso(self):
         """Carrega o progresso salvo."""
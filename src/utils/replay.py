@@ -0,0 +1,1092 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Gravação e reprodução de partidas (replays).
+
+Três tipos de replay, todos no mesmo formato binário:
+
+- ENTRADAS (FaseNormal, FaseBoss e minigames contra bots): seed do
+  rng_jogo (src/utils/rng.py, o gerador da jogabilidade), fase ou minigame
+  jogado, cópia dos saves lidos pela fase (upgrades, inventário, moedas)
+  e, a cada frame, o tempo, as
+  teclas, o mouse e os eventos que o jogo leu. Enquanto a gravação ou a
+  reprodução está ativa, pygame.time.get_ticks, pygame.event.get,
+  pygame.key.get_pressed e pygame.mouse.get_pressed/get_pos passam por uma
+  camada que congela tempo, teclas e mouse durante o frame (o frame termina
+  no relogio.tick), então a fase roda igual nas duas vezes. Na reprodução
+  os saves gravados vão para uma pasta temporária (os saves do jogador não
+  são tocados). O joystick não é gravado.
+- SIMULACAO (modo Bomb simulado no servidor): seed, mapa e as chamadas que
+  o servidor fez na SimulacaoBomba (jogadores sincronizados, acertos em
+  bots, passos de tempo). Reproduzir é rodar a simulação de novo.
+- SNAPSHOTS (modos em que o servidor só repassa o que os clientes mandam,
+  que depende do tempo da rede): jogadores e ações de minigame de cada tick.
+
+Arquivo: 'SSRP', versão (B), tipo (B), tamanho do cabeçalho (I), cabeçalho
+JSON e o corpo comprimido com zlib, uma sequência de registros
+(tag, tamanho, dados) com inteiros em varint. O último registro (FIM) traz
+o resultado da partida, que a reprodução confere.
+
+Reprodução sem janela, sem som e sem limite de FPS:
+    python -m src.utils.replay replays/fase5_1700000000.ssr
+    python -m src.utils.replay replays/Bomb_1700000000_5555.ssr --velocidade 8
+"""
+
+import argparse
+import json
+import os
+import random
+import struct
+import sys
+import threading
+import time
+import zlib
+from abc import ABC, abstractmethod
+from collections import Counter, deque
+from typing import Any, Dict, List, Optional, Tuple
+
+import pygame
+
+from src.config import FPS, PASTA_REPLAYS
+from src.utils.display_manager import convert_mouse_position
+from src.utils.fonts import obter_fonte
+from src.utils.rng import semear_jogo
+from src.utils.saves import ler_dados, pasta_dados_temporaria
+
+MAGICO = b'SSRP'
+# 2: a jogabilidade sorteia no rng_jogo (replays da versão 1 dependiam do
+# random global e não se repetem mais)
+VERSAO = 2
+_CABECALHO = struct.Struct('<4sBBI')
+_FLOAT = struct.Struct('<d')
+
+TIPO_ENTRADAS = 0
+TIPO_SIMULACAO = 1
+TIPO_SNAPSHOTS = 2
+NOMES_TIPOS = {TIPO_ENTRADAS: 'entradas', TIPO_SIMULACAO: 'simulação', TIPO_SNAPSHOTS: 'snapshots'}
+
+# Tags dos registros
+REG_FRAME = 1
+REG_FIM = 2
+REG_INICIAR = 10
+REG_SINCRONIZAR = 11
+REG_REMOVER = 12
+REG_DANO_BOT = 14
+REG_PASSO = 15
+REG_MOVER = 16
+REG_SNAPSHOT = 20
+
+# Registros entre dois flushes do zlib (o que veio antes sobrevive a um crash)
+FLUSH_A_CADA = 600
+
+# Saves que a fase lê (upgrades, munições, inventário, moedas), por nome
+# dentro da pasta de dados
+ARQUIVOS_SAVE = ('upgrades.json', 'inventario.json', 'moedas.json')
+
+# Minigames que podem ser gravados (sem cliente, só contra bots):
+# nome no cabeçalho -> (módulo, função)
+MINIGAMES = {
+    'aim': ('src.game.minigame_aim', 'executar_minigame_aim'),
+    'duals': ('src.game.minigame_duals', 'executar_minigame_duals'),
+    'sabers': ('src.game.minigame_sabers', 'executar_minigame_sabers'),
+    'deadeye': ('src.game.minigame_deadeye', 'executar_minigame_deadeye'),
+    'boxfight': ('src.game.minigame_boxfight', 'executar_minigame_boxfight'),
+}
+
+# Eventos gravados e os atributos guardados de cada um
+CAMPOS_EVENTO = {
+    pygame.QUIT: (),
+    pygame.KEYDOWN: ('key', 'mod', 'scancode', 'unicode'),
+    pygame.KEYUP: ('key', 'mod', 'scancode'),
+    pygame.MOUSEBUTTONDOWN: ('button', 'pos'),
+    pygame.MOUSEBUTTONUP: ('button', 'pos'),
+    pygame.MOUSEMOTION: ('pos', 'rel', 'buttons'),
+    pygame.MOUSEWHEEL: ('x', 'y'),
+}
+
+# Flags do registro de frame: o que mudou desde o frame anterior
+_MUDOU_TECLAS = 1
+_MUDOU_MOUSE = 2
+_MUDOU_BOTOES = 4
+
+
+# ==================== FORMATO ====================
+
+class _Escrita:
+    """Monta os dados de um registro."""
+
+    def __init__(self):
+        self.partes: List[bytes] = []
+
+    def int(self, valor: int) -> '_Escrita':
+        # Zigzag: negativos pequenos também ocupam poucos bytes
+        valor = valor * 2 if valor >= 0 else -valor * 2 - 1
+        saida = bytearray()
+        while valor >= 0x80:
+            saida.append((valor & 0x7F) | 0x80)
+            valor >>= 7
+        saida.append(valor)
+        self.partes.append(bytes(saida))
+        return self
+
+    def float(self, valor: float) -> '_Escrita':
+        self.partes.append(_FLOAT.pack(valor))
+        return self
+
+    def texto(self, valor: str) -> '_Escrita':
+        dados = valor.encode('utf-8')
+        self.int(len(dados))
+        self.partes.append(dados)
+        return self
+
+    def valor(self, valor: Any) -> '_Escrita':
+        """Int, texto ou tupla de ints, com uma tag de tipo na frente."""
+        if isinstance(valor, str):
+            return self.int(1).texto(valor)
+        if isinstance(valor, (tuple, list)):
+            self.int(2).int(len(valor))
+            for item in valor:
+                self.int(int(item))
+            return self
+        return self.int(0).int(int(valor))
+
+    def bytes(self) -> bytes:
+        return b''.join(self.partes)
+
+
+class _Leitura:
+    """Lê os dados de um registro na mesma ordem em que foram escritos."""
+
+    def __init__(self, dados: bytes):
+        self.dados = dados
+        self.pos = 0
+
+    def acabou(self) -> bool:
+        return self.pos >= len(self.dados)
+
+    def byte(self) -> int:
+        valor = self.dados[self.pos]
+        self.pos += 1
+        return valor
+
+    def int(self) -> int:
+        valor = 0
+        deslocamento = 0
+        while True:
+            byte = self.byte()
+            valor |= (byte & 0x7F) << deslocamento
+            if byte < 0x80:
+                break
+            deslocamento += 7
+        return valor // 2 if valor % 2 == 0 else -(valor + 1) // 2
+
+    def float(self) -> float:
+        valor = _FLOAT.unpack_from(self.dados, self.pos)[0]
+        self.pos += _FLOAT.size
+        return valor
+
+    def texto(self) -> str:
+        tamanho = self.int()
+        if self.pos + tamanho > len(self.dados):
+            raise IndexError("registro cortado")
+        valor = self.dados[self.pos:self.pos + tamanho].decode('utf-8')
+        self.pos += tamanho
+        return valor
+
+    def bloco(self) -> bytes:
+        tamanho = self.int()
+        if self.pos + tamanho > len(self.dados):
+            raise IndexError("registro cortado")
+        valor = self.dados[self.pos:self.pos + tamanho]
+        self.pos += tamanho
+        return valor
+
+    def valor(self) -> Any:
+        tipo = self.int()
+        if tipo == 1:
+            return self.texto()
+        if tipo == 2:
+            return tuple(self.int() for _ in range(self.int()))
+        return self.int()
+
+
+class ArquivoReplay:
+    """Escreve um replay no disco, registro a registro."""
+
+    def __init__(self, caminho: str, tipo: int, cabecalho: Dict):
+        """
+        Args:
+            caminho: Arquivo de saída (a pasta é criada se preciso)
+            tipo: TIPO_ENTRADAS, TIPO_SIMULACAO ou TIPO_SNAPSHOTS
+            cabecalho: Dados da partida (JSON)
+        """
+        pasta = os.path.dirname(caminho)
+        if pasta:
+            os.makedirs(pasta, exist_ok=True)
+
+        self.caminho = caminho
+        self.arquivo = open(caminho, 'wb')
+        dados = json.dumps(cabecalho, ensure_ascii=False).encode('utf-8')
+        self.arquivo.write(_CABECALHO.pack(MAGICO, VERSAO, tipo, len(dados)))
+        self.arquivo.write(dados)
+        self.compressor = zlib.compressobj(9)
+        self.registros = 0
+
+    def registrar(self, tag: int, dados: bytes = b''):
+        """Acrescenta um registro ao corpo comprimido."""
+        if self.arquivo is None:
+            return
+        self.arquivo.write(self.compressor.compress(
+            bytes([tag]) + _Escrita().int(len(dados)).bytes() + dados
+        ))
+        self.registros += 1
+        if self.registros % FLUSH_A_CADA == 0:
+            self.arquivo.write(self.compressor.flush(zlib.Z_SYNC_FLUSH))
+
+    def fechar(self, fim: Optional[Dict] = None):
+        """
+        Grava o registro final e fecha o arquivo.
+
+        Args:
+            fim: Resultado da partida (conferido na reprodução)
+        """
+        if self.arquivo is None:
+            return
+        self.registrar(REG_FIM, json.dumps(fim or {}, ensure_ascii=False).encode('utf-8'))
+        self.arquivo.write(self.compressor.flush())
+        self.arquivo.close()
+        self.arquivo = None
+        print(f"🎞️ Replay gravado em {self.caminho} "
+              f"({os.path.getsize(self.caminho) // 1024} KB, {self.registros} registros)")
+
+
+class Replay:
+    """Replay lido do disco."""
+
+    def __init__(self, tipo: int, cabecalho: Dict, registros: List[Tuple[int, bytes]],
+                 fim: Optional[Dict], tamanho: int):
+        self.tipo = tipo
+        self.cabecalho = cabecalho
+        self.registros = registros
+        self.fim = fim  # None se o arquivo foi cortado (jogo fechado no meio)
+        self.tamanho = tamanho
+
+
+def ler_replay(caminho: str) -> Replay:
+    """
+    Lê um replay inteiro para a memória.
+
+    Raises:
+        ValueError: se o arquivo não for um replay desta versão
+    """
+    with open(caminho, 'rb') as f:
+        conteudo = f.read()
+
+    if len(conteudo) < _CABECALHO.size:
+        raise ValueError(f"{caminho} não é um replay")
+    magico, versao, tipo, tamanho = _CABECALHO.unpack_from(conteudo)
+    if magico != MAGICO:
+        raise ValueError(f"{caminho} não é um replay")
+    if versao != VERSAO:
+        raise ValueError(f"{caminho}: versão {versao} de replay não suportada (esperada {VERSAO})")
+
+    inicio = _CABECALHO.size
+    cabecalho = json.loads(conteudo[inicio:inicio + tamanho].decode('utf-8'))
+    # decompressobj aceita o corpo cortado: lê o que foi gravado até o último flush
+    corpo = zlib.decompressobj().decompress(conteudo[inicio + tamanho:])
+
+    registros = []
+    fim = None
+    leitura = _Leitura(corpo)
+    while not leitura.acabou():
+        try:
+            tag = leitura.byte()
+            dados = leitura.bloco()
+        except IndexError:
+            break
+        if tag == REG_FIM:
+            fim = json.loads(dados.decode('utf-8'))
+        else:
+            registros.append((tag, dados))
+
+    return Replay(tipo, cabecalho, registros, fim, len(conteudo))
+
+
+class _Ritmo:
+    """Segura a reprodução em `velocidade` vezes o tempo real (None = sem limite)."""
+
+    def __init__(self, velocidade: Optional[float]):
+        self.velocidade = velocidade
+        self.inicio = time.perf_counter()
+
+    def esperar(self, tempo_jogo: float):
+        """Dorme até o relógio real alcançar tempo_jogo (s) / velocidade."""
+        if not self.velocidade:
+            return
+        falta = tempo_jogo / self.velocidade - (time.perf_counter() - self.inicio)
+        if falta > 0:
+            time.sleep(falta)
+
+
+# ==================== ENTRADAS (FASES) ====================
+
+class _CamadaEntradas(ABC):
+    """
+    Substitui as leituras de tempo, teclado, mouse e eventos do pygame pelo
+    estado congelado do frame atual. As subclasses dizem de onde vem esse
+    estado (do jogador, gravando; do arquivo, reproduzindo).
+    """
+
+    def __init__(self):
+        self.tempo = 0
+        self.teclas: Tuple[int, ...] = ()  # Scancodes apertados
+        self.mouse = (0, 0)  # Posição já convertida para a área do jogo
+        self.botoes = 0  # Bitmask dos botões do mouse
+        self.frames = 0
+        self._estado_teclas = None
+        self._originais = None
+
+    def instalar(self):
+        self._originais = (pygame.time.get_ticks, pygame.event.get, pygame.key.get_pressed,
+                           pygame.mouse.get_pressed, pygame.mouse.get_pos)
+        pygame.time.get_ticks = self._get_ticks
+        pygame.event.get = self._event_get
+        pygame.key.get_pressed = self._key_get_pressed
+        pygame.mouse.get_pressed = self._mouse_get_pressed
+        pygame.mouse.get_pos = self._mouse_get_pos
+
+    def remover(self):
+        if self._originais is None:
+            return
+        (pygame.time.get_ticks, pygame.event.get, pygame.key.get_pressed,
+         pygame.mouse.get_pressed, pygame.mouse.get_pos) = self._originais
+        self._originais = None
+
+    @abstractmethod
+    def fim_frame(self):
+        """Chamado pelo relógio no fim de cada frame."""
+
+    @abstractmethod
+    def novo_frame(self):
+        """Chamado pelo relógio depois do tick: congela o estado do próximo frame."""
+
+    def _get_ticks(self) -> int:
+        return self.tempo
+
+    @abstractmethod
+    def _event_get(self, *args, **kwargs) -> List:
+        """Eventos do frame (pygame.event.get)."""
+
+    def _key_get_pressed(self):
+        if self._estado_teclas is None:
+            estado = [False] * 512
+            for scancode in self.teclas:
+                estado[scancode] = True
+            self._estado_teclas = pygame.key.ScancodeWrapper(estado)
+        return self._estado_teclas
+
+    def _mouse_get_pressed(self, num_buttons: int = 3) -> Tuple[bool, ...]:
+        return tuple(bool(self.botoes >> i & 1) for i in range(num_buttons))
+
+    def _mouse_get_pos(self) -> Tuple[int, int]:
+        return self.mouse
+
+
+class RelogioReplay:
+    """
+    Relógio entregue à fase durante a gravação/reprodução: cada tick() fecha
+    um frame. Reproduzindo, não dorme (ou segura em `velocidade` x tempo real)
+    e guarda quanto cada frame levou de verdade (duracoes, em ms).
+    """
+
+    def __init__(self, camada: _CamadaEntradas, relogio=None, velocidade: Optional[float] = None):
+        self.camada = camada
+        self.relogio = relogio
+        self.ritmo = _Ritmo(velocidade)
+        self._ultimo = 0
+        self.duracoes: List[float] = []
+        self._inicio_frame = time.perf_counter()
+
+    def reiniciar(self):
+        """Começa a medir a partir de agora (descarta o que veio antes)."""
+        self.duracoes = []
+        self._inicio_frame = time.perf_counter()
+
+    def tick(self, framerate: int = 0) -> int:
+        self.camada.fim_frame()
+        if self.relogio is not None:
+            self._ultimo = self.relogio.tick(framerate)
+        else:
+            self.duracoes.append((time.perf_counter() - self._inicio_frame) * 1000.0)
+            self._ultimo = 1000 // framerate if framerate else 0
+            self.ritmo.esperar(self.camada.frames / framerate if framerate else 0)
+            self._inicio_frame = time.perf_counter()
+        self.camada.novo_frame()
+        return self._ultimo
+
+    def get_time(self) -> int:
+        return self._ultimo
+
+    def get_fps(self) -> float:
+        if self.relogio is not None:
+            return self.relogio.get_fps()
+        return 1000.0 / self._ultimo if self._ultimo else 0.0
+
+
+class GravadorEntradas(_CamadaEntradas):
+    """Grava as entradas de uma fase enquanto ela é jogada."""
+
+    def __init__(self, caminho: str, cabecalho: Dict, relogio):
+        """
+        Args:
+            caminho: Arquivo do replay
+            cabecalho: Dados da fase (seed, número, saves)
+            relogio: Clock real do jogo
+        """
+        super().__init__()
+        self.caminho = caminho
+        self.cabecalho = cabecalho
+        self.relogio = RelogioReplay(self, relogio)
+        self.arquivo: Optional[ArquivoReplay] = None
+        self.tempo_inicial = 0
+
+        self._mouse_real = (0, 0)
+        self._amostrado = set()
+        self._chamadas: List[List] = []
+        # Último estado escrito no arquivo (só o que muda é gravado)
+        self._tempo_gravado = 0
+        self._teclas_gravadas: Tuple[int, ...] = ()
+        self._mouse_gravado = (0, 0)
+        self._botoes_gravados = 0
+
+    def instalar(self):
+        super().instalar()
+        self.tempo = self._tempo_gravado = self.tempo_inicial = self._originais[0]()
+        self.arquivo = ArquivoReplay(self.caminho, TIPO_ENTRADAS,
+                                     {**self.cabecalho, 'tempo_inicial': self.tempo})
+
+    def finalizar(self, resultado: Any):
+        """
+        Fecha a gravação com o resultado da fase e devolve o pygame ao normal.
+
+        Args:
+            resultado: O que a partida retornou (fase: True, False ou "menu")
+        """
+        if self.arquivo is None:
+            return
+        frames = self.frames
+        # O último frame não chega ao tick (a fase retorna no meio dele)
+        self.fim_frame()
+        self.remover()
+        self.arquivo.fechar({'resultado': _normalizar(resultado), 'frames': frames,
+                             'duracao_ms': self.tempo - self.tempo_inicial})
+        self.arquivo = None
+
+    def fim_frame(self):
+        escrita = _Escrita().int(self.tempo - self._tempo_gravado)
+        self._tempo_gravado = self.tempo
+
+        flags = 0
+        if self.teclas != self._teclas_gravadas:
+            flags |= _MUDOU_TECLAS
+        if self.mouse != self._mouse_gravado:
+            flags |= _MUDOU_MOUSE
+        if self.botoes != self._botoes_gravados:
+            flags |= _MUDOU_BOTOES
+        escrita.int(flags)
+
+        if flags & _MUDOU_TECLAS:
+            escrita.int(len(self.teclas))
+            for scancode in self.teclas:
+                escrita.int(scancode)
+            self._teclas_gravadas = self.teclas
+        if flags & _MUDOU_MOUSE:
+            escrita.int(self.mouse[0]).int(self.mouse[1])
+            self._mouse_gravado = self.mouse
+        if flags & _MUDOU_BOTOES:
+            escrita.int(self.botoes)
+            self._botoes_gravados = self.botoes
+
+        escrita.int(len(self._chamadas))
+        for eventos in self._chamadas:
+            escrita.int(len(eventos))
+            for evento in eventos:
+                escrita.int(evento.type)
+                for campo in CAMPOS_EVENTO[evento.type]:
+                    valor = getattr(evento, campo, 0)
+                    if campo == 'pos':
+                        valor = convert_mouse_position(valor)
+                    escrita.valor(valor)
+
+        self.arquivo.registrar(REG_FRAME, escrita.bytes())
+        self.frames += 1
+        self._chamadas = []
+
+    def novo_frame(self):
+        self.tempo = self._originais[0]()
+        self._amostrado.clear()
+
+    def _event_get(self, *args, **kwargs) -> List:
+        eventos = self._originais[1](*args, **kwargs)
+        self._chamadas.append([e for e in eventos if e.type in CAMPOS_EVENTO])
+        return eventos
+
+    def _key_get_pressed(self):
+        if 'teclas' not in self._amostrado:
+            self._amostrado.add('teclas')
+            teclas = tuple(i for i, apertada in enumerate(self._originais[2]()) if apertada)
+            if teclas != self.teclas:
+                self.teclas = teclas
+                self._estado_teclas = None
+        return super()._key_get_pressed()
+
+    def _mouse_get_pressed(self, num_buttons: int = 3) -> Tuple[bool, ...]:
+        if 'botoes' not in self._amostrado:
+            self._amostrado.add('botoes')
+            reais = self._originais[3](num_buttons=5)
+            self.botoes = sum(1 << i for i, apertado in enumerate(reais) if apertado)
+        return super()._mouse_get_pressed(num_buttons)
+
+    def _mouse_get_pos(self) -> Tuple[int, int]:
+        # O jogo converte a posição da tela; o arquivo guarda já convertida
+        if 'mouse' not in self._amostrado:
+            self._amostrado.add('mouse')
+            self._mouse_real = self._originais[4]()
+            self.mouse = tuple(convert_mouse_position(self._mouse_real))
+        return self._mouse_real
+
+
+class ReprodutorEntradas(_CamadaEntradas):
+    """Entrega à fase as entradas gravadas, frame a frame."""
+
+    def __init__(self, replay: Replay, velocidade: Optional[float] = None):
+        super().__init__()
+        self.replay = replay
+        self.relogio = RelogioReplay(self, velocidade=velocidade)
+        self.frames_gravados = deque(dados for tag, dados in replay.registros if tag == REG_FRAME)
+        self.chamadas: deque = deque()
+        # True se a fase pediu mais frames do que o replay tem (divergiu)
+        self.esgotado = False
+
+    def instalar(self):
+        super().instalar()
+        self.tempo = self.replay.cabecalho.get('tempo_inicial', 0)
+        self.novo_frame()
+        self.relogio.reiniciar()
+
+    def fim_frame(self):
+        self.frames += 1
+
+    def novo_frame(self):
+        if not self.frames_gravados:
+            self.esgotado = True
+            self.chamadas = deque()
+            return
+
+        leitura = _Leitura(self.frames_gravados.popleft())
+        self.tempo += leitura.int()
+        flags = leitura.int()
+        if flags & _MUDOU_TECLAS:
+            self.teclas = tuple(leitura.int() for _ in range(leitura.int()))
+            self._estado_teclas = None
+        if flags & _MUDOU_MOUSE:
+            self.mouse = (leitura.int(), leitura.int())
+        if flags & _MUDOU_BOTOES:
+            self.botoes = leitura.int()
+
+        self.chamadas = deque()
+        for _ in range(leitura.int()):
+            eventos = []
+            for _ in range(leitura.int()):
+                tipo = leitura.int()
+                atributos = {campo: leitura.valor() for campo in CAMPOS_EVENTO.get(tipo, ())}
+                eventos.append(pygame.event.Event(tipo, atributos))
+            self.chamadas.append(eventos)
+
+    def _event_get(self, *args, **kwargs) -> List:
+        # Esvaziar a fila real (o driver dummy também gera eventos)
+        self._originais[1]()
+        if self.esgotado:
+            return [pygame.event.Event(pygame.QUIT)]
+        return self.chamadas.popleft() if self.chamadas else []
+
+
+def ler_saves() -> Dict[str, str]:
+    """Saves que a fase lê, da pasta de dados em uso ({nome: conteúdo})."""
+    return ler_dados(ARQUIVOS_SAVE)
+
+
+def usar_saves(saves: Dict[str, str]):
+    """
+    Contexto em que o jogo lê e escreve saves numa pasta temporária com os
+    saves dados (ausente = não existe); os saves do jogador não são abertos.
+
+    Args:
+        saves: {nome: conteúdo}, como gravado no cabeçalho (aceita também as
+            chaves 'data/nome' de gravações antigas)
+    """
+    return pasta_dados_temporaria({os.path.basename(nome): conteudo
+                                   for nome, conteudo in saves.items()})
+
+
+def iniciar_gravacao(relogio, cabecalho: Dict, caminho: str) -> GravadorEntradas:
+    """
+    Começa a gravar as entradas de uma partida: sorteia e aplica o seed do
+    rng_jogo (e do random global, para os efeitos visuais também se
+    repetirem) e instala a camada de entradas.
+
+    Args:
+        relogio: Clock do jogo (a partida deve usar gravador.relogio no lugar dele)
+        cabecalho: O que foi jogado ({'modo': 'fase', 'fase': n} ou
+            {'modo': 'minigame', 'minigame': nome, 'customizacao': {...}})
+        caminho: Arquivo do replay
+
+    Returns:
+        GravadorEntradas; chamar finalizar(resultado) quando a partida terminar
+    """
+    seed = random.randrange(2**31)
+    _semear(seed)
+    cabecalho = {
+        **cabecalho,
+        'seed': seed,
+        'fps': FPS,
+        'saves': ler_saves(),
+        'gravado_em': time.strftime('%Y-%m-%d %H:%M:%S'),
+    }
+    gravador = GravadorEntradas(caminho, cabecalho, relogio)
+    gravador.instalar()
+    return gravador
+
+
+def iniciar_gravacao_fase(relogio, numero_fase: int, pasta: str = PASTA_REPLAYS) -> GravadorEntradas:
+    """
+    Começa a gravar uma fase (ver iniciar_gravacao).
+
+    Args:
+        relogio: Clock do jogo (a fase deve usar gravador.relogio no lugar dele)
+        numero_fase: Fase jogada
+        pasta: Pasta dos replays
+
+    Returns:
+        GravadorEntradas; chamar finalizar(resultado) quando a fase terminar
+    """
+    caminho = os.path.join(pasta, f"fase{numero_fase}_{int(time.time())}.ssr")
+    gravador = iniciar_gravacao(relogio, {'modo': 'fase', 'fase': numero_fase}, caminho)
+    print(f"🔴 Gravando replay da fase {numero_fase} (seed {gravador.cabecalho['seed']})")
+    return gravador
+
+
+def preparar_partida(cabecalho: Dict):
+    """
+    Monta a partida descrita no cabeçalho de um replay de entradas, com os
+    mesmos gradientes e fontes de main_game (display já inicializado).
+
+    Returns:
+        Função jogar(relogio) que roda a partida e devolve o resultado
+    """
+    from src.utils.display_manager import get_display_manager
+    from src.utils.visual import criar_gradiente
+
+    try:
+        fonte_titulo = obter_fonte("Arial", 72, True)
+        fonte_normal = obter_fonte("Arial", 24)
+    except Exception:
+        fonte_titulo = obter_fonte(None, 72)
+        fonte_normal = obter_fonte(None, 24)
+    tela = get_display_manager().get_game_surface()
+
+    if cabecalho.get('modo', 'fase') == 'minigame':
+        import importlib
+
+        modulo, funcao = MINIGAMES[cabecalho['minigame']]
+        executar = getattr(importlib.import_module(modulo), funcao)
+        gradiente = criar_gradiente((10, 0, 30), (0, 10, 40))
+        customizacao = dict(cabecalho.get('customizacao', {}))
+        if 'cor' in customizacao:
+            customizacao['cor'] = tuple(customizacao['cor'])
+        nome = cabecalho.get('nome_jogador', 'Jogador')
+
+        def jogar(relogio):
+            return executar(tela, relogio, gradiente, fonte_titulo, fonte_normal,
+                            None, nome, customizacao)
+        return jogar
+
+    from src.game.fase import jogar_fase
+
+    numero_fase = cabecalho['fase']
+    if numero_fase >= 26:
+        gradiente = criar_gradiente((0, 40, 90), (0, 70, 130))
+    elif numero_fase >= 11:
+        gradiente = criar_gradiente((0, 30, 10), (10, 60, 20))
+    else:
+        gradiente = criar_gradiente((10, 0, 30), (0, 10, 40))
+
+    def jogar(relogio):
+        return jogar_fase(tela, relogio, numero_fase, gradiente,
+                          fonte_titulo, fonte_normal, gravar=False)
+    return jogar
+
+
+def _semear(seed: int):
+    """
+    Semeia o rng_jogo, que decide a partida, e o random global, só para os
+    efeitos visuais saírem iguais (a partida não depende dele).
+    """
+    semear_jogo(seed)
+    random.seed(seed)
+
+
+def _normalizar(valor: Any) -> Any:
+    """Mesma forma que o valor tem depois de ir e voltar do JSON do arquivo."""
+    return json.loads(json.dumps(valor, default=str))
+
+
+def reproduzir_entradas(replay: Replay, velocidade: Optional[float] = None) -> Dict:
+    """
+    Joga a partida de novo com as entradas gravadas (display já inicializado).
+    A partida lê os saves do replay de uma pasta temporária.
+
+    Returns:
+        Resumo: resultado, frames, tempos (total e de cada frame) e se
+        confere com a gravação
+    """
+    cabecalho = replay.cabecalho
+    jogar = preparar_partida(cabecalho)
+
+    reprodutor = ReprodutorEntradas(replay, velocidade)
+    with usar_saves(cabecalho.get('saves', {})):
+        _semear(cabecalho['seed'])
+        reprodutor.instalar()
+        inicio = time.perf_counter()
+        try:
+            resultado = _normalizar(jogar(reprodutor.relogio))
+        finally:
+            tempo_real = time.perf_counter() - inicio
+            reprodutor.remover()
+
+    fim = replay.fim or {}
+    confere = not reprodutor.esgotado and (
+        not fim or (fim.get('resultado') == resultado and fim.get('frames') == reprodutor.frames)
+    )
+    tempo_jogo = (reprodutor.tempo - cabecalho.get('tempo_inicial', 0)) / 1000.0
+    return {
+        'resultado': resultado,
+        'resultado_gravado': fim.get('resultado'),
+        'frames': reprodutor.frames,
+        'frames_gravados': fim.get('frames'),
+        'tempo_jogo_s': tempo_jogo,
+        'tempo_real_s': tempo_real,
+        'ms_por_frame': tempo_real * 1000.0 / max(1, reprodutor.frames),
+        'duracoes_ms': reprodutor.relogio.duracoes,
+        'confere': confere,
+    }
+
+
+# ==================== SIMULAÇÃO (SERVIDOR) ====================
+
+class SimulacaoGravada:
+    """
+    Envolve uma SimulacaoBomba e grava as chamadas que mudam o estado dela
+    (mover_jogador também: a habilidade de classe muda quem os tiros e os
+    bots enxergam); o resto (estado, bots, tiros...) é repassado direto.
+    """
+
+    def __init__(self, simulacao, caminho: str, cabecalho: Dict):
+        """
+        Args:
+            simulacao: SimulacaoBomba recém-criada
+            caminho: Arquivo do replay
+            cabecalho: Seed, mapa e modo (o seed tem que ser o da simulação)
+        """
+        self.simulacao = simulacao
+        self.arquivo = ArquivoReplay(caminho, TIPO_SIMULACAO, cabecalho)
+
+    def __getattr__(self, nome):
+        return getattr(self.simulacao, nome)
+
+    def iniciar(self, times: Dict[int, Tuple[str, str, Optional[str]]]):
+        self.arquivo.registrar(REG_INICIAR, json.dumps(
+            {str(pid): list(dados) for pid, dados in times.items()}, ensure_ascii=False
+        ).encode('utf-8'))
+        self.simulacao.iniciar(times)
+
+    def remover_jogador(self, player_id: int):
+        self.arquivo.registrar(REG_REMOVER, _Escrita().int(player_id).bytes())
+        self.simulacao.remover_jogador(player_id)
+
+    def mover_jogador(self, player_id: int, x: float, y: float, keys: Dict[str, bool]):
+        teclas = ''.join(sorted(f"{k}," for k, v in keys.items() if v))
+        self.arquivo.registrar(REG_MOVER, _Escrita().int(player_id).float(x).float(y)
+                               .texto(teclas).bytes())
+        return self.simulacao.mover_jogador(player_id, x, y, keys)
+
+    def sincronizar_jogador(self, player_id: int, x: float, y: float, vidas: int, usando: bool):
+        self.arquivo.registrar(REG_SINCRONIZAR, _Escrita().int(player_id).float(x).float(y)
+                               .int(vidas).int(int(usando)).bytes())
+        self.simulacao.sincronizar_jogador(player_id, x, y, vidas, usando)
+
+    def dano_bot(self, bot_id: int, dano: int, time_atirador: Optional[str]) -> Optional[int]:
+        self.arquivo.registrar(REG_DANO_BOT, _Escrita().int(bot_id).int(dano)
+                               .texto(time_atirador or '').bytes())
+        return self.simulacao.dano_bot(bot_id, dano, time_atirador)
+
+    def passo(self, dt: float) -> List[Dict]:
+        self.arquivo.registrar(REG_PASSO, _Escrita().float(dt).bytes())
+        return self.simulacao.passo(dt)
+
+    def fechar(self):
+        """Fecha o replay com o estado final (conferido na reprodução)."""
+        self.arquivo.fechar({'estado': self.simulacao.estado(), 'tempo': self.simulacao.tempo})
+
+
+def reproduzir_simulacao(replay: Replay, velocidade: Optional[float] = None) -> Dict:
+    """
+    Roda de novo a SimulacaoBomba com as chamadas gravadas.
+
+    Returns:
+        Resumo: placar, passos, custo de cada passo e se o estado final confere
+    """
+    from src.game.simulacao_bomba import SimulacaoBomba, JOGADORES_POR_TIME
+    from src.utils.tilemap import TileMap
+
+    cabecalho = replay.cabecalho
+    simulacao = SimulacaoBomba(TileMap(cabecalho['mapa'], carregar_imagens=False), cabecalho['seed'],
+                               cabecalho.get('jogadores_por_time', JOGADORES_POR_TIME))
+
+    ritmo = _Ritmo(velocidade)
+    passos = 0
+    tempo_jogo = 0.0
+    duracoes: List[float] = []
+    rounds = []
+    inicio = time.perf_counter()
+
+    for tag, dados in replay.registros:
+        leitura = _Leitura(dados)
+        if tag == REG_PASSO:
+            dt = leitura.float()
+            t0 = time.perf_counter()
+            simulacao.passo(dt)
+            duracoes.append((time.perf_counter() - t0) * 1000.0)
+            passos += 1
+            tempo_jogo += dt
+            if simulacao.round_terminado and (not rounds or rounds[-1][0] != simulacao.round_atual):
+                rounds.append((simulacao.round_atual, simulacao.time_vencedor,
+                               (simulacao.tempo - simulacao.inicio_round) / 1000.0))
+            ritmo.esperar(tempo_jogo)
+        elif tag == REG_SINCRONIZAR:
+            simulacao.sincronizar_jogador(leitura.int(), leitura.float(), leitura.float(),
+                                          leitura.int(), bool(leitura.int()))
+        elif tag == REG_MOVER:
+            player_id, x, y = leitura.int(), leitura.float(), leitura.float()
+            teclas = {k: True for k in leitura.texto().split(',') if k}
+            simulacao.mover_jogador(player_id, x, y, teclas)
+        elif tag == REG_DANO_BOT:
+            simulacao.dano_bot(leitura.int(), leitura.int(), leitura.texto() or None)
+        elif tag == REG_REMOVER:
+            simulacao.remover_jogador(leitura.int())
+        elif tag == REG_INICIAR:
+            times = json.loads(dados.decode('utf-8'))
+            simulacao.iniciar({int(pid): tuple(v) for pid, v in times.items()})
+
+    estado = json.loads(json.dumps(simulacao.estado()))
+    fim = replay.fim or {}
+    return {
+        'placar': estado['placar'],
+        'rounds': rounds,
+        'passos': passos,
+        'tempo_jogo_s': tempo_jogo,
+        'tempo_real_s': time.perf_counter() - inicio,
+        'ms_por_passo': sum(duracoes) / max(1, passos),
+        'duracoes_ms': duracoes,
+        'confere': not fim or fim.get('estado') == estado,
+    }
+
+
+# ==================== SNAPSHOTS (SERVIDOR) ====================
+
+class GravadorSnapshots:
+    """
+    Grava, a cada tick do servidor, os jogadores e as ações repassadas. O
+    registro final traz quantos snapshots foram gravados, o CRC32 deles e o
+    último estado dos jogadores, que a reprodução confere.
+    """
+
+    def __init__(self, caminho: str, cabecalho: Dict):
+        self.arquivo = ArquivoReplay(caminho, TIPO_SNAPSHOTS, cabecalho)
+        self.inicio = time.time()
+        self.acoes: List = []
+        self.lock = threading.Lock()
+        self.snapshots = 0
+        self.crc = 0
+        self.ultimo = b''  # JSON do último snapshot
+
+    def acao(self, player_id: int, acao: Dict):
+        """Guarda uma ação de minigame repassada (vai no próximo snapshot)."""
+        with self.lock:
+            self.acoes.append([player_id, acao])
+
+    def registrar(self, jogadores: List[Dict]):
+        """
+        Grava o snapshot do tick.
+
+        Args:
+            jogadores: Estado de cada jogador (id, x, y, health, alive)
+        """
+        with self.lock:
+            acoes, self.acoes = self.acoes, []
+            dados = json.dumps({'jogadores': jogadores, 'acoes': acoes},
+                               separators=(',', ':'), ensure_ascii=False).encode('utf-8')
+            escrita = _Escrita().int(int((time.time() - self.inicio) * 1000))
+            self.arquivo.registrar(REG_SNAPSHOT, escrita.bytes() + dados)
+            self.snapshots += 1
+            self.crc = zlib.crc32(dados, self.crc)
+            self.ultimo = dados
+
+    def fechar(self):
+        with self.lock:
+            self.arquivo.fechar({
+                'duracao_ms': int((time.time() - self.inicio) * 1000),
+                'snapshots': self.snapshots,
+                'crc': self.crc,
+                'jogadores': json.loads(self.ultimo)['jogadores'] if self.ultimo else [],
+            })
+
+
+def reproduzir_snapshots(replay: Replay, velocidade: Optional[float] = None) -> Dict:
+    """
+    Percorre os snapshots e soma, por jogador, dano recebido, mortes,
+    distância percorrida e ações.
+
+    Returns:
+        Resumo da partida; 'confere' diz se a quantidade de snapshots, o
+        CRC32 deles e o último estado dos jogadores batem com o registro final
+    """
+    ritmo = _Ritmo(velocidade)
+    jogadores: Dict[int, Dict] = {}
+    anteriores: Dict[int, Dict] = {}
+    ultimo: List[Dict] = []
+    acoes = Counter()
+    snapshots = 0
+    crc = 0
+    tempo_ms = 0
+    inicio = time.perf_counter()
+
+    for tag, dados in replay.registros:
+        if tag != REG_SNAPSHOT:
+            continue
+        leitura = _Leitura(dados)
+        tempo_ms = leitura.int()
+        corpo = dados[leitura.pos:]
+        snapshot = json.loads(corpo.decode('utf-8'))
+        snapshots += 1
+        crc = zlib.crc32(corpo, crc)
+        ultimo = snapshot['jogadores']
+
+        for atual in snapshot['jogadores']:
+            pid = atual['id']
+            resumo = jogadores.setdefault(pid, {'dano': 0, 'mortes': 0, 'distancia': 0.0, 'acoes': 0})
+            anterior = anteriores.get(pid)
+            if anterior is not None:
+                resumo['dano'] += max(0, anterior['health'] - atual['health'])
+                if anterior['alive'] and not atual['alive']:
+                    resumo['mortes'] += 1
+                resumo['distancia'] += ((atual['x'] - anterior['x']) ** 2 +
+                                        (atual['y'] - anterior['y']) ** 2) ** 0.5
+            anteriores[pid] = atual
+
+        for pid, acao in snapshot['acoes']:
+            acoes[acao.get('action', '?')] += 1
+            if pid in jogadores:
+                jogadores[pid]['acoes'] += 1
+
+        ritmo.esperar(tempo_ms / 1000.0)
+
+    fim = replay.fim or {}
+    confere = not fim or (fim.get('snapshots') == snapshots and fim.get('crc') == crc
+                          and fim.get('jogadores') == ultimo)
+    return {
+        'snapshots': snapshots,
+        'snapshots_gravados': fim.get('snapshots'),
+        'tempo_jogo_s': tempo_ms / 1000.0,
+        'tempo_real_s': time.perf_counter() - inicio,
+        'jogadores': jogadores,
+        'acoes': dict(acoes),
+        'confere': confere,
+    }
+
+
+# ==================== REPRODUÇÃO SEM JANELA ====================
+
+def iniciar_sem_janela():
+    """Inicializa pygame com display e áudio dummy (antes de qualquer janela)."""
+    from src.utils.display_manager import initialize_game_display
+
+    os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+    os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+    pygame.init()
+    try:
+        pygame.mixer.init()
+    except pygame.error:
+        pass
+    # Sempre o caminho surface: o driver dummy não apresenta nada e os
+    # benchmarks comparam com baselines gravadas nele
+    initialize_game_display(backend="surface")
+
+
+def reproduzir(replay: Replay, velocidade: Optional[float] = None) -> Dict:
+    """Reproduz qualquer tipo de replay (entradas precisam de iniciar_sem_janela antes)."""
+    if replay.tipo == TIPO_ENTRADAS:
+        return reproduzir_entradas(replay, velocidade)
+    if replay.tipo == TIPO_SIMULACAO:
+        return reproduzir_simulacao(replay, velocidade)
+    if replay.tipo == TIPO_SNAPSHOTS:
+        return reproduzir_snapshots(replay, velocidade)
+    raise ValueError(f"tipo de replay desconhecido: {replay.tipo}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Reproduz um replay sem janela, mais rápido que o tempo real")
+    parser.add_argument('arquivo', help="Arquivo .ssr")
+    parser.add_argument('--velocidade', type=float, default=None,
+                        help="Vezes o tempo real (padrão: sem limite)")
+    parser.add_argument('--info', action='store_true', help="Só mostrar o cabeçalho")
+    args = parser.parse_args()
+
+    try:
+        replay = ler_replay(args.arquivo)
+    except (OSError, ValueError) as e:
+        print(f"❌ {e}")
+        sys.exit(2)
+
+    cabecalho = {k: v for k, v in replay.cabecalho.items() if k != 'saves'}
+    print(f"🎞️ {args.arquivo}: replay de {NOMES_TIPOS.get(replay.tipo, replay.tipo)}, "
+          f"{replay.tamanho // 1024} KB, {len(replay.registros)} registros")
+    print(f"   {json.dumps(cabecalho, ensure_ascii=False)}")
+    if replay.fim is None:
+        print("⚠️ Replay sem registro final (gravação interrompida): nada para conferir")
+    if args.info:
+        return
+
+    if replay.tipo == TIPO_ENTRADAS:
+        iniciar_sem_janela()
+    resumo = reproduzir(replay, args.velocidade)
+
+    for chave, valor in resumo.items():
+        if chave == 'duracoes_ms':
+            continue
+        if isinstance(valor, float):
+            valor = f"{valor:.3f}"
+        print(f"   {chave}: {valor}")
+    tempo_real = resumo.get('tempo_real_s') or 0.0
+    if tempo_real > 0:
+        print(f"⏩ {resumo['tempo_jogo_s'] / tempo_real:.1f}x o tempo real")
+    if resumo['confere']:
+        print("✅ Reprodução confere com a gravação")
+    else:
+        print("❌ Reprodução divergiu da gravação")
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
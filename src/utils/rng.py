@@ -0,0 +1,42 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Gerador aleatório da jogabilidade.
+
+Tudo que muda o rumo da partida (spawn, IA e ataques dos inimigos e
+bosses, dispersão dos tiros, drops, moedas, sorteios dos minigames) sorteia
+em rng_jogo; efeitos só visuais (partículas, rastros, estrelas, tremor de
+tela) continuam no random global:
+
+    from src.utils.rng import rng_jogo
+    if rng_jogo.random() < 0.3:
+        inimigo.atirar(...)
+
+O replay grava o seed do rng_jogo e o aplica na reprodução, então um efeito
+visual que passe a sortear mais ou menos vezes não muda a partida nem
+invalida replays gravados e baselines dos benchmarks.
+"""
+
+import random
+
+# Gerador da partida atual (semeado por semear_jogo no início de replays e
+# minigames sincronizados; fora deles segue com o seed do sistema)
+rng_jogo = random.Random()
+
+
+def semear_jogo(seed: int):
+    """Reinicia o gerador da jogabilidade com um seed."""
+    rng_jogo.seed(seed)
+
+
+def novo_id_entidade() -> int:
+    """
+    Id de uma entidade com IA (quadrados, bosses).
+
+    A IA usa o id para variar o comportamento de cada inimigo; ele era o
+    id(self), um endereço de memória que muda a cada execução. Sorteado no
+    rng_jogo, o id se repete quando o replay reproduz a partida com o mesmo
+    seed.
+    """
+    return rng_jogo.getrandbits(32)
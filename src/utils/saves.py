@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Pasta dos saves do jogador (upgrades, inventário, moedas, progresso...).
+
+Todo acesso aos arquivos de save passa por caminho_dados, para que a
+reprodução de replays e os benchmarks possam apontar o jogo para uma pasta
+temporária sem tocar nos saves reais (se o processo cair no meio, os saves
+do jogador continuam intactos):
+
+    with pasta_dados_temporaria({'upgrades.json': '{"vida": 20}'}):
+        jogar(...)
+"""
+
+import os
+import shutil
+import tempfile
+from contextlib import contextmanager
+from typing import Dict
+
+from src.config import PASTA_DADOS
+
+# Pasta em uso (PASTA_DADOS, ou a temporária de um replay/benchmark)
+_pasta_atual = PASTA_DADOS
+
+
+def pasta_dados() -> str:
+    """Pasta onde os saves são lidos e escritos agora."""
+    return _pasta_atual
+
+
+def caminho_dados(nome: str) -> str:
+    """
+    Caminho de um arquivo de save.
+
+    Args:
+        nome: Nome do arquivo dentro da pasta de dados ('upgrades.json')
+    """
+    return os.path.join(_pasta_atual, nome)
+
+
+def ler_dados(nomes) -> Dict[str, str]:
+    """
+    Conteúdo dos saves que existem na pasta atual.
+
+    Args:
+        nomes: Nomes dos arquivos a ler
+
+    Returns:
+        {nome: conteúdo} (arquivos ausentes ficam de fora)
+    """
+    conteudos = {}
+    for nome in nomes:
+        caminho = caminho_dados(nome)
+        if os.path.exists(caminho):
+            with open(caminho, 'r', encoding='utf-8') as f:
+                conteudos[nome] = f.read()
+    return conteudos
+
+
+@contextmanager
+def pasta_dados_temporaria(conteudos: Dict[str, str]):
+    """
+    Troca a pasta de dados por uma temporária com os arquivos dados e
+    apaga essa pasta ao sair (os saves reais não são abertos).
+
+    Args:
+        conteudos: {nome do arquivo: conteúdo}; os outros saves não existem
+    """
+    global _pasta_atual
+    anterior = _pasta_atual
+    pasta = tempfile.mkdtemp(prefix='squarestorm_dados_')
+    try:
+        for nome, conteudo in conteudos.items():
+            with open(os.path.join(pasta, nome), 'w', encoding='utf-8') as f:
+                f.write(conteudo)
+        _pasta_atual = pasta
+        yield pasta
+    finally:
+        _pasta_atual = anterior
+        shutil.rmtree(pasta, ignore_errors=True)
@@ -0,0 +1,256 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Cache de sprites das entidades desenhadas com primitivas.
+
+Cada quadrado do jogo (jogador, inimigos, bots, atores das cutscenes) era
+montado a cada frame com 4 pygame.draw.rect (sombra, interior escuro,
+corpo, brilho), e os bosses com 8 a 12 primitivas mais uma superfície de
+sombra nova por frame. O visual só depende de poucas coisas (tamanho,
+passo da pulsação, cores, estado de dano), então a composição é feita uma
+vez por combinação e depois só copiada:
+
+    sprite = sprite_quadrado(tamanho, mod_tamanho, cor_uso, cor_escura, cor_brilhante)
+    tela.blit(sprite, (x, y))
+
+    sprite = cache_sprites.obter(('boss', tamanho, cor), lambda: montar(...))
+
+Projéteis e sabres fingiam brilho com vários círculos concêntricos; o
+sprite_brilho é um gradiente radial de verdade, somado à tela com
+BLEND_ADD (fundo preto = não muda nada), e vários sprites vão para a
+tela numa chamada só com Surface.blits:
+
+    lote = [(disco(3, cor), (x - 3, y - 3)), ...]
+    lote_brilho = [(sprite_brilho(12, cor), (x - 12, y - 12), None, pygame.BLEND_ADD), ...]
+    tela.blits(lote_brilho, doreturn=False)
+
+As superfícies do cache são compartilhadas: não desenhar nelas nem mudar
+o alpha depois de criadas.
+"""
+
+from collections import OrderedDict
+from typing import Callable, Dict, Hashable
+
+import pygame
+
+# Limites do cache (o sprite usado há mais tempo sai primeiro). Um
+# quadrado pulsando gera 6 sprites por cor; o limite de pixels segura os
+# sprites grandes dos bosses (auras, fases com tamanho maior)
+MAX_SPRITES_CACHE = 1024
+MAX_PIXELS_SPRITES = 4_000_000
+
+COR_SOMBRA_QUADRADO = (20, 20, 20)
+# Os brilhos têm cor quantizada (cores que variam a cada frame, como o
+# arco de carregamento dos bosses, não enchem o cache)
+QUANTIZACAO_COR_BRILHO = 8
+
+
+class CacheSprites:
+    """Cache LRU de superfícies pré-compostas com contadores de acerto."""
+
+    def __init__(self, maximo: int = MAX_SPRITES_CACHE, maximo_pixels: int = MAX_PIXELS_SPRITES):
+        self.maximo = maximo
+        self.maximo_pixels = maximo_pixels
+        self._superficies: 'OrderedDict[Hashable, pygame.Surface]' = OrderedDict()
+        self.pixels = 0
+        self.acertos = 0
+        self.falhas = 0
+
+    def obter(self, chave: Hashable, criar: Callable[[], pygame.Surface]) -> pygame.Surface:
+        """
+        Devolve o sprite da chave (chamando criar() só se não estiver no cache).
+
+        Args:
+            chave: Tupla com tudo de que o desenho depende (tipo, tamanho, cores, estado)
+            criar: Função sem argumentos que monta a superfície
+
+        Returns:
+            Superfície compartilhada (não alterar)
+        """
+        superficie = self._superficies.get(chave)
+        if superficie is not None:
+            self.acertos += 1
+            self._superficies.move_to_end(chave)
+            return superficie
+
+        self.falhas += 1
+        superficie = criar()
+        self._superficies[chave] = superficie
+        self.pixels += superficie.get_width() * superficie.get_height()
+        while len(self._superficies) > 1 and (len(self._superficies) > self.maximo
+                                              or self.pixels > self.maximo_pixels):
+            _, antiga = self._superficies.popitem(last=False)
+            self.pixels -= antiga.get_width() * antiga.get_height()
+        return superficie
+
+    def limpar(self):
+        """Descarta os sprites e zera os contadores."""
+        self._superficies.clear()
+        self.pixels = 0
+        self.acertos = 0
+        self.falhas = 0
+
+    def estatisticas(self) -> Dict:
+        """
+        Returns:
+            {'acertos', 'falhas', 'taxa' (0-1), 'sprites', 'pixels'}
+        """
+        total = self.acertos + self.falhas
+        return {
+            'acertos': self.acertos,
+            'falhas': self.falhas,
+            'taxa': self.acertos / total if total else 0.0,
+            'sprites': len(self._superficies),
+            'pixels': self.pixels,
+        }
+
+
+# Cache do processo (só o loop de jogo desenha)
+cache_sprites = CacheSprites()
+
+
+def _cor(cor) -> tuple:
+    """Cores chegam como lista do JSON da rede; a chave precisa de tupla."""
+    return cor if type(cor) is tuple else tuple(cor)
+
+
+def _montar_quadrado(tamanho, mod_tamanho, cor, cor_escura, cor_brilhante, compacto) -> pygame.Surface:
+    """Desenha o quadrado com origem em (0, 0), na ordem do Quadrado.desenhar."""
+    if compacto:
+        # Escala do multiplayer: sombra, bordas e brilho menores
+        sombra, raio_interior, margem, raio_corpo, brilho, lado_brilho, raio_brilho = 2, 3, 1, 2, 2, 3, 1
+        raio_sombra = 2
+    else:
+        sombra, raio_interior, margem, raio_corpo, brilho, lado_brilho, raio_brilho = 4, 5, 3, 3, 5, 8, 2
+        raio_sombra = 3
+
+    lado = int(tamanho) + max(sombra, mod_tamanho) + 1
+    superficie = pygame.Surface((lado, lado), pygame.SRCALPHA)
+    pygame.draw.rect(superficie, COR_SOMBRA_QUADRADO,
+                     (sombra, sombra, tamanho, tamanho), 0, raio_sombra)
+    pygame.draw.rect(superficie, cor_escura,
+                     (0, 0, tamanho + mod_tamanho, tamanho + mod_tamanho), 0, raio_interior)
+    pygame.draw.rect(superficie, cor,
+                     (margem, margem, tamanho + mod_tamanho - 2 * margem, tamanho + mod_tamanho - 2 * margem),
+                     0, raio_corpo)
+    pygame.draw.rect(superficie, cor_brilhante,
+                     (brilho, brilho, lado_brilho, lado_brilho), 0, raio_brilho)
+    return superficie
+
+
+def sprite_quadrado(tamanho, mod_tamanho: int, cor, cor_escura=None, cor_brilhante=None,
+                    compacto: bool = False) -> pygame.Surface:
+    """
+    Sprite do quadrado estilizado (sombra, interior escuro, corpo e brilho).
+
+    Args:
+        tamanho: Lado do quadrado (pode ser float, como no Quadrado)
+        mod_tamanho: Passo da pulsação em pixels
+        cor: Cor do corpo (a cor da entidade, ou BRANCO no efeito de dano)
+        cor_escura: Cor do interior; None = cor - 50 (o _gerar_cor_escura)
+        cor_brilhante: Cor do brilho; None = cor + 70 (o _gerar_cor_brilhante)
+        compacto: Proporções do multiplayer (sombra de 2 px, brilho 3x3)
+
+    Returns:
+        Superfície compartilhada para copiar em (x, y) da entidade
+    """
+    cor = _cor(cor)
+    if cor_escura is not None:
+        cor_escura = _cor(cor_escura)
+    if cor_brilhante is not None:
+        cor_brilhante = _cor(cor_brilhante)
+    chave = ('quadrado', tamanho, mod_tamanho, cor, cor_escura, cor_brilhante, compacto)
+
+    def criar():
+        escura = cor_escura if cor_escura is not None else tuple(max(0, c - 50) for c in cor)
+        brilhante = cor_brilhante if cor_brilhante is not None else tuple(min(255, c + 70) for c in cor)
+        return _montar_quadrado(tamanho, mod_tamanho, cor, escura, brilhante, compacto)
+
+    return cache_sprites.obter(chave, criar)
+
+
+def sombra_retangular(largura: int, altura: int, alpha: int) -> pygame.Surface:
+    """
+    Retângulo preto translúcido (sombra dos bosses), com o alpha já aplicado.
+
+    Returns:
+        Superfície compartilhada para copiar na posição da sombra
+    """
+    def criar():
+        superficie = pygame.Surface((largura, altura))
+        superficie.set_alpha(alpha)
+        superficie.fill((0, 0, 0))
+        return superficie
+
+    return cache_sprites.obter(('sombra', largura, altura, alpha), criar)
+
+
+def aura_circular(raio: int, alpha: int, cor) -> pygame.Surface:
+    """
+    Anel de 2 px numa superfície (raio * 2) com o alpha já aplicado (auras dos bosses).
+
+    Returns:
+        Superfície compartilhada para copiar com o centro em (raio, raio)
+    """
+    cor = _cor(cor)
+
+    def criar():
+        superficie = pygame.Surface((raio * 2, raio * 2))
+        superficie.set_alpha(alpha)
+        pygame.draw.circle(superficie, cor, (raio, raio), raio, 2)
+        return superficie
+
+    return cache_sprites.obter(('aura', raio, alpha, cor), criar)
+
+
+def disco(raio: int, cor, espessura: int = 0) -> pygame.Surface:
+    """
+    Círculo (ou anel, com espessura) idêntico ao pygame.draw.circle.
+
+    Returns:
+        Superfície compartilhada para copiar em (x - raio, y - raio)
+    """
+    cor = _cor(cor)
+
+    def criar():
+        superficie = pygame.Surface((2 * raio, 2 * raio), pygame.SRCALPHA)
+        pygame.draw.circle(superficie, cor, (raio, raio), raio, espessura)
+        return superficie
+
+    return cache_sprites.obter(('disco', raio, cor, espessura), criar)
+
+
+def quantizar_cor(cor) -> tuple:
+    """Arredonda a cor para múltiplos de QUANTIZACAO_COR_BRILHO."""
+    passo = QUANTIZACAO_COR_BRILHO
+    return tuple(min(255, int(c + passo / 2) // passo * passo) for c in cor)
+
+
+def sprite_brilho(raio: int, cor, intensidade: float = 1.0) -> pygame.Surface:
+    """
+    Brilho radial (cor no centro até preto na borda) para somar com BLEND_ADD.
+
+    Args:
+        raio: Raio do brilho em pixels
+        cor: Cor no centro (quantizada)
+        intensidade: Fração da cor no centro (0-1)
+
+    Returns:
+        Superfície compartilhada (sem alpha) para copiar em (x - raio, y - raio)
+        com special_flags=pygame.BLEND_ADD
+    """
+    raio = max(1, int(raio))
+    cor = quantizar_cor(cor)
+    intensidade = round(intensidade, 2)
+
+    def criar():
+        superficie = pygame.Surface((2 * raio, 2 * raio))
+        superficie.fill((0, 0, 0))
+        # Do anel de fora para dentro, a luz cai com o quadrado da distância
+        for r in range(raio, 0, -1):
+            fator = intensidade * (1.0 - r / (raio + 1)) ** 2
+            pygame.draw.circle(superficie, tuple(int(c * fator) for c in cor), (raio, raio), r)
+        return superficie
+
+    return cache_sprites.obter(('brilho', raio, cor, intensidade), criar)
@@ -8,8 +8,12 @@ Implementa colisões baseadas em tiles e renderização com tileset.
 
 import pygame
 import xml.etree.ElementTree as ET
+import math
 import os
 
+# Lado dos blocos pré-desenhados do mapa, em tiles (32 x 16px = 512px)
+TAMANHO_CHUNK = 32
+
 
 class TileMap:
     """
@@ -20,14 +24,17 @@ class TileMap:
     # Tiles que são considerados "chão" (onde pode andar)
     TILES_CHAO = [182, 114,96,97,98,99,100,419,416,216, 250, 284, 318, 216,708,709,710,711,712,188,187,120,150,184,83,85,82,86,728,732,726,322]  # 182, 114 e 322 são pisos caminháveis
 
-    def __init__(self, caminho_tmx):
+    def __init__(self, caminho_tmx, carregar_imagens=True):
         """
         Carrega um mapa TMX.
 
         Args:
             caminho_tmx: Caminho para o arquivo .tmx
+            carregar_imagens: Se False, carrega só tiles, colisões e objetos
+                              (servidor sem display: não há convert_alpha)
         """
         self.caminho = caminho_tmx
+        self.carregar_imagens = carregar_imagens
         self.diretorio = os.path.dirname(caminho_tmx)
         self.largura = 0  # Em tiles
         self.altura = 0   # Em tiles
@@ -39,6 +46,9 @@ class TileMap:
         # Tilesets (suporte a múltiplos)
         self.tilesets = []  # Lista de {'firstgid': int, 'imagem': Surface, 'colunas': int, 'linhas': int}
         self.tiles_cache = {}  # Cache de superfícies de tiles individuais
+        self._tiles_transformados = {}  # tile_id com flags de flip -> superfície
+        # Blocos do mapa já desenhados: (cx, cy, cor_fundo, cor_chao, cor_parede) -> Surface
+        self._chunks = {}
 
         # Objetos do mapa (spawn points, etc.)
         self.objetos = {}  # {nome: {'x': x, 'y': y, 'width': w, 'height': h}}
@@ -61,8 +71,8 @@ class TileMap:
             print(f"[TILEMAP] Mapa carregado: {self.largura}x{self.altura} tiles")
             print(f"[TILEMAP] Tamanho tile: {self.tile_largura}x{self.tile_altura}")
 
-            # Carregar todos os tilesets
-            for tileset in root.findall('tileset'):
+            # Carregar todos os tilesets (só para renderização)
+            for tileset in (root.findall('tileset') if self.carregar_imagens else []):
                 firstgid = int(tileset.get('firstgid', 1))
                 source = tileset.get('source')
 
@@ -146,7 +156,10 @@ class TileMap:
                     return
 
                 print(f"[TILEMAP] Carregando imagem: {image_path}")
-                tileset_imagem = pygame.image.load(image_path).convert_alpha()
+                tileset_imagem = pygame.image.load(image_path)
+                # Sem surface de display (backend renderer) não há formato para converter
+                if pygame.display.get_surface() is not None:
+                    tileset_imagem = tileset_imagem.convert_alpha()
                 print(f"[TILEMAP] Tileset carregado: {colunas} colunas, {linhas} linhas")
 
                 # Adicionar à lista de tilesets
@@ -182,7 +195,10 @@ class TileMap:
                     print(f"[TILEMAP] AVISO: Imagem não encontrada: {image_path}")
                     return
 
-                tileset_imagem = pygame.image.load(image_path).convert_alpha()
+                tileset_imagem = pygame.image.load(image_path)
+                # Sem surface de display (backend renderer) não há formato para converter
+                if pygame.display.get_surface() is not None:
+                    tileset_imagem = tileset_imagem.convert_alpha()
                 print(f"[TILEMAP] Tileset embutido carregado: {colunas}x{linhas}")
 
                 tileset_info = {
@@ -376,8 +392,11 @@ class TileMap:
 
         tile_surface = self.tiles_cache[tile_id_base]
 
-        # Aplicar transformações se necessário
+        # Aplicar transformações se necessário (uma vez por combinação)
         if flip_h or flip_v or flip_d:
+            transformado = self._tiles_transformados.get(tile_id)
+            if transformado is not None:
+                return transformado
             tile_surface = tile_surface.copy()
 
             if flip_d:
@@ -391,29 +410,83 @@ class TileMap:
             if flip_v:
                 tile_surface = pygame.transform.flip(tile_surface, False, True)
 
+            self._tiles_transformados[tile_id] = tile_surface
+
         return tile_surface
 
-    def desenhar_tiles(self, tela, camera_x=0, camera_y=0, cor_chao=None, cor_parede=None):
+    def desenhar_tiles(self, tela, camera_x=0, camera_y=0, cor_chao=None, cor_parede=None,
+                       cor_fundo=None):
         """
         Desenha o mapa de tiles usando o tileset carregado.
 
+        O mapa é desenhado em blocos de TAMANHO_CHUNK x TAMANHO_CHUNK tiles,
+        montados na primeira vez que aparecem: um frame copia poucos blocos
+        em vez de um blit por tile visível.
+
         Args:
             tela: Superfície do pygame
             camera_x: Offset X da câmera
             camera_y: Offset Y da câmera
             cor_chao: (Ignorado se tileset carregado) Cor para tiles vazios
             cor_parede: (Ignorado se tileset carregado) Cor para tiles sólidos
+            cor_fundo: Cor já pintada atrás do mapa; com ela os blocos são
+                       opacos (cópia mais barata). None = blocos transparentes
+                       onde não há tile
         """
-        # Calcular quais tiles estão visíveis
-        tile_inicio_x = max(0, int(camera_x // self.tile_largura))
-        tile_inicio_y = max(0, int(camera_y // self.tile_altura))
-        tile_fim_x = min(self.largura, int((camera_x + tela.get_width()) // self.tile_largura) + 2)
-        tile_fim_y = min(self.altura, int((camera_y + tela.get_height()) // self.tile_altura) + 2)
+        lado = TAMANHO_CHUNK * self.tile_largura
+        altura_chunk = TAMANHO_CHUNK * self.tile_altura
+
+        # Calcular quais blocos estão visíveis
+        chunk_inicio_x = max(0, int(camera_x // lado))
+        chunk_inicio_y = max(0, int(camera_y // altura_chunk))
+        chunk_fim_x = min((self.largura + TAMANHO_CHUNK - 1) // TAMANHO_CHUNK,
+                          int((camera_x + tela.get_width()) // lado) + 1)
+        chunk_fim_y = min((self.altura + TAMANHO_CHUNK - 1) // TAMANHO_CHUNK,
+                          int((camera_y + tela.get_height()) // altura_chunk) + 1)
+
+        # Câmera fracionária: o blit trunca a posição de cada tile visível
+        # (x * 16 - camera_x >= 0), o que equivale a subtrair ceil(camera_x)
+        deslocamento_x = math.ceil(camera_x)
+        deslocamento_y = math.ceil(camera_y)
+        for cy in range(chunk_inicio_y, chunk_fim_y):
+            for cx in range(chunk_inicio_x, chunk_fim_x):
+                chunk = self._obter_chunk(cx, cy, cor_fundo, cor_chao, cor_parede)
+                tela.blit(chunk, (cx * lado - deslocamento_x, cy * altura_chunk - deslocamento_y))
+
+    def _obter_chunk(self, cx, cy, cor_fundo, cor_chao, cor_parede):
+        """Devolve o bloco (cx, cy) do mapa, desenhando-o na primeira vez."""
+        chave = (cx, cy, cor_fundo, cor_chao, cor_parede)
+        chunk = self._chunks.get(chave)
+        if chunk is not None:
+            return chunk
+
+        tile_x0 = cx * TAMANHO_CHUNK
+        tile_y0 = cy * TAMANHO_CHUNK
+        tile_x1 = min(self.largura, tile_x0 + TAMANHO_CHUNK)
+        tile_y1 = min(self.altura, tile_y0 + TAMANHO_CHUNK)
+        tamanho = ((tile_x1 - tile_x0) * self.tile_largura, (tile_y1 - tile_y0) * self.tile_altura)
+
+        if cor_fundo is not None:
+            chunk = pygame.Surface(tamanho)
+            chunk.fill(cor_fundo)
+        else:
+            chunk = pygame.Surface(tamanho, pygame.SRCALPHA)
+        self._desenhar_area(chunk, tile_x0, tile_y0, tile_x1, tile_y1, cor_chao, cor_parede)
+        if pygame.display.get_surface() is not None:
+            chunk = chunk.convert() if cor_fundo is not None else chunk.convert_alpha()
+
+        self._chunks[chave] = chunk
+        return chunk
+
+    def _desenhar_area(self, superficie, tile_x0, tile_y0, tile_x1, tile_y1, cor_chao, cor_parede):
+        """Desenha os tiles de [tile_x0, tile_x1) x [tile_y0, tile_y1) com (tile_x0, tile_y0) na origem."""
+        origem_x = tile_x0 * self.tile_largura
+        origem_y = tile_y0 * self.tile_altura
 
         # Se temos tileset, usar texturas
         if self.tilesets and self.tiles_cache:
-            for y in range(tile_inicio_y, tile_fim_y):
-                for x in range(tile_inicio_x, tile_fim_x):
+            for y in range(tile_y0, tile_y1):
+                for x in range(tile_x0, tile_x1):
                     tile_id = self.get_tile(x, y)
 
                     if tile_id == 0:
@@ -422,28 +495,28 @@ class TileMap:
                     tile_surface = self._obter_tile_surface(tile_id)
 
                     if tile_surface:
-                        px = x * self.tile_largura - camera_x
-                        py = y * self.tile_altura - camera_y
-                        tela.blit(tile_surface, (px, py))
+                        px = x * self.tile_largura - origem_x
+                        py = y * self.tile_altura - origem_y
+                        superficie.blit(tile_surface, (px, py))
         else:
             # Fallback: desenhar com cores sólidas
             cor_chao = cor_chao or (40, 35, 50)
             cor_parede = cor_parede or (80, 60, 45)
 
-            for y in range(tile_inicio_y, tile_fim_y):
-                for x in range(tile_inicio_x, tile_fim_x):
+            for y in range(tile_y0, tile_y1):
+                for x in range(tile_x0, tile_x1):
                     tile_id = self.get_tile(x, y)
                     tile_id_base = tile_id & 0x1FFFFFFF
 
-                    px = x * self.tile_largura - camera_x
-                    py = y * self.tile_altura - camera_y
+                    px = x * self.tile_largura - origem_x
+                    py = y * self.tile_altura - origem_y
 
                     if self._is_tile_walkable(tile_id_base):
                         cor = cor_chao
                     else:
                         cor = cor_parede
 
-                    pygame.draw.rect(tela, cor, (px, py, self.tile_largura, self.tile_altura))
+                    pygame.draw.rect(superficie, cor, (px, py, self.tile_largura, self.tile_altura))
 
     def desenhar_debug(self, tela, camera_x=0, camera_y=0):
         """
@@ -10,6 +10,7 @@ import random
 from src.config import LARGURA, ALTURA, BRANCO, AMARELO, VERMELHO
 from src.config import LARGURA_JOGO, ALTURA_JOGO
 from src.utils.display_manager import convert_mouse_position
+from src.utils.fonts import obter_fonte, renderizar_texto, DESLOCAMENTO_SOMBRA
 def criar_gradiente(cor1, cor2, largura=None, altura=None):
     """
     Cria uma superfície com um gradiente vertical.
@@ -94,6 +95,26 @@ def desenhar_estrelas(tela, estrelas):
         if estrela[0] < 0:
             estrela[0] = LARGURA
             estrela[1] = random.randint(0, ALTURA_JOGO)
+
+def rects_estrelas(estrelas):
+    """
+    Regiões que o próximo desenhar_estrelas vai pintar (camada de estrelas
+    das telas retidas, src/ui/retained_ui.py).
+
+    Args:
+        estrelas: Lista de estrelas
+
+    Returns:
+        Lista de pygame.Rect, uma por estrela visível
+    """
+    rects = []
+    for estrela in estrelas:
+        raio = int(estrela[2])
+        if raio > 0 and estrela[1] < ALTURA_JOGO:
+            rects.append(pygame.Rect(int(estrela[0]) - raio, int(estrela[1]) - raio,
+                                     2 * raio + 1, 2 * raio + 1))
+    return rects
+
 def desenhar_texto(tela, texto, tamanho, cor, x, y, fonte=None, sombra=True):
     """
     Desenha texto na tela, opcionalmente com uma sombra.
@@ -114,20 +135,17 @@ def desenhar_texto(tela, texto, tamanho, cor, x, y, fonte=None, sombra=True):
     tamanho_ajustado = int(tamanho * (ALTURA / 848))
     
     if fonte is None:
-        fonte = pygame.font.SysFont("Arial", tamanho_ajustado, True)
+        fonte = obter_fonte("Arial", tamanho_ajustado, True)
     
+    # Texto e sombra vêm juntos do cache (a sombra fica DESLOCAMENTO_SOMBRA abaixo/à direita)
+    superficie = renderizar_texto(texto, fonte, cor, sombra=(30, 30, 30) if sombra else None)
+    largura, altura = superficie.get_size()
     if sombra:
-        # Desenhar sombra do texto
-        superficie_sombra = fonte.render(texto, True, (30, 30, 30))
-        rect_sombra = superficie_sombra.get_rect()
-        rect_sombra.center = (x + 2, y + 2)
-        tela.blit(superficie_sombra, rect_sombra)
-    
-    # Desenhar texto principal
-    superficie = fonte.render(texto, True, cor)
-    rect = superficie.get_rect()
+        largura -= DESLOCAMENTO_SOMBRA
+        altura -= DESLOCAMENTO_SOMBRA
+    rect = pygame.Rect(0, 0, largura, altura)
     rect.center = (x, y)
-    tela.blit(superficie, rect)
+    tela.blit(superficie, rect.topleft)
     
     return rect
 
@@ -158,8 +176,8 @@ def criar_botao(tela, texto, x, y, largura, altura, cor_normal, cor_hover, cor_t
     
     # Renderizar o texto do botão
     tamanho_fonte = int(28 * escala_y)
-    fonte = pygame.font.SysFont("Arial", tamanho_fonte, True)
-    texto_surf = fonte.render(texto, True, cor_texto)
+    fonte = obter_fonte("Arial", tamanho_fonte, True)
+    texto_surf = renderizar_texto(texto, fonte, cor_texto)
     texto_rect = texto_surf.get_rect(center=rect.center)
     tela.blit(texto_surf, texto_rect)
     
@@ -347,6 +365,7 @@ def criar_texto_flutuante(texto, x, y, cor, particulas, duracao=60, tamanho_font
             self.vida_maxima = duracao
             self.tamanho_fonte = tamanho_fonte
             self.velocidade_y = -0.7  # Velocidade para cima
+            self.superficie = None  # Renderizada no primeiro desenho (o alpha muda a cada frame)
             
         def atualizar(self):
             self.y += self.velocidade_y
@@ -357,9 +376,11 @@ def criar_texto_flutuante(texto, x, y, cor, particulas, duracao=60, tamanho_font
             # Calcular opacidade com base no tempo de vida restante
             alpha = int(255 * (self.vida / self.vida_maxima))
             
-            # Criar fonte e renderizar texto
-            fonte = pygame.font.SysFont("Arial", self.tamanho_fonte, True)
-            texto_surf = fonte.render(self.texto, True, self.cor)
+            # Renderizar o texto uma vez só; depois só o alpha muda
+            if self.superficie is None:
+                fonte = obter_fonte("Arial", self.tamanho_fonte, True)
+                self.superficie = fonte.render(self.texto, True, self.cor)
+            texto_surf = self.superficie
             texto_surf.set_alpha(alpha)
             
             # Posicionar texto centralizado
@@ -374,6 +395,36 @@ def criar_texto_flutuante(texto, x, y, cor, particulas, duracao=60, tamanho_font
     particulas.append(texto_flutuante)
 
 
+# Overlays de cor da tela inteira: uma superfície opaca por (tamanho, cor),
+# reaproveitada; só o alpha da superfície muda entre os frames
+_overlays = {}
+
+
+def desenhar_overlay_cor(tela, cor, alpha, tamanho=(LARGURA, ALTURA_JOGO)):
+    """
+    Cobre a tela com uma cor translúcida (flash, escurecer, fade).
+
+    Args:
+        tela: Superfície onde desenhar
+        cor: Cor RGB do overlay
+        alpha: Opacidade de 0 a 255 (0 não desenha nada)
+        tamanho: Área coberta a partir de (0, 0)
+    """
+    alpha = min(255, int(alpha))
+    if alpha <= 0:
+        return
+    chave = (tamanho, tuple(cor))
+    overlay = _overlays.get(chave)
+    if overlay is None:
+        overlay = pygame.Surface(tamanho)
+        overlay.fill(cor)
+        if pygame.display.get_surface() is not None:
+            overlay = overlay.convert()
+        _overlays[chave] = overlay
+    overlay.set_alpha(alpha)
+    tela.blit(overlay, (0, 0))
+
+
 def criar_relampagos(tempo_atual, ultima_vez, intervalo_min=3000, intervalo_max=8000):
     """
     Decide se deve criar um relâmpago baseado no tempo.
@@ -419,9 +470,7 @@ def desenhar_relampago(tela, tempo_inicio, duracao, cor_flash=(200, 255, 200)):
         alpha = int(150 * (1 - progresso))  # De 150 a 0
 
         # Criar overlay do flash
-        flash_surface = pygame.Surface((LARGURA, ALTURA_JOGO), pygame.SRCALPHA)
-        flash_surface.fill((*cor_flash, alpha))
-        tela.blit(flash_surface, (0, 0))
+        desenhar_overlay_cor(tela, cor_flash, alpha, (LARGURA, ALTURA_JOGO))
         return True  # Relâmpago ainda ativo
 
     return False  # Relâmpago terminou
\ No newline at end of file
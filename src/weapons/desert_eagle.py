@@ -20,6 +20,7 @@ from src.config import *
 from src.entities.tiro import Tiro
 from src.utils.sound import gerar_som_tiro
 from src.entities.particula import Particula
+from src.utils.saves import caminho_dados
 
 
 def carregar_upgrade_desert_eagle():
@@ -28,8 +29,8 @@ def carregar_upgrade_desert_eagle():
     Retorna 0 se não houver upgrade.
     """
     try:
-        if os.path.exists("data/upgrades.json"):
-            with open("data/upgrades.json", "r") as f:
+        if os.path.exists(caminho_dados("upgrades.json")):
+            with open(caminho_dados("upgrades.json"), "r") as f:
                 upgrades = json.load(f)
                 return upgrades.get("desert_eagle", 0)
         return 0
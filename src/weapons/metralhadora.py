@@ -15,6 +15,8 @@ from src.config import *
 from src.entities.tiro import Tiro
 from src.utils.sound import gerar_som_tiro
 from src.entities.particula import Particula
+from src.utils.saves import caminho_dados, pasta_dados
+from src.utils.rng import rng_jogo
 
 def carregar_upgrade_metralhadora():
     """
@@ -23,8 +25,8 @@ def carregar_upgrade_metralhadora():
     """
     try:
         # Verificar se o arquivo existe
-        if os.path.exists("data/upgrades.json"):
-            with open("data/upgrades.json", "r") as f:
+        if os.path.exists(caminho_dados("upgrades.json")):
+            with open(caminho_dados("upgrades.json"), "r") as f:
                 upgrades = json.load(f)
                 return upgrades.get("metralhadora", 0)
         return 0
@@ -41,12 +43,12 @@ def salvar_municao_metralhadora(quantidade):
     """
     try:
         upgrades = {}
-        if os.path.exists("data/upgrades.json"):
-            with open("data/upgrades.json", "r") as f:
+        if os.path.exists(caminho_dados("upgrades.json")):
+            with open(caminho_dados("upgrades.json"), "r") as f:
                 upgrades = json.load(f)
         upgrades["metralhadora"] = max(0, quantidade)
-        os.makedirs("data", exist_ok=True)
-        with open("data/upgrades.json", "w") as f:
+        os.makedirs(pasta_dados(), exist_ok=True)
+        with open(caminho_dados("upgrades.json"), "w") as f:
             json.dump(upgrades, f, indent=4)
     except Exception as e:
         print(f"Erro ao salvar munição de metralhadora: {e}")
@@ -87,8 +89,8 @@ def atirar_metralhadora(jogador, tiros, pos_mouse, particulas=None, flashes=None
     
     # Adicionar ligeira imprecisão para simular recuo da metralhadora
     imprecisao = 0.08  # Pequena variação na direção
-    dx += random.uniform(-imprecisao, imprecisao)
-    dy += random.uniform(-imprecisao, imprecisao)
+    dx += rng_jogo.uniform(-imprecisao, imprecisao)
+    dy += rng_jogo.uniform(-imprecisao, imprecisao)
     
     # Normalizar novamente após adicionar imprecisão
     distancia_nova = math.sqrt(dx * dx + dy * dy)
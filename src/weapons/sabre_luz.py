@@ -15,6 +15,12 @@ import json
 from src.config import *
 from src.utils.sound import gerar_som_tiro
 from src.entities.particula import Particula
+from src.utils.sprites import disco, sprite_brilho
+from src.utils.saves import caminho_dados
+
+# Brilho aditivo da lâmina: raio de cada sprite e distância entre eles
+RAIO_BRILHO_LAMINA = 10
+ESPACO_BRILHO_LAMINA = 8
 
 def carregar_upgrade_sabre():
     """
@@ -22,8 +28,8 @@ def carregar_upgrade_sabre():
     Retorna 0 se não houver upgrade.
     """
     try:
-        if os.path.exists("data/upgrades.json"):
-            with open("data/upgrades.json", "r") as f:
+        if os.path.exists(caminho_dados("upgrades.json")):
+            with open(caminho_dados("upgrades.json"), "r") as f:
                 upgrades = json.load(f)
                 return upgrades.get("sabre_luz", 0)
         return 0
@@ -959,6 +965,17 @@ def desenhar_sabre(tela, jogador, tempo_atual, pos_mouse):
         lamina_end_x = ponta_x + vibracao * sin_a
         lamina_end_y = ponta_y - vibracao * cos_a
         
+        # Brilho aditivo ao longo da lâmina (pulsa junto com o sabre)
+        brilho = sprite_brilho(RAIO_BRILHO_LAMINA, cor_lamina_glow, round(0.3 + 0.2 * pulso, 1))
+        comprimento_lamina = math.hypot(lamina_end_x - emissor_x, lamina_end_y - emissor_y)
+        passos = max(1, int(comprimento_lamina / ESPACO_BRILHO_LAMINA))
+        tela.blits([
+            (brilho, (int(emissor_x + (lamina_end_x - emissor_x) * i / passos) - RAIO_BRILHO_LAMINA,
+                      int(emissor_y + (lamina_end_y - emissor_y) * i / passos) - RAIO_BRILHO_LAMINA),
+             None, pygame.BLEND_ADD)
+            for i in range(passos + 1)
+        ], doreturn=False)
+        
         # Núcleo da lâmina (borda) - sempre o mesmo tamanho
         pygame.draw.line(tela, cor_lamina_edge, 
                         (emissor_x, emissor_y), 
@@ -974,13 +991,17 @@ def desenhar_sabre(tela, jogador, tempo_atual, pos_mouse):
                         (emissor_x, emissor_y), 
                         (lamina_end_x, lamina_end_y), 1)
         
+        # Faíscas, partículas e energia do emissor vão num Surface.blits só
+        lote = []
+        
         # Efeito de faíscas na ponta
         if pulso > 0.7:
             for i in range(3):
                 spark_x = lamina_end_x + random.uniform(-3, 3)
                 spark_y = lamina_end_y + random.uniform(-3, 3)
                 spark_size = random.randint(1, 2)
-                pygame.draw.circle(tela, cor_lamina_core, (int(spark_x), int(spark_y)), spark_size)
+                lote.append((disco(spark_size, cor_lamina_core),
+                             (int(spark_x) - spark_size, int(spark_y) - spark_size)))
         
         # Partículas de energia ao longo da lâmina
         for i in range(4):
@@ -993,15 +1014,18 @@ def desenhar_sabre(tela, jogador, tempo_atual, pos_mouse):
                 # Adicionar vibração às partículas
                 particle_x += random.uniform(-1, 1)
                 particle_y += random.uniform(-1, 1)
-                pygame.draw.circle(tela, cor_lamina_glow, 
-                                 (int(particle_x), int(particle_y)), 2)
+                lote.append((disco(2, cor_lamina_glow), (int(particle_x) - 2, int(particle_y) - 2)))
         
         # Efeito de energia no emissor
         if random.random() < 0.3:  # 30% de chance por frame
             energy_size = random.randint(2, 4)
             energy_x = emissor_x + random.uniform(-2, 2)
             energy_y = emissor_y + random.uniform(-2, 2)
-            pygame.draw.circle(tela, (150, 200, 255), (int(energy_x), int(energy_y)), energy_size)
+            lote.append((disco(energy_size, (150, 200, 255)),
+                         (int(energy_x) - energy_size, int(energy_y) - energy_size)))
+        
+        if lote:
+            tela.blits(lote, doreturn=False)
             
 def desenhar_icone_sabre_hud(tela, x, y, tempo_atual, ativo=False):
     """
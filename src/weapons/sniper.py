@@ -23,6 +23,8 @@ from src.config import *
 from src.entities.tiro import Tiro
 from src.utils.sound import gerar_som_tiro
 from src.entities.particula import Particula
+from src.utils.saves import caminho_dados, pasta_dados
+from src.utils.rng import rng_jogo
 
 
 def carregar_upgrade_sniper():
@@ -31,8 +33,8 @@ def carregar_upgrade_sniper():
     Retorna 0 se não houver upgrade.
     """
     try:
-        if os.path.exists("data/upgrades.json"):
-            with open("data/upgrades.json", "r") as f:
+        if os.path.exists(caminho_dados("upgrades.json")):
+            with open(caminho_dados("upgrades.json"), "r") as f:
                 upgrades = json.load(f)
                 return upgrades.get("sniper", 0)
         return 0
@@ -50,12 +52,12 @@ def salvar_municao_sniper(quantidade):
     """
     try:
         upgrades = {}
-        if os.path.exists("data/upgrades.json"):
-            with open("data/upgrades.json", "r") as f:
+        if os.path.exists(caminho_dados("upgrades.json")):
+            with open(caminho_dados("upgrades.json"), "r") as f:
                 upgrades = json.load(f)
         upgrades["sniper"] = max(0, quantidade)
-        os.makedirs("data", exist_ok=True)
-        with open("data/upgrades.json", "w") as f:
+        os.makedirs(pasta_dados(), exist_ok=True)
+        with open(caminho_dados("upgrades.json"), "w") as f:
             json.dump(upgrades, f, indent=4)
     except Exception as e:
         print(f"Erro ao salvar munição de sniper: {e}")
@@ -101,7 +103,7 @@ def atirar_sniper(jogador, tiros, pos_mouse, particulas=None, flashes=None, mira
     # Se NÃO está mirando, adicionar grande imprecisão (tiro aleatório)
     if not mirando:
         # Imprecisão grande - tiro vai em direção completamente aleatória
-        angulo_aleatorio = random.uniform(-math.pi / 2, math.pi / 2)  # -90 a +90 graus
+        angulo_aleatorio = rng_jogo.uniform(-math.pi / 2, math.pi / 2)  # -90 a +90 graus
         cos_a = math.cos(angulo_aleatorio)
         sin_a = math.sin(angulo_aleatorio)
         novo_dx = dx * cos_a - dy * sin_a
@@ -15,6 +15,7 @@ from src.config import *
 from src.entities.tiro import Tiro
 from src.utils.sound import gerar_som_tiro
 from src.entities.particula import Particula
+from src.utils.saves import caminho_dados, pasta_dados
 
 def carregar_upgrade_spas12():
     """
@@ -23,8 +24,8 @@ def carregar_upgrade_spas12():
     """
     try:
         # Verificar se o arquivo existe
-        if os.path.exists("data/upgrades.json"):
-            with open("data/upgrades.json", "r") as f:
+        if os.path.exists(caminho_dados("upgrades.json")):
+            with open(caminho_dados("upgrades.json"), "r") as f:
                 upgrades = json.load(f)
                 return upgrades.get("spas12", 0)
         return 0
@@ -42,18 +43,18 @@ def salvar_municao_spas12(quantidade):
     try:
         # Carregar upgrades existentes
         upgrades = {}
-        if os.path.exists("data/upgrades.json"):
-            with open("data/upgrades.json", "r") as f:
+        if os.path.exists(caminho_dados("upgrades.json")):
+            with open(caminho_dados("upgrades.json"), "r") as f:
                 upgrades = json.load(f)
 
         # Atualizar munição de SPAS-12
         upgrades["spas12"] = max(0, quantidade)
 
         # Criar diretório se não existir
-        os.makedirs("data", exist_ok=True)
+        os.makedirs(pasta_dados(), exist_ok=True)
 
         # Salvar
-        with open("data/upgrades.json", "w") as f:
+        with open(caminho_dados("upgrades.json"), "w") as f:
             json.dump(upgrades, f, indent=4)
     except Exception as e:
         print(f"Erro ao salvar munição de SPAS-12: {e}")